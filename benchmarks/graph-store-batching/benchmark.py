@@ -0,0 +1,221 @@
+"""Round trips and wall time of graph-store writes and traversals, per item vs. batched.
+
+Both drivers run against an in-process fake server that answers every statement
+after a fixed `--rtt-ms` delay, standing in for the network hop to a local
+Neo4j or ArangoDB container. Two strategies are compared:
+
+- `per-item`: one statement per node, relationship, ID or start node, which is
+  how the drivers issued writes before batching.
+- `batched`:  the drivers' `UNWIND $rows` (Neo4j) and `FOR doc IN @docs`
+  (ArangoDB) statements, `write_batch_size` rows per statement.
+
+Usage:
+    python benchmarks/graph-store-batching/benchmark.py [--items 2000] [--rtt-ms 0.5] [--batch-size 1000]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from mindor.core.component.services.graph_store.drivers.neo4j import Neo4jGraphStoreAction
+from mindor.core.component.services.graph_store.drivers.arangodb import ArangoDBGraphStoreAction
+
+
+class FakeNeo4jResult:
+    def __init__(self, records: List[Dict[str, Any]]):
+        self.records = records
+
+    async def data(self) -> List[Dict[str, Any]]:
+        return self.records
+
+    async def single(self) -> Optional[Dict[str, Any]]:
+        return self.records[0] if self.records else None
+
+
+class FakeNeo4jSession:
+    """Answers `run()` calls after `rtt` seconds; a transaction costs a round trip to begin and one to commit."""
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.round_trips = 0
+        self._next_id = 0
+
+    async def run(self, cypher: str, parameters: Optional[Dict[str, Any]] = None) -> FakeNeo4jResult:
+        await self._round_trip()
+        return FakeNeo4jResult(self._answer(parameters or {}))
+
+    async def begin_transaction(self) -> "FakeNeo4jTransaction":
+        await self._round_trip()
+        return FakeNeo4jTransaction(self)
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.rtt)
+
+    def _answer(self, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if "rows" in parameters:
+            return [ { "index": row["index"], "id": self._new_id() } for row in parameters["rows"] ]
+        if "ids" in parameters:
+            return [ { "count": len(parameters["ids"]) } ]
+        if "start_ids" in parameters:
+            return [ { "node": {}, "depth": 1, "relationship_types": [] } for _ in parameters["start_ids"] ]
+        return [ { "id": self._new_id() } ]
+
+    def _new_id(self) -> str:
+        self._next_id += 1
+        return f"4:fake:{self._next_id}"
+
+
+class FakeNeo4jTransaction:
+    def __init__(self, session: FakeNeo4jSession):
+        self.session = session
+
+    async def __aenter__(self) -> "FakeNeo4jTransaction":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        pass
+
+    async def run(self, cypher: str, parameters: Optional[Dict[str, Any]] = None) -> FakeNeo4jResult:
+        return await self.session.run(cypher, parameters)
+
+    async def commit(self) -> None:
+        await self.session._round_trip()
+
+
+class FakeArangoDatabase:
+    """Answers AQL and per-document collection calls after `rtt` seconds (python-arango is synchronous)."""
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.round_trips = 0
+        self.aql = SimpleNamespace(execute=self._execute)
+
+    def has_collection(self, name: str) -> bool:
+        return True
+
+    def collection(self, name: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            insert=lambda doc: self._round_trip({ "_id": f"{name}/{self.round_trips}" }),
+            update=lambda doc: self._round_trip(doc),
+            delete=lambda key: self._round_trip(True),
+        )
+
+    def _execute(self, aql: str, bind_vars: Optional[Dict[str, Any]] = None) -> List[Any]:
+        bind_vars = bind_vars or {}
+        rows = bind_vars.get("docs") or bind_vars.get("keys") or bind_vars.get("start_nodes") or [ None ]
+        return self._round_trip([ f"{bind_vars.get('@collection', 'nodes')}/{index}" for index in range(len(rows)) ])
+
+    def _round_trip(self, value: Any) -> Any:
+        self.round_trips += 1
+        time.sleep(self.rtt)
+        return value
+
+
+async def _run_neo4j(strategy: str, items: int, rtt: float, batch_size: int) -> Dict[str, Dict[str, float]]:
+    session = FakeNeo4jSession(rtt)
+    action = Neo4jGraphStoreAction(SimpleNamespace(), session, batch_size)
+    nodes = [ { "label": "Person", "properties": { "n": index } } for index in range(items) ]
+    ids = [ f"4:fake:{index}" for index in range(items) ]
+    relationships = [ { "type": "KNOWS", "from": ids[index - 1], "to": ids[index], "properties": {} } for index in range(items) ]
+
+    async def per_item_insert():
+        for node in nodes:
+            await (await session.run("CREATE (n:Person $properties) RETURN elementId(n) AS id", parameters=node)).single()
+        for relationship in relationships:
+            await (await session.run("MATCH (a), (b) ... CREATE (a)-[r:KNOWS]->(b)", parameters=relationship)).single()
+
+    async def per_item_update():
+        for id in ids:
+            await session.run("MATCH (n) WHERE elementId(n) = $id SET n.n = $prop_n RETURN n", parameters={ "id": id })
+
+    async def per_item_delete():
+        for id in ids:
+            await session.run("MATCH (n) WHERE elementId(n) = $id DETACH DELETE n", parameters={ "id": id })
+
+    async def per_item_traverse():
+        for id in ids:
+            await (await session.run("MATCH p = (start)-[r*1..2]->(end) ...", parameters={ "start_id": id })).data()
+
+    traverse_params = { "direction": "out", "max_depth": 2, "relationship_types": None, "node_labels": None }
+    operations = {
+        "insert":   (per_item_insert,   lambda: action._insert(nodes, relationships, params={}, cancellation_token=None)),
+        "update":   (per_item_update,   lambda: action._update(ids, None, params={ "properties": { "n": 0 }, "labels": None }, cancellation_token=None)),
+        "delete":   (per_item_delete,   lambda: action._delete(ids, None, params={ "detach": True }, cancellation_token=None)),
+        "traverse": (per_item_traverse, lambda: action._traverse(ids, params=traverse_params, cancellation_token=None)),
+    }
+
+    return { name: await _measure(session, per_item if strategy == "per-item" else batched) for name, (per_item, batched) in operations.items() }
+
+
+async def _run_arangodb(strategy: str, items: int, rtt: float, batch_size: int) -> Dict[str, Dict[str, float]]:
+    database = FakeArangoDatabase(rtt)
+    action = ArangoDBGraphStoreAction(SimpleNamespace(), database, batch_size)
+    nodes = [ { "label": "persons", "properties": { "n": index } } for index in range(items) ]
+    ids = [ f"persons/{index}" for index in range(items) ]
+    relationships = [ { "from": ids[index - 1], "to": ids[index], "properties": {} } for index in range(items) ]
+
+    async def per_item_insert():
+        def _insert():
+            for node in nodes:
+                database.collection("persons").insert(node["properties"])
+            for relationship in relationships:
+                database.collection("knows").insert({ "_from": relationship["from"], "_to": relationship["to"] })
+        await asyncio.to_thread(_insert)
+
+    async def per_item_update():
+        await asyncio.to_thread(lambda: [ database.collection("persons").update({ "_key": id, "n": 0 }) for id in ids ])
+
+    async def per_item_delete():
+        await asyncio.to_thread(lambda: [ database.collection("persons").delete(id) for id in ids ])
+
+    async def per_item_traverse():
+        await asyncio.to_thread(lambda: [ database.aql.execute("FOR v, e, p IN 1..@max_depth OUTBOUND @start_node knows ...", bind_vars={ "start_node": id }) for id in ids ])
+
+    traverse_params = { "direction": "out", "max_depth": 2, "relationship_types": None, "graph": None, "edge_collection": "knows" }
+    operations = {
+        "insert":   (per_item_insert,   lambda: action._insert(nodes, relationships, params={ "collection": None, "edge_collection": "knows" }, cancellation_token=None)),
+        "update":   (per_item_update,   lambda: action._update(ids, None, params={ "properties": { "n": 0 }, "collection": None }, cancellation_token=None)),
+        "delete":   (per_item_delete,   lambda: action._delete(ids, None, params={ "collection": None }, cancellation_token=None)),
+        "traverse": (per_item_traverse, lambda: action._traverse(ids, params=traverse_params, cancellation_token=None)),
+    }
+
+    return { name: await _measure(database, per_item if strategy == "per-item" else batched) for name, (per_item, batched) in operations.items() }
+
+
+async def _measure(server: Any, operation: Any) -> Dict[str, float]:
+    server.round_trips = 0
+    started = time.perf_counter()
+    await operation()
+    return { "round_trips": server.round_trips, "ms": (time.perf_counter() - started) * 1000 }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=2000, help="nodes, relationships, IDs and start nodes per operation")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="simulated round-trip time to the server")
+    parser.add_argument("--batch-size", type=int, default=1000, help="write_batch_size for the batched strategy")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+
+    for driver, runner in (("neo4j", _run_neo4j), ("arangodb", _run_arangodb)):
+        for strategy in ("per-item", "batched"):
+            measured = await runner(strategy, args.items, args.rtt_ms / 1000, args.batch_size)
+            for operation, values in measured.items():
+                results.append({ "driver": driver, "strategy": strategy, "operation": operation, **values })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'driver':<10}{'operation':<10}{'strategy':<10}{'round trips':>12}{'ms':>10}")
+    for result in results:
+        print(f"{result['driver']:<10}{result['operation']:<10}{result['strategy']:<10}{result['round_trips']:>12}{result['ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+"""Wall time of a thumbnail chain on the native image processor, as chained actions vs. one pipeline action.
+
+Each run processes `--images` JPEG photos of `--width` x `--height` through the
+same four steps: fit into `--size`, crop to a 16:9 band, sharpen, grayscale.
+
+- `chained`:  one action per step, the way a workflow of separate jobs runs them.
+  Every step is its own executor call and produces a full intermediate image.
+- `pipeline`: a single `method: pipeline` action with the four steps as operations.
+
+Images are decoded lazily from JPEG bytes, the way stream inputs arrive, and
+`--batch-size` images are processed at a time in both strategies.
+
+Usage:
+    python benchmarks/image-processor-pipeline/benchmark.py [--images 32] [--width 3000] [--height 2000] [--size 320]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import time
+from typing import Any, Dict, List
+
+from PIL import Image as PILImage
+from pydantic import TypeAdapter
+
+from mindor.core.component.services.image_processor.drivers.native import NativeImageProcessorAction
+from mindor.dsl.schema.action.impl.image_processor.impl.native import NativeImageProcessorActionConfig
+
+
+class FakeContext:
+    """Just enough of `ComponentActionContext` for the image processor: values pass through unrendered."""
+    def __init__(self, image: Any):
+        self.image = image
+
+    async def render_variable(self, value: Any, **kwargs: Any) -> Any:
+        return value
+
+    async def render_scalar(self, value: Any, cast: Any, default: Any = None) -> Any:
+        return default if value is None else cast(value)
+
+    async def render_image(self, value: Any) -> Any:
+        return self.image
+
+    def register_source(self, key: str, value: Any) -> None:
+        pass
+
+
+def _make_photo(width: int, height: int) -> bytes:
+    gradient = PILImage.linear_gradient("L").resize((width, height))
+    image = PILImage.merge("RGB", (gradient, gradient.transpose(PILImage.Transpose.ROTATE_180), gradient.transpose(PILImage.Transpose.FLIP_LEFT_RIGHT)))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def _operations(size: int, width: int, height: int) -> List[Dict[str, Any]]:
+    fit_width, fit_height = (size, size * height // width) if width >= height else (size * width // height, size)
+    band_height = min(fit_height, fit_width * 9 // 16)
+
+    return [
+        { "method": "resize", "width": size, "height": size, "scale_mode": "fit" },
+        { "method": "crop", "x": 0, "y": (fit_height - band_height) // 2, "width": fit_width, "height": band_height },
+        { "method": "sharpen", "factor": 1.5 },
+        { "method": "grayscale" },
+    ]
+
+
+async def _run_chained(photos: List[bytes], operations: List[Dict[str, Any]], batch_size: int) -> List[PILImage.Image]:
+    actions = [ NativeImageProcessorAction(_validate({ **operation, "batch_size": batch_size })) for operation in operations ]
+    images: Any = [ PILImage.open(io.BytesIO(photo)) for photo in photos ]
+
+    for action in actions:
+        images = await action.run(FakeContext(images))
+
+    return images
+
+
+async def _run_pipeline(photos: List[bytes], operations: List[Dict[str, Any]], batch_size: int) -> List[PILImage.Image]:
+    action = NativeImageProcessorAction(_validate({ "method": "pipeline", "operations": operations, "batch_size": batch_size }))
+    images = [ PILImage.open(io.BytesIO(photo)) for photo in photos ]
+
+    return await action.run(FakeContext(images))
+
+
+def _validate(config: Dict[str, Any]) -> Any:
+    return TypeAdapter(NativeImageProcessorActionConfig).validate_python({ "image": "${input.images}", **config })
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", type=int, default=32, help="number of photos per run")
+    parser.add_argument("--width", type=int, default=3000, help="photo width in pixels")
+    parser.add_argument("--height", type=int, default=2000, help="photo height in pixels")
+    parser.add_argument("--size", type=int, default=320, help="bounding box of the resize step")
+    parser.add_argument("--batch-size", type=int, default=4, help="images processed at a time")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per strategy; the fastest is reported")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    photo = _make_photo(args.width, args.height)
+    photos = [ photo ] * args.images
+    operations = _operations(args.size, args.width, args.height)
+    results: List[Dict[str, Any]] = []
+
+    for strategy, runner in (("chained", _run_chained), ("pipeline", _run_pipeline)):
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            outputs = await runner(photos, operations, args.batch_size)
+            timings.append(time.perf_counter() - started)
+        best = min(timings)
+        results.append({ "strategy": strategy, "ms": best * 1000, "images_per_s": args.images / best, "output_size": list(outputs[0].size) })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'strategy':<10}{'ms':>10}{'images/s':>10}{'output':>12}")
+    for result in results:
+        print(f"{result['strategy']:<10}{result['ms']:>10.1f}{result['images_per_s']:>10.1f}{'x'.join(map(str, result['output_size'])):>12}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,147 @@
+"""Micro-benchmark of the per-chunk cost of carrying a stream from a component
+to the HTTP response body.
+
+A component generator yields N small chunks. Each run hands the stream to the
+component, job, workflow and task layers the way the runtime does, renders it
+as SSE with `HttpEventStreamer` (or passes raw bytes through, as for PCM audio),
+and drains the body the way the ASGI server would. Two layer strategies are
+compared:
+
+- `nested`: every layer wraps the stream in its own async generator, as the
+  runtime did before termination callbacks could be registered on the stream.
+- `hooks`:  every layer registers a callback on one stream object with
+  `attach_terminated_callback()`.
+
+Usage:
+    python benchmarks/stream-chunk-overhead/benchmark.py [--chunks 200000] [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from mindor.core.foundation.streaming.iterators import (
+    StreamEncodingFormat,
+    StreamEncodingIterator,
+    StreamIterator,
+    attach_terminated_callback,
+)
+from mindor.core.utils.transport.http_stream import HttpChunkCoalescer, HttpEventStreamer
+
+LAYERS = ("component", "job", "workflow", "task")
+
+
+class NestedTerminationIterator(StreamIterator):
+    """One wrapper per layer, equivalent to the former Component/Job/TaskOutputStreamIterator."""
+    def __init__(self, source: Any, on_terminated: Callable):
+        self.source = source
+        self.on_terminated = on_terminated
+        self._notified = False
+
+    async def _iterate_stream(self) -> AsyncIterator[Any]:
+        try:
+            async for chunk in self.source:
+                yield chunk
+        except asyncio.CancelledError:
+            await self._notify("cancelled", None)
+            raise
+        except Exception as e:
+            await self._notify("failed", str(e))
+            raise
+        else:
+            await self._notify("completed", None)
+        finally:
+            if not self._notified:
+                await self._notify("cancelled", "consumer closed stream")
+
+    async def _notify(self, event: str, error: Optional[str]) -> None:
+        self._notified = True
+        await self.on_terminated(event, error)
+
+
+async def _on_terminated(event: str, error: Optional[str]) -> None:
+    pass
+
+
+def _make_source(kind: str, count: int) -> Any:
+    async def _text():
+        for _ in range(count):
+            yield "token"
+
+    async def _pcm():
+        chunk = bytes(960)  # 10 ms of 48 kHz 16-bit mono
+        for _ in range(count):
+            yield chunk
+
+    if kind == "text":
+        return StreamEncodingIterator(_text(), StreamEncodingFormat.TEXT)
+    return _pcm()
+
+
+def _build_stream(kind: str, strategy: str, count: int) -> Any:
+    stream = _make_source(kind, count)
+
+    for _ in LAYERS:
+        if strategy == "nested":
+            stream = NestedTerminationIterator(stream, _on_terminated)
+        else:
+            stream = attach_terminated_callback(stream, _on_terminated)
+
+    return stream
+
+
+async def _drain(body: Any) -> int:
+    size = 0
+    async for piece in body:
+        size += len(piece)
+    return size
+
+
+async def _run_once(kind: str, strategy: str, count: int, coalesce: bool) -> float:
+    stream = _build_stream(kind, strategy, count)
+    body = HttpEventStreamer(stream).stream() if kind == "text" else stream
+
+    if coalesce:
+        body = HttpChunkCoalescer(body, max_delay=0.02, max_bytes=64 * 1024).stream()
+
+    started = time.perf_counter()
+    await _drain(body)
+    return (time.perf_counter() - started) / count * 1e9
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+
+    for kind in ("text", "pcm"):
+        for coalesce in (False, True):
+            for strategy in ("nested", "hooks"):
+                await _run_once(kind, strategy, min(args.chunks, 10_000), coalesce)  # warm-up
+                samples = [ await _run_once(kind, strategy, args.chunks, coalesce) for _ in range(args.repeat) ]
+                results.append({
+                    "stream": kind,
+                    "coalesce": coalesce,
+                    "strategy": strategy,
+                    "ns_per_chunk": statistics.median(samples),
+                })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'stream':<8}{'coalesce':<10}{'strategy':<10}{'ns/chunk':>10}")
+    for result in results:
+        print(f"{result['stream']:<8}{str(result['coalesce']):<10}{result['strategy']:<10}{result['ns_per_chunk']:>10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
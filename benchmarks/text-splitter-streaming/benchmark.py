@@ -0,0 +1,101 @@
+"""Throughput of the streaming text splitter when text arrives a few characters at a time.
+
+Each run splits `--chars` characters of generated prose with the default separators,
+`--chunk-size` and `--chunk-overlap`, in three input shapes:
+
+- `whole`:  the text is fed in one piece, the way a non-streaming input arrives.
+- `tokens`: the text is fed `--token-chars` characters at a time, the way LLM output
+  or STT transcripts arrive. Paragraphs are short, so segments end quickly.
+- `long-paragraph`: the same token feed, but the text is one paragraph of lines after
+  a short introduction. The splitter commits to the paragraph separator early, so
+  the rest of the input is a single oversize segment that is split by line.
+
+Reported per shape: wall time, throughput, chunks produced and the largest amount
+of text the splitter held back between feeds.
+
+Usage:
+    python benchmarks/text-splitter-streaming/benchmark.py [--chars 2000000] [--token-chars 4] [--chunk-size 1000]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Any, Dict, List
+
+from mindor.core.component.services.text_splitter.separators import DEFAULT_SEPARATORS
+from mindor.core.component.services.text_splitter.text_splitter import StreamingTextSplitter
+
+
+WORDS = [ "lorem", "ipsum", "dolor", "sit", "amet,", "consectetur", "adipiscing", "elit." ]
+
+
+def _make_prose(chars: int, seed: int) -> str:
+    rng, words, length = random.Random(seed), [], 0
+    while length < chars:
+        word = rng.choice(WORDS) + rng.choices([ " ", "\n", "\n\n" ], weights=[ 90, 8, 2 ])[0]
+        words.append(word)
+        length += len(word)
+    return "".join(words)[:chars]
+
+
+def _feed(text: str, size: int) -> List[str]:
+    return [ text[start:start + size] for start in range(0, len(text), size) ]
+
+
+def _held_back(splitter: StreamingTextSplitter) -> int:
+    held = len(splitter._pending_text) + splitter._pending_length + sum(len(part) for part in splitter._oversize_parts)
+    if splitter._oversize_splitter is not None:
+        held += _held_back(splitter._oversize_splitter)
+    return held
+
+
+def _run(pieces: List[str], chunk_size: int, chunk_overlap: int) -> Dict[str, Any]:
+    splitter = StreamingTextSplitter(DEFAULT_SEPARATORS, chunk_size, chunk_overlap)
+    chunks, peak = 0, 0
+
+    started = time.perf_counter()
+    for piece in pieces:
+        chunks += sum(1 for _ in splitter.feed(piece))
+        peak = max(peak, _held_back(splitter))
+    chunks += sum(1 for _ in splitter.flush())
+    elapsed = time.perf_counter() - started
+
+    return { "seconds": elapsed, "chunks": chunks, "peak_pending": peak }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chars", type=int, default=2_000_000, help="characters of input text")
+    parser.add_argument("--token-chars", type=int, default=4, help="characters per fed piece in the token shapes")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="splitter chunk size")
+    parser.add_argument("--chunk-overlap", type=int, default=200, help="splitter chunk overlap")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per shape; the fastest is reported")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    prose = _make_prose(args.chars, seed=0)
+    shapes = {
+        "whole":          [ prose ],
+        "tokens":         _feed(prose, args.token_chars),
+        "long-paragraph": _feed("Introduction\n\n" + prose.replace("\n\n", "\n"), args.token_chars),
+    }
+    results: List[Dict[str, Any]] = []
+
+    for shape, pieces in shapes.items():
+        runs = [ _run(pieces, args.chunk_size, args.chunk_overlap) for _ in range(args.repeat) ]
+        best = min(runs, key=lambda run: run["seconds"])
+        results.append({ "shape": shape, **best, "mb_per_s": args.chars / best["seconds"] / 1e6 })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'shape':<16}{'seconds':>10}{'MB/s':>10}{'chunks':>10}{'peak pending':>14}")
+    for result in results:
+        print(f"{result['shape']:<16}{result['seconds']:>10.3f}{result['mb_per_s']:>10.2f}{result['chunks']:>10}{result['peak_pending']:>14}")
+
+
+if __name__ == "__main__":
+    main()
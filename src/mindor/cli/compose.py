@@ -5,34 +5,62 @@ import asyncio
 import json
 import sys
 
-def _load_compose_config(config_files: List[Path], env_files: List[Path], env_data: List[str]):
-    from mindor.dsl.loader import load_compose_config
-    from mindor.core.utils.env import load_env_files, merge_env_data
+def _load_compose_config(ctx: click.Context, env_files: List[Path], env_data: List[str]):
+    with _profile_startup("import", "loader"):
+        from mindor.dsl.loader import load_compose_config
+        from mindor.core.utils.env import load_env_files, merge_env_data
 
     env = load_env_files(".", env_files or [])
     env = merge_env_data(env, env_data)
 
-    return load_compose_config(".", config_files, env)
+    return load_compose_config(".", ctx.obj.get("config_files", []), env, use_cache=ctx.obj.get("config_cache", False))
+
+def _profile_startup(phase: str, subsystem: str):
+    from mindor.core.utils.startup_profiler import startup_profiler
+
+    return startup_profiler.measure(phase, subsystem)
 
 def _get_version() -> str:
     from mindor.version import __version__
 
     return __version__
 
+def _print_version(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    # Resolving the installed version scans package metadata, so it is only done when asked for.
+    if not value or ctx.resilient_parsing:
+        return
+
+    click.echo(f"{ctx.find_root().info_name} {_get_version()}")
+    ctx.exit()
+
 @click.group()
 @click.option(
     "--file", "-f", "config_files", multiple=True,
     type=click.Path(exists=True, dir_okay=False, path_type=Path),
     help="Compose configuration files."
 )
-@click.version_option(
-    version=_get_version(),
-    message="%(prog)s %(version)s"
+@click.option(
+    "--profile-startup", is_flag=True,
+    help="Report how long imports, config validation, and subsystem setup take."
+)
+@click.option(
+    "--config-cache", is_flag=True,
+    help="Reuse the compose configuration validated earlier from identical content."
+)
+@click.option(
+    "--version", is_flag=True, expose_value=False, is_eager=True, callback=_print_version,
+    help="Show the version and exit."
 )
 @click.pass_context
-def compose_command(ctx: click.Context, config_files: List[Path]) -> None:
+def compose_command(ctx: click.Context, config_files: List[Path], profile_startup: bool, config_cache: bool) -> None:
     ctx.ensure_object(dict)
     ctx.obj["config_files"] = list(config_files)
+    ctx.obj["config_cache"] = config_cache
+
+    if profile_startup:
+        from mindor.core.utils.startup_profiler import startup_profiler
+        startup_profiler.enable(lambda report: click.echo(report, err=True))
+        ctx.call_on_close(startup_profiler.complete)
 
 @click.command(name="up")
 @click.option("-d", "--detach", is_flag=True, help="Run in detached mode.")
@@ -55,11 +83,11 @@ def up_command(
     env_data: List[str],
     verbose: bool
 ) -> None:
-    from mindor.core.compose import launch_services
-    config_files = ctx.obj.get("config_files", [])
+    with _profile_startup("import", "runtime"):
+        from mindor.core.compose import launch_services
     async def _async_command():
         try:
-            config = _load_compose_config(config_files, env_files, env_data)
+            config = _load_compose_config(ctx, env_files, env_data)
             await launch_services(config, detach, verbose)
         except Exception as e:
             import traceback
@@ -87,11 +115,11 @@ def down_command(
     env_data: List[str],
     verbose: bool
 ) -> None:
-    from mindor.core.compose import terminate_services
-    config_files = ctx.obj.get("config_files", [])
+    with _profile_startup("import", "runtime"):
+        from mindor.core.compose import terminate_services
     async def _async_command():
         try:
-            config = _load_compose_config(config_files, env_files, env_data)
+            config = _load_compose_config(ctx, env_files, env_data)
             await terminate_services(config, verbose)
         except Exception as e:
             if verbose:
@@ -122,11 +150,11 @@ def start_command(
     env_data: List[str],
     verbose: bool
 ) -> None:
-    from mindor.core.compose import start_services
-    config_files = ctx.obj.get("config_files", [])
+    with _profile_startup("import", "runtime"):
+        from mindor.core.compose import start_services
     async def _async_command():
         try:
-            config = _load_compose_config(config_files, env_files, env_data)
+            config = _load_compose_config(ctx, env_files, env_data)
             await start_services(config, verbose)
         except Exception as e:
             if verbose:
@@ -157,11 +185,11 @@ def stop_command(
     env_data: List[str],
     verbose: bool
 ) -> None:
-    from mindor.core.compose import stop_services
-    config_files = ctx.obj.get("config_files", [])
+    with _profile_startup("import", "runtime"):
+        from mindor.core.compose import stop_services
     async def _async_command():
         try:
-            config = _load_compose_config(config_files, env_files, env_data)
+            config = _load_compose_config(ctx, env_files, env_data)
             await stop_services(config, verbose)
         except Exception as e:
             if verbose:
@@ -224,13 +252,13 @@ def run_command(
     auto_resume: bool,
     verbose: bool
 ) -> None:
-    from mindor.core.compose.manager import ComposeManager
-    from mindor.core.controller.base import TaskStatus
-    from mindor.cli.interrupt import prompt_for_interrupt
-    config_files = ctx.obj.get("config_files", [])
+    with _profile_startup("import", "runtime"):
+        from mindor.core.compose.manager import ComposeManager
+        from mindor.core.controller.base import TaskStatus
+        from mindor.cli.interrupt import prompt_for_interrupt
     async def _async_command():
         try:
-            config = _load_compose_config(config_files, env_files, env_data)
+            config = _load_compose_config(ctx, env_files, env_data)
             input = json.loads(input_json) if input_json else {}
             metadata = json.loads(metadata_json) if metadata_json else None
             is_tty = sys.stdin.isatty()
@@ -289,11 +317,12 @@ def validate_command(
     env_data: List[str],
     verbose: bool
 ) -> None:
-    from mindor.core.compose import validate_compose_config
-    config_files = ctx.obj.get("config_files", [])
+    with _profile_startup("import", "runtime"):
+        from mindor.core.compose import validate_compose_config
     try:
-        config = _load_compose_config(config_files, env_files, env_data)
-        errors = validate_compose_config(config)
+        config = _load_compose_config(ctx, env_files, env_data)
+        with _profile_startup("validate", "semantics"):
+            errors = validate_compose_config(config)
 
         if errors:
             click.echo("❌ Configuration has semantic errors:\n", err=True)
@@ -9,13 +9,12 @@ from mindor.dsl.schema.gateway import GatewayConfig
 from mindor.dsl.schema.workflow import WorkflowConfig
 from mindor.dsl.schema.runtime import RuntimeType
 from mindor.core.foundation import AsyncService
-from mindor.core.foundation.streaming.iterators import StreamIterator
+from mindor.core.foundation.streaming.iterators import StreamIterator, StreamTerminatedEvent, attach_terminated_callback
 from mindor.core.utils.work_queue import WorkQueue
 from mindor.core.utils.active_counter import ActiveCounter
 from mindor.core.logger import logging
 from collections.abc import AsyncIterator
 from .context import ComponentActionContext
-from .streaming import ComponentOutputStreamIterator, StreamTerminatedEvent
 import asyncio
 
 class ActionResolver:
@@ -165,7 +164,7 @@ class ComponentService(AsyncService):
                 else:
                     await context.event_notifier.notify("failed", error=error)
 
-            return ComponentOutputStreamIterator(output, _on_terminated)
+            return attach_terminated_callback(output, _on_terminated)
 
         await context.event_notifier.notify("completed", output=output)
 
@@ -1,5 +1,6 @@
 from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
 from mindor.dsl.schema.component import ComponentConfig, ComponentType
+from mindor.core.utils.startup_profiler import startup_profiler
 from .base import ComponentService, ComponentGlobalConfigs, ComponentRegistry, ActionResolver
 import importlib
 
@@ -49,6 +50,7 @@ def _load_component_module(type: ComponentType) -> None:
     module_name = type.value.replace("-", "_")
 
     try:
-        importlib.import_module(f"mindor.core.component.services.{module_name}")
+        with startup_profiler.measure("import", f"component:{type.value}"):
+            importlib.import_module(f"mindor.core.component.services.{module_name}")
     except ImportError as e:
         raise ValueError(f"Unsupported component type: {type}") from e
@@ -22,7 +22,7 @@ from mindor.core.foundation.streaming.bytes import BytesStreamResource
 from mindor.core.foundation.streaming.text import TextStreamResource
 from mindor.core.foundation.streaming.audio import PcmStreamResource, WavStreamResource, AudioStreamResource
 from mindor.core.foundation.streaming.video import VideoStreamResource
-from mindor.core.foundation.streaming.image import ImageStreamResource
+from mindor.core.foundation.streaming.image import ImageStreamResource, RawImageStreamResource, RAW_IMAGE_CONTENT_TYPE
 from mindor.core.foundation.streaming.iterators import StreamChunkIterator
 from mindor.core.foundation.variable.codec import StreamKind, VariableCodec
 import asyncio
@@ -84,7 +84,7 @@ class IpcInboundStream:
         `StreamChunkIterator`) per §2.3.1 mapping. The returned object is what
         gets substituted into the decoded payload tree in place of the marker.
 
-        For audio/video/wav/pcm: the reader is wrapped in
+        For audio/video/wav/pcm and raw images: the reader is wrapped in
         `AsyncIterableStreamResource` and then passed as `source` to the domain
         resource.
 
@@ -118,6 +118,9 @@ class IpcInboundStream:
         if cls is VideoStreamResource:
             return VideoStreamResource(source, attrs=attrs, filename=filename)
 
+        if cls is RawImageStreamResource:
+            return RawImageStreamResource(source, attrs=attrs, filename=filename)
+
         # BytesStreamResource / ImageStreamResource / TextStreamResource → keep
         # the raw async-iterable resource; component decodes if it needs a
         # PIL.Image or decoded str.
@@ -134,6 +137,9 @@ class IpcInboundStream:
         """
         content_type = (content_type or "").lower()
 
+        if content_type == RAW_IMAGE_CONTENT_TYPE:
+            return RawImageStreamResource
+
         if content_type.startswith("image/"):
             return ImageStreamResource
 
@@ -1,4 +1,5 @@
 from typing import Optional, Union, Dict, List, Any
+from collections.abc import AsyncIterator
 from mindor.dsl.schema.component import AgentComponentConfig, AgentModelConfig
 from mindor.dsl.schema.action import ActionConfig, AgentActionConfig
 from mindor.dsl.schema.common.model.tool import ModelTool
@@ -9,7 +10,7 @@ from mindor.core.workflow.tool import WorkflowToolGenerator, WorkflowTool
 from mindor.core.workflow.schema import create_workflow_schemas
 from ..base import ComponentType, register_component
 from ..context import ComponentActionContext
-import asyncio, ulid, json
+import asyncio, contextlib, ulid, json
 
 class AgentAction:
     def __init__(
@@ -20,7 +21,9 @@ class AgentAction:
         tools: Dict[str, Union[WorkflowTool, ModelTool]],
         tool_schemas: List[Dict[str, Any]],
         instructions: Optional[str],
-        max_iteration_count: int
+        max_iteration_count: int,
+        max_concurrent_tool_calls: int = 0,
+        tool_timeout: Optional[Union[str, int, float]] = None
     ):
         self.config: AgentActionConfig = config
         self.model_component: ComponentService = model_component
@@ -29,22 +32,29 @@ class AgentAction:
         self.tool_schemas: List[Dict[str, Any]] = tool_schemas
         self.instructions: Optional[str] = instructions
         self.max_iteration_count: int = max_iteration_count
+        self.max_concurrent_tool_calls: int = max_concurrent_tool_calls
+        self.tool_timeout: Optional[Union[str, int, float]] = tool_timeout
 
     async def run(self, context: ComponentActionContext) -> Any:
-        max_iteration_count = await context.render_scalar(self.config.max_iteration_count, int, self.max_iteration_count)
-        streaming           = await context.render_variable(self.config.streaming)
+        max_iteration_count       = await context.render_scalar(self.config.max_iteration_count, int, self.max_iteration_count)
+        max_concurrent_tool_calls = await context.render_scalar(self.config.max_concurrent_tool_calls, int, self.max_concurrent_tool_calls)
+        tool_timeout              = await context.render_scalar(self.config.tool_timeout if self.config.tool_timeout is not None else self.tool_timeout, "time")
+        streaming                 = await context.render_variable(self.config.streaming)
 
         tools = self.tool_schemas if self.tool_schemas else None
 
         is_direct_output = not self.config.output or self.config.output == "${result}"
 
-        initial_messages: List[Dict[str, Any]] = await self._build_initial_messages(context)
+        # `messages` is what the agent produced and returns; `history` is the whole
+        # conversation the model sees. Both only ever grow, so each turn appends to
+        # the same lists instead of rebuilding them.
         messages: List[Dict[str, Any]] = []
+        history: List[Dict[str, Any]] = await self._build_initial_messages(context)
 
         if streaming:
             async def _stream_message_generator():
                 for _ in range(max_iteration_count):
-                    input = await self._render_model_input(context, messages or initial_messages, tools)
+                    input = await self._render_model_input(context, history, tools)
                     response = await self.model_component.run(
                         self.model_config.action,
                         ulid.ulid(),
@@ -55,6 +65,7 @@ class AgentAction:
 
                     assistant_message = await self._render_model_response(context, response)
                     messages.append(assistant_message)
+                    history.append(assistant_message)
                     await context.event_notifier.notify("internal", kind="message", output=assistant_message)
                     yield assistant_message
 
@@ -62,16 +73,16 @@ class AgentAction:
                     if not tool_calls:
                         break
 
-                    tool_messages = await self._execute_tool_calls(tool_calls, context)
-                    for tool_message in tool_messages:
+                    async for tool_message in self._execute_tool_calls(tool_calls, context, max_concurrent_tool_calls, tool_timeout):
                         messages.append(tool_message)
+                        history.append(tool_message)
                         await context.event_notifier.notify("internal", kind="tool", output=tool_message)
                         yield tool_message
 
             return _stream_message_generator()
         else:
             for _ in range(max_iteration_count):
-                input = await self._render_model_input(context, messages or initial_messages, tools)
+                input = await self._render_model_input(context, history, tools)
                 response = await self.model_component.run(
                     self.model_config.action,
                     ulid.ulid(),
@@ -82,15 +93,16 @@ class AgentAction:
 
                 assistant_message = await self._render_model_response(context, response)
                 messages.append(assistant_message)
+                history.append(assistant_message)
                 await context.event_notifier.notify("internal", kind="message", output=assistant_message)
 
                 tool_calls = self._extract_tool_calls(assistant_message)
                 if not tool_calls:
                     break
 
-                tool_messages = await self._execute_tool_calls(tool_calls, context)
-                for tool_message in tool_messages:
+                async for tool_message in self._execute_tool_calls(tool_calls, context, max_concurrent_tool_calls, tool_timeout):
                     messages.append(tool_message)
+                    history.append(tool_message)
                     await context.event_notifier.notify("internal", kind="tool", output=tool_message)
 
             context.register_source("result", messages)
@@ -148,70 +160,77 @@ class AgentAction:
     async def _execute_tool_calls(
         self,
         tool_calls: List[Dict[str, Any]],
-        context: ComponentActionContext
-    ) -> List[Dict[str, Any]]:
-        tool_kinds: List[str] = []
-        workflow_calls: List[Dict[str, Any]] = []
+        context: ComponentActionContext,
+        max_concurrency: int,
+        timeout: Optional[float]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run all tool calls of one turn at once and yield their tool messages as they finish.
+
+        Workflow tools run as separate tasks, at most `max_concurrency` at a time
+        (0 means no limit), each cancelled after `timeout`. Model tools are answered
+        by the client through a single interrupt, which waits alongside them.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
         external_calls: List[Dict[str, Any]] = []
+        tasks: List[asyncio.Task] = []
 
         for tool_call in tool_calls:
             tool = self.tools.get(tool_call.get("name", ""))
             if isinstance(tool, WorkflowTool):
-                tool_kinds.append("workflow")
-                workflow_calls.append(tool_call)
+                tasks.append(asyncio.create_task(self._execute_workflow_tool_call(tool_call, context, semaphore, timeout)))
             elif isinstance(tool, ModelTool):
-                tool_kinds.append("external")
                 external_calls.append(tool_call)
             else:
-                tool_kinds.append("unknown")
-
-        workflow_blocks = iter(await self._execute_workflow_tool_calls(workflow_calls, context)) if workflow_calls else iter(())
-        external_blocks = iter(await self._execute_external_tool_calls(external_calls, context)) if external_calls else iter(())
-
-        blocks: List[Dict[str, Any]] = []
-        for tool_call, tool_kind in zip(tool_calls, tool_kinds):
-            if tool_kind == "workflow":
-                blocks.append(next(workflow_blocks))
-            elif tool_kind == "external":
-                blocks.append(next(external_blocks))
-            else:
-                blocks.append({
+                yield self._format_messages("tool", [{
                     "type": "tool_result",
                     "id": tool_call.get("id", ""),
                     "content": f"Error: Unknown tool '{tool_call.get('name', '')}'",
                     "is_error": True,
-                })
+                }])[0]
 
-        messages: List[Dict[str, Any]] = []
-        for block in blocks:
-            messages.extend(self._format_messages("tool", [block]))
+        if external_calls:
+            tasks.append(asyncio.create_task(self._execute_external_tool_calls(external_calls, context)))
 
-        return messages
+        try:
+            for completed in asyncio.as_completed(tasks):
+                result = await completed
+                for block in (result if isinstance(result, list) else [ result ]):
+                    yield self._format_messages("tool", [block])[0]
+        finally:
+            for task in tasks:
+                task.cancel()
 
-    async def _execute_workflow_tool_calls(
+    async def _execute_workflow_tool_call(
         self,
-        tool_calls: List[Dict[str, Any]],
-        context: ComponentActionContext
-    ) -> List[Dict[str, Any]]:
-        async def _execute_tool_call(tool_call: Dict[str, Any]) -> Dict[str, Any]:
-            tool_name = tool_call["name"]
-            tool_arguments = tool_call.get("arguments", {})
-            call_id = tool_call.get("id", "")
-
-            try:
-                result = await self.tools[tool_name].function(**tool_arguments, context=context.workflow)
-                content = json.dumps(result) if isinstance(result, (dict, list)) else str(result)
-
-                return { "type": "tool_result", "id": call_id, "content": content }
-            except Exception as e:
-                return {
-                    "type": "tool_result",
-                    "id": call_id,
-                    "content": f"{type(e).__name__}: {e}",
-                    "is_error": True,
-                }
-
-        return list(await asyncio.gather(*[ _execute_tool_call(tool_call) for tool_call in tool_calls ]))
+        tool_call: Dict[str, Any],
+        context: ComponentActionContext,
+        semaphore: Optional[asyncio.Semaphore],
+        timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        tool_name = tool_call["name"]
+        tool_arguments = tool_call.get("arguments", {})
+        call_id = tool_call.get("id", "")
+
+        try:
+            async with semaphore or contextlib.nullcontext():
+                result = await asyncio.wait_for(self.tools[tool_name].function(**tool_arguments, context=context.workflow), timeout)
+            content = json.dumps(result) if isinstance(result, (dict, list)) else str(result)
+
+            return { "type": "tool_result", "id": call_id, "content": content }
+        except asyncio.TimeoutError:
+            return {
+                "type": "tool_result",
+                "id": call_id,
+                "content": f"TimeoutError: tool '{tool_name}' did not finish within {timeout}s",
+                "is_error": True,
+            }
+        except Exception as e:
+            return {
+                "type": "tool_result",
+                "id": call_id,
+                "content": f"{type(e).__name__}: {e}",
+                "is_error": True,
+            }
 
     async def _execute_external_tool_calls(
         self,
@@ -340,5 +359,7 @@ class AgentComponent(ComponentService):
             self.tools,
             self.tool_schemas,
             self.config.instructions,
-            self.config.max_iteration_count
+            self.config.max_iteration_count,
+            self.config.max_concurrent_tool_calls,
+            self.config.tool_timeout
         ).run(context)
@@ -6,11 +6,11 @@ from mindor.dsl.schema.component import AudioClipperComponentConfig
 from mindor.dsl.schema.action import AudioClipperActionConfig
 from mindor.core.foundation.cancellation import CancellationToken
 from mindor.core.foundation.variable.array import ArrayValue
-from mindor.core.foundation.streaming.audio import AudioStreamResource
+from mindor.core.foundation.streaming.audio import AudioStreamResource, read_wav_source
 from mindor.core.foundation.streaming.media import MediaSource
 from mindor.core.foundation.streaming.resources import AsyncIterableStreamResource, save_stream_to_temporary_file
 from mindor.core.foundation.streaming.file import FileStreamResource
-from mindor.core.utils.audio import is_streamable_audio_format
+from mindor.core.utils.audio import WavAudio, concat_wavs, is_streamable_audio_format
 from mindor.core.utils.ffmpeg.probe import probe_audio
 from mindor.core.utils.ffmpeg.muxer import get_extension_for_muxer
 from mindor.core.utils.files import get_temporary_path
@@ -19,9 +19,23 @@ from mindor.core.logger import logging
 from ..base import AudioClipperService, AudioClipperDriver, register_audio_clipper_service
 from ..base import ComponentActionContext
 from .common import AudioClipperAction
-import asyncio, os
+import asyncio, contextlib, os
+
+# Inputs larger than this are clipped by ffmpeg rather than loaded into memory.
+_IN_PROCESS_MAX_SIZE = 64 * 1024 * 1024
 
 class FFmpegAudioClipperAction(AudioClipperAction):
+    def __init__(
+        self,
+        config: AudioClipperActionConfig,
+        process_limit: Optional[asyncio.Semaphore] = None,
+        in_process: bool = True,
+    ):
+        super().__init__(config)
+
+        self.process_limit: Optional[asyncio.Semaphore] = process_limit
+        self.in_process: bool = in_process
+
     async def _clip_batch(
         self,
         audios: List[MediaSource],
@@ -32,6 +46,18 @@ class FFmpegAudioClipperAction(AudioClipperAction):
         results: List[Union[AsyncIterator[Dict[str, Any]], Dict[str, Any]]] = []
 
         for audio, spans in zip(audios, spans):
+            if self.in_process:
+                wav, audio = await read_wav_source(audio, _IN_PROCESS_MAX_SIZE)
+
+                if wav is not None:
+                    format = audio.format or "wav"
+
+                    if merge:
+                        results.append(await self._merge_in_process(wav, self._iterate_spans(spans), format))
+                    else:
+                        results.append(self._clip_in_process(wav, self._iterate_spans(spans), format))
+                    continue
+
             input_path, spooled = await self._resolve_input_path(audio)
             format = await self._resolve_format(audio, input_path)
 
@@ -50,6 +76,41 @@ class FFmpegAudioClipperAction(AudioClipperAction):
 
         return results
 
+    async def _clip_in_process(
+        self,
+        wav: WavAudio,
+        spans: AsyncIterator[Dict[str, float]],
+        format: str,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield one clip per span cut straight from the loaded samples, which
+        keeps them byte-identical to the source like `-c copy` does."""
+        async for span in spans:
+            clip = wav.slice(span["start_time"], span["end_time"])
+
+            yield { "audio": self._to_audio_stream(clip, format), "start_time": span["start_time"], "end_time": span["end_time"] }
+
+    async def _merge_in_process(
+        self,
+        wav: WavAudio,
+        spans: AsyncIterator[Dict[str, float]],
+        format: str,
+    ) -> Dict[str, Any]:
+        clips: List[WavAudio] = []
+        times: List[Dict[str, float]] = []
+
+        async for span in spans:
+            clips.append(wav.slice(span["start_time"], span["end_time"]))
+            times.append({ "start_time": span["start_time"], "end_time": span["end_time"] })
+
+        if not clips:
+            return { "audio": None, "times": [] }
+
+        return { "audio": self._to_audio_stream(concat_wavs(clips), format), "times": times }
+
+    @staticmethod
+    def _to_audio_stream(wav: WavAudio, format: str) -> AudioStreamResource:
+        return AudioStreamResource(wav.to_bytes() if format == "wav" else wav.data, format=format)
+
     async def _clip(
         self,
         input_path: str,
@@ -206,11 +267,15 @@ class FFmpegAudioClipperAction(AudioClipperAction):
         # CancellationToken is a threading.Event that has to be polled.
         # Wrap the ffmpeg run in a task and cancel it when the token fires;
         # run_subprocess then kills the process on its way out.
-        process_task = asyncio.create_task(run_subprocess(
-            command,
-            None,
-            stderr_handler=lambda r: r.read(),
-        ))
+        async def _run() -> Tuple[Any, Any, Any]:
+            async with self.process_limit or contextlib.nullcontext():
+                return await run_subprocess(
+                    command,
+                    None,
+                    stderr_handler=lambda r: r.read(),
+                )
+
+        process_task = asyncio.create_task(_run())
 
         watcher_task: Optional[asyncio.Task] = None
 
@@ -283,24 +348,26 @@ class FFmpegAudioClipperAction(AudioClipperAction):
         async def _stream() -> AsyncIterator[bytes]:
             watcher_task: Optional[asyncio.Task] = None
             try:
-                async with stream_subprocess(
-                    command,
-                    source=None,
-                    stdout_handler=_handle_stdout,
-                    stderr_handler=_handle_stderr,
-                ) as (process, chunks, _):
-                    if cancellation_token is not None:
-                        async def _watch_cancellation() -> None:
-                            while not cancellation_token.is_cancelled():
-                                if process.returncode is not None:
-                                    return
-                                await asyncio.sleep(0.2)
-                            process.kill()
-
-                        watcher_task = asyncio.create_task(_watch_cancellation())
-
-                    async for chunk in chunks:
-                        yield chunk
+                # A streamed output holds its process slot until it has been read to the end.
+                async with self.process_limit or contextlib.nullcontext():
+                    async with stream_subprocess(
+                        command,
+                        source=None,
+                        stdout_handler=_handle_stdout,
+                        stderr_handler=_handle_stderr,
+                    ) as (process, chunks, _):
+                        if cancellation_token is not None:
+                            async def _watch_cancellation() -> None:
+                                while not cancellation_token.is_cancelled():
+                                    if process.returncode is not None:
+                                        return
+                                    await asyncio.sleep(0.2)
+                                process.kill()
+
+                            watcher_task = asyncio.create_task(_watch_cancellation())
+
+                        async for chunk in chunks:
+                            yield chunk
 
                 if process.returncode is not None and process.returncode != 0:
                     error_message = b"".join(error).decode("utf-8", errors="replace")
@@ -362,5 +429,7 @@ class FFmpegAudioClipperService(AudioClipperService):
     def __init__(self, id: str, config: AudioClipperComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
+        self.process_limit: Optional[asyncio.Semaphore] = asyncio.Semaphore(self.config.max_concurrent_processes) if self.config.max_concurrent_processes > 0 else None
+
     async def _run(self, action: AudioClipperActionConfig, context: ComponentActionContext) -> Any:
-        return await FFmpegAudioClipperAction(action).run(context)
+        return await FFmpegAudioClipperAction(action, self.process_limit, self.config.in_process).run(context)
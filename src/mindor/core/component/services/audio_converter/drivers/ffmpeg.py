@@ -6,18 +6,21 @@ from mindor.dsl.schema.component import AudioConverterComponentConfig
 from mindor.dsl.schema.action import AudioConverterActionConfig
 from mindor.core.foundation.cancellation import CancellationToken
 from mindor.core.foundation.media.encoding import AudioEncoderParams
-from mindor.core.foundation.streaming.audio import AudioStreamResource
+from mindor.core.foundation.streaming.audio import AudioStreamResource, read_wav_source
 from mindor.core.foundation.streaming.media import MediaSource
 from mindor.core.foundation.streaming.resources import AsyncIterableStreamResource, save_stream_to_temporary_file
 from mindor.core.foundation.streaming.file import FileStreamResource
-from mindor.core.utils.audio import is_streamable_audio_format, is_pcm_format
+from mindor.core.utils.audio import WavAudio, is_streamable_audio_format, is_pcm_format, get_pcm_format_for_codec
 from mindor.core.utils.files import get_temporary_path
 from mindor.core.utils.shell import run_subprocess, stream_subprocess
 from mindor.core.logger import logging
 from ..base import AudioConverterService, AudioConverterDriver, register_audio_converter_service
 from ..base import ComponentActionContext
 from .common import AudioConverterAction
-import asyncio, os
+import asyncio, contextlib, os
+
+# Inputs larger than this are converted by ffmpeg rather than loaded into memory.
+_IN_PROCESS_MAX_SIZE = 64 * 1024 * 1024
 
 _FORMAT_CODEC_MAP: dict[str, str] = {
     "mp3":  "libmp3lame",
@@ -30,6 +33,17 @@ _FORMAT_CODEC_MAP: dict[str, str] = {
 }
 
 class FFmpegAudioConverterAction(AudioConverterAction):
+    def __init__(
+        self,
+        config: AudioConverterActionConfig,
+        process_limit: Optional[asyncio.Semaphore] = None,
+        in_process: bool = True,
+    ):
+        super().__init__(config)
+
+        self.process_limit: Optional[asyncio.Semaphore] = process_limit
+        self.in_process: bool = in_process
+
     async def _convert_batch(
         self,
         audios: List[MediaSource],
@@ -48,6 +62,17 @@ class FFmpegAudioConverterAction(AudioConverterAction):
         encoding: AudioEncoderParams,
         cancellation_token: Optional[CancellationToken] = None,
     ) -> AudioStreamResource:
+        pcm_format = self._resolve_in_process_format(encoding, format)
+
+        if pcm_format is not None:
+            wav, source = await read_wav_source(source, _IN_PROCESS_MAX_SIZE)
+
+            # Rate changes go to ffmpeg, whose resampler filters out aliasing.
+            if wav is not None and self._can_convert_in_process(wav, encoding):
+                logging.debug("Converting %s audio to '%s' in-process", source.format or "wav", format)
+                wav = wav.convert(encoding.sample_rate, encoding.channels, pcm_format)
+                return AudioStreamResource(wav.to_bytes() if format == "wav" else wav.data, format=format)
+
         input_path, spooled = await self._resolve_input_path(source)
 
         command = [ "ffmpeg", "-hide_banner" ]
@@ -109,11 +134,15 @@ class FFmpegAudioConverterAction(AudioConverterAction):
         # CancellationToken is a threading.Event that has to be polled.
         # Wrap the ffmpeg run in a task and cancel it when the token fires;
         # run_subprocess then kills the process on its way out.
-        process_task = asyncio.create_task(run_subprocess(
-            command,
-            source.stream if input_path is None else None,
-            stderr_handler=lambda r: r.read(),
-        ))
+        async def _run() -> Tuple[Any, Any, Any]:
+            async with self.process_limit or contextlib.nullcontext():
+                return await run_subprocess(
+                    command,
+                    source.stream if input_path is None else None,
+                    stderr_handler=lambda r: r.read(),
+                )
+
+        process_task = asyncio.create_task(_run())
 
         watcher_task: Optional[asyncio.Task] = None
 
@@ -187,24 +216,26 @@ class FFmpegAudioConverterAction(AudioConverterAction):
         async def _stream() -> AsyncIterator[bytes]:
             watcher_task: Optional[asyncio.Task] = None
             try:
-                async with stream_subprocess(
-                    command,
-                    source=source.stream if input_path is None else None,
-                    stdout_handler=_handle_stdout,
-                    stderr_handler=_handle_stderr,
-                ) as (process, chunks, error):
-                    if cancellation_token is not None:
-                        async def _watch_cancellation() -> None:
-                            while not cancellation_token.is_cancelled():
-                                if process.returncode is not None:
-                                    return
-                                await asyncio.sleep(0.2)
-                            process.kill()
-
-                        watcher_task = asyncio.create_task(_watch_cancellation())
-
-                    async for chunk in chunks:
-                        yield chunk
+                # A streamed output holds its process slot until it has been read to the end.
+                async with self.process_limit or contextlib.nullcontext():
+                    async with stream_subprocess(
+                        command,
+                        source=source.stream if input_path is None else None,
+                        stdout_handler=_handle_stdout,
+                        stderr_handler=_handle_stderr,
+                    ) as (process, chunks, error):
+                        if cancellation_token is not None:
+                            async def _watch_cancellation() -> None:
+                                while not cancellation_token.is_cancelled():
+                                    if process.returncode is not None:
+                                        return
+                                    await asyncio.sleep(0.2)
+                                process.kill()
+
+                            watcher_task = asyncio.create_task(_watch_cancellation())
+
+                        async for chunk in chunks:
+                            yield chunk
 
                 if process.returncode is not None and process.returncode != 0:
                     error_message = error.result().decode("utf-8", errors="replace") if error else ""
@@ -243,6 +274,25 @@ class FFmpegAudioConverterAction(AudioConverterAction):
 
         return spooled_path, True
 
+    def _resolve_in_process_format(self, encoding: AudioEncoderParams, format: str) -> Optional[str]:
+        """PCM sample format of a WAV or raw PCM output that needs no codec work, or None."""
+        if not self.in_process or encoding.bitrate:
+            return None
+
+        if format == "wav":
+            return get_pcm_format_for_codec(self._resolve_audio_codec(encoding, format))
+
+        if is_pcm_format(format) and encoding.codec in (None, f"pcm_{format}"):
+            return get_pcm_format_for_codec(f"pcm_{format}")
+
+        return None
+
+    def _can_convert_in_process(self, wav: WavAudio, encoding: AudioEncoderParams) -> bool:
+        if encoding.sample_rate and encoding.sample_rate != wav.sample_rate:
+            return False
+
+        return not encoding.channels or encoding.channels == wav.channels or 1 in (wav.channels, encoding.channels)
+
     @staticmethod
     def _resolve_audio_codec(encoding: AudioEncoderParams, format: str) -> Optional[str]:
         if encoding.codec:
@@ -255,5 +305,10 @@ class FFmpegAudioConverterService(AudioConverterService):
     def __init__(self, id: str, config: AudioConverterComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
+        self.process_limit: Optional[asyncio.Semaphore] = asyncio.Semaphore(self.config.max_concurrent_processes) if self.config.max_concurrent_processes > 0 else None
+
+    def get_setup_requirements(self) -> Optional[List[str]]:
+        return [ "numpy" ] if self.config.in_process else None
+
     async def _run(self, action: AudioConverterActionConfig, context: ComponentActionContext) -> Any:
-        return await FFmpegAudioConverterAction(action).run(context)
+        return await FFmpegAudioConverterAction(action, self.process_limit, self.config.in_process).run(context)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING
 
 from typing import Optional, Tuple, List, Dict, Callable, Any
 from collections.abc import AsyncIterator
@@ -10,23 +11,34 @@ from mindor.dsl.schema.action import (
 )
 from mindor.core.foundation.cancellation import CancellationToken
 from mindor.core.foundation.media.encoding import AudioEncoderParams
-from mindor.core.foundation.streaming.audio import AudioStreamResource
+from mindor.core.foundation.streaming.audio import AudioStreamResource, read_wav_source
 from mindor.core.foundation.streaming.media import MediaSource
 from mindor.core.foundation.streaming.resources import AsyncIterableStreamResource, save_stream_to_temporary_file
 from mindor.core.foundation.streaming.file import FileStreamResource
 from mindor.core.foundation.variable.time import parse_time
 from mindor.core.utils.ffmpeg.probe import probe_audio
-from mindor.core.utils.audio import is_streamable_audio_format
+from mindor.core.utils.audio import WavAudio, concat_wavs, mix_waveforms, is_streamable_audio_format, get_pcm_format_for_codec
+from mindor.core.utils.channels.subprocess_stream import SubprocessStreamChannel
 from mindor.core.utils.files import get_temporary_path
 from mindor.core.utils.shell import run_subprocess, stream_subprocess
 from mindor.core.logger import logging
 from ..base import AudioMixerService, register_audio_mixer_service
 from ..base import ComponentActionContext
 from .common import AudioMixerAction
-import asyncio, os
+import asyncio, contextlib, os
+
+if TYPE_CHECKING:
+    import numpy as np
 
 _DEFAULT_FORMAT = "wav"
 
+# Inputs larger than this are mixed by ffmpeg rather than loaded into memory.
+_IN_PROCESS_MAX_SIZE = 64 * 1024 * 1024
+
+# `pass_fds` and inherited pipe descriptors are POSIX-only; elsewhere live
+# streams are spooled to temp files as before.
+_SUPPORTS_FD_INPUT: bool = os.name == "posix"
+
 # Fallback codec when the encoding config leaves it unset.
 _FORMAT_CODEC_MAP: Dict[str, str] = {
     "mp3":  "libmp3lame",
@@ -39,6 +51,17 @@ _FORMAT_CODEC_MAP: Dict[str, str] = {
 }
 
 class FFmpegAudioMixerAction(AudioMixerAction):
+    def __init__(
+        self,
+        config: AudioMixerActionConfig,
+        process_limit: Optional[asyncio.Semaphore] = None,
+        in_process: bool = True,
+    ):
+        super().__init__(config)
+
+        self.process_limit: Optional[asyncio.Semaphore] = process_limit
+        self.in_process: bool = in_process
+
     async def _concat(
         self,
         audios: List[MediaSource],
@@ -47,25 +70,28 @@ class FFmpegAudioMixerAction(AudioMixerAction):
         cancellation_token: Optional[CancellationToken] = None,
     ) -> AudioStreamResource:
         format = self._resolve_container_format(params["format"])
+        pcm_format = self._resolve_in_process_format(params["encoding"], format)
+
+        if pcm_format is not None and not params.get("crossfade"):
+            wavs, audios = await self._read_wav_sources(audios)
+
+            if wavs is not None and all(wav.matches(wavs[0]) for wav in wavs) and self._can_remix(wavs[0].channels, params["encoding"].channels):
+                logging.debug("Mixing %d WAV audios in-process with concat to '%s'", len(wavs), format)
+                wav = concat_wavs(wavs).convert(params["encoding"].sample_rate, params["encoding"].channels, pcm_format)
+                return AudioStreamResource(wav.to_bytes(), format=format)
 
         if streaming and not is_streamable_audio_format(format):
             logging.warning("Format '%s' is not streamable; falling back to file output.", format)
             streaming = False
 
-        input_paths: List[str] = []
+        fd_channels: List[SubprocessStreamChannel] = []
         spooled_paths: List[str] = []
 
-        for audio in audios:
-            path, spooled = await self._resolve_input_path(audio)
-            input_paths.append(path)
-            if spooled:
-                spooled_paths.append(path)
-
         command: List[str] = [ "ffmpeg", "-hide_banner", "-y" ]
-        for path in input_paths:
-            command.extend([ "-i", path ])
+        for audio in audios:
+            command.extend([ "-i", await self._resolve_input(audio, fd_channels, spooled_paths) ])
 
-        filter_complex, audio_label = self._build_concat_filter(len(input_paths), params.get("crossfade"))
+        filter_complex, audio_label = self._build_concat_filter(len(audios), params.get("crossfade"))
         command.extend([ "-filter_complex", filter_complex ])
         command.extend([ "-map", audio_label ])
 
@@ -82,9 +108,9 @@ class FFmpegAudioMixerAction(AudioMixerAction):
         logging.debug("Mixing %d audios with concat filter to '%s'", len(audios), format)
 
         if streaming:
-            return await self._encode_to_stream(command, format, _cleanup, cancellation_token)
+            return await self._encode_to_stream(command, fd_channels, format, _cleanup, cancellation_token)
 
-        return await self._encode_to_file(command, format, _cleanup, cancellation_token)
+        return await self._encode_to_file(command, fd_channels, format, _cleanup, cancellation_token)
 
     async def _overlay(
         self,
@@ -96,42 +122,43 @@ class FFmpegAudioMixerAction(AudioMixerAction):
         cancellation_token: Optional[CancellationToken] = None,
     ) -> AudioStreamResource:
         format = self._resolve_container_format(params["format"])
+        pcm_format = self._resolve_in_process_format(params["encoding"], format)
+        filter_params = [ self._resolve_overlay_filter_params(placement) for placement in placements ]
+
+        if pcm_format is not None:
+            wavs, sources = await self._read_wav_sources([ audio, *overlays ])
+            audio, overlays = sources[0], sources[1:]
+
+            if wavs is not None and self._can_overlay_in_process(wavs, filter_params, params["encoding"].channels):
+                logging.debug("Overlaying %d WAV overlay(s) in-process to '%s'", len(overlays), format)
+                wav = self._overlay_in_process(wavs[0], wavs[1:], filter_params, params["duration_mode"])
+                wav = wav.convert(params["encoding"].sample_rate, params["encoding"].channels, pcm_format)
+                return AudioStreamResource(wav.to_bytes(), format=format)
 
         if streaming and not is_streamable_audio_format(format):
             logging.warning("Format '%s' is not streamable; falling back to file output.", format)
             streaming = False
 
-        base_path, base_spooled = await self._resolve_input_path(audio)
-
-        overlay_paths: List[str] = []
+        fd_channels: List[SubprocessStreamChannel] = []
         spooled_paths: List[str] = []
 
-        if base_spooled:
-            spooled_paths.append(base_path)
-
-        for overlay in overlays:
-            path, spooled = await self._resolve_input_path(overlay)
-            overlay_paths.append(path)
-            if spooled:
-                spooled_paths.append(path)
-
-        # `base` mode caps the output at the base's duration via `-t`. `longest`
-        # and `shortest` are handled by amix's `duration` option directly.
+        # `base` mode caps the output at the base's duration via `-t`, which
+        # needs a probe of the base, so a live base is spooled rather than piped.
+        # `longest` and `shortest` are handled by amix's `duration` option directly.
+        is_base_duration = params["duration_mode"] == AudioMixerOverlayDurationMode.BASE
+        base_input = await self._resolve_input(audio, fd_channels, spooled_paths, seekable=is_base_duration)
         output_duration: Optional[float] = None
 
-        if params["duration_mode"] == AudioMixerOverlayDurationMode.BASE:
-            (output_duration,) = await probe_audio(base_path, ["duration"])
+        if is_base_duration:
+            (output_duration,) = await probe_audio(base_input, ["duration"])
 
         command: List[str] = [ "ffmpeg", "-hide_banner", "-y" ]
-        command.extend([ "-i", base_path ])
+        command.extend([ "-i", base_input ])
 
-        for path in overlay_paths:
-            command.extend([ "-i", path ])
+        for overlay in overlays:
+            command.extend([ "-i", await self._resolve_input(overlay, fd_channels, spooled_paths) ])
 
-        filter_complex, audio_label = self._build_overlay_filter(
-            [ self._resolve_overlay_filter_params(placement) for placement in placements ],
-            params["duration_mode"],
-        )
+        filter_complex, audio_label = self._build_overlay_filter(filter_params, params["duration_mode"])
 
         command.extend([ "-filter_complex", filter_complex ])
         command.extend([ "-map", audio_label ])
@@ -152,9 +179,106 @@ class FFmpegAudioMixerAction(AudioMixerAction):
         logging.debug("Overlaying %d overlay(s) on base to '%s'", len(overlays), format)
 
         if streaming:
-            return await self._encode_to_stream(command, format, _cleanup, cancellation_token)
+            return await self._encode_to_stream(command, fd_channels, format, _cleanup, cancellation_token)
+
+        return await self._encode_to_file(command, fd_channels, format, _cleanup, cancellation_token)
+
+    def _can_overlay_in_process(
+        self,
+        wavs: List[WavAudio],
+        filter_params: List[Tuple[Optional[float], Optional[float], float, float, Optional[float], Optional[float]]],
+        channels: Optional[int],
+    ) -> bool:
+        base = wavs[0]
+
+        if any(wav.sample_rate != base.sample_rate or wav.channels != base.channels for wav in wavs):
+            return False
 
-        return await self._encode_to_file(command, format, _cleanup, cancellation_token)
+        # The pan filter is built for stereo; anything else goes through ffmpeg's channel mapping.
+        if base.channels != 2 and any(pan != 0.0 for _, _, _, pan, _, _ in filter_params):
+            return False
+
+        return self._can_remix(base.channels, channels)
+
+    @staticmethod
+    def _overlay_in_process(
+        base: WavAudio,
+        overlays: List[WavAudio],
+        filter_params: List[Tuple[Optional[float], Optional[float], float, float, Optional[float], Optional[float]]],
+        duration_mode: AudioMixerOverlayDurationMode,
+    ) -> WavAudio:
+        """Mirror of `_build_overlay_filter` on decoded samples: each overlay is
+        delayed, trimmed, gained, panned and faded, then everything is summed
+        without normalization like `amix=normalize=0`.
+        """
+        import numpy as np
+
+        sample_rate = base.sample_rate
+        tracks: List[Tuple[np.ndarray, int]] = [ (base.to_waveform(), 0) ]
+
+        for overlay, (start, end, gain, pan, fade_in, fade_out) in zip(overlays, filter_params):
+            start_frame = round((start or 0.0) * sample_rate)
+            waveform = overlay.to_waveform()
+
+            if end is not None:
+                # `end` is absolute along the delayed timeline, like atrim after adelay.
+                waveform = waveform[:max(0, round(end * sample_rate) - start_frame)]
+
+            waveform = waveform * np.float32(gain)
+
+            if pan != 0.0:
+                waveform[:, 0] *= max(0.0, 1.0 - pan)
+                waveform[:, 1] *= max(0.0, 1.0 + pan)
+
+            positions = np.arange(start_frame, start_frame + waveform.shape[0], dtype=np.float64)
+            envelope = np.ones(waveform.shape[0], dtype=np.float64)
+
+            if fade_in is not None and fade_in > 0:
+                envelope *= np.clip((positions - start_frame) / (fade_in * sample_rate), 0.0, 1.0)
+
+            if fade_out is not None and fade_out > 0 and end is not None:
+                fade_start = max(0.0, end - fade_out) * sample_rate
+                envelope *= np.clip(1.0 - (positions - fade_start) / (fade_out * sample_rate), 0.0, 1.0)
+
+            tracks.append(((waveform * envelope[:, None]).astype(np.float32), start_frame))
+
+        ends = [ start_frame + waveform.shape[0] for waveform, start_frame in tracks ]
+        frame_count = {
+            AudioMixerOverlayDurationMode.BASE:     ends[0],
+            AudioMixerOverlayDurationMode.SHORTEST: min(ends),
+            AudioMixerOverlayDurationMode.LONGEST:  max(ends),
+        }[duration_mode]
+
+        return WavAudio.from_waveform(mix_waveforms(tracks, frame_count), sample_rate, "f32le")
+
+    async def _read_wav_sources(self, sources: List[MediaSource]) -> Tuple[Optional[List[WavAudio]], List[MediaSource]]:
+        """Load every source as a WAV for in-process mixing, stopping at the first
+        one that isn't. Returns `(wavs, sources)` where `wavs` is None if any source
+        needs ffmpeg and `sources` replaces the streams consumed along the way.
+        """
+        wavs: List[WavAudio] = []
+        sources = list(sources)
+
+        for index, source in enumerate(sources):
+            wav, sources[index] = await read_wav_source(source, _IN_PROCESS_MAX_SIZE)
+
+            if wav is None:
+                return None, sources
+
+            wavs.append(wav)
+
+        return wavs, sources
+
+    def _resolve_in_process_format(self, encoding: AudioEncoderParams, format: str) -> Optional[str]:
+        """PCM sample format of a WAV output that needs no codec work, or None."""
+        if not self.in_process or format != "wav" or encoding.bitrate:
+            return None
+
+        return get_pcm_format_for_codec(self._resolve_audio_codec(encoding, format))
+
+    @staticmethod
+    def _can_remix(channels: int, target_channels: Optional[int]) -> bool:
+        return not target_channels or target_channels == channels or 1 in (channels, target_channels)
 
     @staticmethod
     def _build_concat_filter(
@@ -257,25 +381,40 @@ class FFmpegAudioMixerAction(AudioMixerAction):
 
         return ";".join(filter_parts), "[aout]"
 
-    async def _resolve_input_path(self, source: MediaSource) -> Tuple[str, bool]:
-        """Ensure the input is available at a filesystem path ffmpeg can seek.
-
-        Concat and overlay both need seekable, indexed inputs, so live streams
-        must be spooled rather than piped. Returns (path, spooled): spooled=True
-        means the caller owns the temp file cleanup.
+    async def _resolve_input(
+        self,
+        source: MediaSource,
+        fd_channels: List[SubprocessStreamChannel],
+        spooled_paths: List[str],
+        seekable: bool = False,
+    ) -> str:
+        """Return the ffmpeg input for `source`: its own path, an inherited pipe, or a spooled temp file.
+
+        Streamable formats are fed through `pipe:<fd>` so nothing touches the
+        disk; the channel joins `fd_channels` and starts pumping once ffmpeg is
+        running. Other live streams, or any input that has to be `seekable`, are
+        spooled and the temp path joins `spooled_paths` for the caller to clean up.
         """
         if isinstance(source.stream, FileStreamResource):
-            return source.stream.path, False
+            return source.stream.path
+
+        if not seekable and _SUPPORTS_FD_INPUT and is_streamable_audio_format(source.format):
+            channel = SubprocessStreamChannel(source.stream)
+            fd_channels.append(channel)
+
+            return f"pipe:{channel.read_fd}"
 
         logging.debug("Spooling mixer input (format=%s) to a temp file for seekable access.", source.format)
 
         spooled_path = await save_stream_to_temporary_file(source.stream, source.format)
+        spooled_paths.append(spooled_path)
 
-        return spooled_path, True
+        return spooled_path
 
     async def _encode_to_file(
         self,
         command: List[str],
+        fd_channels: List[SubprocessStreamChannel],
         format: str,
         cleanup: Callable[[], None],
         cancellation_token: Optional[CancellationToken] = None,
@@ -284,11 +423,21 @@ class FFmpegAudioMixerAction(AudioMixerAction):
 
         command = command + [ output_path ]
 
-        process_task = asyncio.create_task(run_subprocess(
-            command,
-            source=None,
-            stderr_handler=lambda r: r.read(),
-        ))
+        async def _on_started() -> None:
+            for channel in fd_channels:
+                await channel.start()
+
+        async def _run() -> Tuple[Any, Any, Any]:
+            async with self.process_limit or contextlib.nullcontext():
+                return await run_subprocess(
+                    command,
+                    source=None,
+                    stderr_handler=lambda r: r.read(),
+                    pass_fds=tuple(channel.read_fd for channel in fd_channels),
+                    on_started=_on_started,
+                )
+
+        process_task = asyncio.create_task(_run())
 
         watcher_task: Optional[asyncio.Task] = None
 
@@ -319,6 +468,9 @@ class FFmpegAudioMixerAction(AudioMixerAction):
                 except (asyncio.CancelledError, Exception):
                     pass
 
+            for channel in fd_channels:
+                await channel.close()
+
             cleanup()
 
         logging.debug("Audio mixing completed: '%s'", output_path)
@@ -328,6 +480,7 @@ class FFmpegAudioMixerAction(AudioMixerAction):
     async def _encode_to_stream(
         self,
         command: List[str],
+        fd_channels: List[SubprocessStreamChannel],
         format: str,
         cleanup: Callable[[], None],
         cancellation_token: Optional[CancellationToken] = None,
@@ -353,27 +506,35 @@ class FFmpegAudioMixerAction(AudioMixerAction):
 
                 error.append(line)
 
+        async def _on_started() -> None:
+            for channel in fd_channels:
+                await channel.start()
+
         async def _stream() -> AsyncIterator[bytes]:
             watcher_task: Optional[asyncio.Task] = None
             try:
-                async with stream_subprocess(
-                    command,
-                    source=None,
-                    stdout_handler=_handle_stdout,
-                    stderr_handler=_handle_stderr,
-                ) as (process, chunks, _):
-                    if cancellation_token is not None:
-                        async def _watch_cancellation() -> None:
-                            while not cancellation_token.is_cancelled():
-                                if process.returncode is not None:
-                                    return
-                                await asyncio.sleep(0.2)
-                            process.kill()
-
-                        watcher_task = asyncio.create_task(_watch_cancellation())
-
-                    async for chunk in chunks:
-                        yield chunk
+                # A streamed output holds its process slot until it has been read to the end.
+                async with self.process_limit or contextlib.nullcontext():
+                    async with stream_subprocess(
+                        command,
+                        source=None,
+                        stdout_handler=_handle_stdout,
+                        stderr_handler=_handle_stderr,
+                        pass_fds=tuple(channel.read_fd for channel in fd_channels),
+                        on_started=_on_started,
+                    ) as (process, chunks, _):
+                        if cancellation_token is not None:
+                            async def _watch_cancellation() -> None:
+                                while not cancellation_token.is_cancelled():
+                                    if process.returncode is not None:
+                                        return
+                                    await asyncio.sleep(0.2)
+                                process.kill()
+
+                            watcher_task = asyncio.create_task(_watch_cancellation())
+
+                        async for chunk in chunks:
+                            yield chunk
 
                 if process.returncode is not None and process.returncode != 0:
                     error_message = b"".join(error).decode("utf-8", errors="replace")
@@ -386,6 +547,9 @@ class FFmpegAudioMixerAction(AudioMixerAction):
                     except (asyncio.CancelledError, Exception):
                         pass
 
+                for channel in fd_channels:
+                    await channel.close()
+
                 cleanup()
 
         return AudioStreamResource(AsyncIterableStreamResource(_stream()), format=format)
@@ -447,5 +611,10 @@ class FFmpegAudioMixerService(AudioMixerService):
     def __init__(self, id: str, config: AudioMixerComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
+        self.process_limit: Optional[asyncio.Semaphore] = asyncio.Semaphore(self.config.max_concurrent_processes) if self.config.max_concurrent_processes > 0 else None
+
+    def get_setup_requirements(self) -> Optional[List[str]]:
+        return [ "numpy" ] if self.config.in_process else None
+
     async def _run(self, action: AudioMixerActionConfig, context: ComponentActionContext) -> Any:
-        return await FFmpegAudioMixerAction(action).run(context)
+        return await FFmpegAudioMixerAction(action, self.process_limit, self.config.in_process).run(context)
@@ -1,34 +1,154 @@
-from typing import Any, Dict
+from typing import Optional, Dict, List, Tuple, Deque, Any
 from collections.abc import AsyncIterator
+from collections import deque
 from mindor.dsl.schema.component import MemoryDataQueueComponentConfig
 from mindor.dsl.schema.action import (
     DataQueueActionConfig,
     DataQueueActionMethod,
     MemoryDataQueueEnqueueActionConfig,
     MemoryDataQueueDequeueActionConfig,
+    MemoryDataQueueCloseActionConfig,
+    MemoryDataQueueStatsActionConfig,
 )
 from mindor.core.foundation.streaming.iterators import StreamIterator
+from mindor.core.foundation.variable.time import parse_time
+from mindor.core.logger import logging
 from ..base import DataQueueService, DataQueueDriver, register_data_queue_service
 from ..base import ComponentActionContext
-import asyncio
+import asyncio, time
 
 class MemoryDataQueueFullError(Exception):
     pass
 
+class MemoryDataQueueClosedError(Exception):
+    pass
+
+class MemoryDataQueueSession:
+    """Items of one session, with blocking puts, batched gets and an end-of-stream state.
+
+    Once closed, puts fail and consumers end their streams after draining the
+    items that are still queued. Each item keeps its enqueue time so `get_stats()`
+    can report how long the oldest waiting item has been queued.
+    """
+    def __init__(self, name: str, max_size: int):
+        self.name: str = name
+        self.max_size: int = max_size
+        self.closed: bool = False
+        self.consumer_count: int = 0
+        self.producer_count: int = 0
+        self.enqueued_count: int = 0
+        self.dequeued_count: int = 0
+        self.last_active_at: float = time.monotonic()
+
+        self._items: Deque[Tuple[float, Any]] = deque()
+        self._condition: asyncio.Condition = asyncio.Condition()
+
+    @property
+    def is_idle(self) -> bool:
+        return self.consumer_count == 0 and self.producer_count == 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._items
+
+    async def put(self, items: List[Any], timeout: Optional[float] = None) -> None:
+        async with self._condition:
+            self.producer_count += 1
+            try:
+                for item in items:
+                    if self.max_size and len(self._items) >= self.max_size:
+                        self._condition.notify_all()
+                        await self._wait_for_space(timeout)
+
+                    if self.closed:
+                        raise MemoryDataQueueClosedError(f"Data queue session '{self.name}' is closed")
+
+                    self._items.append((time.monotonic(), item))
+                    self.enqueued_count += 1
+            finally:
+                self.producer_count -= 1
+                self.last_active_at = time.monotonic()
+                self._condition.notify_all()
+
+    async def get(self, max_count: int, batch_timeout: Optional[float] = None) -> Optional[List[Any]]:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._items or self.closed)
+
+            if max_count > 1 and batch_timeout and len(self._items) < max_count and not self.closed:
+                try:
+                    await asyncio.wait_for(self._condition.wait_for(lambda: len(self._items) >= max_count or self.closed), batch_timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+                # Another consumer may have taken the items while this one waited.
+                await self._condition.wait_for(lambda: self._items or self.closed)
+
+            if not self._items:
+                return None
+
+            items = [ self._items.popleft()[1] for _ in range(min(max_count, len(self._items))) ]
+            self.dequeued_count += len(items)
+            self.last_active_at = time.monotonic()
+            self._condition.notify_all()
+
+            return items
+
+    async def close(self) -> None:
+        async with self._condition:
+            self.closed = True
+            self.last_active_at = time.monotonic()
+            self._condition.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "depth": len(self._items),
+            "lag": time.monotonic() - self._items[0][0] if self._items else 0.0,
+            "enqueued": self.enqueued_count,
+            "dequeued": self.dequeued_count,
+            "consumers": self.consumer_count,
+            "producers": self.producer_count,
+            "closed": self.closed,
+            "idle": time.monotonic() - self.last_active_at,
+        }
+
+    async def _wait_for_space(self, timeout: Optional[float]) -> None:
+        try:
+            await asyncio.wait_for(self._condition.wait_for(lambda: self.closed or len(self._items) < self.max_size), timeout)
+        except asyncio.TimeoutError:
+            raise MemoryDataQueueFullError(f"Data queue session '{self.name}' is full (max_size={self.max_size})")
+
 class MemoryDataQueueDequeueIterator(StreamIterator):
-    def __init__(self, queue: asyncio.Queue):
-        self.queue: asyncio.Queue = queue
+    def __init__(self, session: MemoryDataQueueSession, batch_size: Optional[int], batch_timeout: Optional[float]):
+        self.session: MemoryDataQueueSession = session
+        self.batch_size: Optional[int] = batch_size
+        self.batch_timeout: Optional[float] = batch_timeout
 
     async def _iterate_stream(self) -> AsyncIterator[Any]:
-        while True:
-            yield await self.queue.get()
+        self.session.consumer_count += 1
+        try:
+            while True:
+                items = await self.session.get(self.batch_size or 1, self.batch_timeout)
+
+                if items is None:
+                    return
+
+                if self.batch_size:
+                    yield items
+                else:
+                    yield items[0]
+        finally:
+            self.session.consumer_count -= 1
+            self.session.last_active_at = time.monotonic()
 
 @register_data_queue_service(DataQueueDriver.MEMORY)
 class MemoryDataQueueService(DataQueueService):
     def __init__(self, id: str, config: MemoryDataQueueComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
-        self._sessions: Dict[str, asyncio.Queue] = {}
+        self.session_idle_timeout: float = parse_time(self.config.session_idle_timeout)
+
+        self._sessions: Dict[str, MemoryDataQueueSession] = {}
+        self._last_expired_at: float = time.monotonic()
 
     async def _run(self, action: DataQueueActionConfig, context: ComponentActionContext) -> Any:
         if action.method == DataQueueActionMethod.ENQUEUE:
@@ -37,39 +157,64 @@ class MemoryDataQueueService(DataQueueService):
         if action.method == DataQueueActionMethod.DEQUEUE:
             return await self._dequeue(action, context)
 
+        if action.method == DataQueueActionMethod.CLOSE:
+            return await self._close(action, context)
+
+        if action.method == DataQueueActionMethod.STATS:
+            return await self._stats(action, context)
+
         raise ValueError(f"Unsupported data queue action method: {action.method}")
 
+    def get_stats(self) -> Dict[str, Any]:
+        return { name: session.get_stats() for name, session in self._sessions.items() }
+
     async def _enqueue(self, action: MemoryDataQueueEnqueueActionConfig, context: ComponentActionContext) -> None:
-        item   = await context.render_variable(action.item)
-        spread = await context.render_scalar(action.spread, bool)
+        item    = await context.render_variable(action.item)
+        spread  = await context.render_scalar(action.spread, bool)
+        close   = await context.render_scalar(action.close, bool)
+        timeout = await context.render_scalar(action.timeout, "time")
 
-        session = await self._resolve_session(action, context)
-        queue = self._get_or_create_queue(session)
+        session = self._get_or_create_session(await self._resolve_session(action, context))
 
         if spread and isinstance(item, (list, tuple)):
-            for element in item:
-                self._enqueue_item(queue, element, session)
-                await asyncio.sleep(0)
+            await session.put(list(item), timeout)
         elif spread and isinstance(item, (StreamIterator, AsyncIterator)):
             async for element in item:
-                self._enqueue_item(queue, element, session)
-                await asyncio.sleep(0)
+                await session.put([ element ], timeout)
         else:
-            self._enqueue_item(queue, item, session)
+            await session.put([ item ], timeout)
 
-        return None
+        if close:
+            await session.close()
 
-    def _enqueue_item(self, queue: asyncio.Queue, item: Any, session: str) -> None:
-        try:
-            queue.put_nowait(item)
-        except asyncio.QueueFull:
-            raise MemoryDataQueueFullError(f"Data queue '{self.id}' session '{session}' is full (max_size={self.config.max_size})")
+        return None
 
     async def _dequeue(self, action: MemoryDataQueueDequeueActionConfig, context: ComponentActionContext) -> Any:
-        session = await self._resolve_session(action, context)
-        queue = self._get_or_create_queue(session)
+        batch_size    = await context.render_scalar(action.batch_size, int)
+        batch_timeout = await context.render_scalar(action.batch_timeout, "time")
+
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"'batch_size' must be >= 1, got {batch_size}")
+
+        session = self._get_or_create_session(await self._resolve_session(action, context))
 
-        return MemoryDataQueueDequeueIterator(queue)
+        return MemoryDataQueueDequeueIterator(session, batch_size, batch_timeout)
+
+    async def _close(self, action: MemoryDataQueueCloseActionConfig, context: ComponentActionContext) -> None:
+        session = self._get_or_create_session(await self._resolve_session(action, context))
+        await session.close()
+
+        return None
+
+    async def _stats(self, action: MemoryDataQueueStatsActionConfig, context: ComponentActionContext) -> Optional[Dict[str, Any]]:
+        self._expire_idle_sessions()
+
+        if action.session is None:
+            return self.get_stats()
+
+        session = self._sessions.get(await self._resolve_session(action, context))
+
+        return session.get_stats() if session else None
 
     async def _resolve_session(self, action: DataQueueActionConfig, context: ComponentActionContext) -> str:
         session = await context.render_variable(action.session)
@@ -79,11 +224,35 @@ class MemoryDataQueueService(DataQueueService):
 
         return "__default__"
 
-    def _get_or_create_queue(self, session: str) -> asyncio.Queue:
-        queue = self._sessions.get(session)
+    def _get_or_create_session(self, name: str) -> MemoryDataQueueSession:
+        self._expire_idle_sessions()
+
+        session = self._sessions.get(name)
+
+        if session is None or (session.closed and session.is_idle and session.is_empty):
+            session = MemoryDataQueueSession(name, self.config.max_size)
+            self._sessions[name] = session
+
+        return session
+
+    def _expire_idle_sessions(self) -> None:
+        """Removes empty sessions that nothing has used for `session_idle_timeout`.
+
+        Sessions still holding items are kept until they are consumed, so expiry never
+        drops data. Runs at most every quarter of the timeout, so looking up a session
+        stays cheap however many sessions exist.
+        """
+        if self.session_idle_timeout <= 0:
+            return
+
+        now = time.monotonic()
+
+        if now - self._last_expired_at < self.session_idle_timeout / 4:
+            return
 
-        if queue is None:
-            queue = asyncio.Queue(maxsize=self.config.max_size)
-            self._sessions[session] = queue
+        self._last_expired_at = now
 
-        return queue
+        for name, session in list(self._sessions.items()):
+            if session.is_idle and session.is_empty and now - session.last_active_at >= self.session_idle_timeout:
+                logging.debug("Data queue '%s' session '%s' expired", self.id, name)
+                del self._sessions[name]
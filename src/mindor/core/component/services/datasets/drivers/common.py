@@ -1,17 +1,20 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-from typing import Optional, Dict, Any
+from typing import Optional, Union, Dict, List, Iterator, Any
+from collections.abc import AsyncIterator
 from abc import abstractmethod
 from mindor.dsl.schema.action import DatasetsActionConfig, DatasetsActionMethod
 from mindor.core.foundation.cancellation import CancellationToken
+from mindor.core.utils.streamer import SyncGeneratorStreamer
 from ....action.base import ComponentAction
 from ..base import ComponentActionContext
 from ..utils import format_template_example
-import os
+import asyncio, threading, os
 
 if TYPE_CHECKING:
-    from datasets import Dataset
+    from datasets import Dataset, IterableDataset
+    import pyarrow as pa
 
 class DatasetsAction(ComponentAction):
     def __init__(self, config: DatasetsActionConfig):
@@ -29,25 +32,13 @@ class DatasetsAction(ComponentAction):
 
     async def _resolve_params(self, method: DatasetsActionMethod, context: ComponentActionContext) -> Dict[str, Any]:
         if method == DatasetsActionMethod.LOAD:
-            fraction       = await context.render_variable(self.config.fraction)
-            shuffle        = await context.render_variable(self.config.shuffle)
-            split          = await context.render_variable(self.config.split)
-            streaming      = await context.render_variable(self.config.streaming)
-            keep_in_memory = await context.render_variable(self.config.keep_in_memory)
-            cache_dir      = await context.render_variable(self.config.cache_dir)
-            save_infos     = await context.render_variable(self.config.save_infos)
-
-            if cache_dir:
-                cache_dir = os.path.expanduser(cache_dir)
+            fraction = await context.render_variable(self.config.fraction)
+            shuffle  = await context.render_variable(self.config.shuffle)
 
             return {
-                "fraction":       fraction,
-                "shuffle":        shuffle,
-                "split":          split,
-                "streaming":      streaming,
-                "keep_in_memory": keep_in_memory,
-                "cache_dir":      cache_dir,
-                "save_infos":     save_infos,
+                "fraction": fraction,
+                "shuffle":  shuffle,
+                **await self._resolve_load_params(context),
             }
 
         if method == DatasetsActionMethod.CONCAT:
@@ -89,14 +80,68 @@ class DatasetsAction(ComponentAction):
                 "remove_columns": remove_columns,
             }
 
+        if method == DatasetsActionMethod.ITERATE:
+            dataset     = await context.render_variable(self.config.dataset)
+            batch_size  = await context.render_variable(self.config.batch_size)
+            columns     = await context.render_variable(self.config.columns)
+            filters     = await context.render_variable(self.config.filters)
+            limit       = await context.render_variable(self.config.limit)
+            num_shards  = await context.render_variable(self.config.num_shards)
+            shard_index = await context.render_variable(self.config.shard_index)
+            prefetch    = await context.render_variable(self.config.prefetch)
+            format      = await context.render_variable(self.config.format)
+
+            if isinstance(columns, str):
+                columns = [ columns ]
+
+            if int(batch_size) < 1:
+                raise ValueError(f"'batch_size' must be >= 1, got {batch_size}")
+
+            if int(prefetch) < 1:
+                raise ValueError(f"'prefetch' must be >= 1, got {prefetch}")
+
+            if num_shards is not None and not 0 <= int(shard_index) < int(num_shards):
+                raise ValueError(f"'shard_index' must be in [0, {num_shards}), got {shard_index}")
+
+            return {
+                "dataset":     dataset,
+                "batch_size":  int(batch_size),
+                "columns":     columns,
+                "filters":     filters or None,
+                "limit":       int(limit) if limit is not None else None,
+                "num_shards":  int(num_shards) if num_shards is not None else None,
+                "shard_index": int(shard_index),
+                "prefetch":    int(prefetch),
+                "format":      format,
+                **await self._resolve_load_params(context),
+            }
+
         raise ValueError(f"Unsupported datasets action method: {method}")
 
+    async def _resolve_load_params(self, context: ComponentActionContext) -> Dict[str, Any]:
+        split          = await context.render_variable(self.config.split)
+        streaming      = await context.render_variable(self.config.streaming)
+        keep_in_memory = await context.render_variable(self.config.keep_in_memory)
+        cache_dir      = await context.render_variable(self.config.cache_dir)
+        save_infos     = await context.render_variable(self.config.save_infos)
+
+        if cache_dir:
+            cache_dir = os.path.expanduser(cache_dir)
+
+        return {
+            "split":          split,
+            "streaming":      streaming,
+            "keep_in_memory": keep_in_memory,
+            "cache_dir":      cache_dir,
+            "save_infos":     save_infos,
+        }
+
     async def _dispatch(
         self,
         method: DatasetsActionMethod,
         params: Dict[str, Any],
         cancellation_token: Optional[CancellationToken] = None,
-    ) -> Dataset:
+    ) -> Union[Dataset, AsyncIterator[Any]]:
         if method == DatasetsActionMethod.LOAD:
             return await self._load(params, cancellation_token)
 
@@ -109,6 +154,9 @@ class DatasetsAction(ComponentAction):
         if method == DatasetsActionMethod.MAP:
             return await self._map(params, cancellation_token)
 
+        if method == DatasetsActionMethod.ITERATE:
+            return await self._iterate(params, cancellation_token)
+
         raise ValueError(f"Unsupported datasets action method: {method}")
 
     @abstractmethod
@@ -119,6 +167,14 @@ class DatasetsAction(ComponentAction):
     ) -> Dataset:
         pass
 
+    @abstractmethod
+    async def _open_dataset(
+        self,
+        params: Dict[str, Any],
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> Union[Dataset, IterableDataset]:
+        pass
+
     async def _concat(
         self,
         params: Dict[str, Any],
@@ -202,3 +258,90 @@ class DatasetsAction(ComponentAction):
             return dataset.map(_format_example, remove_columns=remove_columns)
 
         return await self._run_in_executor(_fn)
+
+    async def _iterate(
+        self,
+        params: Dict[str, Any],
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> AsyncIterator[Any]:
+        from datasets import Dataset, IterableDataset
+
+        dataset = params["dataset"]
+
+        if dataset is None:
+            dataset = await self._open_dataset(params, cancellation_token)
+
+        if not isinstance(dataset, (Dataset, IterableDataset)):
+            raise TypeError(f"Expected Dataset or IterableDataset instance, but got {type(dataset).__name__}")
+
+        stop_event = threading.Event()
+        batches = self._iterate_batches(dataset, params, stop_event, cancellation_token)
+
+        return SyncGeneratorStreamer(batches, asyncio.get_running_loop(), maxsize=params["prefetch"], stop_event=stop_event)
+
+    def _iterate_batches(
+        self,
+        dataset: Union[Dataset, IterableDataset],
+        params: Dict[str, Any],
+        stop_event: threading.Event,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> Iterator[Any]:
+        """Yields record batches of the dataset, read in a worker thread ahead of the consumer.
+
+        Columns needed by the filter are read along with the projected ones and
+        dropped after filtering, so a filtered batch may hold fewer than
+        `batch_size` rows. Iteration stops once `limit` rows have been yielded.
+        """
+        from datasets import IterableDataset
+        from datasets.distributed import split_dataset_by_node
+        import pyarrow.parquet as pq
+
+        columns, filters, remaining = params["columns"], params["filters"], params["limit"]
+
+        if columns:
+            dataset = dataset.select_columns(list(dict.fromkeys(columns + self._get_filter_columns(filters))))
+
+        if params["num_shards"]:
+            if isinstance(dataset, IterableDataset):
+                dataset = split_dataset_by_node(dataset, rank=params["shard_index"], world_size=params["num_shards"])
+            else:
+                dataset = dataset.shard(num_shards=params["num_shards"], index=params["shard_index"], contiguous=True)
+
+        expression = pq.filters_to_expression(filters) if filters else None
+
+        for table in dataset.with_format("arrow").iter(batch_size=params["batch_size"]):
+            if stop_event.is_set() or (cancellation_token is not None and cancellation_token.is_cancelled()):
+                return
+
+            if expression is not None:
+                table = table.filter(expression)
+
+            if columns:
+                table = table.select(columns)
+
+            if remaining is not None:
+                table = table.slice(0, remaining)
+                remaining -= table.num_rows
+
+            if table.num_rows > 0:
+                yield self._format_batch(table, params["format"])
+
+            if remaining == 0:
+                return
+
+    def _format_batch(self, table: pa.Table, format: str) -> Any:
+        if format == "arrow":
+            return table
+
+        if format == "numpy":
+            return { name: table.column(name).to_numpy() for name in table.column_names }
+
+        return table.to_pydict()
+
+    def _get_filter_columns(self, filters: Optional[List[Any]]) -> List[str]:
+        if not filters:
+            return []
+
+        conjunctions = filters if isinstance(filters[0][0], (list, tuple)) else [ filters ]
+
+        return [ condition[0] for conjunction in conjunctions for condition in conjunction ]
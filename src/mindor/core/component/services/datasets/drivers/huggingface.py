@@ -1,17 +1,18 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-from typing import Optional, Dict, Any
+from typing import Optional, Union, Dict, List, Tuple, Any
 from mindor.dsl.schema.component import HuggingfaceDatasetsComponentConfig
 from mindor.dsl.schema.action import DatasetsActionConfig, DatasetsActionMethod
 from mindor.core.foundation.cancellation import CancellationToken
+from mindor.core.utils.caching import LRUCache
 from ..base import DatasetsService, DatasetsDriver, register_datasets_service
 from ..base import ComponentActionContext
 from .common import DatasetsAction
-import os
+import glob, json, os
 
 if TYPE_CHECKING:
-    from datasets import Dataset
+    from datasets import Dataset, IterableDataset
 
 _LOAD_DATASET_KEYS = (
     "path", "name", "revision", "token", "split",
@@ -19,11 +20,19 @@ _LOAD_DATASET_KEYS = (
     "trust_remote_code", "data_files", "data_dir",
 )
 
+# Builders that read `columns` and `filters` themselves, skipping unread columns and row groups.
+_PUSHDOWN_BUILDERS = ( "parquet", )
+
+# Datasets returned by `load_dataset`, shared by every action in the process. Map-style
+# datasets are memory-mapped Arrow files, so a cached handle costs little memory; datasets
+# loaded with `keep_in_memory` hold all their rows and are never cached.
+_dataset_handles: LRUCache[Any] = LRUCache(max_size=16)
+
 class HuggingfaceDatasetsAction(DatasetsAction):
     async def _resolve_params(self, method: DatasetsActionMethod, context: ComponentActionContext) -> Dict[str, Any]:
         params = await super()._resolve_params(method, context)
 
-        if method == DatasetsActionMethod.LOAD:
+        if method in (DatasetsActionMethod.LOAD, DatasetsActionMethod.ITERATE):
             path              = await context.render_variable(self.config.path)
             name              = await context.render_variable(self.config.name)
             revision          = await context.render_variable(self.config.revision)
@@ -57,9 +66,7 @@ class HuggingfaceDatasetsAction(DatasetsAction):
         cancellation_token: Optional[CancellationToken] = None,
     ) -> Dataset:
         def _fn() -> Dataset:
-            from datasets import load_dataset
-
-            dataset = load_dataset(**{ key: params[key] for key in _LOAD_DATASET_KEYS })
+            dataset = self._load_dataset({ key: params[key] for key in _LOAD_DATASET_KEYS })
 
             if params["shuffle"]:
                 dataset = dataset.shuffle()
@@ -74,6 +81,74 @@ class HuggingfaceDatasetsAction(DatasetsAction):
 
         return await self._run_in_executor(_fn)
 
+    async def _open_dataset(
+        self,
+        params: Dict[str, Any],
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> Union[Dataset, IterableDataset]:
+        load_params = { key: params[key] for key in _LOAD_DATASET_KEYS }
+
+        if params["path"] in _PUSHDOWN_BUILDERS:
+            if params["columns"]:
+                load_params["columns"] = list(dict.fromkeys(params["columns"] + self._get_filter_columns(params["filters"])))
+            if params["filters"]:
+                load_params["filters"] = params["filters"]
+
+        return await self._run_in_executor(self._load_dataset, load_params)
+
+    def _load_dataset(self, load_params: Dict[str, Any]) -> Union[Dataset, IterableDataset]:
+        from datasets import load_dataset
+
+        if load_params.get("keep_in_memory"):
+            return load_dataset(**load_params)
+
+        key = self._get_handle_key(load_params)
+        dataset = _dataset_handles.get(key)
+
+        if dataset is None:
+            dataset = load_dataset(**load_params)
+            _dataset_handles.set(key, dataset)
+
+        return dataset
+
+    def _get_handle_key(self, load_params: Dict[str, Any]) -> str:
+        """Identifies a loaded dataset by its load parameters and the state of its local files.
+
+        Local data files (including glob matches) and every file under local directories
+        contribute their size and modification time, so editing them on disk invalidates
+        the handle.
+        """
+        data_files = load_params.get("data_files")
+
+        if isinstance(data_files, dict):
+            data_files = [ file for files in data_files.values() for file in ([ files ] if isinstance(files, str) else files) ]
+        elif isinstance(data_files, str):
+            data_files = [ data_files ]
+
+        patterns = [ *(data_files or []), load_params.get("data_dir"), load_params.get("path") ]
+        file_states: List[Tuple[str, int, int]] = []
+
+        for pattern in patterns:
+            if not isinstance(pattern, str):
+                continue
+            for path in sorted(glob.glob(pattern)):
+                for file in self._list_files(path):
+                    stat = os.stat(file)
+                    file_states.append((file, stat.st_size, stat.st_mtime_ns))
+
+        return json.dumps([ load_params, file_states ], sort_keys=True, default=str)
+
+    def _list_files(self, path: str) -> List[str]:
+        if not os.path.isdir(path):
+            return [ path ]
+
+        files: List[str] = []
+        for root, dirs, names in os.walk(path):
+            dirs.sort()
+            files.extend(os.path.join(root, name) for name in sorted(names))
+
+        return files
+
 @register_datasets_service(DatasetsDriver.HUGGINGFACE)
 class HuggingfaceDatasetsService(DatasetsService):
     def __init__(self, id: str, config: HuggingfaceDatasetsComponentConfig, daemon: bool):
@@ -0,0 +1,160 @@
+from typing import Optional, Dict, Callable, Awaitable
+from collections import OrderedDict
+from mindor.dsl.schema.component import FileStoreCacheConfig
+from mindor.core.foundation.variable.size import parse_size
+import asyncio, hashlib, os, uuid
+
+_PARTIAL_SUFFIX = ".partial"
+
+class FileStoreCache:
+    """Read-through disk cache for objects downloaded from a remote file store.
+
+    Entries are addressed by a hash of the store, object key and ETag, so an
+    object that changed remotely (new ETag) never resolves to a stale entry.
+    Downloads are written to a temporary file and renamed into place, which
+    keeps half-written entries invisible to other readers and processes.
+
+    The total size of the cached entries is capped at `max_size`; the least
+    recently used entries are evicted first, with recency persisted as the
+    file's modification time so it survives restarts.
+    """
+    def __init__(self, path: str, max_size: int):
+        self.path: str = path
+        self.max_size: int = max_size
+
+        self._entries: Optional[OrderedDict[str, int]] = None
+        self._total_size: int = 0
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    def accepts(self, size: Optional[int]) -> bool:
+        return size is not None and size <= self.max_size
+
+    def lookup(self, namespace: str, key: str, etag: str) -> Optional[str]:
+        entry_path = self._resolve_entry_path(namespace, key, etag)
+
+        if not os.path.isfile(entry_path):
+            self._forget(entry_path)
+            return None
+
+        self._touch(entry_path)
+
+        return entry_path
+
+    async def fetch(
+        self,
+        namespace: str,
+        key: str,
+        etag: str,
+        download: Callable[[str], Awaitable[None]],
+    ) -> str:
+        """Returns the path of the cached entry, calling `download(path)` to fill it
+        on a miss. Concurrent fetches of the same entry share one download."""
+        entry_path = self.lookup(namespace, key, etag)
+
+        if entry_path is not None:
+            return entry_path
+
+        entry_path = self._resolve_entry_path(namespace, key, etag)
+        future = self._pending.get(entry_path)
+
+        if future is None:
+            future = asyncio.ensure_future(self._download(entry_path, download))
+            self._pending[entry_path] = future
+            future.add_done_callback(lambda _: self._pending.pop(entry_path, None))
+
+        # Shielded so a cancelled caller does not abort the download other callers wait on.
+        return await asyncio.shield(future)
+
+    async def _download(self, entry_path: str, download: Callable[[str], Awaitable[None]]) -> str:
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        partial_path = f"{entry_path}.{uuid.uuid4().hex}{_PARTIAL_SUFFIX}"
+
+        try:
+            await download(partial_path)
+            os.replace(partial_path, entry_path)
+        except BaseException:
+            try:
+                os.remove(partial_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        self._insert(entry_path, os.path.getsize(entry_path))
+        self._evict(keep=entry_path)
+
+        return entry_path
+
+    def _resolve_entry_path(self, namespace: str, key: str, etag: str) -> str:
+        digest = hashlib.sha256(f"{namespace}\n{key}\n{etag}".encode("utf-8")).hexdigest()
+
+        return os.path.join(self.path, digest[:2], digest)
+
+    def _load_entries(self) -> OrderedDict[str, int]:
+        if self._entries is None:
+            found = []
+            for directory, _, filenames in os.walk(self.path):
+                for filename in filenames:
+                    if filename.endswith(_PARTIAL_SUFFIX):
+                        continue
+                    entry_path = os.path.join(directory, filename)
+                    try:
+                        stat = os.stat(entry_path)
+                    except FileNotFoundError:
+                        continue
+                    found.append((stat.st_mtime, entry_path, stat.st_size))
+
+            self._entries = OrderedDict((entry_path, size) for _, entry_path, size in sorted(found))
+            self._total_size = sum(self._entries.values())
+
+        return self._entries
+
+    def _insert(self, entry_path: str, size: int) -> None:
+        entries = self._load_entries()
+        self._total_size += size - entries.pop(entry_path, 0)
+        entries[entry_path] = size
+
+    def _forget(self, entry_path: str) -> None:
+        entries = self._load_entries()
+        self._total_size -= entries.pop(entry_path, 0)
+
+    def _touch(self, entry_path: str) -> None:
+        entries = self._load_entries()
+
+        if entry_path in entries:
+            entries.move_to_end(entry_path)
+        else:
+            self._insert(entry_path, os.path.getsize(entry_path))
+
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+    def _evict(self, keep: str) -> None:
+        entries = self._load_entries()
+
+        for entry_path in list(entries.keys()):
+            if self._total_size <= self.max_size:
+                break
+            if entry_path == keep:
+                continue
+            self._forget(entry_path)
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                pass
+
+_caches: Dict[str, FileStoreCache] = {}
+
+def get_file_store_cache(config: FileStoreCacheConfig) -> FileStoreCache:
+    """Returns the cache for the configured directory, shared by every component
+    using it so that they all count towards the same size limit."""
+    path = os.path.abspath(config.get_cache_dir())
+    max_size = parse_size(config.max_size)
+
+    if path not in _caches:
+        _caches[path] = FileStoreCache(path, max_size)
+    else:
+        _caches[path].max_size = min(_caches[path].max_size, max_size)
+
+    return _caches[path]
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict, List, Any
 from mindor.dsl.schema.component import AwsS3FileStoreComponentConfig
 from mindor.dsl.schema.action import FileStoreActionConfig, AwsS3FileStoreActionConfig
-from mindor.core.foundation.streaming.resources import ReaderStreamResource, save_stream_to_file
+from mindor.core.foundation.streaming.resources import ReaderStreamResource
 from mindor.core.foundation.streaming.resolver import resolve_stream_resource
 from mindor.core.foundation.cancellation import CancellationToken
 from mindor.core.utils.files import is_glob_match, guess_content_type
@@ -13,14 +13,15 @@ from mindor.core.utils.time import format_datetime_iso_string
 from mindor.core.foundation.providers.aws_s3 import upload, multipart_upload
 from ..base import FileStoreService, FileStoreDriver, register_file_store_service
 from ..base import ComponentActionContext
-from .common import FileStoreAction
+from ..cache import FileStoreCache, get_file_store_cache
+from .common import RemoteFileStoreAction, RemoteObjectInfo
 from contextlib import AsyncExitStack
 import os, urllib.parse
 
 if TYPE_CHECKING:
     from types_aiobotocore_s3 import S3Client
 
-_DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB — for put and save_to downloads
+_DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB — for multipart uploads
 _DEFAULT_STREAMING_CHUNK_SIZE = 8 * 1024  # 8KB — for streaming output, matching other StreamResources
 _DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024  # 8MB
 
@@ -30,15 +31,16 @@ class S3Location:
     region: Optional[str] = None
     endpoint: Optional[str] = None
 
-class AwsS3FileStoreAction(FileStoreAction):
+class AwsS3FileStoreAction(RemoteFileStoreAction):
     def __init__(
         self,
         config: AwsS3FileStoreActionConfig,
         client: S3Client,
         location: S3Location,
         base_path: Optional[str] = None,
+        cache: Optional[FileStoreCache] = None,
     ):
-        super().__init__(config)
+        super().__init__(config, cache)
 
         self.client: S3Client = client
         self.location: S3Location = location
@@ -105,15 +107,17 @@ class AwsS3FileStoreAction(FileStoreAction):
         chunk_size = params["chunk_size"]
 
         object_key = self._resolve_object_key(path)
-        response = await self.client.get_object(Bucket=self.location.bucket, Key=object_key)
-
-        body = response["Body"]
-        size = response.get("ContentLength")
-        content_type = response.get("ContentType") or guess_content_type(path)
-        last_modified = response.get("LastModified")
-        modified_at = format_datetime_iso_string(last_modified) if last_modified else None
         url = self._build_file_url(object_key)
 
+        if streaming and self.cache is None:
+            response = await self.client.get_object(Bucket=self.location.bucket, Key=object_key)
+            info = self._build_object_info(response)
+        else:
+            response = None
+            info = await self._fetch_object_info(object_key)
+
+        content_type = info.content_type or guess_content_type(path)
+
         if save_to:
             if os.path.isdir(save_to):
                 save_to = os.path.join(save_to, os.path.basename(path))
@@ -122,43 +126,48 @@ class AwsS3FileStoreAction(FileStoreAction):
             if parent:
                 os.makedirs(parent, exist_ok=True)
 
-            stream = ReaderStreamResource(body, chunk_size=chunk_size or _DEFAULT_CHUNK_SIZE)
-            await save_stream_to_file(stream, save_to)
+            await self._save_object(object_key, info, save_to, params)
 
             return {
                 "path": path,
                 "url": url,
-                "size": size or os.path.getsize(save_to),
+                "size": info.size or os.path.getsize(save_to),
                 "content_type": content_type,
-                "modified_at": modified_at,
+                "modified_at": info.modified_at,
                 "save_to": save_to,
             }
 
         if streaming:
-            content = ReaderStreamResource(
-                body,
-                content_type=content_type,
-                filename=os.path.basename(path) or None,
-                chunk_size=chunk_size or _DEFAULT_STREAMING_CHUNK_SIZE,
-            )
+            filename = os.path.basename(path) or None
+            content = self._open_cached_object(object_key, info, content_type, filename, chunk_size)
+
+            if content is None:
+                if response is None:
+                    response = await self.client.get_object(Bucket=self.location.bucket, Key=object_key)
+                content = ReaderStreamResource(
+                    response["Body"],
+                    content_type=content_type,
+                    filename=filename,
+                    chunk_size=chunk_size or _DEFAULT_STREAMING_CHUNK_SIZE,
+                )
 
             return {
                 "path": path,
                 "url": url,
-                "size": size,
+                "size": info.size,
                 "content_type": content_type,
-                "modified_at": modified_at,
+                "modified_at": info.modified_at,
                 "content": content,
             }
 
-        content = await body.read()
+        content = await self._read_object(object_key, info, params)
 
         return {
             "path": path,
             "url": url,
-            "size": size or len(content),
+            "size": info.size or len(content),
             "content_type": content_type,
-            "modified_at": modified_at,
+            "modified_at": info.modified_at,
             "content": content,
         }
 
@@ -254,6 +263,36 @@ class AwsS3FileStoreAction(FileStoreAction):
             "next_token": response.get("NextContinuationToken"),
         }
 
+    async def _fetch_object_info(self, object_key: str) -> RemoteObjectInfo:
+        response = await self.client.head_object(Bucket=self.location.bucket, Key=object_key)
+
+        return self._build_object_info(response)
+
+    async def _read_object_range(self, object_key: str, info: RemoteObjectInfo, start: int, end: Optional[int]) -> bytes:
+        request_params: Dict[str, Any] = { "Bucket": self.location.bucket, "Key": object_key }
+        if end is not None:
+            request_params["Range"] = f"bytes={start}-{end}"
+        if info.etag:
+            # Fails the part instead of mixing bytes of two object versions.
+            request_params["IfMatch"] = info.etag
+
+        response = await self.client.get_object(**request_params)
+
+        return await response["Body"].read()
+
+    def _build_object_info(self, response: Dict[str, Any]) -> RemoteObjectInfo:
+        last_modified = response.get("LastModified")
+
+        return RemoteObjectInfo(
+            size=response.get("ContentLength"),
+            etag=response.get("ETag"),
+            content_type=response.get("ContentType"),
+            modified_at=format_datetime_iso_string(last_modified) if last_modified else None,
+        )
+
+    def _get_cache_namespace(self) -> str:
+        return f"s3://{self.location.endpoint or ''}/{self.location.bucket}"
+
     def _resolve_object_key(self, path: str) -> str:
         if self.base_path:
             return f"{self.base_path}{path.lstrip('/')}"
@@ -290,6 +329,7 @@ class AwsS3FileStoreService(FileStoreService):
             endpoint=config.endpoint.rstrip("/") if config.endpoint else None,
         )
         self.base_path: Optional[str] = (config.base_path.rstrip("/") + "/") if config.base_path else None
+        self.cache: Optional[FileStoreCache] = get_file_store_cache(config.cache) if config.cache else None
         self.client: Optional[S3Client] = None
 
         self._client_session: Optional[AsyncContextManager[S3Client]] = None
@@ -314,7 +354,7 @@ class AwsS3FileStoreService(FileStoreService):
                 self.client = None
 
     async def _run(self, action: FileStoreActionConfig, context: ComponentActionContext) -> Any:
-        return await AwsS3FileStoreAction(action, self.client, self.location, self.base_path).run(context)
+        return await AwsS3FileStoreAction(action, self.client, self.location, self.base_path, self.cache).run(context)
 
     def _create_client_session(self) -> AsyncContextManager[S3Client]:
         import aioboto3
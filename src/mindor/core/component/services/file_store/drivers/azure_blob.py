@@ -6,7 +6,6 @@ from typing import Optional, Dict, List, Any
 from collections.abc import AsyncIterator
 from mindor.dsl.schema.component import AzureBlobFileStoreComponentConfig
 from mindor.dsl.schema.action import FileStoreActionConfig, AzureBlobFileStoreActionConfig
-from mindor.core.foundation.streaming.resources import save_stream_to_file
 from mindor.core.foundation.streaming.resolver import resolve_stream_resource
 from mindor.core.foundation.cancellation import CancellationToken
 from mindor.core.utils.files import is_glob_match, guess_content_type
@@ -14,13 +13,14 @@ from mindor.core.utils.time import format_datetime_iso_string
 from mindor.core.foundation.providers.azure_blob import upload, multipart_upload
 from ..base import FileStoreService, FileStoreDriver, register_file_store_service
 from ..base import ComponentActionContext
-from .common import FileStoreAction
+from ..cache import FileStoreCache, get_file_store_cache
+from .common import RemoteFileStoreAction, RemoteObjectInfo
 import os, urllib.parse
 
 if TYPE_CHECKING:
     from azure.storage.blob.aio import BlobServiceClient, ContainerClient, BlobClient, StorageStreamDownloader
 
-_DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB — for put and save_to downloads
+_DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB — for multipart uploads
 _DEFAULT_STREAMING_CHUNK_SIZE = 8 * 1024  # 8KB — for streaming output, matching other StreamResources
 _DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024  # 8MB
 
@@ -71,15 +71,16 @@ class AzureBlobDownloadReader:
         except StopAsyncIteration:
             self._exhausted = True
 
-class AzureBlobFileStoreAction(FileStoreAction):
+class AzureBlobFileStoreAction(RemoteFileStoreAction):
     def __init__(
         self,
         config: AzureBlobFileStoreActionConfig,
         container_client: ContainerClient,
         location: AzureBlobLocation,
         base_path: Optional[str] = None,
+        cache: Optional[FileStoreCache] = None,
     ):
-        super().__init__(config)
+        super().__init__(config, cache)
 
         self.container_client: ContainerClient = container_client
         self.location: AzureBlobLocation = location
@@ -148,13 +149,14 @@ class AzureBlobFileStoreAction(FileStoreAction):
         blob_name = self._resolve_blob_name(path)
         blob_client = self.container_client.get_blob_client(blob_name)
 
-        downloader = await blob_client.download_blob()
-        properties = downloader.properties
+        if streaming and self.cache is None:
+            downloader = await blob_client.download_blob()
+            info = self._build_object_info(downloader.properties)
+        else:
+            downloader = None
+            info = self._build_object_info(await blob_client.get_blob_properties())
 
-        size = properties.size
-        content_type = getattr(properties.content_settings, "content_type", None) or guess_content_type(path)
-        last_modified = properties.last_modified
-        modified_at = format_datetime_iso_string(last_modified) if last_modified else None
+        content_type = info.content_type or guess_content_type(path)
         url = self._build_file_url(blob_name)
 
         if save_to:
@@ -165,45 +167,49 @@ class AzureBlobFileStoreAction(FileStoreAction):
             if parent:
                 os.makedirs(parent, exist_ok=True)
 
-            reader = AzureBlobDownloadReader(downloader, chunk_size or _DEFAULT_CHUNK_SIZE)
-            stream = ReaderStreamResource(reader, chunk_size=chunk_size or _DEFAULT_CHUNK_SIZE)
-            await save_stream_to_file(stream, save_to)
+            await self._save_object(blob_name, info, save_to, params)
 
             return {
                 "path": path,
                 "url": url,
-                "size": size if size is not None else os.path.getsize(save_to),
+                "size": info.size if info.size is not None else os.path.getsize(save_to),
                 "content_type": content_type,
-                "modified_at": modified_at,
+                "modified_at": info.modified_at,
                 "save_to": save_to,
             }
 
         if streaming:
-            reader = AzureBlobDownloadReader(downloader, chunk_size or _DEFAULT_STREAMING_CHUNK_SIZE)
-            content = ReaderStreamResource(
-                reader,
-                content_type=content_type,
-                filename=os.path.basename(path) or None,
-                chunk_size=chunk_size or _DEFAULT_STREAMING_CHUNK_SIZE,
-            )
+            filename = os.path.basename(path) or None
+            content = self._open_cached_object(blob_name, info, content_type, filename, chunk_size)
+
+            if content is None:
+                if downloader is None:
+                    downloader = await blob_client.download_blob()
+                reader = AzureBlobDownloadReader(downloader, chunk_size or _DEFAULT_STREAMING_CHUNK_SIZE)
+                content = ReaderStreamResource(
+                    reader,
+                    content_type=content_type,
+                    filename=filename,
+                    chunk_size=chunk_size or _DEFAULT_STREAMING_CHUNK_SIZE,
+                )
 
             return {
                 "path": path,
                 "url": url,
-                "size": size,
+                "size": info.size,
                 "content_type": content_type,
-                "modified_at": modified_at,
+                "modified_at": info.modified_at,
                 "content": content,
             }
 
-        content = await downloader.readall()
+        content = await self._read_object(blob_name, info, params)
 
         return {
             "path": path,
             "url": url,
-            "size": size if size is not None else len(content),
+            "size": info.size if info.size is not None else len(content),
             "content_type": content_type,
-            "modified_at": modified_at,
+            "modified_at": info.modified_at,
             "content": content,
         }
 
@@ -306,6 +312,34 @@ class AzureBlobFileStoreAction(FileStoreAction):
             "next_token": continuation or None,
         }
 
+    async def _read_object_range(self, blob_name: str, info: RemoteObjectInfo, start: int, end: Optional[int]) -> bytes:
+        from azure.core import MatchConditions
+
+        download_params: Dict[str, Any] = { "offset": start }
+        if end is not None:
+            download_params["length"] = end - start + 1
+        if info.etag:
+            # Fails the part instead of mixing bytes of two blob versions.
+            download_params["etag"] = info.etag
+            download_params["match_condition"] = MatchConditions.IfNotModified
+
+        downloader = await self.container_client.get_blob_client(blob_name).download_blob(**download_params)
+
+        return await downloader.readall()
+
+    def _build_object_info(self, properties: Any) -> RemoteObjectInfo:
+        last_modified = properties.last_modified
+
+        return RemoteObjectInfo(
+            size=properties.size,
+            etag=properties.etag,
+            content_type=getattr(properties.content_settings, "content_type", None),
+            modified_at=format_datetime_iso_string(last_modified) if last_modified else None,
+        )
+
+    def _get_cache_namespace(self) -> str:
+        return f"azure://{self.location.account_name or ''}/{self.location.container}"
+
     def _resolve_blob_name(self, path: str) -> str:
         if self.base_path:
             return f"{self.base_path}{path.lstrip('/')}"
@@ -338,6 +372,7 @@ class AzureBlobFileStoreService(FileStoreService):
             account_name=config.account_name,
         )
         self.base_path: Optional[str] = (config.base_path.rstrip("/") + "/") if config.base_path else None
+        self.cache: Optional[FileStoreCache] = get_file_store_cache(config.cache) if config.cache else None
         self.client: Optional[ContainerClient] = None
 
         self._service_client: Optional[BlobServiceClient] = None
@@ -367,7 +402,7 @@ class AzureBlobFileStoreService(FileStoreService):
                 self._service_client = None
 
     async def _run(self, action: FileStoreActionConfig, context: ComponentActionContext) -> Any:
-        return await AzureBlobFileStoreAction(action, self.client, self.location, self.base_path).run(context)
+        return await AzureBlobFileStoreAction(action, self.client, self.location, self.base_path, self.cache).run(context)
 
     def _create_service_client(self) -> BlobServiceClient:
         from azure.storage.blob.aio import BlobServiceClient
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
-from typing import Optional, Dict, List, Tuple, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Tuple, Callable, Awaitable, Any
 from collections.abc import AsyncIterator
 from abc import abstractmethod
 from mindor.dsl.schema.action import FileStoreActionConfig, FileStoreActionMethod
 from mindor.core.foundation.streaming.iterators import StreamIterator
+from mindor.core.foundation.streaming.file import FileStreamResource
 from mindor.core.foundation.cancellation import CancellationToken
 from mindor.core.utils.iterators import BatchSourceIterator
 from ..base import ComponentActionContext
+from ..cache import FileStoreCache
 from ....action.base import ComponentAction
-import asyncio
+import asyncio, shutil
+
+_DEFAULT_PART_SIZE = 8 * 1024 * 1024  # 8MB
+_DEFAULT_MAX_CONCURRENCY = 4
+
+@dataclass(frozen=True)
+class RemoteObjectInfo:
+    size: Optional[int]
+    etag: Optional[str] = None
+    content_type: Optional[str] = None
+    modified_at: Optional[str] = None
 
 class FileStoreAction(ComponentAction):
     def __init__(self, config: FileStoreActionConfig):
@@ -205,3 +218,149 @@ class FileStoreAction(ComponentAction):
         cancellation_token: Optional[CancellationToken],
     ) -> Dict[str, Any]:
         pass
+
+
+class RemoteFileStoreAction(FileStoreAction):
+    """Base for drivers backed by an object store that serves byte ranges.
+
+    `save_to` and full reads fetch the object as `part_size` ranges, up to
+    `max_concurrency` at a time, so at most `part_size * max_concurrency`
+    bytes are in flight. When a cache is attached, objects are downloaded
+    into it once and served from disk while their ETag stays the same.
+    """
+    def __init__(self, config: FileStoreActionConfig, cache: Optional[FileStoreCache] = None):
+        super().__init__(config)
+
+        self.cache: Optional[FileStoreCache] = cache
+
+    async def _resolve_params(
+        self,
+        method: FileStoreActionMethod,
+        context: ComponentActionContext,
+    ) -> Dict[str, Any]:
+        params = await super()._resolve_params(method, context)
+
+        if method == FileStoreActionMethod.GET:
+            params["part_size"]       = await context.render_scalar(self.config.part_size, "size")
+            params["max_concurrency"] = await context.render_scalar(self.config.max_concurrency, int)
+
+        return params
+
+    async def _save_object(self, object_key: str, info: RemoteObjectInfo, save_to: str, params: Dict[str, Any]) -> None:
+        if self._is_cacheable(info):
+            cached_path = await self._fetch_cached_object(object_key, info, params)
+            await asyncio.to_thread(shutil.copyfile, cached_path, save_to)
+            return
+
+        await self._download_object_to_file(object_key, info, save_to, params)
+
+    async def _read_object(self, object_key: str, info: RemoteObjectInfo, params: Dict[str, Any]) -> bytes:
+        if self._is_cacheable(info):
+            cached_path = await self._fetch_cached_object(object_key, info, params)
+            return await asyncio.to_thread(_read_file, cached_path)
+
+        if info.size is None:
+            return await self._read_object_range(object_key, info, 0, None)
+
+        buffer = bytearray(info.size)
+
+        async def _write(offset: int, data: bytes) -> None:
+            buffer[offset:offset + len(data)] = data
+
+        await self._download_object_ranges(object_key, info, params, _write)
+
+        return bytes(buffer)
+
+    def _open_cached_object(
+        self,
+        object_key: str,
+        info: RemoteObjectInfo,
+        content_type: Optional[str],
+        filename: Optional[str],
+        chunk_size: Optional[int],
+    ) -> Optional[FileStreamResource]:
+        if not self._is_cacheable(info):
+            return None
+
+        cached_path = self.cache.lookup(self._get_cache_namespace(), object_key, info.etag)
+
+        if cached_path is None:
+            return None
+
+        return FileStreamResource(cached_path, content_type=content_type, filename=filename, chunk_size=chunk_size)
+
+    def _is_cacheable(self, info: RemoteObjectInfo) -> bool:
+        return self.cache is not None and bool(info.etag) and self.cache.accepts(info.size)
+
+    async def _fetch_cached_object(self, object_key: str, info: RemoteObjectInfo, params: Dict[str, Any]) -> str:
+        async def _download(path: str) -> None:
+            await self._download_object_to_file(object_key, info, path, params)
+
+        return await self.cache.fetch(self._get_cache_namespace(), object_key, info.etag, _download)
+
+    async def _download_object_to_file(self, object_key: str, info: RemoteObjectInfo, path: str, params: Dict[str, Any]) -> None:
+        with open(path, "wb") as file:
+            if info.size is None:
+                data = await self._read_object_range(object_key, info, 0, None)
+                await asyncio.to_thread(file.write, data)
+                return
+
+            lock = asyncio.Lock()
+
+            def _write_at(offset: int, data: bytes) -> None:
+                file.seek(offset)
+                file.write(data)
+
+            async def _write(offset: int, data: bytes) -> None:
+                async with lock:
+                    await asyncio.to_thread(_write_at, offset, data)
+
+            await self._download_object_ranges(object_key, info, params, _write)
+
+    async def _download_object_ranges(
+        self,
+        object_key: str,
+        info: RemoteObjectInfo,
+        params: Dict[str, Any],
+        write: Callable[[int, bytes], Awaitable[None]],
+    ) -> None:
+        part_size       = params.get("part_size") or _DEFAULT_PART_SIZE
+        max_concurrency = params.get("max_concurrency") or _DEFAULT_MAX_CONCURRENCY
+
+        if not info.size:
+            return
+
+        offsets = iter(range(0, info.size, part_size))
+
+        async def _download_parts() -> None:
+            # Workers share one offset iterator, so at most `max_concurrency` parts are in flight.
+            for start in offsets:
+                end = min(start + part_size, info.size) - 1
+                data = await self._read_object_range(object_key, info, start, end)
+                if len(data) != end - start + 1:
+                    raise IOError(f"Expected {end - start + 1} bytes at offset {start} of '{object_key}', got {len(data)}")
+                await write(start, data)
+
+        worker_count = min(max(1, int(max_concurrency)), -(-info.size // part_size))
+        workers = [ asyncio.create_task(_download_parts()) for _ in range(worker_count) ]
+
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+
+    @abstractmethod
+    async def _read_object_range(self, object_key: str, info: RemoteObjectInfo, start: int, end: Optional[int]) -> bytes:
+        """Reads bytes `start` to `end` (inclusive) of the object; `end` of None reads to the end."""
+        pass
+
+    @abstractmethod
+    def _get_cache_namespace(self) -> str:
+        pass
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as file:
+        return file.read()
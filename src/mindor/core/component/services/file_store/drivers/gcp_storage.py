@@ -5,7 +5,6 @@ from dataclasses import dataclass
 from typing import Optional, Dict, List, Tuple, Any
 from mindor.dsl.schema.component import GcpStorageFileStoreComponentConfig
 from mindor.dsl.schema.action import FileStoreActionConfig, GcpStorageFileStoreActionConfig
-from mindor.core.foundation.streaming.resources import save_stream_to_file
 from mindor.core.foundation.streaming.resolver import resolve_stream_resource
 from mindor.core.foundation.streaming.bytes import BytesStreamResource
 from mindor.core.foundation.cancellation import CancellationToken
@@ -14,13 +13,14 @@ from mindor.core.utils.time import format_datetime_iso_string
 from mindor.core.foundation.providers.gcp_storage import upload, multipart_upload
 from ..base import FileStoreService, FileStoreDriver, register_file_store_service
 from ..base import ComponentActionContext
-from .common import FileStoreAction
+from ..cache import FileStoreCache, get_file_store_cache
+from .common import RemoteFileStoreAction, RemoteObjectInfo
 import aiohttp, os, urllib.parse
 
 if TYPE_CHECKING:
     from gcloud.aio.storage import Storage
 
-_DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB — for put and save_to downloads
+_DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # 8MB — for multipart uploads
 _DEFAULT_STREAMING_CHUNK_SIZE = 8 * 1024  # 8KB — for streaming output, matching other StreamResources
 _DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024  # 8MB
 
@@ -30,15 +30,16 @@ class GcsLocation:
     project: Optional[str] = None
     endpoint: Optional[str] = None
 
-class GcpStorageFileStoreAction(FileStoreAction):
+class GcpStorageFileStoreAction(RemoteFileStoreAction):
     def __init__(
         self,
         config: GcpStorageFileStoreActionConfig,
         client: Storage,
         location: GcsLocation,
         base_path: Optional[str] = None,
+        cache: Optional[FileStoreCache] = None,
     ):
-        super().__init__(config)
+        super().__init__(config, cache)
         self.client: Storage = client
         self.location: GcsLocation = location
         self.base_path: Optional[str] = base_path
@@ -105,13 +106,9 @@ class GcpStorageFileStoreAction(FileStoreAction):
 
         object_name = self._resolve_object_name(path)
 
-        metadata = await self.client.download_metadata(self.location.bucket, object_name)
+        info = await self._fetch_object_info(object_name)
 
-        size_raw = metadata.get("size")
-        size = int(size_raw) if size_raw is not None else None
-        content_type = metadata.get("contentType") or guess_content_type(path)
-        last_modified = metadata.get("updated") or metadata.get("timeCreated")
-        modified_at = last_modified  # GCS already returns RFC 3339 strings
+        content_type = info.content_type or guess_content_type(path)
         url = self._build_file_url(object_name)
 
         if save_to:
@@ -122,45 +119,47 @@ class GcpStorageFileStoreAction(FileStoreAction):
             if parent:
                 os.makedirs(parent, exist_ok=True)
 
-            data = await self.client.download(self.location.bucket, object_name)
-            stream = BytesStreamResource(data, chunk_size=chunk_size or _DEFAULT_CHUNK_SIZE)
-            await save_stream_to_file(stream, save_to)
+            await self._save_object(object_name, info, save_to, params)
 
             return {
                 "path": path,
                 "url": url,
-                "size": size if size is not None else os.path.getsize(save_to),
+                "size": info.size if info.size is not None else os.path.getsize(save_to),
                 "content_type": content_type,
-                "modified_at": modified_at,
+                "modified_at": info.modified_at,
                 "save_to": save_to,
             }
 
         if streaming:
-            data = await self.client.download(self.location.bucket, object_name)
-            content = BytesStreamResource(
-                data,
-                content_type=content_type,
-                filename=os.path.basename(path) or None,
-                chunk_size=chunk_size or _DEFAULT_STREAMING_CHUNK_SIZE,
-            )
+            filename = os.path.basename(path) or None
+            content = self._open_cached_object(object_name, info, content_type, filename, chunk_size)
+
+            if content is None:
+                data = await self.client.download(self.location.bucket, object_name)
+                content = BytesStreamResource(
+                    data,
+                    content_type=content_type,
+                    filename=filename,
+                    chunk_size=chunk_size or _DEFAULT_STREAMING_CHUNK_SIZE,
+                )
 
             return {
                 "path": path,
                 "url": url,
-                "size": size if size is not None else len(data),
+                "size": info.size if info.size is not None else content.size,
                 "content_type": content_type,
-                "modified_at": modified_at,
+                "modified_at": info.modified_at,
                 "content": content,
             }
 
-        content = await self.client.download(self.location.bucket, object_name)
+        content = await self._read_object(object_name, info, params)
 
         return {
             "path": path,
             "url": url,
-            "size": size if size is not None else len(content),
+            "size": info.size if info.size is not None else len(content),
             "content_type": content_type,
-            "modified_at": modified_at,
+            "modified_at": info.modified_at,
             "content": content,
         }
 
@@ -249,6 +248,25 @@ class GcpStorageFileStoreAction(FileStoreAction):
             "next_token": response.get("nextPageToken"),
         }
 
+    async def _fetch_object_info(self, object_name: str) -> RemoteObjectInfo:
+        metadata = await self.client.download_metadata(self.location.bucket, object_name)
+        size_raw = metadata.get("size")
+
+        return RemoteObjectInfo(
+            size=int(size_raw) if size_raw is not None else None,
+            etag=metadata.get("etag"),
+            content_type=metadata.get("contentType"),
+            modified_at=metadata.get("updated") or metadata.get("timeCreated"),  # GCS already returns RFC 3339 strings
+        )
+
+    async def _read_object_range(self, object_name: str, info: RemoteObjectInfo, start: int, end: Optional[int]) -> bytes:
+        headers = { "Range": f"bytes={start}-{end}" } if end is not None else None
+
+        return await self.client.download(self.location.bucket, object_name, headers=headers)
+
+    def _get_cache_namespace(self) -> str:
+        return f"gs://{self.location.endpoint or ''}/{self.location.bucket}"
+
     def _resolve_object_name(self, path: str) -> str:
         if self.base_path:
             return f"{self.base_path}{path.lstrip('/')}"
@@ -279,6 +297,7 @@ class GcpStorageFileStoreService(FileStoreService):
             endpoint=config.endpoint.rstrip("/") if config.endpoint else None,
         )
         self.base_path: Optional[str] = (config.base_path.rstrip("/") + "/") if config.base_path else None
+        self.cache: Optional[FileStoreCache] = get_file_store_cache(config.cache) if config.cache else None
         self.client: Optional[Storage] = None
         self.session: Optional[aiohttp.ClientSession] = None
 
@@ -306,7 +325,7 @@ class GcpStorageFileStoreService(FileStoreService):
                 self.session = None
 
     async def _run(self, action: FileStoreActionConfig, context: ComponentActionContext) -> Any:
-        return await GcpStorageFileStoreAction(action, self.client, self.location, self.base_path).run(context)
+        return await GcpStorageFileStoreAction(action, self.client, self.location, self.base_path, self.cache).run(context)
 
     def _create_client(self) -> Tuple[Storage, aiohttp.ClientSession]:
         from gcloud.aio.storage import Storage
@@ -57,16 +57,39 @@ class ArangoDBQueryBuilder:
         doc = { "_key": key, **properties }
         return collection, doc
 
+    @staticmethod
+    def build_insert_docs(collection: str, docs: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        aql = "FOR doc IN @docs INSERT doc INTO @@collection RETURN NEW._id"
+        return aql, { "docs": docs, "@collection": collection }
+
+    @staticmethod
+    def build_update_docs(collection: str, docs: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        aql = "FOR doc IN @docs UPDATE doc IN @@collection RETURN 1"
+        return aql, { "docs": docs, "@collection": collection }
+
+    @staticmethod
+    def build_remove_docs(collection: str, keys: List[str]) -> Tuple[str, Dict[str, Any]]:
+        aql = "FOR key IN @keys REMOVE key IN @@collection RETURN 1"
+        return aql, { "keys": keys, "@collection": collection }
+
     @staticmethod
     def build_traverse(
-        start_node: str,
+        start_nodes: List[str],
         direction: str,
         max_depth: int,
+        graph: Optional[str],
         edge_collection: Optional[str],
         relationship_types: Optional[List[str]],
     ) -> Tuple[str, Dict[str, Any]]:
         direction_map = { "out": "outbound", "in": "inbound", "both": "any" }
         arango_direction = direction_map.get(direction, "outbound")
+        bind_vars: Dict[str, Any] = { "start_nodes": [ str(start_node) for start_node in start_nodes ], "max_depth": max_depth }
+
+        if graph:
+            ArangoDBQueryBuilder.verify_identifier(graph, "graph")
+            bind_vars["graph"] = graph
+            aql = f"FOR start IN @start_nodes FOR v, e, p IN 1..@max_depth {arango_direction.upper()} start GRAPH @graph OPTIONS {{order: \"bfs\", uniqueVertices: \"global\"}} RETURN {{node: v, edge: e, depth: LENGTH(p.edges)}}"
+            return aql, bind_vars
 
         edge_collections = []
         if edge_collection:
@@ -81,8 +104,8 @@ class ArangoDBQueryBuilder:
         else:
             edge_str = "edges"
 
-        aql = f"FOR v, e, p IN 1..@max_depth {arango_direction.upper()} @start_node {edge_str} RETURN {{node: v, edge: e, depth: LENGTH(p.edges)}}"
-        return aql, { "start_node": str(start_node), "max_depth": max_depth }
+        aql = f"FOR start IN @start_nodes FOR v, e, p IN 1..@max_depth {arango_direction.upper()} start {edge_str} RETURN {{node: v, edge: e, depth: LENGTH(p.edges)}}"
+        return aql, bind_vars
 
 class ArangoDBGraphStoreAction(GraphStoreAction):
     async def _resolve_params(self, method: GraphStoreActionMethod, context: ComponentActionContext) -> Dict[str, Any]:
@@ -149,34 +172,24 @@ class ArangoDBGraphStoreAction(GraphStoreAction):
             collection      = params["collection"]
             edge_collection = params["edge_collection"]
 
-            created_nodes = 0
-            created_relationships = 0
-            inserted_ids: List[str] = []
+            node_docs: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+            edge_docs: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
 
-            for node in nodes or []:
+            for index, node in enumerate(nodes or []):
                 collection_name, doc = ArangoDBQueryBuilder.build_insert_node_doc(node, collection)
+                node_docs.setdefault(collection_name, []).append((index, doc))
 
-                if not self.database.has_collection(collection_name):
-                    self.database.create_collection(collection_name)
-
-                result = self.database.collection(collection_name).insert(doc)
-                inserted_ids.append(result.get("_id", result.get("_key", "")))
-                created_nodes += 1
-
-            for relationship in relationships or []:
+            for index, relationship in enumerate(relationships or []):
                 collection_name, doc = ArangoDBQueryBuilder.build_insert_edge_doc(relationship, edge_collection)
+                edge_docs.setdefault(collection_name, []).append((index, doc))
 
-                if not self.database.has_collection(collection_name):
-                    self.database.create_collection(collection_name, edge=True)
-
-                result = self.database.collection(collection_name).insert(doc)
-                inserted_ids.append(result.get("_id", result.get("_key", "")))
-                created_relationships += 1
+            node_ids = self._insert_docs(node_docs, edge=False)
+            edge_ids = self._insert_docs(edge_docs, edge=True)
 
             return {
-                "ids": inserted_ids,
-                "created_nodes": created_nodes,
-                "created_relationships": created_relationships,
+                "ids": [ node_ids[index] for index in sorted(node_ids) ] + [ edge_ids[index] for index in sorted(edge_ids) ],
+                "created_nodes": len(node_ids),
+                "created_relationships": len(edge_ids),
             }
 
         return await self._run_in_executor(_insert)
@@ -193,18 +206,25 @@ class ArangoDBGraphStoreAction(GraphStoreAction):
             properties = params["properties"]
             collection = params["collection"]
 
-            affected_rows = 0
+            if not properties:
+                return { "affected_rows": 0 }
+
+            docs: Dict[str, List[Dict[str, Any]]] = {}
+
+            for id in node_ids or []:
+                collection_name, doc = ArangoDBQueryBuilder.build_update_doc(str(id), properties, collection or "nodes")
+                docs.setdefault(collection_name, []).append(doc)
+
+            for id in relationship_ids or []:
+                collection_name, doc = ArangoDBQueryBuilder.build_update_doc(str(id), properties, collection or "edges")
+                docs.setdefault(collection_name, []).append(doc)
 
-            if properties:
-                for id in node_ids or []:
-                    collection_name, doc = ArangoDBQueryBuilder.build_update_doc(str(id), properties, collection or "nodes")
-                    self.database.collection(collection_name).update(doc)
-                    affected_rows += 1
+            affected_rows = 0
 
-                for id in relationship_ids or []:
-                    collection_name, doc = ArangoDBQueryBuilder.build_update_doc(str(id), properties, collection or "edges")
-                    self.database.collection(collection_name).update(doc)
-                    affected_rows += 1
+            for collection_name, collection_docs in docs.items():
+                for rows in self._split_rows(collection_docs):
+                    aql, bind_vars = ArangoDBQueryBuilder.build_update_docs(collection_name, rows)
+                    affected_rows += len(list(self.database.aql.execute(aql, bind_vars=bind_vars)))
 
             return { "affected_rows": affected_rows }
 
@@ -221,17 +241,22 @@ class ArangoDBGraphStoreAction(GraphStoreAction):
         def _delete() -> Dict[str, Any]:
             collection = params["collection"]
 
-            affected_rows = 0
+            keys: Dict[str, List[str]] = {}
 
             for id in node_ids or []:
                 collection_name, key = ArangoDBQueryBuilder.resolve_doc_id(str(id), collection or "nodes")
-                self.database.collection(collection_name).delete(key)
-                affected_rows += 1
+                keys.setdefault(collection_name, []).append(key)
 
             for id in relationship_ids or []:
                 collection_name, key = ArangoDBQueryBuilder.resolve_doc_id(str(id), collection or "edges")
-                self.database.collection(collection_name).delete(key)
-                affected_rows += 1
+                keys.setdefault(collection_name, []).append(key)
+
+            affected_rows = 0
+
+            for collection_name, collection_keys in keys.items():
+                for rows in self._split_rows(collection_keys):
+                    aql, bind_vars = ArangoDBQueryBuilder.build_remove_docs(collection_name, rows)
+                    affected_rows += len(list(self.database.aql.execute(aql, bind_vars=bind_vars)))
 
             return { "affected_rows": affected_rows }
 
@@ -251,38 +276,33 @@ class ArangoDBGraphStoreAction(GraphStoreAction):
             graph_name         = params["graph"]
             edge_collection    = params["edge_collection"]
 
-            direction_map = { "out": "outbound", "in": "inbound", "both": "any" }
-            arango_direction = direction_map.get(direction, "outbound")
+            aql, bind_vars = ArangoDBQueryBuilder.build_traverse(
+                start_nodes,
+                direction,
+                max_depth,
+                graph_name,
+                edge_collection,
+                relationship_types,
+            )
+            cursor = self.database.aql.execute(aql, bind_vars=bind_vars)
 
-            records: List[Dict[str, Any]] = []
+            return [ doc for doc in cursor ]
 
-            for start_node in start_nodes:
-                if graph_name:
-                    ArangoDBQueryBuilder.verify_identifier(graph_name, "graph")
-                    graph = self.database.graph(graph_name)
-                    result = graph.traverse(
-                        start_vertex=str(start_node),
-                        direction=arango_direction,
-                        max_depth=max_depth
-                    )
-
-                    vertices = result.get("vertices", [])
-                    records.extend({ "node": vertex, "depth": None } for vertex in vertices[1:])
-                    continue
-
-                aql, bind_vars = ArangoDBQueryBuilder.build_traverse(
-                    start_node,
-                    direction,
-                    max_depth,
-                    edge_collection,
-                    relationship_types,
-                )
-                cursor = self.database.aql.execute(aql, bind_vars=bind_vars)
-                records.extend(doc for doc in cursor)
+        return await self._run_in_executor(_traverse)
 
-            return records
+    def _insert_docs(self, docs: Dict[str, List[Tuple[int, Dict[str, Any]]]], edge: bool) -> Dict[int, str]:
+        ids: Dict[int, str] = {}
 
-        return await self._run_in_executor(_traverse)
+        for collection_name, indexed_docs in docs.items():
+            if not self.database.has_collection(collection_name):
+                self.database.create_collection(collection_name, edge=edge)
+
+            for rows in self._split_rows(indexed_docs):
+                aql, bind_vars = ArangoDBQueryBuilder.build_insert_docs(collection_name, [ doc for _, doc in rows ])
+                cursor = self.database.aql.execute(aql, bind_vars=bind_vars)
+                ids.update(zip([ index for index, _ in rows ], cursor))
+
+        return ids
 
 @register_graph_store_service(GraphStoreDriver.ARANGODB)
 class ArangoDBGraphStoreService(GraphStoreService):
@@ -309,7 +329,7 @@ class ArangoDBGraphStoreService(GraphStoreService):
             self.database = None
 
     async def _run(self, action: GraphStoreActionConfig, context: ComponentActionContext) -> Any:
-        return await ArangoDBGraphStoreAction(action, self.database).run(context)
+        return await ArangoDBGraphStoreAction(action, self.database, self.config.write_batch_size).run(context)
 
     def _create_client(self) -> Tuple[ArangoClient, StandardDatabase]:
         from arango import ArangoClient
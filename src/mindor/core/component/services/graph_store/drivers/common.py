@@ -13,9 +13,10 @@ from ....action.base import ComponentAction
 import asyncio
 
 class GraphStoreAction(ComponentAction):
-    def __init__(self, config: GraphStoreActionConfig, database: Any):
+    def __init__(self, config: GraphStoreActionConfig, database: Any, write_batch_size: int = 1000):
         self.config: GraphStoreActionConfig = config
         self.database: Any = database
+        self.write_batch_size: int = write_batch_size
 
     async def run(self, context: ComponentActionContext) -> Any:
         input, is_single_input, is_streaming_input = await self._prepare_input(self.config.method, context)
@@ -145,6 +146,9 @@ class GraphStoreAction(ComponentAction):
 
         raise ValueError(f"Unsupported graph store action method: {method}")
 
+    def _split_rows(self, rows: List[Any]) -> List[List[Any]]:
+        return [ rows[index:index + self.write_batch_size] for index in range(0, len(rows), self.write_batch_size) ]
+
     async def _process_batch(
         self,
         method: GraphStoreActionMethod,
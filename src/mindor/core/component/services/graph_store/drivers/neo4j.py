@@ -24,74 +24,55 @@ class Neo4jQueryBuilder:
         return value
 
     @staticmethod
-    def build_create_node(label: str, properties: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    def build_create_nodes(label: str) -> str:
         label = Neo4jQueryBuilder.verify_identifier(label, "label")
-        prop_str = ", ".join(f"{k}: ${k}" for k in properties.keys())
-        cypher = f"CREATE (n:{label} {{{prop_str}}}) RETURN elementId(n) AS id"
-        return cypher, properties
+        return f"UNWIND $rows AS row CREATE (n:{label}) SET n = row.properties RETURN row.index AS index, elementId(n) AS id"
 
     @staticmethod
-    def build_create_relationship(rel_type: str, from_id: str, to_id: str, properties: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    def build_create_relationships(rel_type: str) -> str:
         rel_type = Neo4jQueryBuilder.verify_identifier(rel_type, "relationship type")
-        prop_params = { f"prop_{k}": v for k, v in properties.items() }
-        params: Dict[str, Any] = { "from_id": from_id, "to_id": to_id, **prop_params }
-
-        if properties:
-            prop_str = ", ".join(f"{k}: $prop_{k}" for k in properties.keys())
-            cypher = f"MATCH (a), (b) WHERE elementId(a) = $from_id AND elementId(b) = $to_id CREATE (a)-[r:{rel_type} {{{prop_str}}}]->(b) RETURN elementId(r) AS id"
-        else:
-            cypher = f"MATCH (a), (b) WHERE elementId(a) = $from_id AND elementId(b) = $to_id CREATE (a)-[r:{rel_type}]->(b) RETURN elementId(r) AS id"
-
-        return cypher, params
+        return (
+            "UNWIND $rows AS row "
+            "MATCH (a) WHERE elementId(a) = row.from_id "
+            "MATCH (b) WHERE elementId(b) = row.to_id "
+            f"CREATE (a)-[r:{rel_type}]->(b) SET r = row.properties "
+            "RETURN row.index AS index, elementId(r) AS id"
+        )
 
     @staticmethod
-    def build_update_node(node_id: str, properties: Optional[Dict[str, Any]], labels: Optional[Union[str, List[str]]]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    def build_update_nodes(properties: Optional[Dict[str, Any]], labels: Optional[Union[str, List[str]]]) -> Optional[str]:
         clauses = []
-        params: Dict[str, Any] = { "id": node_id }
 
         if properties:
-            set_parts = []
-            for k, v in properties.items():
-                params[f"prop_{k}"] = v
-                set_parts.append(f"n.{k} = $prop_{k}")
-            clauses.append("SET " + ", ".join(set_parts))
+            clauses.append("SET n += $properties")
 
         if labels:
             label_list = labels if isinstance(labels, list) else [labels]
             for label in label_list:
                 Neo4jQueryBuilder.verify_identifier(label, "label")
-                clauses.append(f"SET n:{label}")
+            clauses.append("SET n:" + ":".join(label_list))
 
         if not clauses:
             return None
 
-        cypher = f"MATCH (n) WHERE elementId(n) = $id {' '.join(clauses)} RETURN n"
-        return cypher, params
+        return f"UNWIND $ids AS id MATCH (n) WHERE elementId(n) = id {' '.join(clauses)} RETURN count(n) AS count"
 
     @staticmethod
-    def build_update_relationship(relationship_id: str, properties: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
-        params: Dict[str, Any] = { "id": relationship_id }
-        set_parts = []
-        for k, v in properties.items():
-            params[f"prop_{k}"] = v
-            set_parts.append(f"r.{k} = $prop_{k}")
-        cypher = f"MATCH ()-[r]->() WHERE elementId(r) = $id SET {', '.join(set_parts)} RETURN r"
-        return cypher, params
+    def build_update_relationships() -> str:
+        return "UNWIND $ids AS id MATCH ()-[r]->() WHERE elementId(r) = id SET r += $properties RETURN count(r) AS count"
 
     @staticmethod
-    def build_delete_node(node_id: str, detach: bool) -> Tuple[str, Dict[str, Any]]:
+    def build_delete_nodes(detach: bool) -> str:
         delete_clause = "DETACH DELETE n" if detach else "DELETE n"
-        cypher = f"MATCH (n) WHERE elementId(n) = $id {delete_clause}"
-        return cypher, { "id": node_id }
+        return f"UNWIND $ids AS id MATCH (n) WHERE elementId(n) = id {delete_clause} RETURN count(*) AS count"
 
     @staticmethod
-    def build_delete_relationship(relationship_id: str) -> Tuple[str, Dict[str, Any]]:
-        cypher = "MATCH ()-[r]->() WHERE elementId(r) = $id DELETE r"
-        return cypher, { "id": relationship_id }
+    def build_delete_relationships() -> str:
+        return "UNWIND $ids AS id MATCH ()-[r]->() WHERE elementId(r) = id DELETE r RETURN count(*) AS count"
 
     @staticmethod
     def build_traverse(
-        start_node: str,
+        start_nodes: List[str],
         direction: str,
         max_depth: int,
         relationship_types: Optional[List[str]],
@@ -116,11 +97,16 @@ class Neo4jQueryBuilder:
                 Neo4jQueryBuilder.verify_identifier(nl, "node label")
             label_filter = " AND (" + " OR ".join(f"ANY(l IN labels(end) WHERE l = '{label}')" for label in node_labels) + ")"
 
-        cypher = f"MATCH p = {path_pattern} WHERE elementId(start) = $start_id{label_filter} RETURN end AS node, length(p) AS depth, [rel IN relationships(p) | type(rel)] AS relationship_types"
+        cypher = f"UNWIND $start_ids AS start_id MATCH p = {path_pattern} WHERE elementId(start) = start_id{label_filter} RETURN end AS node, length(p) AS depth, [rel IN relationships(p) | type(rel)] AS relationship_types"
 
-        return cypher, { "start_id": start_node }
+        return cypher, { "start_ids": start_nodes }
 
 class Neo4jGraphStoreAction(GraphStoreAction):
+    def __init__(self, config: GraphStoreActionConfig, driver: AsyncDriver, write_batch_size: int = 1000, database_name: Optional[str] = None):
+        super().__init__(config, driver, write_batch_size)
+
+        self.database_name: Optional[str] = database_name
+
     async def _query(
         self,
         queries: List[str],
@@ -134,9 +120,10 @@ class Neo4jGraphStoreAction(GraphStoreAction):
 
         records: List[Dict[str, Any]] = []
 
-        for query in queries:
-            result = await self.database.run(query, parameters=bind_vars or {})
-            records.extend(await result.data())
+        async with self._open_session() as session:
+            for query in queries:
+                result = await session.run(query, parameters=bind_vars or {})
+                records.extend(await result.data())
 
         return records
 
@@ -148,39 +135,37 @@ class Neo4jGraphStoreAction(GraphStoreAction):
         params: Dict[str, Any],
         cancellation_token: Optional[CancellationToken],
     ) -> Dict[str, Any]:
-        node_ids: List[str] = []
-        relationship_ids: List[str] = []
-        created_nodes = 0
-        created_relationships = 0
-
-        for node in nodes or []:
-            cypher, cypher_params = Neo4jQueryBuilder.build_create_node(
-                node.get("label", "Node"),
-                node.get("properties", {}),
-            )
-            result = await self.database.run(cypher, parameters=cypher_params)
-            record = await result.single()
-            if record:
-                node_ids.append(record["id"])
-            created_nodes += 1
-
-        for relationship in relationships or []:
-            cypher, cypher_params = Neo4jQueryBuilder.build_create_relationship(
-                relationship.get("type", "RELATED_TO"),
-                relationship.get("from"),
-                relationship.get("to"),
-                relationship.get("properties", {}) or {},
-            )
-            result = await self.database.run(cypher, parameters=cypher_params)
-            record = await result.single()
-            if record:
-                relationship_ids.append(record["id"])
-            created_relationships += 1
+        nodes, relationships = nodes or [], relationships or []
+        node_rows: Dict[str, List[Dict[str, Any]]] = {}
+        relationship_rows: Dict[str, List[Dict[str, Any]]] = {}
+
+        for index, node in enumerate(nodes):
+            node_rows.setdefault(node.get("label", "Node"), []).append({
+                "index": index,
+                "properties": node.get("properties", {}),
+            })
+
+        for index, relationship in enumerate(relationships):
+            relationship_rows.setdefault(relationship.get("type", "RELATED_TO"), []).append({
+                "index": index,
+                "from_id": relationship.get("from"),
+                "to_id": relationship.get("to"),
+                "properties": relationship.get("properties", {}) or {},
+            })
+
+        statements = [
+            *[ (Neo4jQueryBuilder.build_create_nodes(label), "rows", rows) for label, rows in node_rows.items() ],
+            *[ (Neo4jQueryBuilder.build_create_relationships(rel_type), "rows", rows) for rel_type, rows in relationship_rows.items() ],
+        ]
+        records = await self._run_unwind_statements(statements)
+        node_count = sum(len(rows) for rows in node_rows.values())
+        node_ids: Dict[int, str] = { record["index"]: record["id"] for record in records[:node_count] }
+        relationship_ids: Dict[int, str] = { record["index"]: record["id"] for record in records[node_count:] }
 
         return {
-            "ids": node_ids + relationship_ids,
-            "created_nodes": created_nodes,
-            "created_relationships": created_relationships,
+            "ids": [ node_ids[index] for index in sorted(node_ids) ] + [ relationship_ids[index] for index in sorted(relationship_ids) ],
+            "created_nodes": len(node_ids),
+            "created_relationships": len(relationship_ids),
         }
 
     async def _update(
@@ -194,22 +179,18 @@ class Neo4jGraphStoreAction(GraphStoreAction):
         properties = params["properties"]
         labels     = params["labels"]
 
-        affected_rows = 0
+        statements: List[Tuple[str, str, List[Any]]] = []
+        cypher = Neo4jQueryBuilder.build_update_nodes(properties, labels)
 
-        for id in node_ids or []:
-            built = Neo4jQueryBuilder.build_update_node(id, properties, labels)
-            if built:
-                cypher, cypher_params = built
-                await self.database.run(cypher, parameters=cypher_params)
-                affected_rows += 1
+        if cypher and node_ids:
+            statements.append((cypher, "ids", node_ids))
 
-        if properties:
-            for id in relationship_ids or []:
-                cypher, cypher_params = Neo4jQueryBuilder.build_update_relationship(id, properties)
-                await self.database.run(cypher, parameters=cypher_params)
-                affected_rows += 1
+        if properties and relationship_ids:
+            statements.append((Neo4jQueryBuilder.build_update_relationships(), "ids", relationship_ids))
+
+        records = await self._run_unwind_statements(statements, { "properties": properties or {} })
 
-        return { "affected_rows": affected_rows }
+        return { "affected_rows": sum(record["count"] for record in records) }
 
     async def _delete(
         self,
@@ -221,19 +202,17 @@ class Neo4jGraphStoreAction(GraphStoreAction):
     ) -> Dict[str, Any]:
         detach = params["detach"]
 
-        affected_rows = 0
+        statements: List[Tuple[str, str, List[Any]]] = []
 
-        for id in node_ids or []:
-            cypher, cypher_params = Neo4jQueryBuilder.build_delete_node(id, detach)
-            await self.database.run(cypher, parameters=cypher_params)
-            affected_rows += 1
+        if node_ids:
+            statements.append((Neo4jQueryBuilder.build_delete_nodes(detach), "ids", node_ids))
 
-        for id in relationship_ids or []:
-            cypher, cypher_params = Neo4jQueryBuilder.build_delete_relationship(id)
-            await self.database.run(cypher, parameters=cypher_params)
-            affected_rows += 1
+        if relationship_ids:
+            statements.append((Neo4jQueryBuilder.build_delete_relationships(), "ids", relationship_ids))
 
-        return { "affected_rows": affected_rows }
+        records = await self._run_unwind_statements(statements)
+
+        return { "affected_rows": sum(record["count"] for record in records) }
 
     async def _traverse(
         self,
@@ -247,51 +226,75 @@ class Neo4jGraphStoreAction(GraphStoreAction):
         relationship_types = params["relationship_types"]
         node_labels        = params["node_labels"]
 
+        cypher, cypher_params = Neo4jQueryBuilder.build_traverse(
+            start_nodes,
+            direction,
+            max_depth,
+            relationship_types,
+            node_labels,
+        )
+        async with self._open_session() as session:
+            result = await session.run(cypher, parameters=cypher_params)
+            return await result.data()
+
+    async def _run_unwind_statements(self, statements: List[Tuple[str, str, List[Any]]], parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Runs each `(cypher, parameter name, rows)` statement in chunks of `write_batch_size` rows.
+
+        Chunks are packed into explicit transactions of up to `write_batch_size`
+        rows, so a large write costs one round trip per chunk instead of per row.
+        """
+        chunks = [
+            (cypher, key, rows)
+            for cypher, key, items in statements
+            for rows in self._split_rows(items)
+        ]
         records: List[Dict[str, Any]] = []
 
-        for start_node in start_nodes:
-            cypher, cypher_params = Neo4jQueryBuilder.build_traverse(
-                start_node,
-                direction,
-                max_depth,
-                relationship_types,
-                node_labels,
-            )
-            result = await self.database.run(cypher, parameters=cypher_params)
-            records.extend(await result.data())
+        if not chunks:
+            return records
+
+        async with self._open_session() as session:
+            while chunks:
+                row_count = 0
+                async with await session.begin_transaction() as transaction:
+                    while chunks and (row_count == 0 or row_count + len(chunks[0][2]) <= self.write_batch_size):
+                        cypher, key, rows = chunks.pop(0)
+                        result = await transaction.run(cypher, parameters={ **(parameters or {}), key: rows })
+                        records.extend(await result.data())
+                        row_count += len(rows)
+                    await transaction.commit()
 
         return records
 
+    def _open_session(self) -> AsyncSession:
+        # A session holds at most one open transaction and is not safe for
+        # concurrent use, so every call borrows its own from the driver's pool.
+        return self.database.session(database=self.database_name)
+
 @register_graph_store_service(GraphStoreDriver.NEO4J)
 class Neo4jGraphStoreService(GraphStoreService):
     def __init__(self, id: str, config: GraphStoreComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
         self.driver: Optional[AsyncDriver] = None
-        self.session: Optional[AsyncSession] = None
 
     def get_setup_requirements(self) -> Optional[List[str]]:
         return [ "neo4j" ]
 
     async def _start(self) -> None:
         self.driver = self._create_driver()
-        self.session = self.driver.session(database=self.config.database)
 
         await super()._start()
 
     async def _stop(self) -> None:
         await super()._stop()
 
-        if self.session:
-            await self.session.close()
-            self.session = None
-
         if self.driver:
             await self.driver.close()
             self.driver = None
 
     async def _run(self, action: GraphStoreActionConfig, context: ComponentActionContext) -> Any:
-        return await Neo4jGraphStoreAction(action, self.session).run(context)
+        return await Neo4jGraphStoreAction(action, self.driver, self.config.write_batch_size, self.config.database).run(context)
 
     def _create_driver(self) -> AsyncDriver:
         from neo4j import AsyncGraphDatabase
@@ -1,16 +1,22 @@
 from typing import Type, Optional, Dict, List, Any
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from mindor.dsl.schema.component import ImageCompressorComponentConfig, ImageCompressorDriver
 from mindor.dsl.schema.action import ImageCompressorActionConfig
 from mindor.core.foundation import AsyncService
 from ...context import ComponentActionContext
+import multiprocessing, os
 
 class ImageCompressorService(AsyncService):
+    uses_process_pool: bool = True
+
     def __init__(self, id: str, config: ImageCompressorComponentConfig, daemon: bool):
         super().__init__(daemon)
 
         self.id: str = id
         self.config: ImageCompressorComponentConfig = config
+        self.worker_count: int = config.max_workers or os.cpu_count() or 1
+        self.executor: Optional[ProcessPoolExecutor] = None
 
     def get_setup_requirements(self) -> Optional[List[str]]:
         return None
@@ -18,6 +24,19 @@ class ImageCompressorService(AsyncService):
     async def run(self, action: ImageCompressorActionConfig, context: ComponentActionContext) -> Any:
         return await self._run(action, context)
 
+    async def _start(self) -> None:
+        if self.uses_process_pool and self.worker_count > 1:
+            self.executor = ProcessPoolExecutor(max_workers=self.worker_count, mp_context=multiprocessing.get_context("spawn"))
+
+        await super()._start()
+
+    async def _stop(self) -> None:
+        await super()._stop()
+
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
     @abstractmethod
     async def _run(self, action: ImageCompressorActionConfig, context: ComponentActionContext) -> Any:
         pass
@@ -1,20 +1,55 @@
 from __future__ import annotations
 
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Tuple, Callable, Any
 from collections.abc import AsyncIterator
+from concurrent.futures import Executor
 from abc import abstractmethod
 from mindor.dsl.schema.action import ImageCompressorActionConfig
 from mindor.core.foundation.streaming.iterators import StreamIterator
-from mindor.core.utils.iterators import BatchSourceIterator
+from mindor.core.utils.iterators import OrderedConcurrentIterator
 from mindor.core.logger import logging
 from ..base import ComponentActionContext
 from ....action.base import ComponentAction
 from PIL import Image as PILImage
-import io, asyncio
+import io, asyncio, functools, threading, time
+
+class CompressLevelSelector:
+    """Picks the highest compression level whose encode time fits a latency budget.
+
+    Encode times observed per level are kept as a moving average of seconds per
+    megapixel. A level that has not been observed yet is tried as soon as every
+    level above it is known to run over budget, so the selector walks down from
+    the configured maximum until it finds a level that fits.
+    """
+    def __init__(self, min_level: int = 0, smoothing: float = 0.3):
+        self.min_level: int = min_level
+        self.smoothing: float = smoothing
+        self._seconds_per_megapixel: Dict[int, float] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def select(self, max_level: int, pixels: int, budget: float) -> int:
+        megapixels = max(pixels, 1) / 1_000_000
+
+        with self._lock:
+            for level in range(max_level, self.min_level, -1):
+                cost = self._seconds_per_megapixel.get(level)
+                if cost is None or cost * megapixels <= budget:
+                    return level
+
+        return min(self.min_level, max_level)
+
+    def observe(self, level: int, pixels: int, elapsed: float) -> None:
+        cost = elapsed / (max(pixels, 1) / 1_000_000)
+
+        with self._lock:
+            previous = self._seconds_per_megapixel.get(level)
+            self._seconds_per_megapixel[level] = cost if previous is None else previous + (cost - previous) * self.smoothing
 
 class ImageCompressorAction(ComponentAction):
-    def __init__(self, config: ImageCompressorActionConfig):
+    def __init__(self, config: ImageCompressorActionConfig, executor: Optional[Executor] = None, concurrency: int = 1):
         self.config: ImageCompressorActionConfig = config
+        self.executor: Optional[Executor] = executor
+        self.concurrency: int = concurrency
 
     async def run(self, context: ComponentActionContext) -> Any:
         image      = await context.render_image(self.config.image)
@@ -24,20 +59,15 @@ class ImageCompressorAction(ComponentAction):
 
         is_single_input  = not isinstance(image, (list, StreamIterator, AsyncIterator))
         is_direct_output = not self.config.output or self.config.output == "${result}"
+        window_size      = batch_size or self.concurrency
 
-        if isinstance(image, (StreamIterator, AsyncIterator)):
-            async def _stream_output_generator():
-                async for batch_images in BatchSourceIterator(image, batch_size=batch_size or 1):
-                    batch_results = await self._compress_batch(batch_images, params)
-                    for result in batch_results:
-                        yield result
+        async def _compress(image: Optional[PILImage.Image]) -> Optional[bytes]:
+            return await self._compress_image(image, params)
 
-            return _stream_output_generator()
+        if isinstance(image, (StreamIterator, AsyncIterator)):
+            return OrderedConcurrentIterator(image, _compress, window_size).__aiter__()
         else:
-            results = []
-            async for batch_images in BatchSourceIterator(image, batch_size=batch_size or 1):
-                batch_results = await self._compress_batch(batch_images, params)
-                results.extend(batch_results)
+            results = [ result async for result in OrderedConcurrentIterator(image, _compress, window_size) ]
 
             result = results[0] if is_single_input else results
             context.register_source("result", result)
@@ -47,24 +77,24 @@ class ImageCompressorAction(ComponentAction):
     async def _resolve_params(self, context: ComponentActionContext) -> Dict[str, Any]:
         return {}
 
-    async def _compress_batch(
-        self,
-        images: List[Optional[PILImage.Image]],
-        params: Dict[str, Any],
-    ) -> List[Optional[bytes]]:
-        async def _compress(image: Optional[PILImage.Image]) -> Optional[bytes]:
-            if image is None:
-                logging.debug("Image compressor skipped because no image was provided.")
-                return None
-
-            return await self._compress(image, params)
+    async def _compress_image(self, image: Optional[PILImage.Image], params: Dict[str, Any]) -> Optional[bytes]:
+        if image is None:
+            logging.debug("Image compressor skipped because no image was provided.")
+            return None
 
-        return await asyncio.gather(*[ _compress(image) for image in images ])
+        return await self._compress(image, params)
 
     @abstractmethod
     async def _compress(self, image: PILImage.Image, params: Dict[str, Any]) -> bytes:
         pass
 
+    async def _run_in_worker(self, fn: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+        """Runs `fn` in the component's process pool, or a thread when there is none, and returns its result with the time it took."""
+        if self.executor is not None:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(_run_timed, fn, *args))
+
+        return await self._run_in_executor(_run_timed, fn, *args)
+
     @staticmethod
     def _encode_png_lossless(image: PILImage.Image, compress_level: int, strip_metadata: bool) -> bytes:
         save_params: Dict[str, Any] = {
@@ -97,3 +127,8 @@ class ImageCompressorAction(ComponentAction):
                 added = True
 
         return pnginfo if added else None
+
+def _run_timed(fn: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    started_at = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started_at
@@ -1,33 +1,51 @@
 from __future__ import annotations
 
-from typing import Dict, Any
+from typing import Optional, Dict, Any
+from concurrent.futures import Executor
 from mindor.dsl.schema.component import ImageCompressorComponentConfig
 from mindor.dsl.schema.action import ImageCompressorActionConfig
 from ..base import ImageCompressorService, ImageCompressorDriver, register_image_compressor_service
 from ..base import ComponentActionContext
-from .common import ImageCompressorAction
+from .common import ImageCompressorAction, CompressLevelSelector
 from PIL import Image as PILImage
 
 class NativeImageCompressorAction(ImageCompressorAction):
+    def __init__(self, config: ImageCompressorActionConfig, executor: Optional[Executor], concurrency: int, level_selector: CompressLevelSelector):
+        super().__init__(config, executor, concurrency)
+
+        self.level_selector: CompressLevelSelector = level_selector
+
     async def _resolve_params(self, context: ComponentActionContext) -> Dict[str, Any]:
         strip_metadata = await context.render_scalar(self.config.strip_metadata, bool)
         compress_level = await context.render_scalar(self.config.compress_level, int)
+        target_latency = await context.render_scalar(self.config.target_latency, "time", None)
 
         return {
             "strip_metadata": strip_metadata,
             "compress_level": compress_level,
+            "target_latency": target_latency,
         }
 
     async def _compress(self, image: PILImage.Image, params: Dict[str, Any]) -> bytes:
-        def _compress() -> bytes:
-            return self._encode_png_lossless(image, params["compress_level"], params["strip_metadata"])
+        compress_level, target_latency = params["compress_level"], params["target_latency"]
+        pixels = image.width * image.height
+
+        if target_latency is not None:
+            compress_level = self.level_selector.select(compress_level, pixels, target_latency)
 
-        return await self._run_in_executor(_compress)
+        result, elapsed = await self._run_in_worker(self._encode_png_lossless, image, compress_level, params["strip_metadata"])
+
+        if target_latency is not None:
+            self.level_selector.observe(compress_level, pixels, elapsed)
+
+        return result
 
 @register_image_compressor_service(ImageCompressorDriver.NATIVE)
 class NativeImageCompressorService(ImageCompressorService):
     def __init__(self, id: str, config: ImageCompressorComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
+        self.level_selector: CompressLevelSelector = CompressLevelSelector()
+
     async def _run(self, action: ImageCompressorActionConfig, context: ComponentActionContext) -> Any:
-        return await NativeImageCompressorAction(action).run(context)
+        return await NativeImageCompressorAction(action, self.executor, self.worker_count, self.level_selector).run(context)
@@ -19,21 +19,23 @@ class OxipngImageCompressorAction(ImageCompressorAction):
         }
 
     async def _compress(self, image: PILImage.Image, params: Dict[str, Any]) -> bytes:
-        def _compress() -> bytes:
-            import oxipng
+        result, _ = await self._run_in_worker(self._optimize_png, image, params["level"], params["strip_metadata"])
+        return result
 
-            # Encode losslessly first so oxipng has a valid PNG to optimize.
-            # Preserve metadata at this stage; oxipng strips it below when requested.
-            input_png = self._encode_png_lossless(image, compress_level=6, strip_metadata=False)
+    @staticmethod
+    def _optimize_png(image: PILImage.Image, level: int, strip_metadata: bool) -> bytes:
+        import oxipng
 
-            if params["strip_metadata"]:
-                strip = oxipng.StripChunks.safe()
-            else:
-                strip = oxipng.StripChunks.none()
+        # Encode losslessly first so oxipng has a valid PNG to optimize.
+        # Preserve metadata at this stage; oxipng strips it below when requested.
+        input_png = OxipngImageCompressorAction._encode_png_lossless(image, compress_level=6, strip_metadata=False)
 
-            return oxipng.optimize_from_memory(input_png, level=params["level"], strip=strip)
+        if strip_metadata:
+            strip = oxipng.StripChunks.safe()
+        else:
+            strip = oxipng.StripChunks.none()
 
-        return await self._run_in_executor(_compress)
+        return oxipng.optimize_from_memory(input_png, level=level, strip=strip)
 
 @register_image_compressor_service(ImageCompressorDriver.OXIPNG)
 class OxipngImageCompressorService(ImageCompressorService):
@@ -44,4 +46,4 @@ class OxipngImageCompressorService(ImageCompressorService):
         return [ "pyoxipng" ]
 
     async def _run(self, action: ImageCompressorActionConfig, context: ComponentActionContext) -> Any:
-        return await OxipngImageCompressorAction(action).run(context)
+        return await OxipngImageCompressorAction(action, self.executor, self.worker_count).run(context)
@@ -54,8 +54,11 @@ class PngquantImageCompressorAction(ImageCompressorAction):
 
 @register_image_compressor_service(ImageCompressorDriver.PNGQUANT)
 class PngquantImageCompressorService(ImageCompressorService):
+    # Each image already runs in its own pngquant process.
+    uses_process_pool: bool = False
+
     def __init__(self, id: str, config: ImageCompressorComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
     async def _run(self, action: ImageCompressorActionConfig, context: ComponentActionContext) -> Any:
-        return await PngquantImageCompressorAction(action).run(context)
+        return await PngquantImageCompressorAction(action, None, self.worker_count).run(context)
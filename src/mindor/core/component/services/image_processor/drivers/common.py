@@ -7,12 +7,11 @@ from abc import abstractmethod
 from mindor.dsl.schema.action import ImageProcessorActionConfig, ImageProcessorActionMethod, ImageScaleMode, FlipDirection, ImageConcatMode, ImagePositionAnchor, MosaicMode, ImageRegion
 from mindor.core.foundation.streaming.iterators import StreamIterator
 from mindor.core.foundation.variable.image import ImageArrayValue
-from mindor.core.utils.iterators import BatchSourceIterator
+from mindor.core.utils.iterators import OrderedConcurrentIterator
 from mindor.core.logger import logging
 from ..base import ComponentActionContext
 from ....action.base import ComponentAction
 from PIL import Image as PILImage
-import asyncio
 
 class ImageProcessorAction(ComponentAction):
     def __init__(self, config: ImageProcessorActionConfig):
@@ -27,19 +26,13 @@ class ImageProcessorAction(ComponentAction):
         is_single_input  = not isinstance(image, (list, StreamIterator, AsyncIterator))
         is_direct_output = not self.config.output or self.config.output == "${result}"
 
-        if isinstance(image, (StreamIterator, AsyncIterator)):
-            async def _stream_output_generator():
-                async for batch_images in BatchSourceIterator(image, batch_size=batch_size or 1):
-                    batch_results = await self._process_batch(self.config.method, batch_images, params)
-                    for result in batch_results:
-                        yield result
+        async def _process(image: Optional[Union[PILImage.Image, ImageArrayValue]]) -> Optional[PILImage.Image]:
+            return await self._process_image(self.config.method, image, params)
 
-            return _stream_output_generator()
+        if isinstance(image, (StreamIterator, AsyncIterator)):
+            return OrderedConcurrentIterator(image, _process, batch_size or 1).__aiter__()
         else:
-            results = []
-            async for batch_images in BatchSourceIterator(image, batch_size=batch_size or 1):
-                batch_results = await self._process_batch(self.config.method, batch_images, params)
-                results.extend(batch_results)
+            results = [ result async for result in OrderedConcurrentIterator(image, _process, batch_size or 1) ]
 
             result = results[0] if is_single_input else results
             context.register_source("result", result)
@@ -52,11 +45,13 @@ class ImageProcessorAction(ComponentAction):
 
         return await context.render_image(self.config.image)
 
-    async def _resolve_params(self, method: ImageProcessorActionMethod, context: ComponentActionContext) -> Dict[str, Any]:
+    async def _resolve_params(self, method: ImageProcessorActionMethod, context: ComponentActionContext, config: Optional[Any] = None) -> Dict[str, Any]:
+        config = config or self.config
+
         if method == ImageProcessorActionMethod.RESIZE:
-            width      = await context.render_scalar(self.config.width, int)
-            height     = await context.render_scalar(self.config.height, int)
-            scale_mode = await context.render_variable(self.config.scale_mode)
+            width      = await context.render_scalar(config.width, int)
+            height     = await context.render_scalar(config.height, int)
+            scale_mode = await context.render_variable(config.scale_mode)
 
             if width is None and height is None:
                 raise ValueError("At least one of 'width' or 'height' must be specified for 'resize' method")
@@ -69,10 +64,10 @@ class ImageProcessorAction(ComponentAction):
             return { "width": width, "height": height, "scale_mode": scale_mode }
 
         if method == ImageProcessorActionMethod.CROP:
-            x      = await context.render_scalar(self.config.x, int)
-            y      = await context.render_scalar(self.config.y, int)
-            width  = await context.render_scalar(self.config.width, int)
-            height = await context.render_scalar(self.config.height, int)
+            x      = await context.render_scalar(config.x, int)
+            y      = await context.render_scalar(config.y, int)
+            width  = await context.render_scalar(config.width, int)
+            height = await context.render_scalar(config.height, int)
 
             if x is None or y is None or width is None or height is None:
                 raise ValueError("'x', 'y', 'width', and 'height' must all be specified for 'crop' method")
@@ -80,8 +75,8 @@ class ImageProcessorAction(ComponentAction):
             return { "x": x, "y": y, "width": width, "height": height }
 
         if method == ImageProcessorActionMethod.ROTATE:
-            angle  = await context.render_scalar(self.config.angle, float)
-            expand = await context.render_scalar(self.config.expand, bool)
+            angle  = await context.render_scalar(config.angle, float)
+            expand = await context.render_scalar(config.expand, bool)
 
             if angle is None:
                 raise ValueError("'angle' must be specified for 'rotate' method")
@@ -89,7 +84,7 @@ class ImageProcessorAction(ComponentAction):
             return { "angle": angle, "expand": expand }
 
         if method == ImageProcessorActionMethod.FLIP:
-            direction = await context.render_variable(self.config.direction)
+            direction = await context.render_variable(config.direction)
 
             if direction is None:
                 raise ValueError("'direction' must be specified for 'flip' method")
@@ -105,7 +100,7 @@ class ImageProcessorAction(ComponentAction):
             return {}
 
         if method == ImageProcessorActionMethod.BLUR:
-            radius = await context.render_scalar(self.config.radius, float)
+            radius = await context.render_scalar(config.radius, float)
 
             if radius is None:
                 raise ValueError("'radius' must be specified for 'blur' method")
@@ -113,7 +108,7 @@ class ImageProcessorAction(ComponentAction):
             return { "radius": radius }
 
         if method == ImageProcessorActionMethod.SHARPEN:
-            factor = await context.render_scalar(self.config.factor, float)
+            factor = await context.render_scalar(config.factor, float)
 
             if factor is None:
                 raise ValueError("'factor' must be specified for 'sharpen' method")
@@ -121,7 +116,7 @@ class ImageProcessorAction(ComponentAction):
             return { "factor": factor }
 
         if method == ImageProcessorActionMethod.ADJUST_BRIGHTNESS:
-            factor = await context.render_scalar(self.config.factor, float)
+            factor = await context.render_scalar(config.factor, float)
 
             if factor is None:
                 raise ValueError("'factor' must be specified for 'adjust-brightness' method")
@@ -129,7 +124,7 @@ class ImageProcessorAction(ComponentAction):
             return { "factor": factor }
 
         if method == ImageProcessorActionMethod.ADJUST_CONTRAST:
-            factor = await context.render_scalar(self.config.factor, float)
+            factor = await context.render_scalar(config.factor, float)
 
             if factor is None:
                 raise ValueError("'factor' must be specified for 'adjust-contrast' method")
@@ -137,7 +132,7 @@ class ImageProcessorAction(ComponentAction):
             return { "factor": factor }
 
         if method == ImageProcessorActionMethod.ADJUST_SATURATION:
-            factor = await context.render_scalar(self.config.factor, float)
+            factor = await context.render_scalar(config.factor, float)
 
             if factor is None:
                 raise ValueError("'factor' must be specified for 'adjust-saturation' method")
@@ -145,11 +140,11 @@ class ImageProcessorAction(ComponentAction):
             return { "factor": factor }
 
         if method == ImageProcessorActionMethod.CONCAT:
-            mode       = await context.render_variable(self.config.mode)
-            columns    = await context.render_scalar(self.config.columns, int)
-            rows       = await context.render_scalar(self.config.rows, int)
-            spacing    = await context.render_scalar(self.config.spacing, int)
-            background = await context.render_scalar(self.config.background, "color")
+            mode       = await context.render_variable(config.mode)
+            columns    = await context.render_scalar(config.columns, int)
+            rows       = await context.render_scalar(config.rows, int)
+            spacing    = await context.render_scalar(config.spacing, int)
+            background = await context.render_scalar(config.background, "color")
 
             try:
                 mode = ImageConcatMode(mode)
@@ -165,8 +160,8 @@ class ImageProcessorAction(ComponentAction):
             }
 
         if method == ImageProcessorActionMethod.MERGE:
-            anchor     = await context.render_variable(self.config.anchor)
-            background = await context.render_scalar(self.config.background, "color")
+            anchor     = await context.render_variable(config.anchor)
+            background = await context.render_scalar(config.background, "color")
 
             try:
                 anchor = ImagePositionAnchor(anchor)
@@ -179,13 +174,13 @@ class ImageProcessorAction(ComponentAction):
             }
 
         if method == ImageProcessorActionMethod.OVERLAY:
-            overlay = await context.render_image(self.config.overlay)
-            x       = await context.render_scalar(self.config.x, int)
-            y       = await context.render_scalar(self.config.y, int)
-            width   = await context.render_scalar(self.config.width, int)
-            height  = await context.render_scalar(self.config.height, int)
-            anchor  = await context.render_variable(self.config.anchor)
-            opacity = await context.render_scalar(self.config.opacity, float)
+            overlay = await context.render_image(config.overlay)
+            x       = await context.render_scalar(config.x, int)
+            y       = await context.render_scalar(config.y, int)
+            width   = await context.render_scalar(config.width, int)
+            height  = await context.render_scalar(config.height, int)
+            anchor  = await context.render_variable(config.anchor)
+            opacity = await context.render_scalar(config.opacity, float)
 
             if isinstance(overlay, (list, StreamIterator, AsyncIterator)):
                 raise ValueError("'overlay' must resolve to a single image, not a batch or stream")
@@ -212,15 +207,15 @@ class ImageProcessorAction(ComponentAction):
             }
 
         if method == ImageProcessorActionMethod.MOSAIC:
-            mode           = await context.render_variable(self.config.mode)
-            regions        = await self._render_image_region(context)
-            block_size     = await context.render_scalar(self.config.block_size, int)
-            block_scale    = await context.render_scalar(self.config.block_scale, float)
-            min_block_size = await context.render_scalar(self.config.min_block_size, int)
-            max_block_size = await context.render_scalar(self.config.max_block_size, int)
-            blur_radius    = await context.render_scalar(self.config.blur_radius, float)
-            corner_radius  = await context.render_scalar(self.config.corner_radius, int)
-            corner_scale   = await context.render_scalar(self.config.corner_scale, float)
+            mode           = await context.render_variable(config.mode)
+            regions        = await self._render_image_region(context, config)
+            block_size     = await context.render_scalar(config.block_size, int)
+            block_scale    = await context.render_scalar(config.block_scale, float)
+            min_block_size = await context.render_scalar(config.min_block_size, int)
+            max_block_size = await context.render_scalar(config.max_block_size, int)
+            blur_radius    = await context.render_scalar(config.blur_radius, float)
+            corner_radius  = await context.render_scalar(config.corner_radius, int)
+            corner_scale   = await context.render_scalar(config.corner_scale, float)
 
             try:
                 mode = MosaicMode(mode)
@@ -272,22 +267,24 @@ class ImageProcessorAction(ComponentAction):
                 "corner_scale":   corner_scale,
             }
 
-        raise ValueError(f"Unsupported image processing action method: {self.config.method}")
+        if method == ImageProcessorActionMethod.PIPELINE:
+            operations = [ (operation.method, await self._resolve_params(operation.method, context, operation)) for operation in config.operations ]
 
-    async def _process_batch(
+            return { "operations": operations }
+
+        raise ValueError(f"Unsupported image processing action method: {config.method}")
+
+    async def _process_image(
         self,
         method: ImageProcessorActionMethod,
-        images: Union[List[Optional[PILImage.Image]], List[Optional[ImageArrayValue]]],
+        image: Optional[Union[PILImage.Image, ImageArrayValue]],
         params: Dict[str, Any],
-    ) -> List[Optional[PILImage.Image]]:
-        async def _process(image: Optional[Union[PILImage.Image, ImageArrayValue]]) -> Optional[PILImage.Image]:
-            if image is None:
-                logging.debug("Image processor (%s) skipped because no image was provided.", method)
-                return None
-
-            return await self._process(method, image, params)
+    ) -> Optional[PILImage.Image]:
+        if image is None:
+            logging.debug("Image processor (%s) skipped because no image was provided.", method)
+            return None
 
-        return await asyncio.gather(*[ _process(image) for image in images ])
+        return await self._process(method, image, params)
 
     async def _process(self, method: ImageProcessorActionMethod, image: Union[PILImage.Image, ImageArrayValue], params: Dict[str, Any]) -> PILImage.Image:
         if method == ImageProcessorActionMethod.RESIZE:
@@ -332,6 +329,9 @@ class ImageProcessorAction(ComponentAction):
         if method == ImageProcessorActionMethod.MOSAIC:
             return await self._mosaic(image, params)
 
+        if method == ImageProcessorActionMethod.PIPELINE:
+            return await self._pipeline(image, params)
+
         raise ValueError(f"Unsupported image processing action method: {method}")
 
     @abstractmethod
@@ -390,14 +390,18 @@ class ImageProcessorAction(ComponentAction):
     async def _mosaic(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
         pass
 
-    async def _render_image_region(self, context: ComponentActionContext) -> Optional[List[ImageRegion]]:
-        if isinstance(self.config.region, ImageRegion):
-            return [ self.config.region ]
+    @abstractmethod
+    async def _pipeline(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        pass
+
+    async def _render_image_region(self, context: ComponentActionContext, config: Any) -> Optional[List[ImageRegion]]:
+        if isinstance(config.region, ImageRegion):
+            return [ config.region ]
 
-        if isinstance(self.config.region, list):
-            return [ self._as_image_region(item) for item in self.config.region ]
+        if isinstance(config.region, list):
+            return [ self._as_image_region(item) for item in config.region ]
 
-        region = await context.render_variable(self.config.region)
+        region = await context.render_variable(config.region)
 
         if region is None:
             return None
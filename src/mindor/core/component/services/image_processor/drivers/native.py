@@ -2,222 +2,346 @@ from __future__ import annotations
 
 from typing import Optional, Dict, List, Tuple, Any
 from mindor.dsl.schema.component import ImageProcessorComponentConfig
-from mindor.dsl.schema.action import ImageProcessorActionConfig, ImageScaleMode, FlipDirection, ImageConcatMode, ImagePositionAnchor, MosaicMode, ImageRegion
+from mindor.dsl.schema.action import ImageProcessorActionConfig, ImageProcessorActionMethod, ImageScaleMode, FlipDirection, ImageConcatMode, ImagePositionAnchor, MosaicMode, ImageRegion
 from ..base import ImageProcessorService, ImageProcessorDriver, register_image_processor_service
 from ..base import ComponentActionContext
 from .common import ImageProcessorAction
 from PIL import Image as PILImage, ImageFilter, ImageEnhance, ImageDraw
-import math
+import io, math
 
 class NativeImageProcessorAction(ImageProcessorAction):
+    PIPELINE_REDUCING_GAP = 3.0
+
     async def _resize(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
-        def _resize() -> PILImage.Image:
-            scale_mode = params["scale_mode"]
-            original_width, original_height = image.size
-            target_width  = params["width"]  or original_width
-            target_height = params["height"] or original_height
+        return await self._run_in_executor(self._apply_resize, image, params)
 
-            if scale_mode == ImageScaleMode.FIT:
-                new_width, new_height = self._get_size_aspect_fit(target_width, target_height, original_width, original_height)
-                return image.resize((new_width, new_height), PILImage.Resampling.LANCZOS)
+    async def _crop(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_crop, image, params)
 
-            if scale_mode == ImageScaleMode.FILL:
-                new_width, new_height = self._get_size_aspect_fill(target_width, target_height, original_width, original_height)
-                resized = image.resize((new_width, new_height), PILImage.Resampling.LANCZOS)
+    async def _rotate(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_rotate, image, params)
 
-                crop_box = self._get_center_crop_box(new_width, new_height, target_width, target_height)
-                return resized.crop(crop_box)
+    async def _flip(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_flip, image, params)
 
-            return image.resize((target_width, target_height), PILImage.Resampling.LANCZOS)
+    async def _grayscale(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_grayscale, image, params)
 
-        return await self._run_in_executor(_resize)
+    async def _blur(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_blur, image, params)
 
-    async def _crop(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
-        def _crop() -> PILImage.Image:
-            x      = params["x"]
-            y      = params["y"]
-            width  = params["width"]
-            height = params["height"]
+    async def _sharpen(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_sharpen, image, params)
 
-            return image.crop((x, y, x + width, y + height))
+    async def _adjust_brightness(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_adjust_brightness, image, params)
 
-        return await self._run_in_executor(_crop)
+    async def _adjust_contrast(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_adjust_contrast, image, params)
 
-    async def _rotate(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
-        def _rotate() -> PILImage.Image:
-            return image.rotate(-params["angle"], expand=params["expand"], resample=PILImage.Resampling.BICUBIC)
+    async def _adjust_saturation(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_adjust_saturation, image, params)
 
-        return await self._run_in_executor(_rotate)
+    async def _concat(self, images: List[PILImage.Image], params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_concat, images, params)
 
-    async def _flip(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
-        def _flip() -> PILImage.Image:
-            if params["direction"] == FlipDirection.HORIZONTAL:
-                return image.transpose(PILImage.Transpose.FLIP_LEFT_RIGHT)
-            else:
-                return image.transpose(PILImage.Transpose.FLIP_TOP_BOTTOM)
+    async def _merge(self, images: List[PILImage.Image], params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_merge, images, params)
 
-        return await self._run_in_executor(_flip)
+    async def _overlay(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_overlay, image, params)
 
-    async def _grayscale(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
-        def _grayscale() -> PILImage.Image:
-            return image.convert("L")
+    async def _mosaic(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_mosaic, image, params)
 
-        return await self._run_in_executor(_grayscale)
+    async def _pipeline(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return await self._run_in_executor(self._apply_pipeline, image, params)
 
-    async def _blur(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
-        def _blur() -> PILImage.Image:
-            return image.filter(ImageFilter.GaussianBlur(radius=params["radius"]))
+    def _apply_resize(self, image: PILImage.Image, params: Dict[str, Any], source_size: Optional[Tuple[int, int]] = None, reducing_gap: Optional[float] = None) -> PILImage.Image:
+        (new_width, new_height), crop_box = self._get_resize_geometry(params, source_size or image.size)
+        resized = image.resize((new_width, new_height), PILImage.Resampling.LANCZOS, reducing_gap=reducing_gap)
 
-        return await self._run_in_executor(_blur)
+        if params["scale_mode"] == ImageScaleMode.FILL:
+            return resized.crop(crop_box)
 
-    async def _sharpen(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
-        def _sharpen() -> PILImage.Image:
-            return ImageEnhance.Sharpness(image).enhance(params["factor"])
+        return resized
 
-        return await self._run_in_executor(_sharpen)
+    def _apply_crop(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        x      = params["x"]
+        y      = params["y"]
+        width  = params["width"]
+        height = params["height"]
 
-    async def _adjust_brightness(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
-        def _adjust_brightness() -> PILImage.Image:
-            return ImageEnhance.Brightness(image).enhance(params["factor"])
+        return image.crop((x, y, x + width, y + height))
 
-        return await self._run_in_executor(_adjust_brightness)
+    def _apply_rotate(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return image.rotate(-params["angle"], expand=params["expand"], resample=PILImage.Resampling.BICUBIC)
 
-    async def _adjust_contrast(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
-        def _adjust_contrast() -> PILImage.Image:
-            return ImageEnhance.Contrast(image).enhance(params["factor"])
+    def _apply_flip(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        if params["direction"] == FlipDirection.HORIZONTAL:
+            return image.transpose(PILImage.Transpose.FLIP_LEFT_RIGHT)
+        else:
+            return image.transpose(PILImage.Transpose.FLIP_TOP_BOTTOM)
 
-        return await self._run_in_executor(_adjust_contrast)
+    def _apply_grayscale(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return image.convert("L")
 
-    async def _adjust_saturation(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
-        def _adjust_saturation() -> PILImage.Image:
-            return ImageEnhance.Color(image).enhance(params["factor"])
+    def _apply_blur(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return image.filter(ImageFilter.GaussianBlur(radius=params["radius"]))
 
-        return await self._run_in_executor(_adjust_saturation)
+    def _apply_sharpen(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return ImageEnhance.Sharpness(image).enhance(params["factor"])
 
-    async def _concat(self, images: List[PILImage.Image], params: Dict[str, Any]) -> PILImage.Image:
-        def _concat() -> PILImage.Image:
-            mode       = params["mode"]
-            spacing    = params["spacing"]
-            background = params["background"]
-            converted  = [ image.convert("RGBA") for image in images ]
+    def _apply_adjust_brightness(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return ImageEnhance.Brightness(image).enhance(params["factor"])
 
-            if mode == ImageConcatMode.HORIZONTAL:
-                return self._concat_horizontal(converted, spacing, background)
+    def _apply_adjust_contrast(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return ImageEnhance.Contrast(image).enhance(params["factor"])
 
-            if mode == ImageConcatMode.VERTICAL:
-                return self._concat_vertical(converted, spacing, background)
+    def _apply_adjust_saturation(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        return ImageEnhance.Color(image).enhance(params["factor"])
 
-            if mode == ImageConcatMode.GRID:
-                return self._concat_grid(converted, params["columns"], params["rows"], spacing, background)
+    def _apply_concat(self, images: List[PILImage.Image], params: Dict[str, Any]) -> PILImage.Image:
+        mode       = params["mode"]
+        spacing    = params["spacing"]
+        background = params["background"]
+        converted  = [ image.convert("RGBA") for image in images ]
 
-            raise ValueError(f"Unsupported concat mode: {mode}")
+        if mode == ImageConcatMode.HORIZONTAL:
+            return self._concat_horizontal(converted, spacing, background)
 
-        return await self._run_in_executor(_concat)
+        if mode == ImageConcatMode.VERTICAL:
+            return self._concat_vertical(converted, spacing, background)
 
-    async def _merge(self, images: List[PILImage.Image], params: Dict[str, Any]) -> PILImage.Image:
-        def _merge() -> PILImage.Image:
-            anchor     = params["anchor"]
-            background = params["background"]
-            converted  = [ image.convert("RGBA") for image in images ]
+        if mode == ImageConcatMode.GRID:
+            return self._concat_grid(converted, params["columns"], params["rows"], spacing, background)
 
-            max_width  = max(image.width  for image in converted)
-            max_height = max(image.height for image in converted)
-            canvas     = PILImage.new("RGBA", (max_width, max_height), background)
+        raise ValueError(f"Unsupported concat mode: {mode}")
 
-            anchor_x, anchor_y = self._resolve_anchor_point(anchor, canvas.size)
+    def _apply_merge(self, images: List[PILImage.Image], params: Dict[str, Any]) -> PILImage.Image:
+        anchor     = params["anchor"]
+        background = params["background"]
+        converted  = [ image.convert("RGBA") for image in images ]
 
-            for image in converted:
-                offset_x, offset_y = self._resolve_anchor_offset(anchor, anchor_x, anchor_y, image.size)
-                canvas.alpha_composite(image, (offset_x, offset_y))
+        max_width  = max(image.width  for image in converted)
+        max_height = max(image.height for image in converted)
+        canvas     = PILImage.new("RGBA", (max_width, max_height), background)
 
-            return canvas
+        anchor_x, anchor_y = self._resolve_anchor_point(anchor, canvas.size)
 
-        return await self._run_in_executor(_merge)
+        for image in converted:
+            offset_x, offset_y = self._resolve_anchor_offset(anchor, anchor_x, anchor_y, image.size)
+            canvas.alpha_composite(image, (offset_x, offset_y))
 
-    async def _overlay(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
-        def _overlay() -> PILImage.Image:
-            canvas  = image.convert("RGBA")
-            overlay = params["overlay"].convert("RGBA")
-
-            if params["width"] is not None or params["height"] is not None:
-                if params["width"] is None:
-                    height = params["height"]
-                    width  = max(1, round(overlay.width * height / overlay.height))
-                elif params["height"] is None:
-                    width  = params["width"]
-                    height = max(1, round(overlay.height * width / overlay.width))
-                else:
-                    width  = params["width"]
-                    height = params["height"]
+        return canvas
 
-                overlay = overlay.resize((width, height), PILImage.Resampling.LANCZOS)
+    def _apply_overlay(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        canvas  = image.convert("RGBA")
+        overlay = params["overlay"].convert("RGBA")
+
+        if params["width"] is not None or params["height"] is not None:
+            if params["width"] is None:
+                height = params["height"]
+                width  = max(1, round(overlay.width * height / overlay.height))
+            elif params["height"] is None:
+                width  = params["width"]
+                height = max(1, round(overlay.height * width / overlay.width))
+            else:
+                width  = params["width"]
+                height = params["height"]
 
-            if params["opacity"] < 1.0:
-                alpha = overlay.split()[3].point(lambda a: int(a * params["opacity"]))
-                overlay.putalpha(alpha)
+            overlay = overlay.resize((width, height), PILImage.Resampling.LANCZOS)
 
-            offset_x, offset_y = self._resolve_anchor_offset(params["anchor"], params["x"], params["y"], overlay.size)
-            canvas.alpha_composite(overlay, (offset_x, offset_y))
+        if params["opacity"] < 1.0:
+            alpha = overlay.split()[3].point(lambda a: int(a * params["opacity"]))
+            overlay.putalpha(alpha)
 
-            if image.mode != "RGBA":
-                return canvas.convert(image.mode)
+        offset_x, offset_y = self._resolve_anchor_offset(params["anchor"], params["x"], params["y"], overlay.size)
+        canvas.alpha_composite(overlay, (offset_x, offset_y))
 
-            return canvas
+        if image.mode != "RGBA":
+            return canvas.convert(image.mode)
 
-        return await self._run_in_executor(_overlay)
+        return canvas
 
-    async def _mosaic(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
-        def _mosaic() -> PILImage.Image:
-            mode    = params["mode"]
-            regions = params["regions"]
+    def _apply_mosaic(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        mode    = params["mode"]
+        regions = params["regions"]
 
-            if regions is None:
-                regions = [ ImageRegion(x=0, y=0, width=image.width, height=image.height) ]
+        if regions is None:
+            regions = [ ImageRegion(x=0, y=0, width=image.width, height=image.height) ]
 
-            canvas = image.copy()
+        canvas = image.copy()
 
-            for region in regions:
-                cx1 = max(0, int(region.x))
-                cy1 = max(0, int(region.y))
-                cx2 = min(image.width,  int(region.x) + int(region.width))
-                cy2 = min(image.height, int(region.y) + int(region.height))
+        for region in regions:
+            cx1 = max(0, int(region.x))
+            cy1 = max(0, int(region.y))
+            cx2 = min(image.width,  int(region.x) + int(region.width))
+            cy2 = min(image.height, int(region.y) + int(region.height))
 
-                if cx2 <= cx1 or cy2 <= cy1:
-                    continue
+            if cx2 <= cx1 or cy2 <= cy1:
+                continue
 
-                target     = canvas.crop((cx1, cy1, cx2, cy2))
-                block_size = None
+            target     = canvas.crop((cx1, cy1, cx2, cy2))
+            block_size = None
 
-                if mode == MosaicMode.PIXELATE:
-                    block_size = params["block_size"]
+            if mode == MosaicMode.PIXELATE:
+                block_size = params["block_size"]
 
-                    if block_size is None:
-                        block_size = round(min(target.size) * params["block_scale"])
-                        block_size = min(params["max_block_size"], max(params["min_block_size"], block_size))
+                if block_size is None:
+                    block_size = round(min(target.size) * params["block_scale"])
+                    block_size = min(params["max_block_size"], max(params["min_block_size"], block_size))
 
-                    mosaic = self._mosaic_pixelate(target, block_size)
-                elif mode == MosaicMode.BLUR:
-                    mosaic = target.filter(ImageFilter.GaussianBlur(radius=params["blur_radius"]))
-                else:
-                    raise ValueError(f"Unsupported mosaic mode: {mode}")
+                mosaic = self._mosaic_pixelate(target, block_size)
+            elif mode == MosaicMode.BLUR:
+                mosaic = target.filter(ImageFilter.GaussianBlur(radius=params["blur_radius"]))
+            else:
+                raise ValueError(f"Unsupported mosaic mode: {mode}")
 
-                corner_radius = params["corner_radius"]
+            corner_radius = params["corner_radius"]
 
-                if corner_radius is None:
-                    corner_radius = round(min(target.size) * params["corner_scale"])
+            if corner_radius is None:
+                corner_radius = round(min(target.size) * params["corner_scale"])
 
-                if corner_radius > 0:
-                    if mode == MosaicMode.PIXELATE:
-                        mask = self._blocky_rounded_rectangle_mask(mosaic.size, corner_radius, block_size)
-                    else:
-                        mask = self._rounded_rectangle_mask(mosaic.size, corner_radius)
-                    canvas.paste(mosaic, (cx1, cy1), mask)
+            if corner_radius > 0:
+                if mode == MosaicMode.PIXELATE:
+                    mask = self._blocky_rounded_rectangle_mask(mosaic.size, corner_radius, block_size)
                 else:
-                    canvas.paste(mosaic, (cx1, cy1))
+                    mask = self._rounded_rectangle_mask(mosaic.size, corner_radius)
+                canvas.paste(mosaic, (cx1, cy1), mask)
+            else:
+                canvas.paste(mosaic, (cx1, cy1))
+
+        return canvas
+
+    def _apply_pipeline(self, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        operations  = params["operations"]
+        source_size = image.size
+        image       = self._draft_for_pipeline(image, operations)
+        index       = 0
+
+        while index < len(operations):
+            method, operation_params = operations[index]
+            next_method, next_params = operations[index + 1] if index + 1 < len(operations) else (None, None)
+
+            if method == ImageProcessorActionMethod.RESIZE and next_method == ImageProcessorActionMethod.CROP:
+                cropped = self._apply_resize_crop(image, operation_params, next_params, source_size)
+
+                if cropped is not None:
+                    image, source_size, index = cropped, cropped.size, index + 2
+                    continue
+
+            if method == ImageProcessorActionMethod.RESIZE:
+                image = self._apply_resize(image, operation_params, source_size, self.PIPELINE_REDUCING_GAP)
+            else:
+                image = self._apply_operation(method, image, operation_params)
+
+            source_size, index = image.size, index + 1
+
+        return image
+
+    def _apply_operation(self, method: ImageProcessorActionMethod, image: PILImage.Image, params: Dict[str, Any]) -> PILImage.Image:
+        if method == ImageProcessorActionMethod.CROP:
+            return self._apply_crop(image, params)
+
+        if method == ImageProcessorActionMethod.ROTATE:
+            return self._apply_rotate(image, params)
+
+        if method == ImageProcessorActionMethod.FLIP:
+            return self._apply_flip(image, params)
+
+        if method == ImageProcessorActionMethod.GRAYSCALE:
+            return self._apply_grayscale(image, params)
+
+        if method == ImageProcessorActionMethod.BLUR:
+            return self._apply_blur(image, params)
+
+        if method == ImageProcessorActionMethod.SHARPEN:
+            return self._apply_sharpen(image, params)
+
+        if method == ImageProcessorActionMethod.ADJUST_BRIGHTNESS:
+            return self._apply_adjust_brightness(image, params)
+
+        if method == ImageProcessorActionMethod.ADJUST_CONTRAST:
+            return self._apply_adjust_contrast(image, params)
+
+        if method == ImageProcessorActionMethod.ADJUST_SATURATION:
+            return self._apply_adjust_saturation(image, params)
+
+        if method == ImageProcessorActionMethod.OVERLAY:
+            return self._apply_overlay(image, params)
+
+        if method == ImageProcessorActionMethod.MOSAIC:
+            return self._apply_mosaic(image, params)
+
+        raise ValueError(f"Unsupported pipeline operation: {method}")
+
+    def _apply_resize_crop(self, image: PILImage.Image, resize_params: Dict[str, Any], crop_params: Dict[str, Any], source_size: Tuple[int, int]) -> Optional[PILImage.Image]:
+        """Resamples only the source area that the crop keeps, instead of resizing the whole image first.
+
+        Returns None when the crop reaches outside the resized image, in which case
+        the two operations are applied one after the other.
+        """
+        (new_width, new_height), (left, top, right, bottom) = self._get_resize_geometry(resize_params, source_size)
+        x, y, width, height = crop_params["x"], crop_params["y"], crop_params["width"], crop_params["height"]
+
+        if x < 0 or y < 0 or width <= 0 or height <= 0 or left + x + width > right or top + y + height > bottom:
+            return None
+
+        scale_x = image.width  / new_width
+        scale_y = image.height / new_height
+        box = ((left + x) * scale_x, (top + y) * scale_y, (left + x + width) * scale_x, (top + y + height) * scale_y)
+
+        return image.resize((width, height), PILImage.Resampling.LANCZOS, box=box, reducing_gap=self.PIPELINE_REDUCING_GAP)
+
+    def _draft_for_pipeline(self, image: PILImage.Image, operations: List[Tuple[ImageProcessorActionMethod, Dict[str, Any]]]) -> PILImage.Image:
+        """Lets the JPEG decoder downscale by a power of two when the pipeline starts with a resize.
+
+        Only applies to images that have not been decoded yet. Like `Image.thumbnail()`,
+        the decoded size stays at least `PIPELINE_REDUCING_GAP` times the size of the
+        first resize so the final resampling keeps its quality. Drafting changes the
+        image in place, so it is applied to a copy reopened from the same source and
+        the caller's image is left as it was.
+        """
+        method, params = operations[0]
+
+        if method != ImageProcessorActionMethod.RESIZE or image.format != "JPEG" or not image.tile:
+            return image
+
+        draft = self._reopen_image(image)
+
+        if draft is None:
+            return image
+
+        (new_width, new_height), _ = self._get_resize_geometry(params, image.size)
+        draft.draft(draft.mode, (int(new_width * self.PIPELINE_REDUCING_GAP), int(new_height * self.PIPELINE_REDUCING_GAP)))
+
+        return draft
+
+    def _reopen_image(self, image: PILImage.Image) -> Optional[PILImage.Image]:
+        if isinstance(image.fp, io.BytesIO):
+            return PILImage.open(io.BytesIO(image.fp.getvalue()))
+
+        if getattr(image, "filename", None):
+            return PILImage.open(image.filename)
+
+        return None
+
+    def _get_resize_geometry(self, params: Dict[str, Any], size: Tuple[int, int]) -> Tuple[Tuple[int, int], Tuple[int, int, int, int]]:
+        scale_mode = params["scale_mode"]
+        original_width, original_height = size
+        target_width  = params["width"]  or original_width
+        target_height = params["height"] or original_height
+
+        if scale_mode == ImageScaleMode.FIT:
+            new_width, new_height = self._get_size_aspect_fit(target_width, target_height, original_width, original_height)
+            return (new_width, new_height), (0, 0, new_width, new_height)
 
-            return canvas
+        if scale_mode == ImageScaleMode.FILL:
+            new_width, new_height = self._get_size_aspect_fill(target_width, target_height, original_width, original_height)
+            return (new_width, new_height), self._get_center_crop_box(new_width, new_height, target_width, target_height)
 
-        return await self._run_in_executor(_mosaic)
+        return (target_width, target_height), (0, 0, target_width, target_height)
 
     def _concat_horizontal(self, images: List[PILImage.Image], spacing: int, background: Tuple[int, int, int, int]) -> PILImage.Image:
         total_width = sum(image.width for image in images) + spacing * (len(images) - 1)
@@ -16,6 +16,12 @@ if TYPE_CHECKING:
     import torch
 
 class ModelTaskService(AsyncService):
+    # Drivers whose loads are plain blocking library calls opt in to preloading
+    # on a worker thread, so models of other components can load at the same time.
+    # The load then runs on a temporary event loop, so drivers that create objects
+    # bound to the running loop (such as vLLM's AsyncLLMEngine) must leave it off.
+    threaded_model_loading: bool = False
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(daemon)
 
@@ -40,7 +46,10 @@ class ModelTaskService(AsyncService):
 
     async def _start(self) -> None:
         if self.config.preload:
-            await self._load_model()
+            if self.threaded_model_loading:
+                await self.run_in_thread(self._load_model)
+            else:
+                await self._load_model()
             self._model_loaded = True
         else:
             logging.info(f"Component '{self.id}': model will be loaded on demand")
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
     import torch
 
 class HuggingfaceModelTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
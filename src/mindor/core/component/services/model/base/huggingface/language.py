@@ -4,7 +4,9 @@ from typing import TYPE_CHECKING
 from typing import Type, Optional, Dict, List, Any
 from mindor.dsl.schema.component import ModelComponentConfig, HuggingfaceModelConfig
 from mindor.core.logger import logging
+from ...utils.tokenizer import SharedTokenizer, tokenizer_registry
 from .base import HuggingfaceModelTaskService
+import threading
 
 if TYPE_CHECKING:
     from transformers import PreTrainedModel, PreTrainedTokenizer
@@ -16,8 +18,11 @@ class HuggingfaceLanguageModelTaskService(HuggingfaceModelTaskService):
 
         self.model: Optional[PreTrainedModel] = None
         self.tokenizer: Optional[PreTrainedTokenizer] = None
+        self.tokenizer_lock: Optional[threading.Lock] = None
         self.device: Optional[torch.device] = None
 
+        self._shared_tokenizer: Optional[SharedTokenizer] = None
+
     def get_setup_requirements(self) -> Optional[List[str]]:
         return [
             "transformers>=4.21.0",
@@ -30,16 +35,31 @@ class HuggingfaceLanguageModelTaskService(HuggingfaceModelTaskService):
     async def _load_model(self) -> None:
         self.model, model_path = await self._load_pretrained_model()
         self.tokenizer = await self._load_pretrained_tokenizer(model_path)
+        self.tokenizer_lock = self._shared_tokenizer.lock
         self.device = self._get_model_device(self.model)
 
     async def _unload_model(self) -> None:
+        if self._shared_tokenizer is not None:
+            tokenizer_registry.release(self._shared_tokenizer)
+            self._shared_tokenizer = None
+
         self.model = None
         self.tokenizer = None
+        self.tokenizer_lock = None
         self.device = None
 
     async def _load_pretrained_tokenizer(self, model_path: str) -> Optional[PreTrainedTokenizer]:
         tokenizer_cls = self._get_tokenizer_class()
-        tokenizer = tokenizer_cls.from_pretrained(model_path, **self._get_tokenizer_params())
+        params = self._get_tokenizer_params()
+
+        # Components using the same model, including model tokenizers, load it once and share that
+        # instance; calls that encode or decode with it hold `tokenizer_lock`.
+        self._shared_tokenizer = tokenizer_registry.acquire(tokenizer_cls, model_path, params, lambda: self._create_pretrained_tokenizer(tokenizer_cls, model_path, params))
+
+        return self._shared_tokenizer.tokenizer
+
+    def _create_pretrained_tokenizer(self, tokenizer_cls: Type[PreTrainedTokenizer], model_path: str, params: Dict[str, Any]) -> PreTrainedTokenizer:
+        tokenizer = tokenizer_cls.from_pretrained(model_path, **params)
 
         if tokenizer.pad_token is None:
             logging.info("Tokenizer does not have a pad_token defined. Configuring pad_token automatically.")
@@ -10,6 +10,7 @@ from ...base import ComponentActionContext
 from ...base.huggingface.language import HuggingfaceLanguageModelTaskService
 from ..text_generation.huggingface import HuggingfaceTextGenerationTaskAction
 from .common import ToolBuilder
+from threading import Lock
 
 if TYPE_CHECKING:
     from transformers import PreTrainedModel, PreTrainedTokenizer
@@ -30,10 +31,11 @@ class HuggingfaceChatCompletionTaskAction(HuggingfaceTextGenerationTaskAction):
         config: ChatCompletionModelActionConfig,
         model: PreTrainedModel,
         tokenizer: PreTrainedTokenizer,
+        tokenizer_lock: Lock,
         device: torch.device,
         tools: Optional[List[ModelTool]] = None,
     ):
-        super().__init__(config, model, tokenizer, device)
+        super().__init__(config, model, tokenizer, tokenizer_lock, device)
 
         self.tools: Optional[List[ModelTool]] = tools
 
@@ -59,7 +61,7 @@ class HuggingfaceChatCompletionTaskService(HuggingfaceLanguageModelTaskService):
         action: ModelActionConfig,
         context: ComponentActionContext
     ) -> Any:
-        return await HuggingfaceChatCompletionTaskAction(action, self.model, self.tokenizer, self.device, self.config.tools).run(context)
+        return await HuggingfaceChatCompletionTaskAction(action, self.model, self.tokenizer, self.tokenizer_lock, self.device, self.config.tools).run(context)
 
     def _get_model_class(self) -> Type[PreTrainedModel]:
         from transformers import AutoModelForCausalLM
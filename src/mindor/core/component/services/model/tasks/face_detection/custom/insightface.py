@@ -123,6 +123,8 @@ class InsightfaceFaceDetectionTaskAction(FaceDetectionTaskAction):
         return []
 
 class InsightfaceFaceDetectionTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
@@ -100,6 +100,8 @@ class BlazeFaceFaceDetectionTaskAction(FaceDetectionTaskAction):
         return landmarks
 
 class BlazeFaceFaceDetectionTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
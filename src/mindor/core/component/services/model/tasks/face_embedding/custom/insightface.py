@@ -140,6 +140,8 @@ class InsightfaceFaceEmbeddingTaskAction(FaceEmbeddingTaskAction):
         return "male" if gender == 1 else "female"
 
 class InsightfaceFaceEmbeddingTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
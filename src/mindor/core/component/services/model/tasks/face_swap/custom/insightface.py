@@ -108,6 +108,8 @@ class InsightfaceFaceSwapTaskAction(FaceSwapTaskAction):
         return await self._run_in_executor(_swap)
 
 class InsightfaceFaceSwapTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
@@ -1029,6 +1029,8 @@ class InsightfaceFaceTrackingTaskAction(FaceTrackingTaskAction):
         return "male" if gender == 1 else "female"
 
 class InsightfaceFaceTrackingTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
@@ -131,6 +131,8 @@ class SamImageSegmentationTaskAction(ImageSegmentationTaskAction):
         return PILImage.fromarray((mask.astype("uint8") * 255), mode="L")
 
 class SamImageSegmentationTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
@@ -109,6 +109,8 @@ class WanImageToVideoTaskAction(ImageToVideoTaskAction):
         return VideoStreamResource(buffer.getvalue(), format="mp4", attrs={ "fps": str(fps) })
 
 class WanImageToVideoTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
@@ -147,6 +147,8 @@ class EsrganImageUpscaleTaskAction(ImageUpscaleTaskAction):
         return output
 
 class EsrganImageUpscaleTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
@@ -69,6 +69,8 @@ class RealEsrganImageUpscaleTaskAction(ImageUpscaleTaskAction):
         return await self._run_in_executor(_upscale)
 
 class RealEsrganImageUpscaleTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
@@ -167,6 +167,8 @@ class SwinIRImageUpscaleTaskAction(ImageUpscaleTaskAction):
         return output
 
 class SwinIRImageUpscaleTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
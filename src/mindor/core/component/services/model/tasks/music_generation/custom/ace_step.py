@@ -94,6 +94,8 @@ class AceStepMusicGenerationTaskAction(MusicGenerationTaskAction):
         return await self._run_in_executor(_generate)
 
 class AceStepMusicGenerationTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
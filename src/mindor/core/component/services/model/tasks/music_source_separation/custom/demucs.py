@@ -121,6 +121,8 @@ class DemucsMusicSourceSeparationTaskAction(MusicSourceSeparationTaskAction):
         return stems
 
 class DemucsMusicSourceSeparationTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     config: DemucsMusicSourceSeparationModelComponentConfig
 
     def __init__(self, id: str, config: DemucsMusicSourceSeparationModelComponentConfig, daemon: bool):
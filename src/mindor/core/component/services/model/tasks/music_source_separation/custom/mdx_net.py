@@ -213,6 +213,8 @@ class MdxNetMusicSourceSeparationTaskAction(MusicSourceSeparationTaskAction):
         return np.stack(channels, axis=0)
 
 class MdxNetMusicSourceSeparationTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     config: MdxNetMusicSourceSeparationModelComponentConfig
 
     def __init__(self, id: str, config: MdxNetMusicSourceSeparationModelComponentConfig, daemon: bool):
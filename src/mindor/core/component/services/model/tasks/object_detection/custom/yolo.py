@@ -112,6 +112,8 @@ class YoloObjectDetectionTaskAction(ObjectDetectionTaskAction):
         return { "x": x1, "y": y1, "width": x2 - x1, "height": y2 - y1 }
 
 class YoloObjectDetectionTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
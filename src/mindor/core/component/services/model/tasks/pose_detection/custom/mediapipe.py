@@ -143,6 +143,8 @@ class BlazePosePoseDetectionTaskAction(PoseDetectionTaskAction):
         return PILImage.fromarray((array * 255).astype(np.uint8), mode="L")
 
 class BlazePosePoseDetectionTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
@@ -113,6 +113,8 @@ class YoloPoseDetectionTaskAction(PoseDetectionTaskAction):
         return { "x": int(x1), "y": int(y1), "width": int(x2 - x1), "height": int(y2 - y1) }
 
 class YoloPoseDetectionTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
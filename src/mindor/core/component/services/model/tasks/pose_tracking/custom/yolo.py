@@ -863,6 +863,8 @@ class YoloPoseTrackingTaskAction(PoseTrackingTaskAction):
         return min(x2 - x1, y2 - y1) >= min_size
 
 class YoloPoseTrackingTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
@@ -149,6 +149,8 @@ class PyannoteSpeakerDiarizationTaskAction(SpeakerDiarizationTaskAction):
         return segments
 
 class PyannoteSpeakerDiarizationTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     config: PyannoteSpeakerDiarizationModelComponentConfig
 
     def __init__(self, id: str, config: PyannoteSpeakerDiarizationModelComponentConfig, daemon: bool):
@@ -226,6 +226,8 @@ class CrisperWhisperSpeechToTextTaskAction(SpeechToTextTaskAction):
 
 
 class CrisperWhisperSpeechToTextTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     config: CrisperWhisperSpeechToTextModelComponentConfig
 
     def __init__(self, id: str, config: CrisperWhisperSpeechToTextModelComponentConfig, daemon: bool):
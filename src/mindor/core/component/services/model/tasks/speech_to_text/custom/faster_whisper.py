@@ -152,6 +152,8 @@ class FasterWhisperSpeechToTextTaskAction(SpeechToTextTaskAction):
         }
 
 class FasterWhisperSpeechToTextTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     config: FasterWhisperSpeechToTextModelComponentConfig
 
     def __init__(self, id: str, config: FasterWhisperSpeechToTextModelComponentConfig, daemon: bool):
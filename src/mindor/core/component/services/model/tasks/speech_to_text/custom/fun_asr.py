@@ -177,6 +177,8 @@ class FunAsrSpeechToTextTaskAction(SpeechToTextTaskAction):
         ]
 
 class FunAsrSpeechToTextTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     config: FunAsrSpeechToTextModelComponentConfig
 
     def __init__(self, id: str, config: FunAsrSpeechToTextModelComponentConfig, daemon: bool):
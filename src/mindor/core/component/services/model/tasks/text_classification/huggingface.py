@@ -10,6 +10,7 @@ from ...base import ModelTaskType, ModelDriver, register_model_task_service
 from ...base import ComponentActionContext
 from ...base.huggingface.language import HuggingfaceLanguageModelTaskService
 from .common import TextClassificationTaskAction
+from threading import Lock
 
 if TYPE_CHECKING:
     from transformers import PreTrainedModel, PreTrainedTokenizer
@@ -23,6 +24,7 @@ class HuggingfaceTextClassificationTaskAction(TextClassificationTaskAction):
         config: TextClassificationModelActionConfig,
         model: PreTrainedModel,
         tokenizer: PreTrainedTokenizer,
+        tokenizer_lock: Lock,
         device: torch.device,
         labels: Optional[List[str]]
     ):
@@ -30,6 +32,7 @@ class HuggingfaceTextClassificationTaskAction(TextClassificationTaskAction):
 
         self.model: PreTrainedModel = model
         self.tokenizer: PreTrainedTokenizer = tokenizer
+        self.tokenizer_lock: Lock = tokenizer_lock
         self.device: torch.device = device
 
     async def _resolve_params(self, context: ComponentActionContext) -> Dict[str, Any]:
@@ -56,7 +59,8 @@ class HuggingfaceTextClassificationTaskAction(TextClassificationTaskAction):
         def _predict() -> List[Any]:
             import torch, torch.nn.functional as F
 
-            inputs: Dict[str, Tensor] = self.tokenizer(texts, **params["tokenizer"])
+            with self.tokenizer_lock:
+                inputs: Dict[str, Tensor] = self.tokenizer(texts, **params["tokenizer"])
             inputs = { k: v.to(self.device) for k, v in inputs.items() }
 
             with torch.inference_mode():
@@ -102,4 +106,4 @@ class HuggingfaceTextClassificationTaskService(HuggingfaceLanguageModelTaskServi
         return AutoTokenizer
 
     async def _run(self, action: ModelActionConfig, context: ComponentActionContext) -> Any:
-        return await HuggingfaceTextClassificationTaskAction(action, self.model, self.tokenizer, self.device, self.labels).run(context)
+        return await HuggingfaceTextClassificationTaskAction(action, self.model, self.tokenizer, self.tokenizer_lock, self.device, self.labels).run(context)
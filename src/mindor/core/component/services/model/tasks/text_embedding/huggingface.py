@@ -10,6 +10,7 @@ from ...base import ModelTaskType, ModelDriver, register_model_task_service
 from ...base import ComponentActionContext
 from ...base.huggingface.language import HuggingfaceLanguageModelTaskService
 from .common import TextEmbeddingTaskAction
+from threading import Lock
 
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
@@ -25,6 +26,7 @@ class HuggingfaceTextEmbeddingTaskAction(TextEmbeddingTaskAction):
         architecture: HuggingfaceTextEmbeddingModelArchitecture,
         model: Union[PreTrainedModel, SentenceTransformer],
         tokenizer: Optional[PreTrainedTokenizer],
+        tokenizer_lock: Optional[Lock],
         device: torch.device
     ):
         super().__init__(config)
@@ -32,6 +34,7 @@ class HuggingfaceTextEmbeddingTaskAction(TextEmbeddingTaskAction):
         self.architecture: HuggingfaceTextEmbeddingModelArchitecture = architecture
         self.model: Union[PreTrainedModel, SentenceTransformer] = model
         self.tokenizer: Optional[PreTrainedTokenizer] = tokenizer
+        self.tokenizer_lock: Optional[Lock] = tokenizer_lock
         self.device: torch.device = device
 
     async def _resolve_params(self, context: ComponentActionContext) -> Dict[str, Any]:
@@ -60,7 +63,8 @@ class HuggingfaceTextEmbeddingTaskAction(TextEmbeddingTaskAction):
 
             import torch, torch.nn.functional as F
 
-            inputs: Dict[str, Tensor] = self.tokenizer(texts, **params["tokenizer"])
+            with self.tokenizer_lock:
+                inputs: Dict[str, Tensor] = self.tokenizer(texts, **params["tokenizer"])
             inputs = { k: v.to(self.device) for k, v in inputs.items() }
 
             with torch.inference_mode():
@@ -141,4 +145,4 @@ class HuggingfaceTextEmbeddingTaskService(HuggingfaceLanguageModelTaskService):
         return AutoTokenizer
 
     async def _run(self, action: ModelActionConfig, context: ComponentActionContext) -> Any:
-        return await HuggingfaceTextEmbeddingTaskAction(action, self.config.architecture, self.model, self.tokenizer, self.device).run(context)
+        return await HuggingfaceTextEmbeddingTaskAction(action, self.config.architecture, self.model, self.tokenizer, self.tokenizer_lock, self.device).run(context)
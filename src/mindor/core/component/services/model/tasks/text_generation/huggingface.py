@@ -13,7 +13,7 @@ from ...base.huggingface.language import HuggingfaceLanguageModelTaskService
 from ...base.huggingface.streamer import BatchTextIteratorStreamer
 from ...base.huggingface.cancellation import create_cancellation_criteria
 from .common import TextGenerationTaskAction
-from threading import Thread
+from threading import Thread, Lock
 import asyncio
 
 if TYPE_CHECKING:
@@ -27,12 +27,14 @@ class HuggingfaceTextGenerationTaskAction(TextGenerationTaskAction):
         config: TextGenerationModelActionConfig,
         model: PreTrainedModel,
         tokenizer: PreTrainedTokenizer,
+        tokenizer_lock: Lock,
         device: torch.device,
     ):
         super().__init__(config)
 
         self.model: Union[PreTrainedModel, GenerationMixin] = model
         self.tokenizer: PreTrainedTokenizer = tokenizer
+        self.tokenizer_lock: Lock = tokenizer_lock
         self.device: torch.device = device
 
     async def _resolve_params(self, context: ComponentActionContext) -> Dict[str, Any]:
@@ -97,7 +99,8 @@ class HuggingfaceTextGenerationTaskAction(TextGenerationTaskAction):
             from transformers import GenerationConfig
             import torch
 
-            inputs: Dict[str, Tensor] = self.tokenizer(texts, **params["tokenizer"])
+            with self.tokenizer_lock:
+                inputs: Dict[str, Tensor] = self.tokenizer(texts, **params["tokenizer"])
             inputs = { k: v.to(self.device) for k, v in inputs.items() }
 
             stopping_criteria = self._build_stopping_criteria(params["stop_sequences"], cancellation_token)
@@ -130,7 +133,8 @@ class HuggingfaceTextGenerationTaskAction(TextGenerationTaskAction):
                     stopping_criteria=stopping_criteria,
                 )
 
-            return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+            with self.tokenizer_lock:
+                return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
 
         results = await self._run_in_executor(_generate)
 
@@ -169,4 +173,4 @@ class HuggingfaceTextGenerationTaskService(HuggingfaceLanguageModelTaskService):
         return AutoTokenizer
 
     async def _run(self, action: ModelActionConfig, context: ComponentActionContext) -> Any:
-        return await HuggingfaceTextGenerationTaskAction(action, self.model, self.tokenizer, self.device).run(context)
+        return await HuggingfaceTextGenerationTaskAction(action, self.model, self.tokenizer, self.tokenizer_lock, self.device).run(context)
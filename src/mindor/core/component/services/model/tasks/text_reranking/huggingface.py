@@ -9,6 +9,7 @@ from ...base import ModelTaskType, ModelDriver, register_model_task_service
 from ...base import ComponentActionContext
 from ...base.huggingface.language import HuggingfaceLanguageModelTaskService
 from .common import TextRerankingTaskAction
+from threading import Lock
 
 if TYPE_CHECKING:
     from transformers import PreTrainedModel, PreTrainedTokenizer
@@ -22,12 +23,14 @@ class HuggingfaceTextRerankingTaskAction(TextRerankingTaskAction):
         config: TextRerankingModelActionConfig,
         model: PreTrainedModel,
         tokenizer: PreTrainedTokenizer,
+        tokenizer_lock: Lock,
         device: torch.device
     ):
         super().__init__(config)
 
         self.model: PreTrainedModel = model
         self.tokenizer: PreTrainedTokenizer = tokenizer
+        self.tokenizer_lock: Lock = tokenizer_lock
         self.device: torch.device = device
 
     async def _resolve_params(self, context: ComponentActionContext) -> Dict[str, Any]:
@@ -60,7 +63,8 @@ class HuggingfaceTextRerankingTaskAction(TextRerankingTaskAction):
                 offsets.append(len(pairs))
                 pairs.extend((query, text) for text in texts)
 
-            inputs: Dict[str, Tensor] = self.tokenizer(pairs, **params["tokenizer"])
+            with self.tokenizer_lock:
+                inputs: Dict[str, Tensor] = self.tokenizer(pairs, **params["tokenizer"])
             inputs = { k: v.to(self.device) for k, v in inputs.items() }
 
             with torch.inference_mode():
@@ -92,4 +96,4 @@ class HuggingfaceTextRerankingTaskService(HuggingfaceLanguageModelTaskService):
         return AutoTokenizer
 
     async def _run(self, action: ModelActionConfig, context: ComponentActionContext) -> Any:
-        return await HuggingfaceTextRerankingTaskAction(action, self.model, self.tokenizer, self.device).run(context)
+        return await HuggingfaceTextRerankingTaskAction(action, self.model, self.tokenizer, self.tokenizer_lock, self.device).run(context)
@@ -95,6 +95,8 @@ class ChatterboxTextToSpeechCloneTaskAction(ChatterboxTextToSpeechTaskAction):
         return params
 
 class ChatterboxTextToSpeechTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
@@ -111,6 +111,8 @@ class KokoroTextToSpeechGenerateTaskAction(TextToSpeechTaskAction):
         return _KOKORO_DEFAULT_LANG_CODE
 
 class KokoroTextToSpeechTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
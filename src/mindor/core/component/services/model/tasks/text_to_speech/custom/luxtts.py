@@ -94,6 +94,8 @@ class LuxttsTextToSpeechCloneTaskAction(TextToSpeechTaskAction):
         return await self._run_in_executor(_generate)
 
 class LuxttsTextToSpeechTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
@@ -162,6 +162,8 @@ class QwenTextToSpeechDesignTaskAction(QwenTextToSpeechTaskAction):
         )
 
 class QwenTextToSpeechTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
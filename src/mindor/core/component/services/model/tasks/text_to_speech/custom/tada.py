@@ -100,6 +100,8 @@ class TadaTextToSpeechCloneTaskAction(TextToSpeechTaskAction):
         return await self._run_in_executor(_generate)
 
 class TadaTextToSpeechTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
@@ -12,7 +12,7 @@ from ...base import ComponentActionContext
 from ...base.huggingface.language import HuggingfaceLanguageModelTaskService
 from ...base.huggingface.streamer import BatchTextIteratorStreamer
 from .common import TextToTextTaskAction
-from threading import Thread
+from threading import Thread, Lock
 import asyncio
 
 if TYPE_CHECKING:
@@ -26,12 +26,14 @@ class HuggingfaceTextToTextTaskAction(TextToTextTaskAction):
         config: TextToTextModelActionConfig,
         model: PreTrainedModel,
         tokenizer: PreTrainedTokenizer,
+        tokenizer_lock: Lock,
         device: torch.device,
     ):
         super().__init__(config)
 
         self.model: Union[PreTrainedModel, GenerationMixin] = model
         self.tokenizer: PreTrainedTokenizer = tokenizer
+        self.tokenizer_lock: Lock = tokenizer_lock
         self.device: torch.device = device
 
     async def _resolve_params(self, context: ComponentActionContext) -> Dict[str, Any]:
@@ -98,7 +100,8 @@ class HuggingfaceTextToTextTaskAction(TextToTextTaskAction):
 
             stopping_criteria = [ StopStringCriteria(self.tokenizer, params["stop_sequences"]) ] if params["stop_sequences"] else None
 
-            inputs: Dict[str, Tensor] = self.tokenizer(texts, **params["tokenizer"])
+            with self.tokenizer_lock:
+                inputs: Dict[str, Tensor] = self.tokenizer(texts, **params["tokenizer"])
             inputs = { k: v.to(self.device) for k, v in inputs.items() }
 
             if streaming:
@@ -129,7 +132,8 @@ class HuggingfaceTextToTextTaskAction(TextToTextTaskAction):
                     stopping_criteria=stopping_criteria,
                 )
 
-            return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+            with self.tokenizer_lock:
+                return self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
 
         results = await self._run_in_executor(_generate)
 
@@ -149,4 +153,4 @@ class HuggingfaceTextToTextTaskService(HuggingfaceLanguageModelTaskService):
         return AutoTokenizer
 
     async def _run(self, action: ModelActionConfig, context: ComponentActionContext) -> Any:
-        return await HuggingfaceTextToTextTaskAction(action, self.model, self.tokenizer, self.device).run(context)
+        return await HuggingfaceTextToTextTaskAction(action, self.model, self.tokenizer, self.tokenizer_lock, self.device).run(context)
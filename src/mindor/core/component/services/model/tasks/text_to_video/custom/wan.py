@@ -102,6 +102,8 @@ class WanTextToVideoTaskAction(TextToVideoTaskAction):
         return VideoStreamResource(buffer.getvalue(), format="mp4", attrs={ "fps": str(fps) })
 
 class WanTextToVideoTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     def __init__(self, id: str, config: ModelComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
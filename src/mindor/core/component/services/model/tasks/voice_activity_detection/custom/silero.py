@@ -239,6 +239,8 @@ class SileroVoiceActivityDetectionTaskAction(VoiceActivityDetectionTaskAction):
         return float(sum(probs) / len(probs)) if probs else 0.0
 
 class SileroVoiceActivityDetectionTaskService(ModelTaskService):
+    threaded_model_loading: bool = True
+
     config: SileroVoiceActivityDetectionModelComponentConfig
 
     def __init__(self, id: str, config: SileroVoiceActivityDetectionModelComponentConfig, daemon: bool):
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Optional, Dict, List, Tuple
+from mindor.core.utils.caching import LRUCache
+from mindor.core.logger import logging
+import threading
+
+class TokenIdsCache:
+    """Token ids of recently tokenized texts, so repeated strings such as system prompts
+    are tokenized once.
+
+    Only texts up to `max_text_length` characters are cached, which bounds the memory a
+    full cache can hold. Misses are tokenized in one batch without padding, truncation,
+    attention masks or any other extra outputs, holding `lock` for the call.
+    """
+    def __init__(self, tokenizer: Any, max_size: int, max_text_length: int, lock: Optional[threading.Lock] = None):
+        self.tokenizer: Any = tokenizer
+        self.max_text_length: int = max_text_length
+        self.lock: threading.Lock = lock or threading.Lock()
+
+        self._cache: Optional[LRUCache[List[int]]] = LRUCache(max_size) if max_size > 0 else None
+
+    def get_token_ids(self, texts: List[str]) -> List[List[int]]:
+        """Returns the token ids of each text, including special tokens. Callers must not
+        modify the returned lists, since they may be shared with later calls."""
+        results: List[Optional[List[int]]] = [ self._cache.get(text) if self._is_cacheable(text) else None for text in texts ]
+        missing = [ index for index, token_ids in enumerate(results) if token_ids is None ]
+
+        if missing:
+            with self.lock:
+                outputs = self.tokenizer(
+                    [ texts[index] for index in missing ],
+                    padding=False,
+                    truncation=False,
+                    return_attention_mask=False,
+                    return_token_type_ids=False,
+                )
+
+            for index, token_ids in zip(missing, outputs["input_ids"]):
+                token_ids = list(token_ids)
+                if self._is_cacheable(texts[index]):
+                    self._cache.set(texts[index], token_ids)
+                results[index] = token_ids
+
+        return results
+
+    def count_tokens(self, texts: List[str]) -> List[int]:
+        return [ len(token_ids) for token_ids in self.get_token_ids(texts) ]
+
+    def _is_cacheable(self, text: str) -> bool:
+        return self._cache is not None and len(text) <= self.max_text_length
+
+class SharedTokenizer:
+    """One loaded tokenizer and the components using it.
+
+    Fast tokenizers apply the padding and truncation settings of a call to the instance
+    itself, so every component calling `tokenizer` to encode or decode holds `lock` for
+    the call and passes its padding and truncation explicitly.
+    """
+    def __init__(self, key: Tuple[Any, ...]):
+        self.key: Tuple[Any, ...] = key
+        self.tokenizer: Optional[Any] = None
+        self.token_ids: Optional[TokenIdsCache] = None
+        self.references: int = 0
+        self.lock: threading.Lock = threading.Lock()
+
+        self._load_lock: threading.Lock = threading.Lock()
+
+class TokenizerRegistry:
+    """Loaded tokenizers shared by every component of the process that uses the same model.
+
+    Entries are keyed by the tokenizer class, the provisioned model path (which pins the
+    revision for hub models) and the load options. Components acquire a tokenizer when
+    they load and release it when they unload; the last release drops it. Each model is
+    loaded from its files once, and every component calls that same instance.
+    """
+    def __init__(self, token_ids_cache_size: int, max_cached_text_length: int):
+        self.token_ids_cache_size: int = token_ids_cache_size
+        self.max_cached_text_length: int = max_cached_text_length
+
+        self._tokenizers: Dict[Tuple[Any, ...], SharedTokenizer] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def acquire(self, tokenizer_cls: Any, model_path: str, params: Dict[str, Any], load: Callable[[], Any]) -> SharedTokenizer:
+        key = self.get_key(tokenizer_cls, model_path, params)
+
+        with self._lock:
+            shared = self._tokenizers.get(key)
+
+            if shared is None:
+                shared = SharedTokenizer(key)
+                self._tokenizers[key] = shared
+
+            shared.references += 1
+
+        # Loading holds only this entry's lock, so tokenizers of other models load at the same time.
+        try:
+            with shared._load_lock:
+                if shared.tokenizer is None:
+                    tokenizer = load()
+                    shared.token_ids = TokenIdsCache(tokenizer, self.token_ids_cache_size, self.max_cached_text_length, shared.lock)
+                    shared.tokenizer = tokenizer
+                else:
+                    logging.debug("Reusing tokenizer loaded from '%s'", model_path)
+        except BaseException:
+            self.release(shared)
+            raise
+
+        return shared
+
+    def release(self, shared: SharedTokenizer) -> None:
+        with self._lock:
+            shared.references -= 1
+
+            if shared.references <= 0 and self._tokenizers.get(shared.key) is shared:
+                del self._tokenizers[shared.key]
+
+    def get_key(self, tokenizer_cls: Any, model_path: str, params: Dict[str, Any]) -> Tuple[Any, ...]:
+        # The access token only authorizes the download, so it doesn't tell tokenizers apart.
+        options = tuple(sorted((name, repr(value)) for name, value in params.items() if name != "token"))
+        return (f"{tokenizer_cls.__module__}.{tokenizer_cls.__qualname__}", model_path, options)
+
+    def __len__(self) -> int:
+        return len(self._tokenizers)
+
+tokenizer_registry: TokenizerRegistry = TokenizerRegistry(token_ids_cache_size=4096, max_cached_text_length=8192)
@@ -4,22 +4,39 @@ from typing import TYPE_CHECKING
 from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
 from mindor.dsl.schema.component import ModelTokenizerComponentConfig, HuggingfaceModelConfig
 from mindor.core.logger import logging
+from ...model.utils.tokenizer import SharedTokenizer, tokenizer_registry
 from .common import ModelTokenizerTaskService
 
 class HuggingfaceModelTokenizerTaskService(ModelTokenizerTaskService):
     def __init__(self, id: str, config: ModelTokenizerComponentConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
+        self.shared_tokenizer: Optional[SharedTokenizer] = None
+
     def get_setup_requirements(self) -> Optional[List[str]]:
         return [ "transformers" ]
 
     async def _load_tokenizer(self) -> None:
-        self.tokenizer = await self._load_pretrained_tokenizer()
+        self.shared_tokenizer = await self._load_pretrained_tokenizer()
+        self.tokenizer = self.shared_tokenizer.tokenizer
+
+    async def _stop(self) -> None:
+        await super()._stop()
+
+        if self.shared_tokenizer is not None:
+            tokenizer_registry.release(self.shared_tokenizer)
+            self.shared_tokenizer = None
 
-    async def _load_pretrained_tokenizer(self) -> Any:
+    async def _load_pretrained_tokenizer(self) -> SharedTokenizer:
         tokenizer_cls = self._get_tokenizer_class()
         model_path = await self._provision_model(self.config.model)
-        tokenizer = tokenizer_cls.from_pretrained(model_path, **self._get_tokenizer_params())
+        params = self._get_tokenizer_params()
+
+        # Model components loading the same tokenizer share the loaded instance, its lock and its token id cache.
+        return tokenizer_registry.acquire(tokenizer_cls, model_path, params, lambda: self._create_pretrained_tokenizer(tokenizer_cls, model_path, params))
+
+    def _create_pretrained_tokenizer(self, tokenizer_cls: Type, model_path: str, params: Dict[str, Any]) -> Any:
+        tokenizer = tokenizer_cls.from_pretrained(model_path, **params)
 
         if tokenizer.pad_token is None:
             logging.info("Tokenizer does not have a pad_token defined. Configuring pad_token automatically.")
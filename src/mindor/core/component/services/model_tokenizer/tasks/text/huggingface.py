@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-from typing import Dict, List, Any
+from typing import Optional, Dict, List, Any
 from collections.abc import AsyncIterator
 from mindor.dsl.schema.action import ModelTokenizerActionConfig
 from mindor.dsl.schema.action.impl.model_tokenizer.tasks.common import ModelTokenizerMethod
@@ -9,13 +9,15 @@ from mindor.core.foundation.streaming.iterators import StreamIterator
 from mindor.core.foundation.variable.array import ArrayValue
 from mindor.core.utils.iterators import BatchSourceIterator
 from .....action.base import ComponentAction
+from ....model.utils.tokenizer import TokenIdsCache
 from ...base import ModelTokenizerTaskType, ModelTokenizerDriver, register_model_tokenizer_task_service
 from ...base import HuggingfaceModelTokenizerTaskService, ComponentActionContext
 
 class HuggingfaceTextModelTokenizerTaskAction(ComponentAction):
-    def __init__(self, config: ModelTokenizerActionConfig, tokenizer: Any):
+    def __init__(self, config: ModelTokenizerActionConfig, tokenizer: Any, token_ids: Optional[TokenIdsCache] = None):
         self.config: ModelTokenizerActionConfig = config
         self.tokenizer = tokenizer
+        self.token_ids: TokenIdsCache = token_ids or TokenIdsCache(tokenizer, max_size=0, max_text_length=0)
 
     async def run(self, context: ComponentActionContext) -> Any:
         value      = await self._prepare_input(self.config.method, context)
@@ -108,8 +110,15 @@ class HuggingfaceTextModelTokenizerTaskAction(ComponentAction):
         raise ValueError(f"Unsupported tokenizer method: {method}")
 
     async def _encode(self, texts: List[str], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if not params["encode_params"] and not params["additional_returns"]:
+            return await self._encode_plain(texts)
+
+        # Padding and truncation are always given, since the tokenizer may be shared with other components.
+        encode_params = { "padding": False, "truncation": False, **params["encode_params"] }
+
         def _encode() -> List[Dict[str, Any]]:
-            outputs = self.tokenizer(texts, **params["encode_params"])
+            with self.token_ids.lock:
+                outputs = self.tokenizer(texts, **encode_params)
 
             results: List[Dict[str, Any]] = []
             for index in range(len(texts)):
@@ -125,14 +134,32 @@ class HuggingfaceTextModelTokenizerTaskAction(ComponentAction):
 
         return await self._run_in_executor(_encode)
 
+    async def _encode_plain(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Encodes without padding, truncation or extra returns, so results can come from the
+        token id cache; the attention mask is then all ones."""
+        with_attention_mask = "attention_mask" in getattr(self.tokenizer, "model_input_names", [ "attention_mask" ])
+
+        def _encode() -> List[Dict[str, Any]]:
+            results: List[Dict[str, Any]] = []
+            for token_ids in self.token_ids.get_token_ids(texts):
+                result: Dict[str, Any] = { "input_ids": list(token_ids) }
+                if with_attention_mask:
+                    result["attention_mask"] = [ 1 ] * len(token_ids)
+                results.append(result)
+
+            return results
+
+        return await self._run_in_executor(_encode)
+
     async def _decode(self, token_ids: List[ArrayValue], params: Dict[str, Any]) -> List[Dict[str, str]]:
         collected = [ await ids.collect() for ids in token_ids ]
 
         def _decode() -> List[Dict[str, str]]:
-            outputs = self.tokenizer.batch_decode(
-                collected,
-                skip_special_tokens=params["skip_special_tokens"],
-            )
+            with self.token_ids.lock:
+                outputs = self.tokenizer.batch_decode(
+                    collected,
+                    skip_special_tokens=params["skip_special_tokens"],
+                )
 
             return [ { "text": text } for text in outputs ]
 
@@ -140,13 +167,11 @@ class HuggingfaceTextModelTokenizerTaskAction(ComponentAction):
 
     async def _count(self, texts: List[str], params: Dict[str, Any]) -> List[Dict[str, int]]:
         def _count() -> List[Dict[str, int]]:
-            outputs = self.tokenizer(texts)
-
-            return [ { "count": len(outputs["input_ids"][index]) } for index in range(len(texts)) ]
+            return [ { "count": count } for count in self.token_ids.count_tokens(texts) ]
 
         return await self._run_in_executor(_count)
 
 @register_model_tokenizer_task_service(ModelTokenizerTaskType.TEXT, ModelTokenizerDriver.HUGGINGFACE)
 class HuggingfaceTextModelTokenizerTaskService(HuggingfaceModelTokenizerTaskService):
     async def run(self, action: ModelTokenizerActionConfig, context: ComponentActionContext) -> Any:
-        return await HuggingfaceTextModelTokenizerTaskAction(action, self.tokenizer).run(context)
+        return await HuggingfaceTextModelTokenizerTaskAction(action, self.tokenizer, self.shared_tokenizer.token_ids).run(context)
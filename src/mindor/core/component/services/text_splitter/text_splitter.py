@@ -1,5 +1,6 @@
-from typing import Optional, Dict, List, Iterator, Tuple, Any
+from typing import Optional, Dict, List, Deque, Iterator, Tuple, Any
 from collections.abc import AsyncIterator
+from collections import deque
 from mindor.dsl.schema.component import TextSplitterComponentConfig
 from mindor.dsl.schema.action import ActionConfig, TextSplitterActionConfig
 from mindor.core.foundation.streaming.iterators import StreamChunkIterator, StreamIterator
@@ -25,7 +26,7 @@ class SegmentMergeBuffer:
         self.chunk_overlap: int = chunk_overlap
         self.separator: str = separator
 
-        self._segments: List[str] = []
+        self._segments: Deque[str] = deque()
         self._length: int = 0
 
     def add(self, segment: str) -> Iterator[str]:
@@ -47,7 +48,7 @@ class SegmentMergeBuffer:
     def flush(self) -> Optional[str]:
         """Build the final chunk from whatever is buffered and clear state."""
         chunk = self._build_chunk()
-        self._segments = []
+        self._segments.clear()
         self._length = 0
         return chunk
 
@@ -69,7 +70,7 @@ class SegmentMergeBuffer:
         oldest_len = len(self._segments[0])
         overhead = len(self.separator) if len(self._segments) > 1 else 0
         self._length -= oldest_len + overhead
-        self._segments.pop(0)
+        self._segments.popleft()
 
     def _append(self, segment: str) -> None:
         overhead = len(self.separator) if len(self._segments) > 1 else 0
@@ -83,36 +84,56 @@ class StreamingTextSplitter:
     """Splits text incrementally as input is fed.
 
     Algorithm (streaming/batch equivalent):
-    - Hold input in a pending buffer.
+    - Hold input in a list of pending parts until a separator is decided.
     - Decide a single separator (from `separators`, in priority order) the first time
       a candidate appears in the pending buffer. Once decided, the same separator is
       used for the rest of the input.
-    - To keep streaming results identical to batch, decision is held back while the
-      buffer end might still grow into a higher-priority separator (`max_separator_len`
-      lookahead). On `flush()` the lookahead is lifted.
+    - To keep streaming results identical to batch, decision is held back until the
+      buffer reaches `chunk_size` or input is finalized: a higher-priority separator
+      might still appear in the upcoming input.
     - With a decided separator, segments are produced using the same keep_separator=True
       semantics as `_split_text_with_separator`: the first segment has no leading
       separator, subsequent segments carry the separator at their start.
+    - Only the unfinished segment stays pending, and the scan for the next separator
+      resumes where the previous one stopped, so each character is examined once
+      however finely the input is fed.
     - Oversize segments (>= chunk_size) are recursively split with the lower-priority
-      separators (`fallback_separators`), mirroring `_split_text`.
+      separators (`fallback_separators`), mirroring `_split_text`. A segment is streamed
+      into that split as soon as it is known to be oversize instead of being held
+      until its end, which keeps the pending text below `chunk_size`. That split must
+      choose the separator the whole segment would get, so it decides on its whole
+      input: it waits for the end unless its top-priority separator has appeared.
     - Merge & overlap behavior is delegated to ``SegmentMergeBuffer``.
     """
-    def __init__(self, separators: List[str], chunk_size: int, chunk_overlap: int):
+    def __init__(self, separators: List[str], chunk_size: int, chunk_overlap: int, decide_on_whole_input: bool = False):
         self.separators: List[str] = separators
         self.chunk_size: int = chunk_size
         self.chunk_overlap: int = chunk_overlap
+        self.decide_on_whole_input: bool = decide_on_whole_input
         self.max_separator_len: int = max((len(s) for s in separators if s), default=0)
 
-        self._pending_text: str = ""
+        self._pending_parts: List[str] = []         # Input held until a separator is decided.
+        self._pending_length: int = 0
+        self._decision_scan_count: int = 0          # Pending parts already searched for the top-priority separator.
+        self._decision_scan_tail: str = ""          # End of the searched parts, for a separator split across parts.
+        self._pending_text: str = ""                # Unfinished segment once a separator is decided.
+        self._scan_position: int = 0                # Where the next separator search in `_pending_text` starts.
         self._separator: Optional[str] = None       # Decided on first match.
         self._fallback_separators: List[str] = []   # Lower-priority separators (for oversize segments).
-        self._is_first_segment: bool = True         # Tracks keep_separator semantics for the FIRST segment.
+
+        self._oversize_length: Optional[int] = None                 # Characters of an oversize segment already passed on.
+        self._oversize_splitter: Optional[StreamingTextSplitter] = None
+        self._oversize_parts: List[str] = []                        # Oversize segment kept whole when no fallback is left.
 
         self._merge_buffer: SegmentMergeBuffer = SegmentMergeBuffer(chunk_size, chunk_overlap)
 
     def feed(self, text: str) -> Iterator[str]:
         if text:
-            self._pending_text += text
+            if self._separator is None:
+                self._pending_parts.append(text)
+                self._pending_length += len(text)
+            else:
+                self._pending_text += text
             yield from self._extract_segments(final=False)
 
     def flush(self) -> Iterator[str]:
@@ -125,26 +146,31 @@ class StreamingTextSplitter:
         if self._separator is None:
             if not self._try_decide_separator(final=final):
                 return
-            # After decision, the part of pending BEFORE the first separator occurrence is
-            # the first segment (no leading separator).
-            first_pos = self._pending_text.find(self._separator) if self._separator else -1
-            if self._separator and first_pos >= 0:
-                first_segment = self._pending_text[:first_pos]
-                self._pending_text = self._pending_text[first_pos:]
-                if first_segment:
-                    yield from self._consume_segment(first_segment)
-                self._is_first_segment = False
-            elif not self._separator:
-                # Empty separator: character-level split. No "first segment" notion —
-                # every character is its own segment, all with empty separator (no leading sep).
-                self._is_first_segment = False
 
-        while True:
-            segment, remaining = self._extract_segment(self._pending_text, final=final)
-            if segment is None:
-                break
-            self._pending_text = remaining
-            yield from self._consume_segment(segment)
+            text = "".join(self._pending_parts)
+            self._pending_parts = []
+            self._pending_length = 0
+
+            if self._separator:
+                # The part of pending BEFORE the first separator occurrence is the
+                # first segment (no leading separator).
+                first_pos = text.find(self._separator)
+                if first_pos > 0:
+                    yield from self._consume_segment(text[:first_pos])
+                self._pending_text = text[first_pos:]
+                self._scan_position = len(self._separator)
+            else:
+                self._pending_text = text
+
+        if not self._separator:
+            # Empty separator: character-level split. Every character is its own
+            # segment, all with empty separator (no leading sep).
+            text, self._pending_text = self._pending_text, ""
+            for character in text:
+                yield from self._consume_segment(character)
+            return
+
+        yield from self._extract_separated_segments(final)
 
     def _try_decide_separator(self, final: bool) -> bool:
         """Try to pick a separator from `separators` in priority order.
@@ -155,9 +181,16 @@ class StreamingTextSplitter:
         the highest-priority separator that actually appears in what we have (falling
         through to the empty-string character fallback if none do).
         """
-        if not final and len(self._pending_text) < self.chunk_size:
+        if self.decide_on_whole_input:
+            if not final and not self._has_top_priority_separator():
+                return False
+        elif not final and self._pending_length < self.chunk_size:
             return False
 
+        # Join once so an undecided buffer isn't re-joined on every later feed.
+        text = "".join(self._pending_parts)
+        self._pending_parts = [ text ] if text else []
+
         for index, separator in enumerate(self.separators):
             if not separator:
                 # Empty separator — character split fallback.
@@ -165,7 +198,7 @@ class StreamingTextSplitter:
                 self._fallback_separators = []
                 return True
 
-            if self._pending_text.find(separator) < 0:
+            if text.find(separator) < 0:
                 continue
 
             self._separator = separator
@@ -174,68 +207,116 @@ class StreamingTextSplitter:
 
         return False
 
-    def _extract_segment(self, text: str, final: bool) -> Tuple[Optional[str], str]:
-        """Extract one segment from the start of `text` using the decided separator.
+    def _has_top_priority_separator(self) -> bool:
+        """Whether the first separator has appeared, after which no later input can change
+        the decision. Only the parts fed since the previous search are examined."""
+        separator = self.separators[0] if self.separators else ""
+        if not separator:
+            return True
+
+        for part in self._pending_parts[self._decision_scan_count:]:
+            text = self._decision_scan_tail + part
+            if separator in text:
+                return True
+            self._decision_scan_tail = text[-(len(separator) - 1):] if len(separator) > 1 else ""
+
+        self._decision_scan_count = len(self._pending_parts)
+        return False
+
+    def _extract_separated_segments(self, final: bool) -> Iterator[str]:
+        """Cut every complete segment out of the pending text using the decided separator.
 
-        keep_separator=True: every segment after the first STARTS with the separator.
-        So we look for the NEXT separator occurrence after position `len(separator)`
-        (skipping the leading separator) and cut there. The segment is
-        `text[:next_pos]` (which starts with the leading separator), the rest is
-        `text[next_pos:]` (which also starts with that next separator, ready for
-        the following extraction).
+        keep_separator=True: every segment after the first STARTS with the separator,
+        so the search for the next occurrence skips the leading one. Segments are cut
+        by moving a cursor through the pending text, and the unfinished remainder is
+        sliced off once, so a single large feed stays linear.
         """
         separator = self._separator
-        if separator is None:
-            return None, text
+        text = self._pending_text
+        start = 0
+        position = self._scan_position
 
-        if not separator:
-            # Empty separator: yield one character at a time.
-            if not text:
-                return None, text
-            if not final and len(text) <= self.max_separator_len:
-                # Hold back the last character so a higher-priority separator (none here,
-                # since we only decide empty when final) could still complete — but in
-                # practice empty is only decided on final, so this branch is unreachable.
-                return None, text
-            return text[:1], text[1:]
-
-        # The text here should start with `separator` (or be empty / shorter than
-        # separator, which means nothing to cut yet).
-        if len(text) < len(separator):
-            return None, text
-
-        next_pos = text.find(separator, len(separator))
-        if next_pos < 0:
-            # No further separator visible. Hold the text until more arrives or final.
-            if not final:
-                return None, text
-            # Final: the whole remaining text is the last segment.
-            return text, ""
-
-        return text[:next_pos], text[next_pos:]
+        while True:
+            next_pos = text.find(separator, position)
+            if next_pos < 0:
+                break
+            yield from self._end_segment(text[start:next_pos])
+            start = next_pos
+            position = next_pos + len(separator)
+
+        remaining = text[start:]
+
+        if final:
+            # The whole remaining text is the last segment.
+            self._pending_text = ""
+            self._scan_position = 0
+            if remaining or self._oversize_length is not None:
+                yield from self._end_segment(remaining)
+            return
+
+        # A separator not seen yet can only start within the last `len(separator) - 1`
+        # characters, so the next search resumes there.
+        self._scan_position = max(position - start, len(remaining) - len(separator) + 1)
+        self._pending_text = remaining
+
+        # Everything before the scan position belongs to the unfinished segment. Once that
+        # reaches chunk_size the segment is oversize however it ends, so pass it on.
+        segment_length = self._scan_position + (self._oversize_length or 0)
+        if segment_length >= self.chunk_size and self._scan_position > 0:
+            if self._oversize_length is None:
+                yield from self._start_oversize_segment()
+            yield from self._feed_oversize_segment(remaining[:self._scan_position])
+            self._pending_text = remaining[self._scan_position:]
+            self._scan_position = 0
+
+    def _end_segment(self, segment: str) -> Iterator[str]:
+        if self._oversize_length is None:
+            yield from self._consume_segment(segment)
+            return
+
+        yield from self._feed_oversize_segment(segment)
+        yield from self._finish_oversize_segment()
 
     def _consume_segment(self, segment: str) -> Iterator[str]:
         if len(segment) < self.chunk_size:
             yield from self._merge_buffer.add(segment)
             return
 
+        yield from self._start_oversize_segment()
+        yield from self._feed_oversize_segment(segment)
+        yield from self._finish_oversize_segment()
+
+    def _start_oversize_segment(self) -> Iterator[str]:
         # Oversize: flush merge buffer, then recursively split with lower-priority
-        # separators. If none left, emit the segment as-is.
+        # separators. If none left, the segment is emitted as-is when it ends.
         chunk = self._merge_buffer.flush()
         if chunk is not None:
             yield chunk
 
-        if not self._fallback_separators:
-            text = segment.strip()
+        self._oversize_length = 0
+
+        if self._fallback_separators:
+            self._oversize_splitter = StreamingTextSplitter(self._fallback_separators, self.chunk_size, self.chunk_overlap, decide_on_whole_input=True)
+
+    def _feed_oversize_segment(self, text: str) -> Iterator[str]:
+        self._oversize_length += len(text)
+
+        if self._oversize_splitter is not None:
+            yield from self._oversize_splitter.feed(text)
+        else:
+            self._oversize_parts.append(text)
+
+    def _finish_oversize_segment(self) -> Iterator[str]:
+        if self._oversize_splitter is not None:
+            yield from self._oversize_splitter.flush()
+        else:
+            text = "".join(self._oversize_parts).strip()
             if text:
                 yield text
-            return
 
-        sub = StreamingTextSplitter(self._fallback_separators, self.chunk_size, self.chunk_overlap)
-        for chunk in sub.feed(segment):
-            yield chunk
-        for chunk in sub.flush():
-            yield chunk
+        self._oversize_length = None
+        self._oversize_splitter = None
+        self._oversize_parts = []
 
 class TextSplitterAction(ComponentAction):
     def __init__(self, config: TextSplitterActionConfig):
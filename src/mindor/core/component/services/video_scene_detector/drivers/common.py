@@ -7,9 +7,10 @@ from mindor.dsl.schema.action import VideoSceneDetectorActionConfig
 from mindor.core.foundation.streaming.iterators import StreamChunkIterator, StreamIterator
 from mindor.core.foundation.streaming.media import MediaSource
 from mindor.core.foundation.cancellation import CancellationToken
-from mindor.core.utils.iterators import BatchSourceIterator
+from mindor.core.utils.iterators import OrderedConcurrentIterator
 from ....action.base import ComponentAction
 from ..base import ComponentActionContext
+import os
 
 class VideoSceneDetectorAction(ComponentAction):
     def __init__(self, config: VideoSceneDetectorActionConfig):
@@ -25,36 +26,23 @@ class VideoSceneDetectorAction(ComponentAction):
         is_single_input  = not isinstance(video, (list, StreamIterator, AsyncIterator))
         is_direct_output = not self.config.output or self.config.output == "${result}"
 
+        async def _detect(video: MediaSource) -> Union[List[Dict[str, Any]], StreamChunkIterator]:
+            result = await self._detect(video, params, streaming, context.cancellation_token)
+
+            if streaming:
+                async def _stream_chunk_generator(result=result, scope=f"stream:{id(result)}"):
+                    async for chunk in result:
+                        context.register_source("result[]", chunk, scope=scope)
+                        yield (await context.render_variable(self.config.output, scope=scope)) if not is_direct_output else chunk
+
+                return StreamChunkIterator(_stream_chunk_generator(), is_fragmented=True)
+
+            return result
+
         if isinstance(video, (StreamIterator, AsyncIterator)):
-            async def _stream_output_generator():
-                async for batch_videos in BatchSourceIterator(video, batch_size=batch_size or 1):
-                    batch_results = await self._detect_batch(batch_videos, params, streaming, context.cancellation_token)
-                    for result in batch_results:
-                        if streaming:
-                            async def _stream_chunk_generator(result=result, scope=f"stream:{id(result)}"):
-                                async for chunk in result:
-                                    context.register_source("result[]", chunk, scope=scope)
-                                    yield (await context.render_variable(self.config.output, scope=scope)) if not is_direct_output else chunk
-
-                            yield StreamChunkIterator(_stream_chunk_generator(), is_fragmented=True)
-                        else:
-                            yield result
-
-            return _stream_output_generator()
+            return OrderedConcurrentIterator(video, _detect, batch_size or 1).__aiter__()
         else:
-            results = []
-            async for batch_videos in BatchSourceIterator(video, batch_size=batch_size or 1):
-                batch_results = await self._detect_batch(batch_videos, params, streaming, context.cancellation_token)
-                for result in batch_results:
-                    if streaming:
-                        async def _stream_chunk_generator(result=result, scope=f"stream:{id(result)}"):
-                            async for chunk in result:
-                                context.register_source("result[]", chunk, scope=scope)
-                                yield (await context.render_variable(self.config.output, scope=scope)) if not is_direct_output else chunk
-
-                        results.append(StreamChunkIterator(_stream_chunk_generator(), is_fragmented=True))
-                    else:
-                        results.append(result)
+            results = [ result async for result in OrderedConcurrentIterator(video, _detect, batch_size or 1) ]
 
             result = results[0] if is_single_input else results
             context.register_source("result", result)
@@ -67,19 +55,24 @@ class VideoSceneDetectorAction(ComponentAction):
         start_time = await context.render_scalar(self.config.start_time, "time")
         end_time   = await context.render_scalar(self.config.end_time, "time")
 
+        segment_duration    = await context.render_scalar(self.config.segment_duration, "time")
+        segment_concurrency = await context.render_scalar(self.config.segment_concurrency, int)
+
         return {
-            "detector":   detector,
-            "threshold":  threshold,
-            "start_time": start_time,
-            "end_time":   end_time,
+            "detector":            detector,
+            "threshold":           threshold,
+            "start_time":          start_time,
+            "end_time":            end_time,
+            "segment_duration":    segment_duration,
+            "segment_concurrency": segment_concurrency or os.cpu_count() or 1,
         }
 
     @abstractmethod
-    async def _detect_batch(
+    async def _detect(
         self,
-        videos: List[MediaSource],
+        video: MediaSource,
         params: Dict[str, Any],
         streaming: bool,
         cancellation_token: Optional[CancellationToken] = None,
-    ) -> List[Union[List[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]]:
+    ) -> Union[List[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]:
         pass
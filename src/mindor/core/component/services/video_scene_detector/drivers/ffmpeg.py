@@ -8,69 +8,35 @@ from mindor.core.foundation.cancellation import CancellationToken
 from mindor.core.foundation.streaming.media import MediaSource
 from mindor.core.foundation.streaming.resources import save_stream_to_temporary_file
 from mindor.core.foundation.streaming.file import FileStreamResource
-from mindor.core.utils.ffmpeg.probe import probe_video
+from mindor.core.utils.ffmpeg.probe import probe_video, probe_keyframes
 from mindor.core.utils.shell import run_subprocess, stream_subprocess
 from mindor.core.utils.time import format_timecode
+from mindor.core.utils.iterators import OrderedConcurrentIterator
 from mindor.core.logger import logging
 from ..base import VideoSceneDetectorService, VideoSceneDetectorDriver, register_video_scene_detector_service
 from ..base import ComponentActionContext
 from .common import VideoSceneDetectorAction
-import asyncio, os, re
+import asyncio, math, os, re
 
 _PTS_TIME_PATTERN = re.compile(rb"pts_time:\s*(\d+(?:\.\d+)?)")
 
-class FFmpegVideoSceneDetectorAction(VideoSceneDetectorAction):
-    async def _detect_batch(
-        self,
-        videos: List[MediaSource],
-        params: Dict[str, Any],
-        streaming: bool,
-        cancellation_token: Optional[CancellationToken] = None,
-    ) -> List[Union[List[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]]:
-        results: List[Union[List[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]] = []
-
-        for video in videos:
-            results.append(await self._detect(
-                video,
-                params["detector"],
-                params["threshold"],
-                params["start_time"],
-                params["end_time"],
-                streaming,
-                cancellation_token,
-            ))
-
-        return results
+# Frames a segment runs into the next one; the scene score of a frame looks back
+# at most two frames, so cuts past this point score the same as in a single pass.
+_SEGMENT_OVERLAP_FRAMES = 3
 
+class FFmpegVideoSceneDetectorAction(VideoSceneDetectorAction):
     async def _detect(
         self,
         video: MediaSource,
-        detector: Optional[str],
-        threshold: Optional[float],
-        start_time: Optional[float],
-        end_time: Optional[float],
+        params: Dict[str, Any],
         streaming: bool,
         cancellation_token: Optional[CancellationToken] = None,
     ) -> Union[List[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]:
+        threshold, start_time, end_time = params["threshold"], params["start_time"], params["end_time"]
+
         input_path, spooled = await self._resolve_input_path(video)
         resolved_threshold = threshold if threshold is not None else 0.3
 
-        command: List[str] = [ "ffmpeg", "-hide_banner" ]
-
-        if start_time is not None:
-            command.extend([ "-ss", str(start_time) ])
-        if end_time is not None:
-            command.extend([ "-to", str(end_time) ])
-
-        command.extend([ "-i", input_path ])
-        command.extend([ "-vf", f"select='gt(scene,{resolved_threshold})',showinfo" ])
-        command.extend([ "-f", "null", "-" ])
-
-        logging.debug(
-            "Detecting scenes with ffmpeg (threshold=%s, streaming=%s)",
-            resolved_threshold, streaming,
-        )
-
         def _cleanup() -> None:
             if spooled:
                 try:
@@ -80,11 +46,51 @@ class FFmpegVideoSceneDetectorAction(VideoSceneDetectorAction):
 
         duration, frame_rate = await probe_video(input_path, ("duration", "frame_rate"))
 
+        if params["segment_duration"]:
+            range_start = start_time or 0.0
+            range_end   = min(end_time, duration) if end_time is not None else duration
+
+            segment_starts = await self._plan_segments(input_path, range_start, range_end, params["segment_duration"])
+
+            if len(segment_starts) > 1:
+                logging.debug(
+                    "Detecting scenes with ffmpeg in %d segments (threshold=%s, streaming=%s)",
+                    len(segment_starts), resolved_threshold, streaming,
+                )
+
+                scenes = self._stream_segmented_scenes(
+                    input_path, segment_starts, range_end, resolved_threshold, frame_rate,
+                    params["segment_concurrency"], _cleanup, cancellation_token,
+                )
+
+                return scenes if streaming else [ scene async for scene in scenes ]
+
+        command = self._build_command(input_path, resolved_threshold, start_time, end_time)
+
+        logging.debug(
+            "Detecting scenes with ffmpeg (threshold=%s, streaming=%s)",
+            resolved_threshold, streaming,
+        )
+
         if streaming:
             return self._stream_scenes(command, duration, frame_rate, _cleanup, cancellation_token)
 
         return await self._collect_scenes(command, duration, frame_rate, _cleanup, cancellation_token)
 
+    def _build_command(self, input_path: str, threshold: float, start_time: Optional[float], end_time: Optional[float]) -> List[str]:
+        command: List[str] = [ "ffmpeg", "-hide_banner" ]
+
+        if start_time is not None:
+            command.extend([ "-ss", str(start_time) ])
+        if end_time is not None:
+            command.extend([ "-to", str(end_time) ])
+
+        command.extend([ "-i", input_path ])
+        command.extend([ "-vf", f"select='gt(scene,{threshold})',showinfo" ])
+        command.extend([ "-f", "null", "-" ])
+
+        return command
+
     async def _collect_scenes(
         self,
         command: List[str],
@@ -94,6 +100,19 @@ class FFmpegVideoSceneDetectorAction(VideoSceneDetectorAction):
         cancellation_token: Optional[CancellationToken],
     ) -> List[Dict[str, Any]]:
         """Run ffmpeg to completion and assemble the per-video scene result."""
+        try:
+            timestamps = await self._run_scene_filter(command, cancellation_token)
+            boundaries = [ 0.0 ] + timestamps + [ duration ]
+
+            return [ self._make_scene(index, boundaries[index], boundaries[index + 1], frame_rate) for index in range(len(boundaries) - 1) ]
+        except asyncio.CancelledError:
+            logging.info("Scene detection cancelled")
+            raise
+        finally:
+            cleanup()
+
+    async def _run_scene_filter(self, command: List[str], cancellation_token: Optional[CancellationToken]) -> List[float]:
+        """Run an ffmpeg scene filter command to completion and return the cut timestamps it reported."""
         async def _handle_stderr(reader: asyncio.StreamReader) -> Tuple[List[float], bytes]:
             timestamps: List[float] = []
             error_lines: List[bytes] = []
@@ -141,25 +160,7 @@ class FFmpegVideoSceneDetectorAction(VideoSceneDetectorAction):
                 error_message = error.decode("utf-8", errors="replace") if error else ""
                 raise RuntimeError(f"ffmpeg scene detection failed (exit code {process.returncode}): {error_message}")
 
-            scenes: List[Dict[str, Any]] = []
-            boundaries = [ 0.0 ] + timestamps + [ duration ]
-
-            for index in range(len(boundaries) - 1):
-                start = boundaries[index]
-                end = boundaries[index + 1]
-                scenes.append({
-                    "index": index,
-                    "start_time": format_timecode(start),
-                    "end_time": format_timecode(end),
-                    "start_frame": int(start * frame_rate),
-                    "end_frame": int(end * frame_rate),
-                    "duration": format_timecode(end - start)
-                })
-
-            return scenes
-        except asyncio.CancelledError:
-            logging.info("Scene detection cancelled")
-            raise
+            return timestamps
         finally:
             if watcher_task is not None and not watcher_task.done():
                 watcher_task.cancel()
@@ -168,8 +169,74 @@ class FFmpegVideoSceneDetectorAction(VideoSceneDetectorAction):
                 except (asyncio.CancelledError, Exception):
                     pass
 
+    async def _plan_segments(self, input_path: str, range_start: float, range_end: float, segment_duration: float) -> List[float]:
+        """Return the start times of the segments `[range_start, range_end)` is split into.
+
+        Segments start at the keyframe at or before each multiple of `segment_duration`,
+        so every ffmpeg run seeks straight to a frame it can decode.
+        """
+        positions = [ range_start + segment_duration * index for index in range(1, math.ceil((range_end - range_start) / segment_duration)) ]
+
+        try:
+            keyframes = await probe_keyframes(input_path, positions)
+        except RuntimeError:
+            keyframes = positions
+
+        return [ range_start ] + [ keyframe for keyframe in keyframes if range_start < keyframe < range_end ]
+
+    async def _stream_segmented_scenes(
+        self,
+        input_path: str,
+        segment_starts: List[float],
+        range_end: float,
+        threshold: float,
+        frame_rate: float,
+        concurrency: int,
+        cleanup: Callable[[], None],
+        cancellation_token: Optional[CancellationToken],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run one ffmpeg per segment in parallel and yield the stitched scenes in order.
+
+        A frame's scene score depends on the frames before it, so the first frames
+        of a segment score differently than they would in a single pass. Each
+        segment therefore runs `_SEGMENT_OVERLAP_FRAMES` frames into the next one,
+        and a cut belongs to the segment that has already seen that many frames
+        before it; the other segment's copy is dropped.
+        """
+        overlap = _SEGMENT_OVERLAP_FRAMES / frame_rate
+        range_start = segment_starts[0]
+        owned_from = [ -math.inf ] + [ start + overlap for start in segment_starts[1:] ] + [ math.inf ]
+
+        async def _detect_segment(index: int) -> List[float]:
+            start = segment_starts[index]
+            end   = segment_starts[index + 1] + overlap * 2 if index + 1 < len(segment_starts) else range_end
+
+            timestamps = await self._run_scene_filter(self._build_command(input_path, threshold, start, end), cancellation_token)
+
+            return [ start + timestamp for timestamp in timestamps if owned_from[index] < start + timestamp <= owned_from[index + 1] ]
+
+        try:
+            index, boundary = 0, range_start
+
+            async for cuts in OrderedConcurrentIterator(list(range(len(segment_starts))), _detect_segment, concurrency):
+                for cut in cuts:
+                    yield self._make_scene(index, boundary - range_start, cut - range_start, frame_rate)
+                    index, boundary = index + 1, cut
+
+            yield self._make_scene(index, boundary - range_start, range_end - range_start, frame_rate)
+        finally:
             cleanup()
 
+    def _make_scene(self, index: int, start: float, end: float, frame_rate: float) -> Dict[str, Any]:
+        return {
+            "index": index,
+            "start_time": format_timecode(start),
+            "end_time": format_timecode(end),
+            "start_frame": int(start * frame_rate),
+            "end_frame": int(end * frame_rate),
+            "duration": format_timecode(end - start),
+        }
+
     async def _stream_scenes(
         self,
         command: List[str],
@@ -225,14 +292,7 @@ class FFmpegVideoSceneDetectorAction(VideoSceneDetectorAction):
                     timestamp = await timestamps.get()
                     end = timestamp if timestamp is not None else duration
 
-                    yield {
-                        "index": index,
-                        "start_time": format_timecode(prev_boundary),
-                        "end_time": format_timecode(end),
-                        "start_frame": int(prev_boundary * frame_rate),
-                        "end_frame": int(end * frame_rate),
-                        "duration": format_timecode(end - prev_boundary),
-                    }
+                    yield self._make_scene(index, prev_boundary, end, frame_rate)
 
                     if timestamp is None:
                         break
@@ -17,38 +17,15 @@ from .common import VideoSceneDetectorAction
 import json, os
 
 class TransNetV2VideoSceneDetectorAction(VideoSceneDetectorAction):
-    async def _detect_batch(
-        self,
-        videos: List[MediaSource],
-        params: Dict[str, Any],
-        streaming: bool,
-        cancellation_token: Optional[CancellationToken] = None,
-    ) -> List[Union[List[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]]:
-        results: List[Union[List[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]] = []
-
-        for video in videos:
-            results.append(await self._detect(
-                video,
-                params["detector"],
-                params["threshold"],
-                params["start_time"],
-                params["end_time"],
-                streaming,
-                cancellation_token,
-            ))
-
-        return results
-
     async def _detect(
         self,
         video: MediaSource,
-        detector: Optional[str],
-        threshold: Optional[float],
-        start_time: Optional[float],
-        end_time: Optional[float],
+        params: Dict[str, Any],
         streaming: bool,
         cancellation_token: Optional[CancellationToken] = None,
     ) -> Union[List[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]:
+        threshold, start_time, end_time = params["threshold"], params["start_time"], params["end_time"]
+
         input_path, spooled = await self._resolve_input_path(video)
         resolved_threshold = threshold if threshold is not None else 0.5
 
@@ -1,7 +1,9 @@
-from typing import Dict, List
+from typing import Dict, List, Tuple, Set, Any
 from mindor.dsl.schema.compose import ComposeConfig
 from mindor.dsl.schema.action.impl.workflow import WorkflowActionConfig
+from mindor.dsl.schema.controller.adapter.impl.http_server import HttpServerControllerAdapterConfig
 from mindor.dsl.schema.listener.impl.http_trigger import HttpTriggerListenerConfig
+from mindor.dsl.schema.listener.impl.http_callback import HttpCallbackListenerConfig
 from mindor.dsl.schema.component.impl.workflow import WorkflowComponentConfig
 from mindor.core.workflow.validator import WorkflowValidator
 
@@ -14,9 +16,11 @@ class ComposeValidator:
         self.errors = []
 
         self._validate_duplicate_component_ids()
+        self._validate_component_dependencies()
         self._validate_duplicate_workflow_ids()
         self._validate_workflow_references()
         self._validate_workflows()
+        self._validate_shared_http_servers()
 
         return self.errors
 
@@ -35,6 +39,49 @@ class ComposeValidator:
             else:
                 seen.add(component.id)
 
+    def _validate_component_dependencies(self):
+        components = { component.id: component for component in self.config.components }
+
+        for component in self.config.components:
+            for dependency_id in component.depends_on:
+                if dependency_id == component.id:
+                    self.errors.append(
+                        f"component '{component.id}'.depends_on: "
+                        f"Component '{component.id}' depends on itself"
+                    )
+                elif dependency_id not in components:
+                    self.errors.append(
+                        f"component '{component.id}'.depends_on: "
+                        f"References non-existent component '{dependency_id}'"
+                    )
+
+        visiting: Set[str] = set()
+        visited: Set[str] = set()
+
+        def _detect_cycle(component_id: str):
+            if component_id in visiting:
+                self.errors.append(
+                    f"component '{component_id}'.depends_on: "
+                    f"Dependency cycle detected involving component '{component_id}'"
+                )
+                return
+
+            if component_id in visited or component_id not in components:
+                return
+
+            visiting.add(component_id)
+
+            for dependency_id in components[component_id].depends_on:
+                if dependency_id != component_id:
+                    _detect_cycle(dependency_id)
+
+            visiting.remove(component_id)
+            visited.add(component_id)
+
+        for component in self.config.components:
+            if component.id not in visited:
+                _detect_cycle(component.id)
+
     def _validate_duplicate_workflow_ids(self):
         seen: set = set()
 
@@ -97,6 +144,42 @@ class ComposeValidator:
                             f"References non-existent workflow '{trigger.workflow}'"
                         )
 
+    def _validate_shared_http_servers(self):
+        # HTTP-facing services bound to the same host and port share one server,
+        # routed by base path, so each of them needs a distinct base path.
+        mounts: Dict[Tuple[str, int], Dict[str, str]] = {}
+        services: List[Tuple[str, Any]] = [
+            (f"controller.adapters[{index}]", adapter) for index, adapter in enumerate(self.config.controller.adapters)
+            if isinstance(adapter, HttpServerControllerAdapterConfig)
+        ] + [
+            (f"listeners[{index}]", listener) for index, listener in enumerate(self.config.listeners)
+            if isinstance(listener, (HttpTriggerListenerConfig, HttpCallbackListenerConfig))
+        ]
+
+        for location, service in services:
+            address = (service.host, service.port)
+            prefix = (service.base_path or "").strip().strip("/")
+            owners = mounts.setdefault(address, {})
+
+            if prefix in owners:
+                self.errors.append(
+                    f"{location}.base_path: "
+                    f"Shares {service.host}:{service.port} with {owners[prefix]} "
+                    f"and needs a distinct base_path"
+                )
+            else:
+                owners[prefix] = location
+
+        for index, adapter in enumerate(self.config.controller.adapters):
+            if not isinstance(adapter, HttpServerControllerAdapterConfig) or adapter.workers <= 1:
+                continue
+
+            if len(mounts.get((adapter.host, adapter.port), {})) > 1:
+                self.errors.append(
+                    f"controller.adapters[{index}].workers: "
+                    f"Listeners cannot share {adapter.host}:{adapter.port} with a multi-worker HTTP server"
+                )
+
     def _validate_workflows(self):
         for workflow in self.config.workflows:
             self.errors.extend(WorkflowValidator(workflow, self.config.components).validate())
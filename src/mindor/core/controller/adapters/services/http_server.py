@@ -2,35 +2,83 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any, Callable, get_type_hints
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, AsyncIterable
 from typing_extensions import Self
 from pydantic import BaseModel, Field, ValidationError
-from mindor.dsl.schema.controller import HttpServerControllerAdapterConfig, ControllerAdapterType
+from mindor.dsl.schema.controller import HttpServerControllerAdapterConfig, StreamCoalescingConfig, ControllerAdapterType
 from mindor.dsl.schema.workflow import WorkflowVariableConfig, WorkflowVariableGroupConfig
-from mindor.core.utils.transport.http_client import request_with_url
+from mindor.core.utils.transport.webhook import WebhookDispatcher, WebhookOutbox
+from mindor.core.utils.json import json_dumps, json_dumps_str, json_loads
+from mindor.core.utils.image import has_alpha
 from mindor.core.utils.transport.http_request import parse_request_body, parse_options_header
 from mindor.core.foundation.streaming.image import ImageStreamResource
 from mindor.core.foundation.streaming.resources import StreamResource
 from mindor.core.foundation.streaming.iterators import StreamIterator, StreamEncodingIterator, StreamChunkIterator
-from mindor.core.utils.transport.http_stream import HttpEventStreamer
+from mindor.core.utils.transport.http_stream import HttpEventStreamer, HttpChunkCoalescer
+from mindor.core.controller.streaming import TaskOutputStreamResource
 from mindor.core.controller.base import TaskState, TaskStatus, InterruptState, TaskEvent, JobEvent
 from mindor.core.workflow.schema import WorkflowSchema
 from mindor.core.workflow import WorkflowResolver
-from mindor.core.errors import TaskError, ShutdownError
+from mindor.core.errors import TaskError, ShutdownError, OverloadedError, NotReadyError
 from mindor.core.controller.errors import TaskNotFoundError, TaskAlreadyFinishedError, TaskCancelInProgressError
+from mindor.core.utils.transport.http_server import SharedHttpServer, get_shared_http_server
+from mindor.core.foundation.variable.time import parse_time
+from mindor.core.foundation.variable.size import parse_size
+from mindor.core.controller.workers import ControllerWorkerContext, ControllerWorkerPool, create_shared_socket, create_unix_socket
 from ..base import ControllerAdapterService, register_controller_adapter
 from fastapi import FastAPI, APIRouter, Request, Body, HTTPException
 from fastapi import WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, JSONResponse, StreamingResponse
+from fastapi.responses import Response, JSONResponse, StreamingResponse, FileResponse
 from starlette.background import BackgroundTask
 from PIL import Image as PILImage
 from datetime import datetime, timezone
-import uvicorn, json, ulid, asyncio, inspect, functools, logging
+import uvicorn, aiohttp, ulid, asyncio, inspect, functools, logging, os
 
 if TYPE_CHECKING:
     from mindor.core.controller.base import ControllerService
 
+WORKER_TOKEN_HEADER = "X-Mindor-Worker-Token"
+
+_PROXY_EXCLUDED_HEADERS = { "content-length", "content-encoding", "transfer-encoding", "connection", "keep-alive" }
+
+def _exclude_none(values: Dict[str, Any]) -> Dict[str, Any]:
+    return { key: value for key, value in values.items() if value is not None }
+
+class FastJSONResponse(JSONResponse):
+    """`JSONResponse` encoded with the pluggable serializer in `mindor.core.utils.json`."""
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+_NEGOTIABLE_IMAGE_FORMATS: Dict[str, str] = {
+    "image/png":  "png",
+    "image/webp": "webp",
+    "image/jpeg": "jpeg",
+}
+
+class StreamFileResponse(FileResponse):
+    """`FileResponse` for a stream resource backed by a local file.
+
+    The file is sent with `http.response.pathsend` when the server supports it,
+    otherwise in 1 MB reads, and Range requests are honoured. The resource is
+    closed once the response ends, and task output streams are reported as
+    completed if the file was sent in full.
+    """
+    chunk_size = 1024 * 1024
+
+    def __init__(self, resource: StreamResource, path: str, headers: Dict[str, str]):
+        super().__init__(path, headers=headers, media_type=resource.content_type)
+
+        self.resource: StreamResource = resource
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+            if isinstance(self.resource, TaskOutputStreamResource):
+                await self.resource.notify_delivered()
+        finally:
+            await self.resource.close()
+
 class WorkflowRunBody(BaseModel):
     workflow_id: Optional[str] = None
     input: Optional[Any] = None
@@ -41,6 +89,7 @@ class WorkflowRunBody(BaseModel):
     subscribe_task: bool = False
     callback_url: Optional[str] = None
     callback_headers: Optional[Dict[str, str]] = None
+    coalesce: Optional[bool] = None
 
 class WorkflowResumeBody(BaseModel):
     job_id: str
@@ -95,6 +144,16 @@ class InterruptResult(BaseModel):
             metadata=instance.metadata
         )
 
+    @classmethod
+    def to_dict(cls, instance: InterruptState) -> Dict[str, Any]:
+        return _exclude_none({
+            "job_id": instance.job_id,
+            "run_id": instance.run_id,
+            "phase": instance.phase,
+            "message": instance.message,
+            "metadata": instance.metadata,
+        })
+
 class TaskStateResult(BaseModel):
     task_id: str
     status: Literal[ "pending", "processing", "interrupted", "cancelling", "cancelled", "completed", "failed" ]
@@ -120,7 +179,18 @@ class TaskStateResult(BaseModel):
 
     @classmethod
     def to_dict(cls, instance: TaskState) -> Dict[str, Any]:
-        return cls.from_instance(instance).model_dump(exclude_none=True)
+        # Built directly instead of through model_dump(), which would copy the
+        # whole output; the JSON serializer encodes it as-is.
+        return _exclude_none({
+            "task_id": instance.task_id,
+            "status": instance.status,
+            "workflow_id": instance.workflow_id,
+            "output": instance.output,
+            "error": instance.error,
+            "interrupt": InterruptResult.to_dict(instance.interrupt) if instance.interrupt else None,
+            "session_id": instance.session_id,
+            "metadata": instance.metadata,
+        })
 
 class WorkflowStartedResult(BaseModel):
     task_id: str
@@ -167,7 +237,18 @@ class JobEventResult(BaseModel):
 
     @classmethod
     def to_dict(cls, instance: JobEvent) -> Dict[str, Any]:
-        return cls.from_instance(instance).model_dump(exclude_none=True)
+        return _exclude_none({
+            "task_id": instance.task_id,
+            "run_id": instance.run_id,
+            "workflow_id": instance.workflow_id,
+            "job_id": instance.job_id,
+            "job_type": instance.job_type,
+            "event": instance.event,
+            "elapsed": instance.elapsed,
+            "output": instance.output,
+            "error": instance.error,
+            "next_job_id": instance.next_job_id,
+        })
 
 class TaskEventResult(BaseModel):
     task_id: str
@@ -198,7 +279,18 @@ class TaskEventResult(BaseModel):
 
     @classmethod
     def to_dict(cls, instance: TaskEvent) -> Dict[str, Any]:
-        return cls.from_instance(instance).model_dump(exclude_none=True)
+        return _exclude_none({
+            "task_id": instance.task_id,
+            "workflow_id": instance.workflow_id,
+            "event": instance.event,
+            "status": instance.status,
+            "output": instance.output,
+            "error": instance.error,
+            "interrupt": InterruptResult.to_dict(instance.interrupt) if instance.interrupt else None,
+            "elapsed": instance.elapsed,
+            "session_id": instance.session_id,
+            "metadata": instance.metadata,
+        })
 
 class WorkflowVariableResult(BaseModel):
     name: Optional[str]
@@ -283,6 +375,7 @@ class WebSocketManager:
         self._connections: Dict[str, WebSocket] = {}
         self._task_subscribers: Dict[str, Set[str]] = {}
         self._client_subscriptions: Dict[str, Set[str]] = {}
+        self._task_relays: Dict[str, Set[asyncio.Queue]] = {}
 
     async def accept(self, client_id: str, websocket: WebSocket) -> bool:
         if client_id in self._connections:
@@ -312,6 +405,7 @@ class WebSocketManager:
         self._connections.clear()
         self._task_subscribers.clear()
         self._client_subscriptions.clear()
+        self._task_relays.clear()
 
     def has_connection(self, client_id: str) -> bool:
         return client_id in self._connections
@@ -324,11 +418,17 @@ class WebSocketManager:
         await websocket.send_text(self._serialize_message(message))
 
     async def broadcast_task_message(self, task_id: str, message: WebSocketMessage) -> None:
+        for queue in self._task_relays.get(task_id, ()):
+            queue.put_nowait(message)
+
+        if self._task_subscribers.get(task_id):
+            await self.broadcast_task_text(task_id, self._serialize_message(message))
+
+    async def broadcast_task_text(self, task_id: str, message_text: str) -> None:
         subscribers = self._task_subscribers.get(task_id)
         if not subscribers:
             return
 
-        message_text = self._serialize_message(message)
         connections = [ self._connections[client_id] for client_id in subscribers if client_id in self._connections ]
         tasks = [ websocket.send_text(message_text) for websocket in connections ]
 
@@ -360,10 +460,29 @@ class WebSocketManager:
             self._client_subscriptions[client_id].discard(task_id)
 
     def has_task_subscribers(self, task_id: str) -> bool:
-        return bool(self._task_subscribers.get(task_id))
+        return bool(self._task_subscribers.get(task_id)) or bool(self._task_relays.get(task_id))
+
+    def add_task_relay(self, task_id: str) -> asyncio.Queue:
+        """Registers a queue receiving every message broadcast for `task_id`, used to
+        forward task messages to subscribers connected to another worker."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._task_relays.setdefault(task_id, set()).add(queue)
+        return queue
+
+    def remove_task_relay(self, task_id: str, queue: asyncio.Queue) -> None:
+        relays = self._task_relays.get(task_id)
+        if relays is not None:
+            relays.discard(queue)
+            if not relays:
+                self._task_relays.pop(task_id, None)
 
     def _serialize_message(self, message: WebSocketMessage) -> str:
-        return json.dumps(message.model_dump(exclude_none=True, mode="json"), ensure_ascii=False, default=str)
+        return json_dumps_str(_exclude_none({
+            "type": message.type,
+            "id": message.id,
+            "data": message.data,
+            "timestamp": message.timestamp.isoformat().replace("+00:00", "Z"),
+        }))
 
 class WebSocketRouter:
     def __init__(self):
@@ -410,17 +529,26 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
         super().__init__(config, controller, daemon)
 
         self.server: Optional[uvicorn.Server] = None
+        self.shared_server: Optional[SharedHttpServer] = None
         self.app: FastAPI = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
         self.http_router: APIRouter = APIRouter()
         self.websocket_manager: WebSocketManager = WebSocketManager()
         self.websocket_router: WebSocketRouter = WebSocketRouter()
 
+        self.worker_pool: Optional[ControllerWorkerPool] = None
+        self.callback_dispatcher: Optional[WebhookDispatcher] = None
+
         self._task_callbacks: Dict[str, Tuple[str, Dict[str, str]]] = {}
+        self._task_relays: Dict[str, asyncio.Task] = {}
+        self._worker_sessions: Dict[int, aiohttp.ClientSession] = {}
+        self._static_json_contents: Dict[str, bytes] = {}
 
         self._configure_server()
         self._configure_http_routes()
         if self.config.websocket is not False:
             self._configure_websocket_routes()
+        if self.config.workers > 1:
+            self._configure_worker_routes()
         self.app.include_router(self.http_router, prefix=self.config.base_path or "")
 
     def _configure_server(self) -> None:
@@ -492,6 +620,7 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
                 state = await self.controller.run_workflow(
                     workflow_id,
                     body.input,
+                    task_id=self._generate_task_id(),
                     wait_for_completion=body.wait_for_completion,
                     stop_at_streaming=body.output_only,
                     session_id=body.session_id,
@@ -499,11 +628,13 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
                 )
             except ShutdownError:
                 raise HTTPException(status_code=503, detail="Service is shutting down")
+            except OverloadedError as e:
+                raise HTTPException(status_code=429, detail=str(e))
+            except NotReadyError as e:
+                raise HTTPException(status_code=503, detail=str(e))
 
             if body.callback_url:
-                self._task_callbacks[state.task_id] = (
-                    body.callback_url, { "Content-Type": "application/json", **(body.callback_headers or {}) },
-                )
+                self._task_callbacks[state.task_id] = (body.callback_url, body.callback_headers or {})
 
             if body.subscribe_task and session_id:
                 self.websocket_manager.subscribe_task(session_id, state.task_id)
@@ -514,39 +645,52 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
                         data=TaskStateResult.to_dict(state),
                     ))
 
-            return self._render_task_response(state, body.output_only, allow_streaming=True)
+            return self._render_task_response(state, body.output_only, allow_streaming=True, accept=request.headers.get("accept"), coalesce=body.coalesce)
 
         @self.http_router.get("/tasks/{task_id}")
         async def get_task_state(
+            request: Request,
             task_id: str,
-            output_only: bool = False
+            output_only: bool = False,
+            coalesce: Optional[bool] = None
         ):
+            if self._is_remote_task(task_id):
+                return await self._forward_task_request(request, task_id)
+
             state = self.controller.get_task_state(task_id)
 
             if not state:
                 raise HTTPException(status_code=404, detail="Task not found.")
 
-            return self._render_task_response(state, output_only)
+            return self._render_task_response(state, output_only, accept=request.headers.get("accept"), coalesce=coalesce)
 
         @self.http_router.post("/tasks/{task_id}/resume")
         async def resume_task(
+            request: Request,
             task_id: str,
             body: WorkflowResumeBody = Body(...)
         ):
+            if self._is_remote_task(task_id):
+                return await self._forward_task_request(request, task_id)
+
             try:
                 state = await self.controller.resume_workflow(task_id, body.job_id, body.run_id, body.answer)
-                return JSONResponse(content=TaskStateResult.to_dict(state))
+                return FastJSONResponse(content=TaskStateResult.to_dict(state))
             except ValueError as e:
                 raise HTTPException(status_code=400, detail=str(e))
 
         @self.http_router.post("/tasks/{task_id}/cancel")
         async def cancel_task(
+            request: Request,
             task_id: str,
             wait_for_completion: bool = True
         ):
+            if self._is_remote_task(task_id):
+                return await self._forward_task_request(request, task_id)
+
             try:
                 state = await self.controller.cancel_workflow(task_id, wait_for_completion=wait_for_completion)
-                return JSONResponse(content=TaskStateResult.to_dict(state))
+                return FastJSONResponse(content=TaskStateResult.to_dict(state))
             except TaskNotFoundError as e:
                 raise HTTPException(status_code=404, detail=str(e))
             except (TaskAlreadyFinishedError, TaskCancelInProgressError) as e:
@@ -555,12 +699,27 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
         @self.http_router.get("/health")
         async def health_check():
             if self.controller.is_shutdown_pending:
-                return JSONResponse(status_code=503, content={ "status": "shutdown_pending" })
+                return FastJSONResponse(status_code=503, content={ "status": "shutdown_pending" })
 
             if self.controller.is_shutting_down:
-                return JSONResponse(status_code=503, content={ "status": "shutting_down" })
+                return FastJSONResponse(status_code=503, content={ "status": "shutting_down" })
+
+            if self.controller.is_starting:
+                return FastJSONResponse(content={ "status": "starting" })
+
+            if self.controller.is_degraded:
+                return FastJSONResponse(content={ "status": "degraded" })
+
+            return FastJSONResponse(content={ "status": "ok" })
+
+        @self.http_router.get("/metrics")
+        async def get_metrics():
+            metrics = self.controller.get_metrics()
+
+            if self.callback_dispatcher:
+                metrics["callbacks"] = self.callback_dispatcher.get_stats()
 
-            return JSONResponse(content={ "status": "ok" })
+            return FastJSONResponse(content=metrics)
 
     def _configure_websocket_routes(self) -> None:
         @self.http_router.websocket(self.config.websocket.path)
@@ -579,14 +738,13 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
                 return
 
             if task:
-                state = self.controller.get_task_state(task)
+                state = await self._subscribe_task(client_id, task)
                 if state:
-                    self.websocket_manager.subscribe_task(client_id, task)
                     await self.websocket_manager.send_message(client_id, WebSocketMessage(
                         type="task_subscribed",
                         data=TaskSubscribedResult(
                             task_id=task,
-                            state=TaskStateResult.to_dict(state),
+                            state=state,
                         ).model_dump(exclude_none=True),
                     ))
                 else:
@@ -602,10 +760,13 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
                 while True:
                     message_text = await websocket.receive_text()
                     try:
-                        message = WebSocketMessage(**json.loads(message_text))
-                    except json.JSONDecodeError:
+                        data = json_loads(message_text)
+                    except ValueError:
                         await self.websocket_manager.send_error(client_id, "INVALID_REQUEST", "Invalid JSON")
                         continue
+
+                    try:
+                        message = WebSocketMessage(**data)
                     except Exception as e:
                         await self.websocket_manager.send_error(client_id, "INVALID_REQUEST", f"Invalid message: {e}")
                         continue
@@ -634,6 +795,7 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
             state = await self.controller.run_workflow(
                 workflow_id,
                 payload.input,
+                task_id=self._generate_task_id(),
                 wait_for_completion=False,
                 session_id=payload.session_id,
                 metadata=payload.metadata,
@@ -662,19 +824,17 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
 
         @self.websocket_router.handler("subscribe_task")
         async def subscribe_task(client_id: str, message_id: Optional[str], payload: TaskSubscribePayload) -> None:
-            state = self.controller.get_task_state(payload.task_id)
+            state = await self._subscribe_task(client_id, payload.task_id)
             if not state:
                 await self.websocket_manager.send_error(client_id, "TASK_NOT_FOUND", f"Task '{payload.task_id}' not found", message_id)
                 return
 
-            self.websocket_manager.subscribe_task(client_id, payload.task_id)
-
             await self.websocket_manager.send_message(client_id, WebSocketMessage(
                 type="task_subscribed",
                 id=message_id,
                 data=TaskSubscribedResult(
                     task_id=payload.task_id,
-                    state=TaskStateResult.to_dict(state),
+                    state=state,
                 ).model_dump(exclude_none=True),
             ))
 
@@ -693,13 +853,16 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
         @self.websocket_router.handler("resume_task")
         async def resume_task(client_id: str, message_id: Optional[str], payload: TaskResumePayload) -> None:
             try:
-                state = await self.controller.resume_workflow(payload.task_id, payload.job_id, payload.run_id, payload.answer)
+                if self._is_remote_task(payload.task_id):
+                    status = await self._resume_remote_task(payload)
+                else:
+                    status = (await self.controller.resume_workflow(payload.task_id, payload.job_id, payload.run_id, payload.answer)).status
                 await self.websocket_manager.send_message(client_id, WebSocketMessage(
                     type="task_resumed",
                     id=message_id,
                     data=TaskResumedResult(
                         task_id=payload.task_id,
-                        status=state.status,
+                        status=status,
                     ).model_dump(exclude_none=True),
                 ))
             except TaskError as e:
@@ -707,7 +870,7 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
 
         @self.websocket_router.handler("get_task")
         async def get_task(client_id: str, message_id: Optional[str], payload: TaskGetPayload) -> None:
-            state = self.controller.get_task_state(payload.task_id)
+            state = await self._get_task_state(payload.task_id)
             if not state:
                 await self.websocket_manager.send_error(client_id, "TASK_NOT_FOUND", f"Task '{payload.task_id}' not found", message_id)
                 return
@@ -715,7 +878,7 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
             await self.websocket_manager.send_message(client_id, WebSocketMessage(
                 type="task_state",
                 id=message_id,
-                data=TaskStateResult.to_dict(state)
+                data=state
             ))
 
         @self.websocket_router.handler("ping")
@@ -725,25 +888,90 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
                 id=message_id,
             ))
 
+    def _configure_worker_routes(self) -> None:
+        @self.http_router.get("/tasks/{task_id}/relay")
+        async def relay_task_messages(
+            request: Request,
+            task_id: str
+        ):
+            # Internal stream consumed by the other workers; see _open_task_relay().
+            if not self.worker_context or request.headers.get(WORKER_TOKEN_HEADER) != self.worker_context.token:
+                raise HTTPException(status_code=404, detail="Not Found")
+
+            state = self.controller.get_task_state(task_id)
+            if not state:
+                raise HTTPException(status_code=404, detail="Task not found.")
+
+            queue = self.websocket_manager.add_task_relay(task_id)
+
+            async def _stream():
+                try:
+                    yield self._serialize_relay_message(WebSocketMessage(type="task_state", data=TaskStateResult.to_dict(state)))
+
+                    if state.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED):
+                        return
+
+                    while True:
+                        message: WebSocketMessage = await queue.get()
+                        yield self._serialize_relay_message(message)
+
+                        if message.type == "task_event" and message.data.get("event") in ("completed", "failed", "cancelled"):
+                            return
+                finally:
+                    self.websocket_manager.remove_task_relay(task_id, queue)
+
+            return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
     async def _start(self) -> None:
         self.controller.add_task_state_listener(self._on_task_state_change)
         self.controller.add_task_event_listener(self._on_task_event)
         self.controller.add_job_event_listener(self._on_job_event)
 
+        self.callback_dispatcher = self._create_callback_dispatcher()
+        await self.callback_dispatcher.start()
+
         await super()._start()
 
     async def _serve(self) -> None:
+        try:
+            if self.worker_context:
+                await self._serve_worker()
+            else:
+                # Listeners configured on the same host and port are mounted on this server.
+                self.shared_server = get_shared_http_server(self.config.host, self.config.port)
+                await self.shared_server.serve(self.config.base_path, self.app)
+        finally:
+            self.server = None
+            self.shared_server = None
+
+            if self.worker_pool:
+                await self.worker_pool.stop()
+                self.worker_pool = None
+
+            if self.worker_context:
+                self.worker_context.dispose()
+
+            for session in self._worker_sessions.values():
+                await session.close()
+            self._worker_sessions.clear()
+
+    async def _serve_worker(self) -> None:
         self.server = uvicorn.Server(uvicorn.Config(
             self.app,
             host=self.config.host,
             port=self.config.port,
             log_level="info"
         ))
+        sockets = [
+            create_shared_socket(self.config.host, self.config.port),
+            create_unix_socket(self.worker_context.get_socket_path()),
+        ]
 
-        try:
-            await self.server.serve()
-        finally:
-            self.server = None
+        if self.worker_context.is_primary:
+            self.worker_pool = ControllerWorkerPool(self.worker_context)
+            await self.worker_pool.start()
+
+        await self.server.serve(sockets=sockets)
 
     async def _shutdown(self) -> None:
         self.controller.remove_task_state_listener(self._on_task_state_change)
@@ -751,12 +979,46 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
         self.controller.remove_job_event_listener(self._on_job_event)
         await self.websocket_manager.dispose()
 
+        for relay in list(self._task_relays.values()):
+            relay.cancel()
+
         if self.server:
             self.server.should_exit = True
 
+        if self.shared_server:
+            self.shared_server.release(self.config.base_path)
+
         if self.daemon_task:
             await self.daemon_task
 
+        if self.callback_dispatcher:
+            await self.callback_dispatcher.stop()
+            self.callback_dispatcher = None
+
+    def _get_setup_requirements(self) -> Optional[List[str]]:
+        return [ "aiosqlite" ] if self.config.callback.outbox else None
+
+    def _create_callback_dispatcher(self) -> WebhookDispatcher:
+        config = self.config.callback
+        outbox = None
+
+        if config.outbox:
+            # Each worker process delivers the callbacks of the tasks it owns.
+            path = f"{config.outbox}.{self.worker_context.index}" if self.worker_context else config.outbox
+            outbox = WebhookOutbox(path)
+
+        return WebhookDispatcher(
+            max_concurrency=config.max_concurrency,
+            max_connections_per_host=config.max_connections_per_host,
+            timeout=parse_time(config.timeout),
+            max_retries=config.max_retries,
+            retry_backoff=parse_time(config.retry_backoff),
+            max_retry_backoff=parse_time(config.max_retry_backoff),
+            batch_size=config.batch_size,
+            batch_interval=parse_time(config.batch_interval),
+            outbox=outbox
+        )
+
     async def _on_task_state_change(self, task_id: str, state: TaskState) -> None:
         if self.websocket_manager.has_task_subscribers(task_id):
             await self.websocket_manager.broadcast_task_message(
@@ -794,71 +1056,192 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
             )
 
     async def _send_task_callback(self, event: TaskEvent, callback_url: str, headers: Dict[str, str]) -> None:
+        if not self.callback_dispatcher:
+            logging.warning("Dropping task callback for %s: adapter is not running", event.task_id)
+            return
+
         try:
-            payload = TaskEventResult.from_instance(event).model_dump(exclude_none=True, mode="json")
-            await request_with_url(
-                callback_url,
-                method="POST",
-                body=payload,
-                headers=headers,
-                raise_on_error=False,
-            )
+            await self.callback_dispatcher.submit(callback_url, TaskEventResult.to_dict(event), headers)
         except Exception:
-            logging.warning("Failed to deliver task callback for %s to %s", event.task_id, callback_url, exc_info=True)
+            logging.warning("Failed to queue task callback for %s to %s", event.task_id, callback_url, exc_info=True)
+
+    @property
+    def worker_context(self) -> Optional[ControllerWorkerContext]:
+        return self.controller.worker_context if self.config.workers > 1 else None
+
+    def _generate_task_id(self) -> Optional[str]:
+        return self.worker_context.generate_task_id() if self.worker_context else None
+
+    def _is_remote_task(self, task_id: str) -> bool:
+        return self.worker_context is not None and self.worker_context.is_remote_task(task_id)
+
+    async def _get_task_state(self, task_id: str) -> Optional[Dict[str, Any]]:
+        if self._is_remote_task(task_id):
+            async with await self._request_owner(task_id, "GET", self._get_route_path(f"/tasks/{task_id}")) as response:
+                return await response.json() if response.status == 200 else None
+
+        state = self.controller.get_task_state(task_id)
+        return TaskStateResult.to_dict(state) if state else None
+
+    async def _subscribe_task(self, client_id: str, task_id: str) -> Optional[Dict[str, Any]]:
+        if self._is_remote_task(task_id):
+            state = await self._open_task_relay(task_id)
+        else:
+            state = await self._get_task_state(task_id)
+
+        if state:
+            self.websocket_manager.subscribe_task(client_id, task_id)
+
+        return state
+
+    async def _resume_remote_task(self, payload: TaskResumePayload) -> str:
+        body = WorkflowResumeBody(job_id=payload.job_id, run_id=payload.run_id, answer=payload.answer).model_dump(mode="json")
+
+        async with await self._request_owner(payload.task_id, "POST", self._get_route_path(f"/tasks/{payload.task_id}/resume"), json=body) as response:
+            content = await response.json(content_type=None)
+
+            if response.status == 404:
+                raise TaskNotFoundError(content.get("detail") or f"Task '{payload.task_id}' not found")
+
+            if response.status != 200:
+                raise TaskError(content.get("detail") or f"Failed to resume task '{payload.task_id}'")
+
+            return content["status"]
+
+    async def _open_task_relay(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Starts forwarding the messages of a task owned by another worker to the
+        local subscribers and returns its current state, or None if it does not exist."""
+        if task_id in self._task_relays:
+            return await self._get_task_state(task_id)
+
+        response = await self._request_owner(task_id, "GET", self._get_route_path(f"/tasks/{task_id}/relay"), timeout=aiohttp.ClientTimeout(total=None))
+
+        if response.status != 200:
+            response.release()
+            return None
+
+        message = json_loads(await response.content.readline())
+        self._task_relays[task_id] = asyncio.create_task(self._pump_task_relay(task_id, response))
+
+        return message["data"]
+
+    async def _pump_task_relay(self, task_id: str, response: aiohttp.ClientResponse) -> None:
+        try:
+            async for line in response.content:
+                if not line.strip():
+                    continue
+
+                if not self.websocket_manager.has_task_subscribers(task_id):
+                    break
+
+                await self.websocket_manager.broadcast_task_text(task_id, line.decode("utf-8").rstrip("\n"))
+        except aiohttp.ClientError:
+            logging.warning("Lost task relay for %s from its owning worker", task_id, exc_info=True)
+        finally:
+            response.close()
+            self._task_relays.pop(task_id, None)
+
+    async def _forward_task_request(self, request: Request, task_id: str) -> Response:
+        response = await self._request_owner(
+            task_id,
+            request.method,
+            request.url.path,
+            params=request.query_params,
+            data=await request.body(),
+            headers={ key: value for key, value in request.headers.items() if key.lower() in ("content-type", "accept") },
+            timeout=aiohttp.ClientTimeout(total=None)
+        )
+
+        return StreamingResponse(
+            response.content.iter_any(),
+            status_code=response.status,
+            headers={ key: value for key, value in response.headers.items() if key.lower() not in _PROXY_EXCLUDED_HEADERS },
+            background=BackgroundTask(response.release)
+        )
+
+    async def _request_owner(self, task_id: str, method: str, path: str, **kwargs: Any) -> aiohttp.ClientResponse:
+        owner = self.worker_context.get_task_owner(task_id)
+
+        if owner not in self._worker_sessions:
+            connector = aiohttp.UnixConnector(path=self.worker_context.get_socket_path(owner))
+            self._worker_sessions[owner] = aiohttp.ClientSession(connector=connector)
+
+        try:
+            return await self._worker_sessions[owner].request(
+                method,
+                f"http://worker-{owner}{path}",
+                headers={ **kwargs.pop("headers", {}), WORKER_TOKEN_HEADER: self.worker_context.token },
+                **kwargs
+            )
+        except aiohttp.ClientError as e:
+            raise HTTPException(status_code=502, detail=f"Worker owning task '{task_id}' is unavailable: {e}")
+
+    def _get_route_path(self, path: str) -> str:
+        return f"{self.config.base_path or ''}{path}"
+
+    def _serialize_relay_message(self, message: WebSocketMessage) -> str:
+        return self.websocket_manager._serialize_message(message) + "\n"
 
     def _resolve_workflow_id(self, workflow_id: str) -> Optional[str]:
         if workflow_id == "__default__":
             workflow_id, _ = WorkflowResolver(self.controller.workflows).resolve(workflow_id, raise_on_error=False)
         return workflow_id
 
-    def _render_task_response(self, state: TaskState, output_only: bool, allow_streaming: bool = False) -> Response:
+    def _render_task_response(self, state: TaskState, output_only: bool, allow_streaming: bool = False, accept: Optional[str] = None, coalesce: Optional[bool] = None) -> Response:
         if not output_only and isinstance(state.output, (StreamResource, StreamIterator, AsyncIterator)):
             raise HTTPException(status_code=400, detail="Streaming output is only allowed when output_only=true.")
 
         if output_only:
-            return self._render_task_output(state, allow_streaming=allow_streaming)
+            return self._render_task_output(state, allow_streaming=allow_streaming, accept=accept, coalesce=coalesce)
 
         return self._render_task_state(state)
 
     def _render_task_state(self, state: TaskState) -> Response:
-        return JSONResponse(content=TaskStateResult.to_dict(state))
+        return FastJSONResponse(content=TaskStateResult.to_dict(state))
 
-    def _render_task_output(self, state: TaskState, allow_streaming: bool = False) -> Response:
+    def _render_task_output(self, state: TaskState, allow_streaming: bool = False, accept: Optional[str] = None, coalesce: Optional[bool] = None) -> Response:
         if state.status in (TaskStatus.PENDING, TaskStatus.PROCESSING, TaskStatus.INTERRUPTED, TaskStatus.CANCELLING):
-            return JSONResponse(status_code=202, content=TaskStateResult.to_dict(state))
+            return FastJSONResponse(status_code=202, content=TaskStateResult.to_dict(state))
 
         if state.status == TaskStatus.STREAMING:
             if not allow_streaming:
-                return JSONResponse(status_code=202, content=TaskStateResult.to_dict(state))
-            return self._render_stream_output(state.output)
+                return FastJSONResponse(status_code=202, content=TaskStateResult.to_dict(state))
+            return self._render_stream_output(state.output, coalesce)
 
         if state.status == TaskStatus.CANCELLED:
-            return JSONResponse(status_code=409, content=TaskStateResult.to_dict(state))
+            return FastJSONResponse(status_code=409, content=TaskStateResult.to_dict(state))
 
         if state.status == TaskStatus.FAILED:
             raise HTTPException(status_code=500, detail=str(state.error))
 
         if isinstance(state.output, PILImage.Image):
-            return self._render_stream_resource(ImageStreamResource(state.output))
+            response = self._render_stream_resource(ImageStreamResource(state.output, self._negotiate_image_format(accept, state.output)))
+            response.headers["Vary"] = "Accept"
+            return response
 
         if isinstance(state.output, (StreamResource, StreamIterator, AsyncIterator)):
-            return self._render_stream_output(state.output)
+            return self._render_stream_output(state.output, coalesce)
 
         if isinstance(state.output, bytes):
             return Response(content=state.output, media_type="application/octet-stream")
 
-        return JSONResponse(content=state.output)
+        return FastJSONResponse(content=state.output)
 
-    def _render_stream_output(self, output: Any) -> Response:
+    def _render_stream_output(self, output: Any, coalesce: Optional[bool] = None) -> Response:
         if isinstance(output, StreamResource):
             return self._render_stream_resource(output)
 
         if isinstance(output, StreamEncodingIterator):
-            return self._render_event_stream(output)
+            return self._render_event_stream(output, coalesce)
 
-        return StreamingResponse(output, media_type="application/octet-stream")
+        return StreamingResponse(self._coalesce_stream(output, coalesce), media_type="application/octet-stream")
 
     def _render_stream_resource(self, resource: StreamResource) -> Response:
+        path = resource.get_local_path()
+
+        if path and os.path.isfile(path):
+            return StreamFileResponse(resource, path, self._build_stream_resource_headers(resource))
+
         return StreamingResponse(
             resource,
             media_type=resource.content_type,
@@ -866,15 +1249,54 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
             background=BackgroundTask(resource.close)
         )
 
-    def _render_event_stream(self, iterator: StreamEncodingIterator) -> Response:
+    def _negotiate_image_format(self, accept: Optional[str], image: PILImage.Image) -> str:
+        """Picks the format the client prefers among PNG, WebP and JPEG from its
+        `Accept` header, falling back to PNG. JPEG is skipped for images with alpha."""
+        candidates: List[Tuple[float, int, str]] = []
+
+        for position, item in enumerate((accept or "").split(",")):
+            media_type, _, params = item.partition(";")
+            format = _NEGOTIABLE_IMAGE_FORMATS.get(media_type.strip().lower())
+
+            if format is None or (format == "jpeg" and has_alpha(image)):
+                continue
+
+            quality = 1.0
+            for param in params.split(";"):
+                name, _, value = param.partition("=")
+                if name.strip().lower() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+
+            if quality > 0:
+                candidates.append((-quality, position, format))
+
+        return min(candidates)[2] if candidates else "png"
+
+    def _render_event_stream(self, iterator: StreamEncodingIterator, coalesce: Optional[bool] = None) -> Response:
         return StreamingResponse(
-            HttpEventStreamer(iterator).stream(),
+            self._coalesce_stream(HttpEventStreamer(iterator).stream(), coalesce),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache"
             }
         )
 
+    def _coalesce_stream(self, stream: AsyncIterable, coalesce: Optional[bool]) -> AsyncIterable:
+        """Wraps the response body in a chunk coalescer when the adapter enables it,
+        or when the request asks for it; `coalesce=false` on the request turns it off."""
+        config = self.config.stream_coalescing
+
+        if coalesce is False or (coalesce is None and config is False):
+            return stream
+
+        if not isinstance(config, StreamCoalescingConfig):
+            config = StreamCoalescingConfig()
+
+        return HttpChunkCoalescer(stream, parse_time(config.max_delay), parse_size(config.max_bytes)).stream()
+
     def _build_stream_resource_headers(self, resource: StreamResource) -> Dict[str, str]:
         headers: Dict[str, str] = { "Cache-Control": "no-cache" }
 
@@ -885,14 +1307,23 @@ class HttpServerControllerAdapterService(ControllerAdapterService):
         return headers
 
     def _render_workflow_list(self, workflows: Dict[str, WorkflowSchema]) -> Response:
-        return JSONResponse(content=[
+        return self._render_static_json("workflows", lambda: [
             WorkflowSimpleResult.to_dict(workflow) for workflow in workflows.values()
         ])
 
     def _render_workflow_schemas(self, workflows: Dict[str, WorkflowSchema]) -> Response:
-        return JSONResponse(content=[
+        return self._render_static_json("workflows:schema", lambda: [
             WorkflowSchemaResult.to_dict(workflow) for workflow in workflows.values()
         ])
 
     def _render_workflow_schema(self, workflow: WorkflowSchema) -> Response:
-        return JSONResponse(content=WorkflowSchemaResult.to_dict(workflow))
+        return self._render_static_json(f"workflow:{workflow.workflow_id}:schema", lambda: WorkflowSchemaResult.to_dict(workflow))
+
+    def _render_static_json(self, key: str, build: Callable[[], Any]) -> Response:
+        # Workflow schemas never change at runtime, so their responses are encoded once.
+        content = self._static_json_contents.get(key)
+
+        if content is None:
+            content = self._static_json_contents[key] = json_dumps(build())
+
+        return Response(content=content, media_type="application/json")
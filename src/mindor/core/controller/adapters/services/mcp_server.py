@@ -18,7 +18,8 @@ from ..base import ControllerAdapterService, register_controller_adapter
 from mcp.server.fastmcp.server import FastMCP
 from mcp.server.stdio import stdio_server
 from mcp.types import ContentBlock, TextContent, ImageContent, AudioContent, EmbeddedResource, BlobResourceContents
-import asyncio, uvicorn, json
+from mindor.core.utils.json import json_dumps_str, json_loads
+import asyncio, uvicorn
 
 if TYPE_CHECKING:
     from mindor.core.controller.base import ControllerService
@@ -121,18 +122,18 @@ class McpServerControllerAdapterService(ControllerAdapterService):
         return await self._build_state_response(state)
 
     async def _resume_workflow_as_tool(self, task_id: str, job_id: str, run_id: Optional[str] = None, answer: str = "") -> List[ContentBlock]:
-        parsed_answer = json.loads(answer) if answer else None
+        parsed_answer = json_loads(answer) if answer else None
         try:
             await self.controller.resume_workflow(task_id, job_id, run_id, parsed_answer)
         except ValueError as e:
-            return [ TextContent(type="text", text=json.dumps({"error": str(e)})) ]
+            return [ TextContent(type="text", text=json_dumps_str({"error": str(e)})) ]
 
         state = await self.controller.wait_for_terminal_state(task_id)
         return await self._build_state_response(state)
 
     async def _build_state_response(self, state: TaskState) -> List[ContentBlock]:
         if state.status == TaskStatus.INTERRUPTED:
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=json_dumps_str({
                 "status": "interrupted",
                 "task_id": state.task_id,
                 "interrupt": {
@@ -145,16 +146,16 @@ class McpServerControllerAdapterService(ControllerAdapterService):
             }))]
 
         if state.status == TaskStatus.FAILED:
-            return [ TextContent(type="text", text=json.dumps({"status": "failed", "error": state.error})) ]
+            return [ TextContent(type="text", text=json_dumps_str({"status": "failed", "error": state.error})) ]
 
         workflow = self.controller.workflow_schemas.get(state.workflow_id) if state.workflow_id else None
         if workflow:
             return await self._build_output_value(state, workflow)
 
         if state.output is None:
-            return [ TextContent(type="text", text=json.dumps({"status": "completed"})) ]
+            return [ TextContent(type="text", text=json_dumps_str({"status": "completed"})) ]
         if isinstance(state.output, (dict, list)):
-            return [ TextContent(type="text", text=json.dumps(state.output)) ]
+            return [ TextContent(type="text", text=json_dumps_str(state.output)) ]
         return [ TextContent(type="text", text=str(state.output)) ]
 
     async def _build_output_value(self, state: TaskState, workflow: WorkflowSchema) -> List[ContentBlock]:
@@ -167,7 +168,7 @@ class McpServerControllerAdapterService(ControllerAdapterService):
             else:
                 for variable in workflow.output:
                     if isinstance(variable, WorkflowVariableGroupConfig):
-                        output.append(TextContent(type="text", text=json.dumps(state.output[variable.name], default=str)))
+                        output.append(TextContent(type="text", text=json_dumps_str(state.output[variable.name])))
                     else:
                         output.append(await self._convert_output_value(state.task_id, state.output[variable.name], variable.name, variable.type, variable.subtype, variable.format))
 
@@ -225,7 +226,7 @@ class McpServerControllerAdapterService(ControllerAdapterService):
             )
 
         if isinstance(value, (dict, list)):
-            return TextContent(type="text", text=json.dumps(value))
+            return TextContent(type="text", text=json_dumps_str(value))
 
         return TextContent(type="text", text=str(value))
 
@@ -5,6 +5,7 @@ from typing import Type, Dict, Optional, Any
 from mindor.dsl.schema.controller import QueueSubscriberDriver
 from mindor.dsl.schema.controller.adapter.impl.queue_subscriber.impl.common import CommonQueueSubscriberControllerAdapterConfig
 from mindor.core.foundation import AsyncService
+from mindor.core.controller.base import TaskState, TaskStatus
 
 if TYPE_CHECKING:
     from mindor.core.controller.base import ControllerService
@@ -21,6 +22,32 @@ class CommonQueueSubscriberControllerAdapterService(AsyncService):
         self.config = config
         self.controller = controller
 
+    def _workflow_id_from_queue_key(self, queue_key: str) -> str:
+        prefix = self.config.name + ":"
+
+        if queue_key.startswith(prefix):
+            return queue_key[len(prefix):]
+
+        return queue_key
+
+    def _get_task_output(self, state: TaskState) -> Optional[Dict[str, Any]]:
+        if state.status == TaskStatus.INTERRUPTED and state.interrupt:
+            return { "interrupt": {
+                "job_id": state.interrupt.job_id,
+                "run_id": state.interrupt.run_id,
+                "phase": state.interrupt.phase,
+                "message": state.interrupt.message,
+                "metadata": state.interrupt.metadata,
+            }}
+
+        if state.status == TaskStatus.FAILED:
+            return { "error": state.error }
+
+        if state.status == TaskStatus.COMPLETED:
+            return { "output": state.output }
+
+        return None
+
 def register_queue_subscriber_controller_adapter_service(driver: QueueSubscriberDriver):
     def decorator(cls: Type[CommonQueueSubscriberControllerAdapterService]) -> Type[CommonQueueSubscriberControllerAdapterService]:
         QueueSubscriberControllerAdapterServiceRegistry[driver] = cls
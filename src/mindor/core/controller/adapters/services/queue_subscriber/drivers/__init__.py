@@ -1 +1,2 @@
 from .redis import *
+from .sqlite import *
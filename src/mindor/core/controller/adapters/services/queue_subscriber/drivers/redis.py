@@ -1,21 +1,25 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Tuple, Deque, Any
 from collections.abc import AsyncIterator
+from collections import deque
 from mindor.core.foundation.streaming.iterators import StreamIterator
-from mindor.dsl.schema.controller import RedisQueueSubscriberControllerAdapterConfig, QueueSubscriberDriver
+from mindor.dsl.schema.controller import RedisQueueSubscriberControllerAdapterConfig, QueueSubscriberDriver, RedisQueueMode
 from mindor.core.controller.base import TaskState, TaskStatus
 from mindor.core.controller.queue.serialize import deserialize_input
 from mindor.core.controller.queue.errors import BlobNotFoundError, BlobCorruptedError, BlobUnauthorizedError
 from mindor.core.foundation.variable.time import parse_time
 from mindor.core.logger import logging
 from ..base import CommonQueueSubscriberControllerAdapterService, register_queue_subscriber_controller_adapter_service
-import asyncio, json, ulid
+from mindor.core.utils.json import json_dumps_str, json_loads
+import asyncio, ulid
 
 if TYPE_CHECKING:
     from mindor.core.controller.base import ControllerService
 
+StreamEntry = Tuple[str, str, Optional[Dict[bytes, bytes]]]
+
 @register_queue_subscriber_controller_adapter_service(QueueSubscriberDriver.REDIS)
 class RedisCommonQueueSubscriberControllerAdapterService(CommonQueueSubscriberControllerAdapterService):
     def __init__(
@@ -31,6 +35,8 @@ class RedisCommonQueueSubscriberControllerAdapterService(CommonQueueSubscriberCo
         self._stop_event: asyncio.Event = asyncio.Event()
         self._worker_id: str = config.worker_id or ulid.ulid()
         self._active_task_ids: set[str] = set()
+        self._stream_tasks: Dict[str, Tuple[str, asyncio.Task]] = {}
+        self._stream_backlog: Deque[StreamEntry] = deque()
 
     def _get_setup_requirements(self):
         return [ "redis>=5.0.0" ]
@@ -47,13 +53,16 @@ class RedisCommonQueueSubscriberControllerAdapterService(CommonQueueSubscriberCo
 
         workflows = self.config.workflows or list(self.controller.workflow_schemas.keys())
         queue_keys = [ f"{self.config.name}:{workflow_id}" for workflow_id in workflows ]
-        logging.info("Queue subscriber started: %s (queues: %s, workers: %d)", self._build_redis_url(), ", ".join(queue_keys), self.config.max_concurrent_count)
+        logging.info("Queue subscriber started: %s (queues: %s, workers: %d, mode: %s)", self._build_redis_url(), ", ".join(queue_keys), self.config.max_concurrent_count, self.config.mode.value)
 
         self._workers.append(asyncio.create_task(self._cancel_listener_loop()))
 
-        for index in range(self.config.max_concurrent_count):
-            task = asyncio.create_task(self._consumer_loop(index, queue_keys))
-            self._workers.append(task)
+        if self.config.mode == RedisQueueMode.STREAM:
+            self._workers.append(asyncio.create_task(self._stream_consumer_loop(queue_keys)))
+        else:
+            for index in range(self.config.max_concurrent_count):
+                task = asyncio.create_task(self._consumer_loop(index, queue_keys))
+                self._workers.append(task)
 
         try:
             await asyncio.gather(*self._workers, return_exceptions=True)
@@ -79,8 +88,8 @@ class RedisCommonQueueSubscriberControllerAdapterService(CommonQueueSubscriberCo
                 workflow_id = self._workflow_id_from_queue_key(queue_key.decode("utf-8"))
 
                 try:
-                    message = json.loads(raw_message)
-                except json.JSONDecodeError:
+                    message = json_loads(raw_message)
+                except ValueError:
                     continue
 
                 await self._handle_workflow_task(workflow_id, message)
@@ -90,6 +99,181 @@ class RedisCommonQueueSubscriberControllerAdapterService(CommonQueueSubscriberCo
             except Exception:
                 await asyncio.sleep(1)
 
+    async def _stream_consumer_loop(self, queue_keys: list[str]) -> None:
+        block_ms = max(int(parse_time(self.config.pop_timeout) * 1000), 1)
+        claim_interval = parse_time(self.config.claim_interval)
+        loop = asyncio.get_running_loop()
+        last_claimed_at: Optional[float] = None
+
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    await self._create_consumer_groups(queue_keys)
+                    break
+                except asyncio.CancelledError:
+                    return
+                except Exception as e:
+                    logging.warning("Failed to create consumer group '%s': %s", self.config.consumer_group, e)
+                    await asyncio.sleep(1)
+
+            while not self._stop_event.is_set():
+                try:
+                    if last_claimed_at is None or loop.time() - last_claimed_at >= claim_interval:
+                        await self._refresh_stream_entries()
+                        self._stream_backlog.extend(await self._claim_stream_entries(queue_keys))
+                        last_claimed_at = loop.time()
+
+                    free_count = self.config.max_concurrent_count - len(self._stream_tasks)
+
+                    if free_count <= 0:
+                        tasks = [ task for _, task in self._stream_tasks.values() ]
+                        await asyncio.wait(tasks, timeout=block_ms / 1000, return_when=asyncio.FIRST_COMPLETED)
+                        continue
+
+                    if not self._stream_backlog:
+                        self._stream_backlog.extend(await self._read_stream_entries(queue_keys, free_count, block_ms))
+
+                    while self._stream_backlog and len(self._stream_tasks) < self.config.max_concurrent_count:
+                        self._start_stream_task(*self._stream_backlog.popleft())
+
+                except asyncio.CancelledError:
+                    break
+                except Exception:
+                    await asyncio.sleep(1)
+        finally:
+            # Unacknowledged entries stay pending in the group and are reclaimed by other workers.
+            for _, task in self._stream_tasks.values():
+                task.cancel()
+            self._stream_tasks.clear()
+            self._stream_backlog.clear()
+
+    async def _create_consumer_groups(self, queue_keys: list[str]) -> None:
+        from redis.exceptions import ResponseError
+
+        for queue_key in queue_keys:
+            try:
+                await self._client.xgroup_create(queue_key, self.config.consumer_group, id="0", mkstream=True)
+            except ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+    async def _read_stream_entries(self, queue_keys: list[str], count: int, block_ms: int) -> List[StreamEntry]:
+        response = await self._client.xreadgroup(
+            self.config.consumer_group,
+            self._worker_id,
+            { queue_key: ">" for queue_key in queue_keys },
+            count=count,
+            block=block_ms
+        )
+        entries: List[StreamEntry] = []
+
+        for queue_key, stream_entries in response or []:
+            for entry_id, fields in stream_entries:
+                entries.append((self._decode(queue_key), self._decode(entry_id), fields))
+
+        return entries
+
+    async def _claim_stream_entries(self, queue_keys: list[str]) -> List[StreamEntry]:
+        min_idle_time = int(parse_time(self.config.claim_idle_time) * 1000)
+        count = max(self.config.max_concurrent_count - len(self._stream_tasks) - len(self._stream_backlog), 0)
+        entries: List[StreamEntry] = []
+
+        for queue_key in queue_keys:
+            if len(entries) >= count:
+                break
+
+            response = await self._client.xautoclaim(
+                queue_key,
+                self.config.consumer_group,
+                self._worker_id,
+                min_idle_time=min_idle_time,
+                start_id="0-0",
+                count=count - len(entries)
+            )
+
+            for entry_id, fields in response[1]:
+                entry_id = self._decode(entry_id)
+                if entry_id in self._stream_tasks or any(entry_id == backlog_id for _, backlog_id, _ in self._stream_backlog):
+                    continue
+
+                # Every claim counts as a delivery, so an entry that keeps failing or
+                # crashing its worker is given up on instead of being retried forever.
+                delivery_count = await self._get_delivery_count(queue_key, entry_id)
+
+                if delivery_count > self.config.max_deliveries:
+                    await self._dead_letter_stream_entry(queue_key, entry_id, fields, delivery_count)
+                    continue
+
+                entries.append((queue_key, entry_id, fields))
+
+        if entries:
+            logging.info("Reclaimed %d stale queue entries", len(entries))
+
+        return entries
+
+    async def _get_delivery_count(self, queue_key: str, entry_id: str) -> int:
+        pending = await self._client.xpending_range(queue_key, self.config.consumer_group, min=entry_id, max=entry_id, count=1)
+
+        return pending[0]["times_delivered"] if pending else 0
+
+    async def _dead_letter_stream_entry(self, queue_key: str, entry_id: str, fields: Optional[Dict[bytes, bytes]], delivery_count: int) -> None:
+        logging.warning("Queue entry %s on %s was delivered %d times; moving it to %s:dead", entry_id, queue_key, delivery_count, queue_key)
+        message = self._parse_stream_message(fields)
+
+        if message is not None:
+            error = f"Task abandoned after {delivery_count} deliveries (max_deliveries={self.config.max_deliveries})"
+            state = TaskState(task_id=message.get("task_id"), status=TaskStatus.FAILED, error=error)
+            await self._publish_result(self._workflow_id_from_queue_key(queue_key), message.get("task_id"), message.get("run_id"), state)
+
+        async with self._client.pipeline(transaction=False) as pipeline:
+            pipeline.xadd(f"{queue_key}:dead", { **(fields or {}), b"entry_id": entry_id, b"deliveries": delivery_count })
+            pipeline.xack(queue_key, self.config.consumer_group, entry_id)
+            pipeline.xdel(queue_key, entry_id)
+            await pipeline.execute()
+
+    async def _refresh_stream_entries(self) -> None:
+        # Resets the idle time of entries this worker still owns so that other
+        # workers do not reclaim long-running tasks.
+        entry_ids: Dict[str, List[str]] = {}
+        owned_entries = [ (queue_key, entry_id) for entry_id, (queue_key, _) in self._stream_tasks.items() ]
+        owned_entries.extend((queue_key, entry_id) for queue_key, entry_id, _ in self._stream_backlog)
+
+        for queue_key, entry_id in owned_entries:
+            entry_ids.setdefault(queue_key, []).append(entry_id)
+
+        for queue_key, ids in entry_ids.items():
+            await self._client.xclaim(queue_key, self.config.consumer_group, self._worker_id, min_idle_time=0, message_ids=ids, justid=True)
+
+    def _start_stream_task(self, queue_key: str, entry_id: str, fields: Optional[Dict[bytes, bytes]]) -> None:
+        task = asyncio.create_task(self._handle_stream_entry(queue_key, entry_id, fields))
+        task.add_done_callback(lambda _: self._stream_tasks.pop(entry_id, None))
+        self._stream_tasks[entry_id] = (queue_key, task)
+
+    async def _handle_stream_entry(self, queue_key: str, entry_id: str, fields: Optional[Dict[bytes, bytes]]) -> None:
+        message = self._parse_stream_message(fields)
+
+        try:
+            if message is not None:
+                await self._handle_workflow_task(self._workflow_id_from_queue_key(queue_key), message)
+
+            async with self._client.pipeline(transaction=False) as pipeline:
+                pipeline.xack(queue_key, self.config.consumer_group, entry_id)
+                pipeline.xdel(queue_key, entry_id)
+                await pipeline.execute()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.warning("Failed to process queue entry %s on %s; leaving it pending: %s", entry_id, queue_key, e)
+
+    def _parse_stream_message(self, fields: Optional[Dict[bytes, bytes]]) -> Optional[Dict[str, Any]]:
+        if fields is None:
+            return None
+
+        try:
+            return json_loads(fields.get(b"message", b""))
+        except ValueError:
+            return None
+
     async def _handle_workflow_task(self, workflow_id: str, message: Dict[str, Any]) -> None:
         task_id = message.get("task_id")
         run_id  = message.get("run_id")
@@ -146,8 +330,8 @@ class RedisCommonQueueSubscriberControllerAdapterService(CommonQueueSubscriberCo
                 if message["type"] != "message":
                     continue
                 try:
-                    data = json.loads(message["data"])
-                except (json.JSONDecodeError, TypeError):
+                    data = json_loads(message["data"])
+                except (ValueError, TypeError):
                     continue
                 task_id = data.get("task_id")
                 if not task_id or task_id not in self._active_task_ids:
@@ -168,19 +352,19 @@ class RedisCommonQueueSubscriberControllerAdapterService(CommonQueueSubscriberCo
     async def _read_resume(self, pubsub) -> Any:
         async for message in pubsub.listen():
             if message["type"] == "message":
-                data = json.loads(message["data"])
+                data = json_loads(message["data"])
                 return data.get("answer")
 
     async def _publish_result(self, workflow_id: str, task_id: str, run_id: str, state: TaskState) -> None:
         result_key = f"{self.config.name}:{workflow_id}:{run_id}"
 
-        result = json.dumps({
+        result = json_dumps_str({
             "task_id": task_id,
             "run_id": run_id,
             "status": state.status.value,
             "worker_id": self._worker_id,
             **(self._get_task_output(state) or {}),
-        }, default=str)
+        })
 
         result_ttl = int(parse_time(self.config.result_ttl))
 
@@ -196,7 +380,7 @@ class RedisCommonQueueSubscriberControllerAdapterService(CommonQueueSubscriberCo
         stream_key = f"{result_key}:stream"
         result_ttl = int(parse_time(self.config.result_ttl))
 
-        result = json.dumps({
+        result = json_dumps_str({
             "task_id": task_id,
             "run_id": run_id,
             "status": "streaming",
@@ -207,7 +391,7 @@ class RedisCommonQueueSubscriberControllerAdapterService(CommonQueueSubscriberCo
 
         try:
             async for chunk in state.output:
-                data = chunk if isinstance(chunk, str) else json.dumps(chunk, default=str, ensure_ascii=False)
+                data = chunk if isinstance(chunk, str) else json_dumps_str(chunk)
                 await self._client.xadd(stream_key, { "event": "chunk", "data": data })
 
             await self._client.xadd(stream_key, { "event": "done" })
@@ -227,28 +411,5 @@ class RedisCommonQueueSubscriberControllerAdapterService(CommonQueueSubscriberCo
 
         return self.config.url
 
-    def _workflow_id_from_queue_key(self, queue_key: str) -> str:
-        prefix = self.config.name + ":"
-
-        if queue_key.startswith(prefix):
-            return queue_key[len(prefix):]
-
-        return queue_key
-
-    def _get_task_output(self, state: TaskState) -> Optional[Dict[str, Any]]:
-        if state.status == TaskStatus.INTERRUPTED and state.interrupt:
-            return { "interrupt": {
-                "job_id": state.interrupt.job_id,
-                "run_id": state.interrupt.run_id,
-                "phase": state.interrupt.phase,
-                "message": state.interrupt.message,
-                "metadata": state.interrupt.metadata,
-            }}
-
-        if state.status == TaskStatus.FAILED:
-            return { "error": state.error }
-
-        if state.status == TaskStatus.COMPLETED:
-            return { "output": state.output }
-
-        return None
+    def _decode(self, value: Any) -> str:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
@@ -0,0 +1,263 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from typing import Optional, Dict, List, Tuple, Any
+from collections.abc import AsyncIterator
+from mindor.core.foundation.streaming.iterators import StreamIterator
+from mindor.dsl.schema.controller import SqliteQueueSubscriberControllerAdapterConfig, QueueSubscriberDriver
+from mindor.core.controller.base import TaskState, TaskStatus
+from mindor.core.controller.queue.serialize import deserialize_input
+from mindor.core.controller.queue.store import SqliteQueueStore, FileBlobClient
+from mindor.core.controller.queue.errors import BlobNotFoundError, BlobCorruptedError, BlobUnauthorizedError
+from mindor.core.foundation.variable.time import parse_time
+from mindor.core.logger import logging
+from ..base import CommonQueueSubscriberControllerAdapterService, register_queue_subscriber_controller_adapter_service
+from mindor.core.utils.json import json_dumps_str, json_loads
+import asyncio, time, ulid
+
+if TYPE_CHECKING:
+    from mindor.core.controller.base import ControllerService
+
+@register_queue_subscriber_controller_adapter_service(QueueSubscriberDriver.SQLITE)
+class SqliteCommonQueueSubscriberControllerAdapterService(CommonQueueSubscriberControllerAdapterService):
+    def __init__(
+        self,
+        config: SqliteQueueSubscriberControllerAdapterConfig,
+        controller: ControllerService,
+        daemon: bool
+    ):
+        super().__init__(config, controller, daemon)
+
+        self._store: Optional[SqliteQueueStore] = None
+        self._blobs: Optional[FileBlobClient] = None
+        self._workers: List[asyncio.Task] = []
+        self._stop_event: asyncio.Event = asyncio.Event()
+        self._worker_id: str = config.worker_id or ulid.ulid()
+        self._active_task_ids: set[str] = set()
+        self._entry_tasks: Dict[int, asyncio.Task] = {}
+        self._poll_interval: float = parse_time(config.poll_interval)
+
+    def _get_setup_requirements(self):
+        return [ "aiosqlite" ]
+
+    async def _serve(self) -> None:
+        self._store = SqliteQueueStore(self.config.path)
+        await self._store.open()
+
+        self._blobs = FileBlobClient(self.config.blob_dir or f"{self.config.path}.blobs")
+        self._blobs.ensure_directory()
+
+        workflows = self.config.workflows or list(self.controller.workflow_schemas.keys())
+        queue_keys = [ f"{self.config.name}:{workflow_id}" for workflow_id in workflows ]
+        logging.info("Queue subscriber started: %s (queues: %s, workers: %d)", self.config.path, ", ".join(queue_keys), self.config.max_concurrent_count)
+
+        self._workers.append(asyncio.create_task(self._cancel_listener_loop()))
+        self._workers.append(asyncio.create_task(self._consumer_loop(queue_keys)))
+
+        try:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        finally:
+            await self._store.close()
+            self._store = None
+
+    async def _shutdown(self) -> None:
+        self._stop_event.set()
+        for worker in self._workers:
+            worker.cancel()
+        self._workers.clear()
+
+    async def _consumer_loop(self, queue_keys: list[str]) -> None:
+        claim_idle_time = parse_time(self.config.claim_idle_time)
+        claim_interval = parse_time(self.config.claim_interval)
+        result_ttl = parse_time(self.config.result_ttl)
+        loop = asyncio.get_running_loop()
+        last_claimed_at: Optional[float] = None
+
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    if last_claimed_at is None or loop.time() - last_claimed_at >= claim_interval:
+                        await self._store.touch(list(self._entry_tasks.keys()), self._worker_id)
+                        if result_ttl > 0:
+                            await self._store.purge_messages(time.time() - result_ttl)
+                        await self._blobs.purge()
+                        last_claimed_at = loop.time()
+
+                    free_count = self.config.max_concurrent_count - len(self._entry_tasks)
+
+                    if free_count <= 0:
+                        await asyncio.wait(list(self._entry_tasks.values()), timeout=claim_interval, return_when=asyncio.FIRST_COMPLETED)
+                        continue
+
+                    entries = await self._store.claim(queue_keys, self._worker_id, free_count, time.time() - claim_idle_time)
+
+                    if not entries:
+                        await asyncio.sleep(self._poll_interval)
+                        continue
+
+                    for entry_id, queue_key, raw_message, delivery_count in entries:
+                        # A task that keeps failing or crashing its worker is given up on instead of being retried forever.
+                        if delivery_count > self.config.max_deliveries:
+                            await self._dead_letter_entry(entry_id, queue_key, raw_message, delivery_count)
+                            continue
+
+                        self._start_entry_task(entry_id, queue_key, raw_message)
+
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logging.warning("Queue consumer loop error: %s", e)
+                    await asyncio.sleep(1)
+        finally:
+            # Unacknowledged tasks keep their owner and are reclaimed by other workers once stale.
+            for task in self._entry_tasks.values():
+                task.cancel()
+            self._entry_tasks.clear()
+
+    def _start_entry_task(self, entry_id: int, queue_key: str, raw_message: str) -> None:
+        task = asyncio.create_task(self._handle_entry(entry_id, queue_key, raw_message))
+        task.add_done_callback(lambda _: self._entry_tasks.pop(entry_id, None))
+        self._entry_tasks[entry_id] = task
+
+    async def _dead_letter_entry(self, entry_id: int, queue_key: str, raw_message: str, delivery_count: int) -> None:
+        logging.warning("Queue entry %d on %s was delivered %d times; moving it to the dead task table", entry_id, queue_key, delivery_count)
+        message = self._parse_message(raw_message)
+        error = f"Task abandoned after {delivery_count} deliveries (max_deliveries={self.config.max_deliveries})"
+
+        if message is not None:
+            state = TaskState(task_id=message.get("task_id"), status=TaskStatus.FAILED, error=error)
+            await self._publish_result(self._workflow_id_from_queue_key(queue_key), message.get("task_id"), message.get("run_id"), state)
+
+        await self._store.bury(entry_id, error)
+
+    async def _handle_entry(self, entry_id: int, queue_key: str, raw_message: str) -> None:
+        message = self._parse_message(raw_message)
+
+        try:
+            if message is not None:
+                await self._handle_workflow_task(self._workflow_id_from_queue_key(queue_key), message)
+
+            await self._store.ack(entry_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.warning("Failed to process queue entry %d on %s; leaving it claimed: %s", entry_id, queue_key, e)
+
+    def _parse_message(self, raw_message: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json_loads(raw_message)
+        except ValueError:
+            return None
+
+    async def _handle_workflow_task(self, workflow_id: str, message: Dict[str, Any]) -> None:
+        task_id = message.get("task_id")
+        run_id  = message.get("run_id")
+        input   = message.get("input", {})
+        result_key  = f"{self.config.name}:{workflow_id}:{run_id}"
+        resume_key  = f"{result_key}:resume"
+        blob_prefix = f"{self.config.name}:{workflow_id}:{run_id}:blob:"
+
+        try:
+            input = await deserialize_input(input, self._blobs, blob_prefix)
+        except (BlobNotFoundError, BlobCorruptedError, BlobUnauthorizedError) as e:
+            state = TaskState(task_id=task_id, status=TaskStatus.FAILED, error=str(e))
+            await self._publish_result(workflow_id, task_id, run_id, state)
+            return
+
+        async def _on_interrupt(interrupt):
+            state = TaskState(task_id=task_id, status=TaskStatus.INTERRUPTED, interrupt=interrupt)
+            await self._publish_result(workflow_id, task_id, run_id, state)
+            return await self._read_resume(resume_key)
+
+        self._active_task_ids.add(task_id)
+        try:
+            state = await self.controller.run_workflow(
+                workflow_id,
+                input,
+                task_id=task_id,
+                wait_for_completion=True,
+                on_interrupt=_on_interrupt
+            )
+        except Exception as e:
+            state = TaskState(task_id=task_id, status=TaskStatus.FAILED, error=str(e))
+        finally:
+            self._active_task_ids.discard(task_id)
+
+        if state.status == TaskStatus.COMPLETED and isinstance(state.output, (StreamIterator, AsyncIterator)):
+            await self._publish_stream_result(workflow_id, task_id, run_id, state)
+        else:
+            await self._publish_result(workflow_id, task_id, run_id, state)
+
+    async def _cancel_listener_loop(self) -> None:
+        cancel_key = f"{self.config.name}:cancel"
+        try:
+            last_id = await self._store.get_last_message_id()
+            while not self._stop_event.is_set():
+                messages = await self._store.fetch(cancel_key, last_id)
+
+                if not messages:
+                    await asyncio.sleep(self._poll_interval)
+                    continue
+
+                for message_id, raw_message in messages:
+                    last_id = message_id
+                    try:
+                        data = json_loads(raw_message)
+                    except (ValueError, TypeError):
+                        continue
+                    task_id = data.get("task_id")
+                    if not task_id or task_id not in self._active_task_ids:
+                        continue
+                    try:
+                        await self.controller.cancel_workflow(task_id, wait_for_completion=False)
+                    except Exception as e:
+                        logging.warning("Failed to cancel task %s: %s", task_id, e)
+        except asyncio.CancelledError:
+            pass
+
+    async def _read_resume(self, resume_key: str) -> Any:
+        while True:
+            messages = await self._store.pop(resume_key)
+
+            if messages:
+                return json_loads(messages[0]).get("answer")
+
+            await asyncio.sleep(self._poll_interval)
+
+    async def _publish_result(self, workflow_id: str, task_id: str, run_id: str, state: TaskState) -> None:
+        result_key = f"{self.config.name}:{workflow_id}:{run_id}"
+
+        result = json_dumps_str({
+            "task_id": task_id,
+            "run_id": run_id,
+            "status": state.status.value,
+            "worker_id": self._worker_id,
+            **(self._get_task_output(state) or {}),
+        })
+
+        await self._store.publish(result_key, result)
+
+    async def _publish_stream_result(self, workflow_id: str, task_id: str, run_id: str, state: TaskState) -> None:
+        result_key = f"{self.config.name}:{workflow_id}:{run_id}"
+        stream_key = f"{result_key}:stream"
+
+        result = json_dumps_str({
+            "task_id": task_id,
+            "run_id": run_id,
+            "status": "streaming",
+            "worker_id": self._worker_id,
+            "stream_key": stream_key,
+        })
+        await self._store.publish(result_key, result)
+
+        try:
+            async for chunk in state.output:
+                data = chunk if isinstance(chunk, str) else json_dumps_str(chunk)
+                await self._store.publish(stream_key, json_dumps_str({ "event": "chunk", "data": data }))
+
+            await self._store.publish(stream_key, json_dumps_str({ "event": "done" }))
+        except Exception as e:
+            await self._store.publish(stream_key, json_dumps_str({ "event": "error", "data": str(e) }))
+        finally:
+            if hasattr(state.output, 'aclose'):
+                await state.output.aclose()
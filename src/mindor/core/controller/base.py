@@ -5,7 +5,7 @@ from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Annotated,
 from collections.abc import AsyncIterator
 from enum import Enum
 from dataclasses import dataclass
-from mindor.dsl.schema.controller import ControllerConfig
+from mindor.dsl.schema.controller import ControllerConfig, ControllerAdapterType, AdmissionFairShareKey
 from mindor.dsl.schema.component import ComponentConfig
 from mindor.dsl.schema.listener import ListenerConfig
 from mindor.dsl.schema.gateway import GatewayConfig
@@ -16,7 +16,7 @@ from mindor.dsl.schema.tracer import TracerConfig
 from mindor.dsl.schema.logger import LoggerConfig, LoggerType, ConsoleLoggerConfig
 from mindor.core.foundation import AsyncService
 from mindor.core.controller.adapters import create_controller_adapter
-from mindor.core.component import ComponentService, ComponentGlobalConfigs, create_component
+from mindor.core.component import ComponentService, ComponentGlobalConfigs, ComponentResolver, create_component
 from mindor.core.listener import ListenerService, create_listener
 from mindor.core.gateway import GatewayService, create_gateway
 from mindor.core.system import SystemService, create_system
@@ -34,16 +34,20 @@ from mindor.core.controller.errors import (
     JobIdMismatchError,
     InterruptNotActiveError,
 )
-from mindor.core.errors import ShutdownError
+from mindor.core.errors import ShutdownError, NotReadyError
 from mindor.core.utils.work_queue import WorkQueue
+from mindor.core.utils.admission_queue import AdmissionWorkQueue
 from mindor.core.utils.caching import ExpiringDict
 from mindor.core.foundation.variable.time import parse_time
 from mindor.core.foundation.streaming.resources import StreamResource
-from mindor.core.foundation.streaming.iterators import StreamIterator, StreamChunkIterator
+from mindor.core.foundation.streaming.iterators import StreamIterator, StreamChunkIterator, attach_terminated_callback
 from mindor.core.foundation.variable.atomic import AtomicDict, AtomicList
 from mindor.core.foundation.cancellation import CancellationToken
 from mindor.core.utils.event_dispatcher import EventDispatcher
-from .streaming import TaskOutputStreamIterator, TaskOutputStreamResource
+from mindor.core.utils.startup_profiler import startup_profiler
+from .streaming import TaskOutputStreamResource
+from .startup import ComponentStartupScheduler
+from .workers import ControllerWorkerContext
 from .runtime.base.specs import ControllerRuntimeSpecs
 from .runtime.native import ControllerNativeRuntimeManager
 from .runtime.docker import ControllerDockerRuntimeManager
@@ -177,6 +181,7 @@ class ControllerService(AsyncService):
         self.interrupt_handlers: Dict[str, InterruptHandler] = {}
         self.cancellation_tokens: Dict[str, CancellationToken] = {}
         self.task_events: Dict[str, asyncio.Event] = {}
+        self.worker_context: Optional[ControllerWorkerContext] = ControllerWorkerContext.from_env()
         self._queue: Optional[ControllerQueueService] = None
         self._inflight_tasks: Dict[str, asyncio.Task] = {}
         self._shutdown_pending: bool = False
@@ -189,9 +194,12 @@ class ControllerService(AsyncService):
         self._task_previous_status: Dict[str, TaskStatus] = {}
         self._event_dispatcher: EventDispatcher = EventDispatcher()
         self._output_renderer: TaskOutputRenderer = TaskOutputRenderer()
+        self._component_startup: Optional[ComponentStartupScheduler] = None
+        self._component_startup_task: Optional[asyncio.Task] = None
+        self._workflow_component_ids: Dict[str, List[str]] = {}
 
         if self.config.max_concurrent_count > 0:
-            self.task_queue = WorkQueue(self.config.max_concurrent_count, self._run_workflow)
+            self.task_queue = self._create_task_queue()
 
         if self.config.queue:
             from mindor.core.controller.queue import ControllerQueueService
@@ -305,6 +313,10 @@ class ControllerService(AsyncService):
     def is_shutting_down(self) -> bool:
         return self._shutting_down
 
+    @property
+    def is_worker_replica(self) -> bool:
+        return self.worker_context is not None and not self.worker_context.is_primary
+
     async def run_workflow(
         self,
         workflow_id: str,
@@ -320,6 +332,14 @@ class ControllerService(AsyncService):
         if self._shutting_down:
             raise ShutdownError("Service is shutting down")
 
+        if self._component_startup:
+            pending_component_ids = [ id for id in self._get_workflow_component_ids(workflow_id) if not self._component_startup.is_ready(id) ]
+            failed_component_ids = [ id for id in pending_component_ids if self._component_startup.is_failed(id) ]
+            if failed_component_ids:
+                raise NotReadyError(f"Workflow '{workflow_id}' is unavailable because components failed to start: {', '.join(failed_component_ids)}")
+            if pending_component_ids:
+                raise NotReadyError(f"Workflow '{workflow_id}' is waiting for components to start: {', '.join(pending_component_ids)}")
+
         task_id = task_id or ulid.ulid()
         state = TaskState(
             task_id=task_id,
@@ -337,7 +357,7 @@ class ControllerService(AsyncService):
 
         try:
             if self.task_queue:
-                future = await self.task_queue.schedule(task_id, workflow_id, input, on_interrupt, session_id, metadata)
+                future = await self.task_queue.schedule(task_id, workflow_id, input, on_interrupt, session_id, metadata, **self._get_admission_params(workflow_id, session_id, metadata))
                 task = asyncio.ensure_future(future)
             else:
                 task = asyncio.create_task(self._run_workflow(task_id, workflow_id, input, on_interrupt, session_id, metadata))
@@ -514,11 +534,64 @@ class ControllerService(AsyncService):
         with self.task_states_lock:
             return self.task_states.get(task_id)
 
+    def get_metrics(self) -> Dict[str, Any]:
+        metrics: Dict[str, Any] = {}
+
+        if isinstance(self.task_queue, AdmissionWorkQueue):
+            metrics["task_queue"] = self.task_queue.get_stats()
+
+        if self._component_startup:
+            metrics["components"] = self._component_startup.get_stats()
+
+        return metrics
+
+    @property
+    def is_starting(self) -> bool:
+        return self._component_startup is not None and not self._component_startup.is_complete
+
+    @property
+    def is_degraded(self) -> bool:
+        return self._component_startup is not None and bool(self._component_startup.failed_component_ids)
+
     def is_workflow_available(self, workflow_id: str) -> bool:
         if workflow_id in self.workflow_schemas or self._queue:
             return True
         return False
 
+    def _create_task_queue(self) -> WorkQueue:
+        admission = self.config.admission
+
+        if admission:
+            queue_timeout = parse_time(admission.queue_timeout)
+            return AdmissionWorkQueue(
+                self.config.max_concurrent_count,
+                self._run_workflow,
+                max_queue_size=admission.max_queue_size,
+                queue_timeout=queue_timeout if queue_timeout > 0 else None
+            )
+
+        return WorkQueue(self.config.max_concurrent_count, self._run_workflow)
+
+    def _get_admission_params(self, workflow_id: str, session_id: Optional[str], metadata: Optional[Any]) -> Dict[str, Any]:
+        admission = self.config.admission
+
+        if not admission:
+            return {}
+
+        priority = 0
+        if admission.priority_key and isinstance(metadata, dict):
+            try:
+                priority = int(metadata.get(admission.priority_key) or 0)
+            except (TypeError, ValueError):
+                pass
+
+        group = tuple(
+            workflow_id if key == AdmissionFairShareKey.WORKFLOW else session_id
+            for key in admission.fair_share_by
+        )
+
+        return { "priority": priority, "group": group }
+
     async def _start(self) -> None:
         if self.task_queue:
             await self.task_queue.start()
@@ -526,21 +599,41 @@ class ControllerService(AsyncService):
         if self._queue:
             await self._queue.start()
 
-        await self._setup_tracers()
-        await self._start_tracers()
+        with startup_profiler.measure("setup", "tracers"):
+            await self._setup_tracers()
+            await self._start_tracers()
 
         if self.daemon:
-            await self._start_systems()
-            await self._start_listeners()
-            await self._start_gateways()
-            await self._start_components()
-            await self._start_adapters()
-
-            if self.config.webui:
-                await self._setup_webui()
-                await self._start_webui()
+            if not self.worker_context:
+                self.worker_context = self._create_worker_context()
+
+            with startup_profiler.measure("setup", "systems"):
+                await self._start_systems()
+            if not self.is_worker_replica:
+                with startup_profiler.measure("setup", "listeners"):
+                    await self._start_listeners()
+                with startup_profiler.measure("setup", "gateways"):
+                    await self._start_gateways()
+            if self.config.startup.serve_partial:
+                self._component_startup_task = asyncio.create_task(self._start_components_in_background())
+            else:
+                with startup_profiler.measure("setup", "components"):
+                    await self._start_components()
+            with startup_profiler.measure("setup", "adapters"):
+                await self._start_adapters()
+
+            if self.config.webui and not self.is_worker_replica:
+                with startup_profiler.measure("setup", "webui"):
+                    await self._setup_webui()
+                    await self._start_webui()
+
+            if self.is_worker_replica:
+                asyncio.create_task(self._watch_primary_process())
+            else:
+                asyncio.create_task(self._watch_stop_request())
 
-            asyncio.create_task(self._watch_stop_request())
+            if not self._component_startup_task:
+                startup_profiler.complete()
 
         await super()._start()
 
@@ -578,12 +671,16 @@ class ControllerService(AsyncService):
 
         if self.daemon:
             await self._stop_adapters()
+            if self._component_startup_task and not self._component_startup_task.done():
+                self._component_startup_task.cancel()
+                await asyncio.gather(self._component_startup_task, return_exceptions=True)
             await self._stop_components()
-            await self._stop_gateways()
-            await self._stop_listeners()
+            if not self.is_worker_replica:
+                await self._stop_gateways()
+                await self._stop_listeners()
             await self._stop_systems()
 
-            if self.config.webui:
+            if self.config.webui and not self.is_worker_replica:
                 await self._stop_webui()
 
         await super()._stop()
@@ -609,6 +706,15 @@ class ControllerService(AsyncService):
 
         os.unlink(stop_file)
 
+    async def _watch_primary_process(self, interval: float = 1.0) -> None:
+        # Replicas are re-parented once the primary worker exits without stopping them.
+        while self.started:
+            if os.getppid() != self.worker_context.parent_pid:
+                logging.warning("Primary controller worker exited; stopping worker %d", self.worker_context.index)
+                await self.stop()
+                break
+            await asyncio.sleep(interval)
+
     async def _setup_systems(self) -> None:
         await asyncio.gather(*[ system.setup() for system in self._create_systems() ])
 
@@ -652,10 +758,26 @@ class ControllerService(AsyncService):
         await asyncio.gather(*[ component.teardown() for component in self._create_components() ])
 
     async def _start_components(self) -> None:
-        await asyncio.gather(*[ component.start() for component in self._create_components() ])
+        startup = self.config.startup
+        self._component_startup = ComponentStartupScheduler(
+            self._create_components(),
+            max_concurrent_count=startup.max_concurrent_count,
+            ram_budget=startup.ram_budget,
+            vram_budget=startup.vram_budget
+        )
+        await self._component_startup.run()
+
+    async def _start_components_in_background(self) -> None:
+        try:
+            with startup_profiler.measure("setup", "components"):
+                await self._start_components()
+        except Exception as e:
+            logging.error("Workflows using components that failed to start stay unavailable: %s", e)
+        finally:
+            startup_profiler.complete()
 
     async def _stop_components(self) -> None:
-        await asyncio.gather(*[ component.stop() for component in self._create_components() ])
+        await asyncio.gather(*[ component.stop() for component in self._create_components() if component.started ])
 
     async def _start_loggers(self, verbose: bool = False) -> None:
         await asyncio.gather(*[ logger.start() for logger in self._create_loggers(verbose) ])
@@ -688,7 +810,12 @@ class ControllerService(AsyncService):
         await asyncio.gather(*[ self._create_webui().stop() ])
 
     def _create_adapters(self) -> List[ControllerAdapterService]:
-        return [ create_controller_adapter(config, self, self.daemon) for config in self.config.adapters ]
+        configs = self.config.adapters
+
+        if self.is_worker_replica:
+            configs = [ config for config in configs if config.type == ControllerAdapterType.HTTP_SERVER ]
+
+        return [ create_controller_adapter(config, self, self.daemon) for config in configs ]
 
     def _create_listeners(self) -> List[ListenerService]:
         return [ create_listener(f"listener-{index}", config, self.daemon) for index, config in enumerate(self.listeners) ]
@@ -716,9 +843,33 @@ class ControllerService(AsyncService):
     def _create_loggers(self, verbose: bool = False) -> List[LoggerService]:
         return [ create_logger(f"logger-{index}", config, self.daemon, verbose) for index, config in enumerate(self.loggers or [ self._get_default_logger_config() ]) ]
 
+    def _create_worker_context(self) -> Optional[ControllerWorkerContext]:
+        workers = max([ config.workers for config in self.config.adapters if config.type == ControllerAdapterType.HTTP_SERVER ], default=1)
+
+        if workers > 1:
+            return ControllerWorkerContext.create(workers)
+
+        return None
+
     def _get_runtime_specs(self) -> ControllerRuntimeSpecs:
         return ControllerRuntimeSpecs(self.config, self.components, self.listeners, self.gateways, self.workflows, self.tracers, self.loggers)
 
+    def _get_workflow_component_ids(self, workflow_id: str) -> List[str]:
+        if workflow_id not in self._workflow_component_ids:
+            workflow = next((workflow for workflow in self.workflows if workflow.id == workflow_id), None)
+            component_ids: List[str] = []
+
+            for job in workflow.jobs if workflow else []:
+                component = getattr(job, "component", None) or getattr(getattr(job, "do", None), "component", None)
+                if isinstance(component, str):
+                    component_id, _ = ComponentResolver(self.components).resolve(component, raise_on_error=False)
+                    if component_id and component_id not in component_ids:
+                        component_ids.append(component_id)
+
+            self._workflow_component_ids[workflow_id] = component_ids
+
+        return self._workflow_component_ids[workflow_id]
+
     def _get_component_global_configs(self) -> ComponentGlobalConfigs:
         return ComponentGlobalConfigs.create(self.components, self.listeners, self.gateways, self.workflows)
 
@@ -813,7 +964,7 @@ class ControllerService(AsyncService):
                 if isinstance(output, StreamResource):
                     output = TaskOutputStreamResource(output, _on_stream_terminated)
                 else:
-                    output = TaskOutputStreamIterator(output, _on_stream_terminated)
+                    output = attach_terminated_callback(output, _on_stream_terminated)
 
                 state = TaskState(
                     task_id=task_id,
@@ -2,14 +2,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from typing import Optional, Dict, List, Any
-from mindor.dsl.schema.controller import RedisControllerQueueConfig, ControllerQueueDriver
+from mindor.dsl.schema.controller import RedisControllerQueueConfig, ControllerQueueDriver, RedisQueueMode
 from ..base import CommonControllerQueueService, InterruptCallback, register_controller_queue_service
 from ..serialize import serialize_input
 from mindor.core.utils.compat.asyncio import async_timeout
 from mindor.core.foundation.variable.time import parse_time
 from mindor.core.foundation.variable.size import parse_size
 from mindor.core.logger import logging
-import asyncio, json, ulid
+from mindor.core.utils.json import json_dumps_str, json_loads
+import asyncio, ulid
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
@@ -53,8 +54,8 @@ class RedisStreamIterator:
         if event == "chunk":
             data = fields.get("data", "")
             try:
-                return json.loads(data)
-            except (json.JSONDecodeError, TypeError):
+                return json_loads(data)
+            except (ValueError, TypeError):
                 return data
 
         if event == "done":
@@ -129,7 +130,7 @@ class RedisControllerQueueService(CommonControllerQueueService):
                 ttl_seconds=self._blob_ttl,
                 max_blob_size=self._max_blob_size,
             )
-            message = json.dumps({
+            message = json_dumps_str({
                 "task_id": task_id,
                 "run_id": run_id,
                 "input": serialized_input,
@@ -137,7 +138,7 @@ class RedisControllerQueueService(CommonControllerQueueService):
 
             pubsub = self.client.pubsub()
             await pubsub.subscribe(result_key)
-            await self.client.lpush(queue_key, message)
+            await self._enqueue(queue_key, message)
         except BaseException:
             if blob_keys:
                 try:
@@ -159,7 +160,7 @@ class RedisControllerQueueService(CommonControllerQueueService):
 
                 if status == "interrupted" and on_interrupt:
                     answer = await on_interrupt(result.get("interrupt", {}))
-                    await self.client.publish(resume_key, json.dumps({ "answer": answer }, default=str))
+                    await self.client.publish(resume_key, json_dumps_str({ "answer": answer }))
                     continue
 
                 if status == "streaming":
@@ -179,9 +180,15 @@ class RedisControllerQueueService(CommonControllerQueueService):
             except asyncio.CancelledError:
                 pass
 
+    async def _enqueue(self, queue_key: str, message: str) -> None:
+        if self.config.mode == RedisQueueMode.STREAM:
+            await self.client.xadd(queue_key, { "message": message })
+        else:
+            await self.client.lpush(queue_key, message)
+
     async def _cancel(self, task_id: str) -> None:
         cancel_key = f"{self.config.name}:cancel"
-        await self.client.publish(cancel_key, json.dumps({ "task_id": task_id }))
+        await self.client.publish(cancel_key, json_dumps_str({ "task_id": task_id }))
 
     def _build_redis_url(self) -> str:
         if not self.config.url:
@@ -216,4 +223,4 @@ class RedisControllerQueueService(CommonControllerQueueService):
                 if message["type"] != "message":
                     continue
 
-                return json.loads(message["data"])
+                return json_loads(message["data"])
@@ -0,0 +1,186 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from typing import Optional, Dict, List, Any
+from collections import deque
+from mindor.dsl.schema.controller import SqliteControllerQueueConfig, ControllerQueueDriver
+from ..base import CommonControllerQueueService, InterruptCallback, register_controller_queue_service
+from ..serialize import serialize_input
+from ..store import SqliteQueueStore, FileBlobClient
+from mindor.core.utils.compat.asyncio import async_timeout
+from mindor.core.foundation.variable.time import parse_time
+from mindor.core.foundation.variable.size import parse_size
+from mindor.core.logger import logging
+from mindor.core.utils.json import json_dumps_str, json_loads
+import asyncio, ulid
+
+class SqliteStreamIterator:
+    def __init__(self, store: SqliteQueueStore, stream_key: str, timeout: Optional[float], poll_interval: float):
+        self.store = store
+        self.stream_key = stream_key
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+        self._pending: deque = deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        async with async_timeout(self.timeout):
+            while not self._pending:
+                messages = await self.store.pop(self.stream_key, count=256)
+
+                if not messages:
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+
+                self._pending.extend(messages)
+
+        return self._handle_entry(json_loads(self._pending.popleft()))
+
+    def _handle_entry(self, fields: dict):
+        event = fields.get("event")
+
+        if event == "chunk":
+            data = fields.get("data", "")
+            try:
+                return json_loads(data)
+            except (ValueError, TypeError):
+                return data
+
+        if event == "done":
+            raise StopAsyncIteration
+
+        if event == "error":
+            raise RuntimeError(fields.get("data", "Unknown streaming error"))
+
+@register_controller_queue_service(ControllerQueueDriver.SQLITE)
+class SqliteControllerQueueService(CommonControllerQueueService):
+    def __init__(self, config: SqliteControllerQueueConfig):
+        super().__init__(config)
+
+        self.store: Optional[SqliteQueueStore] = None
+        self.blobs: Optional[FileBlobClient] = None
+
+        self._timeout: Optional[float] = None
+        self._poll_interval: float = 0.0
+        self._blob_ttl: int = 0
+        self._max_blob_size: Optional[int] = None
+
+    def _get_setup_requirements(self):
+        return [ "aiosqlite" ]
+
+    async def _start(self) -> None:
+        self.store = SqliteQueueStore(self.config.path)
+        await self.store.open()
+
+        self.blobs = FileBlobClient(self.config.blob_dir or f"{self.config.path}.blobs")
+        self.blobs.ensure_directory()
+
+        self._timeout = self._resolve_timeout()
+        self._poll_interval = parse_time(self.config.poll_interval)
+        self._blob_ttl = self._resolve_blob_ttl()
+        self._max_blob_size = self._resolve_max_blob_size()
+
+        await super()._start()
+
+    async def _stop(self) -> None:
+        if self.store:
+            await self.store.close()
+            self.store = None
+
+        await super()._stop()
+
+    async def _dispatch(
+        self,
+        task_id: str,
+        workflow_id: str,
+        input: Dict[str, Any],
+        on_interrupt: InterruptCallback
+    ) -> Any:
+        run_id = ulid.ulid()
+        queue_key  = f"{self.config.name}:{workflow_id}"
+        result_key = f"{queue_key}:{run_id}"
+        resume_key = f"{result_key}:resume"
+        blob_prefix = f"{queue_key}:{run_id}:blob:"
+
+        blob_keys: List[str] = []
+
+        try:
+            serialized_input, blob_keys = await serialize_input(
+                input,
+                self.blobs,
+                blob_prefix,
+                ttl_seconds=self._blob_ttl,
+                max_blob_size=self._max_blob_size,
+            )
+            message = json_dumps_str({
+                "task_id": task_id,
+                "run_id": run_id,
+                "input": serialized_input,
+            })
+
+            await self.store.push(queue_key, message)
+        except BaseException:
+            if blob_keys:
+                try:
+                    await self.blobs.delete(*blob_keys)
+                except BaseException as e:
+                    logging.warning("Failed to cleanup blob files (%d keys): %s", len(blob_keys), e)
+            raise
+
+        try:
+            while True:
+                result = await self._wait_for_message(result_key)
+                status = result.get("status", "failed")
+
+                if status == "interrupted" and on_interrupt:
+                    answer = await on_interrupt(result.get("interrupt", {}))
+                    await self.store.publish(resume_key, json_dumps_str({ "answer": answer }))
+                    continue
+
+                if status == "streaming":
+                    stream_key = result.get("stream_key")
+                    return SqliteStreamIterator(self.store, stream_key, self._timeout, self._poll_interval)
+
+                if status == "failed":
+                    raise RuntimeError(result.get("error", "Unknown error from queue worker"))
+
+                return result.get("output")
+        except TimeoutError:
+            raise TimeoutError(f"Queue dispatch timed out after {self.config.timeout} waiting for result") from None
+
+    async def _cancel(self, task_id: str) -> None:
+        cancel_key = f"{self.config.name}:cancel"
+        await self.store.publish(cancel_key, json_dumps_str({ "task_id": task_id }))
+
+    def _resolve_timeout(self) -> Optional[float]:
+        timeout = parse_time(self.config.timeout)
+
+        if timeout > 0:
+            return timeout
+
+        return None
+
+    def _resolve_blob_ttl(self) -> int:
+        if self.config.blob_ttl is not None:
+            return int(parse_time(self.config.blob_ttl))
+
+        return 3600
+
+    def _resolve_max_blob_size(self) -> Optional[int]:
+        if self.config.max_blob_size is not None:
+            return parse_size(self.config.max_blob_size)
+
+        return None
+
+    async def _wait_for_message(self, channel: str) -> Dict[str, Any]:
+        async with async_timeout(self._timeout):
+            while True:
+                messages = await self.store.pop(channel)
+
+                if messages:
+                    return json_loads(messages[0])
+
+                await asyncio.sleep(self._poll_interval)
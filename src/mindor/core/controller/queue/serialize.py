@@ -7,8 +7,9 @@ from starlette.datastructures import UploadFile, Headers
 from PIL.Image import Image as PILImage
 from mindor.core.logger import logging
 from mindor.core.foundation.streaming.resources import StreamResource
+from mindor.core.foundation.streaming.image import encode_image, FAST_PNG_COMPRESS_LEVEL
 from .errors import BlobNotFoundError, BlobCorruptedError, BlobTooLargeError
-import ulid
+import asyncio, ulid
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
@@ -57,9 +58,8 @@ async def serialize_input(
             return await _store(b"".join(chunks), element.filename, element.content_type, "stream_resource")
 
         if isinstance(element, PILImage):
-            buffer = BytesIO()
-            element.save(buffer, format="PNG")
-            return await _store(buffer.getvalue(), "image.png", "image/png", "pil_image")
+            data = await asyncio.to_thread(encode_image, element, "png", None, FAST_PNG_COMPRESS_LEVEL)
+            return await _store(data, "image.png", "image/png", "pil_image")
 
         if isinstance(element, dict):
             return { key: await _walk(value) for key, value in element.items() }
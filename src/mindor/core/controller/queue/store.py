@@ -0,0 +1,259 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from typing import Optional, Dict, List, Tuple, Any
+import aiofiles, aiofiles.os, asyncio, hashlib, os, time, ulid
+
+if TYPE_CHECKING:
+    from aiosqlite import Connection as AsyncConnection
+
+class SqliteQueueStore:
+    """Task queue and message channels kept in a WAL-mode SQLite database.
+
+    Tasks are claimed by competing workers; messages are addressed to a
+    channel and either popped by a single reader (results, resumes, stream
+    chunks) or scanned by id by every reader (cancel broadcasts).
+    """
+    def __init__(self, path: str):
+        self.path: str = path
+        self.connection: Optional[AsyncConnection] = None
+
+    async def open(self) -> None:
+        import aiosqlite
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        # Autocommit mode: every statement is its own transaction so that
+        # dispatcher and worker processes never hold a write lock across awaits.
+        self.connection = await aiosqlite.connect(self.path, isolation_level=None)
+
+        await self.connection.execute("PRAGMA journal_mode=WAL")
+        await self.connection.execute("PRAGMA synchronous=NORMAL")
+        await self.connection.execute("PRAGMA busy_timeout=5000")
+        await self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS queue_tasks ("
+            "  id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            "  queue TEXT NOT NULL,"
+            "  message TEXT NOT NULL,"
+            "  owner TEXT,"
+            "  claimed_at REAL,"
+            "  deliveries INTEGER NOT NULL DEFAULT 0"
+            ")"
+        )
+        await self._add_missing_column("queue_tasks", "deliveries", "INTEGER NOT NULL DEFAULT 0")
+        await self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS queue_tasks_queue_idx ON queue_tasks (queue, id)"
+        )
+        await self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS queue_dead_tasks ("
+            "  id INTEGER PRIMARY KEY,"
+            "  queue TEXT NOT NULL,"
+            "  message TEXT NOT NULL,"
+            "  deliveries INTEGER NOT NULL,"
+            "  error TEXT,"
+            "  buried_at REAL NOT NULL"
+            ")"
+        )
+        await self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS queue_messages ("
+            "  id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            "  channel TEXT NOT NULL,"
+            "  data TEXT NOT NULL,"
+            "  created_at REAL NOT NULL"
+            ")"
+        )
+        await self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS queue_messages_channel_idx ON queue_messages (channel, id)"
+        )
+
+    async def close(self) -> None:
+        if self.connection:
+            await self.connection.close()
+            self.connection = None
+
+    async def push(self, queue: str, message: str) -> None:
+        await self.connection.execute(
+            "INSERT INTO queue_tasks (queue, message) VALUES (?, ?)",
+            (queue, message),
+        )
+
+    async def claim(self, queues: List[str], owner: str, count: int, stale_before: float) -> List[Tuple[int, str, str, int]]:
+        """Atomically claims up to `count` unowned tasks, including tasks whose owner
+        stopped heartbeating before `stale_before`, in FIFO order. Each task is
+        returned with the number of times it has been claimed, this one included."""
+        if not queues or count <= 0:
+            return []
+
+        placeholders = ",".join("?" * len(queues))
+
+        async with self.connection.execute(
+            f"UPDATE queue_tasks SET owner = ?, claimed_at = ?, deliveries = deliveries + 1 WHERE id IN ("
+            f"  SELECT id FROM queue_tasks"
+            f"  WHERE queue IN ({placeholders}) AND (owner IS NULL OR claimed_at < ?)"
+            f"  ORDER BY id LIMIT ?"
+            f") RETURNING id, queue, message, deliveries",
+            (owner, time.time(), *queues, stale_before, count),
+        ) as cursor:
+            rows = await cursor.fetchall()
+
+        return sorted(rows)
+
+    async def touch(self, ids: List[int], owner: str) -> None:
+        if not ids:
+            return
+
+        placeholders = ",".join("?" * len(ids))
+
+        await self.connection.execute(
+            f"UPDATE queue_tasks SET claimed_at = ? WHERE owner = ? AND id IN ({placeholders})",
+            (time.time(), owner, *ids),
+        )
+
+    async def ack(self, id: int) -> None:
+        await self.connection.execute("DELETE FROM queue_tasks WHERE id = ?", (id,))
+
+    async def bury(self, id: int, error: str) -> None:
+        """Moves a task that will not be retried to the dead task table."""
+        # Copying before deleting keeps the task if the process stops in between;
+        # burying it again then replaces the copy.
+        await self.connection.execute(
+            "INSERT OR REPLACE INTO queue_dead_tasks (id, queue, message, deliveries, error, buried_at)"
+            "  SELECT id, queue, message, deliveries, ?, ? FROM queue_tasks WHERE id = ?",
+            (error, time.time(), id),
+        )
+        await self.ack(id)
+
+    async def publish(self, channel: str, data: str) -> None:
+        await self.connection.execute(
+            "INSERT INTO queue_messages (channel, data, created_at) VALUES (?, ?, ?)",
+            (channel, data, time.time()),
+        )
+
+    async def pop(self, channel: str, count: int = 1) -> List[str]:
+        """Removes and returns up to `count` of the oldest messages on a single-reader channel."""
+        async with self.connection.execute(
+            "DELETE FROM queue_messages WHERE id IN ("
+            "  SELECT id FROM queue_messages WHERE channel = ? ORDER BY id LIMIT ?"
+            ") RETURNING id, data",
+            (channel, count),
+        ) as cursor:
+            rows = await cursor.fetchall()
+
+        return [ data for _, data in sorted(rows) ]
+
+    async def fetch(self, channel: str, after_id: int) -> List[Tuple[int, str]]:
+        """Returns messages on a broadcast channel newer than `after_id` without removing them."""
+        async with self.connection.execute(
+            "SELECT id, data FROM queue_messages WHERE channel = ? AND id > ? ORDER BY id",
+            (channel, after_id),
+        ) as cursor:
+            return list(await cursor.fetchall())
+
+    async def get_last_message_id(self) -> int:
+        async with self.connection.execute("SELECT COALESCE(MAX(id), 0) FROM queue_messages") as cursor:
+            (last_id,) = await cursor.fetchone()
+
+        return last_id
+
+    async def purge_messages(self, created_before: float) -> None:
+        await self.connection.execute("DELETE FROM queue_messages WHERE created_at < ?", (created_before,))
+
+    async def _add_missing_column(self, table: str, column: str, definition: str) -> None:
+        # Databases created by earlier versions lack columns added since.
+        async with self.connection.execute(f"PRAGMA table_info({table})") as cursor:
+            columns = [ row[1] for row in await cursor.fetchall() ]
+
+        if column not in columns:
+            await self.connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+class FileBlobClient:
+    """Local-directory stand-in for the subset of the Redis client used by
+    `serialize_input` and `deserialize_input` (setex, delete, get/delete pipeline)."""
+    def __init__(self, directory: str):
+        self.directory: str = directory
+
+    async def setex(self, key: str, ttl_seconds: int, value: bytes) -> None:
+        path = self._get_path(key)
+        temp_path = f"{path}.{ulid.ulid()}.tmp"
+
+        async with aiofiles.open(temp_path, "wb") as f:
+            await f.write(value)
+
+        # Expiry is tracked through the modification time; see purge().
+        os.utime(temp_path, (time.time(), time.time() + ttl_seconds))
+        await aiofiles.os.replace(temp_path, path)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        path = self._get_path(key)
+
+        if not os.path.exists(path) or os.path.getmtime(path) < time.time():
+            return None
+
+        try:
+            async with aiofiles.open(path, "rb") as f:
+                return await f.read()
+        except FileNotFoundError:
+            return None
+
+    async def delete(self, *keys: str) -> int:
+        deleted = 0
+
+        for key in keys:
+            try:
+                await aiofiles.os.remove(self._get_path(key))
+                deleted += 1
+            except FileNotFoundError:
+                pass
+
+        return deleted
+
+    def pipeline(self, transaction: bool = True) -> FileBlobPipeline:
+        return FileBlobPipeline(self)
+
+    async def purge(self) -> None:
+        now = time.time()
+
+        for entry in await asyncio.to_thread(self._scan_entries):
+            if entry.stat().st_mtime < now:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+    def ensure_directory(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _scan_entries(self) -> List[os.DirEntry]:
+        try:
+            with os.scandir(self.directory) as entries:
+                return [ entry for entry in entries if entry.is_file() ]
+        except FileNotFoundError:
+            return []
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+class FileBlobPipeline:
+    def __init__(self, client: FileBlobClient):
+        self.client: FileBlobClient = client
+        self.commands: List[Tuple[str, Tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> FileBlobPipeline:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.commands.clear()
+
+    def get(self, key: str) -> FileBlobPipeline:
+        self.commands.append(("get", (key,)))
+        return self
+
+    def delete(self, *keys: str) -> FileBlobPipeline:
+        self.commands.append(("delete", keys))
+        return self
+
+    async def execute(self) -> List[Any]:
+        results = [ await getattr(self.client, command)(*args) for command, args in self.commands ]
+        self.commands.clear()
+        return results
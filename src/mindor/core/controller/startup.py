@@ -0,0 +1,182 @@
+from typing import Optional, Dict, List, Tuple, Set, Any
+from enum import Enum
+from dataclasses import dataclass
+from mindor.core.component import ComponentService
+from mindor.core.utils.startup_profiler import startup_profiler
+from mindor.core.logger import logging
+import asyncio, time
+
+class ComponentStartupStatus(str, Enum):
+    PENDING  = "pending"
+    STARTING = "starting"
+    READY    = "ready"
+    FAILED   = "failed"
+
+@dataclass
+class ComponentStartupState:
+    component_id: str
+    status: ComponentStartupStatus = ComponentStartupStatus.PENDING
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+class ComponentStartupScheduler:
+    """Starts components concurrently while respecting their `depends_on` order.
+
+    A component starts once all of its dependencies are ready, with at most
+    `max_concurrent_count` components starting at a time and only while the
+    `runtime_spec` estimates of the starting components fit the RAM and VRAM
+    budgets. A component that exceeds a budget on its own is started alone.
+    Components whose dependency failed are marked failed without being started,
+    and `run()` raises the first failure once every component has settled.
+    """
+    def __init__(
+        self,
+        components: List[ComponentService],
+        max_concurrent_count: int = 0,
+        ram_budget: Optional[int] = None,
+        vram_budget: Optional[int] = None
+    ):
+        self.components: Dict[str, ComponentService] = { component.id: component for component in components }
+        self.max_concurrent_count: int = max_concurrent_count
+        self.ram_budget: Optional[int] = ram_budget
+        self.vram_budget: Optional[int] = vram_budget
+        self.states: Dict[str, ComponentStartupState] = { id: ComponentStartupState(id) for id in self.components }
+
+        self._settled: Dict[str, asyncio.Event] = {}
+        self._errors: Dict[str, Exception] = {}
+        self._capacity: Optional[asyncio.Condition] = None
+        self._starting: Set[str] = set()
+        self._completed: bool = False
+
+    @property
+    def is_complete(self) -> bool:
+        return self._completed
+
+    @property
+    def failed_component_ids(self) -> List[str]:
+        return [ id for id, state in self.states.items() if state.status == ComponentStartupStatus.FAILED ]
+
+    def is_ready(self, component_id: str) -> bool:
+        state = self.states.get(component_id)
+        return state is None or state.status == ComponentStartupStatus.READY
+
+    def is_failed(self, component_id: str) -> bool:
+        state = self.states.get(component_id)
+        return state is not None and state.status == ComponentStartupStatus.FAILED
+
+    async def run(self) -> None:
+        self._validate_dependencies()
+
+        self._settled = { id: asyncio.Event() for id in self.components }
+        self._capacity = asyncio.Condition()
+
+        try:
+            await asyncio.gather(*[ self._start_component(component) for component in self.components.values() ])
+        finally:
+            self._completed = True
+
+        for id in self.components:
+            if id in self._errors:
+                raise self._errors[id]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            id: {
+                "status": state.status.value,
+                "elapsed": round(state.elapsed, 3) if state.elapsed is not None else None,
+                **({ "error": state.error } if state.error else {})
+            } for id, state in self.states.items()
+        }
+
+    async def _start_component(self, component: ComponentService) -> None:
+        state = self.states[component.id]
+
+        try:
+            for dependency_id in component.config.depends_on:
+                await self._settled[dependency_id].wait()
+
+                if self.states[dependency_id].status != ComponentStartupStatus.READY:
+                    state.status, state.error = ComponentStartupStatus.FAILED, f"Dependency '{dependency_id}' failed to start"
+                    logging.error("Component '%s' not started: %s", component.id, state.error)
+                    return
+
+            async with self._capacity:
+                await self._capacity.wait_for(lambda: self._can_start(component))
+                self._starting.add(component.id)
+
+            state.status, state.started_at = ComponentStartupStatus.STARTING, time.monotonic()
+
+            try:
+                with startup_profiler.measure("start", f"component:{component.id}"):
+                    await component.start()
+                state.status = ComponentStartupStatus.READY
+                logging.info("Component '%s' is ready (%.2fs)", component.id, state.elapsed)
+            except Exception as e:
+                state.status, state.error = ComponentStartupStatus.FAILED, str(e)
+                self._errors[component.id] = e
+                logging.error("Component '%s' failed to start: %s", component.id, e)
+            finally:
+                state.finished_at = time.monotonic()
+                async with self._capacity:
+                    self._starting.discard(component.id)
+                    self._capacity.notify_all()
+        finally:
+            self._settled[component.id].set()
+
+    def _can_start(self, component: ComponentService) -> bool:
+        if not self._starting:
+            return True
+
+        if self.max_concurrent_count > 0 and len(self._starting) >= self.max_concurrent_count:
+            return False
+
+        ram, vram = self._get_memory_estimate(component)
+        starting = [ self._get_memory_estimate(self.components[id]) for id in self._starting ]
+
+        if self.ram_budget is not None and ram + sum(estimate[0] for estimate in starting) > self.ram_budget:
+            return False
+
+        if self.vram_budget is not None and vram + sum(estimate[1] for estimate in starting) > self.vram_budget:
+            return False
+
+        return True
+
+    def _get_memory_estimate(self, component: ComponentService) -> Tuple[int, int]:
+        runtime_spec = getattr(component.config, "runtime_spec", None)
+
+        if not runtime_spec or not getattr(component.config, "preload", True):
+            return 0, 0
+
+        return runtime_spec.ram or 0, runtime_spec.vram or 0
+
+    def _validate_dependencies(self) -> None:
+        for component in self.components.values():
+            for dependency_id in component.config.depends_on:
+                if dependency_id not in self.components:
+                    raise ValueError(f"Component '{component.id}' depends on non-existent component '{dependency_id}'")
+
+        visiting: Set[str] = set()
+        visited: Set[str] = set()
+
+        def _visit(component_id: str) -> None:
+            if component_id in visiting:
+                raise ValueError(f"Dependency cycle detected involving component '{component_id}'")
+
+            if component_id in visited:
+                return
+
+            visiting.add(component_id)
+            for dependency_id in self.components[component_id].config.depends_on:
+                _visit(dependency_id)
+            visiting.remove(component_id)
+            visited.add(component_id)
+
+        for component_id in self.components:
+            _visit(component_id)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from typing import Optional, Dict, List
+from dataclasses import dataclass
+from mindor.core.logger import logging
+import asyncio, os, re, secrets, shutil, signal, socket, subprocess, sys, tempfile, ulid
+
+WORKER_INDEX_ENV   = "MINDOR_WORKER_INDEX"
+WORKER_COUNT_ENV   = "MINDOR_WORKER_COUNT"
+WORKER_DIR_ENV     = "MINDOR_WORKER_DIR"
+WORKER_TOKEN_ENV   = "MINDOR_WORKER_TOKEN"
+WORKER_PARENT_ENV  = "MINDOR_WORKER_PARENT"
+
+_TASK_OWNER_PATTERN = re.compile(r"-w(\d+)$")
+
+@dataclass
+class ControllerWorkerContext:
+    """Identity of one process in a group of controller workers sharing a listening socket.
+
+    Worker 0 is the primary process started by the user; it spawns the replicas
+    and is the only one running listeners, gateways and the web UI. Each worker
+    also serves its routes on a private Unix socket in `runtime_dir`, which the
+    other workers use to reach the tasks it owns.
+    """
+    index: int
+    count: int
+    runtime_dir: str
+    token: str
+    parent_pid: Optional[int] = None
+
+    @classmethod
+    def create(cls, count: int) -> ControllerWorkerContext:
+        return cls(
+            index=0,
+            count=count,
+            runtime_dir=tempfile.mkdtemp(prefix="mindor-workers-"),
+            token=secrets.token_hex(16)
+        )
+
+    @classmethod
+    def from_env(cls) -> Optional[ControllerWorkerContext]:
+        if WORKER_INDEX_ENV not in os.environ:
+            return None
+
+        return cls(
+            index=int(os.environ[WORKER_INDEX_ENV]),
+            count=int(os.environ[WORKER_COUNT_ENV]),
+            runtime_dir=os.environ[WORKER_DIR_ENV],
+            token=os.environ[WORKER_TOKEN_ENV],
+            parent_pid=int(os.environ[WORKER_PARENT_ENV])
+        )
+
+    @property
+    def is_primary(self) -> bool:
+        return self.index == 0
+
+    def get_env(self, index: int) -> Dict[str, str]:
+        return {
+            WORKER_INDEX_ENV:  str(index),
+            WORKER_COUNT_ENV:  str(self.count),
+            WORKER_DIR_ENV:    self.runtime_dir,
+            WORKER_TOKEN_ENV:  self.token,
+            WORKER_PARENT_ENV: str(os.getpid()),
+        }
+
+    def get_socket_path(self, index: Optional[int] = None) -> str:
+        return os.path.join(self.runtime_dir, f"worker-{self.index if index is None else index}.sock")
+
+    def generate_task_id(self) -> str:
+        return f"{ulid.ulid()}-w{self.index}"
+
+    def get_task_owner(self, task_id: str) -> Optional[int]:
+        """Index of the worker that created `task_id`, or None if the id carries no owner."""
+        match = _TASK_OWNER_PATTERN.search(task_id)
+        if not match:
+            return None
+
+        index = int(match.group(1))
+        return index if index < self.count else None
+
+    def is_remote_task(self, task_id: str) -> bool:
+        owner = self.get_task_owner(task_id)
+        return owner is not None and owner != self.index
+
+    def dispose(self) -> None:
+        if self.is_primary:
+            shutil.rmtree(self.runtime_dir, ignore_errors=True)
+
+class ControllerWorkerPool:
+    """Replica controller processes spawned by the primary worker.
+
+    Replicas re-run the command line of the primary, so they load the same
+    compose file and components; the worker environment tells them to start
+    only the HTTP server and to bind it with SO_REUSEPORT.
+    """
+    def __init__(self, context: ControllerWorkerContext):
+        self.context: ControllerWorkerContext = context
+        self.processes: List[subprocess.Popen] = []
+
+    async def start(self) -> None:
+        command = [ sys.executable ] + [ arg for arg in sys.argv if arg not in ( "--detach", "-d" ) ]
+
+        for index in range(1, self.context.count):
+            logging.debug("Spawning controller worker %d: %s", index, " ".join(command))
+
+            self.processes.append(subprocess.Popen(
+                command,
+                env={ **os.environ, **self.context.get_env(index) },
+                stdin=subprocess.DEVNULL,
+                close_fds=True,
+            ))
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        for process in self.processes:
+            if process.poll() is None:
+                # SIGINT takes the same graceful path as Ctrl-C in the foreground.
+                process.send_signal(signal.SIGINT)
+
+        await asyncio.gather(*[ self._wait_for_exit(process, timeout) for process in self.processes ])
+        self.processes.clear()
+
+    async def _wait_for_exit(self, process: subprocess.Popen, timeout: float) -> None:
+        try:
+            await asyncio.to_thread(process.wait, timeout)
+        except subprocess.TimeoutExpired:
+            logging.warning("Controller worker %d did not exit within %ss; killing it", process.pid, timeout)
+            process.kill()
+            await asyncio.to_thread(process.wait)
+
+def create_shared_socket(host: str, port: int) -> socket.socket:
+    """TCP socket bound with SO_REUSEPORT so every worker can accept on the same port."""
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise RuntimeError("Running multiple HTTP workers requires SO_REUSEPORT, which is not available on this platform")
+
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((host, port))
+    except OSError:
+        sock.close()
+        raise
+
+    return sock
+
+def create_unix_socket(path: str) -> socket.socket:
+    if os.path.exists(path):
+        os.unlink(path)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+
+    return sock
@@ -3,3 +3,9 @@ class TaskError(ValueError):
 
 class ShutdownError(RuntimeError):
     pass
+
+class OverloadedError(RuntimeError):
+    pass
+
+class NotReadyError(RuntimeError):
+    pass
@@ -11,17 +11,21 @@ from .media import MediaSource
 from .iterators import StreamChunkIterator
 from ...utils.audio import (
     AudioBuffer,
+    WavAudio,
+    parse_wav,
     is_pcm_format,
     get_pcm_dtype,
+    get_pcm_sample_width,
     get_pcm_format,
     decode_pcm_to_waveform,
     encode_waveform_to_pcm,
     parse_wav_header,
 )
+from ...utils.files import get_file_extension
 from ...utils.shell import stream_subprocess
 from ...logger import logging
 from starlette.datastructures import UploadFile
-import asyncio, struct, shutil
+import aiofiles, asyncio, struct, shutil
 
 if TYPE_CHECKING:
     import numpy as np
@@ -157,6 +161,9 @@ class AudioStreamResource(StreamResource):
         self.format: str = format
         self.attrs: Dict[str, Any] = attrs or {}
 
+    def get_local_path(self) -> Optional[str]:
+        return self.source.get_local_path()
+
     async def close(self) -> None:
         await self.source.close()
 
@@ -817,3 +824,37 @@ def is_audio_streamable(source: MediaSource) -> bool:
         return False
 
     return True
+
+async def read_wav_source(source: MediaSource, max_size: int) -> Tuple[Optional[WavAudio], MediaSource]:
+    """Load a WAV or raw PCM source into memory for in-process sample work.
+
+    Returns `(wav, source)`. `wav` is None when the source isn't plain PCM, is
+    larger than `max_size` bytes or has an unknown format; `source` is what the
+    caller should keep using, since a non-file stream has been consumed by the
+    time its header can be checked and is handed back as a bytes-backed copy.
+    """
+    is_pcm = is_pcm_format(source.format) and source.format != "u8" and bool(source.attrs.get("sample_rate")) and bool(source.attrs.get("channels"))
+    is_wav = source.format == "wav" or (
+        source.format is None and isinstance(source.stream, FileStreamResource) and (get_file_extension(source.stream.path) or "").lower() == "wav"
+    )
+
+    if not (is_pcm or is_wav):
+        return None, source
+
+    if source.stream.size is not None and source.stream.size > max_size:
+        return None, source
+
+    if isinstance(source.stream, FileStreamResource):
+        async with aiofiles.open(source.stream.path, "rb") as f:
+            data = await f.read()
+    else:
+        data = await read_stream_to_bytes(source.stream)
+        source = MediaSource(BytesStreamResource(data), source.format, source.attrs)
+
+    if is_wav:
+        return parse_wav(data), source
+
+    sample_rate, channels = int(source.attrs["sample_rate"]), int(source.attrs["channels"])
+    frame_size = channels * get_pcm_sample_width(source.format)
+
+    return WavAudio(data[:len(data) - len(data) % frame_size], sample_rate, channels, source.format), source
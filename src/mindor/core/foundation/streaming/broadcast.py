@@ -0,0 +1,211 @@
+from typing import Optional, Dict, Any
+from collections.abc import AsyncIterator, AsyncIterable
+from collections import deque
+from .iterators import StreamChunkIterator
+import asyncio, itertools
+
+class StreamBroadcast:
+    """Fans one async source out to several consumers, iterating it only once.
+
+    Items pulled from the source are kept in a ring buffer until every consumer
+    has read them; each consumer reads through its own cursor. The source is
+    pulled on demand by whichever consumer runs ahead, and once `max_buffer_size`
+    items are waiting for the slowest consumer, the fast ones pause until it
+    catches up, so memory stays bounded however skewed the consumers are.
+
+    `consumer_count` reserves slots for consumers that have not subscribed yet:
+    nothing is dropped from the buffer until they have all joined. Slots can also
+    be reserved for a named owner with `reservations`; a subscription made for that
+    owner takes one of its slots, and `release()` gives back the slots of an owner
+    that will not subscribe after all, so a consumer that never arrives doesn't
+    stall the others once the buffer is full. Consumers subscribing beyond the
+    reserved slots start from the oldest buffered item.
+
+    With `limit_subscribed_only`, `max_buffer_size` bounds only how far the subscribed
+    consumers drift apart. Items kept for reserved slots that nobody has taken yet
+    don't pause anyone, so consumers that are read one after another never wait on
+    each other; the buffer then holds whatever the later ones have yet to read.
+
+    An error raised by the source is raised to every consumer, and the source is
+    closed once all consumers have left before it was exhausted.
+    """
+    def __init__(
+        self,
+        source: AsyncIterable,
+        consumer_count: int = 0,
+        max_buffer_size: int = 1024,
+        reservations: Optional[Dict[str, int]] = None,
+        limit_subscribed_only: bool = False,
+    ):
+        self.source: AsyncIterable = source
+        self.max_buffer_size: int = max(1, max_buffer_size)
+        self.limit_subscribed_only: bool = limit_subscribed_only
+
+        self._iterator: Optional[AsyncIterator] = None
+        self._buffer: deque = deque()
+        self._offset: int = 0
+        self._cursors: Dict[int, int] = {}
+        self._reservations: Dict[Optional[str], int] = { owner: count for owner, count in (reservations or {}).items() if count > 0 }
+        if consumer_count > 0:
+            self._reservations[None] = self._reservations.get(None, 0) + consumer_count
+        self._consumer_ids = itertools.count()
+        self._condition: asyncio.Condition = asyncio.Condition()
+        self._pulling: bool = False
+        self._waiting: int = 0
+        self._exhausted: bool = False
+        self._error: Optional[BaseException] = None
+
+    @property
+    def buffered_count(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def reserved_count(self) -> int:
+        return sum(self._reservations.values())
+
+    def subscribe(self, owner: Optional[str] = None) -> AsyncIterator[Any]:
+        return self._consume(owner)
+
+    async def release(self, owner: Optional[str]) -> None:
+        """Gives back the slots still reserved for `owner`, letting the buffer drain
+        past items it would otherwise have waited for."""
+        if self._reservations.pop(owner, 0) == 0:
+            return
+
+        if self._cursors or self.reserved_count > 0:
+            await self._trim(notify=True)
+        elif self._iterator is not None:
+            await self._abandon()
+
+    async def _consume(self, owner: Optional[str]) -> AsyncIterator[Any]:
+        consumer_id = next(self._consumer_ids)
+        self._cursors[consumer_id] = self._offset
+
+        if self._reservations.get(owner, 0) > 0:
+            self._reservations[owner] -= 1
+            if self._reservations[owner] == 0:
+                del self._reservations[owner]
+
+        try:
+            while True:
+                position = self._cursors[consumer_id]
+
+                if position - self._offset < len(self._buffer):
+                    item = self._buffer[position - self._offset]
+                    self._cursors[consumer_id] = position + 1
+                    await self._trim()
+                    yield item
+                    continue
+
+                if not await self._fill(position):
+                    return
+        finally:
+            await self._unsubscribe(consumer_id)
+
+    async def _fill(self, position: int) -> bool:
+        """Makes the item at `position` available, pulling it from the source if
+        no other consumer is already doing so. Returns False at the end of the source."""
+        async with self._condition:
+            while True:
+                if position - self._offset < len(self._buffer):
+                    return True
+                if self._error is not None:
+                    raise self._error
+                if self._exhausted:
+                    return False
+                if not self._pulling and not self._is_full():
+                    break
+                self._waiting += 1
+                try:
+                    await self._condition.wait()
+                finally:
+                    self._waiting -= 1
+
+            self._pulling = True
+
+        try:
+            if self._iterator is None:
+                self._iterator = self.source.__aiter__()
+            item = await self._iterator.__anext__()
+        except StopAsyncIteration:
+            self._exhausted = True
+            return False
+        except BaseException as e:
+            self._error = e
+            raise
+        else:
+            self._buffer.append(item)
+            return True
+        finally:
+            async with self._condition:
+                self._pulling = False
+                self._condition.notify_all()
+
+    def _is_full(self) -> bool:
+        if self.limit_subscribed_only:
+            end = self._offset + len(self._buffer)
+            return end - min(self._cursors.values(), default=end) >= self.max_buffer_size
+
+        return len(self._buffer) >= self.max_buffer_size
+
+    async def _trim(self, notify: bool = False) -> None:
+        if self.reserved_count == 0 and self._buffer:
+            lowest = min(self._cursors.values(), default=self._offset + len(self._buffer))
+
+            while self._buffer and self._offset < lowest:
+                self._buffer.popleft()
+                self._offset += 1
+
+        if (notify or self._waiting) and not self._is_full():
+            async with self._condition:
+                self._condition.notify_all()
+
+    async def _unsubscribe(self, consumer_id: int) -> None:
+        self._cursors.pop(consumer_id, None)
+
+        if self._cursors or self.reserved_count > 0:
+            await self._trim()
+            return
+
+        await self._abandon()
+
+    async def _abandon(self) -> None:
+        """Drops the buffer and closes the source once no consumer is left or expected."""
+        self._offset += len(self._buffer)
+        self._buffer.clear()
+
+        if not self._exhausted and self._error is None:
+            self._exhausted = True
+            aclose = getattr(self._iterator, "aclose", None)
+            if aclose is not None:
+                try:
+                    await aclose()
+                except Exception:
+                    pass
+
+class BroadcastStreamIterator(StreamChunkIterator):
+    """Stream over a shared `StreamBroadcast`; every iteration is a separate subscription,
+    so the same value can be handed to several consumers that each see every chunk."""
+    def __init__(self, broadcast: StreamBroadcast, is_fragmented: bool = False, owner: Optional[str] = None):
+        super().__init__(broadcast.source, is_fragmented=is_fragmented)
+
+        self.broadcast: StreamBroadcast = broadcast
+        self.owner: Optional[str] = owner
+
+    def bind(self, owner: Optional[str]) -> "BroadcastStreamIterator":
+        """Same stream, subscribing on behalf of `owner` so it takes one of the slots reserved for it."""
+        return BroadcastStreamIterator(self.broadcast, is_fragmented=self.is_fragmented, owner=owner)
+
+    async def _iterate_stream(self) -> AsyncIterator[Any]:
+        subscription = self.broadcast.subscribe(self.owner)
+
+        try:
+            async for chunk in subscription:
+                if chunk is None and self.is_fragmented:
+                    continue
+                yield chunk
+        finally:
+            await subscription.aclose()
+
+    async def _close_source(self) -> None:
+        pass  # The source is shared with the other subscribers and closed by the broadcast.
@@ -4,22 +4,28 @@ from .resources import StreamResource
 from starlette.datastructures import UploadFile
 import aiofiles, os
 
+_MIN_FILE_CHUNK_SIZE = 8192
+_MAX_FILE_CHUNK_SIZE = 1024 * 1024
+
 class FileStreamResource(StreamResource):
     def __init__(
         self,
         path: str,
         content_type: Optional[str] = None,
         filename: Optional[str] = None,
-        chunk_size: int = 8192,
+        chunk_size: Optional[int] = None,
         auto_delete: bool = False
     ):
         super().__init__(content_type, filename or os.path.basename(path), size=os.path.getsize(path))
 
         self.path = path
-        self.chunk_size: int = chunk_size
+        self.chunk_size: int = chunk_size or self._resolve_chunk_size(self.size)
         self.auto_delete: bool = auto_delete
         self._stream: Optional[aiofiles.threadpool.text.AsyncTextIOWrapper] = None
 
+    def get_local_path(self) -> Optional[str]:
+        return self.path
+
     async def close(self) -> None:
         if self._stream:
             await self._stream.close()
@@ -40,6 +46,12 @@ class FileStreamResource(StreamResource):
                 break
             yield chunk
 
+    @staticmethod
+    def _resolve_chunk_size(size: int) -> int:
+        # Every read is a thread-pool hop through aiofiles, so large files are
+        # read in chunks of up to 1 MB instead of paying that cost every 8 KB.
+        return max(_MIN_FILE_CHUNK_SIZE, min(size, _MAX_FILE_CHUNK_SIZE))
+
 class UploadFileStreamResource(StreamResource):
     def __init__(self, file: UploadFile):
         super().__init__(file.content_type, file.filename, size=file.size)
@@ -1,10 +1,13 @@
-from typing import Optional
+from typing import Optional, Dict, Tuple, Any
 from collections.abc import AsyncIterator
-from .resources import StreamResource
+from .resources import StreamResource, read_stream_to_bytes
 from PIL import Image as PILImage
-import asyncio, io
+import asyncio, io, zlib
+
+_CHUNK_SIZE = 64 * 1024
 
 _CONTENT_TYPE_MAP = {
+    "raw": "image/x-raw",
     "png": "image/png",
     "jpeg": "image/jpeg",
     "jpg": "image/jpeg",
@@ -26,42 +29,166 @@ _PIL_FORMAT_MAP = {
     "ico": "ICO"
 }
 
+RAW_IMAGE_CONTENT_TYPE = "image/x-raw"
+
+# zlib level 1 encodes several times faster than Pillow's default (6) for a
+# slightly larger file; used for hops between our own processes.
+FAST_PNG_COMPRESS_LEVEL = 1
+
+_ENCODED_CACHE_ATTR = "_mindor_encoded"
+
+def encode_image(
+    image: PILImage.Image,
+    format: str = "png",
+    quality: Optional[int] = None,
+    compress_level: Optional[int] = None
+) -> bytes:
+    """Encodes `image`, reusing the bytes of any earlier encoding with the same settings.
+
+    Encodings are memoised on the image object itself, so a frame passed through
+    several boundaries (IPC, HTTP, queue blobs) is encoded once per format. The
+    memo is tied to a checksum of the pixels, so an image modified in place is
+    encoded again.
+
+    `raw` returns the pixel buffer as-is, without memoising it; rebuild it with
+    `decode_raw_image()` and the attributes from `get_raw_image_attrs()`.
+    """
+    if format == "raw":
+        return image.tobytes()
+
+    key = (format, quality, compress_level)
+    state = _get_image_state(image)
+    cache = _get_encoded_cache(image, state)
+
+    if cache is not None and key in cache:
+        return cache[key]
+
+    data = _save_image(image, _PIL_FORMAT_MAP.get(format, "PNG"), quality, compress_level)
+
+    if cache is None:
+        cache = {}
+        setattr(image, _ENCODED_CACHE_ATTR, (state, cache))
+    cache[key] = data
+
+    return data
+
+def get_cached_image_encoding(
+    image: PILImage.Image,
+    format: str = "png",
+    quality: Optional[int] = None,
+    compress_level: Optional[int] = None
+) -> Optional[bytes]:
+    if format == "raw" or getattr(image, _ENCODED_CACHE_ATTR, None) is None:
+        return None
+
+    cache = _get_encoded_cache(image, _get_image_state(image))
+    return cache.get((format, quality, compress_level)) if cache else None
+
+def _get_encoded_cache(image: PILImage.Image, state: Tuple) -> Optional[Dict[Tuple, bytes]]:
+    memo: Optional[Tuple[Tuple, Dict[Tuple, bytes]]] = getattr(image, _ENCODED_CACHE_ATTR, None)
+    return memo[1] if memo is not None and memo[0] == state else None
+
+def _get_image_state(image: PILImage.Image) -> Tuple:
+    # Pillow keeps no modification counter, so the pixels themselves tell whether
+    # an image changed since it was encoded; a checksum costs far less than encoding.
+    return (image.mode, image.size, image.getpalette(), zlib.crc32(image.tobytes()))
+
+def supports_raw_image(image: PILImage.Image) -> bool:
+    # Palette images would lose their palette in a bare pixel buffer.
+    return image.mode not in ("P", "PA")
+
+def get_raw_image_attrs(image: PILImage.Image) -> Dict[str, Any]:
+    return { "mode": image.mode, "width": image.width, "height": image.height }
+
+def decode_raw_image(data: bytes, attrs: Dict[str, Any]) -> PILImage.Image:
+    return PILImage.frombytes(attrs["mode"], (int(attrs["width"]), int(attrs["height"])), data)
+
+def _save_image(image: PILImage.Image, pil_format: str, quality: Optional[int], compress_level: Optional[int]) -> bytes:
+    params: Dict[str, Any] = {}
+
+    if pil_format == "PNG" and compress_level is not None:
+        params["compress_level"] = compress_level
+
+    if pil_format in ("JPEG", "WEBP") and quality is not None:
+        params["quality"] = quality
+
+    if pil_format == "JPEG" and image.mode not in ("RGB", "L", "CMYK"):
+        image = image.convert("RGB")
+
+    buffer = io.BytesIO()
+    image.save(buffer, pil_format, **params)
+
+    return buffer.getvalue()
+
 class ImageStreamResource(StreamResource):
-    def __init__(self, image: PILImage.Image, format: str = "png", filename: Optional[str] = None):
+    def __init__(
+        self,
+        image: PILImage.Image,
+        format: str = "png",
+        filename: Optional[str] = None,
+        quality: Optional[int] = None,
+        compress_level: Optional[int] = None
+    ):
         super().__init__(self._resolve_content_type(format), filename)
 
         self.image: PILImage.Image = image
         self.format: str = format
-        self._buffer: Optional[io.BytesIO] = None
+        self.quality: Optional[int] = quality
+        self.compress_level: Optional[int] = compress_level
+        self.attrs: Dict[str, Any] = get_raw_image_attrs(image) if format == "raw" else {}
+        self._data: Optional[bytes] = get_cached_image_encoding(image, format, quality, compress_level)
+
+        if self._data is not None:
+            self.size = len(self._data)
 
     async def close(self) -> None:
-        if self._buffer:
-            self._buffer.close()
-            self._buffer = None
+        self._data = None
 
     async def _iterate_stream(self) -> AsyncIterator[bytes]:
-        if not self._buffer:
-            self._buffer = await asyncio.to_thread(self._write_to_buffer, self.image, self.format)
+        data = self._data
 
-        while True:
-            chunk = self._buffer.read(8192)  # Read in 8KB chunks
-            if not chunk:
-                break
-            yield chunk
+        if data is None:
+            data = self._data = await asyncio.to_thread(encode_image, self.image, self.format, self.quality, self.compress_level)
 
-    def _write_to_buffer(self, image: PILImage.Image, format: str) -> io.BytesIO:
-        buffer = io.BytesIO()
-        image.save(buffer, self._resolve_pil_format(format))
-        buffer.seek(0)
-        return buffer
+        for offset in range(0, len(data), _CHUNK_SIZE):
+            yield data[offset:offset + _CHUNK_SIZE]
 
     def _resolve_content_type(self, format: str) -> str:
         return _CONTENT_TYPE_MAP.get(format, "application/octet-stream")
 
-    def _resolve_pil_format(self, format: str) -> str:
-        return _PIL_FORMAT_MAP.get(format, "PNG")
+class RawImageStreamResource(StreamResource):
+    """Image received from another process as a raw pixel buffer.
+
+    `load_image_from_stream()` rebuilds the image straight from the pixels using
+    the mode and dimensions in `attrs`; iterating the resource yields the image
+    encoded as `format`, like any other image stream.
+    """
+    def __init__(self, source: StreamResource, attrs: Dict[str, Any], format: str = "png", filename: Optional[str] = None):
+        super().__init__(_CONTENT_TYPE_MAP.get(format, "application/octet-stream"), filename)
+
+        self.source: StreamResource = source
+        self.attrs: Dict[str, Any] = attrs
+        self.format: str = format
+        self._image: Optional[PILImage.Image] = None
+
+    async def load_image(self) -> PILImage.Image:
+        if self._image is None:
+            data = await read_stream_to_bytes(self.source)
+            self._image = await asyncio.to_thread(decode_raw_image, data, self.attrs)
+
+        return self._image
+
+    async def close(self) -> None:
+        await self.source.close()
+
+    async def _iterate_stream(self) -> AsyncIterator[bytes]:
+        async for chunk in ImageStreamResource(await self.load_image(), self.format):
+            yield chunk
 
 async def load_image_from_stream(stream: StreamResource) -> PILImage.Image:
+    if isinstance(stream, RawImageStreamResource):
+        return await stream.load_image()
+
     data = bytearray()
     async with stream:
         async for chunk in stream:
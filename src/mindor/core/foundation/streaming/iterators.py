@@ -1,21 +1,97 @@
-from typing import Any, Optional
-from collections.abc import AsyncIterator, AsyncIterable
+from typing import Union, Literal, Optional, Callable, Awaitable, List, Any
+from collections.abc import AsyncIterator, AsyncIterable, AsyncGenerator
 from abc import ABC, abstractmethod
 from enum import Enum
+from mindor.core.logger import logging
 from .json import encode_value_to_json
+import asyncio
+
+StreamTerminatedEvent = Literal[ "completed", "cancelled", "failed" ]
+StreamTerminatedCallback = Callable[[StreamTerminatedEvent, Optional[str]], Awaitable[None]]
 
 class StreamEncodingFormat(str, Enum):
     TEXT = "text"
     JSON = "json"
 
 class StreamIterator(ABC):
+    """Base class of the streams passed between components, jobs and tasks.
+
+    Layers that need to know when a stream ends register a callback with
+    `add_terminated_callback()` instead of wrapping the stream in another
+    iterator. However many callbacks are registered, chunks pass through a
+    single extra generator frame, and through none when there are no callbacks.
+    Callbacks are called in registration order, once per stream.
+    """
+    _terminated_callbacks: Optional[List[StreamTerminatedCallback]] = None
+    _notified_terminated: bool = False
+    _iteration: Optional[AsyncGenerator] = None
+
     def __aiter__(self) -> AsyncIterator[Any]:
-        return self._iterate_stream()
+        if not self._terminated_callbacks:
+            return self._iterate_stream()
+
+        self._iteration = self._iterate_with_callbacks()
+        return self._iteration
 
     @abstractmethod
     async def _iterate_stream(self) -> AsyncIterator[Any]:
         pass
 
+    @property
+    def is_iterating(self) -> bool:
+        return self._iteration is not None
+
+    def add_terminated_callback(self, callback: StreamTerminatedCallback) -> None:
+        if self._iteration is not None:
+            raise RuntimeError("Cannot add a termination callback to a stream that is already being iterated")
+
+        if self._terminated_callbacks is None:
+            self._terminated_callbacks = []
+
+        self._terminated_callbacks.append(callback)
+
+    async def aclose(self) -> None:
+        try:
+            if self._iteration is not None:
+                await self._iteration.aclose()
+            await self._close_source()
+        except Exception:
+            pass
+
+        if self._terminated_callbacks and not self._notified_terminated:
+            await self._notify_terminated("cancelled", "consumer closed stream")
+
+    async def _close_source(self) -> None:
+        pass
+
+    async def _iterate_with_callbacks(self) -> AsyncIterator[Any]:
+        iterator = self._iterate_stream()
+
+        try:
+            async for chunk in iterator:
+                yield chunk
+        except asyncio.CancelledError:
+            await self._notify_terminated("cancelled", None)
+            raise
+        except Exception as e:
+            await self._notify_terminated("failed", str(e))
+            raise
+        else:
+            await self._notify_terminated("completed", None)
+        finally:
+            await iterator.aclose()
+            if not self._notified_terminated:
+                await self._notify_terminated("cancelled", "consumer closed stream")
+
+    async def _notify_terminated(self, event: StreamTerminatedEvent, error: Optional[str]) -> None:
+        self._notified_terminated = True
+
+        for callback in self._terminated_callbacks or []:
+            try:
+                await callback(event, error)
+            except Exception:
+                logging.warning("Stream termination callback failed", exc_info=True)
+
 class StreamChunkIterator(StreamIterator):
     def __init__(self, source: AsyncIterable, is_fragmented: bool = False):
         self.source: AsyncIterable = source
@@ -27,6 +103,9 @@ class StreamChunkIterator(StreamIterator):
                 continue
             yield chunk
 
+    async def _close_source(self) -> None:
+        await _close_iterable(self.source)
+
 class StreamEncodingIterator(StreamIterator):
     def __init__(
         self,
@@ -48,6 +127,9 @@ class StreamEncodingIterator(StreamIterator):
 
             yield encoded
 
+    async def _close_source(self) -> None:
+        await _close_iterable(self.source)
+
     async def _encode_chunk(self, chunk: Any) -> Optional[Any]:
         if self.format == StreamEncodingFormat.TEXT:
             return chunk if isinstance(chunk, str) else str(chunk)
@@ -59,3 +141,19 @@ class StreamEncodingIterator(StreamIterator):
             return await encode_value_to_json(chunk)
 
         return chunk
+
+def attach_terminated_callback(source: Union[StreamIterator, AsyncIterable], callback: StreamTerminatedCallback) -> StreamIterator:
+    """Registers `callback` to be told how `source` ends, wrapping it only when
+    it is not a `StreamIterator` that can carry the callback itself."""
+    if not isinstance(source, StreamIterator) or source.is_iterating:
+        source = StreamChunkIterator(source, is_fragmented=getattr(source, "is_fragmented", False))
+
+    source.add_terminated_callback(callback)
+
+    return source
+
+async def _close_iterable(iterable: AsyncIterable) -> None:
+    aclose = getattr(iterable, "aclose", None)
+
+    if aclose is not None:
+        await aclose()
@@ -31,6 +31,14 @@ class StreamResource(ABC):
     def __aiter__(self):
         return self._iterate_stream()
 
+    def get_local_path(self) -> Optional[str]:
+        """Path of a local file holding exactly the bytes this resource streams, if any.
+
+        Consumers that can hand a file to the kernel (e.g. an HTTP response using
+        `sendfile`) serve it from this path instead of iterating the stream.
+        """
+        return None
+
     @abstractmethod
     async def close(self) -> None:
         pass
@@ -106,6 +114,9 @@ class ChunkedStreamResource(StreamResource):
         self.stream: StreamResource = stream
         self.chunk_size: int = chunk_size
 
+    def get_local_path(self) -> Optional[str]:
+        return self.stream.get_local_path()
+
     async def close(self) -> None:
         await self.stream.close()
 
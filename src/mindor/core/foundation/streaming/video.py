@@ -36,6 +36,9 @@ class VideoStreamResource(StreamResource):
         self.format: Optional[str] = format
         self.attrs: Dict[str, Any] = attrs or {}
 
+    def get_local_path(self) -> Optional[str]:
+        return self.source.get_local_path()
+
     async def close(self) -> None:
         await self.source.close()
 
@@ -6,7 +6,7 @@ from enum import Enum
 from pydantic import BaseModel
 from ..streaming.resources import StreamResource
 from ..streaming.iterators import StreamIterator, StreamEncodingIterator, StreamEncodingFormat
-from ..streaming.image import ImageStreamResource
+from ..streaming.image import ImageStreamResource, FAST_PNG_COMPRESS_LEVEL, supports_raw_image
 from ..streaming.file import UploadFileStreamResource
 from .atomic import AtomicDict, AtomicList
 from PIL import Image as PILImage
@@ -30,7 +30,8 @@ class VariableCodec:
 
     - `bytes` / `bytearray` → `{"__variable__": {"type": "bytes", "value": "<b64>"}}`
       with the data inlined as base64.
-    - `StreamResource`, `StreamIterator`, `AsyncIterator`, `PIL.Image` →
+    - `StreamResource`, `StreamIterator`, `AsyncIterator`, `PIL.Image` (as a
+      raw pixel buffer, or a fast-profile PNG for palette images) →
       `{"__variable__": {"type": "stream", "id": "<ulid>", "kind": ...,
       "content_type": ..., ...}}`. Actual chunk data is shipped separately via
       `STREAM_*` messages (out of scope for the codec itself).
@@ -73,9 +74,12 @@ class VariableCodec:
         if isinstance(value, (bytes, bytearray)):
             return self._build_bytes_variable(bytes(value))
 
-        # PIL.Image auto-lift to ImageStreamResource
+        # PIL.Image auto-lift to ImageStreamResource. Both ends of an IPC hop are
+        # local, so the pixel buffer is sent raw instead of paying for a PNG encode.
         if isinstance(value, PILImage.Image):
-            return self._build_stream_variable(ImageStreamResource(value), on_stream_encode)
+            if supports_raw_image(value):
+                return self._build_stream_variable(ImageStreamResource(value, "raw"), on_stream_encode)
+            return self._build_stream_variable(ImageStreamResource(value, compress_level=FAST_PNG_COMPRESS_LEVEL), on_stream_encode)
 
         # UploadFile auto-lift to UploadFileStreamResource so raw HTTP/gradio
         # uploads can flow through IPC unchanged (the worker sees a StreamResource).
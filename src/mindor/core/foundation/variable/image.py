@@ -1,7 +1,7 @@
 from typing import Optional, List, Union, Any
 from collections.abc import AsyncIterator, AsyncIterable
 from ..streaming.resources import StreamResource
-from ..streaming.image import load_image_from_stream, ImageStreamResource
+from ..streaming.image import load_image_from_stream, ImageStreamResource, RawImageStreamResource
 from ..streaming.iterators import StreamIterator, StreamChunkIterator
 from PIL import Image as PILImage
 
@@ -107,6 +107,9 @@ class ImageValueRenderer:
         if isinstance(value, ImageStreamResource):
             return value.image
 
+        if isinstance(value, RawImageStreamResource):
+            return await value.load_image()
+
         if isinstance(value, StreamResource):
             return await load_image_from_stream(value)
 
@@ -7,6 +7,7 @@ from ..streaming.base64 import Base64StreamResource, encode_value_to_base64, dec
 from ..streaming.json import decode_json_value, encode_value_to_json
 from ..streaming.bytes import BytesStreamResource
 from ..streaming.iterators import StreamEncodingFormat, StreamEncodingIterator, StreamIterator, StreamChunkIterator
+from ..streaming.broadcast import StreamBroadcast
 from ..streaming.image import load_image_from_stream, ImageStreamResource
 from ..streaming.audio import PcmStreamResource, WavStreamResource, AudioStreamResource
 from ..streaming.video import VideoStreamResource
@@ -18,7 +19,7 @@ from mindor.dsl.schema.common.operator.condition import ConditionOperator
 from starlette.datastructures import UploadFile
 from PIL import Image as PILImage
 from urllib.parse import unquote_to_bytes
-import re, aiofiles, os, asyncio
+import re, aiofiles, os
 
 class FieldResolver:
     def __init__(self):
@@ -64,8 +65,13 @@ class FieldResolver:
         return value
 
 class VariableRenderer:
-    def __init__(self, source_resolver: Callable[[str, Optional[Union[int, slice]], Optional[str]], Awaitable[Any]]):
+    def __init__(
+        self,
+        source_resolver: Callable[[str, Optional[Union[int, slice]], Optional[str]], Awaitable[Any]],
+        split_buffer_size: int = 1024
+    ):
         self.source_resolver: Callable[[str, Optional[Union[int, slice]], Optional[str]], Awaitable[Any]] = source_resolver
+        self.split_buffer_size: int = split_buffer_size
         self.field_resolver: FieldResolver = FieldResolver()
         self.patterns: Dict[str, re.Pattern] = {
             "variable": re.compile(
@@ -350,52 +356,32 @@ class VariableRenderer:
             return value
 
         if isinstance(source, (StreamIterator, AsyncIterable)):
-            source_iterator = source.__aiter__()
-            buffers: Dict[str, List[Any]] = { key: [] for key in template }
-            error: Optional[BaseException] = None
-            advance_lock = asyncio.Lock()
-            exhausted = False
-            index = 0
-
-            async def _advance_for(key: str) -> bool:
-                nonlocal exhausted, error, index
-
-                async with advance_lock:
-                    if buffers[key]:
-                        return True
-                    if exhausted:
-                        return False
-                    if error is not None:
-                        raise error
-
-                    try:
-                        item = await source_iterator.__anext__()
-                    except StopAsyncIteration:
-                        exhausted = True
-                        return False
-                    except BaseException as e:
-                        error = e
-                        raise
-
+            async def _render_items() -> AsyncIterator[Dict[str, Any]]:
+                index = 0
+                async for item in source:
                     self._item_stack.append(item)
                     self._index_stack.append(index)
                     try:
-                        for key in template:
-                            buffers[key].append(await self._render_element(template[key], scope, skip_decode))
+                        values = { key: await self._render_element(template[key], scope, skip_decode) for key in template }
                     finally:
                         self._item_stack.pop()
                         self._index_stack.pop()
                         index += 1
+                    yield values
 
-                    return True
+            # Every lane reads the rendered elements through its own cursor; lanes that
+            # run too far ahead of the slowest lane being read wait for it to catch up,
+            # while lanes not read yet only keep their elements buffered.
+            broadcast = StreamBroadcast(_render_items(), consumer_count=len(template), max_buffer_size=self.split_buffer_size, limit_subscribed_only=True)
 
             def _iterate_for(key: str) -> AsyncIterator[Any]:
                 async def _iterate() -> AsyncIterator[Any]:
-                    while True:
-                        if not buffers[key]:
-                            if not await _advance_for(key):
-                                return
-                        yield buffers[key].pop(0)
+                    subscription = broadcast.subscribe()
+                    try:
+                        async for values in subscription:
+                            yield values[key]
+                    finally:
+                        await subscription.aclose()
                 return _iterate()
 
             is_fragmented = source.is_fragmented if isinstance(source, StreamChunkIterator) else True
@@ -3,11 +3,12 @@ from collections.abc import AsyncIterator
 from mindor.dsl.schema.listener import HttpCallbackListenerConfig, HttpCallbackConfig
 from mindor.core.utils.transport.http_request import parse_request_body, parse_options_header
 from mindor.core.foundation.variable.renderer import VariableRenderer
+from mindor.core.utils.transport.http_server import SharedHttpServer, get_shared_http_server
 from ..base import ListenerService, ListenerType, register_listener
 from fastapi import FastAPI, APIRouter, Body, HTTPException, Request
 from fastapi.responses import Response, JSONResponse
 from threading import Lock
-import asyncio, uvicorn
+import asyncio
 
 class HttpCallbackContext:
     def __init__(
@@ -57,7 +58,7 @@ class HttpCallbackListener(ListenerService):
     def __init__(self, id: str, config: HttpCallbackListenerConfig, daemon: bool):
         super().__init__(id, config, daemon)
         
-        self.server: Optional[uvicorn.Server] = None
+        self.server: Optional[SharedHttpServer] = None
         self.app: FastAPI = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
         self.router: APIRouter = APIRouter()
 
@@ -111,20 +112,15 @@ class HttpCallbackListener(ListenerService):
         return True
 
     async def _serve(self) -> None:
-        self.server = uvicorn.Server(uvicorn.Config(
-            self.app, 
-            host=self.config.host, 
-            port=self.config.port, 
-            log_level="info"
-        ))
+        self.server = get_shared_http_server(self.config.host, self.config.port)
         try:
-            await self.server.serve()
+            await self.server.serve(self.config.base_path, self.app)
         finally:
             self.server = None
- 
+
     async def _shutdown(self) -> None:
         if self.server:
-            self.server.should_exit = True
+            self.server.release(self.config.base_path)
 
     def _get_pending_future(self, id: str) -> Optional[asyncio.Future]:
         with self._pending_futures_lock:
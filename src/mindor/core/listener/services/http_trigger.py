@@ -8,10 +8,11 @@ from pydantic import BaseModel
 from mindor.dsl.schema.listener import HttpTriggerListenerConfig, HttpTriggerConfig
 from mindor.core.utils.transport.http_request import parse_request_body, parse_options_header
 from mindor.core.foundation.variable.renderer import VariableRenderer
+from mindor.core.utils.transport.http_server import SharedHttpServer, get_shared_http_server
 from ..base import ListenerService, ListenerType, register_listener
 from fastapi import FastAPI, APIRouter, Body, HTTPException, Request
 from fastapi.responses import Response, JSONResponse
-import asyncio, uvicorn
+import asyncio
 
 if TYPE_CHECKING:
     from mindor.core.controller import ControllerService, TaskState
@@ -80,7 +81,7 @@ class HttpTriggerListener(ListenerService):
     def __init__(self, id: str, config: HttpTriggerListenerConfig, daemon: bool):
         super().__init__(id, config, daemon)
 
-        self.server: Optional[uvicorn.Server] = None
+        self.server: Optional[SharedHttpServer] = None
         self.app: FastAPI = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
         self.router: APIRouter = APIRouter()
 
@@ -132,17 +133,12 @@ class HttpTriggerListener(ListenerService):
             return JSONResponse(content=TaskStateResult.to_dict(states[0]))
 
     async def _serve(self) -> None:
-        self.server = uvicorn.Server(uvicorn.Config(
-            self.app,
-            host=self.config.host,
-            port=self.config.port,
-            log_level="info"
-        ))
+        self.server = get_shared_http_server(self.config.host, self.config.port)
         try:
-            await self.server.serve()
+            await self.server.serve(self.config.base_path, self.app)
         finally:
             self.server = None
 
     async def _shutdown(self) -> None:
         if self.server:
-            self.server.should_exit = True
+            self.server.release(self.config.base_path)
@@ -0,0 +1,179 @@
+from typing import Callable, Awaitable, Optional, Tuple, Dict, List, Hashable, Any
+from collections import deque
+from dataclasses import dataclass, field
+from .work_queue import WorkQueue
+from .statistics import summarize_durations
+from mindor.core.errors import ShutdownError, OverloadedError
+import asyncio, heapq, itertools, time
+
+@dataclass(order=True)
+class _QueueEntry:
+    sort_key: Tuple[int, int]
+    group: Hashable = field(compare=False)
+    item: Tuple[Tuple[Any, ...], Dict[str, Any], asyncio.Future] = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    removed: bool = field(default=False, compare=False)
+
+class FairPriorityQueue:
+    """Drop-in replacement for the `asyncio.Queue` used by `WorkQueue`.
+
+    Entries are grouped by a fairness key. The highest priority waiting in any
+    group is served first; groups tied on priority are served round-robin, so a
+    burst from one workflow or session cannot starve the others.
+    """
+    def __init__(self, on_dequeue: Optional[Callable[[asyncio.Future, float], None]] = None):
+        self._groups: Dict[Hashable, List[_QueueEntry]] = {}
+        self._served_at: Dict[Hashable, int] = {}
+        self._sequence = itertools.count()
+        self._size: int = 0
+        self._held: int = 0
+        self._not_empty: asyncio.Event = asyncio.Event()
+        self._on_dequeue = on_dequeue
+
+    def qsize(self) -> int:
+        return self._size
+
+    @property
+    def held_count(self) -> int:
+        """Entries not yet popped by a worker, including cancelled or expired ones."""
+        return self._held
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def put_nowait(self, item: Tuple[Tuple[Any, ...], Dict[str, Any], asyncio.Future], priority: int = 0, group: Hashable = None) -> None:
+        entry = _QueueEntry((-priority, next(self._sequence)), group, item, time.monotonic())
+        if group not in self._groups:
+            # A group joining the rotation queues up behind the groups already waiting.
+            self._groups[group] = []
+            self._served_at[group] = next(self._sequence)
+
+        heapq.heappush(self._groups[group], entry)
+        self._size += 1
+        self._held += 1
+        self._not_empty.set()
+
+        # Futures cancelled or expired while queued stop counting towards the
+        # depth immediately; the worker pops and discards them later.
+        item[2].add_done_callback(lambda _: self._discard(entry))
+
+    async def put(self, item: Tuple[Tuple[Any, ...], Dict[str, Any], asyncio.Future]) -> None:
+        self.put_nowait(item)
+
+    async def get(self) -> Tuple[Tuple[Any, ...], Dict[str, Any], asyncio.Future]:
+        while not self._groups:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        return self.get_nowait()
+
+    def get_nowait(self) -> Tuple[Tuple[Any, ...], Dict[str, Any], asyncio.Future]:
+        if not self._groups:
+            raise asyncio.QueueEmpty
+
+        group = min(self._groups, key=lambda key: (self._groups[key][0].sort_key[0], self._served_at[key]))
+        entries = self._groups[group]
+        entry = heapq.heappop(entries)
+
+        self._held -= 1
+
+        if entries:
+            self._served_at[group] = next(self._sequence)
+        else:
+            del self._groups[group]
+            del self._served_at[group]
+
+        if not entry.removed:
+            entry.removed = True
+            self._size -= 1
+            if self._on_dequeue:
+                self._on_dequeue(entry.item[2], time.monotonic() - entry.enqueued_at)
+
+        return entry.item
+
+    def task_done(self) -> None:
+        pass
+
+    def _discard(self, entry: _QueueEntry) -> None:
+        if not entry.removed:
+            entry.removed = True
+            self._size -= 1
+
+class AdmissionWorkQueue(WorkQueue):
+    """`WorkQueue` with bounded depth, queue deadlines, priorities and fair-share groups.
+
+    Requests beyond `max_queue_size` fail fast with `OverloadedError` instead of
+    piling up, and requests that wait longer than `queue_timeout` expire, so the
+    latency of admitted work stays bounded under overload.
+    """
+    def __init__(
+        self,
+        max_concurrent_count: int,
+        handler: Callable[..., Awaitable[Any]],
+        max_queue_size: int = 0,
+        queue_timeout: Optional[float] = None,
+        wait_time_window: int = 1024
+    ):
+        super().__init__(max_concurrent_count, handler)
+
+        self.max_queue_size: int = max_queue_size
+        self.queue_timeout: Optional[float] = queue_timeout
+
+        self._wait_times: deque = deque(maxlen=wait_time_window)
+        self._expiry_handles: Dict[asyncio.Future, asyncio.TimerHandle] = {}
+        self._admitted_count: int = 0
+        self._rejected_count: int = 0
+        self._expired_count: int = 0
+
+    def _create_queue(self) -> FairPriorityQueue:
+        return FairPriorityQueue(on_dequeue=self._handle_dequeue)
+
+    async def schedule(self, *args: Any, priority: int = 0, group: Hashable = None, **kwargs: Any) -> asyncio.Future:
+        if not self.queue:
+            raise RuntimeError("Queue not started")
+
+        if self.draining or self.stopped:
+            raise ShutdownError("Queue is shutting down")
+
+        if self.max_queue_size > 0 and self.queue.qsize() >= self.max_queue_size:
+            self._rejected_count += 1
+            raise OverloadedError(f"Task queue is full ({self.max_queue_size} waiting)")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._active_counter.acquire()
+        self._admitted_count += 1
+        self.queue.put_nowait((args, kwargs, future), priority=priority, group=group)
+
+        if self.queue_timeout:
+            self._expiry_handles[future] = loop.call_later(self.queue_timeout, self._expire, future)
+            future.add_done_callback(self._cancel_expiry)
+
+        return future
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queue.qsize() if self.queue else 0,
+            "running": self._active_counter.count - (self.queue.held_count if self.queue else 0),
+            "admitted": self._admitted_count,
+            "rejected": self._rejected_count,
+            "expired": self._expired_count,
+            "wait_time": summarize_durations(self._wait_times),
+        }
+
+    def _handle_dequeue(self, future: asyncio.Future, wait_time: float) -> None:
+        self._wait_times.append(wait_time)
+        self._cancel_expiry(future)
+
+    def _cancel_expiry(self, future: asyncio.Future) -> None:
+        handle = self._expiry_handles.pop(future, None)
+
+        if handle:
+            handle.cancel()
+
+    def _expire(self, future: asyncio.Future) -> None:
+        self._expiry_handles.pop(future, None)
+
+        if not future.done():
+            self._expired_count += 1
+            future.set_exception(OverloadedError(f"Task expired after waiting {self.queue_timeout}s in the queue"))
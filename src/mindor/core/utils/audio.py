@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-from typing import Union, Literal, Tuple, Optional, Dict, Set, Any
+from typing import Union, Literal, Tuple, Optional, Dict, List, Set, Any
 import struct
 
 if TYPE_CHECKING:
@@ -28,6 +28,16 @@ _PCM_FORMAT_NUMPY_DTYPE_MAP: Dict[str, str] = {
     "f64le": "<f8",
 }
 
+_PCM_CODEC_FORMAT_MAP: Dict[str, str] = {
+    "pcm_s16le": "s16le",
+    "pcm_s32le": "s32le",
+    "pcm_f32le": "f32le",
+    "pcm_f64le": "f64le",
+}
+
+_WAVE_FORMAT_PCM: int = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT: int = 0x0003
+
 # Audio container formats whose headers sit at the front of the stream, so
 # ffmpeg can decode them straight off pipe:0 without needing to seek. Formats
 # like m4a/mp4 keep the moov atom at the end and must be spooled to a file.
@@ -213,6 +223,167 @@ def parse_wav_header(data: bytes) -> Optional[Tuple[int, Dict[str, Any]]]:
 
     return None
 
+class WavAudio:
+    """A PCM WAV held in memory as interleaved sample bytes plus their layout.
+
+    Trimming and joining work on the raw bytes, so they keep the source's
+    samples exactly. Mixing, gain and resampling go through float32 waveforms
+    shaped (frames, channels) via :meth:`to_waveform` / :meth:`from_waveform`.
+    """
+    def __init__(self, data: bytes, sample_rate: int, channels: int, format: str):
+        self.data: bytes = data
+        self.sample_rate: int = sample_rate
+        self.channels: int = channels
+        self.format: str = format
+
+    @property
+    def frame_size(self) -> int:
+        return self.channels * get_pcm_sample_width(self.format)
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.data) // self.frame_size
+
+    @property
+    def duration(self) -> float:
+        return self.frame_count / self.sample_rate
+
+    def matches(self, other: WavAudio) -> bool:
+        return (self.sample_rate, self.channels, self.format) == (other.sample_rate, other.channels, other.format)
+
+    def slice(self, start_time: float, end_time: Optional[float] = None) -> WavAudio:
+        start_frame = min(self.frame_count, max(0, round(start_time * self.sample_rate)))
+        end_frame = self.frame_count if end_time is None else min(self.frame_count, max(start_frame, round(end_time * self.sample_rate)))
+
+        return WavAudio(self.data[start_frame * self.frame_size:end_frame * self.frame_size], self.sample_rate, self.channels, self.format)
+
+    def to_waveform(self) -> np.ndarray:
+        waveform = decode_pcm_to_waveform(self.data, self.format, "float32", self.channels)
+
+        return waveform.reshape(-1, 1) if self.channels == 1 else waveform.T
+
+    def to_bytes(self) -> bytes:
+        sample_width = get_pcm_sample_width(self.format)
+        format_tag   = _WAVE_FORMAT_IEEE_FLOAT if self.format.startswith("f") else _WAVE_FORMAT_PCM
+
+        return (
+            b"RIFF" + struct.pack("<I", 36 + len(self.data)) + b"WAVE"
+            + b"fmt " + struct.pack("<I", 16)
+            + struct.pack("<HHIIHH", format_tag, self.channels, self.sample_rate, self.sample_rate * self.frame_size, self.frame_size, sample_width * 8)
+            + b"data" + struct.pack("<I", len(self.data))
+            + self.data
+        )
+
+    def convert(self, sample_rate: Optional[int] = None, channels: Optional[int] = None, format: Optional[str] = None) -> WavAudio:
+        """Resample, remix and/or re-encode; returns `self` when nothing changes."""
+        sample_rate = sample_rate or self.sample_rate
+        channels    = channels or self.channels
+        format      = format or self.format
+
+        if (sample_rate, channels, format) == (self.sample_rate, self.channels, self.format):
+            return self
+
+        waveform = self.to_waveform()
+
+        if sample_rate != self.sample_rate:
+            waveform = resample_waveform(waveform, sample_rate / self.sample_rate)
+
+        if channels != self.channels:
+            waveform = remix_waveform(waveform, channels)
+
+        return WavAudio.from_waveform(waveform, sample_rate, format)
+
+    @classmethod
+    def from_waveform(cls, waveform: np.ndarray, sample_rate: int, format: str = "s16le") -> WavAudio:
+        # Flatten the interleaved frames so encode_waveform_to_pcm can't mistake
+        # a short (frames, channels) array for a channels-first one.
+        data, _ = encode_waveform_to_pcm(waveform.reshape(-1), format=format)
+
+        return cls(data, sample_rate, int(waveform.shape[1]), format)
+
+def parse_wav(data: bytes) -> Optional[WavAudio]:
+    """Load a complete WAV file held in ``data``. Returns ``None`` unless it is
+    plain integer or IEEE float PCM that :class:`WavAudio` can work on.
+    """
+    header = parse_wav_header(data)
+
+    if header is None:
+        return None
+
+    header_size, attrs = header
+    format_tag = struct.unpack_from("<H", data, data.find(b"fmt ", 12) + 8)[0]
+
+    # 8-bit WAV is unsigned (offset by 128), which the signed PCM helpers here
+    # don't model; leave it to ffmpeg.
+    if format_tag == _WAVE_FORMAT_PCM and attrs["bit_depth"] != 8:
+        format = _PCM_BIT_DEPTH_FORMAT_MAP.get(attrs["bit_depth"])
+    elif format_tag == _WAVE_FORMAT_IEEE_FLOAT:
+        format = { 32: "f32le", 64: "f64le" }.get(attrs["bit_depth"])
+    else:
+        format = None
+
+    if format is None or attrs["channels"] < 1 or attrs["sample_rate"] < 1:
+        return None
+
+    # Streaming writers leave the size fields unset (0 or 0xFFFFFFFF); read to the end then.
+    (data_size,) = struct.unpack_from("<I", data, header_size - 4)
+    data_end = header_size + data_size if 0 < data_size < 0xFFFFFFFF else len(data)
+    frame_size = attrs["channels"] * get_pcm_sample_width(format)
+    samples = data[header_size:min(data_end, len(data))]
+
+    return WavAudio(samples[:len(samples) - len(samples) % frame_size], attrs["sample_rate"], attrs["channels"], format)
+
+def concat_wavs(wavs: List[WavAudio]) -> WavAudio:
+    """Join WAVs that share one layout end-to-end without decoding them."""
+    for wav in wavs[1:]:
+        if not wav.matches(wavs[0]):
+            raise ValueError("Cannot concatenate WAVs with different sample rates, channels or sample formats")
+
+    return WavAudio(b"".join(wav.data for wav in wavs), wavs[0].sample_rate, wavs[0].channels, wavs[0].format)
+
+def resample_waveform(waveform: np.ndarray, ratio: float) -> np.ndarray:
+    """Resample a (frames, channels) waveform by `ratio` (target rate / source rate)
+    with linear interpolation. Cheap and adequate for speech and short clips; use
+    ffmpeg's resampler when quality matters more than latency.
+    """
+    import numpy as np
+
+    frame_count = int(round(waveform.shape[0] * ratio))
+    positions = np.arange(frame_count, dtype=np.float64) / ratio
+    frames = np.arange(waveform.shape[0], dtype=np.float64)
+
+    return np.stack([ np.interp(positions, frames, waveform[:, channel]) for channel in range(waveform.shape[1]) ], axis=1).astype(np.float32)
+
+def remix_waveform(waveform: np.ndarray, channels: int) -> np.ndarray:
+    """Downmix a (frames, channels) waveform to mono by averaging, or copy mono to every channel."""
+    import numpy as np
+
+    if channels == 1:
+        return waveform.mean(axis=1, keepdims=True)
+
+    if waveform.shape[1] == 1:
+        return np.repeat(waveform, channels, axis=1)
+
+    raise ValueError(f"Cannot remix {waveform.shape[1]} channels to {channels}")
+
+def mix_waveforms(tracks: List[Tuple[np.ndarray, int]], frame_count: int) -> np.ndarray:
+    """Sum `(waveform, start_frame)` tracks into one (frame_count, channels) waveform.
+
+    Tracks are added without normalization, so callers apply any gain first;
+    the encoder clips the result to [-1, 1].
+    """
+    import numpy as np
+
+    mixed = np.zeros((frame_count, tracks[0][0].shape[1]), dtype=np.float32)
+
+    for waveform, start_frame in tracks:
+        end_frame = min(frame_count, start_frame + waveform.shape[0])
+
+        if end_frame > start_frame:
+            mixed[start_frame:end_frame] += waveform[:end_frame - start_frame]
+
+    return mixed
+
 def is_streamable_audio_format(format: Optional[str]) -> bool:
     """True if the audio format can be fed to ffmpeg's pipe:0 without seeking."""
     return format in _STREAMABLE_AUDIO_FORMATS or format in _PCM_FORMATS
@@ -229,6 +400,14 @@ def get_pcm_format(bit_depth: int, default: str = "s16le") -> str:
     """Raw PCM format identifier for a given bit depth. Returns `default` if unknown."""
     return _PCM_BIT_DEPTH_FORMAT_MAP.get(int(bit_depth), default)
 
+def get_pcm_sample_width(format: str) -> int:
+    """Bytes per sample of a raw PCM format identifier (3 for s24le)."""
+    return 3 if format == "s24le" else get_pcm_dtype(format).itemsize
+
+def get_pcm_format_for_codec(codec: str) -> Optional[str]:
+    """Raw PCM format written by an ffmpeg PCM codec name, or None for compressed codecs."""
+    return _PCM_CODEC_FORMAT_MAP.get(codec)
+
 def get_pcm_dtype(format: str) -> np.dtype:
     """Numpy dtype for a raw PCM format identifier. Raises ValueError if unsupported."""
     import numpy as np
@@ -1,5 +1,6 @@
-from typing import TypeVar, Generic, Dict, Tuple, Optional, Any
-import time
+from typing import TypeVar, Generic, Dict, Tuple, Hashable, Optional, Any
+from collections import OrderedDict
+import threading, time
 
 T = TypeVar("T")
 
@@ -33,3 +34,38 @@ class ExpiringDict(Generic[T]):
         now = time.time()
         for key in [ key for key, (_, expires_at) in self._store.items() if now >= expires_at ]:
             del self._store[key]
+
+class LRUCache(Generic[T]):
+    """Keeps up to `max_size` entries, evicting the least recently used one first.
+
+    Safe to share between threads, so executor jobs can read and fill the same cache.
+    """
+    def __init__(self, max_size: int):
+        self.max_size: int = max_size
+        self._store: OrderedDict[Hashable, T] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[T]:
+        with self._lock:
+            if key not in self._store:
+                return None
+            self._store.move_to_end(key)
+            return self._store[key]
+
+    def set(self, key: Hashable, value: T) -> None:
+        with self._lock:
+            self._store[key] = value
+            self._store.move_to_end(key)
+            while len(self._store) > self.max_size:
+                self._store.popitem(last=False)
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            self._store.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+
+    def __len__(self) -> int:
+        return len(self._store)
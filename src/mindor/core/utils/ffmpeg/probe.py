@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Sequence, Tuple
+from typing import Any, Dict, Optional, Sequence, Tuple, List, Set
 from ..files import get_file_extension
 from ..shell import run_command
 import json
@@ -112,3 +112,37 @@ async def probe_audio(input_path: str, fields: Sequence[str]) -> Tuple[Any, ...]
     'codec', 'sample_rate', 'channels', 'channel_layout' (from the first audio stream).
     """
     return await _probe(input_path, fields, "a:0", _AUDIO_FIELDS)
+
+async def probe_keyframes(input_path: str, positions: Sequence[float]) -> List[float]:
+    """Return the time of the keyframe at or before each of `positions` in the first video stream.
+
+    Each position is read with a seek and a single packet (`-read_intervals`), so
+    the cost does not grow with the length of the video. Duplicates are removed
+    and the result is sorted.
+    """
+    if not positions:
+        return []
+
+    intervals = ",".join(f"{position:.6f}%+#1" for position in positions)
+    command = [
+        "ffprobe", "-v", "quiet", "-select_streams", "v:0",
+        "-read_intervals", intervals,
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "csv=p=0",
+        input_path,
+    ]
+
+    stdout, _, returncode = await run_command(command)
+
+    if returncode != 0:
+        raise RuntimeError(f"ffprobe failed to read keyframes (exit code {returncode})")
+
+    keyframes: Set[float] = set()
+
+    for line in stdout.decode("utf-8").splitlines():
+        pts_time, _, flags = line.partition(",")
+
+        if "K" in flags and pts_time not in ("", "N/A"):
+            keyframes.add(float(pts_time))
+
+    return sorted(keyframes)
@@ -1,7 +1,8 @@
-from typing import Any, List, Tuple
+from typing import Any, Optional, List, Tuple, Deque, Callable, Awaitable
 from collections.abc import AsyncIterator, AsyncIterable
+from collections import deque
 from mindor.core.foundation.streaming.iterators import StreamIterator
-import codecs
+import asyncio, codecs
 
 class BatchSourceIterator:
     """Yield items from a heterogeneous source as batches.
@@ -133,6 +134,65 @@ class BatchSourceIterator:
 
         yield source
 
+class OrderedConcurrentIterator:
+    """Apply an async function to each item of a source with bounded concurrency.
+
+    Source is read the same way as a single-source `BatchSourceIterator`. Up to
+    `concurrency` calls run at once, and each result is yielded as soon as it and
+    every result before it are done, so the output keeps the source order. The
+    source is read while earlier results are pending, so a slow source delays no
+    result that is already done. Calls still in flight are cancelled when
+    iteration stops early.
+    """
+    def __init__(self, source: Any, fn: Callable[[Any], Awaitable[Any]], concurrency: int):
+        self.source: Any = source
+        self.fn: Callable[[Any], Awaitable[Any]] = fn
+        self.concurrency: int = max(1, concurrency)
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._iterate_results()
+
+    async def _iterate_results(self) -> AsyncIterator[Any]:
+        source = BatchSourceIterator(self.source, batch_size=1).__aiter__()
+        pending: Deque[asyncio.Future] = deque()
+        next_batch: Optional[asyncio.Future] = None
+        exhausted = False
+
+        try:
+            while True:
+                if pending and pending[0].done():
+                    yield pending.popleft().result()
+                    continue
+
+                if next_batch is None and not exhausted and len(pending) < self.concurrency:
+                    next_batch = asyncio.ensure_future(self._read_next(source))
+
+                # Wait for whichever comes first, so a slow source never holds back
+                # a head result that is already done.
+                waiters = [ future for future in (next_batch, pending[0] if pending else None) if future is not None ]
+
+                if not waiters:
+                    return
+
+                await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+
+                if next_batch is not None and next_batch.done():
+                    batch, next_batch = next_batch.result(), None
+                    if batch is None:
+                        exhausted = True
+                    else:
+                        pending.append(asyncio.ensure_future(self.fn(batch[0])))
+        finally:
+            for future in (next_batch, *pending):
+                if future is not None:
+                    future.cancel()
+
+    async def _read_next(self, source: AsyncIterator[List[Any]]) -> Optional[List[Any]]:
+        try:
+            return await source.__anext__()
+        except StopAsyncIteration:
+            return None
+
 class TextDecodeIterator:
     """Decode a stream of bytes/str chunks into str chunks, multi-byte safe.
 
@@ -1,4 +1,6 @@
-from typing import Any
+from typing import Union, Optional, Dict, Type, Any
+from abc import ABC, abstractmethod
+import json
 
 _JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
 
@@ -20,3 +22,114 @@ def to_json_safe(value: Any) -> Any:
         return [ to_json_safe(item) for item in value ]
 
     return repr(value)
+
+def _encode_default(value: Any) -> Any:
+    """Fallback for values the encoders cannot serialize on their own.
+
+    numpy arrays and scalars become lists and Python numbers, sets become
+    lists, and anything else is stringified, matching `json.dumps(default=str)`.
+    """
+    if hasattr(value, "tolist") and type(value).__module__ == "numpy":
+        return value.tolist()
+
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+
+    return str(value)
+
+class JsonSerializer(ABC):
+    """Compact UTF-8 JSON encoder/decoder used on the controller hot paths.
+
+    `loads` raises `ValueError` (or a subclass) on malformed input, whichever
+    backend is active.
+    """
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        pass
+
+    def loads(self, data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        return json.loads(data)
+
+class StdlibJsonSerializer(JsonSerializer):
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_encode_default).encode("utf-8")
+
+class OrjsonSerializer(JsonSerializer):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value, default=_encode_default, option=self._options)
+
+    def loads(self, data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        return self._orjson.loads(data)
+
+class MsgspecJsonSerializer(JsonSerializer):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder(enc_hook=_encode_default)
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+    def loads(self, data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
+
+JsonSerializerRegistry: Dict[str, Type[JsonSerializer]] = {
+    OrjsonSerializer.name:      OrjsonSerializer,
+    MsgspecJsonSerializer.name: MsgspecJsonSerializer,
+    StdlibJsonSerializer.name:  StdlibJsonSerializer,
+}
+
+_serializer: Optional[JsonSerializer] = None
+
+def get_json_serializer() -> JsonSerializer:
+    """Returns the active serializer, picking the first installed backend in
+    registry order (orjson, msgspec, then the standard library) on first use."""
+    global _serializer
+
+    if _serializer is None:
+        for serializer_type in JsonSerializerRegistry.values():
+            try:
+                _serializer = serializer_type()
+                break
+            except ImportError:
+                continue
+
+    return _serializer
+
+def set_json_serializer(name: str) -> JsonSerializer:
+    global _serializer
+
+    try:
+        _serializer = JsonSerializerRegistry[name]()
+    except KeyError:
+        raise ValueError(f"Unsupported JSON serializer: {name}")
+
+    return _serializer
+
+def json_dumps(value: Any) -> bytes:
+    return get_json_serializer().dumps(value)
+
+def json_dumps_str(value: Any) -> str:
+    return get_json_serializer().dumps(value).decode("utf-8")
+
+def json_loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    return get_json_serializer().loads(data)
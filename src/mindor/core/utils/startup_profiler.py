@@ -0,0 +1,83 @@
+from typing import Optional, Callable, Iterator, List
+from dataclasses import dataclass
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+import time
+
+@dataclass
+class StartupRecord:
+    phase: str
+    subsystem: str
+    started_at: float
+    duration: float
+    depth: int
+    note: Optional[str] = None
+
+class StartupProfiler:
+    """Records how long each startup phase takes per subsystem.
+
+    Disabled by default, in which case `measure()` costs a single attribute check.
+    Once enabled, the report is rendered and handed to the reporter the first
+    time `complete()` is called.
+    """
+    def __init__(self):
+        self.enabled: bool = False
+        self.records: List[StartupRecord] = []
+        self._reporter: Optional[Callable[[str], None]] = None
+        self._started_at: float = 0.0
+        self._depth: ContextVar[int] = ContextVar("startup_profiler_depth", default=0)
+
+    def enable(self, reporter: Callable[[str], None]) -> None:
+        self.enabled = True
+        self.records = []
+        self._reporter = reporter
+        self._started_at = time.perf_counter()
+
+    def measure(self, phase: str, subsystem: str):
+        if not self.enabled:
+            return nullcontext()
+        return self._measure(phase, subsystem)
+
+    def annotate(self, phase: str, subsystem: str, note: str) -> None:
+        for record in reversed(self.records):
+            if record.phase == phase and record.subsystem == subsystem:
+                record.note = note
+                break
+
+    def complete(self) -> None:
+        if not self.enabled:
+            return
+
+        self.enabled = False
+        if self._reporter:
+            self._reporter(self.render_report())
+
+    def render_report(self) -> str:
+        lines = [ "Startup profile:", f"  {'phase':<10} {'subsystem':<40} {'start':>9} {'duration':>9}" ]
+
+        for record in sorted(self.records, key=lambda record: record.started_at):
+            subsystem = "  " * record.depth + record.subsystem
+            note = f"  ({record.note})" if record.note else ""
+            lines.append(f"  {record.phase:<10} {subsystem:<40} {self._format_ms(record.started_at - self._started_at):>9} {self._format_ms(record.duration):>9}{note}")
+
+        lines.append(f"  {'total':<10} {'':<40} {'':>9} {self._format_ms(time.perf_counter() - self._started_at):>9}")
+
+        return "\n".join(lines)
+
+    @contextmanager
+    def _measure(self, phase: str, subsystem: str) -> Iterator[None]:
+        depth = self._depth.get()
+        token = self._depth.set(depth + 1)
+        started_at = time.perf_counter()
+        record = StartupRecord(phase, subsystem, started_at, 0.0, depth)
+        self.records.append(record)
+        try:
+            yield
+        finally:
+            record.duration = time.perf_counter() - started_at
+            self._depth.reset(token)
+
+    def _format_ms(self, seconds: float) -> str:
+        return f"{seconds * 1000:.1f}ms"
+
+startup_profiler = StartupProfiler()
@@ -0,0 +1,19 @@
+from typing import Iterable, Dict, List
+
+def summarize_durations(values: Iterable[float]) -> Dict[str, float]:
+    """Returns the average, median, 95th percentile and maximum of a set of
+    durations, all 0.0 when there are none."""
+    values = sorted(values)
+
+    return {
+        "avg": sum(values) / len(values) if values else 0.0,
+        "p50": percentile(values, 0.50),
+        "p95": percentile(values, 0.95),
+        "max": values[-1] if values else 0.0,
+    }
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
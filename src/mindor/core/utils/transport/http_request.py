@@ -3,7 +3,8 @@ from requests.structures import CaseInsensitiveDict
 from starlette.datastructures import FormData, UploadFile
 from urllib.parse import urlencode
 from fastapi import Request
-import aiohttp, re, json, os
+from mindor.core.utils.json import json_dumps, json_loads
+import aiohttp, re, os
 
 _TOKEN_PATTERN = r"([\w!#$%&'*+\-.^_`|~]+)"
 _QUOTED_PATTERN = r'"([^"]*)"'
@@ -39,7 +40,7 @@ class NestedFormParser:
 
 def build_request_body(body: Any, content_type: Optional[str]) -> Any:
     if content_type == "application/json":
-        return json.dumps(body)
+        return json_dumps(body)
     
     if content_type == "multipart/form-data":
         return build_request_form(body)
@@ -74,7 +75,7 @@ async def parse_request_body(request: Request, content_type: str, nested: bool =
         return await parse_request_form(request, nested)
 
     if content_type == "application/json":
-        return await request.json()
+        return json_loads(await request.body())
 
     if content_type.startswith("text/"):
         return str(await request.body())
@@ -0,0 +1,130 @@
+from typing import Optional, Dict, List, Tuple
+from starlette.types import ASGIApp, Scope, Receive, Send
+from starlette.responses import PlainTextResponse
+from starlette.websockets import WebSocketClose
+import asyncio, uvicorn
+
+class SharedHttpServer:
+    """A single uvicorn server shared by every HTTP-facing service bound to the
+    same host and port.
+
+    Each service mounts its own ASGI app under its base path, and requests go
+    to the app with the longest matching path prefix. The path is passed on
+    unchanged, since the apps already register their routes under that base path.
+    The server starts with the first mount and stops after the last one is released.
+    """
+    def __init__(self, host: str, port: int):
+        self.host: str = host
+        self.port: int = port
+        self.server: Optional[uvicorn.Server] = None
+
+        self._mounts: Dict[str, ASGIApp] = {}
+        self._routes: List[Tuple[str, ASGIApp]] = []
+        self._released: Dict[str, asyncio.Event] = {}
+        self._serve_task: Optional[asyncio.Task] = None
+
+    async def serve(self, base_path: Optional[str], app: ASGIApp) -> None:
+        """Mounts `app` under `base_path` and serves it until `release()` is called
+        for the same path or the server stops."""
+        prefix = _normalize_prefix(base_path)
+
+        if prefix in self._mounts:
+            raise ValueError(f"An HTTP service is already mounted at '{prefix or '/'}' on {self.host}:{self.port}")
+
+        released = asyncio.Event()
+        self._mounts[prefix] = app
+        self._released[prefix] = released
+        self._update_routes()
+
+        try:
+            if self._serve_task is None:
+                self.server = uvicorn.Server(uvicorn.Config(self, host=self.host, port=self.port, log_level="info"))
+                self._serve_task = asyncio.create_task(self.server.serve())
+
+            serve_task = self._serve_task
+            release_task = asyncio.create_task(released.wait())
+
+            try:
+                await asyncio.wait([ serve_task, release_task ], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                release_task.cancel()
+
+            if serve_task.done() and not released.is_set():
+                serve_task.result()
+        finally:
+            self._mounts.pop(prefix, None)
+            self._released.pop(prefix, None)
+            self._update_routes()
+
+            if not self._mounts:
+                await self._stop()
+
+    def release(self, base_path: Optional[str]) -> None:
+        released = self._released.get(_normalize_prefix(base_path))
+
+        if released:
+            released.set()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._handle_lifespan(receive, send)
+            return
+
+        app = self._resolve_app(scope.get("path", ""))
+
+        if app is not None:
+            await app(scope, receive, send)
+            return
+
+        if scope["type"] == "websocket":
+            await WebSocketClose()(scope, receive, send)
+        else:
+            await PlainTextResponse("Not Found", status_code=404)(scope, receive, send)
+
+    def _resolve_app(self, path: str) -> Optional[ASGIApp]:
+        for prefix, app in self._routes:
+            if not prefix or path == prefix or path.startswith(prefix + "/"):
+                return app
+
+        return None
+
+    def _update_routes(self) -> None:
+        self._routes = sorted(self._mounts.items(), key=lambda route: len(route[0]), reverse=True)
+
+    async def _handle_lifespan(self, receive: Receive, send: Send) -> None:
+        # Mounted apps come and go while the server runs, so none of them get lifespan events.
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({ "type": "lifespan.startup.complete" })
+            elif message["type"] == "lifespan.shutdown":
+                await send({ "type": "lifespan.shutdown.complete" })
+                return
+
+    async def _stop(self) -> None:
+        _servers.pop((self.host, self.port), None)
+
+        if self._serve_task is not None:
+            self.server.should_exit = True
+            try:
+                await asyncio.shield(self._serve_task)
+            except (Exception, SystemExit):
+                pass
+            self._serve_task = None
+            self.server = None
+
+def _normalize_prefix(base_path: Optional[str]) -> str:
+    prefix = (base_path or "").strip().rstrip("/")
+
+    if prefix and not prefix.startswith("/"):
+        prefix = "/" + prefix
+
+    return prefix
+
+_servers: Dict[Tuple[str, int], SharedHttpServer] = {}
+
+def get_shared_http_server(host: str, port: int) -> SharedHttpServer:
+    if (host, port) not in _servers:
+        _servers[(host, port)] = SharedHttpServer(host, port)
+
+    return _servers[(host, port)]
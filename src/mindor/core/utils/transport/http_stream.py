@@ -1,5 +1,6 @@
-from typing import List, Any
+from typing import Union, Optional, List, Any
 from collections.abc import AsyncIterator, AsyncIterable
+import asyncio
 
 class HttpEventStreamer:
     def __init__(self, iterator: AsyncIterable):
@@ -10,10 +11,7 @@ class HttpEventStreamer:
             if chunk is None:
                 continue
 
-            for line in self._split_chunk(chunk):
-                yield b"data: " + line + b"\n"
-
-            yield b"\n"
+            yield b"".join([ b"data: " + line + b"\n" for line in self._split_chunk(chunk) ]) + b"\n"
 
     def _split_chunk(self, chunk: Any) -> List[bytes]:
         if isinstance(chunk, str):
@@ -23,3 +21,84 @@ class HttpEventStreamer:
             return [ line for line in chunk.split(b"\n") ]
 
         return [ chunk ]
+
+_END = object()
+_FLUSH = object()
+
+class HttpChunkCoalescer:
+    """Merges consecutive response body chunks into fewer, larger writes.
+
+    Chunks are buffered until `max_bytes` are pending or `max_delay` seconds
+    have passed since the first buffered chunk, whichever comes first. Only the
+    write boundaries change, so already-framed data such as SSE events reaches
+    the client unchanged. Buffered data is flushed before the stream ends or
+    its error is raised.
+    """
+    def __init__(self, iterator: AsyncIterable, max_delay: float, max_bytes: int, max_pending_count: int = 256):
+        self.iterator: AsyncIterable = iterator
+        self.max_delay: float = max_delay
+        self.max_bytes: int = max_bytes
+        self.max_pending_count: int = max_pending_count
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending_count)
+        reader = asyncio.create_task(self._read(queue))
+        reader.add_done_callback(lambda _: self._put_nowait(queue, _END))
+        buffer: List[bytes] = []
+        buffered_size, deadline, timer = 0, 0.0, None
+
+        try:
+            while not (reader.done() and queue.empty()):
+                item = await queue.get()
+
+                if item is _END:
+                    break
+
+                if item is not _FLUSH:
+                    if not buffer:
+                        deadline = loop.time() + self.max_delay
+                        timer = loop.call_later(self.max_delay, self._put_nowait, queue, _FLUSH)
+
+                    buffer.append(item)
+                    buffered_size += len(item)
+
+                if buffer and (buffered_size >= self.max_bytes or loop.time() >= deadline):
+                    timer.cancel()
+                    yield b"".join(buffer)
+                    buffer, buffered_size = [], 0
+
+            if buffer:
+                yield b"".join(buffer)
+                buffer = []
+
+            if reader.cancelled():
+                raise asyncio.CancelledError()
+
+            if reader.exception():
+                raise reader.exception()
+        finally:
+            if timer:
+                timer.cancel()
+
+            if not reader.done():
+                reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+
+    async def _read(self, queue: asyncio.Queue) -> None:
+        async for chunk in self.iterator:
+            if chunk is None:
+                continue
+
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            elif not isinstance(chunk, bytes):
+                chunk = bytes(memoryview(chunk))
+
+            await queue.put(chunk)
+
+    def _put_nowait(self, queue: asyncio.Queue, item: Any) -> None:
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            pass  # The consumer is still draining chunks and checks the deadline and the reader for each.
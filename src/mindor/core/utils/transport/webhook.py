@@ -0,0 +1,379 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from typing import Optional, Dict, List, Tuple, Set, Any
+from dataclasses import dataclass, field
+from collections import deque
+from mindor.core.utils.json import json_dumps_str, json_loads
+from mindor.core.utils.statistics import summarize_durations
+from mindor.core.logger import logging
+import aiohttp, asyncio, os, random, time
+
+if TYPE_CHECKING:
+    from aiosqlite import Connection as AsyncConnection
+
+_RETRYABLE_STATUS_CODES = (408, 425, 429)
+
+@dataclass
+class WebhookDelivery:
+    url: str
+    headers: Dict[str, str]
+    body: bytes
+    created_at: float = field(default_factory=time.time)
+    attempts: int = 0
+    id: Optional[int] = None
+
+    @property
+    def batch_key(self) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        return (self.url, tuple(sorted(self.headers.items())))
+
+class WebhookOutbox:
+    """Deliveries not yet acknowledged by their receivers, kept in a SQLite
+    database so that they are retried after a restart."""
+    def __init__(self, path: str):
+        self.path: str = path
+        self.connection: Optional[AsyncConnection] = None
+
+    async def open(self) -> None:
+        import aiosqlite
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.connection = await aiosqlite.connect(self.path, isolation_level=None)
+
+        await self.connection.execute("PRAGMA journal_mode=WAL")
+        await self.connection.execute("PRAGMA synchronous=NORMAL")
+        await self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS webhook_deliveries ("
+            "  id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            "  url TEXT NOT NULL,"
+            "  headers TEXT NOT NULL,"
+            "  body BLOB NOT NULL,"
+            "  created_at REAL NOT NULL,"
+            "  attempts INTEGER NOT NULL DEFAULT 0,"
+            "  next_attempt_at REAL NOT NULL"
+            ")"
+        )
+
+    async def close(self) -> None:
+        if self.connection:
+            await self.connection.close()
+            self.connection = None
+
+    async def add(self, delivery: WebhookDelivery) -> None:
+        async with self.connection.execute(
+            "INSERT INTO webhook_deliveries (url, headers, body, created_at, next_attempt_at) VALUES (?, ?, ?, ?, ?)",
+            (delivery.url, json_dumps_str(delivery.headers), delivery.body, delivery.created_at, delivery.created_at),
+        ) as cursor:
+            delivery.id = cursor.lastrowid
+
+    async def reschedule(self, deliveries: List[WebhookDelivery], next_attempt_at: float) -> None:
+        await self.connection.executemany(
+            "UPDATE webhook_deliveries SET attempts = ?, next_attempt_at = ? WHERE id = ?",
+            [ (delivery.attempts, next_attempt_at, delivery.id) for delivery in deliveries ],
+        )
+
+    async def remove(self, deliveries: List[WebhookDelivery]) -> None:
+        ids = [ delivery.id for delivery in deliveries if delivery.id is not None ]
+
+        if not ids:
+            return
+
+        placeholders = ",".join("?" * len(ids))
+
+        await self.connection.execute(f"DELETE FROM webhook_deliveries WHERE id IN ({placeholders})", ids)
+
+    async def load(self) -> List[Tuple[WebhookDelivery, float]]:
+        """Returns every stored delivery together with the time of its next attempt, oldest first."""
+        async with self.connection.execute(
+            "SELECT id, url, headers, body, created_at, attempts, next_attempt_at FROM webhook_deliveries ORDER BY id"
+        ) as cursor:
+            rows = await cursor.fetchall()
+
+        return [
+            (WebhookDelivery(url, json_loads(headers), bytes(body), created_at, attempts, id), next_attempt_at)
+            for id, url, headers, body, created_at, attempts, next_attempt_at in rows
+        ]
+
+class WebhookDispatcher:
+    """Delivers JSON payloads to webhook URLs from a bounded pool of workers.
+
+    Requests share one connection pool, so connections to the same host are
+    kept alive and reused. Failed deliveries are retried with exponential
+    backoff and jitter until `max_retries` is exhausted; with an outbox, pending
+    deliveries are persisted and picked up again after a restart. When
+    `batch_size` is greater than 1, payloads for the same URL and headers that
+    arrive within `batch_interval` are posted together as a JSON array.
+    """
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        max_connections_per_host: int = 4,
+        timeout: float = 30.0,
+        max_retries: int = 5,
+        retry_backoff: float = 1.0,
+        max_retry_backoff: float = 60.0,
+        batch_size: int = 1,
+        batch_interval: float = 0.0,
+        outbox: Optional[WebhookOutbox] = None,
+        lag_window: int = 1000
+    ):
+        self.max_concurrency: int = max_concurrency
+        self.max_connections_per_host: int = max_connections_per_host
+        self.timeout: float = timeout
+        self.max_retries: int = max_retries
+        self.retry_backoff: float = retry_backoff
+        self.max_retry_backoff: float = max_retry_backoff
+        self.batch_size: int = batch_size
+        self.batch_interval: float = batch_interval
+        self.outbox: Optional[WebhookOutbox] = outbox
+        self.session: Optional[aiohttp.ClientSession] = None
+
+        self._ready: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._buckets: Dict[Tuple, deque] = {}
+        self._scheduled: Set[Tuple] = set()
+        self._batch_timers: Dict[Tuple, asyncio.TimerHandle] = {}
+        self._retry_timers: Set[asyncio.TimerHandle] = set()
+
+        self._pending_count: int = 0
+        self._in_flight_count: int = 0
+        self._delivered_count: int = 0
+        self._retried_count: int = 0
+        self._dropped_count: int = 0
+        self._lags: deque = deque(maxlen=lag_window)
+
+    async def start(self) -> None:
+        if self.session:
+            raise RuntimeError("Webhook dispatcher already started")
+
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.max_connections_per_host),
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        self._ready = asyncio.Queue()
+
+        for _ in range(self.max_concurrency):
+            self._workers.append(asyncio.create_task(self._worker()))
+
+        if self.outbox:
+            await self.outbox.open()
+            await self._restore_outbox()
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """Flushes deliveries that are due, waiting up to `timeout` seconds for them,
+        then stops the workers. Deliveries waiting for a retry are left in the outbox."""
+        if not self.session:
+            return
+
+        for key in list(self._batch_timers):
+            self._flush(key)
+
+        try:
+            await asyncio.wait_for(self._ready.join(), timeout=timeout if timeout is not None else self.timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+        for timer in [ *self._batch_timers.values(), *self._retry_timers ]:
+            timer.cancel()
+        self._batch_timers.clear()
+        self._retry_timers.clear()
+
+        if self._pending_count and not self.outbox:
+            logging.warning("Discarding %d undelivered webhook payload(s) on shutdown", self._pending_count)
+
+        self._buckets.clear()
+        self._scheduled.clear()
+        self._pending_count = 0
+
+        await self.session.close()
+        self.session = None
+
+        if self.outbox:
+            await self.outbox.close()
+
+    async def submit(self, url: str, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        if not self.session:
+            raise RuntimeError("Webhook dispatcher not started")
+
+        delivery = WebhookDelivery(url, { "Content-Type": "application/json", **(headers or {}) }, json_dumps_str(payload).encode("utf-8"))
+
+        if self.outbox:
+            await self.outbox.add(delivery)
+
+        self._pending_count += 1
+        self._enqueue([ delivery ])
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self._pending_count,
+            "in_flight": self._in_flight_count,
+            "delivered": self._delivered_count,
+            "retried": self._retried_count,
+            "dropped": self._dropped_count,
+            "lag": summarize_durations(self._lags),
+        }
+
+    async def _restore_outbox(self) -> None:
+        now = time.time()
+
+        for delivery, next_attempt_at in await self.outbox.load():
+            self._pending_count += 1
+            if next_attempt_at > now:
+                self._schedule_retry([ delivery ], next_attempt_at - now)
+            else:
+                self._enqueue([ delivery ], front=True)
+
+    def _enqueue(self, deliveries: List[WebhookDelivery], front: bool = False) -> None:
+        key = deliveries[0].batch_key
+        bucket = self._buckets.setdefault(key, deque())
+
+        if front:
+            bucket.extendleft(reversed(deliveries))
+        else:
+            bucket.extend(deliveries)
+
+        self._schedule(key, immediate=front)
+
+    def _schedule(self, key: Tuple, immediate: bool = False) -> None:
+        full = len(self._buckets[key]) >= self.batch_size
+
+        if key in self._scheduled:
+            if (immediate or full) and key in self._batch_timers:
+                self._flush(key)
+            return
+
+        self._scheduled.add(key)
+
+        if immediate or full or self.batch_interval <= 0:
+            self._ready.put_nowait(key)
+        else:
+            self._batch_timers[key] = asyncio.get_running_loop().call_later(self.batch_interval, self._flush, key)
+
+    def _flush(self, key: Tuple) -> None:
+        timer = self._batch_timers.pop(key, None)
+
+        if timer:
+            timer.cancel()
+            self._ready.put_nowait(key)
+
+    def _schedule_retry(self, deliveries: List[WebhookDelivery], delay: float) -> None:
+        timer: Optional[asyncio.TimerHandle] = None
+
+        def _requeue() -> None:
+            self._retry_timers.discard(timer)
+            self._enqueue(deliveries, front=True)
+
+        timer = asyncio.get_running_loop().call_later(delay, _requeue)
+        self._retry_timers.add(timer)
+
+    async def _worker(self) -> None:
+        while True:
+            key = await self._ready.get()
+
+            try:
+                self._scheduled.discard(key)
+                bucket = self._buckets.get(key)
+
+                if not bucket:
+                    continue
+
+                batch = [ bucket.popleft() for _ in range(min(self.batch_size, len(bucket))) ]
+
+                if bucket:
+                    self._schedule(key)
+                else:
+                    del self._buckets[key]
+
+                await self._deliver(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logging.exception("Unexpected error while delivering webhook payloads")
+            finally:
+                self._ready.task_done()
+
+    async def _deliver(self, batch: List[WebhookDelivery]) -> None:
+        self._in_flight_count += len(batch)
+
+        try:
+            error, retryable, retry_after = await self._post(batch)
+        finally:
+            self._in_flight_count -= len(batch)
+
+        if error is None:
+            await self._handle_success(batch)
+        else:
+            await self._handle_failure(batch, error, retryable, retry_after)
+
+    async def _post(self, batch: List[WebhookDelivery]) -> Tuple[Optional[str], bool, Optional[float]]:
+        """Posts a batch and returns the error, whether it may be retried, and the
+        delay the receiver asked for; the error is None on success."""
+        url, headers = batch[0].url, batch[0].headers
+
+        if self.batch_size > 1:
+            body = b"[" + b",".join([ delivery.body for delivery in batch ]) + b"]"
+        else:
+            body = batch[0].body
+
+        try:
+            async with self.session.post(url, data=body, headers=headers) as response:
+                await response.read()
+
+                if response.status < 300:
+                    return None, False, None
+
+                retryable = response.status in _RETRYABLE_STATUS_CODES or response.status >= 500
+                return f"HTTP {response.status}", retryable, _parse_retry_after(response.headers.get("Retry-After"))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return str(e) or type(e).__name__, True, None
+
+    async def _handle_success(self, batch: List[WebhookDelivery]) -> None:
+        now = time.time()
+
+        self._pending_count -= len(batch)
+        self._delivered_count += len(batch)
+        self._lags.extend(now - delivery.created_at for delivery in batch)
+
+        if self.outbox:
+            await self.outbox.remove(batch)
+
+    async def _handle_failure(self, batch: List[WebhookDelivery], error: str, retryable: bool, retry_after: Optional[float]) -> None:
+        for delivery in batch:
+            delivery.attempts += 1
+
+        dropped: List[WebhookDelivery] = []
+        retried: List[WebhookDelivery] = []
+
+        for delivery in batch:
+            (retried if retryable and delivery.attempts <= self.max_retries else dropped).append(delivery)
+
+        if dropped:
+            logging.warning("Giving up on %d webhook payload(s) to %s after %d attempt(s): %s", len(dropped), batch[0].url, max(delivery.attempts for delivery in dropped), error)
+            self._pending_count -= len(dropped)
+            self._dropped_count += len(dropped)
+            if self.outbox:
+                await self.outbox.remove(dropped)
+
+        if retried:
+            delay = retry_after if retry_after is not None else self._get_backoff(max(delivery.attempts for delivery in retried))
+            self._retried_count += len(retried)
+            if self.outbox:
+                await self.outbox.reschedule(retried, time.time() + delay)
+            self._schedule_retry(retried, delay)
+
+    def _get_backoff(self, attempts: int) -> float:
+        delay = min(self.max_retry_backoff, self.retry_backoff * (2 ** (attempts - 1)))
+        return random.uniform(delay / 2, delay)
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
@@ -22,8 +22,8 @@ class WorkQueue:
                 break
 
             try:
-                # Skip work that was cancelled while queued — never invoke handler.
-                if future.cancelled():
+                # Skip work that was cancelled (or expired) while queued — never invoke handler.
+                if future.done():
                     continue
 
                 # Run the handler in a child task and await it as an
@@ -62,7 +62,7 @@ class WorkQueue:
         if self.queue:
             raise RuntimeError("Queue already started")
 
-        self.queue = asyncio.Queue()
+        self.queue = self._create_queue()
         self.stopped = False
         self.draining = False
 
@@ -71,6 +71,9 @@ class WorkQueue:
         for _ in range(self.max_concurrent_count):
             self.workers.append(asyncio.create_task(self._worker()))
 
+    def _create_queue(self) -> asyncio.Queue:
+        return asyncio.Queue()
+
     async def schedule(self, *args: Any, **kwargs: Any) -> asyncio.Future:
         if not self.queue:
             raise RuntimeError("Queue not started")
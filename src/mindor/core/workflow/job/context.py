@@ -5,6 +5,7 @@ from mindor.core.foundation.variable.image import ImageValueRenderer
 from mindor.core.foundation.variable.audio import AudioValueRenderer
 from mindor.core.foundation.variable.video import VideoValueRenderer
 from mindor.core.foundation.streaming.media import MediaSource
+from mindor.core.foundation.streaming.broadcast import BroadcastStreamIterator
 from mindor.core.foundation.cancellation import CancellationToken
 from mindor.core.workflow.context import WorkflowContext
 from PIL import Image as PILImage
@@ -63,4 +64,20 @@ class JobContext:
         if key in sources:
             return sources[key][index] if index is not None else sources[key]
 
-        return await self.workflow.resolve_source(key, index, None)
+        source = await self.workflow.resolve_source(key, index, None)
+
+        if key == "jobs" and index is None:
+            return self._bind_shared_outputs(source)
+
+        return source
+
+    def _bind_shared_outputs(self, jobs: Dict[str, Any]) -> Dict[str, Any]:
+        """Shared job output streams read by this job subscribe on its behalf, taking
+        the buffer slots the workflow runner reserved for it."""
+        if not any(isinstance(job.get("output"), BroadcastStreamIterator) for job in jobs.values()):
+            return jobs
+
+        return {
+            job_id: { **job, "output": job["output"].bind(self.job_id) } if isinstance(job.get("output"), BroadcastStreamIterator) else job
+                for job_id, job in jobs.items()
+        }
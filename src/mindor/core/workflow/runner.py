@@ -2,15 +2,15 @@ from typing import Optional, Dict, List, Set, Any
 from collections.abc import AsyncIterator
 from mindor.dsl.schema.workflow import JobConfig
 from mindor.core.component import ComponentGlobalConfigs
-from mindor.core.foundation.streaming.iterators import StreamIterator
+from mindor.core.foundation.streaming.iterators import StreamIterator, StreamTerminatedEvent, attach_terminated_callback
+from mindor.core.foundation.streaming.broadcast import StreamBroadcast, BroadcastStreamIterator
 from mindor.core.utils.time import TimeTracker
 from mindor.core.logger import logging
 from mindor.core.tracer import tracing
 from .context import WorkflowContext
 from .job import Job, RoutingTarget, create_job
-from .job.streaming import JobOutputStreamIterator, StreamTerminatedEvent
 from .job.context import JobContext
-import asyncio
+import asyncio, json, re
 
 class WorkflowRunner:
     def __init__(
@@ -25,23 +25,28 @@ class WorkflowRunner:
         self.output: Optional[Any] = output
         self.global_configs: ComponentGlobalConfigs = global_configs
 
+        self._output_references: Dict[str, Dict[Optional[str], int]] = {}
+
     async def run(self, context: WorkflowContext) -> Any:
         routing_job_ids: Set[str] = { job_id for job in self.jobs.values() for job_id in job.get_routing_jobs() }
         routing_jobs: Dict[str, Job] = { job_id: create_job(job_id, self.jobs[job_id], self.global_configs) for job_id in routing_job_ids }
         pending_jobs: Dict[str, Job] = { job_id: create_job(job_id, job, self.global_configs) for job_id, job in self.jobs.items() if job_id not in routing_job_ids }
 
+        broadcasts: List[StreamBroadcast] = []
+
         workflow_time_tracker = TimeTracker()
         tracing.on_workflow_start(context.task_id, self.id, context.input, context.context.get("session_id"), context.context.get("metadata"))
         logging.info("[task-%s] Workflow '%s' started.", context.task_id, self.id)
 
         try:
-            output = await self._run_jobs(context, pending_jobs, routing_jobs)
+            output = await self._run_jobs(context, pending_jobs, routing_jobs, broadcasts)
 
             if self.output is not None:
                 output = await context.render_variable(self.output)
 
             if isinstance(output, (StreamIterator, AsyncIterator)):
                 async def _on_terminated(event: StreamTerminatedEvent, error: Optional[str]) -> None:
+                    await self._release_output_reservations(broadcasts, None)
                     elapsed = workflow_time_tracker.elapsed()
                     if event == "completed":
                         tracing.on_workflow_end(context.task_id, self.id, None, elapsed)
@@ -52,8 +57,10 @@ class WorkflowRunner:
                         tracing.on_workflow_error(context.task_id, self.id, error, elapsed)
                         logging.error("[task-%s] Workflow '%s' failed after %.2f seconds: %s", context.task_id, self.id, elapsed, error)
 
-                output = JobOutputStreamIterator(output, _on_terminated)
+                output = attach_terminated_callback(output, _on_terminated)
             else:
+                if not self._contains_stream(output):
+                    await self._release_output_reservations(broadcasts, None)
                 elapsed = workflow_time_tracker.elapsed()
                 tracing.on_workflow_end(context.task_id, self.id, output, elapsed)
                 logging.info("[task-%s] Workflow '%s' completed in %.2f seconds.", context.task_id, self.id, elapsed)
@@ -74,7 +81,9 @@ class WorkflowRunner:
         context: WorkflowContext,
         pending_jobs: Dict[str, Job],
         routing_jobs: Dict[str, Job],
+        broadcasts: Optional[List[StreamBroadcast]] = None,
     ) -> Any:
+        broadcasts = broadcasts if broadcasts is not None else []
         running_job_ids: Set[str] = set()
         completed_job_ids: Set[str] = set()
         scheduled_job_tasks: Dict[str, asyncio.Task] = {}
@@ -143,6 +152,19 @@ class WorkflowRunner:
                     )
                     raise
 
+                # A job that finished has subscribed to every shared stream it reads, unless
+                # its own output is a stream still to be iterated; that one releases its
+                # reservations when it terminates.
+                if not isinstance(completed_job_output, (StreamIterator, AsyncIterator)):
+                    await self._release_output_reservations(broadcasts, completed_job_id)
+                await self._release_skipped_route_reservations(
+                    broadcasts,
+                    completed_job_id,
+                    completed_job_output.job_id if isinstance(completed_job_output, RoutingTarget) else None,
+                    routing_jobs,
+                    completed_job_ids,
+                )
+
                 if isinstance(completed_job_output, RoutingTarget):
                     next_job_id = completed_job_output.job_id
                     job_elapsed = job_time_trackers[completed_job_id].elapsed()
@@ -202,6 +224,7 @@ class WorkflowRunner:
                         job_type = self.jobs[completed_job_id].type.value
 
                         async def _on_terminated(event: StreamTerminatedEvent, error: Optional[str], job_id=job_id, job_type=job_type, job_time_tracker=job_time_tracker) -> None:
+                            await self._release_output_reservations(broadcasts, job_id)
                             job_elapsed = job_time_tracker.elapsed()
                             await context.job_event_notifier.notify(
                                 event,
@@ -217,11 +240,23 @@ class WorkflowRunner:
                             else:
                                 logging.info("[task-%s] Job '%s:%s' %s after %.2f seconds.", context.task_id, job_id, self.id, event, job_elapsed)
 
-                        completed_job_output = JobOutputStreamIterator(completed_job_output, _on_terminated)
+                        completed_job_output = attach_terminated_callback(completed_job_output, _on_terminated)
+                        is_streaming_output = True
+
+                        # A stream referenced by several downstream jobs is iterated once
+                        # and replayed to each of them through a bounded shared buffer.
+                        # Slots are only reserved for readers that can still run.
+                        reservations = self._get_expected_output_references(completed_job_id, pending_jobs, routing_jobs, running_job_ids)
+                        if sum(reservations.values()) > 1:
+                            broadcast = StreamBroadcast(completed_job_output, reservations=reservations)
+                            broadcasts.append(broadcast)
+                            completed_job_output = BroadcastStreamIterator(broadcast, is_fragmented=completed_job_output.is_fragmented)
+                    else:
+                        is_streaming_output = False
 
                     context.complete_job(completed_job_id, completed_job_output)
 
-                    if not isinstance(completed_job_output, JobOutputStreamIterator):
+                    if not is_streaming_output:
                         job_elapsed = job_time_trackers[completed_job_id].elapsed()
                         await context.job_event_notifier.notify(
                             "completed",
@@ -306,6 +341,67 @@ class WorkflowRunner:
     def _is_terminal_job(self, job_id: str) -> bool:
         return all(job_id not in self._flatten_job_depends_on(job) for other_id, job in self.jobs.items() if other_id != job_id)
 
+    def _get_output_references(self, job_id: str) -> Dict[Optional[str], int]:
+        """Number of `${jobs.<id>.output}` references, including field accesses such as
+        `${jobs.<id>.output.text}`, per referencing job. References in the workflow
+        output are counted under `None`."""
+        if job_id not in self._output_references:
+            pattern = re.compile(r"\$\{\s*jobs\.%s\.output(?=[\s|}.\[])" % re.escape(job_id))
+            documents: Dict[Optional[str], str] = { other_id: job.model_dump_json() for other_id, job in self.jobs.items() if other_id != job_id }
+            if self.output is not None:
+                documents[None] = json.dumps(self.output, default=str)
+            counts = { owner: len(pattern.findall(document)) for owner, document in documents.items() }
+            self._output_references[job_id] = { owner: count for owner, count in counts.items() if count > 0 }
+
+        return self._output_references[job_id]
+
+    def _get_expected_output_references(
+        self,
+        job_id: str,
+        pending_jobs: Dict[str, Job],
+        routing_jobs: Dict[str, Job],
+        running_job_ids: Set[str],
+    ) -> Dict[Optional[str], int]:
+        """References to the output of `job_id` from the workflow output and from jobs
+        that haven't started yet, so their readers are still to come."""
+        return {
+            owner: count for owner, count in self._get_output_references(job_id).items()
+                if owner is None or owner in routing_jobs or (owner in pending_jobs and owner not in running_job_ids)
+        }
+
+    async def _release_output_reservations(self, broadcasts: List[StreamBroadcast], owner: Optional[str]) -> None:
+        for broadcast in broadcasts:
+            await broadcast.release(owner)
+
+    async def _release_skipped_route_reservations(
+        self,
+        broadcasts: List[StreamBroadcast],
+        job_id: str,
+        next_job_id: Optional[str],
+        routing_jobs: Dict[str, Job],
+        completed_job_ids: Set[str],
+    ) -> None:
+        """Releases the reservations of routing targets `job_id` could have routed to
+        but didn't, unless another router that hasn't finished can still pick them."""
+        if not broadcasts or not routing_jobs:
+            return
+
+        for target_id in self.jobs[job_id].get_routing_jobs():
+            if target_id == next_job_id or target_id not in routing_jobs:
+                continue
+            routers = [ other_id for other_id, job in self.jobs.items() if other_id != job_id and target_id in job.get_routing_jobs() ]
+            if all(router_id in completed_job_ids for router_id in routers):
+                await self._release_output_reservations(broadcasts, target_id)
+
+    def _contains_stream(self, value: Any) -> bool:
+        if isinstance(value, (StreamIterator, AsyncIterator)):
+            return True
+        if isinstance(value, dict):
+            return any(self._contains_stream(item) for item in value.values())
+        if isinstance(value, (list, tuple)):
+            return any(self._contains_stream(item) for item in value)
+        return False
+
     def _get_dependent_job_ids(self, root_job_id: str, candidate_job_ids: Set[str]) -> Set[str]:
         dependents: Set[str] = set()
 
@@ -1,13 +1,17 @@
-from typing import Union, Dict, List, Type, Any
+from typing import Union, Optional, Dict, List, Tuple, Type, Any
 from pydantic import BaseModel, ValidationError
+from mindor.core.utils.startup_profiler import startup_profiler
+from mindor.core.logger import logging
 from .schema.compose import ComposeConfig
 from pathlib import Path
 from copy import deepcopy
-import yaml, re
+import yaml, re, os, sys, hashlib, pickle, pydantic
 
 class ComposeConfigLoader:
-    def __init__(self, config_name: str):
+    def __init__(self, config_name: str, cache_dir: Optional[str] = None, max_cache_entries: int = 64):
         self.config_name: str = config_name
+        self.cache_dir: Optional[str] = cache_dir
+        self.max_cache_entries: int = max_cache_entries
         self.patterns = {
             "environment": re.compile(
                 r"""\$\{                   # ${
@@ -33,26 +37,42 @@ class ComposeConfigLoader:
             else:
                 raise FileNotFoundError(f"{self.config_name}.yml or .yaml not found")
         
-        config_dicts = []
-        for config_file in config_files:
-            try:
-                with open(config_file, "r", encoding="utf-8") as f:
-                    text = self._resolve_environment_variables(f.read(), env)
-                    try:
-                        config_dicts.append(yaml.safe_load(text))
-                    except yaml.YAMLError as e:
-                        raise ValueError(f"YAML parsing error:\n{e}") from e
-            except FileNotFoundError:
-                raise FileNotFoundError(f"Config file not found: {config_file}")
+        config_texts, config_dicts = [], []
+        with startup_profiler.measure("load", "config files"):
+            for config_file in config_files:
+                try:
+                    with open(config_file, "r", encoding="utf-8") as f:
+                        text = self._resolve_environment_variables(f.read(), env)
+                        try:
+                            config_dicts.append(yaml.safe_load(text))
+                            config_texts.append(text)
+                        except yaml.YAMLError as e:
+                            raise ValueError(f"YAML parsing error:\n{e}") from e
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"Config file not found: {config_file}")
+
+        cache_key = self._get_cache_key(work_dir, config_texts) if self.cache_dir else None
+        if cache_key:
+            with startup_profiler.measure("load", "config cache"):
+                config = self._load_cached_config(cache_key)
+            startup_profiler.annotate("load", "config cache", "hit" if config is not None else "miss")
+            if config is not None:
+                return config
 
         merged_config_dict = config_dicts[0]
         for config_dict in config_dicts[1:]:
             merged_config_dict = self._merge_config_dict(merged_config_dict, config_dict)
 
-        try:
-            return ComposeConfig.model_validate(merged_config_dict)
-        except ValidationError as e:
-            raise ValueError(f"Config validation failed:\n{e.json(indent=2)}") from e
+        with startup_profiler.measure("validate", "compose config"):
+            try:
+                config = ComposeConfig.model_validate(merged_config_dict)
+            except ValidationError as e:
+                raise ValueError(f"Config validation failed:\n{e.json(indent=2)}") from e
+
+        if cache_key:
+            self._save_cached_config(cache_key, config)
+
+        return config
 
     def _resolve_environment_variables(self, text: str, env: Dict[str, str]) -> str:
         matches = list(self.patterns["environment"].finditer(text))
@@ -83,5 +103,68 @@ class ComposeConfigLoader:
 
         return merged_dict
 
-def load_compose_config(work_dir: Union[ str, Path ], config_files: List[Union[ str, Path ]], env: Dict[str, str]) -> ComposeConfig:
-    return ComposeConfigLoader("model-compose").load(work_dir, config_files, env)
+    def _get_cache_key(self, work_dir: Union[ str, Path ], config_texts: List[str]) -> str:
+        digest = hashlib.sha256()
+        for part in [ pydantic.VERSION, str(Path(work_dir).resolve()), *config_texts ]:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _load_cached_config(self, cache_key: str) -> Optional[ComposeConfig]:
+        """Returns the config validated earlier from the same content, unless a schema module changed since."""
+        path = os.path.join(self.cache_dir, f"{cache_key}.pickle")
+
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                fingerprint = pickle.load(f)
+                if fingerprint != self._get_module_fingerprint([ module_path for module_path, _, _ in fingerprint ]):
+                    return None
+                return pickle.load(f)
+        except Exception as e:
+            logging.debug("Ignoring unreadable config cache entry '%s': %s", path, e)
+            return None
+
+    def _save_cached_config(self, cache_key: str, config: ComposeConfig) -> None:
+        paths = [ module.__file__ for name, module in list(sys.modules.items()) if name.startswith("mindor.") and getattr(module, "__file__", None) ]
+        path = os.path.join(self.cache_dir, f"{cache_key}.pickle")
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(f"{path}.{os.getpid()}.tmp", "wb") as f:
+                pickle.dump(self._get_module_fingerprint(paths), f)
+                pickle.dump(config, f)
+            os.replace(f"{path}.{os.getpid()}.tmp", path)
+            self._prune_cache()
+        except Exception as e:
+            logging.debug("Failed to write config cache entry '%s': %s", path, e)
+
+    def _get_module_fingerprint(self, paths: List[str]) -> List[Tuple[str, int, int]]:
+        fingerprint = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                fingerprint.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                fingerprint.append((path, 0, 0))
+        return fingerprint
+
+    def _prune_cache(self) -> None:
+        entries = [ os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith(".pickle") ]
+        if len(entries) > self.max_cache_entries:
+            entries.sort(key=os.path.getmtime)
+            for path in entries[:len(entries) - self.max_cache_entries]:
+                os.remove(path)
+
+def get_config_cache_dir() -> str:
+    return os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "model-compose", "configs")
+
+def load_compose_config(
+    work_dir: Union[ str, Path ],
+    config_files: List[Union[ str, Path ]],
+    env: Dict[str, str],
+    use_cache: bool = False
+) -> ComposeConfig:
+    return ComposeConfigLoader("model-compose", get_config_cache_dir() if use_cache else None).load(work_dir, config_files, env)
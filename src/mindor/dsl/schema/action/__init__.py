@@ -1 +1,6 @@
+from typing import Any
 from .action import *
+from . import impl
+
+def __getattr__(name: str) -> Any:
+    return getattr(impl, name)
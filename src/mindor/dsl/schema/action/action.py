@@ -1,47 +1,6 @@
 from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
-from pydantic import BaseModel, Field
-from .impl import *
+from .impl.common import CommonActionConfig
 
-ActionConfig = Union[
-    HttpServerActionConfig,
-    HttpClientActionConfig,
-    WebSocketServerActionConfig,
-    WebSocketClientActionConfig,
-    McpServerActionConfig,
-    McpClientActionConfig,
-    ModelActionConfig,
-    ModelMemoryActionConfig,
-    ModelTokenizerActionConfig,
-    WorkflowActionConfig,
-    ShellActionConfig,
-    TextSplitterActionConfig,
-    SentenceSplitterActionConfig,
-    TranscriptCorrectorActionConfig,
-    ImageProcessorActionConfig,
-    VectorProcessorActionConfig,
-    AgentActionConfig,
-    WebBrowserActionConfig,
-    HtmlFrameRendererActionConfig,
-    VideoSceneDetectorActionConfig,
-    VideoClipperActionConfig,
-    VideoConverterActionConfig,
-    VideoEncoderActionConfig,
-    VideoFrameExtractorActionConfig,
-    VideoMixerActionConfig,
-    ScreenCaptureActionConfig,
-    AudioCaptureActionConfig,
-    VideoCaptureActionConfig,
-    RtmpPublisherActionConfig,
-    MediaInspectorActionConfig,
-    MediaDownloaderActionConfig,
-    AudioExtractorActionConfig,
-    AudioClipperActionConfig,
-    AudioProcessorActionConfig,
-    AudioPlaybackActionConfig,
-    AudioMixerActionConfig,
-    KeyValueStoreActionConfig,
-    GraphStoreActionConfig,
-    FileStoreActionConfig,
-    SearchEngineActionConfig,
-    DataQueueActionConfig
-]
+# Actions are validated through the config of the component that owns them, so
+# this alias only serves as a type hint and avoids importing every action schema.
+ActionConfig = CommonActionConfig
@@ -1,53 +1,59 @@
+from mindor.dsl.utils.lazy import lazy_star_imports
 from .common import *
-from .media import *
-from .http_server import *
-from .http_client import *
-from .websocket_server import *
-from .websocket_client import *
-from .mcp_server import *
-from .mcp_client import *
-from .agent import *
-from .model import *
-from .model_trainer import *
-from .datasets import *
-from .vector_store import *
-from .workflow import *
-from .shell import *
-from .text_splitter import *
-from .sentence_splitter import *
-from .transcript_corrector import *
-from .image_processor import *
-from .image_compressor import *
-from .image_analyzer import *
-from .vector_processor import *
-from .web_scraper import *
-from .web_browser import *
-from .html_frame_renderer import *
-from .video_scene_detector import *
-from .video_clipper import *
-from .video_converter import *
-from .video_encoder import *
-from .video_frame_extractor import *
-from .video_mixer import *
-from .video_analyzer import *
-from .screen_capture import *
-from .audio_capture import *
-from .video_capture import *
-from .rtmp_publisher import *
-from .media_inspector import *
-from .media_downloader import *
-from .audio_extractor import *
-from .audio_clipper import *
-from .audio_converter import *
-from .audio_processor import *
-from .audio_feature_extractor import *
-from .audio_analyzer import *
-from .audio_playback import *
-from .audio_mixer import *
-from .key_value_store import *
-from .graph_store import *
-from .file_store import *
-from .search_engine import *
-from .model_tokenizer import *
-from .model_memory import *
-from .data_queue import *
+
+# Every other module is imported on first access to one of its names, so loading
+# a single component or action schema does not import all of them.
+__getattr__ = lazy_star_imports(__name__, [
+    "media",
+    "http_server",
+    "http_client",
+    "websocket_server",
+    "websocket_client",
+    "mcp_server",
+    "mcp_client",
+    "agent",
+    "model",
+    "model_trainer",
+    "datasets",
+    "vector_store",
+    "workflow",
+    "shell",
+    "text_splitter",
+    "sentence_splitter",
+    "transcript_corrector",
+    "image_processor",
+    "image_compressor",
+    "image_analyzer",
+    "vector_processor",
+    "web_scraper",
+    "web_browser",
+    "html_frame_renderer",
+    "video_scene_detector",
+    "video_clipper",
+    "video_converter",
+    "video_encoder",
+    "video_frame_extractor",
+    "video_mixer",
+    "video_analyzer",
+    "screen_capture",
+    "audio_capture",
+    "video_capture",
+    "rtmp_publisher",
+    "media_inspector",
+    "media_downloader",
+    "audio_extractor",
+    "audio_clipper",
+    "audio_converter",
+    "audio_processor",
+    "audio_feature_extractor",
+    "audio_analyzer",
+    "audio_playback",
+    "audio_mixer",
+    "key_value_store",
+    "graph_store",
+    "file_store",
+    "search_engine",
+    "model_tokenizer",
+    "model_memory",
+    "data_queue"
+])
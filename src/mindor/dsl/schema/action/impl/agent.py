@@ -5,4 +5,6 @@ from .common import CommonActionConfig
 class AgentActionConfig(CommonActionConfig):
     prompt: Optional[str] = Field(default=None, description="Prompt for this invocation, applied as a user message.")
     max_iteration_count: Optional[int] = Field(default=None, description="Maximum ReAct loop iterations. Overrides component-level setting.")
+    max_concurrent_tool_calls: Optional[Union[int, str]] = Field(default=None, description="Maximum number of workflow tool calls run at once within an iteration. Overrides component-level setting.")
+    tool_timeout: Optional[Union[str, int, float]] = Field(default=None, description="Maximum time a single workflow tool call may run. Overrides component-level setting.")
     streaming: Union[bool, str] = Field(default=False, description="Whether output is emitted incrementally as it is produced.")
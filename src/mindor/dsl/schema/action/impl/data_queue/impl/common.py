@@ -6,6 +6,8 @@ from ...common import CommonActionConfig
 class DataQueueActionMethod(str, Enum):
     ENQUEUE = "enqueue"
     DEQUEUE = "dequeue"
+    CLOSE   = "close"
+    STATS   = "stats"
 
 class CommonDataQueueActionConfig(CommonActionConfig):
     method: DataQueueActionMethod = Field(..., description="Queue operation this action performs.")
@@ -15,6 +17,16 @@ class CommonDataQueueEnqueueActionConfig(CommonDataQueueActionConfig):
     method: Literal[DataQueueActionMethod.ENQUEUE]
     item: Union[Any, str] = Field(..., description="Value appended to the queue.")
     spread: Union[bool, str] = Field(default=False, description="Whether to enqueue each element of a list or iterator item as a separate entry.")
+    close: Union[bool, str] = Field(default=False, description="Whether the session is closed once the item has been enqueued, ending its consumers' streams after they drain it.")
+    timeout: Optional[Union[str, int, float]] = Field(default=None, description="Maximum time to wait for space in a full queue before failing; waits indefinitely when omitted.")
 
 class CommonDataQueueDequeueActionConfig(CommonDataQueueActionConfig):
     method: Literal[DataQueueActionMethod.DEQUEUE]
+    batch_size: Optional[Union[int, str]] = Field(default=None, description="Maximum number of items yielded together as a list; items are yielded one by one when omitted.")
+    batch_timeout: Optional[Union[str, int, float]] = Field(default=None, description="Maximum time to wait for a batch to fill after its first item arrives; without it, a batch holds only the items already queued.")
+
+class CommonDataQueueCloseActionConfig(CommonDataQueueActionConfig):
+    method: Literal[DataQueueActionMethod.CLOSE]
+
+class CommonDataQueueStatsActionConfig(CommonDataQueueActionConfig):
+    method: Literal[DataQueueActionMethod.STATS]
@@ -3,6 +3,8 @@ from pydantic import Field
 from .common import (
     CommonDataQueueEnqueueActionConfig,
     CommonDataQueueDequeueActionConfig,
+    CommonDataQueueCloseActionConfig,
+    CommonDataQueueStatsActionConfig,
 )
 
 class MemoryDataQueueEnqueueActionConfig(CommonDataQueueEnqueueActionConfig):
@@ -11,10 +13,18 @@ class MemoryDataQueueEnqueueActionConfig(CommonDataQueueEnqueueActionConfig):
 class MemoryDataQueueDequeueActionConfig(CommonDataQueueDequeueActionConfig):
     pass
 
+class MemoryDataQueueCloseActionConfig(CommonDataQueueCloseActionConfig):
+    pass
+
+class MemoryDataQueueStatsActionConfig(CommonDataQueueStatsActionConfig):
+    pass
+
 MemoryDataQueueActionConfig = Annotated[
     Union[
         MemoryDataQueueEnqueueActionConfig,
         MemoryDataQueueDequeueActionConfig,
+        MemoryDataQueueCloseActionConfig,
+        MemoryDataQueueStatsActionConfig,
     ],
     Field(discriminator="method")
 ]
@@ -7,22 +7,25 @@ class DatasetsDriver(str, Enum):
     HUGGINGFACE = "huggingface"
 
 class DatasetsActionMethod(str, Enum):
-    LOAD   = "load"
-    CONCAT = "concat"
-    SELECT = "select"
-    FILTER = "filter"
-    MAP    = "map"
+    LOAD    = "load"
+    CONCAT  = "concat"
+    SELECT  = "select"
+    FILTER  = "filter"
+    MAP     = "map"
+    ITERATE = "iterate"
 
 class CommonDatasetsActionConfig(CommonActionConfig):
     method: DatasetsActionMethod = Field(..., description="Datasets operation this action performs.")
 
-class CommonDatasetsLoadActionConfig(CommonDatasetsActionConfig):
-    method: Literal[DatasetsActionMethod.LOAD]
+class DatasetsLoadParams(BaseModel):
     split: Optional[str] = Field(default=None, description="Dataset split to load (e.g., train, test, validation).")
     streaming: Union[bool, str] = Field(default=False, description="Whether the dataset is loaded in streaming mode for out-of-memory access.")
     keep_in_memory: Union[bool, str] = Field(default=False, description="Whether the loaded dataset is kept resident in memory.")
     cache_dir: Optional[str] = Field(default=None, description="Directory where downloaded dataset files are cached.")
     save_infos: Union[bool, str] = Field(default=False, description="Whether dataset info is written to the cache.")
+
+class CommonDatasetsLoadActionConfig(CommonDatasetsActionConfig, DatasetsLoadParams):
+    method: Literal[DatasetsActionMethod.LOAD]
     fraction: Optional[Union[float, str]] = Field(default=None, description="Fraction of the dataset to load, from 0.0 to 1.0.")
     shuffle: bool = Field(default=False, description="Whether the dataset is shuffled before `fraction` is applied.")
 
@@ -49,3 +52,15 @@ class CommonDatasetsMapActionConfig(CommonDatasetsActionConfig):
     template: str = Field(..., description="String template with `{column_name}` placeholders substituted per row.")
     output_column: str = Field(..., description="Name of the new column populated by the mapped values.")
     remove_columns: Optional[Union[List[str], str]] = Field(default=None, description="Columns removed from the result after mapping.")
+
+class CommonDatasetsIterateActionConfig(CommonDatasetsActionConfig, DatasetsLoadParams):
+    method: Literal[DatasetsActionMethod.ITERATE]
+    dataset: Optional[str] = Field(default=None, description="Already loaded dataset to iterate. When omitted, the dataset is loaded from the action's source fields.")
+    batch_size: Union[int, str] = Field(default=1000, description="Maximum number of rows in each yielded batch.")
+    columns: Optional[Union[List[str], str]] = Field(default=None, description="Columns included in each batch. All columns when omitted.")
+    filters: Optional[Union[List[Any], str]] = Field(default=None, description="Row filter as `[column, op, value]` conditions ANDed together, or a list of such lists ORed together.")
+    limit: Optional[Union[int, str]] = Field(default=None, description="Maximum total number of rows yielded.")
+    num_shards: Optional[Union[int, str]] = Field(default=None, description="Number of shards the dataset is split into, one per parallel worker.")
+    shard_index: Union[int, str] = Field(default=0, description="Index of the shard this action iterates, from 0 to `num_shards` - 1.")
+    prefetch: Union[int, str] = Field(default=2, description="Number of batches read ahead while the consumer processes the current one.")
+    format: Literal[ "python", "numpy", "arrow" ] = Field(default="python", description="Batch format: column lists (`python`), NumPy arrays (`numpy`) or a `pyarrow.Table` (`arrow`).")
@@ -1,15 +1,16 @@
 from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from .common import (
     DatasetsDriver,
     CommonDatasetsLoadActionConfig,
+    CommonDatasetsIterateActionConfig,
     CommonDatasetsConcatActionConfig,
     CommonDatasetsSelectActionConfig,
     CommonDatasetsFilterActionConfig,
     CommonDatasetsMapActionConfig,
 )
 
-class HuggingfaceDatasetsLoadActionConfig(CommonDatasetsLoadActionConfig):
+class HuggingfaceDatasetsSourceParams(BaseModel):
     path: str = Field(..., description="HuggingFace Hub repo id (e.g., squad) or a built-in builder name for local files (e.g., json, csv, parquet, text).")
     name: Optional[str] = Field(default=None, description="Dataset configuration name (e.g., GLUE's mrpc). Hub datasets only.")
     revision: Optional[str] = Field(default=None, description="Dataset revision or version. Hub datasets only.")
@@ -18,6 +19,9 @@ class HuggingfaceDatasetsLoadActionConfig(CommonDatasetsLoadActionConfig):
     data_files: Optional[Union[str, List[str], Dict[str, str]]] = Field(default=None, description="Data files consumed when `path` is a built-in builder name.")
     data_dir: Optional[str] = Field(default=None, description="Directory of data files consumed when `path` is a built-in builder name.")
 
+class HuggingfaceDatasetsLoadActionConfig(CommonDatasetsLoadActionConfig, HuggingfaceDatasetsSourceParams):
+    pass
+
 class HuggingfaceDatasetsConcatActionConfig(CommonDatasetsConcatActionConfig):
     pass
 
@@ -30,6 +34,15 @@ class HuggingfaceDatasetsFilterActionConfig(CommonDatasetsFilterActionConfig):
 class HuggingfaceDatasetsMapActionConfig(CommonDatasetsMapActionConfig):
     pass
 
+class HuggingfaceDatasetsIterateActionConfig(CommonDatasetsIterateActionConfig, HuggingfaceDatasetsSourceParams):
+    path: Optional[str] = Field(default=None, description="HuggingFace Hub repo id or built-in builder name to load from when `dataset` is not given.")
+
+    @model_validator(mode="after")
+    def validate_source(self):
+        if (self.dataset is None) == (self.path is None):
+            raise ValueError("Exactly one of 'dataset' or 'path' must be specified for 'iterate' method")
+        return self
+
 HuggingfaceDatasetsActionConfig = Annotated[
     Union[
         HuggingfaceDatasetsLoadActionConfig,
@@ -37,6 +50,7 @@ HuggingfaceDatasetsActionConfig = Annotated[
         HuggingfaceDatasetsSelectActionConfig,
         HuggingfaceDatasetsFilterActionConfig,
         HuggingfaceDatasetsMapActionConfig,
+        HuggingfaceDatasetsIterateActionConfig,
     ],
     Field(discriminator="method")
 ]
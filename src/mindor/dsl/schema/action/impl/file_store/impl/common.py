@@ -37,6 +37,10 @@ class CommonFileGetActionConfig(CommonFileStoreActionConfig):
             raise ValueError("'save_to' and 'streaming: true' cannot both be set.")
         return self
 
+class CommonRemoteFileGetActionConfig(CommonFileGetActionConfig):
+    part_size: Optional[Union[int, str]] = Field(default=None, description="Size of each byte range fetched in parallel for `save_to` and full reads; objects no larger than this are fetched in a single request.")
+    max_concurrency: Optional[Union[int, str]] = Field(default=None, description="Maximum number of byte ranges downloaded at once.")
+
 class CommonFileDeleteActionConfig(CommonFileStoreActionConfig):
     method: Literal[FileStoreActionMethod.DELETE]
     path: Union[str, List[str]] = Field(..., description="Path or list of paths within the store to delete, relative to the component's base path.")
@@ -2,7 +2,7 @@ from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annot
 from pydantic import BaseModel, Field
 from .common import (
     CommonFilePutActionConfig,
-    CommonFileGetActionConfig,
+    CommonRemoteFileGetActionConfig,
     CommonFileDeleteActionConfig,
     CommonFileExistsActionConfig,
     CommonFileListActionConfig,
@@ -11,7 +11,7 @@ from .common import (
 class GcpStorageFilePutActionConfig(CommonFilePutActionConfig):
     pass
 
-class GcpStorageFileGetActionConfig(CommonFileGetActionConfig):
+class GcpStorageFileGetActionConfig(CommonRemoteFileGetActionConfig):
     pass
 
 class GcpStorageFileDeleteActionConfig(CommonFileDeleteActionConfig):
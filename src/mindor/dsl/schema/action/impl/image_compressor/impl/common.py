@@ -4,5 +4,5 @@ from ...common import CommonActionConfig
 
 class CommonImageCompressorActionConfig(CommonActionConfig):
     image: Union[str, List[str]] = Field(..., description="Input image or list of images (file path, base64 string, or variable reference).")
-    batch_size: Optional[Union[int, str]] = Field(default=None, description="Number of input images processed per batch.")
+    batch_size: Optional[Union[int, str]] = Field(default=None, description="Number of input images compressed at once; defaults to the component's max_workers.")
     strip_metadata: Union[bool, str] = Field(default=True, description="Whether ancillary PNG metadata chunks (tEXt, eXIf, iCCP, etc.) are removed from the output.")
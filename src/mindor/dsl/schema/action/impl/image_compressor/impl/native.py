@@ -1,6 +1,7 @@
-from typing import Union
+from typing import Union, Optional
 from pydantic import Field
 from .common import CommonImageCompressorActionConfig
 
 class NativeImageCompressorActionConfig(CommonImageCompressorActionConfig):
     compress_level: Union[int, str] = Field(default=9, description="DEFLATE compression level from 0 to 9; higher values produce smaller and slower output.")
+    target_latency: Optional[Union[str, float]] = Field(default=None, description="Per-image encode time budget (e.g. '50ms'); when set, compress_level is the highest level used and lower levels are picked for images that would run over budget.")
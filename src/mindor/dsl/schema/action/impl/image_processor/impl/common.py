@@ -20,6 +20,7 @@ class ImageProcessorActionMethod(str, Enum):
     MERGE             = "merge"
     OVERLAY           = "overlay"
     MOSAIC            = "mosaic"
+    PIPELINE          = "pipeline"
 
 class ImageScaleMode(str, Enum):
     FIT     = "fit"
@@ -59,68 +60,42 @@ class ImageRegion(BaseModel):
 class CommonImageProcessorActionConfig(CommonActionConfig):
     method: ImageProcessorActionMethod = Field(..., description="Image processing operation this action performs.")
     image: Union[str, List[str]] = Field(..., description="Input image or list of images (file path, base64 string, or variable reference).")
-    batch_size: Optional[Union[int, str]] = Field(default=None, description="Number of input images processed per batch.")
+    batch_size: Optional[Union[int, str]] = Field(default=None, description="Number of input images processed at once.")
 
-class ImageProcessorResizeActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.RESIZE]
+class ImageResizeParams(BaseModel):
     width: Optional[Union[int, str]] = Field(None, description="Target output width in pixels.")
     height: Optional[Union[int, str]] = Field(None, description="Target output height in pixels.")
     scale_mode: Union[ImageScaleMode, str] = Field(ImageScaleMode.FIT, description="How the image is fit into the target dimensions.")
 
-class ImageProcessorCropActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.CROP]
+class ImageCropParams(BaseModel):
     x: Union[int, str] = Field(..., description="X coordinate of the crop's top-left corner, in pixels.")
     y: Union[int, str] = Field(..., description="Y coordinate of the crop's top-left corner, in pixels.")
     width: Union[int, str] = Field(..., description="Crop width in pixels.")
     height: Union[int, str] = Field(..., description="Crop height in pixels.")
 
-class ImageProcessorRotateActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.ROTATE]
+class ImageRotateParams(BaseModel):
     angle: Union[float, str] = Field(..., description="Rotation angle in degrees, counter-clockwise.")
     expand: Union[bool, str] = Field(True, description="Whether the canvas expands to fit the rotated image.")
 
-class ImageProcessorFlipActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.FLIP]
+class ImageFlipParams(BaseModel):
     direction: Union[FlipDirection, str] = Field(..., description="Axis along which the image is flipped.")
 
-class ImageProcessorGrayscaleActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.GRAYSCALE]
-
-class ImageProcessorBlurActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.BLUR]
+class ImageBlurParams(BaseModel):
     radius: Union[float, str] = Field(default=2.0, description="Gaussian blur radius in pixels.")
 
-class ImageProcessorSharpenActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.SHARPEN]
+class ImageSharpenParams(BaseModel):
     factor: Union[float, str] = Field(default=1.0, description="Sharpening strength; 1.0 leaves the image unchanged.")
 
-class ImageProcessorAdjustBrightnessActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.ADJUST_BRIGHTNESS]
+class ImageAdjustBrightnessParams(BaseModel):
     factor: Union[float, str] = Field(..., description="Brightness multiplier; 1.0 leaves the image unchanged.")
 
-class ImageProcessorAdjustContrastActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.ADJUST_CONTRAST]
+class ImageAdjustContrastParams(BaseModel):
     factor: Union[float, str] = Field(..., description="Contrast multiplier; 1.0 leaves the image unchanged.")
 
-class ImageProcessorAdjustSaturationActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.ADJUST_SATURATION]
+class ImageAdjustSaturationParams(BaseModel):
     factor: Union[float, str] = Field(..., description="Saturation multiplier; 1.0 leaves the image unchanged.")
 
-class ImageProcessorConcatActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.CONCAT]
-    mode: Union[ImageConcatMode, str] = Field(ImageConcatMode.HORIZONTAL, description="Layout used to arrange the images.")
-    columns: Optional[Union[int, str]] = Field(default=None, description="Number of columns when `mode` is `grid`.")
-    rows: Optional[Union[int, str]] = Field(default=None, description="Number of rows when `mode` is `grid`.")
-    spacing: Union[int, str] = Field(default=0, description="Spacing in pixels between adjacent images.")
-    background: Union[str, Tuple[int, int, int, int], List[int]] = Field(default="#00000000", description="Canvas background color as a hex string or RGBA tuple.")
-
-class ImageProcessorMergeActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.MERGE]
-    anchor: Union[ImagePositionAnchor, str] = Field(default=ImagePositionAnchor.CENTER, description="Alignment applied to each image on the shared canvas.")
-    background: Union[str, Tuple[int, int, int, int], List[int]] = Field(default="#00000000", description="Canvas background color as a hex string or RGBA tuple.")
-
-class ImageProcessorOverlayActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.OVERLAY]
+class ImageOverlayParams(BaseModel):
     overlay: str = Field(..., description="Overlay image (file path, base64 string, or variable reference).")
     x: Union[int, str] = Field(..., description="X coordinate on the base image where the overlay is placed.")
     y: Union[int, str] = Field(..., description="Y coordinate on the base image where the overlay is placed.")
@@ -129,8 +104,7 @@ class ImageProcessorOverlayActionConfig(CommonImageProcessorActionConfig):
     anchor: Union[ImagePositionAnchor, str] = Field(default=ImagePositionAnchor.TOP_LEFT, description="Point of the overlay aligned at `(x, y)`.")
     opacity: Union[float, str] = Field(default=1.0, description="Alpha multiplier for the overlay, from 0.0 to 1.0.")
 
-class ImageProcessorMosaicActionConfig(CommonImageProcessorActionConfig):
-    method: Literal[ImageProcessorActionMethod.MOSAIC]
+class ImageMosaicParams(BaseModel):
     mode: Union[MosaicMode, str] = Field(default=MosaicMode.PIXELATE, description="Mosaic algorithm applied to the target region.")
     region: Optional[Union[ImageRegion, List[ImageRegion], str]] = Field(default=None, description="Region or list of regions to mosaic; omit to apply to the whole image.")
     block_size: Optional[Union[int, str]] = Field(default=None, description="Pixelate block size in pixels. Mutually exclusive with `block_scale`; defaults to 16 when neither is set.")
@@ -142,13 +116,120 @@ class ImageProcessorMosaicActionConfig(CommonImageProcessorActionConfig):
     corner_scale: Optional[Union[float, str]] = Field(default=None, description="Rounded-corner radius relative to each region's shorter side, from 0 to 0.5. Mutually exclusive with `corner_radius`.")
 
     @model_validator(mode="after")
-    def validate_block_size_or_scale(self) -> ImageProcessorMosaicActionConfig:
+    def validate_block_size_or_scale(self) -> ImageMosaicParams:
         if self.block_size is not None and self.block_scale is not None:
             raise ValueError("'block_size' and 'block_scale' are mutually exclusive; specify only one.")
         return self
 
     @model_validator(mode="after")
-    def validate_corner_radius_or_scale(self) -> ImageProcessorMosaicActionConfig:
+    def validate_corner_radius_or_scale(self) -> ImageMosaicParams:
         if self.corner_radius is not None and self.corner_scale is not None:
             raise ValueError("'corner_radius' and 'corner_scale' are mutually exclusive; specify only one.")
         return self
+
+class ImageProcessorResizeActionConfig(CommonImageProcessorActionConfig, ImageResizeParams):
+    method: Literal[ImageProcessorActionMethod.RESIZE]
+
+class ImageProcessorCropActionConfig(CommonImageProcessorActionConfig, ImageCropParams):
+    method: Literal[ImageProcessorActionMethod.CROP]
+
+class ImageProcessorRotateActionConfig(CommonImageProcessorActionConfig, ImageRotateParams):
+    method: Literal[ImageProcessorActionMethod.ROTATE]
+
+class ImageProcessorFlipActionConfig(CommonImageProcessorActionConfig, ImageFlipParams):
+    method: Literal[ImageProcessorActionMethod.FLIP]
+
+class ImageProcessorGrayscaleActionConfig(CommonImageProcessorActionConfig):
+    method: Literal[ImageProcessorActionMethod.GRAYSCALE]
+
+class ImageProcessorBlurActionConfig(CommonImageProcessorActionConfig, ImageBlurParams):
+    method: Literal[ImageProcessorActionMethod.BLUR]
+
+class ImageProcessorSharpenActionConfig(CommonImageProcessorActionConfig, ImageSharpenParams):
+    method: Literal[ImageProcessorActionMethod.SHARPEN]
+
+class ImageProcessorAdjustBrightnessActionConfig(CommonImageProcessorActionConfig, ImageAdjustBrightnessParams):
+    method: Literal[ImageProcessorActionMethod.ADJUST_BRIGHTNESS]
+
+class ImageProcessorAdjustContrastActionConfig(CommonImageProcessorActionConfig, ImageAdjustContrastParams):
+    method: Literal[ImageProcessorActionMethod.ADJUST_CONTRAST]
+
+class ImageProcessorAdjustSaturationActionConfig(CommonImageProcessorActionConfig, ImageAdjustSaturationParams):
+    method: Literal[ImageProcessorActionMethod.ADJUST_SATURATION]
+
+class ImageProcessorConcatActionConfig(CommonImageProcessorActionConfig):
+    method: Literal[ImageProcessorActionMethod.CONCAT]
+    mode: Union[ImageConcatMode, str] = Field(ImageConcatMode.HORIZONTAL, description="Layout used to arrange the images.")
+    columns: Optional[Union[int, str]] = Field(default=None, description="Number of columns when `mode` is `grid`.")
+    rows: Optional[Union[int, str]] = Field(default=None, description="Number of rows when `mode` is `grid`.")
+    spacing: Union[int, str] = Field(default=0, description="Spacing in pixels between adjacent images.")
+    background: Union[str, Tuple[int, int, int, int], List[int]] = Field(default="#00000000", description="Canvas background color as a hex string or RGBA tuple.")
+
+class ImageProcessorMergeActionConfig(CommonImageProcessorActionConfig):
+    method: Literal[ImageProcessorActionMethod.MERGE]
+    anchor: Union[ImagePositionAnchor, str] = Field(default=ImagePositionAnchor.CENTER, description="Alignment applied to each image on the shared canvas.")
+    background: Union[str, Tuple[int, int, int, int], List[int]] = Field(default="#00000000", description="Canvas background color as a hex string or RGBA tuple.")
+
+class ImageProcessorOverlayActionConfig(CommonImageProcessorActionConfig, ImageOverlayParams):
+    method: Literal[ImageProcessorActionMethod.OVERLAY]
+
+class ImageProcessorMosaicActionConfig(CommonImageProcessorActionConfig, ImageMosaicParams):
+    method: Literal[ImageProcessorActionMethod.MOSAIC]
+
+class ImageProcessorResizeOperationConfig(ImageResizeParams):
+    method: Literal[ImageProcessorActionMethod.RESIZE]
+
+class ImageProcessorCropOperationConfig(ImageCropParams):
+    method: Literal[ImageProcessorActionMethod.CROP]
+
+class ImageProcessorRotateOperationConfig(ImageRotateParams):
+    method: Literal[ImageProcessorActionMethod.ROTATE]
+
+class ImageProcessorFlipOperationConfig(ImageFlipParams):
+    method: Literal[ImageProcessorActionMethod.FLIP]
+
+class ImageProcessorGrayscaleOperationConfig(BaseModel):
+    method: Literal[ImageProcessorActionMethod.GRAYSCALE]
+
+class ImageProcessorBlurOperationConfig(ImageBlurParams):
+    method: Literal[ImageProcessorActionMethod.BLUR]
+
+class ImageProcessorSharpenOperationConfig(ImageSharpenParams):
+    method: Literal[ImageProcessorActionMethod.SHARPEN]
+
+class ImageProcessorAdjustBrightnessOperationConfig(ImageAdjustBrightnessParams):
+    method: Literal[ImageProcessorActionMethod.ADJUST_BRIGHTNESS]
+
+class ImageProcessorAdjustContrastOperationConfig(ImageAdjustContrastParams):
+    method: Literal[ImageProcessorActionMethod.ADJUST_CONTRAST]
+
+class ImageProcessorAdjustSaturationOperationConfig(ImageAdjustSaturationParams):
+    method: Literal[ImageProcessorActionMethod.ADJUST_SATURATION]
+
+class ImageProcessorOverlayOperationConfig(ImageOverlayParams):
+    method: Literal[ImageProcessorActionMethod.OVERLAY]
+
+class ImageProcessorMosaicOperationConfig(ImageMosaicParams):
+    method: Literal[ImageProcessorActionMethod.MOSAIC]
+
+ImageProcessorOperationConfig = Annotated[
+    Union[
+        ImageProcessorResizeOperationConfig,
+        ImageProcessorCropOperationConfig,
+        ImageProcessorRotateOperationConfig,
+        ImageProcessorFlipOperationConfig,
+        ImageProcessorGrayscaleOperationConfig,
+        ImageProcessorBlurOperationConfig,
+        ImageProcessorSharpenOperationConfig,
+        ImageProcessorAdjustBrightnessOperationConfig,
+        ImageProcessorAdjustContrastOperationConfig,
+        ImageProcessorAdjustSaturationOperationConfig,
+        ImageProcessorOverlayOperationConfig,
+        ImageProcessorMosaicOperationConfig,
+    ],
+    Field(discriminator="method")
+]
+
+class ImageProcessorPipelineActionConfig(CommonImageProcessorActionConfig):
+    method: Literal[ImageProcessorActionMethod.PIPELINE]
+    operations: List[ImageProcessorOperationConfig] = Field(..., min_length=1, description="Operations applied to each image in order, all in a single executor call.")
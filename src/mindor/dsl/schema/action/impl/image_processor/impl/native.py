@@ -15,6 +15,7 @@ from .common import (
     ImageProcessorMergeActionConfig,
     ImageProcessorOverlayActionConfig,
     ImageProcessorMosaicActionConfig,
+    ImageProcessorPipelineActionConfig,
 )
 
 NativeImageProcessorActionConfig = Annotated[
@@ -33,6 +34,7 @@ NativeImageProcessorActionConfig = Annotated[
         ImageProcessorMergeActionConfig,
         ImageProcessorOverlayActionConfig,
         ImageProcessorMosaicActionConfig,
+        ImageProcessorPipelineActionConfig,
     ],
     Field(discriminator="method")
 ]
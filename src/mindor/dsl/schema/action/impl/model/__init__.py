@@ -1 +1,6 @@
+from typing import Any
 from .model import *
+from . import tasks
+
+def __getattr__(name: str) -> Any:
+    return getattr(tasks, name)
@@ -1,29 +1,5 @@
-from typing import Union
 from .tasks import *
 
-ModelActionConfig = Union[
-    TextGenerationModelActionConfig,
-    ChatCompletionModelActionConfig,
-    TextToTextModelActionConfig,
-    TextClassificationModelActionConfig,
-    TextEmbeddingModelActionConfig,
-    TextRerankingModelActionConfig,
-    ImageToTextModelActionConfig,
-    ImageTextToTextModelActionConfig,
-    ImageGenerationModelActionConfig,
-    ImageEmbeddingModelActionConfig,
-    ImageUpscaleModelActionConfig,
-    ImageBackgroundRemovalModelActionConfig,
-    ImageSegmentationModelActionConfig,
-    TextToVideoModelActionConfig,
-    ImageToVideoModelActionConfig,
-    ObjectDetectionModelActionConfig,
-    FaceDetectionModelActionConfig,
-    PoseDetectionModelActionConfig,
-    PoseTrackingModelActionConfig,
-    FaceEmbeddingModelActionConfig,
-    FaceTrackingModelActionConfig,
-    TextToSpeechModelActionConfig,
-    SpeechToTextModelActionConfig,
-    MusicGenerationModelActionConfig,
-]
+# Model actions are validated through the config of their model task, so this
+# alias only serves as a type hint and avoids importing every task schema.
+ModelActionConfig = CommonModelActionConfig
@@ -16,5 +16,7 @@ class VideoSceneDetectorActionConfig(CommonActionConfig):
     threshold: Optional[Union[float, str]] = Field(default=None, description="Detection sensitivity threshold used by the chosen algorithm.")
     start_time: Optional[str] = Field(default=None, description="Time in the source at which detection begins (e.g., 00:01:00, 60s).")
     end_time: Optional[str] = Field(default=None, description="Time in the source at which detection stops (e.g., 00:05:00, 300s).")
-    batch_size: Optional[Union[int, str]] = Field(default=None, description="Number of input videos processed per batch.")
+    segment_duration: Optional[str] = Field(default=None, description="Length of the keyframe-aligned segments a single video is split into and analyzed in parallel (ffmpeg driver only, e.g., 5m); each video is analyzed in one pass when omitted.")
+    segment_concurrency: Optional[Union[int, str]] = Field(default=None, description="Maximum number of segments of one video analyzed at once; defaults to the number of CPU cores.")
+    batch_size: Optional[Union[int, str]] = Field(default=None, description="Maximum number of input videos analyzed concurrently.")
     streaming: Union[bool, str] = Field(default=False, description="Whether scene results are emitted incrementally as they are detected.")
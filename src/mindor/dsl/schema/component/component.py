@@ -1,59 +1,66 @@
 from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
-from pydantic import BaseModel, Field
-from .impl import *
+from mindor.dsl.utils.lazy import LazyDiscriminatedUnion
+from .impl.common import CommonComponentConfig
+from .impl.types import ComponentType
 
-ComponentConfig = Annotated[
-    Union[
-        HttpServerComponentConfig,
-        HttpClientComponentConfig,
-        WebSocketServerComponentConfig,
-        WebSocketClientComponentConfig,
-        McpServerComponentConfig,
-        McpClientComponentConfig,
-        ModelComponentConfig,
-        ModelMemoryComponentConfig,
-        ModelTokenizerComponentConfig,
-        DatasetsComponentConfig,
-        VectorStoreComponentConfig,
-        WorkflowComponentConfig,
-        ShellComponentConfig,
-        TextSplitterComponentConfig,
-        SentenceSplitterComponentConfig,
-        TranscriptCorrectorComponentConfig,
-        ImageProcessorComponentConfig,
-        ImageCompressorComponentConfig,
-        ImageAnalyzerComponentConfig,
-        VectorProcessorComponentConfig,
-        WebScraperComponentConfig,
-        AgentComponentConfig,
-        WebBrowserComponentConfig,
-        HtmlFrameRendererComponentConfig,
-        VideoSceneDetectorComponentConfig,
-        VideoClipperComponentConfig,
-        VideoConverterComponentConfig,
-        VideoEncoderComponentConfig,
-        VideoFrameExtractorComponentConfig,
-        VideoMixerComponentConfig,
-        VideoAnalyzerComponentConfig,
-        ScreenCaptureComponentConfig,
-        AudioCaptureComponentConfig,
-        VideoCaptureComponentConfig,
-        RtmpPublisherComponentConfig,
-        MediaInspectorComponentConfig,
-        MediaDownloaderComponentConfig,
-        AudioExtractorComponentConfig,
-        AudioClipperComponentConfig,
-        AudioConverterComponentConfig,
-        AudioProcessorComponentConfig,
-        AudioFeatureExtractorComponentConfig,
-        AudioAnalyzerComponentConfig,
-        AudioPlaybackComponentConfig,
-        AudioMixerComponentConfig,
-        KeyValueStoreComponentConfig,
-        GraphStoreComponentConfig,
-        FileStoreComponentConfig,
-        SearchEngineComponentConfig,
-        DataQueueComponentConfig
-    ],
-    Field(discriminator="type")
-]
+# The config class of each component type. Its schema lives in the module named
+# after the type ("http-server" -> impl/http_server) and is only imported once a
+# component of that type is validated.
+ComponentConfigNames: Dict[ComponentType, str] = {
+    ComponentType.HTTP_SERVER:             "HttpServerComponentConfig",
+    ComponentType.HTTP_CLIENT:             "HttpClientComponentConfig",
+    ComponentType.WEBSOCKET_SERVER:        "WebSocketServerComponentConfig",
+    ComponentType.WEBSOCKET_CLIENT:        "WebSocketClientComponentConfig",
+    ComponentType.MCP_SERVER:              "McpServerComponentConfig",
+    ComponentType.MCP_CLIENT:              "McpClientComponentConfig",
+    ComponentType.MODEL:                   "ModelComponentConfig",
+    ComponentType.MODEL_MEMORY:            "ModelMemoryComponentConfig",
+    ComponentType.MODEL_TOKENIZER:         "ModelTokenizerComponentConfig",
+    ComponentType.DATASETS:                "DatasetsComponentConfig",
+    ComponentType.VECTOR_STORE:            "VectorStoreComponentConfig",
+    ComponentType.WORKFLOW:                "WorkflowComponentConfig",
+    ComponentType.SHELL:                   "ShellComponentConfig",
+    ComponentType.TEXT_SPLITTER:           "TextSplitterComponentConfig",
+    ComponentType.SENTENCE_SPLITTER:       "SentenceSplitterComponentConfig",
+    ComponentType.TRANSCRIPT_CORRECTOR:    "TranscriptCorrectorComponentConfig",
+    ComponentType.IMAGE_PROCESSOR:         "ImageProcessorComponentConfig",
+    ComponentType.IMAGE_COMPRESSOR:        "ImageCompressorComponentConfig",
+    ComponentType.IMAGE_ANALYZER:          "ImageAnalyzerComponentConfig",
+    ComponentType.VECTOR_PROCESSOR:        "VectorProcessorComponentConfig",
+    ComponentType.WEB_SCRAPER:             "WebScraperComponentConfig",
+    ComponentType.AGENT:                   "AgentComponentConfig",
+    ComponentType.WEB_BROWSER:             "WebBrowserComponentConfig",
+    ComponentType.HTML_FRAME_RENDERER:     "HtmlFrameRendererComponentConfig",
+    ComponentType.VIDEO_SCENE_DETECTOR:    "VideoSceneDetectorComponentConfig",
+    ComponentType.VIDEO_CLIPPER:           "VideoClipperComponentConfig",
+    ComponentType.VIDEO_CONVERTER:         "VideoConverterComponentConfig",
+    ComponentType.VIDEO_ENCODER:           "VideoEncoderComponentConfig",
+    ComponentType.VIDEO_FRAME_EXTRACTOR:   "VideoFrameExtractorComponentConfig",
+    ComponentType.VIDEO_MIXER:             "VideoMixerComponentConfig",
+    ComponentType.VIDEO_ANALYZER:          "VideoAnalyzerComponentConfig",
+    ComponentType.SCREEN_CAPTURE:          "ScreenCaptureComponentConfig",
+    ComponentType.AUDIO_CAPTURE:           "AudioCaptureComponentConfig",
+    ComponentType.VIDEO_CAPTURE:           "VideoCaptureComponentConfig",
+    ComponentType.RTMP_PUBLISHER:          "RtmpPublisherComponentConfig",
+    ComponentType.MEDIA_INSPECTOR:         "MediaInspectorComponentConfig",
+    ComponentType.MEDIA_DOWNLOADER:        "MediaDownloaderComponentConfig",
+    ComponentType.AUDIO_EXTRACTOR:         "AudioExtractorComponentConfig",
+    ComponentType.AUDIO_CLIPPER:           "AudioClipperComponentConfig",
+    ComponentType.AUDIO_CONVERTER:         "AudioConverterComponentConfig",
+    ComponentType.AUDIO_PROCESSOR:         "AudioProcessorComponentConfig",
+    ComponentType.AUDIO_FEATURE_EXTRACTOR: "AudioFeatureExtractorComponentConfig",
+    ComponentType.AUDIO_ANALYZER:          "AudioAnalyzerComponentConfig",
+    ComponentType.AUDIO_PLAYBACK:          "AudioPlaybackComponentConfig",
+    ComponentType.AUDIO_MIXER:             "AudioMixerComponentConfig",
+    ComponentType.KEY_VALUE_STORE:         "KeyValueStoreComponentConfig",
+    ComponentType.GRAPH_STORE:             "GraphStoreComponentConfig",
+    ComponentType.FILE_STORE:              "FileStoreComponentConfig",
+    ComponentType.SEARCH_ENGINE:           "SearchEngineComponentConfig",
+    ComponentType.DATA_QUEUE:              "DataQueueComponentConfig"
+}
+
+ComponentConfigUnion = LazyDiscriminatedUnion("type", {
+    type.value: f"{__package__}.impl.{type.value.replace('-', '_')}:{name}" for type, name in ComponentConfigNames.items()
+})
+
+ComponentConfig = Annotated[CommonComponentConfig, ComponentConfigUnion]
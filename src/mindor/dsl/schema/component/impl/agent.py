@@ -16,4 +16,6 @@ class AgentComponentConfig(CommonComponentConfig):
     instructions: Optional[str] = Field(default=None, description="System-message text that sets the agent's persona and behavior.")
     tools: List[Union[str, ModelTool]] = Field(default_factory=list, description="Workflow IDs or tool schemas the agent may call.")
     max_iteration_count: int = Field(default=32, description="Maximum number of reasoning-and-tool iterations before the agent halts.")
+    max_concurrent_tool_calls: int = Field(default=0, ge=0, description="Maximum number of workflow tool calls run at once within an iteration; 0 means unlimited.")
+    tool_timeout: Optional[Union[str, int, float]] = Field(default=None, description="Maximum time a single workflow tool call may run before it is cancelled and reported as an error (e.g., 30s); unlimited when omitted.")
     actions: List[AgentActionConfig] = Field(default_factory=list)
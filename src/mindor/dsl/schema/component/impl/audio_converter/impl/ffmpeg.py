@@ -5,4 +5,6 @@ from .common import CommonAudioConverterComponentConfig, AudioConverterDriver
 
 class FFmpegAudioConverterComponentConfig(CommonAudioConverterComponentConfig):
     driver: Literal[AudioConverterDriver.FFMPEG]
+    max_concurrent_processes: int = Field(default=0, description="Maximum FFmpeg processes this component runs at once; 0 means unbounded.")
+    in_process: bool = Field(default=True, description="Whether conversions of plain PCM WAV audio that keep its sample rate run in-process instead of spawning FFmpeg.")
     actions: List[AudioConverterActionConfig] = Field(default_factory=list)
@@ -5,4 +5,6 @@ from .common import CommonAudioMixerComponentConfig, AudioMixerDriver
 
 class FFmpegAudioMixerComponentConfig(CommonAudioMixerComponentConfig):
     driver: Literal[AudioMixerDriver.FFMPEG]
+    max_concurrent_processes: int = Field(default=0, description="Maximum FFmpeg processes this component runs at once; 0 means unbounded.")
+    in_process: bool = Field(default=True, description="Whether concat and overlay of plain PCM WAV audio run in-process instead of spawning FFmpeg.")
     actions: List[AudioMixerActionConfig] = Field(default_factory=list)
@@ -14,6 +14,7 @@ class CommonComponentConfig(BaseModel):
     runtime: RuntimeConfig = Field(..., description="Runtime environment in which this component executes.")
     max_concurrent_count: int = Field(default=0, description="Maximum concurrent actions this component runs; 0 means unbounded.")
     default: bool = Field(default=False, description="Whether to use this component when none is explicitly selected.")
+    depends_on: List[str] = Field(default_factory=list, description="IDs of components that must be ready before this component starts.")
     actions: List[CommonActionConfig] = Field(default_factory=list, description="Actions this component exposes to workflows.")
 
     @model_validator(mode="before")
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Literal, Union
 from enum import Enum
 from pydantic import Field
 from ...common import CommonComponentConfig, ComponentType
@@ -10,3 +10,4 @@ class CommonDataQueueComponentConfig(CommonComponentConfig):
     type: Literal[ComponentType.DATA_QUEUE]
     driver: DataQueueDriver = Field(..., description="Backend implementation used for the data queue.")
     max_size: int = Field(default=0, ge=0, description="Maximum number of items the queue can hold; 0 means unbounded.")
+    session_idle_timeout: Union[str, int, float] = Field(default="10m", description="Idle time after which an empty session with no consumers or waiting producers is removed, as a duration string (e.g., \"10m\") or seconds; sessions still holding items are kept until consumed, and \"0s\" disables expiry.")
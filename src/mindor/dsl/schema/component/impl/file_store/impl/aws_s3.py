@@ -1,9 +1,9 @@
 from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
 from pydantic import BaseModel, Field
 from mindor.dsl.schema.action import AwsS3FileStoreActionConfig
-from .common import CommonFileStoreComponentConfig, FileStoreDriver
+from .common import CommonRemoteFileStoreComponentConfig, FileStoreDriver
 
-class AwsS3FileStoreComponentConfig(CommonFileStoreComponentConfig):
+class AwsS3FileStoreComponentConfig(CommonRemoteFileStoreComponentConfig):
     driver: Literal[FileStoreDriver.AWS_S3]
     bucket: str = Field(..., description="Name of the S3 bucket that backs this store.")
     region: Optional[str] = Field(default=None, description="AWS region hosting the bucket; falls back to the SDK default when unset.")
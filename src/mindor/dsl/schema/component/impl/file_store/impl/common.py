@@ -1,7 +1,8 @@
 from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from ...common import CommonComponentConfig, ComponentType
+import os
 
 class FileStoreDriver(str, Enum):
     LOCAL       = "local"
@@ -13,3 +14,23 @@ class CommonFileStoreComponentConfig(CommonComponentConfig):
     type: Literal[ComponentType.FILE_STORE]
     driver: FileStoreDriver = Field(..., description="Backend implementation used for the file store.")
     base_path: Optional[str] = Field(default=None, description="Path or key prefix prepended to every action's target path.")
+
+class FileStoreCacheConfig(BaseModel):
+    path: Optional[str] = Field(default=None, description="Local directory holding cached objects; defaults to `file-store` under the user cache directory.")
+    max_size: Union[int, str] = Field(default="10GB", description="Maximum total size of cached objects; least recently used objects are evicted beyond it.")
+
+    @field_validator("path", mode="after")
+    def expand_path(cls, value: Optional[str]) -> Optional[str]:
+        return os.path.expanduser(value) if value else value
+
+    def get_cache_dir(self) -> str:
+        return self.path or os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "file-store")
+
+class CommonRemoteFileStoreComponentConfig(CommonFileStoreComponentConfig):
+    cache: Optional[FileStoreCacheConfig] = Field(default=None, description="Local read-through disk cache for downloaded objects, validated against each object's ETag. `true` enables it with default settings.")
+
+    @field_validator("cache", mode="before")
+    def inflate_cache(cls, value: Any) -> Any:
+        if isinstance(value, bool):
+            return {} if value else None
+        return value
@@ -1,9 +1,9 @@
 from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
 from pydantic import BaseModel, Field
 from mindor.dsl.schema.action import GcpStorageFileStoreActionConfig
-from .common import CommonFileStoreComponentConfig, FileStoreDriver
+from .common import CommonRemoteFileStoreComponentConfig, FileStoreDriver
 
-class GcpStorageFileStoreComponentConfig(CommonFileStoreComponentConfig):
+class GcpStorageFileStoreComponentConfig(CommonRemoteFileStoreComponentConfig):
     driver: Literal[FileStoreDriver.GCP_STORAGE]
     bucket: str = Field(..., description="Name of the GCS bucket that backs this store.")
     project: Optional[str] = Field(default=None, description="GCP project ID that owns the bucket; falls back to the SDK default when unset.")
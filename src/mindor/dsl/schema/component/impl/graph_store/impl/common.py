@@ -11,3 +11,4 @@ class GraphStoreDriver(str, Enum):
 class CommonGraphStoreComponentConfig(CommonComponentConfig):
     type: Literal[ComponentType.GRAPH_STORE]
     driver: GraphStoreDriver = Field(..., description="Backend implementation used for the graph store.")
+    write_batch_size: int = Field(default=1000, ge=1, description="Maximum nodes, relationships or IDs sent in one batched write statement.")
@@ -11,3 +11,4 @@ class ImageCompressorDriver(str, Enum):
 class CommonImageCompressorComponentConfig(CommonComponentConfig):
     type: Literal[ComponentType.IMAGE_COMPRESSOR]
     driver: ImageCompressorDriver = Field(..., description="Backend implementation used to compress images.")
+    max_workers: int = Field(default=0, ge=0, description="Images compressed in parallel, in worker processes or concurrent pngquant runs; 0 uses the number of CPUs.")
@@ -1,41 +1,47 @@
 from typing import Union, Dict, Annotated, Any
-from pydantic import Field
+from mindor.dsl.utils.lazy import LazyDiscriminatedUnion
 from ..common import ComponentType, component_validator
 from .tasks import *
 
+# The config class of each model task, defined in the task module named after it
+# ("text-generation" -> tasks/text_generation) and imported on first use.
+ModelComponentConfigNames: Dict[ModelTaskType, str] = {
+    ModelTaskType.TEXT_GENERATION:          "TextGenerationModelComponentConfig",
+    ModelTaskType.CHAT_COMPLETION:          "ChatCompletionModelComponentConfig",
+    ModelTaskType.TEXT_TO_TEXT:             "TextToTextModelComponentConfig",
+    ModelTaskType.TEXT_CLASSIFICATION:      "TextClassificationModelComponentConfig",
+    ModelTaskType.TEXT_EMBEDDING:           "TextEmbeddingModelComponentConfig",
+    ModelTaskType.TEXT_RERANKING:           "TextRerankingModelComponentConfig",
+    ModelTaskType.IMAGE_TO_TEXT:            "ImageToTextModelComponentConfig",
+    ModelTaskType.IMAGE_TEXT_TO_TEXT:       "ImageTextToTextModelComponentConfig",
+    ModelTaskType.IMAGE_GENERATION:         "ImageGenerationModelComponentConfig",
+    ModelTaskType.IMAGE_EMBEDDING:          "ImageEmbeddingModelComponentConfig",
+    ModelTaskType.IMAGE_UPSCALE:            "ImageUpscaleModelComponentConfig",
+    ModelTaskType.IMAGE_BACKGROUND_REMOVAL: "ImageBackgroundRemovalModelComponentConfig",
+    ModelTaskType.IMAGE_SEGMENTATION:       "ImageSegmentationModelComponentConfig",
+    ModelTaskType.TEXT_TO_VIDEO:            "TextToVideoModelComponentConfig",
+    ModelTaskType.IMAGE_TO_VIDEO:           "ImageToVideoModelComponentConfig",
+    ModelTaskType.OBJECT_DETECTION:         "ObjectDetectionModelComponentConfig",
+    ModelTaskType.FACE_DETECTION:           "FaceDetectionModelComponentConfig",
+    ModelTaskType.POSE_DETECTION:           "PoseDetectionModelComponentConfig",
+    ModelTaskType.POSE_TRACKING:            "PoseTrackingModelComponentConfig",
+    ModelTaskType.FACE_EMBEDDING:           "FaceEmbeddingModelComponentConfig",
+    ModelTaskType.FACE_TRACKING:            "FaceTrackingModelComponentConfig",
+    ModelTaskType.FACE_SWAP:                "FaceSwapModelComponentConfig",
+    ModelTaskType.TEXT_TO_SPEECH:           "TextToSpeechModelComponentConfig",
+    ModelTaskType.SPEECH_TO_TEXT:           "SpeechToTextModelComponentConfig",
+    ModelTaskType.AUDIO_TEXT_ALIGNMENT:     "AudioTextAlignmentModelComponentConfig",
+    ModelTaskType.VOICE_ACTIVITY_DETECTION: "VoiceActivityDetectionModelComponentConfig",
+    ModelTaskType.SPEAKER_DIARIZATION:      "SpeakerDiarizationModelComponentConfig",
+    ModelTaskType.MUSIC_GENERATION:         "MusicGenerationModelComponentConfig",
+    ModelTaskType.MUSIC_SOURCE_SEPARATION:  "MusicSourceSeparationModelComponentConfig"
+}
+
 ModelComponentConfig = Annotated[
-    Union[
-        TextGenerationModelComponentConfig,
-        ChatCompletionModelComponentConfig,
-        TextToTextModelComponentConfig,
-        TextClassificationModelComponentConfig,
-        TextEmbeddingModelComponentConfig,
-        TextRerankingModelComponentConfig,
-        ImageToTextModelComponentConfig,
-        ImageTextToTextModelComponentConfig,
-        ImageGenerationModelComponentConfig,
-        ImageEmbeddingModelComponentConfig,
-        ImageUpscaleModelComponentConfig,
-        ImageBackgroundRemovalModelComponentConfig,
-        ImageSegmentationModelComponentConfig,
-        TextToVideoModelComponentConfig,
-        ImageToVideoModelComponentConfig,
-        ObjectDetectionModelComponentConfig,
-        FaceDetectionModelComponentConfig,
-        PoseDetectionModelComponentConfig,
-        PoseTrackingModelComponentConfig,
-        FaceEmbeddingModelComponentConfig,
-        FaceTrackingModelComponentConfig,
-        FaceSwapModelComponentConfig,
-        TextToSpeechModelComponentConfig,
-        SpeechToTextModelComponentConfig,
-        AudioTextAlignmentModelComponentConfig,
-        VoiceActivityDetectionModelComponentConfig,
-        SpeakerDiarizationModelComponentConfig,
-        MusicGenerationModelComponentConfig,
-        MusicSourceSeparationModelComponentConfig
-    ],
-    Field(discriminator="task")
+    CommonModelComponentConfig,
+    LazyDiscriminatedUnion("task", {
+        task.value: f"{__package__}.tasks.{task.value.replace('-', '_')}:{name}" for task, name in ModelComponentConfigNames.items()
+    })
 ]
 
 @component_validator(ComponentType.MODEL, mode="before")
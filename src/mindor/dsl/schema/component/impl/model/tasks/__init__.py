@@ -1,31 +1,37 @@
+from mindor.dsl.utils.lazy import lazy_star_imports
 from .common import *
-from .base import *
-from .text_generation import *
-from .chat_completion import *
-from .text_to_text import *
-from .text_classification import *
-from .text_embedding import *
-from .text_reranking import *
-from .image_to_text import *
-from .image_text_to_text import *
-from .image_generation import *
-from .image_embedding import *
-from .image_upscale import *
-from .image_background_removal import *
-from .image_segmentation import *
-from .text_to_video import *
-from .image_to_video import *
-from .object_detection import *
-from .face_detection import *
-from .face_embedding import *
-from .face_tracking import *
-from .face_swap import *
-from .pose_detection import *
-from .pose_tracking import *
-from .text_to_speech import *
-from .speech_to_text import *
-from .audio_text_alignment import *
-from .voice_activity_detection import *
-from .speaker_diarization import *
-from .music_generation import *
-from .music_source_separation import *
+
+# Task modules are imported on first access to one of their names, so loading
+# the schema of one model task does not import all of them.
+__getattr__ = lazy_star_imports(__name__, [
+    "base",
+    "text_generation",
+    "chat_completion",
+    "text_to_text",
+    "text_classification",
+    "text_embedding",
+    "text_reranking",
+    "image_to_text",
+    "image_text_to_text",
+    "image_generation",
+    "image_embedding",
+    "image_upscale",
+    "image_background_removal",
+    "image_segmentation",
+    "text_to_video",
+    "image_to_video",
+    "object_detection",
+    "face_detection",
+    "face_embedding",
+    "face_tracking",
+    "face_swap",
+    "pose_detection",
+    "pose_tracking",
+    "text_to_speech",
+    "speech_to_text",
+    "audio_text_alignment",
+    "voice_activity_detection",
+    "speaker_diarization",
+    "music_generation",
+    "music_source_separation"
+])
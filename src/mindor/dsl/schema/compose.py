@@ -3,7 +3,7 @@ from pydantic import BaseModel, Field
 from pydantic import model_validator
 
 from .controller import ControllerConfig
-from .component import ComponentConfig
+from .component import ComponentConfig, ComponentConfigUnion
 from .component.impl.common import apply_component_validators
 from .listener import ListenerConfig
 from .gateway import GatewayConfig
@@ -82,11 +82,17 @@ class ComposeConfig(BaseModel):
     def apply_component_before_validators(cls, values: Dict[str, Any]):
         if "components" in values:
             for component in values["components"]:
-                apply_component_validators(component, mode="before")
+                cls._apply_component_before_validators(component)
         if "component" in values:
-            apply_component_validators(values["component"], mode="before")
+            cls._apply_component_before_validators(values["component"])
         return values
 
+    @classmethod
+    def _apply_component_before_validators(cls, component: Dict[str, Any]) -> None:
+        # Validators are registered when the schema module of the component type is imported.
+        ComponentConfigUnion.import_member(component.get("type"))
+        apply_component_validators(component, mode="before")
+
     @model_validator(mode="after")
     def apply_component_after_validators(self):
         for component in self.components:
@@ -1,3 +1,5 @@
 from .controller import *
+from .admission import *
+from .startup import *
 from .adapter import *
 from .queue import *
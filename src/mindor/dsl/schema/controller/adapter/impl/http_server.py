@@ -9,10 +9,28 @@ class WebSocketConfig(BaseModel):
     ping_interval: Union[str, int, float] = Field(default="30s", description="Interval between server-side keepalive pings; '0s' disables pings.")
     ping_timeout: Union[str, int, float] = Field(default="10s", description="Maximum seconds to wait for a ping response before closing the connection.")
 
+class StreamCoalescingConfig(BaseModel):
+    max_delay: Union[str, int, float] = Field(default="20ms", description="Maximum time a streamed chunk is held back to be merged with the following ones.")
+    max_bytes: Union[str, int] = Field(default="64KB", description="Size of merged chunks at which they are written without waiting for 'max_delay'.")
+
+class TaskCallbackConfig(BaseModel):
+    max_concurrency: int = Field(default=16, ge=1, description="Maximum callback requests in flight at once.")
+    max_connections_per_host: int = Field(default=4, ge=1, description="Maximum kept-alive connections to a single callback host.")
+    timeout: Union[str, int, float] = Field(default="30s", description="Timeout for a single callback request.")
+    max_retries: int = Field(default=5, ge=0, description="Maximum retries after a failed delivery before the event is dropped.")
+    retry_backoff: Union[str, int, float] = Field(default="1s", description="Delay before the first retry; doubled on every further retry, with jitter.")
+    max_retry_backoff: Union[str, int, float] = Field(default="60s", description="Upper bound on the delay between retries.")
+    batch_size: int = Field(default=1, ge=1, description="Maximum events posted together to the same callback URL; values above 1 send a JSON array.")
+    batch_interval: Union[str, int, float] = Field(default="1s", description="Maximum time an event waits for others to fill its batch.")
+    outbox: Optional[str] = Field(default=None, description="Path to a SQLite database keeping undelivered events across restarts.")
+
 class HttpServerControllerAdapterConfig(CommonControllerAdapterConfig):
     type: Literal[ControllerAdapterType.HTTP_SERVER]
     origins: Optional[str] = Field(default="*", description="Comma-separated list of allowed CORS origins.")
     websocket: Union[bool, WebSocketConfig] = Field(default_factory=WebSocketConfig, description="WebSocket settings; false disables the endpoint, true uses defaults.")
+    workers: int = Field(default=1, ge=1, description="Number of controller processes serving this adapter on a shared SO_REUSEPORT socket.")
+    stream_coalescing: Union[bool, StreamCoalescingConfig] = Field(default=False, description="Merges streamed output chunks into fewer writes; true uses defaults. Requests can override it with 'coalesce'.")
+    callback: TaskCallbackConfig = Field(default_factory=TaskCallbackConfig, description="Delivery settings for task completion callbacks sent to 'callback_url'.")
 
     @model_validator(mode="before")
     def inflate_websocket(cls, values: Dict[str, Any]):
@@ -20,3 +38,9 @@ class HttpServerControllerAdapterConfig(CommonControllerAdapterConfig):
         if websocket is True:
             values["websocket"] = {}
         return values
+
+    @model_validator(mode="before")
+    def inflate_stream_coalescing(cls, values: Dict[str, Any]):
+        if values.get("stream_coalescing") is True:
+            values["stream_coalescing"] = {}
+        return values
@@ -1,2 +1,3 @@
 from .common import *
 from .redis import *
+from .sqlite import *
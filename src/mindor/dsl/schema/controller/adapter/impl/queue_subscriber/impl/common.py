@@ -4,7 +4,8 @@ from pydantic import BaseModel, Field, model_validator
 from ...types import ControllerAdapterType
 
 class QueueSubscriberDriver(str, Enum):
-    REDIS = "redis"
+    REDIS  = "redis"
+    SQLITE = "sqlite"
 
 class CommonQueueSubscriberControllerAdapterConfig(BaseModel):
     type: Literal[ControllerAdapterType.QUEUE_SUBSCRIBER]
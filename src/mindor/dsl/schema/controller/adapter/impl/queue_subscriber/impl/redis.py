@@ -1,5 +1,6 @@
 from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
 from pydantic import BaseModel, Field, model_validator
+from mindor.dsl.schema.controller.queue.impl.redis import RedisQueueMode
 from .common import CommonQueueSubscriberControllerAdapterConfig, QueueSubscriberDriver
 
 class RedisQueueSubscriberControllerAdapterConfig(CommonQueueSubscriberControllerAdapterConfig):
@@ -11,6 +12,11 @@ class RedisQueueSubscriberControllerAdapterConfig(CommonQueueSubscriberControlle
     database: int = Field(default=0, ge=0, le=15, description="Redis logical database number to select on connect.")
     password: Optional[str] = Field(default=None, description="Password for authenticating with Redis; may also be embedded in `url`.")
     pop_timeout: Union[str, int, float] = Field(default="1s", description="Blocking pop timeout before retrying the queue read (e.g., '1s', '500ms').")
+    mode: RedisQueueMode = Field(default=RedisQueueMode.LIST, description="Queue data structure: 'list' (BRPOP, at-most-once) or 'stream' (consumer group with batched reads and explicit ack, at-least-once).")
+    consumer_group: str = Field(default="workers", description="Consumer group shared by all workers reading the same queues in 'stream' mode.")
+    claim_idle_time: Union[str, int, float] = Field(default="5m", description="Idle time after which a pending entry of a crashed worker is reclaimed in 'stream' mode.")
+    claim_interval: Union[str, int, float] = Field(default="30s", description="Interval between stale-entry reclaim passes and in-flight entry heartbeats in 'stream' mode.")
+    max_deliveries: int = Field(default=5, ge=1, description="Maximum number of times an entry is delivered in 'stream' mode; an entry reclaimed beyond it is failed and moved to the '<queue>:dead' stream.")
 
     @model_validator(mode="before")
     def validate_url_or_host(cls, values: Dict[str, Any]):
@@ -0,0 +1,12 @@
+from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
+from pydantic import BaseModel, Field
+from .common import CommonQueueSubscriberControllerAdapterConfig, QueueSubscriberDriver
+
+class SqliteQueueSubscriberControllerAdapterConfig(CommonQueueSubscriberControllerAdapterConfig):
+    driver: Literal[QueueSubscriberDriver.SQLITE]
+    path: str = Field(default="controller-queue.sqlite", description="Filesystem path to the SQLite database file shared with the queue dispatcher on this host.")
+    blob_dir: Optional[str] = Field(default=None, description="Directory where binary payloads are spilled; defaults to '<path>.blobs'.")
+    poll_interval: Union[str, int, float] = Field(default="50ms", description="Interval between polls of the queue database for new tasks and control messages.")
+    claim_idle_time: Union[str, int, float] = Field(default="5m", description="Time after which a task claimed by a worker that stopped heartbeating is handed to another worker.")
+    claim_interval: Union[str, int, float] = Field(default="30s", description="Interval between stale-task reclaim passes and heartbeats of in-flight tasks.")
+    max_deliveries: int = Field(default=5, ge=1, description="Maximum number of times a task is claimed; a task claimed beyond it is failed and moved to the dead task table.")
@@ -4,7 +4,8 @@ from .impl import *
 
 QueueSubscriberControllerAdapterConfig = Annotated[
     Union[
-        RedisQueueSubscriberControllerAdapterConfig
+        RedisQueueSubscriberControllerAdapterConfig,
+        SqliteQueueSubscriberControllerAdapterConfig
     ],
     Field(discriminator="driver")
 ]
@@ -0,0 +1,13 @@
+from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
+from enum import Enum
+from pydantic import BaseModel, Field
+
+class AdmissionFairShareKey(str, Enum):
+    WORKFLOW = "workflow"
+    SESSION  = "session"
+
+class ControllerAdmissionConfig(BaseModel):
+    max_queue_size: int = Field(default=0, ge=0, description="Maximum tasks waiting for a free slot; further requests are rejected immediately. 0 means unbounded.")
+    queue_timeout: Union[str, int, float] = Field(default="0s", description="Maximum time a task may wait in the queue before it expires; '0s' waits indefinitely.")
+    fair_share_by: List[AdmissionFairShareKey] = Field(default_factory=list, description="Keys that partition queued tasks into groups served round-robin, e.g. [ workflow, session ].")
+    priority_key: Optional[str] = Field(default="priority", description="Request metadata key holding an integer priority; higher values are dequeued first.")
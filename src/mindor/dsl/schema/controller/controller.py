@@ -5,6 +5,8 @@ from mindor.dsl.schema.runtime import RuntimeConfig, RuntimeType
 from .adapter import ControllerAdapterConfig
 from .queue import ControllerQueueConfig, ControllerQueueDriver, RedisControllerQueueConfig
 from .webui import ControllerWebUIConfig, ControllerWebUIDriver
+from .admission import ControllerAdmissionConfig
+from .startup import ControllerStartupConfig
 
 class ControllerConfig(BaseModel):
     name: Optional[str] = Field(default=None, description="Name of controller.")
@@ -12,6 +14,8 @@ class ControllerConfig(BaseModel):
     max_concurrent_count: int = Field(default=0, description="Maximum concurrent tasks the controller runs; 0 means unbounded.")
     shutdown_pending_period: Union[str, int, float] = Field(default="0s", description="Grace period before shutdown begins, allowing traffic to drain.")
     shutdown_timeout: Union[str, int, float] = Field(default="30s", description="Maximum time to wait for in-progress tasks during shutdown.")
+    admission: Optional[ControllerAdmissionConfig] = Field(default=None, description="Bounded, prioritised admission of tasks waiting for one of the max_concurrent_count slots.")
+    startup: ControllerStartupConfig = Field(default_factory=ControllerStartupConfig, description="How components are brought up when the controller starts.")
     threaded: bool = Field(default=False, description="Whether to run tasks on separate worker threads.")
     queue: Optional[ControllerQueueConfig] = Field(default=None, description="Queue used to dispatch workflow execution to remote workers.")
     webui: Optional[ControllerWebUIConfig] = Field(default=None, description="Web UI served alongside the controller.")
@@ -39,6 +43,12 @@ class ControllerConfig(BaseModel):
             webui["driver"] = ControllerWebUIDriver.GRADIO
         return values
 
+    @model_validator(mode="after")
+    def validate_admission(self):
+        if self.admission and self.max_concurrent_count <= 0:
+            raise ValueError("'admission' requires a positive 'max_concurrent_count'.")
+        return self
+
     @model_validator(mode="after")
     def validate_runtime(self):
         if self.runtime.type in [ RuntimeType.VIRTUALENV ]:
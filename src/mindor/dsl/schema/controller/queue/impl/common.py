@@ -3,7 +3,8 @@ from enum import Enum
 from pydantic import BaseModel, Field
 
 class ControllerQueueDriver(str, Enum):
-    REDIS = "redis"
+    REDIS  = "redis"
+    SQLITE = "sqlite"
 
 class CommonControllerQueueConfig(BaseModel):
     driver: ControllerQueueDriver = Field(..., description="Backend implementation used for the controller task queue.")
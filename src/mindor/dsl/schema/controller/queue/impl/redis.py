@@ -1,7 +1,12 @@
 from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
+from enum import Enum
 from pydantic import BaseModel, Field, model_validator
 from .common import CommonControllerQueueConfig, ControllerQueueDriver
 
+class RedisQueueMode(str, Enum):
+    LIST   = "list"
+    STREAM = "stream"
+
 class RedisControllerQueueConfig(CommonControllerQueueConfig):
     driver: Literal[ControllerQueueDriver.REDIS]
     url: Optional[str] = Field(default=None, description="Full connection URL for the Redis server. Mutually exclusive with `host`.")
@@ -10,6 +15,7 @@ class RedisControllerQueueConfig(CommonControllerQueueConfig):
     secure: bool = Field(default=False, description="Whether to connect over TLS/SSL (equivalent to the rediss:// scheme).")
     database: int = Field(default=0, ge=0, le=15, description="Redis logical database number to select on connect.")
     password: Optional[str] = Field(default=None, description="Password for authenticating with Redis; may also be embedded in `url`.")
+    mode: RedisQueueMode = Field(default=RedisQueueMode.LIST, description="Queue data structure: 'list' (LPUSH/BRPOP) or 'stream' (XADD with consumer groups). Must match the subscribers' mode.")
 
     @model_validator(mode="before")
     def validate_url_or_host(cls, values: Dict[str, Any]):
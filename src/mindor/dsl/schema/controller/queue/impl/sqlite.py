@@ -0,0 +1,9 @@
+from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
+from pydantic import BaseModel, Field
+from .common import CommonControllerQueueConfig, ControllerQueueDriver
+
+class SqliteControllerQueueConfig(CommonControllerQueueConfig):
+    driver: Literal[ControllerQueueDriver.SQLITE]
+    path: str = Field(default="controller-queue.sqlite", description="Filesystem path to the SQLite database file shared with the queue subscribers on this host.")
+    blob_dir: Optional[str] = Field(default=None, description="Directory where binary payloads are spilled; defaults to '<path>.blobs'.")
+    poll_interval: Union[str, int, float] = Field(default="50ms", description="Interval between polls of the queue database for results and stream chunks.")
@@ -5,6 +5,7 @@ from .impl import *
 ControllerQueueConfig = Annotated[
     Union[
         RedisControllerQueueConfig,
+        SqliteControllerQueueConfig,
     ],
     Field(discriminator="driver")
 ]
@@ -0,0 +1,8 @@
+from typing import Type, Union, Literal, Optional, Dict, List, Tuple, Set, Annotated, Any
+from pydantic import BaseModel, Field
+
+class ControllerStartupConfig(BaseModel):
+    max_concurrent_count: int = Field(default=4, ge=0, description="Maximum components started at the same time; 0 means unbounded.")
+    ram_budget: Optional[int] = Field(default=None, ge=0, description="System RAM in megabytes that components being started may use together, estimated from their runtime_spec.")
+    vram_budget: Optional[int] = Field(default=None, ge=0, description="VRAM in megabytes that components being started may use together, estimated from their runtime_spec.")
+    serve_partial: bool = Field(default=False, description="Whether to start serving before every component is ready, accepting only workflows whose components are ready.")
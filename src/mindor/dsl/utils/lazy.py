@@ -0,0 +1,98 @@
+from typing import Callable, Dict, List, Optional, Any
+from enum import Enum
+from pydantic import TypeAdapter
+from pydantic_core import core_schema, PydanticCustomError
+import importlib
+import sys
+
+class LazyDiscriminatedUnion:
+    """Annotated marker for a discriminated union whose members are imported on demand.
+
+    Members are given as `tag -> "module:attribute"` paths instead of types, so a
+    member's schema module is only imported the first time a value carrying its
+    tag is validated.
+    """
+    def __init__(self, discriminator: str, members: Dict[str, str]):
+        self.discriminator: str = discriminator
+        self.members: Dict[str, str] = members
+        self._adapters: Dict[str, TypeAdapter] = {}
+
+    def import_member(self, tag: Any) -> Optional[Any]:
+        tag = self._normalize_tag(tag)
+
+        if tag not in self.members:
+            return None
+
+        module_name, attr_name = self.members[tag].split(":")
+
+        if module_name not in sys.modules:
+            from mindor.core.utils.startup_profiler import startup_profiler
+            with startup_profiler.measure("import", f"schema:{tag}"):
+                importlib.import_module(module_name)
+
+        return getattr(sys.modules[module_name], attr_name)
+
+    def __get_pydantic_core_schema__(self, source: Any, handler: Callable[[Any], core_schema.CoreSchema]) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(self._validate)
+
+    def __get_pydantic_json_schema__(self, schema: core_schema.CoreSchema, handler: Callable[[Any], Any]) -> Any:
+        choices = { tag: self._get_adapter(tag).core_schema for tag in self.members }
+        return handler(core_schema.tagged_union_schema(choices, self.discriminator))
+
+    def _validate(self, value: Any) -> Any:
+        tag = value.get(self.discriminator) if isinstance(value, dict) else getattr(value, self.discriminator, None)
+
+        if tag is None:
+            raise PydanticCustomError(
+                "union_tag_not_found",
+                "Unable to extract tag using discriminator '{discriminator}'",
+                { "discriminator": self.discriminator }
+            )
+
+        tag = self._normalize_tag(tag)
+
+        if tag not in self.members:
+            raise PydanticCustomError(
+                "union_tag_invalid",
+                "Input tag '{tag}' found using '{discriminator}' does not match any of the expected tags: {expected_tags}",
+                { "tag": tag, "discriminator": self.discriminator, "expected_tags": ", ".join(f"'{member}'" for member in self.members) }
+            )
+
+        return self._get_adapter(tag).validate_python(value)
+
+    def _get_adapter(self, tag: str) -> TypeAdapter:
+        if tag not in self._adapters:
+            self._adapters[tag] = TypeAdapter(self.import_member(tag))
+        return self._adapters[tag]
+
+    def _normalize_tag(self, tag: Any) -> Any:
+        return tag.value if isinstance(tag, Enum) else tag
+
+def lazy_star_imports(package: str, module_names: List[str]) -> Callable[[str], Any]:
+    """Builds a module `__getattr__` standing in for `from .<module> import *` of each module.
+
+    A missing name is looked up in the modules whose names appear in it first
+    (`HttpServerActionConfig` is tried in `http_server` before anything else),
+    so a lookup normally imports a single module instead of all of them.
+    """
+    def __getattr__(name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        for module_name in _get_candidate_modules(name, module_names):
+            module = importlib.import_module(f"{package}.{module_name}")
+            if not name.startswith("_") and hasattr(module, name):
+                value = getattr(module, name)
+                setattr(sys.modules[package], name, value)
+                return value
+
+        raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+    return __getattr__
+
+def _get_candidate_modules(name: str, module_names: List[str]) -> List[str]:
+    compact_name = name.lower()
+    matches = [ module_name for module_name in module_names if module_name.replace("_", "") in compact_name ]
+    matches.sort(key=len, reverse=True)
+
+    return matches + [ module_name for module_name in module_names if module_name not in matches ]
@@ -9,6 +9,7 @@ Tests are skipped automatically if Redis is unreachable.
 
 import asyncio
 import io
+import json
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import pytest
@@ -167,14 +168,16 @@ async def _start_subscriber(
     queue_name: str,
     workflows: List[str],
     controller: DummyController,
+    **overrides,
 ) -> RedisCommonQueueSubscriberControllerAdapterService:
     config = RedisQueueSubscriberControllerAdapterConfig(
         type=ControllerAdapterType.QUEUE_SUBSCRIBER,
         driver=QueueSubscriberDriver.REDIS,
         name=queue_name,
         workflows=workflows,
-        pop_timeout="1s",
-        max_concurrent_count=1,
+        pop_timeout=overrides.pop("pop_timeout", "1s"),
+        max_concurrent_count=overrides.pop("max_concurrent_count", 1),
+        **overrides,
     )
     service = RedisCommonQueueSubscriberControllerAdapterService(
         config=config,
@@ -592,3 +595,115 @@ async def test_cancel_listener_stops_on_subscriber_shutdown(redis_available, que
     assert all(worker.done() for worker in subscriber._workers) or subscriber._workers == []
 
     await dispatcher._stop()
+
+
+@pytest.mark.anyio
+async def test_stream_mode_batched_round_trip(redis_available, queue_name):
+    """In stream mode a single subscriber reads a batch up to its free slots,
+    runs the tasks concurrently and acks + deletes each entry after publishing."""
+    if not redis_available:
+        pytest.skip("Redis not available on localhost:6379")
+
+    async def handler(workflow_id: str, input: Dict[str, Any], on_interrupt: Any) -> Dict[str, Any]:
+        await asyncio.sleep(0.2)
+        return { "echo": input }
+
+    controller = DummyController(workflows=[WORKFLOW_ID], handler=handler)
+    dispatcher = await _start_dispatcher(queue_name, mode="stream")
+    subscriber = await _start_subscriber(queue_name, [WORKFLOW_ID], controller, mode="stream", max_concurrent_count=4)
+
+    try:
+        started = asyncio.get_running_loop().time()
+        results = await asyncio.gather(*[
+            dispatcher._dispatch(task_id=f"task-{i}", workflow_id=WORKFLOW_ID, input={ "i": i }, on_interrupt=None)
+            for i in range(4)
+        ])
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert results == [ { "echo": { "i": i } } for i in range(4) ]
+        assert elapsed < 0.7  # ran concurrently, not 4 x 0.2s
+
+        queue_key = f"{queue_name}:{WORKFLOW_ID}"
+        assert await dispatcher.client.xlen(queue_key) == 0
+        assert (await dispatcher.client.xpending(queue_key, "workers"))["pending"] == 0
+    finally:
+        await _stop_subscriber(subscriber)
+        await dispatcher.client.delete(f"{queue_name}:{WORKFLOW_ID}")
+        await dispatcher._stop()
+
+
+@pytest.mark.anyio
+async def test_stream_mode_reclaims_entries_of_crashed_worker(redis_available, queue_name):
+    """An entry delivered to a consumer that never acked it is reclaimed by a
+    live subscriber once it has been idle longer than claim_idle_time."""
+    if not redis_available:
+        pytest.skip("Redis not available on localhost:6379")
+
+    controller = DummyController(workflows=[WORKFLOW_ID])
+    dispatcher = await _start_dispatcher(queue_name, mode="stream")
+    queue_key = f"{queue_name}:{WORKFLOW_ID}"
+
+    try:
+        await dispatcher.client.xgroup_create(queue_key, "workers", id="0", mkstream=True)
+        await dispatcher.client.xadd(queue_key, { "message": '{"task_id": "orphan", "run_id": "r1", "input": {"a": 1}}' })
+        await dispatcher.client.xreadgroup("workers", "crashed-worker", { queue_key: ">" }, count=1)
+
+        subscriber = await _start_subscriber(
+            queue_name, [WORKFLOW_ID], controller,
+            mode="stream", claim_idle_time="500ms", claim_interval="200ms", pop_timeout="100ms",
+        )
+        try:
+            for _ in range(50):
+                if controller.received:
+                    break
+                await asyncio.sleep(0.1)
+
+            assert controller.received == [ { "workflow_id": WORKFLOW_ID, "input": { "a": 1 } } ]
+            await asyncio.sleep(0.2)
+            assert (await dispatcher.client.xpending(queue_key, "workers"))["pending"] == 0
+        finally:
+            await _stop_subscriber(subscriber)
+    finally:
+        await dispatcher.client.delete(queue_key)
+        await dispatcher._stop()
+
+
+@pytest.mark.anyio
+async def test_stream_mode_dead_letters_entries_past_max_deliveries(redis_available, queue_name):
+    """An entry reclaimed after it was already delivered max_deliveries times is
+    not run again: its task is failed and the entry moves to the dead stream."""
+    if not redis_available:
+        pytest.skip("Redis not available on localhost:6379")
+
+    controller = DummyController(workflows=[WORKFLOW_ID])
+    dispatcher = await _start_dispatcher(queue_name, mode="stream")
+    queue_key = f"{queue_name}:{WORKFLOW_ID}"
+    dead_key = f"{queue_key}:dead"
+    result_key = f"{queue_key}:r1"
+
+    try:
+        await dispatcher.client.xgroup_create(queue_key, "workers", id="0", mkstream=True)
+        await dispatcher.client.xadd(queue_key, { "message": '{"task_id": "poison", "run_id": "r1", "input": {"a": 1}}' })
+        await dispatcher.client.xreadgroup("workers", "crashed-worker", { queue_key: ">" }, count=1)
+
+        subscriber = await _start_subscriber(
+            queue_name, [WORKFLOW_ID], controller,
+            mode="stream", claim_idle_time="200ms", claim_interval="100ms", pop_timeout="100ms", max_deliveries=1,
+        )
+        try:
+            for _ in range(50):
+                if await dispatcher.client.xlen(dead_key):
+                    break
+                await asyncio.sleep(0.1)
+
+            assert controller.received == []
+            dead_entries = await dispatcher.client.xrange(dead_key)
+            assert len(dead_entries) == 1
+            assert dead_entries[0][1][b"deliveries"] == b"2"
+            assert (await dispatcher.client.xpending(queue_key, "workers"))["pending"] == 0
+            assert json.loads(await dispatcher.client.get(result_key))["status"] == "failed"
+        finally:
+            await _stop_subscriber(subscriber)
+    finally:
+        await dispatcher.client.delete(queue_key, dead_key, result_key)
+        await dispatcher._stop()
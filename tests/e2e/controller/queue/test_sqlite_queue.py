@@ -0,0 +1,364 @@
+"""End-to-end tests for the embedded SQLite queue dispatcher + subscriber.
+
+Brings up a real SqliteControllerQueueService and SqliteCommonQueueSubscriberControllerAdapterService
+side-by-side against a database file in a temporary directory. Unlike the Redis
+tests these need no external service and run everywhere aiosqlite is installed.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from starlette.datastructures import UploadFile
+
+from mindor.core.controller.base import InterruptState
+from mindor.core.controller.adapters.services.queue_subscriber.drivers.sqlite import (
+    SqliteCommonQueueSubscriberControllerAdapterService,
+)
+from mindor.core.controller.queue.drivers.sqlite import SqliteControllerQueueService
+from mindor.dsl.schema.controller import (
+    ControllerAdapterType,
+    ControllerQueueDriver,
+    QueueSubscriberDriver,
+    SqliteControllerQueueConfig,
+    SqliteQueueSubscriberControllerAdapterConfig,
+)
+
+from .test_redis_queue import DummyController, WORKFLOW_ID
+
+pytest.importorskip("aiosqlite")
+
+QUEUE_NAME = "test-e2e"
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Fixtures
+# ──────────────────────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def database_path(tmp_path) -> str:
+    return str(tmp_path / "queue.sqlite")
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Helpers to wire up dispatcher + subscriber against one database file
+# ──────────────────────────────────────────────────────────────────────────────
+
+async def _start_dispatcher(database_path: str, **overrides) -> SqliteControllerQueueService:
+    config = SqliteControllerQueueConfig(
+        driver=ControllerQueueDriver.SQLITE,
+        name=QUEUE_NAME,
+        path=database_path,
+        timeout=overrides.pop("timeout", "10s"),
+        poll_interval=overrides.pop("poll_interval", "10ms"),
+        **overrides,
+    )
+    service = SqliteControllerQueueService(config)
+    await service._start()
+    return service
+
+
+async def _start_subscriber(
+    database_path: str,
+    controller: DummyController,
+    **overrides,
+) -> SqliteCommonQueueSubscriberControllerAdapterService:
+    config = SqliteQueueSubscriberControllerAdapterConfig(
+        type=ControllerAdapterType.QUEUE_SUBSCRIBER,
+        driver=QueueSubscriberDriver.SQLITE,
+        name=QUEUE_NAME,
+        path=database_path,
+        workflows=[WORKFLOW_ID],
+        poll_interval=overrides.pop("poll_interval", "10ms"),
+        max_concurrent_count=overrides.pop("max_concurrent_count", 1),
+        **overrides,
+    )
+    service = SqliteCommonQueueSubscriberControllerAdapterService(
+        config=config,
+        controller=controller,  # type: ignore[arg-type]
+        daemon=True,
+    )
+    serve_task = asyncio.create_task(service._serve())
+    await asyncio.sleep(0.1)
+    service._serve_task = serve_task  # type: ignore[attr-defined]
+    return service
+
+
+async def _stop_subscriber(service: SqliteCommonQueueSubscriberControllerAdapterService) -> None:
+    await service._shutdown()
+    serve_task = getattr(service, "_serve_task", None)
+    if serve_task is not None:
+        try:
+            await asyncio.wait_for(serve_task, timeout=2.0)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Scenarios
+# ──────────────────────────────────────────────────────────────────────────────
+
+@pytest.mark.anyio
+async def test_json_input_round_trip(database_path):
+    controller = DummyController(workflows=[WORKFLOW_ID])
+    dispatcher = await _start_dispatcher(database_path)
+    subscriber = await _start_subscriber(database_path, controller)
+
+    try:
+        result = await dispatcher._dispatch(
+            task_id="task-1",
+            workflow_id=WORKFLOW_ID,
+            input={ "greeting": "hi", "n": 42 },
+            on_interrupt=None,
+        )
+
+        assert result == { "echo": { "greeting": "hi", "n": 42 } }
+        assert controller.received_task_ids == ["task-1"]
+    finally:
+        await _stop_subscriber(subscriber)
+        await dispatcher._stop()
+
+
+@pytest.mark.anyio
+async def test_upload_file_spills_to_blob_dir_and_is_consumed(database_path):
+    payload = b"\x89PNG\r\n\x1a\n" + b"binary-image-bytes" * 100
+    captured: Dict[str, Any] = {}
+
+    async def handler(workflow_id: str, input: Dict[str, Any], on_interrupt: Any) -> Dict[str, Any]:
+        image = input["image"]
+        assert isinstance(image, UploadFile)
+        captured["bytes"] = await image.read()
+        captured["filename"] = image.filename
+        return { "size": len(captured["bytes"]) }
+
+    controller = DummyController(workflows=[WORKFLOW_ID], handler=handler)
+    dispatcher = await _start_dispatcher(database_path)
+    subscriber = await _start_subscriber(database_path, controller)
+
+    try:
+        import io
+        upload = UploadFile(file=io.BytesIO(payload), filename="picture.png")
+        result = await dispatcher._dispatch(
+            task_id="task-2",
+            workflow_id=WORKFLOW_ID,
+            input={ "image": upload },
+            on_interrupt=None,
+        )
+
+        assert result == { "size": len(payload) }
+        assert captured == { "bytes": payload, "filename": "picture.png" }
+        assert os.listdir(f"{database_path}.blobs") == []
+    finally:
+        await _stop_subscriber(subscriber)
+        await dispatcher._stop()
+
+
+@pytest.mark.anyio
+async def test_dispatcher_cleanup_on_serialize_failure(database_path):
+    dispatcher = await _start_dispatcher(database_path, max_blob_size="100B")
+
+    try:
+        with pytest.raises(Exception):
+            await dispatcher._dispatch(
+                task_id="task-3",
+                workflow_id=WORKFLOW_ID,
+                input={ "small": b"x" * 10, "huge": b"x" * 500 },
+                on_interrupt=None,
+            )
+
+        assert os.listdir(f"{database_path}.blobs") == []
+    finally:
+        await dispatcher._stop()
+
+
+@pytest.mark.anyio
+async def test_batched_claim_runs_tasks_concurrently(database_path):
+    async def handler(workflow_id: str, input: Dict[str, Any], on_interrupt: Any) -> Dict[str, Any]:
+        await asyncio.sleep(0.2)
+        return { "echo": input }
+
+    controller = DummyController(workflows=[WORKFLOW_ID], handler=handler)
+    dispatcher = await _start_dispatcher(database_path)
+    subscriber = await _start_subscriber(database_path, controller, max_concurrent_count=4)
+
+    try:
+        started = time.monotonic()
+        results = await asyncio.gather(*[
+            dispatcher._dispatch(task_id=f"task-{i}", workflow_id=WORKFLOW_ID, input={ "i": i }, on_interrupt=None)
+            for i in range(4)
+        ])
+
+        assert results == [ { "echo": { "i": i } } for i in range(4) ]
+        assert time.monotonic() - started < 0.7
+
+        async with dispatcher.store.connection.execute("SELECT COUNT(*) FROM queue_tasks") as cursor:
+            assert (await cursor.fetchone())[0] == 0
+    finally:
+        await _stop_subscriber(subscriber)
+        await dispatcher._stop()
+
+
+@pytest.mark.anyio
+async def test_dispatch_timeout_when_subscriber_absent(database_path):
+    dispatcher = await _start_dispatcher(database_path, timeout="300ms")
+
+    try:
+        with pytest.raises(TimeoutError, match="Queue dispatch timed out"):
+            await dispatcher._dispatch(
+                task_id="task-4",
+                workflow_id=WORKFLOW_ID,
+                input={ "x": 1 },
+                on_interrupt=None,
+            )
+    finally:
+        await dispatcher._stop()
+
+
+@pytest.mark.anyio
+async def test_interrupt_resume_round_trip(database_path):
+    received_by_dispatcher: List[Dict[str, Any]] = []
+
+    async def dispatcher_on_interrupt(interrupt: Dict[str, Any]) -> Any:
+        received_by_dispatcher.append(interrupt)
+        return { "decision": "approve" }
+
+    async def handler(workflow_id: str, input: Dict[str, Any], on_interrupt: Any) -> Dict[str, Any]:
+        answer = await on_interrupt(InterruptState(job_id="job-A", phase="before", message="please approve"))
+        return { "resumed_with": answer }
+
+    controller = DummyController(workflows=[WORKFLOW_ID], handler=handler)
+    dispatcher = await _start_dispatcher(database_path)
+    subscriber = await _start_subscriber(database_path, controller)
+
+    try:
+        result = await dispatcher._dispatch(
+            task_id="task-5",
+            workflow_id=WORKFLOW_ID,
+            input={},
+            on_interrupt=dispatcher_on_interrupt,
+        )
+
+        assert [ interrupt["job_id"] for interrupt in received_by_dispatcher ] == ["job-A"]
+        assert result == { "resumed_with": { "decision": "approve" } }
+    finally:
+        await _stop_subscriber(subscriber)
+        await dispatcher._stop()
+
+
+@pytest.mark.anyio
+async def test_stream_output_round_trip(database_path):
+    async def handler(workflow_id: str, input: Dict[str, Any], on_interrupt: Any):
+        async def _stream():
+            for index in range(3):
+                yield { "token": index }
+        return _stream()
+
+    controller = DummyController(workflows=[WORKFLOW_ID], handler=handler)
+    dispatcher = await _start_dispatcher(database_path)
+    subscriber = await _start_subscriber(database_path, controller)
+
+    try:
+        stream = await dispatcher._dispatch(
+            task_id="task-6",
+            workflow_id=WORKFLOW_ID,
+            input={},
+            on_interrupt=None,
+        )
+
+        assert [ chunk async for chunk in stream ] == [ { "token": 0 }, { "token": 1 }, { "token": 2 } ]
+    finally:
+        await _stop_subscriber(subscriber)
+        await dispatcher._stop()
+
+
+@pytest.mark.anyio
+async def test_cancel_broadcast_reaches_running_task(database_path):
+    handler_started = asyncio.Event()
+
+    async def handler(workflow_id: str, input: Dict[str, Any], on_interrupt: Any) -> Dict[str, Any]:
+        handler_started.set()
+        await controller.cancel_event("cancel-target-1").wait()
+        return { "cancelled": True }
+
+    controller = DummyController(workflows=[WORKFLOW_ID], handler=handler)
+    dispatcher = await _start_dispatcher(database_path, timeout="5s")
+    subscriber = await _start_subscriber(database_path, controller)
+
+    dispatch_task = asyncio.create_task(dispatcher._dispatch(
+        task_id="cancel-target-1",
+        workflow_id=WORKFLOW_ID,
+        input={},
+        on_interrupt=None,
+    ))
+
+    try:
+        await asyncio.wait_for(handler_started.wait(), timeout=3.0)
+        await dispatcher.cancel("cancel-target-1")
+
+        assert await asyncio.wait_for(dispatch_task, timeout=3.0) == { "cancelled": True }
+    finally:
+        if not dispatch_task.done():
+            dispatch_task.cancel()
+        await _stop_subscriber(subscriber)
+        await dispatcher._stop()
+
+
+@pytest.mark.anyio
+async def test_stale_claim_is_reclaimed(database_path):
+    """A task claimed by a worker that stopped heartbeating is picked up by a
+    live subscriber once it has been idle longer than claim_idle_time."""
+    controller = DummyController(workflows=[WORKFLOW_ID])
+    dispatcher = await _start_dispatcher(database_path)
+
+    try:
+        await dispatcher.store.push(f"{QUEUE_NAME}:{WORKFLOW_ID}", '{"task_id": "orphan", "run_id": "r1", "input": {"a": 1}}')
+        claimed = await dispatcher.store.claim([f"{QUEUE_NAME}:{WORKFLOW_ID}"], "crashed-worker", 1, time.time())
+        assert len(claimed) == 1
+
+        subscriber = await _start_subscriber(database_path, controller, claim_idle_time="300ms", claim_interval="100ms")
+        try:
+            for _ in range(50):
+                if controller.received:
+                    break
+                await asyncio.sleep(0.05)
+
+            assert controller.received == [ { "workflow_id": WORKFLOW_ID, "input": { "a": 1 } } ]
+        finally:
+            await _stop_subscriber(subscriber)
+    finally:
+        await dispatcher._stop()
+
+
+@pytest.mark.anyio
+async def test_task_past_max_deliveries_is_dead_lettered(database_path):
+    """A reclaimed task that was already delivered max_deliveries times is not run
+    again: its task is failed and it moves to the dead task table."""
+    controller = DummyController(workflows=[WORKFLOW_ID])
+    dispatcher = await _start_dispatcher(database_path)
+    queue_key = f"{QUEUE_NAME}:{WORKFLOW_ID}"
+
+    try:
+        await dispatcher.store.push(queue_key, '{"task_id": "poison", "run_id": "r1", "input": {"a": 1}}')
+        assert len(await dispatcher.store.claim([queue_key], "crashed-worker", 1, time.time())) == 1
+
+        subscriber = await _start_subscriber(database_path, controller, claim_idle_time="300ms", claim_interval="100ms", max_deliveries=1)
+        try:
+            result = await asyncio.wait_for(dispatcher._wait_for_message(f"{queue_key}:r1"), timeout=5.0)
+
+            assert result["status"] == "failed"
+            assert "2 deliveries" in result["error"]
+            assert controller.received == []
+            async with dispatcher.store.connection.execute("SELECT message, deliveries FROM queue_dead_tasks") as cursor:
+                assert [ deliveries for _, deliveries in await cursor.fetchall() ] == [2]
+        finally:
+            await _stop_subscriber(subscriber)
+    finally:
+        await dispatcher._stop()
@@ -0,0 +1,155 @@
+"""E2E test: request routing between HTTP server workers sharing one port.
+
+Runs two `http-server` adapters in-process as workers 1 and 2 of a worker group,
+each bound to the same TCP port through SO_REUSEPORT and to its own Unix socket.
+Task lookups, resumes and WebSocket subscriptions for a task owned by worker 2
+are issued against worker 1 directly (via its Unix socket) and must be served by
+worker 2.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from contextlib import closing
+from typing import Dict, Optional
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+
+from mindor.core.controller.adapters.services.http_server import HttpServerControllerAdapterService
+from mindor.core.controller.base import TaskEvent, TaskState, TaskStatus
+from mindor.core.controller.workers import ControllerWorkerContext
+from mindor.dsl.schema.controller import ControllerAdapterType, HttpServerControllerAdapterConfig
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT not available")
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _free_port() -> int:
+    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class FakeController:
+    def __init__(self, worker_context: ControllerWorkerContext):
+        self.worker_context = worker_context
+        self.task_states: Dict[str, TaskState] = {}
+        self.is_shutdown_pending = False
+        self.is_shutting_down = False
+        self.add_task_state_listener = MagicMock()
+        self.add_task_event_listener = MagicMock()
+        self.add_job_event_listener = MagicMock()
+        self.remove_task_state_listener = MagicMock()
+        self.remove_task_event_listener = MagicMock()
+        self.remove_job_event_listener = MagicMock()
+
+    def get_task_state(self, task_id: str) -> Optional[TaskState]:
+        return self.task_states.get(task_id)
+
+    async def resume_workflow(self, task_id, job_id, run_id=None, answer=None) -> TaskState:
+        state = self.task_states[task_id]
+        state.status = TaskStatus.PROCESSING
+        return state
+
+
+async def _start_worker(index: int, runtime_dir: str, port: int):
+    context = ControllerWorkerContext(index=index, count=3, runtime_dir=runtime_dir, token="secret", parent_pid=0)
+    controller = FakeController(context)
+    config = HttpServerControllerAdapterConfig(
+        type=ControllerAdapterType.HTTP_SERVER,
+        host="127.0.0.1",
+        port=port,
+        base_path="/api",
+        workers=3,
+    )
+    adapter = HttpServerControllerAdapterService(config, controller, daemon=True)
+    await adapter.start()
+
+    for _ in range(100):
+        if adapter.server and adapter.server.started:
+            break
+        await asyncio.sleep(0.05)
+
+    return adapter, controller
+
+
+def _worker_session(adapter: HttpServerControllerAdapterService) -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(connector=aiohttp.UnixConnector(path=adapter.worker_context.get_socket_path()))
+
+
+@pytest.mark.anyio
+async def test_requests_are_routed_to_owning_worker(tmp_path):
+    port = _free_port()
+    worker1, _ = await _start_worker(1, str(tmp_path), port)
+    worker2, controller2 = await _start_worker(2, str(tmp_path), port)
+
+    task_id = controller2.worker_context.generate_task_id()
+    controller2.task_states[task_id] = TaskState(task_id=task_id, status=TaskStatus.INTERRUPTED, workflow_id="echo")
+
+    try:
+        async with _worker_session(worker1) as session:
+            async with session.get(f"http://worker/api/tasks/{task_id}") as response:
+                assert response.status == 200
+                assert await response.json() == { "task_id": task_id, "status": "interrupted", "workflow_id": "echo" }
+
+            async with session.get(f"http://worker/api/tasks/{task_id[:-1]}1") as response:
+                assert response.status == 404
+
+            async with session.post(f"http://worker/api/tasks/{task_id}/resume", json={ "job_id": "job-A" }) as response:
+                assert response.status == 200
+                assert (await response.json())["status"] == "processing"
+
+            async with session.get(f"http://worker/api/tasks/{task_id}/relay") as response:
+                assert response.status == 404
+    finally:
+        await worker1.stop()
+        await worker2.stop()
+
+
+@pytest.mark.anyio
+async def test_websocket_subscription_relays_owner_events(tmp_path):
+    port = _free_port()
+    worker1, _ = await _start_worker(1, str(tmp_path), port)
+    worker2, controller2 = await _start_worker(2, str(tmp_path), port)
+
+    task_id = controller2.worker_context.generate_task_id()
+    controller2.task_states[task_id] = TaskState(task_id=task_id, status=TaskStatus.PROCESSING, workflow_id="echo")
+
+    try:
+        async with _worker_session(worker1) as session:
+            async with session.ws_connect(f"http://worker/api/ws?task={task_id}") as websocket:
+                subscribed = await websocket.receive_json(timeout=5)
+                assert subscribed["type"] == "task_subscribed"
+                assert subscribed["data"]["state"]["status"] == "processing"
+
+                await worker2._on_task_event(TaskEvent(
+                    task_id=task_id,
+                    workflow_id="echo",
+                    event="completed",
+                    status=TaskStatus.COMPLETED,
+                    output={ "message": "done" },
+                ))
+
+                event = await websocket.receive_json(timeout=5)
+                assert event["type"] == "task_event"
+                assert event["data"]["event"] == "completed"
+                assert event["data"]["output"] == { "message": "done" }
+
+        for _ in range(50):
+            if not worker1._task_relays and not worker2.websocket_manager.has_task_subscribers(task_id):
+                break
+            await asyncio.sleep(0.05)
+
+        assert worker1._task_relays == {}
+        assert not worker2.websocket_manager.has_task_subscribers(task_id)
+    finally:
+        await worker1.stop()
+        await worker2.stop()
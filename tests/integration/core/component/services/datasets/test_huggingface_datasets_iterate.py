@@ -0,0 +1,232 @@
+"""Integration tests for the HuggingFace datasets driver's `iterate` method and handle cache.
+
+Datasets are written to local parquet / jsonl files under `tmp_path` and loaded
+with the built-in builders, so no network or HF Hub access is needed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("datasets")
+
+import numpy as np
+import pyarrow as pa
+from datasets import Dataset, IterableDataset
+
+from mindor.core.component.context import ComponentActionContext
+from mindor.core.component.services.datasets.drivers import huggingface
+from mindor.core.component.services.datasets.drivers.huggingface import HuggingfaceDatasetsAction
+from mindor.dsl.schema.action import (
+    HuggingfaceDatasetsIterateActionConfig,
+    HuggingfaceDatasetsLoadActionConfig,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def clear_handle_cache():
+    huggingface._dataset_handles.clear()
+    yield
+    huggingface._dataset_handles.clear()
+
+
+@pytest.fixture
+def parquet_file(tmp_path) -> str:
+    path = tmp_path / "rows.parquet"
+    Dataset.from_dict({
+        "id":    list(range(100)),
+        "text":  [ f"row {i}" for i in range(100) ],
+        "label": [ i % 3 for i in range(100) ],
+    }).to_parquet(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def jsonl_file(tmp_path) -> str:
+    path = tmp_path / "rows.jsonl"
+    path.write_text("".join(json.dumps({ "id": i, "text": f"row {i}" }) + "\n" for i in range(50)))
+    return str(path)
+
+
+def _make_context(sources: dict = {}) -> ComponentActionContext:
+    ctx = MagicMock(spec=ComponentActionContext)
+    ctx.cancellation_token = None
+    registered: dict = {}
+
+    def register_source(key: str, value: Any, scope: Any = None) -> None:
+        registered[key] = value
+    ctx.register_source = MagicMock(side_effect=register_source)
+
+    async def render_variable(value, **kwargs):
+        if isinstance(value, str):
+            if value == "${result}":
+                return registered.get("result")
+            for key, resolved in sources.items():
+                if value == "${" + key + "}":
+                    return resolved
+        return value
+    ctx.render_variable = AsyncMock(side_effect=render_variable)
+
+    return ctx
+
+
+async def _iterate(tmp_path, **fields) -> list:
+    config = HuggingfaceDatasetsIterateActionConfig(method="iterate", split="train", cache_dir=str(tmp_path / "cache"), **fields)
+    return [ batch async for batch in await HuggingfaceDatasetsAction(config).run(_make_context()) ]
+
+
+class TestIterate:
+    @pytest.mark.anyio
+    async def test_yields_batches_in_order(self, tmp_path, parquet_file):
+        batches = await _iterate(tmp_path, path="parquet", data_files=parquet_file, batch_size=30)
+
+        assert [ len(batch["id"]) for batch in batches ] == [ 30, 30, 30, 10 ]
+        assert sum((batch["id"] for batch in batches), []) == list(range(100))
+
+    @pytest.mark.anyio
+    async def test_columns_filters_and_limit(self, tmp_path, parquet_file):
+        batches = await _iterate(
+            tmp_path,
+            path="parquet",
+            data_files=parquet_file,
+            columns=[ "text" ],
+            filters=[ [ "label", "==", 0 ], [ "id", "<", 60 ] ],
+            limit=15,
+            batch_size=10,
+        )
+
+        rows = sum((batch["text"] for batch in batches), [])
+        assert all(list(batch.keys()) == [ "text" ] for batch in batches)
+        assert rows == [ f"row {i}" for i in range(0, 45, 3) ]
+
+    @pytest.mark.anyio
+    async def test_filters_on_non_pushdown_builder(self, tmp_path, jsonl_file):
+        batches = await _iterate(tmp_path, path="json", data_files=jsonl_file, columns=[ "id" ], filters=[ [ [ "id", "<", 2 ] ], [ [ "id", ">=", 48 ] ] ])
+
+        assert sum((batch["id"] for batch in batches), []) == [ 0, 1, 48, 49 ]
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("streaming", [ False, True ])
+    async def test_shards_partition_the_rows(self, tmp_path, jsonl_file, streaming):
+        ids = []
+        for shard_index in range(3):
+            batches = await _iterate(tmp_path, path="json", data_files=jsonl_file, streaming=streaming, num_shards=3, shard_index=shard_index)
+            ids.append(sum((batch["id"] for batch in batches), []))
+
+        assert all(ids)
+        assert sorted(sum(ids, [])) == list(range(50))
+
+    @pytest.mark.anyio
+    async def test_numpy_and_arrow_formats(self, tmp_path, parquet_file):
+        numpy_batches = await _iterate(tmp_path, path="parquet", data_files=parquet_file, format="numpy", limit=5)
+        arrow_batches = await _iterate(tmp_path, path="parquet", data_files=parquet_file, format="arrow", limit=5)
+
+        assert isinstance(numpy_batches[0]["id"], np.ndarray)
+        assert numpy_batches[0]["id"].tolist() == [ 0, 1, 2, 3, 4 ]
+        assert isinstance(arrow_batches[0], pa.Table)
+        assert arrow_batches[0].num_rows == 5
+
+    @pytest.mark.anyio
+    async def test_iterates_loaded_dataset(self):
+        dataset = Dataset.from_dict({ "id": list(range(10)) })
+        config = HuggingfaceDatasetsIterateActionConfig(method="iterate", dataset="${input.dataset}", batch_size=4)
+
+        batches = [ batch async for batch in await HuggingfaceDatasetsAction(config).run(_make_context({ "input.dataset": dataset })) ]
+
+        assert [ batch["id"] for batch in batches ] == [ [ 0, 1, 2, 3 ], [ 4, 5, 6, 7 ], [ 8, 9 ] ]
+
+    @pytest.mark.anyio
+    async def test_prefetch_bounds_read_ahead(self, tmp_path):
+        reads = []
+
+        def _rows():
+            for i in range(20):
+                reads.append(i)
+                yield { "id": i }
+
+        dataset = IterableDataset.from_generator(_rows)
+        config = HuggingfaceDatasetsIterateActionConfig(method="iterate", dataset="${input.dataset}", batch_size=1, prefetch=2)
+        stream = await HuggingfaceDatasetsAction(config).run(_make_context({ "input.dataset": dataset }))
+
+        first = await stream.__anext__()
+        await asyncio.sleep(0.2)
+
+        assert first["id"] == [ 0 ]
+        assert len(reads) < 20
+
+        await stream.aclose()
+
+    def test_requires_exactly_one_source(self):
+        with pytest.raises(ValueError):
+            HuggingfaceDatasetsIterateActionConfig(method="iterate")
+
+        with pytest.raises(ValueError):
+            HuggingfaceDatasetsIterateActionConfig(method="iterate", dataset="${input.dataset}", path="parquet")
+
+    @pytest.mark.anyio
+    async def test_invalid_shard_index_is_rejected(self, tmp_path, parquet_file):
+        with pytest.raises(ValueError, match="shard_index"):
+            await _iterate(tmp_path, path="parquet", data_files=parquet_file, num_shards=2, shard_index=2)
+
+
+class TestHandleCache:
+    @pytest.mark.anyio
+    async def test_repeated_loads_reuse_handle(self, tmp_path, parquet_file):
+        config = HuggingfaceDatasetsLoadActionConfig(method="load", path="parquet", data_files=parquet_file, split="train", cache_dir=str(tmp_path / "cache"))
+
+        first  = await HuggingfaceDatasetsAction(config).run(_make_context())
+        second = await HuggingfaceDatasetsAction(config).run(_make_context())
+
+        assert first is second
+        assert len(huggingface._dataset_handles) == 1
+
+    @pytest.mark.anyio
+    async def test_modified_file_invalidates_handle(self, tmp_path, jsonl_file):
+        config = HuggingfaceDatasetsLoadActionConfig(method="load", path="json", data_files=jsonl_file, split="train", cache_dir=str(tmp_path / "cache"))
+
+        first = await HuggingfaceDatasetsAction(config).run(_make_context())
+
+        with open(jsonl_file, "a") as file:
+            file.write(json.dumps({ "id": 50, "text": "row 50" }) + "\n")
+
+        second = await HuggingfaceDatasetsAction(config).run(_make_context())
+
+        assert len(first) == 50
+        assert len(second) == 51
+
+    @pytest.mark.anyio
+    async def test_modified_file_inside_directory_invalidates_handle(self, tmp_path):
+        data_dir = tmp_path / "rows"
+        (data_dir / "nested").mkdir(parents=True)
+        nested_file = data_dir / "nested" / "train.jsonl"
+        nested_file.write_text("".join(json.dumps({ "id": i }) + "\n" for i in range(10)))
+
+        config = HuggingfaceDatasetsLoadActionConfig(method="load", path="json", data_dir=str(data_dir), split="train", cache_dir=str(tmp_path / "cache"))
+
+        first = await HuggingfaceDatasetsAction(config).run(_make_context())
+
+        with open(nested_file, "a") as file:
+            file.write(json.dumps({ "id": 10 }) + "\n")
+
+        second = await HuggingfaceDatasetsAction(config).run(_make_context())
+
+        assert len(first) == 10
+        assert len(second) == 11
+
+    @pytest.mark.anyio
+    async def test_in_memory_datasets_are_not_cached(self, tmp_path, parquet_file):
+        config = HuggingfaceDatasetsLoadActionConfig(method="load", path="parquet", data_files=parquet_file, split="train", keep_in_memory=True, cache_dir=str(tmp_path / "cache"))
+
+        await HuggingfaceDatasetsAction(config).run(_make_context())
+
+        assert len(huggingface._dataset_handles) == 0
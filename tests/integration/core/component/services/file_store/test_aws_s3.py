@@ -14,6 +14,7 @@ pytest.importorskip("moto")
 pytest.importorskip("aioboto3")
 
 from mindor.core.component.context import ComponentActionContext
+from mindor.core.component.services.file_store.cache import FileStoreCache
 from mindor.core.component.services.file_store.drivers.aws_s3 import (
     AwsS3FileStoreAction,
     AwsS3FileStoreService,
@@ -248,6 +249,43 @@ class TestGet:
             await action.run(_ctx())
 
 
+class TestRangedGet:
+    @pytest.mark.anyio
+    async def test_get_in_parts_returns_whole_object(self, s3_client):
+        payload = os.urandom(300 * 1024)
+        await s3_client.put_object(Bucket=BUCKET, Key="big.bin", Body=payload)
+
+        action = _make_action(s3_client, {"method": "get", "path": "big.bin", "part_size": "64KB", "max_concurrency": 3})
+        result = await action.run(_ctx())
+        assert result["content"] == payload
+        assert result["size"] == len(payload)
+
+    @pytest.mark.anyio
+    async def test_save_to_in_parts(self, tmp_path, s3_client):
+        payload = os.urandom(300 * 1024)
+        await s3_client.put_object(Bucket=BUCKET, Key="big.bin", Body=payload)
+
+        dest = str(tmp_path / "big.bin")
+        action = _make_action(s3_client, {"method": "get", "path": "big.bin", "save_to": dest, "part_size": "64KB"})
+        await action.run(_ctx())
+        with open(dest, "rb") as f:
+            assert f.read() == payload
+
+    @pytest.mark.anyio
+    async def test_cache_is_refreshed_when_object_changes(self, tmp_path, s3_client):
+        cache = FileStoreCache(str(tmp_path / "cache"), max_size=1024 * 1024)
+        await s3_client.put_object(Bucket=BUCKET, Key="f.bin", Body=b"first")
+
+        def _cached_action():
+            return AwsS3FileStoreAction(_action({"method": "get", "path": "f.bin"}), s3_client, location=_location(), cache=cache)
+
+        assert (await _cached_action().run(_ctx()))["content"] == b"first"
+        assert (await _cached_action().run(_ctx()))["content"] == b"first"
+
+        await s3_client.put_object(Bucket=BUCKET, Key="f.bin", Body=b"second")
+        assert (await _cached_action().run(_ctx()))["content"] == b"second"
+
+
 class TestDelete:
     @pytest.mark.anyio
     async def test_delete_existing(self, s3_client):
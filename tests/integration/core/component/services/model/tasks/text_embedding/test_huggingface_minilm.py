@@ -16,6 +16,7 @@ from __future__ import annotations
 import asyncio
 import importlib.util
 import math
+import threading
 from collections.abc import AsyncIterator
 from typing import Any, List
 from unittest.mock import AsyncMock, MagicMock
@@ -61,7 +62,7 @@ def minilm_action_factory():
 
     def _factory(config: TextEmbeddingModelActionConfig) -> HuggingfaceTextEmbeddingTaskAction:
         return HuggingfaceTextEmbeddingTaskAction(
-            config, HuggingfaceTextEmbeddingModelArchitecture.BERT, model, tokenizer, device
+            config, HuggingfaceTextEmbeddingModelArchitecture.BERT, model, tokenizer, threading.Lock(), device
         )
 
     return _factory
@@ -424,3 +424,49 @@ class TestErrorPropagation:
 
         with pytest.raises(RuntimeError):
             await FFmpegVideoSceneDetectorAction(config).run(ctx)
+
+
+@pytest.fixture(scope="module")
+def long_multi_scene_video():
+    """Six 1s scenes alternating solid colors and testsrc, with a keyframe every 0.5s."""
+    path = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False).name
+    sources = [ "color=c=red", "testsrc", "color=c=blue", "testsrc2", "color=c=green", "testsrc" ]
+    command = [ "ffmpeg", "-y", "-hide_banner", "-loglevel", "error" ]
+    for source in sources:
+        command.extend([ "-f", "lavfi", "-i", f"{source}:size=64x48:duration=1:rate=10" ])
+    command.extend([
+        "-filter_complex", "".join(f"[{index}:v]" for index in range(len(sources))) + f"concat=n={len(sources)}:v=1:a=0",
+        "-c:v", "libx264", "-pix_fmt", "yuv420p", "-g", "5", "-keyint_min", "5", "-sc_threshold", "0",
+        path,
+    ])
+    try:
+        subprocess.run(command, check=True, capture_output=True)
+    except subprocess.CalledProcessError as e:
+        pytest.skip(f"ffmpeg failed: {e.stderr.decode('utf-8', errors='replace')}")
+    yield path
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+@ffmpeg_required
+class TestSegmentedDetection:
+    """A single video split into keyframe-aligned segments yields the same scenes as one pass."""
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("segment_duration", [ "1s", "1.3s", "2s" ])
+    async def test_matches_single_pass(self, long_multi_scene_video, segment_duration):
+        single = await FFmpegVideoSceneDetectorAction(_make_config()).run(_make_context(long_multi_scene_video))
+        segmented = await FFmpegVideoSceneDetectorAction(_make_config(segment_duration=segment_duration)).run(_make_context(long_multi_scene_video))
+
+        assert len(single) >= 5
+        assert [ scene["start_frame"] for scene in segmented ] == [ scene["start_frame"] for scene in single ]
+
+    @pytest.mark.anyio
+    async def test_streaming_yields_scenes_in_order(self, long_multi_scene_video):
+        config = _make_config(segment_duration="1s", segment_concurrency=3, streaming=True)
+
+        stream = await FFmpegVideoSceneDetectorAction(config).run(_make_context(long_multi_scene_video))
+        scenes = [ scene async for scene in stream ]
+
+        assert [ scene["index"] for scene in scenes ] == list(range(len(scenes)))
+        assert all(a["end_frame"] == b["start_frame"] for a, b in zip(scenes, scenes[1:]))
@@ -21,7 +21,7 @@ from mindor.core.component.runtime.base.ipc_stream import (
 )
 from mindor.core.foundation.streaming.bytes import BytesStreamResource
 from mindor.core.foundation.streaming.text import TextStreamResource
-from mindor.core.foundation.streaming.image import ImageStreamResource
+from mindor.core.foundation.streaming.image import ImageStreamResource, RawImageStreamResource
 from mindor.core.foundation.streaming.audio import (
     AudioStreamResource,
     PcmStreamResource,
@@ -264,6 +264,7 @@ class TestMimeToResourceClass:
             ("text/plain", TextStreamResource),
             # MIME matching is case-insensitive (the implementation lowercases).
             ("IMAGE/PNG", ImageStreamResource),
+            ("image/x-raw", RawImageStreamResource),
         ],
     )
     def test_mime_specific_mapping(self, content_type, expected):
@@ -0,0 +1,198 @@
+"""Tests for the agent loop's tool execution, run offline against a scripted chat model.
+
+The model component is replaced by `ScriptedModel`, which replays a fixed list of
+assistant messages and records the conversation it was sent on every turn.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mindor.core.component.context import ComponentActionContext
+from mindor.core.component.services.agent import AgentAction
+from mindor.core.foundation.variable.time import parse_time
+from mindor.core.workflow.tool import WorkflowTool
+from mindor.dsl.schema.action import AgentActionConfig
+from mindor.dsl.schema.common.model.tool import ModelTool
+from mindor.dsl.schema.component import AgentModelConfig
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class ScriptedModel:
+    def __init__(self, replies: List[Dict[str, Any]]):
+        self.replies = list(replies)
+        self.inputs: List[List[Dict[str, Any]]] = []
+
+    async def run(self, action_id, run_id, input, workflow=None, job_id=None):
+        self.inputs.append(list(input["messages"]))
+        return self.replies.pop(0)
+
+
+def _tool_calls(*calls):
+    return { "role": "assistant", "content": [ { "type": "tool_call", "id": id, "name": name, "arguments": arguments } for id, name, arguments in calls ] }
+
+
+def _answer(text):
+    return { "role": "assistant", "content": [ { "type": "text", "text": text } ] }
+
+
+def _sleep_tool(log: List[str], running: Dict[str, int]):
+    async def _function(seconds: float, label: str, context=None):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        try:
+            await asyncio.sleep(seconds)
+            log.append(label)
+            return { "label": label }
+        finally:
+            running["now"] -= 1
+
+    return WorkflowTool(function=_function, description=None, parameters=[], returns=[])
+
+
+def _make_context():
+    context = MagicMock(spec=ComponentActionContext)
+    context.workflow = MagicMock()
+    context.job_id = "job"
+    context.run_id = "run"
+    context.event_notifier = MagicMock()
+    context.event_notifier.notify = AsyncMock()
+    sources: Dict[str, Any] = {}
+
+    def register_source(key, value, scope=None):
+        sources[key] = value
+
+    async def render_variable(value, scope=None, skip_decode=False):
+        if isinstance(value, dict):
+            return { key: await render_variable(item) for key, item in value.items() }
+        if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
+            return sources.get(value[2:-1])
+        return value
+
+    async def render_scalar(value, cast, default=None):
+        if value is None:
+            return default
+        return parse_time(value) if cast == "time" else cast(value)
+
+    context.register_source = MagicMock(side_effect=register_source)
+    context.render_variable = AsyncMock(side_effect=render_variable)
+    context.render_scalar = AsyncMock(side_effect=render_scalar)
+    return context
+
+
+def _make_action(model, tools, **fields):
+    config = AgentActionConfig(prompt="Do the thing.", **fields)
+    model_config = AgentModelConfig(component="model", input={ "messages": "${messages}" })
+    return AgentAction(config, model, model_config, tools, [], "Be brief.", 8)
+
+
+class TestToolExecution:
+    @pytest.mark.anyio
+    async def test_tool_calls_run_concurrently_and_finish_in_completion_order(self):
+        log, running = [], { "now": 0, "peak": 0 }
+        model = ScriptedModel([
+            _tool_calls(("a", "sleep", { "seconds": 0.05, "label": "slow" }), ("b", "sleep", { "seconds": 0.01, "label": "fast" })),
+            _answer("done"),
+        ])
+        action = _make_action(model, { "sleep": _sleep_tool(log, running) })
+
+        messages = await action.run(_make_context())
+
+        assert running["peak"] == 2
+        assert [ message["content"][0]["id"] for message in messages[1:3] ] == [ "b", "a" ]
+        assert messages[-1] == _answer("done")
+
+    @pytest.mark.anyio
+    async def test_max_concurrent_tool_calls_limits_parallelism(self):
+        log, running = [], { "now": 0, "peak": 0 }
+        model = ScriptedModel([
+            _tool_calls(*[ (str(index), "sleep", { "seconds": 0.01, "label": str(index) }) for index in range(5) ]),
+            _answer("done"),
+        ])
+        action = _make_action(model, { "sleep": _sleep_tool(log, running) }, max_concurrent_tool_calls=2)
+
+        await action.run(_make_context())
+
+        assert running["peak"] == 2
+        assert sorted(log) == [ "0", "1", "2", "3", "4" ]
+
+    @pytest.mark.anyio
+    async def test_tool_timeout_reports_error_without_blocking_others(self):
+        log, running = [], { "now": 0, "peak": 0 }
+        model = ScriptedModel([
+            _tool_calls(("a", "sleep", { "seconds": 5, "label": "stuck" }), ("b", "sleep", { "seconds": 0, "label": "quick" })),
+            _answer("done"),
+        ])
+        action = _make_action(model, { "sleep": _sleep_tool(log, running) }, tool_timeout="50ms")
+
+        messages = await asyncio.wait_for(action.run(_make_context()), 1.0)
+        results = { message["content"][0]["id"]: message["content"][0] for message in messages[1:3] }
+
+        assert results["b"]["content"] == '{"label": "quick"}'
+        assert results["a"]["is_error"] is True
+        assert "TimeoutError" in results["a"]["content"]
+        assert log == [ "quick" ]
+
+    @pytest.mark.anyio
+    async def test_unknown_tool_is_reported(self):
+        model = ScriptedModel([ _tool_calls(("a", "missing", {})), _answer("done") ])
+
+        messages = await _make_action(model, {}).run(_make_context())
+
+        assert messages[1]["content"][0]["is_error"] is True
+
+    @pytest.mark.anyio
+    async def test_external_tools_wait_alongside_workflow_tools(self):
+        log, running = [], { "now": 0, "peak": 0 }
+        model = ScriptedModel([
+            _tool_calls(("a", "client", {}), ("b", "sleep", { "seconds": 0, "label": "workflow" })),
+            _answer("done"),
+        ])
+        action = _make_action(model, { "client": ModelTool(name="client"), "sleep": _sleep_tool(log, running) })
+        context = _make_context()
+
+        async def interrupt(point):
+            await asyncio.sleep(0.02)
+            assert log == [ "workflow" ]
+            return { "a": "from client" }
+
+        context.workflow.interrupt_handler.interrupt = AsyncMock(side_effect=interrupt)
+        messages = await action.run(context)
+
+        assert [ message["content"][0]["id"] for message in messages[1:3] ] == [ "b", "a" ]
+        assert messages[2]["content"][0]["content"] == "from client"
+
+
+class TestHistory:
+    @pytest.mark.anyio
+    async def test_model_sees_initial_messages_on_every_turn(self):
+        model = ScriptedModel([ _tool_calls(("a", "missing", {})), _answer("done") ])
+
+        messages = await _make_action(model, {}).run(_make_context())
+
+        assert [ message["role"] for message in model.inputs[0] ] == [ "system", "user" ]
+        assert [ message["role"] for message in model.inputs[1] ] == [ "system", "user", "assistant", "tool" ]
+        assert [ message["role"] for message in messages ] == [ "assistant", "tool", "assistant" ]
+
+    @pytest.mark.anyio
+    async def test_streaming_yields_tool_results_as_they_finish(self):
+        log, running = [], { "now": 0, "peak": 0 }
+        model = ScriptedModel([
+            _tool_calls(("a", "sleep", { "seconds": 0.05, "label": "slow" }), ("b", "sleep", { "seconds": 0, "label": "fast" })),
+            _answer("done"),
+        ])
+        stream = await _make_action(model, { "sleep": _sleep_tool(log, running) }, streaming=True).run(_make_context())
+
+        assert (await stream.__anext__())["role"] == "assistant"
+        assert (await stream.__anext__())["content"][0]["id"] == "b"
+        assert log == [ "fast" ]
+        assert (await stream.__anext__())["content"][0]["id"] == "a"
+        assert (await stream.__anext__()) == _answer("done")
@@ -0,0 +1,81 @@
+"""Tests for the FFmpeg audio clipper's in-process WAV path.
+
+WAV inputs are built in memory, so none of these tests need ffmpeg on PATH.
+"""
+
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from mindor.core.component.services.audio_clipper.drivers.ffmpeg import FFmpegAudioClipperAction
+from mindor.core.foundation.streaming.bytes import BytesStreamResource
+from mindor.core.foundation.streaming.media import MediaSource
+from mindor.core.foundation.streaming.resources import read_stream_to_bytes
+from mindor.core.foundation.variable.array import ArrayValue
+from mindor.core.utils.audio import parse_wav
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _wav(samples, sample_rate=10, sample_width=2) -> MediaSource:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(sample_rate)
+        writer.writeframes(np.asarray(samples, dtype="<i2").tobytes() if sample_width == 2 else bytes(samples))
+    return MediaSource(BytesStreamResource(buffer.getvalue()), "wav")
+
+
+async def _samples(resource) -> list:
+    return np.frombuffer(parse_wav(await read_stream_to_bytes(resource)).data, dtype="<i2").tolist()
+
+
+def _spans(*spans):
+    return ArrayValue([ { "start_time": start, "end_time": end } for start, end in spans ])
+
+
+class TestInProcess:
+    @pytest.mark.anyio
+    async def test_clips_each_span(self):
+        [ clips ] = await FFmpegAudioClipperAction(None)._clip_batch([ _wav(range(20)) ], [ _spans((0.2, 0.5), (1.5, 3.0)) ], merge=False)
+
+        clips = [ clip async for clip in clips ]
+
+        assert [ (clip["start_time"], clip["end_time"]) for clip in clips ] == [ (0.2, 0.5), (1.5, 3.0) ]
+        assert await _samples(clips[0]["audio"]) == [ 2, 3, 4 ]
+        assert await _samples(clips[1]["audio"]) == [ 15, 16, 17, 18, 19 ]
+
+    @pytest.mark.anyio
+    async def test_merges_spans(self):
+        [ result ] = await FFmpegAudioClipperAction(None)._clip_batch([ _wav(range(20)) ], [ _spans((0.0, 0.2), (1.0, 1.1)) ], merge=True)
+
+        assert result["times"] == [ { "start_time": 0.0, "end_time": 0.2 }, { "start_time": 1.0, "end_time": 1.1 } ]
+        assert await _samples(result["audio"]) == [ 0, 1, 10 ]
+
+    @pytest.mark.anyio
+    async def test_merge_without_spans(self):
+        [ result ] = await FFmpegAudioClipperAction(None)._clip_batch([ _wav(range(4)) ], [ _spans() ], merge=True)
+
+        assert result == { "audio": None, "times": [] }
+
+    @pytest.mark.anyio
+    async def test_unsupported_wav_falls_back_to_ffmpeg(self, monkeypatch):
+        paths = []
+
+        async def _resolve_input_path(source):
+            paths.append(await read_stream_to_bytes(source.stream))
+            return "input.wav", False
+
+        action = FFmpegAudioClipperAction(None)
+        monkeypatch.setattr(action, "_resolve_input_path", _resolve_input_path)
+
+        # 8-bit WAV is unsigned and left to ffmpeg; the consumed stream is handed on intact.
+        await action._clip_batch([ _wav([ 128, 129 ], sample_width=1) ], [ _spans((0.0, 0.1)) ], merge=False)
+
+        assert paths == [ await read_stream_to_bytes(_wav([ 128, 129 ], sample_width=1).stream) ]
@@ -0,0 +1,128 @@
+"""Tests for the FFmpeg audio converter's in-process WAV/PCM path and its process limit.
+
+Inputs are built in memory and ffmpeg runs are faked, so none of these tests need ffmpeg on PATH.
+"""
+
+import asyncio
+import io
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from mindor.core.component.services.audio_converter.drivers import ffmpeg
+from mindor.core.component.services.audio_converter.drivers.ffmpeg import FFmpegAudioConverterAction
+from mindor.core.foundation.media.encoding import AudioEncoderParams
+from mindor.core.foundation.streaming.bytes import BytesStreamResource
+from mindor.core.foundation.streaming.media import MediaSource
+from mindor.core.foundation.streaming.resources import read_stream_to_bytes
+from mindor.core.utils.audio import parse_wav
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _wav(samples, sample_rate=8000, channels=1) -> MediaSource:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(2)
+        writer.setframerate(sample_rate)
+        writer.writeframes(np.asarray(samples, dtype="<i2").tobytes())
+    return MediaSource(BytesStreamResource(buffer.getvalue()), "wav")
+
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch):
+    state = { "calls": 0, "running": 0, "peak": 0 }
+
+    async def _run_subprocess(command, source=None, stderr_handler=None, **kwargs):
+        state["calls"] += 1
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        try:
+            if source is not None:
+                async for _ in source:
+                    pass
+            await asyncio.sleep(0.01)
+            with open(command[-1], "wb") as file:
+                file.write(b"encoded")
+            return SimpleNamespace(returncode=0), None, b""
+        finally:
+            state["running"] -= 1
+
+    monkeypatch.setattr(ffmpeg, "run_subprocess", _run_subprocess)
+    return state
+
+
+class TestInProcess:
+    @pytest.mark.anyio
+    async def test_downmixes_wav(self, fake_ffmpeg):
+        source = _wav([ 1000, -1000 ] * 80, channels=2)
+
+        result = await FFmpegAudioConverterAction(None)._convert(source, "wav", AudioEncoderParams(sample_rate=8000, channels=1))
+        wav = parse_wav(await read_stream_to_bytes(result))
+
+        assert (wav.sample_rate, wav.channels, wav.frame_count) == (8000, 1, 80)
+        assert np.abs(np.frombuffer(wav.data, dtype="<i2")).max() == 0
+        assert fake_ffmpeg["calls"] == 0
+
+    @pytest.mark.anyio
+    async def test_rate_change_uses_ffmpeg(self, monkeypatch):
+        commands = []
+
+        async def _convert_to_stream(self, command, *args, **kwargs):
+            commands.append(command)
+            return None
+
+        monkeypatch.setattr(FFmpegAudioConverterAction, "_convert_to_stream", _convert_to_stream)
+
+        await FFmpegAudioConverterAction(None)._convert(_wav([ 1, 2, 3 ]), "wav", AudioEncoderParams(sample_rate=16000))
+
+        assert len(commands) == 1
+        assert commands[0][commands[0].index("-ar") + 1] == "16000"
+
+    @pytest.mark.anyio
+    async def test_converts_raw_pcm_to_float_wav(self, fake_ffmpeg):
+        source = MediaSource(BytesStreamResource(np.array([ 16384, -16384 ], dtype="<i2").tobytes()), "s16le", { "sample_rate": 8000, "channels": 1 })
+
+        result = await FFmpegAudioConverterAction(None)._convert(source, "wav", AudioEncoderParams(codec="pcm_f32le"))
+        wav = parse_wav(await read_stream_to_bytes(result))
+
+        assert wav.format == "f32le"
+        assert np.frombuffer(wav.data, dtype="<f4").tolist() == [ 0.5, -0.5 ]
+
+    @pytest.mark.anyio
+    async def test_wav_to_raw_pcm(self, fake_ffmpeg):
+        result = await FFmpegAudioConverterAction(None)._convert(_wav([ 1, 2, 3 ]), "s16le", AudioEncoderParams())
+
+        assert result.format == "s16le"
+        assert np.frombuffer(await read_stream_to_bytes(result), dtype="<i2").tolist() == [ 1, 2, 3 ]
+
+    @pytest.mark.anyio
+    async def test_compressed_output_uses_ffmpeg(self, fake_ffmpeg):
+        result = await FFmpegAudioConverterAction(None)._convert(_wav([ 1, 2, 3 ]), "m4a", AudioEncoderParams())
+
+        assert fake_ffmpeg["calls"] == 1
+        assert await read_stream_to_bytes(result) == b"encoded"
+
+    @pytest.mark.anyio
+    async def test_bitrate_uses_ffmpeg(self, fake_ffmpeg):
+        await FFmpegAudioConverterAction(None)._convert(_wav([ 1 ]), "m4a", AudioEncoderParams(bitrate=64000))
+        await FFmpegAudioConverterAction(None, in_process=False)._convert(_wav([ 1 ]), "m4a", AudioEncoderParams())
+
+        assert fake_ffmpeg["calls"] == 2
+
+
+class TestProcessLimit:
+    @pytest.mark.anyio
+    async def test_limits_concurrent_ffmpeg_processes(self, fake_ffmpeg):
+        action = FFmpegAudioConverterAction(None, process_limit=asyncio.Semaphore(2))
+
+        await asyncio.gather(*[ action._convert(_wav([ index ]), "m4a", AudioEncoderParams()) for index in range(5) ])
+
+        assert fake_ffmpeg["calls"] == 5
+        assert fake_ffmpeg["peak"] == 2
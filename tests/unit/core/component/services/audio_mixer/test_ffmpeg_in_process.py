@@ -0,0 +1,173 @@
+"""Tests for the FFmpeg audio mixer's in-process WAV path and its ffmpeg fallback inputs.
+
+WAV inputs are built in memory, so none of these tests need ffmpeg on PATH.
+"""
+
+import asyncio
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from mindor.core.component.services.audio_mixer.drivers.ffmpeg import FFmpegAudioMixerAction
+from mindor.core.foundation.media.encoding import AudioEncoderParams
+from mindor.core.foundation.streaming.bytes import BytesStreamResource
+from mindor.core.foundation.streaming.media import MediaSource
+from mindor.core.foundation.streaming.resources import read_stream_to_bytes
+from mindor.core.utils.audio import parse_wav
+from mindor.dsl.schema.action import AudioMixerOverlayDurationMode, AudioOverlayPlacement
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _wav(samples, sample_rate=8000, channels=1) -> MediaSource:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(2)
+        writer.setframerate(sample_rate)
+        writer.writeframes(np.asarray(samples, dtype="<i2").tobytes())
+    return MediaSource(BytesStreamResource(buffer.getvalue()), "wav")
+
+
+async def _read(resource) -> np.ndarray:
+    wav = parse_wav(await read_stream_to_bytes(resource))
+    return np.frombuffer(wav.data, dtype="<i2").reshape(-1, wav.channels)
+
+
+def _action(in_process=True) -> FFmpegAudioMixerAction:
+    return FFmpegAudioMixerAction(None, in_process=in_process)
+
+
+def _concat_params(**encoding):
+    return { "format": None, "encoding": AudioEncoderParams(**encoding), "crossfade": None }
+
+
+def _overlay_params(duration_mode=AudioMixerOverlayDurationMode.BASE, **encoding):
+    return { "format": "wav", "encoding": AudioEncoderParams(**encoding), "duration_mode": duration_mode }
+
+
+class TestConcat:
+    @pytest.mark.anyio
+    async def test_joins_samples_without_ffmpeg(self):
+        result = await _action()._concat([ _wav([ 1, 2, 3 ]), _wav([ 4, 5 ]) ], _concat_params(), streaming=False)
+
+        assert result.format == "wav"
+        assert (await _read(result))[:, 0].tolist() == [ 1, 2, 3, 4, 5 ]
+
+    @pytest.mark.anyio
+    async def test_applies_sample_rate_and_channels(self):
+        result = await _action()._concat([ _wav([ 1000 ] * 80), _wav([ 1000 ] * 80) ], _concat_params(sample_rate=16000, channels=2), streaming=False)
+        wav = parse_wav(await read_stream_to_bytes(result))
+
+        assert (wav.sample_rate, wav.channels, wav.frame_count) == (16000, 2, 320)
+
+    @pytest.mark.anyio
+    async def test_mismatched_inputs_fall_back_to_ffmpeg(self, monkeypatch):
+        commands = []
+
+        async def _encode_to_file(command, fd_channels, format, cleanup, cancellation_token=None):
+            commands.append(command)
+            for channel in fd_channels:
+                await channel.close()
+            cleanup()
+            return "encoded"
+
+        action = _action()
+        monkeypatch.setattr(action, "_encode_to_file", _encode_to_file)
+
+        result = await action._concat([ _wav([ 1, 2 ], sample_rate=8000), _wav([ 3 ], sample_rate=16000) ], _concat_params(), streaming=False)
+
+        assert result == "encoded"
+        assert sum(argument.startswith("pipe:") for argument in commands[0]) == 2
+
+    @pytest.mark.anyio
+    async def test_compressed_output_uses_ffmpeg(self, monkeypatch):
+        calls = []
+
+        async def _encode_to_file(command, fd_channels, format, cleanup, cancellation_token=None):
+            calls.append(format)
+            for channel in fd_channels:
+                await channel.close()
+            return "encoded"
+
+        action = _action()
+        monkeypatch.setattr(action, "_encode_to_file", _encode_to_file)
+
+        await action._concat([ _wav([ 1 ]), _wav([ 2 ]) ], { **_concat_params(), "format": "mp3" }, streaming=False)
+
+        assert calls == [ "mp3" ]
+
+
+class TestOverlay:
+    @pytest.mark.anyio
+    async def test_mixes_delayed_gained_overlay(self):
+        base = _wav([ 100 ] * 8)
+        overlay = _wav([ 1000 ] * 4)
+        placement = AudioOverlayPlacement(start_time=2 / 8000, gain=0.5)
+
+        result = await _action()._overlay(base, [ overlay ], [ placement ], _overlay_params(), streaming=False)
+
+        assert (await _read(result))[:, 0].tolist() == [ 100, 100, 600, 600, 600, 600, 100, 100 ]
+
+    @pytest.mark.anyio
+    async def test_end_time_trims_on_delayed_timeline(self):
+        base = _wav([ 0 ] * 8)
+        overlay = _wav([ 1000 ] * 8)
+        placement = AudioOverlayPlacement(start_time=2 / 8000, end_time=5 / 8000)
+
+        result = await _action()._overlay(base, [ overlay ], [ placement ], _overlay_params(), streaming=False)
+
+        assert (await _read(result))[:, 0].tolist() == [ 0, 0, 1000, 1000, 1000, 0, 0, 0 ]
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize("duration_mode, frame_count", [
+        (AudioMixerOverlayDurationMode.BASE, 4),
+        (AudioMixerOverlayDurationMode.SHORTEST, 4),
+        (AudioMixerOverlayDurationMode.LONGEST, 10),
+    ])
+    async def test_duration_modes(self, duration_mode, frame_count):
+        placement = AudioOverlayPlacement(start_time=4 / 8000)
+
+        result = await _action()._overlay(_wav([ 1 ] * 4), [ _wav([ 2 ] * 6) ], [ placement ], _overlay_params(duration_mode), streaming=False)
+
+        assert len(await _read(result)) == frame_count
+
+    @pytest.mark.anyio
+    async def test_pan_and_fade(self):
+        base = _wav([ 0, 0 ] * 4, channels=2)
+        overlay = _wav([ 1000, 1000 ] * 4, channels=2)
+        placement = AudioOverlayPlacement(pan=0.5, fade_in=2 / 8000)
+
+        samples = await _read(await _action()._overlay(base, [ overlay ], [ placement ], _overlay_params(), streaming=False))
+
+        assert samples[:, 0].tolist() == [ 0, 250, 500, 500 ]
+        assert samples[:, 1].tolist() == [ 0, 750, 1500, 1500 ]
+
+    @pytest.mark.anyio
+    async def test_disabled_in_process_uses_ffmpeg(self, monkeypatch):
+        calls = []
+
+        async def _encode_to_file(command, fd_channels, format, cleanup, cancellation_token=None):
+            calls.append(command)
+            for channel in fd_channels:
+                await channel.close()
+            cleanup()
+            return "encoded"
+
+        async def _probe_audio(path, fields):
+            return [ 1.0 ]
+
+        action = _action(in_process=False)
+        monkeypatch.setattr(action, "_encode_to_file", _encode_to_file)
+        monkeypatch.setattr("mindor.core.component.services.audio_mixer.drivers.ffmpeg.probe_audio", _probe_audio)
+
+        await action._overlay(_wav([ 1 ]), [ _wav([ 2 ]) ], [ AudioOverlayPlacement() ], _overlay_params(), streaming=False)
+
+        # The base is spooled so its duration can be probed; the overlay is piped.
+        assert not calls[0][calls[0].index("-i") + 1].startswith("pipe:")
+        assert calls[0][calls[0].index("-i", calls[0].index("-i") + 1) + 1].startswith("pipe:")
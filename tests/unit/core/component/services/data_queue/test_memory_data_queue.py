@@ -0,0 +1,210 @@
+"""Tests for the memory data queue covering end-of-stream, batching, backpressure, stats and idle expiry."""
+
+import asyncio
+
+import pytest
+
+from unittest.mock import AsyncMock, MagicMock
+from pydantic import TypeAdapter
+
+from mindor.core.component.context import ComponentActionContext
+from mindor.core.component.services.data_queue.backends.memory import (
+    MemoryDataQueueService,
+    MemoryDataQueueFullError,
+    MemoryDataQueueClosedError,
+)
+from mindor.core.foundation.variable.time import parse_time
+from mindor.dsl.schema.action.impl.data_queue.impl.memory import MemoryDataQueueActionConfig
+from mindor.dsl.schema.component import MemoryDataQueueComponentConfig
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _make_context():
+    context = MagicMock(spec=ComponentActionContext)
+
+    async def render_variable(value, scope=None, skip_decode=False):
+        return value
+
+    async def render_scalar(value, cast, default=None):
+        if value is None:
+            return default
+        return parse_time(value) if cast == "time" else cast(value)
+
+    context.render_variable = AsyncMock(side_effect=render_variable)
+    context.render_scalar = AsyncMock(side_effect=render_scalar)
+    return context
+
+
+def _make_service(**fields):
+    config = MemoryDataQueueComponentConfig(type="data-queue", driver="memory", **fields)
+    return MemoryDataQueueService("queue", config, daemon=False)
+
+
+async def _run(service, **fields):
+    action = TypeAdapter(MemoryDataQueueActionConfig).validate_python(fields)
+    return await service.run(action, _make_context())
+
+
+class TestEndOfStream:
+    @pytest.mark.anyio
+    async def test_close_ends_stream_after_draining(self):
+        service = _make_service()
+        await _run(service, method="enqueue", item=[ 1, 2, 3 ], spread=True, close=True)
+
+        stream = await _run(service, method="dequeue")
+
+        assert [ item async for item in stream ] == [ 1, 2, 3 ]
+
+    @pytest.mark.anyio
+    async def test_close_action_wakes_waiting_consumers(self):
+        service = _make_service()
+        stream = await _run(service, method="dequeue", session="jobs")
+        consumer = asyncio.create_task(asyncio.wait_for(_collect(stream), 1.0))
+
+        await _run(service, method="enqueue", session="jobs", item="a")
+        await asyncio.sleep(0.01)
+        await _run(service, method="close", session="jobs")
+
+        assert await consumer == [ "a" ]
+
+    @pytest.mark.anyio
+    async def test_enqueue_into_closed_session_fails(self):
+        service = _make_service()
+        await _run(service, method="enqueue", item=1, close=True)
+        stream = (await _run(service, method="dequeue")).__aiter__()
+        consumer = asyncio.create_task(stream.__anext__())
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(MemoryDataQueueClosedError):
+            await _run(service, method="enqueue", item=2)
+
+        assert await consumer == 1
+        await stream.aclose()
+
+
+class TestBatching:
+    @pytest.mark.anyio
+    async def test_batch_holds_already_queued_items(self):
+        service = _make_service()
+        await _run(service, method="enqueue", item=list(range(5)), spread=True, close=True)
+
+        stream = await _run(service, method="dequeue", batch_size=2)
+
+        assert [ batch async for batch in stream ] == [ [ 0, 1 ], [ 2, 3 ], [ 4 ] ]
+
+    @pytest.mark.anyio
+    async def test_batch_timeout_waits_for_more_items(self):
+        service = _make_service()
+        stream = (await _run(service, method="dequeue", batch_size=3, batch_timeout="200ms")).__aiter__()
+        consumer = asyncio.create_task(stream.__anext__())
+
+        for item in range(3):
+            await _run(service, method="enqueue", item=item)
+            await asyncio.sleep(0.01)
+
+        assert await consumer == [ 0, 1, 2 ]
+        await stream.aclose()
+
+    @pytest.mark.anyio
+    async def test_batch_timeout_yields_partial_batch(self):
+        service = _make_service()
+        await _run(service, method="enqueue", item="only")
+        stream = (await _run(service, method="dequeue", batch_size=10, batch_timeout="20ms")).__aiter__()
+
+        assert await asyncio.wait_for(stream.__anext__(), 1.0) == [ "only" ]
+        await stream.aclose()
+
+
+class TestBackpressure:
+    @pytest.mark.anyio
+    async def test_full_queue_blocks_until_consumed(self):
+        service = _make_service(max_size=2)
+        producer = asyncio.create_task(_run(service, method="enqueue", item=list(range(5)), spread=True, close=True))
+        await asyncio.sleep(0.01)
+
+        assert not producer.done()
+        assert (await _run(service, method="stats", session="__default__"))["depth"] == 2
+
+        stream = await _run(service, method="dequeue")
+
+        assert [ item async for item in stream ] == list(range(5))
+        await producer
+
+    @pytest.mark.anyio
+    async def test_timeout_raises_when_queue_stays_full(self):
+        service = _make_service(max_size=1)
+        await _run(service, method="enqueue", item=1)
+
+        with pytest.raises(MemoryDataQueueFullError):
+            await _run(service, method="enqueue", item=2, timeout="20ms")
+
+
+class TestStats:
+    @pytest.mark.anyio
+    async def test_reports_depth_lag_and_counts(self):
+        service = _make_service()
+        await _run(service, method="enqueue", session="a", item=[ 1, 2, 3 ], spread=True)
+        await asyncio.sleep(0.02)
+
+        stream = (await _run(service, method="dequeue", session="a")).__aiter__()
+        await stream.__anext__()
+
+        stats = await _run(service, method="stats", session="a")
+
+        assert stats["depth"] == 2
+        assert stats["enqueued"] == 3
+        assert stats["dequeued"] == 1
+        assert stats["consumers"] == 1
+        assert stats["lag"] >= 0.02
+        assert await _run(service, method="stats", session="missing") is None
+        assert list((await _run(service, method="stats")).keys()) == [ "a" ]
+
+        await stream.aclose()
+        assert (await _run(service, method="stats", session="a"))["consumers"] == 0
+
+
+class TestIdleExpiry:
+    @pytest.mark.anyio
+    async def test_idle_sessions_are_removed(self):
+        service = _make_service(session_idle_timeout="40ms")
+        await _run(service, method="enqueue", session="stale", item=1)
+        stale = (await _run(service, method="dequeue", session="stale")).__aiter__()
+        assert await stale.__anext__() == 1
+        await stale.aclose()
+        stream = (await _run(service, method="dequeue", session="busy")).__aiter__()
+        consumer = asyncio.create_task(stream.__anext__())
+        await asyncio.sleep(0.06)
+
+        assert list((await _run(service, method="stats")).keys()) == [ "busy" ]
+
+        consumer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
+
+    @pytest.mark.anyio
+    async def test_idle_sessions_holding_items_are_kept(self):
+        service = _make_service(session_idle_timeout="40ms")
+        await _run(service, method="enqueue", session="pending", item=1)
+        await _run(service, method="enqueue", session="closed", item=2, close=True)
+        await asyncio.sleep(0.06)
+
+        stats = await _run(service, method="stats")
+        assert sorted(stats.keys()) == [ "closed", "pending" ]
+        assert stats["pending"]["depth"] == 1
+        assert stats["closed"]["depth"] == 1
+
+    @pytest.mark.anyio
+    async def test_zero_timeout_disables_expiry(self):
+        service = _make_service(session_idle_timeout="0s")
+        await _run(service, method="enqueue", session="kept", item=1)
+        await asyncio.sleep(0.02)
+
+        assert (await _run(service, method="stats", session="kept"))["depth"] == 1
+
+
+async def _collect(stream):
+    return [ item async for item in stream ]
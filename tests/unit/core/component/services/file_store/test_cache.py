@@ -0,0 +1,125 @@
+"""Tests for the file-store read-through disk cache."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+
+import pytest
+
+from mindor.core.component.services.file_store.cache import FileStoreCache, get_file_store_cache
+from mindor.dsl.schema.component import FileStoreCacheConfig
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _writer(data: bytes, calls: list):
+    async def _download(path: str) -> None:
+        calls.append(path)
+        await asyncio.sleep(0.01)
+        with open(path, "wb") as f:
+            f.write(data)
+    return _download
+
+
+class TestLookup:
+    @pytest.mark.anyio
+    async def test_miss_then_hit(self, tmp_path):
+        cache = FileStoreCache(str(tmp_path), max_size=1024)
+        calls = []
+
+        assert cache.lookup("s3://b", "k", '"e1"') is None
+
+        path = await cache.fetch("s3://b", "k", '"e1"', _writer(b"abc", calls))
+        assert open(path, "rb").read() == b"abc"
+        assert cache.lookup("s3://b", "k", '"e1"') == path
+
+        assert await cache.fetch("s3://b", "k", '"e1"', _writer(b"abc", calls)) == path
+        assert len(calls) == 1
+
+    @pytest.mark.anyio
+    async def test_changed_etag_misses(self, tmp_path):
+        cache = FileStoreCache(str(tmp_path), max_size=1024)
+        calls = []
+
+        first = await cache.fetch("s3://b", "k", '"e1"', _writer(b"old", calls))
+        second = await cache.fetch("s3://b", "k", '"e2"', _writer(b"new", calls))
+
+        assert first != second
+        assert open(second, "rb").read() == b"new"
+        assert len(calls) == 2
+
+    @pytest.mark.anyio
+    async def test_concurrent_fetches_share_one_download(self, tmp_path):
+        cache = FileStoreCache(str(tmp_path), max_size=1024)
+        calls = []
+
+        paths = await asyncio.gather(*[
+            cache.fetch("s3://b", "k", '"e1"', _writer(b"abc", calls)) for _ in range(5)
+        ])
+
+        assert len(set(paths)) == 1
+        assert len(calls) == 1
+
+    @pytest.mark.anyio
+    async def test_failed_download_leaves_no_entry(self, tmp_path):
+        cache = FileStoreCache(str(tmp_path), max_size=1024)
+
+        async def _fail(path: str) -> None:
+            with open(path, "wb") as f:
+                f.write(b"partial")
+            raise IOError("connection reset")
+
+        with pytest.raises(IOError):
+            await cache.fetch("s3://b", "k", '"e1"', _fail)
+
+        assert cache.lookup("s3://b", "k", '"e1"') is None
+        assert [ files for _, _, files in os.walk(tmp_path) if files ] == []
+
+
+class TestEviction:
+    @pytest.mark.anyio
+    async def test_least_recently_used_entry_is_evicted(self, tmp_path):
+        cache = FileStoreCache(str(tmp_path), max_size=10)
+        calls = []
+
+        a = await cache.fetch("ns", "a", "1", _writer(b"aaaa", calls))
+        b = await cache.fetch("ns", "b", "1", _writer(b"bbbb", calls))
+        assert cache.lookup("ns", "a", "1") == a  # a becomes most recently used
+
+        c = await cache.fetch("ns", "c", "1", _writer(b"cccc", calls))
+
+        assert os.path.exists(a)
+        assert not os.path.exists(b)
+        assert os.path.exists(c)
+
+    @pytest.mark.anyio
+    async def test_existing_entries_are_counted_on_restart(self, tmp_path):
+        calls = []
+        first = FileStoreCache(str(tmp_path), max_size=10)
+        a = await first.fetch("ns", "a", "1", _writer(b"aaaaaa", calls))
+
+        second = FileStoreCache(str(tmp_path), max_size=10)
+        b = await second.fetch("ns", "b", "1", _writer(b"bbbbbb", calls))
+
+        assert not os.path.exists(a)
+        assert os.path.exists(b)
+
+    def test_oversized_objects_are_not_accepted(self, tmp_path):
+        cache = FileStoreCache(str(tmp_path), max_size=10)
+
+        assert cache.accepts(10) is True
+        assert cache.accepts(11) is False
+        assert cache.accepts(None) is False
+
+
+class TestSharedCache:
+    def test_same_directory_shares_one_cache(self, tmp_path):
+        first = get_file_store_cache(FileStoreCacheConfig(path=str(tmp_path), max_size="2KB"))
+        second = get_file_store_cache(FileStoreCacheConfig(path=str(tmp_path), max_size="1KB"))
+
+        assert first is second
+        assert second.max_size == 1024
@@ -0,0 +1,175 @@
+"""Tests for parallel ranged GETs in the remote file-store drivers, using a fake S3 client."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+import pytest
+from pydantic import TypeAdapter
+
+from mindor.core.component.context import ComponentActionContext
+from mindor.core.component.services.file_store.cache import FileStoreCache
+from mindor.core.component.services.file_store.drivers.aws_s3 import AwsS3FileStoreAction, S3Location
+from mindor.core.foundation.streaming.file import FileStreamResource
+from mindor.dsl.schema.action import AwsS3FileStoreActionConfig
+
+
+ActionAdapter = TypeAdapter(AwsS3FileStoreActionConfig)
+
+BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeBody:
+    def __init__(self, data: bytes):
+        self.data = data
+
+    async def read(self, size: int = -1) -> bytes:
+        data, self.data = (self.data, b"") if size is None or size < 0 else (self.data[:size], self.data[size:])
+        return data
+
+
+class FakeS3Client:
+    """Serves objects from memory and records ranged requests and their concurrency."""
+    def __init__(self, objects: Dict[str, bytes], etag: str = '"etag-1"'):
+        self.objects = objects
+        self.etag = etag
+        self.ranges: List[Optional[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        return { "ContentLength": len(self.objects[Key]), "ETag": self.etag, "ContentType": "application/octet-stream" }
+
+    async def get_object(self, Bucket: str, Key: str, Range: Optional[str] = None, IfMatch: Optional[str] = None) -> Dict[str, Any]:
+        if IfMatch is not None and IfMatch != self.etag:
+            raise RuntimeError("PreconditionFailed")
+
+        self.ranges.append(Range)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+
+        data = self.objects[Key]
+        if Range:
+            start, end = map(int, re.match(r"bytes=(\d+)-(\d+)", Range).groups())
+            data = data[start:end + 1]
+
+        return { "Body": FakeBody(data), "ContentLength": len(data), "ETag": self.etag }
+
+
+def _make_action(client: FakeS3Client, config: Dict[str, Any], cache: Optional[FileStoreCache] = None) -> AwsS3FileStoreAction:
+    return AwsS3FileStoreAction(ActionAdapter.validate_python(config), client, S3Location(bucket=BUCKET), cache=cache)
+
+
+def _ctx() -> ComponentActionContext:
+    return ComponentActionContext("run-test", {})
+
+
+PAYLOAD = bytes(range(256)) * 40  # 10240 bytes
+
+
+class TestRangedGet:
+    @pytest.mark.anyio
+    async def test_full_read_is_split_into_ranges(self):
+        client = FakeS3Client({ "f.bin": PAYLOAD })
+
+        action = _make_action(client, { "method": "get", "path": "f.bin", "part_size": 1024, "max_concurrency": 3 })
+        result = await action.run(_ctx())
+
+        assert result["content"] == PAYLOAD
+        assert result["size"] == len(PAYLOAD)
+        assert len(client.ranges) == 10
+        assert client.max_in_flight == 3
+
+    @pytest.mark.anyio
+    async def test_save_to_writes_parts_at_offsets(self, tmp_path):
+        client = FakeS3Client({ "f.bin": PAYLOAD })
+        dest = str(tmp_path / "out.bin")
+
+        action = _make_action(client, { "method": "get", "path": "f.bin", "save_to": dest, "part_size": "3KB" })
+        result = await action.run(_ctx())
+
+        assert result["save_to"] == dest
+        assert open(dest, "rb").read() == PAYLOAD
+        assert client.ranges == [ "bytes=0-3071", "bytes=3072-6143", "bytes=6144-9215", "bytes=9216-10239" ]
+
+    @pytest.mark.anyio
+    async def test_small_object_uses_single_range(self):
+        client = FakeS3Client({ "f.bin": b"hello" })
+
+        result = await _make_action(client, { "method": "get", "path": "f.bin" }).run(_ctx())
+
+        assert result["content"] == b"hello"
+        assert client.ranges == [ "bytes=0-4" ]
+
+    @pytest.mark.anyio
+    async def test_empty_object_is_not_range_requested(self):
+        client = FakeS3Client({ "f.bin": b"" })
+
+        result = await _make_action(client, { "method": "get", "path": "f.bin" }).run(_ctx())
+
+        assert result["content"] == b""
+        assert client.ranges == []
+
+
+class TestCachedGet:
+    @pytest.mark.anyio
+    async def test_second_read_is_served_from_cache(self, tmp_path):
+        client = FakeS3Client({ "f.bin": PAYLOAD })
+        cache = FileStoreCache(str(tmp_path / "cache"), max_size=1024 * 1024)
+        config = { "method": "get", "path": "f.bin", "part_size": 4096 }
+
+        first = await _make_action(client, config, cache).run(_ctx())
+        requests = len(client.ranges)
+        second = await _make_action(client, config, cache).run(_ctx())
+
+        assert first["content"] == second["content"] == PAYLOAD
+        assert requests == 3
+        assert len(client.ranges) == requests
+
+    @pytest.mark.anyio
+    async def test_changed_etag_downloads_again(self, tmp_path):
+        client = FakeS3Client({ "f.bin": b"version-1" })
+        cache = FileStoreCache(str(tmp_path / "cache"), max_size=1024 * 1024)
+        config = { "method": "get", "path": "f.bin" }
+
+        assert (await _make_action(client, config, cache).run(_ctx()))["content"] == b"version-1"
+
+        client.objects["f.bin"], client.etag = b"version-2", '"etag-2"'
+        assert (await _make_action(client, config, cache).run(_ctx()))["content"] == b"version-2"
+
+    @pytest.mark.anyio
+    async def test_streaming_hit_returns_file_stream(self, tmp_path):
+        client = FakeS3Client({ "f.bin": PAYLOAD })
+        cache = FileStoreCache(str(tmp_path / "cache"), max_size=1024 * 1024)
+
+        await _make_action(client, { "method": "get", "path": "f.bin", "save_to": str(tmp_path / "out.bin") }, cache).run(_ctx())
+        result = await _make_action(client, { "method": "get", "path": "f.bin", "streaming": True }, cache).run(_ctx())
+
+        content = result["content"]
+        assert isinstance(content, FileStreamResource)
+        assert content.filename == "f.bin"
+        assert b"".join([ chunk async for chunk in content ]) == PAYLOAD
+        assert len(client.ranges) == 1
+
+    @pytest.mark.anyio
+    async def test_object_larger_than_cache_bypasses_it(self, tmp_path):
+        client = FakeS3Client({ "f.bin": PAYLOAD })
+        cache_dir = tmp_path / "cache"
+        cache = FileStoreCache(str(cache_dir), max_size=1024)
+
+        result = await _make_action(client, { "method": "get", "path": "f.bin" }, cache).run(_ctx())
+
+        assert result["content"] == PAYLOAD
+        assert not os.path.exists(cache_dir)
@@ -141,9 +141,7 @@ class TestArangoDBInsertAction:
     @pytest.mark.anyio
     async def test_insert_single_node(self, mock_context, mock_db):
         """Test that inserting a single node returns correct creation summary."""
-        mock_collection = MagicMock()
-        mock_collection.insert = MagicMock(return_value={"_id": "persons/1", "_key": "1"})
-        mock_db.collection = MagicMock(return_value=mock_collection)
+        mock_db.aql.execute = MagicMock(return_value=iter(["persons/1"]))
 
         config = ActionAdapter.validate_python({
             "method": "insert",
@@ -156,17 +154,15 @@ class TestArangoDBInsertAction:
         assert result["created_nodes"] == 1
         assert result["created_relationships"] == 0
         assert result["ids"] == ["persons/1"]
-        mock_collection.insert.assert_called_once()
+        mock_db.aql.execute.assert_called_once()
+        aql, bind_vars = mock_db.aql.execute.call_args[0][0], mock_db.aql.execute.call_args[1]["bind_vars"]
+        assert "FOR doc IN @docs INSERT doc INTO @@collection" in aql
+        assert bind_vars == {"docs": [{"name": "Alice", "age": 30}], "@collection": "persons"}
 
     @pytest.mark.anyio
     async def test_insert_multiple_nodes(self, mock_context, mock_db):
-        """Test that inserting multiple nodes returns all created IDs."""
-        mock_collection = MagicMock()
-        mock_collection.insert = MagicMock(side_effect=[
-            {"_id": "persons/1", "_key": "1"},
-            {"_id": "persons/2", "_key": "2"},
-        ])
-        mock_db.collection = MagicMock(return_value=mock_collection)
+        """Test that nodes sharing a collection are inserted by one AQL query."""
+        mock_db.aql.execute = MagicMock(return_value=iter(["persons/1", "persons/2"]))
 
         config = ActionAdapter.validate_python({
             "method": "insert",
@@ -183,14 +179,53 @@ class TestArangoDBInsertAction:
             "created_nodes": 2,
             "created_relationships": 0,
         }]
-        assert mock_collection.insert.call_count == 2
+        assert mock_db.aql.execute.call_count == 1
+
+    @pytest.mark.anyio
+    async def test_insert_groups_by_collection_and_keeps_input_order(self, mock_context, mock_db):
+        """Test that one query per collection is issued and IDs follow the input order."""
+        mock_db.aql.execute = MagicMock(side_effect=[
+            iter(["persons/1", "persons/3"]),
+            iter(["cities/2"]),
+        ])
+
+        config = ActionAdapter.validate_python({
+            "method": "insert",
+            "node": [
+                {"label": "persons", "properties": {"name": "Alice"}},
+                {"label": "cities", "properties": {"name": "Seoul"}},
+                {"label": "persons", "properties": {"name": "Bob"}},
+            ],
+        })
+        action = ArangoDBGraphStoreAction(config, mock_db)
+        result = await action.run(mock_context)
+
+        assert result[0]["ids"] == ["persons/1", "cities/2", "persons/3"]
+        collections = [ call[1]["bind_vars"]["@collection"] for call in mock_db.aql.execute.call_args_list ]
+        assert collections == ["persons", "cities"]
+
+    @pytest.mark.anyio
+    async def test_insert_splits_docs_by_write_batch_size(self, mock_context, mock_db):
+        """Test that documents beyond write_batch_size are sent in further queries."""
+        mock_db.aql.execute = MagicMock(side_effect=[
+            iter(["persons/1", "persons/2"]),
+            iter(["persons/3"]),
+        ])
+
+        config = ActionAdapter.validate_python({
+            "method": "insert",
+            "node": [ {"label": "persons", "properties": {"n": index}} for index in range(3) ],
+        })
+        action = ArangoDBGraphStoreAction(config, mock_db, write_batch_size=2)
+        result = await action.run(mock_context)
+
+        assert result[0]["ids"] == ["persons/1", "persons/2", "persons/3"]
+        assert mock_db.aql.execute.call_count == 2
 
     @pytest.mark.anyio
     async def test_insert_relationship(self, mock_context, mock_db):
         """Test that inserting a relationship returns correct creation summary."""
-        mock_collection = MagicMock()
-        mock_collection.insert = MagicMock(return_value={"_id": "friendships/1", "_key": "1"})
-        mock_db.collection = MagicMock(return_value=mock_collection)
+        mock_db.aql.execute = MagicMock(return_value=iter(["friendships/1"]))
 
         config = ActionAdapter.validate_python({
             "method": "insert",
@@ -208,17 +243,14 @@ class TestArangoDBInsertAction:
         assert result["created_relationships"] == 1
         assert result["created_nodes"] == 0
         assert result["ids"] == ["friendships/1"]
-        insert_call = mock_collection.insert.call_args[0][0]
-        assert insert_call["_from"] == "persons/1"
-        assert insert_call["_to"] == "persons/2"
-        assert insert_call["since"] == 2020
+        bind_vars = mock_db.aql.execute.call_args[1]["bind_vars"]
+        assert bind_vars["@collection"] == "friendships"
+        assert bind_vars["docs"] == [{"_from": "persons/1", "_to": "persons/2", "since": 2020}]
 
     @pytest.mark.anyio
     async def test_insert_node_with_id(self, mock_context, mock_db):
         """Test that inserting a node with an explicit ID uses it as _key."""
-        mock_collection = MagicMock()
-        mock_collection.insert = MagicMock(return_value={"_id": "persons/alice", "_key": "alice"})
-        mock_db.collection = MagicMock(return_value=mock_collection)
+        mock_db.aql.execute = MagicMock(return_value=iter(["persons/alice"]))
 
         config = ActionAdapter.validate_python({
             "method": "insert",
@@ -227,16 +259,14 @@ class TestArangoDBInsertAction:
         action = ArangoDBGraphStoreAction(config, mock_db)
         await action.run(mock_context)
 
-        insert_call = mock_collection.insert.call_args[0][0]
-        assert insert_call["_key"] == "alice"
+        docs = mock_db.aql.execute.call_args[1]["bind_vars"]["docs"]
+        assert docs[0]["_key"] == "alice"
 
     @pytest.mark.anyio
     async def test_insert_creates_collection_if_missing(self, mock_context, mock_db):
         """Test that inserting into a missing collection creates it first."""
         mock_db.has_collection = MagicMock(return_value=False)
-        mock_collection = MagicMock()
-        mock_collection.insert = MagicMock(return_value={"_id": "new_collection/1", "_key": "1"})
-        mock_db.collection = MagicMock(return_value=mock_collection)
+        mock_db.aql.execute = MagicMock(return_value=iter(["new_collection/1"]))
         mock_db.create_collection = MagicMock()
 
         config = ActionAdapter.validate_python({
@@ -246,7 +276,7 @@ class TestArangoDBInsertAction:
         action = ArangoDBGraphStoreAction(config, mock_db)
         await action.run(mock_context)
 
-        mock_db.create_collection.assert_called_once_with("new_collection")
+        mock_db.create_collection.assert_called_once_with("new_collection", edge=False)
 
 
 class TestArangoDBUpdateAction:
@@ -255,8 +285,7 @@ class TestArangoDBUpdateAction:
     @pytest.mark.anyio
     async def test_update_node_with_full_id(self, mock_context, mock_db):
         """Test that updating a node with a full ID extracts collection and key."""
-        mock_collection = MagicMock()
-        mock_db.collection = MagicMock(return_value=mock_collection)
+        mock_db.aql.execute = MagicMock(return_value=iter([1]))
 
         config = ActionAdapter.validate_python({
             "method": "update",
@@ -267,16 +296,14 @@ class TestArangoDBUpdateAction:
         result = await action.run(mock_context)
 
         assert result["affected_rows"] == 1
-        mock_db.collection.assert_called_with("persons")
-        update_call = mock_collection.update.call_args[0][0]
-        assert update_call["_key"] == "12345"
-        assert update_call["age"] == 31
+        bind_vars = mock_db.aql.execute.call_args[1]["bind_vars"]
+        assert bind_vars["@collection"] == "persons"
+        assert bind_vars["docs"] == [{"_key": "12345", "age": 31}]
 
     @pytest.mark.anyio
     async def test_update_node_with_collection_field(self, mock_context, mock_db):
         """Test that updating a node uses the explicit collection field."""
-        mock_collection = MagicMock()
-        mock_db.collection = MagicMock(return_value=mock_collection)
+        mock_db.aql.execute = MagicMock(return_value=iter([1]))
 
         config = ActionAdapter.validate_python({
             "method": "update",
@@ -288,13 +315,12 @@ class TestArangoDBUpdateAction:
         result = await action.run(mock_context)
 
         assert result["affected_rows"] == 1
-        mock_db.collection.assert_called_with("persons")
+        assert mock_db.aql.execute.call_args[1]["bind_vars"]["@collection"] == "persons"
 
     @pytest.mark.anyio
     async def test_update_multiple_nodes(self, mock_context, mock_db):
-        """Test that updating multiple nodes applies changes to each one."""
-        mock_collection = MagicMock()
-        mock_db.collection = MagicMock(return_value=mock_collection)
+        """Test that updating multiple nodes issues one AQL query."""
+        mock_db.aql.execute = MagicMock(return_value=iter([1, 1]))
 
         config = ActionAdapter.validate_python({
             "method": "update",
@@ -306,7 +332,8 @@ class TestArangoDBUpdateAction:
         result = await action.run(mock_context)
 
         assert result == [{"affected_rows": 2}]
-        assert mock_collection.update.call_count == 2
+        assert mock_db.aql.execute.call_count == 1
+        assert "UPDATE doc IN @@collection" in mock_db.aql.execute.call_args[0][0]
 
 
 class TestArangoDBDeleteAction:
@@ -315,8 +342,7 @@ class TestArangoDBDeleteAction:
     @pytest.mark.anyio
     async def test_delete_node_with_full_id(self, mock_context, mock_db):
         """Test that deleting a node with a full ID extracts collection and key."""
-        mock_collection = MagicMock()
-        mock_db.collection = MagicMock(return_value=mock_collection)
+        mock_db.aql.execute = MagicMock(return_value=iter([1]))
 
         config = ActionAdapter.validate_python({
             "method": "delete",
@@ -326,14 +352,12 @@ class TestArangoDBDeleteAction:
         result = await action.run(mock_context)
 
         assert result["affected_rows"] == 1
-        mock_db.collection.assert_called_with("persons")
-        mock_collection.delete.assert_called_once_with("12345")
+        assert mock_db.aql.execute.call_args[1]["bind_vars"] == {"keys": ["12345"], "@collection": "persons"}
 
     @pytest.mark.anyio
     async def test_delete_multiple_nodes(self, mock_context, mock_db):
-        """Test that deleting multiple nodes removes each one."""
-        mock_collection = MagicMock()
-        mock_db.collection = MagicMock(return_value=mock_collection)
+        """Test that deleting multiple nodes issues one AQL query."""
+        mock_db.aql.execute = MagicMock(return_value=iter([1, 1]))
 
         config = ActionAdapter.validate_python({
             "method": "delete",
@@ -344,13 +368,13 @@ class TestArangoDBDeleteAction:
         result = await action.run(mock_context)
 
         assert result == [{"affected_rows": 2}]
-        assert mock_collection.delete.call_count == 2
+        assert mock_db.aql.execute.call_count == 1
+        assert "REMOVE key IN @@collection" in mock_db.aql.execute.call_args[0][0]
 
     @pytest.mark.anyio
     async def test_delete_relationship(self, mock_context, mock_db):
         """Test that deleting a relationship removes it from the edge collection."""
-        mock_collection = MagicMock()
-        mock_db.collection = MagicMock(return_value=mock_collection)
+        mock_db.aql.execute = MagicMock(return_value=iter([1]))
 
         config = ActionAdapter.validate_python({
             "method": "delete",
@@ -360,8 +384,7 @@ class TestArangoDBDeleteAction:
         result = await action.run(mock_context)
 
         assert result["affected_rows"] == 1
-        mock_db.collection.assert_called_with("friendships")
-        mock_collection.delete.assert_called_once_with("abc123")
+        assert mock_db.aql.execute.call_args[1]["bind_vars"] == {"keys": ["abc123"], "@collection": "friendships"}
 
 
 class TestArangoDBTraverseAction:
@@ -369,16 +392,10 @@ class TestArangoDBTraverseAction:
 
     @pytest.mark.anyio
     async def test_traverse_with_graph(self, mock_context, mock_db):
-        """Test that graph-based traversal uses the graph API correctly."""
-        mock_graph = MagicMock()
-        mock_graph.traverse = MagicMock(return_value={
-            "vertices": [
-                {"_id": "persons/1", "name": "Alice"},
-                {"_id": "persons/2", "name": "Bob"},
-            ],
-            "paths": [],
-        })
-        mock_db.graph = MagicMock(return_value=mock_graph)
+        """Test that graph-based traversal runs a GRAPH AQL query."""
+        mock_db.aql.execute = MagicMock(return_value=iter([
+            {"node": {"_id": "persons/2", "name": "Bob"}, "edge": {}, "depth": 1},
+        ]))
 
         config = ActionAdapter.validate_python({
             "method": "traverse",
@@ -390,12 +407,9 @@ class TestArangoDBTraverseAction:
         action = ArangoDBGraphStoreAction(config, mock_db)
         result = await action.run(mock_context)
 
-        mock_db.graph.assert_called_once_with("social_graph")
-        mock_graph.traverse.assert_called_once_with(
-            start_vertex="persons/1",
-            direction="outbound",
-            max_depth=2,
-        )
+        aql, bind_vars = mock_db.aql.execute.call_args[0][0], mock_db.aql.execute.call_args[1]["bind_vars"]
+        assert "OUTBOUND start GRAPH @graph" in aql
+        assert bind_vars == {"start_nodes": ["persons/1"], "max_depth": 2, "graph": "social_graph"}
         assert len(result) == 1
         assert result[0]["node"]["name"] == "Bob"
 
@@ -423,15 +437,28 @@ class TestArangoDBTraverseAction:
         assert "friendships" in aql
         assert len(result) == 1
 
+    @pytest.mark.anyio
+    async def test_traverse_multiple_start_nodes_in_one_query(self, mock_context, mock_db):
+        """Test that several start nodes are traversed by a single AQL query."""
+        mock_db.aql.execute = MagicMock(return_value=iter([]))
+
+        config = ActionAdapter.validate_python({
+            "method": "traverse",
+            "start_node": ["persons/1", "persons/2"],
+            "edge_collection": "friendships",
+        })
+        action = ArangoDBGraphStoreAction(config, mock_db)
+        await action.run(mock_context)
+
+        mock_db.aql.execute.assert_called_once()
+        assert mock_db.aql.execute.call_args[1]["bind_vars"]["start_nodes"] == ["persons/1", "persons/2"]
+
     @pytest.mark.anyio
     async def test_traverse_direction_mapping(self, mock_context, mock_db):
         """Test that direction values are correctly mapped to ArangoDB terms."""
-        mock_graph = MagicMock()
-        mock_graph.traverse = MagicMock(return_value={"vertices": [], "paths": []})
-        mock_db.graph = MagicMock(return_value=mock_graph)
-
-        directions = [("out", "outbound"), ("in", "inbound"), ("both", "any")]
+        directions = [("out", "OUTBOUND"), ("in", "INBOUND"), ("both", "ANY")]
         for input_dir, expected_dir in directions:
+            mock_db.aql.execute = MagicMock(return_value=iter([]))
             config = ActionAdapter.validate_python({
                 "method": "traverse",
                 "start_node": "persons/1",
@@ -441,7 +468,7 @@ class TestArangoDBTraverseAction:
             action = ArangoDBGraphStoreAction(config, mock_db)
             await action.run(mock_context)
 
-            call_kwargs = mock_graph.traverse.call_args[1]
-            assert call_kwargs["direction"] == expected_dir, (
-                f"Expected '{expected_dir}' for direction='{input_dir}', got '{call_kwargs['direction']}'"
+            aql = mock_db.aql.execute.call_args[0][0]
+            assert f"{expected_dir} start GRAPH @graph" in aql, (
+                f"Expected '{expected_dir}' for direction='{input_dir}', got '{aql}'"
             )
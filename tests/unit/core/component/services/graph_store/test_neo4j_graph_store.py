@@ -67,6 +67,16 @@ def mock_context():
 ActionAdapter = TypeAdapter(Neo4jGraphStoreActionConfig)
 
 
+def mock_driver(mock_session):
+    """Create a mock driver whose session() opens the given session as an async context manager."""
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=None)
+
+    driver = MagicMock()
+    driver.session = MagicMock(return_value=mock_session)
+    return driver
+
+
 class TestNeo4jQueryAction:
     """Test Neo4j query action execution."""
 
@@ -78,16 +88,11 @@ class TestNeo4jQueryAction:
         mock_result.data = AsyncMock(return_value=[{"n": {"name": "Alice"}}])
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        mock_driver = AsyncMock()
-        mock_driver.session = MagicMock(return_value=mock_session)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-
         config = ActionAdapter.validate_python({
             "method": "query",
             "query": "MATCH (n:Person) RETURN n",
         })
-        action = Neo4jGraphStoreAction(config, mock_session)
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session))
         result = await action.run(mock_context)
 
         mock_session.run.assert_called_once_with(
@@ -104,17 +109,12 @@ class TestNeo4jQueryAction:
         mock_result.data = AsyncMock(return_value=[])
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        mock_driver = AsyncMock()
-        mock_driver.session = MagicMock(return_value=mock_session)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-
         config = ActionAdapter.validate_python({
             "method": "query",
             "query": "MATCH (n:Person {name: $name}) RETURN n",
             "params": {"name": "Alice"},
         })
-        action = Neo4jGraphStoreAction(config, mock_session)
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session))
         await action.run(mock_context)
 
         mock_session.run.assert_called_once_with(
@@ -130,69 +130,64 @@ class TestNeo4jQueryAction:
         mock_result.data = AsyncMock(return_value=[{"n": {"name": "Alice"}}])
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        mock_driver = AsyncMock()
-        mock_driver.session = MagicMock(return_value=mock_session)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-
         config = ActionAdapter.validate_python({
             "method": "query",
             "query": "MATCH (n) RETURN n",
             "output": "${result[0]}",
         })
-        action = Neo4jGraphStoreAction(config, mock_session)
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session))
         await action.run(mock_context)
 
         mock_context.render_variable.assert_any_call("${result[0]}")
 
 
+def mock_transaction(*records):
+    """Create a mock explicit transaction whose successive run() calls return the given records."""
+    results = []
+    for data in records:
+        mock_result = AsyncMock()
+        mock_result.data = AsyncMock(return_value=data)
+        results.append(mock_result)
+
+    mock_tx = AsyncMock()
+    mock_tx.run = AsyncMock(side_effect=results)
+    mock_tx.__aenter__ = AsyncMock(return_value=mock_tx)
+    mock_tx.__aexit__ = AsyncMock(return_value=None)
+    return mock_tx
+
+
 class TestNeo4jInsertAction:
     """Test Neo4j insert action execution."""
 
-    @staticmethod
-    def mock_run_result(element_id):
-        """Create a mock session.run result that returns a single record with the given element ID."""
-        mock_result = AsyncMock()
-        mock_record = {"id": element_id}
-        mock_result.single = AsyncMock(return_value=mock_record)
-        return mock_result
-
     @pytest.mark.anyio
     async def test_insert_single_node(self, mock_context):
         """Verify inserting a single node returns the correct creation summary."""
+        mock_tx = mock_transaction([{"index": 0, "id": "4:abc:1"}])
         mock_session = AsyncMock()
-        mock_session.run = AsyncMock(return_value=self.mock_run_result("4:abc:1"))
-
-        mock_driver = AsyncMock()
-        mock_driver.session = MagicMock(return_value=mock_session)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
 
         config = ActionAdapter.validate_python({
             "method": "insert",
             "node": {"label": "Person", "properties": {"name": "Alice", "age": 30}},
         })
-        action = Neo4jGraphStoreAction(config, mock_session)
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session))
         result = await action.run(mock_context)
 
         assert result["created_nodes"] == 1
         assert result["created_relationships"] == 0
         assert result["ids"] == ["4:abc:1"]
-        mock_session.run.assert_called_once()
+        mock_tx.run.assert_called_once()
+        mock_tx.commit.assert_awaited_once()
+        assert mock_tx.run.call_args[1]["parameters"]["rows"] == [
+            {"index": 0, "properties": {"name": "Alice", "age": 30}},
+        ]
 
     @pytest.mark.anyio
     async def test_insert_multiple_nodes(self, mock_context):
-        """Verify inserting multiple nodes returns all created IDs."""
+        """Verify nodes sharing a label are created by one UNWIND statement."""
+        mock_tx = mock_transaction([{"index": 0, "id": "4:abc:1"}, {"index": 1, "id": "4:abc:2"}])
         mock_session = AsyncMock()
-        mock_session.run = AsyncMock(side_effect=[
-            self.mock_run_result("4:abc:1"),
-            self.mock_run_result("4:abc:2"),
-        ])
-
-        mock_driver = AsyncMock()
-        mock_driver.session = MagicMock(return_value=mock_session)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
 
         config = ActionAdapter.validate_python({
             "method": "insert",
@@ -201,7 +196,7 @@ class TestNeo4jInsertAction:
                 {"label": "Person", "properties": {"name": "Bob"}},
             ],
         })
-        action = Neo4jGraphStoreAction(config, mock_session)
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session))
         result = await action.run(mock_context)
 
         assert result == [{
@@ -209,18 +204,62 @@ class TestNeo4jInsertAction:
             "created_nodes": 2,
             "created_relationships": 0,
         }]
-        assert mock_session.run.call_count == 2
+        assert mock_tx.run.call_count == 1
+        assert mock_session.run.call_count == 0
+
+    @pytest.mark.anyio
+    async def test_insert_groups_by_label_and_keeps_input_order(self, mock_context):
+        """Verify one statement per label runs in a single transaction and IDs follow the input order."""
+        mock_tx = mock_transaction(
+            [{"index": 0, "id": "4:p:1"}, {"index": 2, "id": "4:p:3"}],
+            [{"index": 1, "id": "4:c:2"}],
+        )
+        mock_session = AsyncMock()
+        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
+
+        config = ActionAdapter.validate_python({
+            "method": "insert",
+            "node": [
+                {"label": "Person", "properties": {"name": "Alice"}},
+                {"label": "City", "properties": {"name": "Seoul"}},
+                {"label": "Person", "properties": {"name": "Bob"}},
+            ],
+        })
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session))
+        result = await action.run(mock_context)
+
+        assert result[0]["ids"] == ["4:p:1", "4:c:2", "4:p:3"]
+        assert mock_session.begin_transaction.call_count == 1
+        cyphers = [ call[0][0] for call in mock_tx.run.call_args_list ]
+        assert "CREATE (n:Person)" in cyphers[0]
+        assert "CREATE (n:City)" in cyphers[1]
+
+    @pytest.mark.anyio
+    async def test_insert_splits_rows_by_write_batch_size(self, mock_context):
+        """Verify rows beyond write_batch_size are sent in further statements and transactions."""
+        mock_session = AsyncMock()
+        mock_session.begin_transaction = AsyncMock(side_effect=[
+            mock_transaction([{"index": 0, "id": "1"}, {"index": 1, "id": "2"}]),
+            mock_transaction([{"index": 2, "id": "3"}, {"index": 3, "id": "4"}]),
+            mock_transaction([{"index": 4, "id": "5"}]),
+        ])
+
+        config = ActionAdapter.validate_python({
+            "method": "insert",
+            "node": [ {"label": "Person", "properties": {"n": index}} for index in range(5) ],
+        })
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session), write_batch_size=2)
+        result = await action.run(mock_context)
+
+        assert result[0]["ids"] == ["1", "2", "3", "4", "5"]
+        assert mock_session.begin_transaction.call_count == 3
 
     @pytest.mark.anyio
     async def test_insert_relationship(self, mock_context):
         """Verify inserting a relationship returns the correct creation summary."""
+        mock_tx = mock_transaction([{"index": 0, "id": "5:abc:1"}])
         mock_session = AsyncMock()
-        mock_session.run = AsyncMock(return_value=self.mock_run_result("5:abc:1"))
-
-        mock_driver = AsyncMock()
-        mock_driver.session = MagicMock(return_value=mock_session)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
 
         config = ActionAdapter.validate_python({
             "method": "insert",
@@ -231,12 +270,81 @@ class TestNeo4jInsertAction:
                 "properties": {"since": 2020},
             },
         })
-        action = Neo4jGraphStoreAction(config, mock_session)
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session))
         result = await action.run(mock_context)
 
         assert result["created_relationships"] == 1
         assert result["created_nodes"] == 0
         assert result["ids"] == ["5:abc:1"]
+        assert mock_tx.run.call_args[1]["parameters"]["rows"] == [
+            {"index": 0, "from_id": "4:abc:1", "to_id": "4:abc:2", "properties": {"since": 2020}},
+        ]
+
+    @pytest.mark.anyio
+    async def test_concurrent_inserts_use_separate_sessions(self, mock_context):
+        """Verify concurrent inserts each open their own session instead of sharing one transaction."""
+        open_transactions = []
+
+        async def run(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            result = AsyncMock()
+            result.data = AsyncMock(return_value=[{"index": 0, "id": "4:abc:1"}])
+            return result
+
+        def make_session(**kwargs):
+            session = AsyncMock()
+
+            async def begin_transaction():
+                # A real session fails when a second transaction opens before the first ends.
+                assert session not in open_transactions
+                open_transactions.append(session)
+                mock_tx = mock_transaction()
+                mock_tx.run = AsyncMock(side_effect=run)
+                mock_tx.__aexit__ = AsyncMock(side_effect=lambda *args: open_transactions.remove(session))
+                return mock_tx
+
+            session.begin_transaction = AsyncMock(side_effect=begin_transaction)
+            return mock_driver(session).session()
+
+        driver = MagicMock()
+        driver.session = MagicMock(side_effect=make_session)
+
+        config = ActionAdapter.validate_python({
+            "method": "insert",
+            "node": {"label": "Person", "properties": {"name": "Alice"}},
+        })
+        action = Neo4jGraphStoreAction(config, driver, database_name="graph")
+        results = await asyncio.gather(action.run(mock_context), action.run(mock_context))
+
+        assert [ result["created_nodes"] for result in results ] == [1, 1]
+        assert driver.session.call_count == 2
+        driver.session.assert_called_with(database="graph")
+
+
+class TestNeo4jUpdateAction:
+    """Test Neo4j update action execution."""
+
+    @pytest.mark.anyio
+    async def test_update_multiple_nodes(self, mock_context):
+        """Verify all node IDs are updated by one statement with properties passed as a parameter."""
+        mock_tx = mock_transaction([{"count": 2}])
+        mock_session = AsyncMock()
+        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
+
+        config = ActionAdapter.validate_python({
+            "method": "update",
+            "node_id": ["4:abc:1", "4:abc:2"],
+            "properties": {"status": "active"},
+        })
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session))
+        result = await action.run(mock_context)
+
+        assert result == [{"affected_rows": 2}]
+        mock_tx.run.assert_called_once()
+        assert mock_tx.run.call_args[1]["parameters"] == {
+            "properties": {"status": "active"},
+            "ids": ["4:abc:1", "4:abc:2"],
+        }
 
 
 class TestNeo4jDeleteAction:
@@ -245,46 +353,38 @@ class TestNeo4jDeleteAction:
     @pytest.mark.anyio
     async def test_delete_node_with_detach(self, mock_context):
         """Verify deleting a node with detach uses DETACH DELETE in the Cypher query."""
+        mock_tx = mock_transaction([{"count": 1}])
         mock_session = AsyncMock()
-        mock_session.run = AsyncMock(return_value=AsyncMock())
-
-        mock_driver = AsyncMock()
-        mock_driver.session = MagicMock(return_value=mock_session)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
 
         config = ActionAdapter.validate_python({
             "method": "delete",
             "node_id": "4:abc:123",
             "detach": True,
         })
-        action = Neo4jGraphStoreAction(config, mock_session)
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session))
         result = await action.run(mock_context)
 
         assert result["affected_rows"] == 1
-        call_args = mock_session.run.call_args
+        call_args = mock_tx.run.call_args
         assert "DETACH DELETE" in call_args[0][0]
 
     @pytest.mark.anyio
     async def test_delete_node_without_detach(self, mock_context):
         """Verify deleting a node without detach uses plain DELETE."""
+        mock_tx = mock_transaction([{"count": 1}])
         mock_session = AsyncMock()
-        mock_session.run = AsyncMock(return_value=AsyncMock())
-
-        mock_driver = AsyncMock()
-        mock_driver.session = MagicMock(return_value=mock_session)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session.begin_transaction = AsyncMock(return_value=mock_tx)
 
         config = ActionAdapter.validate_python({
             "method": "delete",
             "node_id": "4:abc:123",
             "detach": False,
         })
-        action = Neo4jGraphStoreAction(config, mock_session)
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session))
         result = await action.run(mock_context)
 
-        call_args = mock_session.run.call_args
+        call_args = mock_tx.run.call_args
         assert "DETACH DELETE" not in call_args[0][0]
         assert "DELETE n" in call_args[0][0]
 
@@ -302,11 +402,6 @@ class TestNeo4jTraverseAction:
         ])
         mock_session.run = AsyncMock(return_value=mock_result)
 
-        mock_driver = AsyncMock()
-        mock_driver.session = MagicMock(return_value=mock_session)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
-
         config = ActionAdapter.validate_python({
             "method": "traverse",
             "start_node": "4:abc:123",
@@ -314,7 +409,7 @@ class TestNeo4jTraverseAction:
             "max_depth": 2,
             "relationship_types": ["KNOWS"],
         })
-        action = Neo4jGraphStoreAction(config, mock_session)
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session))
         result = await action.run(mock_context)
 
         call_args = mock_session.run.call_args
@@ -323,3 +418,21 @@ class TestNeo4jTraverseAction:
         assert "*1..2" in cypher
         assert "->" in cypher
         assert len(result) == 1
+
+    @pytest.mark.anyio
+    async def test_traverse_multiple_start_nodes_in_one_query(self, mock_context):
+        """Verify several start nodes are traversed by a single UNWIND query."""
+        mock_session = AsyncMock()
+        mock_result = AsyncMock()
+        mock_result.data = AsyncMock(return_value=[])
+        mock_session.run = AsyncMock(return_value=mock_result)
+
+        config = ActionAdapter.validate_python({
+            "method": "traverse",
+            "start_node": ["4:abc:1", "4:abc:2"],
+        })
+        action = Neo4jGraphStoreAction(config, mock_driver(mock_session))
+        await action.run(mock_context)
+
+        mock_session.run.assert_called_once()
+        assert mock_session.run.call_args[1]["parameters"] == {"start_ids": ["4:abc:1", "4:abc:2"]}
@@ -81,137 +81,117 @@ class TestArangoDBIdentifierValidation:
 # ──────────────────────────────────────────────
 
 
-class TestNeo4jBuildCreateNode:
-    def test_returns_cypher_and_params(self):
-        cypher, params = Neo4jQueryBuilder.build_create_node("Person", {"name": "Alice", "age": 30})
-        assert "CREATE (n:Person" in cypher
-        assert "name: $name" in cypher
-        assert "age: $age" in cypher
-        assert "RETURN elementId(n) AS id" in cypher
-        assert params == {"name": "Alice", "age": 30}
-
-    def test_empty_properties(self):
-        cypher, params = Neo4jQueryBuilder.build_create_node("Tag", {})
-        assert "CREATE (n:Tag" in cypher
-        assert params == {}
+class TestNeo4jBuildCreateNodes:
+    def test_unwinds_rows_under_label(self):
+        cypher = Neo4jQueryBuilder.build_create_nodes("Person")
+        assert cypher.startswith("UNWIND $rows AS row")
+        assert "CREATE (n:Person) SET n = row.properties" in cypher
+        assert "RETURN row.index AS index, elementId(n) AS id" in cypher
 
     def test_rejects_bad_label(self):
         with pytest.raises(ValueError, match="Invalid label identifier"):
-            Neo4jQueryBuilder.build_create_node("Person; DROP", {"name": "x"})
+            Neo4jQueryBuilder.build_create_nodes("Person; DROP")
 
 
-class TestNeo4jBuildCreateRelationship:
-    def test_with_properties(self):
-        cypher, params = Neo4jQueryBuilder.build_create_relationship(
-            "KNOWS", "4:a:1", "4:b:2", {"since": 2020}
-        )
-        assert "[r:KNOWS {since: $prop_since}]" in cypher
-        assert "elementId(a) = $from_id" in cypher
-        assert "elementId(b) = $to_id" in cypher
-        assert params == {"from_id": "4:a:1", "to_id": "4:b:2", "prop_since": 2020}
-
-    def test_without_properties_omits_property_braces(self):
-        cypher, params = Neo4jQueryBuilder.build_create_relationship(
-            "KNOWS", "4:a:1", "4:b:2", {}
-        )
-        assert "[r:KNOWS]" in cypher
-        assert "{" not in cypher.split("[r:KNOWS]")[1].split("RETURN")[0]
-        assert params == {"from_id": "4:a:1", "to_id": "4:b:2"}
+class TestNeo4jBuildCreateRelationships:
+    def test_unwinds_rows_under_type(self):
+        cypher = Neo4jQueryBuilder.build_create_relationships("KNOWS")
+        assert cypher.startswith("UNWIND $rows AS row")
+        assert "elementId(a) = row.from_id" in cypher
+        assert "elementId(b) = row.to_id" in cypher
+        assert "CREATE (a)-[r:KNOWS]->(b) SET r = row.properties" in cypher
 
     def test_rejects_bad_relationship_type(self):
         with pytest.raises(ValueError, match="Invalid relationship type identifier"):
-            Neo4jQueryBuilder.build_create_relationship("BAD;TYPE", "a", "b", {})
+            Neo4jQueryBuilder.build_create_relationships("BAD;TYPE")
 
 
-class TestNeo4jBuildUpdateNode:
+class TestNeo4jBuildUpdateNodes:
     def test_properties_only(self):
-        cypher, params = Neo4jQueryBuilder.build_update_node("4:x:1", {"name": "Bob"}, None)
-        assert "n.name = $prop_name" in cypher
-        assert "MATCH (n) WHERE elementId(n) = $id" in cypher
-        assert params == {"id": "4:x:1", "prop_name": "Bob"}
+        cypher = Neo4jQueryBuilder.build_update_nodes({"name": "Bob"}, None)
+        assert "UNWIND $ids AS id MATCH (n) WHERE elementId(n) = id" in cypher
+        assert "SET n += $properties" in cypher
+        assert "name" not in cypher
 
     def test_labels_only_string(self):
-        cypher, params = Neo4jQueryBuilder.build_update_node("4:x:1", None, "Active")
+        cypher = Neo4jQueryBuilder.build_update_nodes(None, "Active")
         assert "SET n:Active" in cypher
-        assert params == {"id": "4:x:1"}
+        assert "$properties" not in cypher
 
     def test_labels_only_list(self):
-        cypher, params = Neo4jQueryBuilder.build_update_node("4:x:1", None, ["A", "B"])
-        assert "SET n:A" in cypher
-        assert "SET n:B" in cypher
+        cypher = Neo4jQueryBuilder.build_update_nodes(None, ["A", "B"])
+        assert "SET n:A:B" in cypher
 
     def test_properties_and_labels(self):
-        cypher, params = Neo4jQueryBuilder.build_update_node("4:x:1", {"k": "v"}, "Tag")
-        assert "n.k = $prop_k" in cypher
+        cypher = Neo4jQueryBuilder.build_update_nodes({"k": "v"}, "Tag")
+        assert "SET n += $properties" in cypher
         assert "SET n:Tag" in cypher
 
     def test_no_changes_returns_none(self):
-        assert Neo4jQueryBuilder.build_update_node("4:x:1", None, None) is None
-        assert Neo4jQueryBuilder.build_update_node("4:x:1", {}, []) is None
+        assert Neo4jQueryBuilder.build_update_nodes(None, None) is None
+        assert Neo4jQueryBuilder.build_update_nodes({}, []) is None
 
     def test_rejects_bad_label(self):
         with pytest.raises(ValueError, match="Invalid label identifier"):
-            Neo4jQueryBuilder.build_update_node("4:x:1", None, "Bad Label!")
+            Neo4jQueryBuilder.build_update_nodes(None, "Bad Label!")
 
 
-class TestNeo4jBuildUpdateRelationship:
-    def test_with_properties(self):
-        cypher, params = Neo4jQueryBuilder.build_update_relationship(
-            "5:r:1", {"weight": 0.5, "kind": "strong"}
-        )
-        assert "r.weight = $prop_weight" in cypher
-        assert "r.kind = $prop_kind" in cypher
-        assert params == {"id": "5:r:1", "prop_weight": 0.5, "prop_kind": "strong"}
+class TestNeo4jBuildUpdateRelationships:
+    def test_sets_properties_parameter(self):
+        cypher = Neo4jQueryBuilder.build_update_relationships()
+        assert "UNWIND $ids AS id" in cypher
+        assert "SET r += $properties" in cypher
 
 
 class TestNeo4jBuildDelete:
-    def test_node_with_detach(self):
-        cypher, params = Neo4jQueryBuilder.build_delete_node("4:x:1", detach=True)
+    def test_nodes_with_detach(self):
+        cypher = Neo4jQueryBuilder.build_delete_nodes(detach=True)
+        assert "UNWIND $ids AS id" in cypher
         assert "DETACH DELETE n" in cypher
-        assert params == {"id": "4:x:1"}
 
-    def test_node_without_detach(self):
-        cypher, params = Neo4jQueryBuilder.build_delete_node("4:x:1", detach=False)
+    def test_nodes_without_detach(self):
+        cypher = Neo4jQueryBuilder.build_delete_nodes(detach=False)
         assert "DETACH DELETE n" not in cypher
         assert "DELETE n" in cypher
 
-    def test_relationship(self):
-        cypher, params = Neo4jQueryBuilder.build_delete_relationship("5:r:1")
+    def test_relationships(self):
+        cypher = Neo4jQueryBuilder.build_delete_relationships()
+        assert "UNWIND $ids AS id" in cypher
         assert "DELETE r" in cypher
-        assert params == {"id": "5:r:1"}
 
 
 class TestNeo4jBuildTraverse:
     def test_outbound_direction(self):
         cypher, params = Neo4jQueryBuilder.build_traverse(
-            "4:x:1", direction="out", max_depth=3, relationship_types=None, node_labels=None,
+            ["4:x:1"], direction="out", max_depth=3, relationship_types=None, node_labels=None,
         )
         assert "(start)-[r*1..3]->(end)" in cypher
-        assert "elementId(start) = $start_id" in cypher
-        assert params == {"start_id": "4:x:1"}
+        assert "UNWIND $start_ids AS start_id" in cypher
+        assert "elementId(start) = start_id" in cypher
+        assert params == {"start_ids": ["4:x:1"]}
 
     def test_inbound_direction(self):
         cypher, _ = Neo4jQueryBuilder.build_traverse(
-            "4:x:1", direction="in", max_depth=2, relationship_types=None, node_labels=None,
+            ["4:x:1"], direction="in", max_depth=2, relationship_types=None, node_labels=None,
         )
         assert "(start)<-[r*1..2]-(end)" in cypher
 
     def test_both_directions_default(self):
         cypher, _ = Neo4jQueryBuilder.build_traverse(
-            "4:x:1", direction="both", max_depth=1, relationship_types=None, node_labels=None,
+            ["4:x:1"], direction="both", max_depth=1, relationship_types=None, node_labels=None,
         )
         assert "(start)-[r*1..1]-(end)" in cypher
 
     def test_relationship_type_filter(self):
         cypher, _ = Neo4jQueryBuilder.build_traverse(
-            "4:x:1", direction="out", max_depth=3,
+            ["4:x:1"], direction="out", max_depth=3,
             relationship_types=["KNOWS", "WORKS_WITH"], node_labels=None,
         )
         assert "[r:KNOWS|WORKS_WITH*1..3]" in cypher
 
     def test_node_label_filter(self):
         cypher, _ = Neo4jQueryBuilder.build_traverse(
-            "4:x:1", direction="out", max_depth=2,
+            ["4:x:1"], direction="out", max_depth=2,
             relationship_types=None, node_labels=["Person"],
         )
         assert "ANY(l IN labels(end) WHERE l = 'Person')" in cypher
@@ -219,14 +199,14 @@ class TestNeo4jBuildTraverse:
     def test_rejects_bad_relationship_type(self):
         with pytest.raises(ValueError, match="Invalid relationship type identifier"):
             Neo4jQueryBuilder.build_traverse(
-                "4:x:1", direction="out", max_depth=3,
+                ["4:x:1"], direction="out", max_depth=3,
                 relationship_types=["bad;rel"], node_labels=None,
             )
 
     def test_rejects_bad_node_label(self):
         with pytest.raises(ValueError, match="Invalid node label identifier"):
             Neo4jQueryBuilder.build_traverse(
-                "4:x:1", direction="out", max_depth=3,
+                ["4:x:1"], direction="out", max_depth=3,
                 relationship_types=None, node_labels=["bad label"],
             )
 
@@ -269,3 +249,46 @@ class TestArangoDBBuildInsertNode:
             ArangoDBQueryBuilder.build_insert_node_doc(
                 {"label": "bad collection!", "properties": {}}, default_collection=None,
             )
+
+
+class TestArangoDBBuildBatchQueries:
+    def test_insert_docs(self):
+        aql, bind_vars = ArangoDBQueryBuilder.build_insert_docs("persons", [{"name": "Alice"}])
+        assert aql == "FOR doc IN @docs INSERT doc INTO @@collection RETURN NEW._id"
+        assert bind_vars == {"docs": [{"name": "Alice"}], "@collection": "persons"}
+
+    def test_update_docs(self):
+        aql, bind_vars = ArangoDBQueryBuilder.build_update_docs("persons", [{"_key": "1", "age": 31}])
+        assert "UPDATE doc IN @@collection" in aql
+        assert bind_vars == {"docs": [{"_key": "1", "age": 31}], "@collection": "persons"}
+
+    def test_remove_docs(self):
+        aql, bind_vars = ArangoDBQueryBuilder.build_remove_docs("persons", ["1", "2"])
+        assert "REMOVE key IN @@collection" in aql
+        assert bind_vars == {"keys": ["1", "2"], "@collection": "persons"}
+
+
+class TestArangoDBBuildTraverse:
+    def test_edge_collection_traversal(self):
+        aql, bind_vars = ArangoDBQueryBuilder.build_traverse(
+            ["persons/1", "persons/2"], direction="in", max_depth=2,
+            graph=None, edge_collection="friendships", relationship_types=None,
+        )
+        assert "FOR start IN @start_nodes" in aql
+        assert "INBOUND start friendships" in aql
+        assert bind_vars == {"start_nodes": ["persons/1", "persons/2"], "max_depth": 2}
+
+    def test_graph_traversal(self):
+        aql, bind_vars = ArangoDBQueryBuilder.build_traverse(
+            ["persons/1"], direction="out", max_depth=1,
+            graph="social", edge_collection=None, relationship_types=None,
+        )
+        assert "OUTBOUND start GRAPH @graph" in aql
+        assert bind_vars["graph"] == "social"
+
+    def test_rejects_bad_graph(self):
+        with pytest.raises(ValueError, match="Invalid graph identifier"):
+            ArangoDBQueryBuilder.build_traverse(
+                ["persons/1"], direction="out", max_depth=1,
+                graph="bad graph", edge_collection=None, relationship_types=None,
+            )
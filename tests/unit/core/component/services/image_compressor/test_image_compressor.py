@@ -0,0 +1,165 @@
+"""Tests for parallel, order-preserving image compression and adaptive compress_level selection."""
+
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from unittest.mock import MagicMock
+from PIL import Image as PILImage
+
+from mindor.core.component.context import ComponentActionContext
+from mindor.core.component.services.image_compressor.drivers.common import ImageCompressorAction, CompressLevelSelector
+from mindor.core.component.services.image_compressor.drivers.native import NativeImageCompressorAction
+from mindor.core.foundation.variable.time import parse_time
+from mindor.dsl.schema.action import NativeImageCompressorActionConfig
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _make_context(images):
+    context = MagicMock(spec=ComponentActionContext)
+    context.cancellation_token = None
+
+    async def render_variable(value, scope=None, skip_decode=False):
+        return value
+
+    async def render_scalar(value, cast, default=None):
+        if value is None:
+            return default
+        return parse_time(value) if cast == "time" else cast(value)
+
+    async def render_image(value):
+        return images
+
+    context.render_variable = render_variable
+    context.render_scalar = render_scalar
+    context.render_image = render_image
+    return context
+
+
+def _make_image(width=64, height=48, color=(200, 30, 90)):
+    return PILImage.new("RGB", (width, height), color)
+
+
+class DelayedCompressorAction(ImageCompressorAction):
+    """Compresses instantly but finishes each image after its own delay, tracking how many run at once."""
+    def __init__(self, config, concurrency, delays):
+        super().__init__(config, None, concurrency)
+        self.delays = delays
+        self.running = 0
+        self.peak = 0
+
+    async def _compress(self, image, params):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delays[image.width])
+            return str(image.width).encode()
+        finally:
+            self.running -= 1
+
+
+class TestOrderedParallelCompression:
+    @pytest.mark.anyio
+    async def test_results_keep_input_order_and_concurrency_is_bounded(self):
+        images = [ _make_image(width=index + 1) for index in range(6) ]
+        delays = { 1: 0.05, 2: 0.01, 3: 0.03, 4: 0.0, 5: 0.02, 6: 0.0 }
+        config = NativeImageCompressorActionConfig(image="${input.images}")
+        action = DelayedCompressorAction(config, concurrency=3, delays=delays)
+
+        result = await action.run(_make_context(images))
+
+        assert result == [ b"1", b"2", b"3", b"4", b"5", b"6" ]
+        assert action.peak == 3
+
+    @pytest.mark.anyio
+    async def test_batch_size_overrides_concurrency(self):
+        images = [ _make_image(width=index + 1) for index in range(4) ]
+        config = NativeImageCompressorActionConfig(image="${input.images}", batch_size=1)
+        action = DelayedCompressorAction(config, concurrency=4, delays={ 1: 0.0, 2: 0.0, 3: 0.0, 4: 0.0 })
+
+        await action.run(_make_context(images))
+
+        assert action.peak == 1
+
+    @pytest.mark.anyio
+    async def test_stream_input_yields_results_in_order(self):
+        async def source():
+            for width in (1, 2, 3):
+                yield _make_image(width=width)
+
+        config = NativeImageCompressorActionConfig(image="${input.images}")
+        action = DelayedCompressorAction(config, concurrency=2, delays={ 1: 0.03, 2: 0.0, 3: 0.0 })
+
+        stream = await action.run(_make_context(source()))
+
+        assert [ chunk async for chunk in stream ] == [ b"1", b"2", b"3" ]
+
+    @pytest.mark.anyio
+    async def test_missing_images_yield_none(self):
+        config = NativeImageCompressorActionConfig(image="${input.images}")
+        action = DelayedCompressorAction(config, concurrency=2, delays={ 1: 0.0 })
+
+        assert await action.run(_make_context([ _make_image(width=1), None ])) == [ b"1", None ]
+
+
+class TestNativeProcessPool:
+    @pytest.mark.anyio
+    async def test_process_pool_output_matches_in_process_encode(self):
+        images = [ _make_image(color=(index * 40, 10, 10)) for index in range(4) ]
+        config = NativeImageCompressorActionConfig(image="${input.images}", compress_level=6)
+        executor = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+
+        try:
+            action = NativeImageCompressorAction(config, executor, 2, CompressLevelSelector())
+            result = await action.run(_make_context(images))
+        finally:
+            executor.shutdown()
+
+        assert result == [ ImageCompressorAction._encode_png_lossless(image, 6, True) for image in images ]
+        assert PILImage.open(io.BytesIO(result[0])).size == (64, 48)
+
+
+class TestCompressLevelSelector:
+    def test_unobserved_max_level_is_tried_first(self):
+        assert CompressLevelSelector().select(9, 1_000_000, 0.01) == 9
+
+    def test_walks_down_while_levels_run_over_budget(self):
+        selector = CompressLevelSelector()
+        selector.observe(9, 1_000_000, 0.5)
+        selector.observe(8, 1_000_000, 0.2)
+
+        assert selector.select(9, 1_000_000, 0.1) == 7
+
+    def test_cost_scales_with_image_size(self):
+        selector = CompressLevelSelector()
+        selector.observe(9, 1_000_000, 0.1)
+
+        assert selector.select(9, 500_000, 0.06) == 9
+        assert selector.select(9, 2_000_000, 0.06) == 8
+
+    def test_falls_back_to_min_level(self):
+        selector = CompressLevelSelector(min_level=1)
+        for level in range(2, 10):
+            selector.observe(level, 1_000_000, 1.0)
+
+        assert selector.select(9, 1_000_000, 0.01) == 1
+
+    @pytest.mark.anyio
+    async def test_native_action_lowers_level_for_target_latency(self):
+        selector = CompressLevelSelector()
+        selector.observe(9, 64 * 48, 1.0)
+        config = NativeImageCompressorActionConfig(image="${input.image}", compress_level=9, target_latency="50ms")
+        action = NativeImageCompressorAction(config, None, 1, selector)
+        image = _make_image()
+
+        result = await action.run(_make_context(image))
+
+        assert result == ImageCompressorAction._encode_png_lossless(image, 8, True)
+        assert 8 in selector._seconds_per_megapixel
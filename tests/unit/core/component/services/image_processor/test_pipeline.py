@@ -0,0 +1,222 @@
+"""Tests for the image-processor pipeline method covering fused operations, JPEG draft decoding, and stream ordering."""
+
+import asyncio
+import io
+
+import pytest
+
+from unittest.mock import AsyncMock, MagicMock
+from PIL import Image as PILImage, ImageChops
+from pydantic import TypeAdapter
+
+from mindor.core.component.context import ComponentActionContext
+from mindor.core.component.services.image_processor.drivers.native import NativeImageProcessorAction
+from mindor.dsl.schema.action import ImageProcessorActionMethod
+from mindor.dsl.schema.action.impl.image_processor.impl.native import (
+    NativeImageProcessorActionConfig,
+    ImageProcessorPipelineActionConfig,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _make_context(image):
+    context = MagicMock(spec=ComponentActionContext)
+    context.cancellation_token = None
+
+    async def render_variable(value, scope=None, skip_decode=False):
+        return value
+
+    async def render_scalar(value, cast, default=None):
+        if value is None:
+            return default
+        return cast(value)
+
+    async def render_image(value):
+        return image
+
+    context.render_variable = AsyncMock(side_effect=render_variable)
+    context.render_scalar = AsyncMock(side_effect=render_scalar)
+    context.render_image = AsyncMock(side_effect=render_image)
+    context.register_source = MagicMock()
+    return context
+
+
+def _gradient(width, height):
+    image = PILImage.new("RGB", (width, height))
+    image.putdata([ (x * 255 // width, y * 255 // height, (x + y) % 256) for y in range(height) for x in range(width) ])
+    return image
+
+
+def _jpeg(width, height):
+    buffer = io.BytesIO()
+    _gradient(width, height).save(buffer, format="JPEG")
+    return PILImage.open(io.BytesIO(buffer.getvalue()))
+
+
+def _max_difference(a, b):
+    return max(high for _, high in ImageChops.difference(a.convert("RGB"), b.convert("RGB")).getextrema())
+
+
+def _pipeline(*operations):
+    return ImageProcessorPipelineActionConfig(method=ImageProcessorActionMethod.PIPELINE, image="${input.image}", operations=list(operations))
+
+
+class TestPipeline:
+    @pytest.mark.anyio
+    async def test_matches_chained_actions(self):
+        image = _gradient(120, 80)
+        operations = [
+            { "method": "crop", "x": 10, "y": 10, "width": 100, "height": 60 },
+            { "method": "flip", "direction": "horizontal" },
+            { "method": "grayscale" },
+            { "method": "adjust-contrast", "factor": 1.5 },
+        ]
+
+        expected = image
+        for operation in operations:
+            config = TypeAdapter(NativeImageProcessorActionConfig).validate_python({ **operation, "image": "${input.image}" })
+            expected = await NativeImageProcessorAction(config).run(_make_context(expected))
+
+        result = await NativeImageProcessorAction(_pipeline(*operations)).run(_make_context(image))
+
+        assert result.mode == "L"
+        assert result.size == (100, 60)
+        assert _max_difference(result, expected) == 0
+
+    @pytest.mark.anyio
+    async def test_runs_in_a_single_executor_call(self):
+        action = NativeImageProcessorAction(_pipeline(
+            { "method": "resize", "width": 60, "height": 40, "scale_mode": "stretch" },
+            { "method": "blur", "radius": 1.0 },
+            { "method": "grayscale" },
+        ))
+        calls = []
+        original = action._run_in_executor
+
+        async def _run_in_executor(fn, *args):
+            calls.append(fn.__name__)
+            return await original(fn, *args)
+
+        action._run_in_executor = _run_in_executor
+        result = await action.run(_make_context(_gradient(120, 80)))
+
+        assert calls == [ "_apply_pipeline" ]
+        assert result.size == (60, 40)
+
+    @pytest.mark.anyio
+    async def test_resize_then_crop_is_fused(self):
+        image = _gradient(400, 300)
+        action = NativeImageProcessorAction(_pipeline(
+            { "method": "resize", "width": 200, "height": 150, "scale_mode": "fit" },
+            { "method": "crop", "x": 50, "y": 25, "width": 100, "height": 100 },
+        ))
+
+        original = action._apply_resize
+        action._apply_resize = MagicMock(side_effect=original)
+        result = await action.run(_make_context(image))
+
+        expected = image.resize((200, 150), PILImage.Resampling.LANCZOS).crop((50, 25, 150, 125))
+
+        action._apply_resize.assert_not_called()
+        assert result.size == (100, 100)
+        assert _max_difference(result, expected) <= 8
+
+    @pytest.mark.anyio
+    async def test_crop_outside_resized_image_is_not_fused(self):
+        image = _gradient(400, 300)
+        action = NativeImageProcessorAction(_pipeline(
+            { "method": "resize", "width": 100, "height": 100, "scale_mode": "fill" },
+            { "method": "crop", "x": 50, "y": 50, "width": 100, "height": 100 },
+        ))
+
+        result = await action.run(_make_context(image))
+
+        assert result.size == (100, 100)
+        assert result.getpixel((75, 75)) == (0, 0, 0)
+
+    @pytest.mark.anyio
+    async def test_jpeg_is_drafted_before_large_downscale(self):
+        image = _jpeg(800, 600)
+        action = NativeImageProcessorAction(_pipeline({ "method": "resize", "width": 100, "height": 100, "scale_mode": "fit" }))
+        drafts = []
+        reopen_image = action._reopen_image
+
+        def _reopen_tracked(source):
+            draft = reopen_image(source)
+            drafts.append(draft)
+            return draft
+
+        action._reopen_image = _reopen_tracked
+        result = await action.run(_make_context(image))
+
+        assert [ draft.size for draft in drafts ] == [ (400, 300) ]
+        assert result.size == (100, 75)
+
+    @pytest.mark.anyio
+    async def test_draft_leaves_the_input_image_untouched(self):
+        image = _jpeg(800, 600)
+        action = NativeImageProcessorAction(_pipeline({ "method": "resize", "width": 100, "height": 100, "scale_mode": "fit" }))
+
+        await action.run(_make_context(image))
+
+        assert image.size == (800, 600)
+        assert image.load() is not None
+        assert image.size == (800, 600)
+
+    @pytest.mark.anyio
+    async def test_operation_params_are_validated(self):
+        action = NativeImageProcessorAction(_pipeline({ "method": "resize", "scale_mode": "fit" }))
+
+        with pytest.raises(ValueError, match="'width' or 'height'"):
+            await action.run(_make_context(_gradient(10, 10)))
+
+    def test_operations_must_not_be_empty(self):
+        with pytest.raises(ValueError):
+            _pipeline()
+
+    def test_batch_methods_are_not_allowed_as_operations(self):
+        with pytest.raises(ValueError):
+            _pipeline({ "method": "concat", "mode": "horizontal" })
+
+
+class TestConcurrency:
+    @pytest.mark.anyio
+    async def test_stream_keeps_order_with_bounded_parallelism(self):
+        sizes = [ (40, 10), (10, 40), (30, 30), (20, 10), (10, 20), (50, 50) ]
+
+        async def _images():
+            for width, height in sizes:
+                yield _gradient(width, height)
+
+        config = _pipeline({ "method": "grayscale" })
+        config.batch_size = 2
+        action = NativeImageProcessorAction(config)
+
+        running, peak = 0, 0
+        original = action._pipeline
+
+        async def _pipeline_tracked(image, params):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                await asyncio.sleep(0.01 * (image.width % 3))
+                return await original(image, params)
+            finally:
+                running -= 1
+
+        action._pipeline = _pipeline_tracked
+        results = [ result async for result in await action.run(_make_context(_images())) ]
+
+        assert [ result.size for result in results ] == sizes
+        assert peak == 2
+
+    @pytest.mark.anyio
+    async def test_missing_images_are_skipped(self):
+        action = NativeImageProcessorAction(_pipeline({ "method": "grayscale" }))
+
+        assert await action.run(_make_context([ None, _gradient(10, 10) ])) == [ None, await action.run(_make_context(_gradient(10, 10))) ]
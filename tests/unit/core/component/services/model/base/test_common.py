@@ -0,0 +1,80 @@
+"""Unit tests for model preloading in ``ModelTaskService``."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Optional
+
+import pytest
+from pydantic import TypeAdapter
+
+from mindor.core.component.services.model.base.common import ModelTaskService
+from mindor.dsl.schema.component import ModelComponentConfig
+
+_ModelConfigAdapter = TypeAdapter(ModelComponentConfig)
+
+
+class _RecordingService(ModelTaskService):
+    """Records the thread and event loop the model was loaded on."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.load_thread: Optional[threading.Thread] = None
+        self.load_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _load_model(self) -> None:
+        self.load_thread = threading.current_thread()
+        self.load_loop = asyncio.get_running_loop()
+
+    async def _unload_model(self) -> None:
+        pass
+
+    async def _run(self, action, context):  # pragma: no cover - never called
+        pass
+
+
+class _ThreadedService(_RecordingService):
+    threaded_model_loading = True
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _make_config():
+    return _ModelConfigAdapter.validate_python({
+        "id": "m1",
+        "type": "model",
+        "task": "text-generation",
+        "driver": "huggingface",
+        "model": "org/model",
+        "preload": True,
+        "actions": [
+            {"prompt": "${input.text}"},
+        ],
+    })
+
+
+@pytest.mark.anyio
+async def test_preload_runs_on_running_loop_by_default():
+    service = _RecordingService("m1", _make_config(), daemon=False)
+
+    await service._start()
+    await service._stop()
+
+    assert service.load_loop is asyncio.get_running_loop()
+    assert service.load_thread is threading.current_thread()
+
+
+@pytest.mark.anyio
+async def test_preload_runs_on_worker_thread_when_driver_opts_in():
+    service = _ThreadedService("m1", _make_config(), daemon=False)
+
+    await service._start()
+    await service._stop()
+
+    assert service.load_loop is not asyncio.get_running_loop()
+    assert service.load_thread is not threading.current_thread()
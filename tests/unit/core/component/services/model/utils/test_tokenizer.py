@@ -0,0 +1,142 @@
+"""Tests for the process-level tokenizer registry and its token id cache, run with a fake tokenizer."""
+
+import threading
+
+import pytest
+
+from mindor.core.component.services.model.utils.tokenizer import TokenIdsCache, TokenizerRegistry
+
+
+class _FakeTokenizer:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, **kwargs):
+        self.calls.append((list(texts), kwargs))
+        return { "input_ids": [ [ 101 ] + [ len(word) for word in text.split() ] + [ 102 ] for text in texts ] }
+
+
+class _FakeTokenizerClass:
+    pass
+
+
+class TestTokenIdsCache:
+    def test_repeated_texts_are_tokenized_once(self):
+        tokenizer = _FakeTokenizer()
+        cache = TokenIdsCache(tokenizer, max_size=8, max_text_length=100)
+
+        assert cache.get_token_ids([ "system prompt", "hi" ]) == [ [ 101, 6, 6, 102 ], [ 101, 2, 102 ] ]
+        assert cache.count_tokens([ "system prompt", "new text here" ]) == [ 4, 5 ]
+        assert [ texts for texts, _ in tokenizer.calls ] == [ [ "system prompt", "hi" ], [ "new text here" ] ]
+
+    def test_requests_only_input_ids_without_padding_or_truncation(self):
+        tokenizer = _FakeTokenizer()
+        TokenIdsCache(tokenizer, max_size=8, max_text_length=100).count_tokens([ "a" ])
+
+        assert tokenizer.calls[0][1] == { "padding": False, "truncation": False, "return_attention_mask": False, "return_token_type_ids": False }
+
+    def test_tokenizes_while_holding_the_lock(self):
+        lock = threading.Lock()
+        held = []
+
+        class _LockCheckingTokenizer(_FakeTokenizer):
+            def __call__(self, texts, **kwargs):
+                held.append(lock.locked())
+                return super().__call__(texts, **kwargs)
+
+        TokenIdsCache(_LockCheckingTokenizer(), max_size=8, max_text_length=100, lock=lock).count_tokens([ "a" ])
+
+        assert held == [ True ]
+
+    def test_long_texts_and_disabled_cache_skip_caching(self):
+        tokenizer = _FakeTokenizer()
+        bounded = TokenIdsCache(tokenizer, max_size=8, max_text_length=5)
+        disabled = TokenIdsCache(tokenizer, max_size=0, max_text_length=100)
+
+        bounded.count_tokens([ "long text" ])
+        bounded.count_tokens([ "long text" ])
+        disabled.count_tokens([ "a" ])
+        disabled.count_tokens([ "a" ])
+
+        assert len(tokenizer.calls) == 4
+
+
+class TestTokenizerRegistry:
+    def test_same_model_shares_one_instance(self):
+        registry = TokenizerRegistry(token_ids_cache_size=8, max_cached_text_length=100)
+        loads = []
+
+        def load():
+            loads.append(1)
+            return _FakeTokenizer()
+
+        first = registry.acquire(_FakeTokenizerClass, "/models/a", { "revision": "main", "token": "x" }, load)
+        second = registry.acquire(_FakeTokenizerClass, "/models/a", { "token": "y", "revision": "main" }, load)
+        other = registry.acquire(_FakeTokenizerClass, "/models/a", { "revision": "v2" }, load)
+
+        assert first is second
+        assert first.tokenizer is second.tokenizer
+        assert other is not first
+        assert len(loads) == 2
+
+    def test_components_share_one_instance_and_lock(self):
+        registry = TokenizerRegistry(token_ids_cache_size=8, max_cached_text_length=100)
+        first = registry.acquire(_FakeTokenizerClass, "/models/a", {}, _FakeTokenizer)
+        second = registry.acquire(_FakeTokenizerClass, "/models/a", {}, _FakeTokenizer)
+
+        assert first.tokenizer is second.tokenizer
+        assert first.token_ids.lock is first.lock
+
+    def test_other_models_load_while_one_is_loading(self):
+        registry = TokenizerRegistry(token_ids_cache_size=8, max_cached_text_length=100)
+        loading, release_load = threading.Event(), threading.Event()
+        loads = []
+
+        def slow_load():
+            loads.append("a")
+            loading.set()
+            release_load.wait(timeout=5)
+            return _FakeTokenizer()
+
+        def acquire_slow():
+            registry.acquire(_FakeTokenizerClass, "/models/a", {}, slow_load)
+
+        threads = [ threading.Thread(target=acquire_slow) for _ in range(2) ]
+        threads[0].start()
+        assert loading.wait(timeout=5)
+        threads[1].start()
+
+        # The registry lock is free while "/models/a" loads.
+        other = registry.acquire(_FakeTokenizerClass, "/models/b", {}, _FakeTokenizer)
+        assert other.tokenizer is not None
+
+        release_load.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert loads == [ "a" ]
+        assert len(registry) == 2
+
+    def test_failed_load_is_released_and_retried(self):
+        registry = TokenizerRegistry(token_ids_cache_size=8, max_cached_text_length=100)
+
+        def failing_load():
+            raise OSError("missing files")
+
+        with pytest.raises(OSError):
+            registry.acquire(_FakeTokenizerClass, "/models/a", {}, failing_load)
+
+        assert len(registry) == 0
+        assert registry.acquire(_FakeTokenizerClass, "/models/a", {}, _FakeTokenizer).tokenizer is not None
+
+    def test_last_release_drops_the_tokenizer(self):
+        registry = TokenizerRegistry(token_ids_cache_size=8, max_cached_text_length=100)
+        first = registry.acquire(_FakeTokenizerClass, "/models/a", {}, _FakeTokenizer)
+        second = registry.acquire(_FakeTokenizerClass, "/models/a", {}, _FakeTokenizer)
+
+        registry.release(first)
+        assert len(registry) == 1
+
+        registry.release(second)
+        assert len(registry) == 0
+        assert registry.acquire(_FakeTokenizerClass, "/models/a", {}, _FakeTokenizer) is not first
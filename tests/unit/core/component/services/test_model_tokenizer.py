@@ -226,3 +226,31 @@ class TestBatchSize:
         assert result == [{"count": 1}, {"count": 2}, {"count": 3}]
 
 
+
+
+class TestTokenIdsCache:
+    @pytest.mark.anyio
+    async def test_count_and_plain_encode_reuse_cached_token_ids(self):
+        from mindor.core.component.services.model.utils.tokenizer import TokenIdsCache
+
+        class _CountingTokenizer(_FakeTokenizer):
+            calls = 0
+
+            def __call__(self, text, **kwargs):
+                self.calls += 1
+                return super().__call__(text, **kwargs)
+
+        tokenizer = _CountingTokenizer()
+        token_ids = TokenIdsCache(tokenizer, max_size=8, max_text_length=100)
+        config = TypeAdapter(ModelTokenizerActionConfig).validate_python({"method": "count", "text": "alpha beta"})
+
+        assert await HuggingfaceTextModelTokenizerTaskAction(config, tokenizer, token_ids).run(_make_context()) == {"count": 2}
+
+        config = TypeAdapter(ModelTokenizerActionConfig).validate_python({"method": "encode", "text": "alpha beta"})
+        ctx = _make_context()
+        ctx.render_scalar = AsyncMock(return_value=None)
+        result = await HuggingfaceTextModelTokenizerTaskAction(config, tokenizer, token_ids).run(ctx)
+
+        assert result["input_ids"] == token_ids.get_token_ids(["alpha beta"])[0]
+        assert result["attention_mask"] == [1, 1]
+        assert tokenizer.calls == 1
@@ -0,0 +1,106 @@
+"""Tests for StreamingTextSplitter fed in small pieces: results match whole-text splitting
+and the text held back between feeds stays bounded by chunk_size."""
+
+import random
+
+import pytest
+
+from mindor.core.component.services.text_splitter.separators import DEFAULT_SEPARATORS
+from mindor.core.component.services.text_splitter.text_splitter import SegmentMergeBuffer, StreamingTextSplitter
+
+
+WORDS = [ "alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta" ]
+
+
+def _make_text(rng, words, breaks=(" ", "\n", "\n\n"), weights=(85, 10, 5)):
+    return "\n\n".join([ "Intro" ] + [ "".join(rng.choice(WORDS) + rng.choices(breaks, weights)[0] for _ in range(words)) ])
+
+
+def _split(pieces, separators=DEFAULT_SEPARATORS, chunk_size=50, chunk_overlap=10, splitter=None):
+    splitter = splitter or StreamingTextSplitter(separators, chunk_size, chunk_overlap)
+    chunks = []
+    for piece in pieces:
+        chunks.extend(splitter.feed(piece))
+    chunks.extend(splitter.flush())
+    return chunks
+
+
+def _pieces(text, rng):
+    cuts = sorted(rng.sample(range(1, len(text)), min(len(text) - 1, rng.randint(1, 40))))
+    return [ text[start:end] for start, end in zip([ 0 ] + cuts, cuts + [ len(text) ]) ]
+
+
+def _held_back(splitter):
+    held = len(splitter._pending_text) + splitter._pending_length + sum(len(part) for part in splitter._oversize_parts)
+    if splitter._oversize_splitter is not None:
+        held += _held_back(splitter._oversize_splitter)
+    return held
+
+
+class TestChunkingInvariance:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_random_pieces_match_whole_text(self, seed):
+        rng = random.Random(seed)
+        text = _make_text(rng, 200)
+        chunk_size = rng.randint(20, 120)
+        chunk_overlap = rng.randint(0, chunk_size // 2)
+
+        expected = _split([ text ], chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+        assert _split(_pieces(text, rng), chunk_size=chunk_size, chunk_overlap=chunk_overlap) == expected
+        assert _split(list(text), chunk_size=chunk_size, chunk_overlap=chunk_overlap) == expected
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_oversize_segments_match_whole_text(self, seed):
+        # One long paragraph after the intro: everything past it is one oversize segment.
+        rng = random.Random(seed)
+        text = _make_text(rng, 300, breaks=(" ", "\n"), weights=(90, 10))
+
+        expected = _split([ text ], chunk_size=40, chunk_overlap=8)
+
+        assert _split([ text[i:i + 3] for i in range(0, len(text), 3) ], chunk_size=40, chunk_overlap=8) == expected
+
+    def test_multi_character_separator_split_across_pieces(self):
+        text = "one<sep>two<sep>three<sep>four"
+
+        expected = _split([ text ], separators=[ "<sep>" ], chunk_size=10, chunk_overlap=0)
+
+        assert expected == [ "one", "<sep>two", "<sep>three", "<sep>four" ]
+        assert _split(list(text), separators=[ "<sep>" ], chunk_size=10, chunk_overlap=0) == expected
+
+    def test_oversize_segment_without_fallback_is_emitted_whole(self):
+        text = "a\n\n" + "b" * 30 + "\n\nc"
+
+        assert _split(list(text), separators=[ "\n\n" ], chunk_size=10, chunk_overlap=0) == [ "a", "b" * 30, "c" ]
+
+
+class TestBoundedPending:
+    def test_long_paragraph_is_streamed(self):
+        text = _make_text(random.Random(0), 5000, breaks=(" ", "\n"), weights=(90, 10))
+        splitter = StreamingTextSplitter(DEFAULT_SEPARATORS, 100, 20)
+        peak, chunks = 0, []
+
+        for start in range(0, len(text), 4):
+            chunks.extend(splitter.feed(text[start:start + 4]))
+            peak = max(peak, _held_back(splitter))
+        chunks.extend(splitter.flush())
+
+        assert peak <= 100 + 2 * len("\n\n")
+        assert len(chunks) > 100
+        assert chunks == _split([ text ], chunk_size=100, chunk_overlap=20)
+
+    def test_chunks_are_yielded_before_input_ends(self):
+        splitter = StreamingTextSplitter(DEFAULT_SEPARATORS, 30, 0)
+
+        chunks = [ chunk for word in [ "Intro\n\n" ] + [ "word " ] * 100 for chunk in splitter.feed(word) ]
+
+        assert len(chunks) > 10
+
+
+class TestSegmentMergeBuffer:
+    def test_overlap_drops_oldest_segments(self):
+        buffer = SegmentMergeBuffer(chunk_size=10, chunk_overlap=4)
+        chunks = [ chunk for segment in [ "aaa", " bb", " cc", " dd", " ee" ] for chunk in buffer.add(segment) ]
+
+        assert chunks == [ "aaa bb cc" ]
+        assert buffer.flush() == "cc dd ee"
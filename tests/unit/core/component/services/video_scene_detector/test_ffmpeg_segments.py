@@ -0,0 +1,149 @@
+"""Tests for concurrent detection across videos and segmented detection of one video with the ffmpeg driver.
+
+ffmpeg itself is replaced by a fake scene filter that reports a fixed set of cuts,
+so segment planning, overlap reconciliation and ordering run without the binary.
+"""
+
+import asyncio
+
+import pytest
+
+from unittest.mock import AsyncMock, MagicMock
+
+from mindor.core.component.context import ComponentActionContext
+from mindor.core.component.services.video_scene_detector.drivers import ffmpeg
+from mindor.core.component.services.video_scene_detector.drivers.ffmpeg import FFmpegVideoSceneDetectorAction
+from mindor.core.foundation.streaming.media import create_media_source
+from mindor.core.foundation.variable.time import parse_time
+from mindor.dsl.schema.action import VideoSceneDetectorActionConfig
+
+FRAME_RATE = 10.0
+DURATION   = 60.0
+CUTS       = [ 4.0, 19.9, 20.0, 20.1, 33.3, 41.0 ]
+KEYFRAMES  = [ 0.0, 10.0, 19.5, 30.0, 40.0, 50.0 ]
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"\x00")
+    return str(path)
+
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch):
+    """Scene filter over `CUTS` that, like ffmpeg, mis-scores the first frame after a seek."""
+    commands = []
+
+    async def probe_video(input_path, fields):
+        return DURATION, FRAME_RATE
+
+    async def probe_keyframes(input_path, positions):
+        return sorted({ max(keyframe for keyframe in KEYFRAMES if keyframe <= position) for position in positions })
+
+    async def run_scene_filter(self, command, cancellation_token):
+        start = float(command[command.index("-ss") + 1]) if "-ss" in command else 0.0
+        end   = float(command[command.index("-to") + 1]) if "-to" in command else DURATION
+        commands.append((start, end))
+        await asyncio.sleep(0.01)
+        spurious = [ 1 / FRAME_RATE ] if start > 0 else []
+        return spurious + [ cut - start for cut in CUTS if start < cut <= end ]
+
+    monkeypatch.setattr(ffmpeg, "probe_video", probe_video)
+    monkeypatch.setattr(ffmpeg, "probe_keyframes", probe_keyframes)
+    monkeypatch.setattr(FFmpegVideoSceneDetectorAction, "_run_scene_filter", run_scene_filter)
+
+    return commands
+
+
+def _make_context(video_value):
+    context = MagicMock(spec=ComponentActionContext)
+    context.cancellation_token = None
+
+    async def render_variable(value, **kwargs):
+        return value
+
+    async def render_scalar(value, cast, default=None):
+        if value is None:
+            return default
+        return parse_time(value) if cast == "time" else cast(value)
+
+    async def render_video(value):
+        if isinstance(video_value, list):
+            return [ create_media_source(item) for item in video_value ]
+        return create_media_source(video_value)
+
+    context.render_variable = AsyncMock(side_effect=render_variable)
+    context.render_scalar = AsyncMock(side_effect=render_scalar)
+    context.render_video = AsyncMock(side_effect=render_video)
+    context.register_source = MagicMock()
+    return context
+
+
+def _cut_times(scenes):
+    return [ parse_time(scene["start_time"]) for scene in scenes[1:] ]
+
+
+class TestSegmentedDetection:
+    @pytest.mark.anyio
+    async def test_matches_single_pass(self, video, fake_ffmpeg):
+        single    = await FFmpegVideoSceneDetectorAction(VideoSceneDetectorActionConfig(video="${input.video}")).run(_make_context(video))
+        segmented = await FFmpegVideoSceneDetectorAction(VideoSceneDetectorActionConfig(video="${input.video}", segment_duration="10s")).run(_make_context(video))
+
+        assert segmented == single
+        assert _cut_times(segmented) == pytest.approx(CUTS)
+        assert [ scene["index"] for scene in segmented ] == list(range(len(CUTS) + 1))
+
+    @pytest.mark.anyio
+    async def test_segments_start_at_keyframes(self, video, fake_ffmpeg):
+        config = VideoSceneDetectorActionConfig(video="${input.video}", segment_duration="10s")
+        await FFmpegVideoSceneDetectorAction(config).run(_make_context(video))
+
+        assert [ start for start, _ in fake_ffmpeg ] == KEYFRAMES
+        assert all(end > next_start for (_, end), (next_start, _) in zip(fake_ffmpeg, fake_ffmpeg[1:]))
+
+    @pytest.mark.anyio
+    async def test_short_video_runs_single_pass(self, video, fake_ffmpeg):
+        config = VideoSceneDetectorActionConfig(video="${input.video}", segment_duration="5m")
+        await FFmpegVideoSceneDetectorAction(config).run(_make_context(video))
+
+        assert len(fake_ffmpeg) == 1
+
+    @pytest.mark.anyio
+    async def test_streams_scenes_in_order(self, video, fake_ffmpeg):
+        config = VideoSceneDetectorActionConfig(video="${input.video}", segment_duration="10s", segment_concurrency=2, streaming=True)
+        stream = await FFmpegVideoSceneDetectorAction(config).run(_make_context(video))
+
+        scenes = [ scene async for scene in stream ]
+
+        assert [ scene["index"] for scene in scenes ] == list(range(len(CUTS) + 1))
+        assert _cut_times(scenes) == pytest.approx(CUTS)
+
+
+class TestConcurrentVideos:
+    @pytest.mark.anyio
+    async def test_batch_size_bounds_concurrency_and_keeps_order(self, video):
+        action = FFmpegVideoSceneDetectorAction(VideoSceneDetectorActionConfig(video="${input.videos}", batch_size=2))
+        running, peak, delays = 0, 0, iter([ 0.03, 0.01, 0.02, 0.0 ])
+
+        async def _detect(video, params, streaming, cancellation_token=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                delay = next(delays)
+                await asyncio.sleep(delay)
+                return [ { "delay": delay } ]
+            finally:
+                running -= 1
+
+        action._detect = _detect
+        results = await action.run(_make_context([ video ] * 4))
+
+        assert [ result[0]["delay"] for result in results ] == [ 0.03, 0.01, 0.02, 0.0 ]
+        assert peak == 2
@@ -17,9 +17,10 @@ def _compose(
     components: List[Dict[str, Any]] = None,
     workflows: List[Dict[str, Any]] = None,
     listeners: List[Dict[str, Any]] = None,
+    controller: Dict[str, Any] = None,
 ) -> ComposeConfig:
     return ComposeConfig.model_validate({
-        "controller": {"type": "http-server", "port": 8080},
+        "controller": controller or {"type": "http-server", "port": 8080},
         "components": components or [],
         "workflows": workflows or [],
         "listeners": listeners or [],
@@ -147,6 +148,42 @@ class TestComponentReferences:
         assert ComposeValidator(config).validate() == []
 
 
+class TestComponentDependencies:
+    def test_valid_dependencies_ok(self):
+        config = _compose(
+            components=[_shell_component("c1"), {**_shell_component("c2"), "depends_on": ["c1"]}],
+            workflows=[{"id": "wf", "jobs": [_job("j1", component="c2")]}],
+        )
+        assert ComposeValidator(config).validate() == []
+
+    def test_missing_dependency(self):
+        config = _compose(
+            components=[{**_shell_component("c1"), "depends_on": ["ghost"]}],
+            workflows=[{"id": "wf", "jobs": [_job("j1")]}],
+        )
+        errors = ComposeValidator(config).validate()
+        assert any("component 'c1'.depends_on: References non-existent component 'ghost'" in e for e in errors)
+
+    def test_self_dependency(self):
+        config = _compose(
+            components=[{**_shell_component("c1"), "depends_on": ["c1"]}],
+            workflows=[{"id": "wf", "jobs": [_job("j1")]}],
+        )
+        errors = ComposeValidator(config).validate()
+        assert any("Component 'c1' depends on itself" in e for e in errors)
+
+    def test_dependency_cycle(self):
+        config = _compose(
+            components=[
+                {**_shell_component("c1"), "depends_on": ["c2"]},
+                {**_shell_component("c2"), "depends_on": ["c1"]},
+            ],
+            workflows=[{"id": "wf", "jobs": [_job("j1")]}],
+        )
+        errors = ComposeValidator(config).validate()
+        assert any("Dependency cycle detected involving component" in e for e in errors)
+
+
 class TestJobGraphs:
     def test_self_dependency_detected(self):
         config = _compose(
@@ -381,3 +418,54 @@ class TestWorkflowReferencesInListeners:
             "default workflow but multiple workflows exist" in e and "listeners[0].triggers[0]" in e
             for e in errors
         )
+
+
+class TestSharedHttpServers:
+    """`_validate_shared_http_servers` — HTTP services bound to the same host and port."""
+
+    def _controller(self, **adapter: Any) -> Dict[str, Any]:
+        return {"adapter": {"type": "http-server", "host": "0.0.0.0", "port": 8080, **adapter}}
+
+    def _listener(self, **values: Any) -> Dict[str, Any]:
+        return {"type": "http-trigger", "triggers": [{"path": "/x", "workflow": "wf"}], **values}
+
+    def _workflows(self) -> List[Dict[str, Any]]:
+        return [{"id": "wf", "jobs": [_job("j1")]}]
+
+    def test_distinct_base_paths_on_shared_port_ok(self):
+        config = _compose(
+            components=[_shell_component("c1")],
+            workflows=self._workflows(),
+            listeners=[self._listener(port=8080, base_path="/hooks")],
+            controller=self._controller(base_path="/api"),
+        )
+        assert ComposeValidator(config).validate() == []
+
+    def test_same_base_path_on_shared_port_reports_error(self):
+        config = _compose(
+            components=[_shell_component("c1")],
+            workflows=self._workflows(),
+            listeners=[self._listener(port=8080, base_path="/api/")],
+            controller=self._controller(base_path="/api"),
+        )
+        errors = ComposeValidator(config).validate()
+        assert any("listeners[0].base_path" in e and "controller.adapters[0]" in e for e in errors)
+
+    def test_same_base_path_on_different_ports_ok(self):
+        config = _compose(
+            components=[_shell_component("c1")],
+            workflows=self._workflows(),
+            listeners=[self._listener(port=8091)],
+            controller=self._controller(),
+        )
+        assert ComposeValidator(config).validate() == []
+
+    def test_listener_on_multi_worker_port_reports_error(self):
+        config = _compose(
+            components=[_shell_component("c1")],
+            workflows=self._workflows(),
+            listeners=[self._listener(port=8080, base_path="/hooks")],
+            controller=self._controller(workers=2),
+        )
+        errors = ComposeValidator(config).validate()
+        assert any("controller.adapters[0].workers" in e for e in errors)
@@ -1,5 +1,6 @@
 """Tests for the WebSocketManager used by the HTTP server controller adapter."""
 
+import asyncio
 import inspect
 import json
 from typing import Annotated, Optional, get_type_hints
@@ -26,6 +27,15 @@ from mindor.core.controller.adapters.services.http_server import (
     WebSocketRouter,
     WorkflowRunPayload,
 )
+from mindor.core.controller.streaming import TaskOutputStreamResource
+from mindor.core.foundation.streaming.iterators import StreamEncodingIterator
+from mindor.core.foundation.streaming.bytes import BytesStreamResource
+from mindor.core.foundation.streaming.file import FileStreamResource
+from mindor.core.foundation.streaming.video import VideoStreamResource
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from PIL import Image as PILImage
 
 
 @pytest.fixture
@@ -351,3 +361,152 @@ class TestWebSocketManagerDispose:
         assert not manager.has_connection("c1")
         assert not manager.has_connection("c2")
         assert not manager.has_task_subscribers("task-1")
+
+
+class TestWebSocketManagerRelays:
+    @pytest.mark.anyio
+    async def test_relay_receives_broadcast_messages(self):
+        manager = WebSocketManager()
+        queue = manager.add_task_relay("task-1")
+        assert manager.has_task_subscribers("task-1")
+
+        message = WebSocketMessage(type="task_state", data={"status": "processing"})
+        await manager.broadcast_task_message("task-1", message)
+        assert queue.get_nowait() is message
+
+    @pytest.mark.anyio
+    async def test_remove_relay_clears_entry(self):
+        manager = WebSocketManager()
+        queue = manager.add_task_relay("task-1")
+        manager.remove_task_relay("task-1", queue)
+        assert not manager.has_task_subscribers("task-1")
+
+    @pytest.mark.anyio
+    async def test_broadcast_task_text_sends_preserialized_payload(self):
+        manager = WebSocketManager()
+        ws = make_websocket()
+        await manager.accept("client-1", ws)
+        manager.subscribe_task("client-1", "task-1")
+        await manager.broadcast_task_text("task-1", '{"type":"task_event"}')
+        ws.send_text.assert_awaited_once_with('{"type":"task_event"}')
+
+
+class TestStreamResourceRendering:
+    @pytest.fixture
+    def adapter(self):
+        config = HttpServerControllerAdapterConfig(type=ControllerAdapterType.HTTP_SERVER)
+        return HttpServerControllerAdapterService(config, MagicMock(), daemon=False)
+
+    def _client(self, adapter, make_resource):
+        async def endpoint(request):
+            return adapter._render_stream_resource(make_resource())
+
+        return TestClient(Starlette(routes=[ Route("/output", endpoint) ]))
+
+    def test_file_output_is_served_with_range_support(self, adapter, tmp_path):
+        path = tmp_path / "clip.mp4"
+        path.write_bytes(bytes(range(256)) * 16)
+
+        with self._client(adapter, lambda: VideoStreamResource(FileStreamResource(str(path)), format="mp4")) as client:
+            response = client.get("/output", headers={ "Range": "bytes=10-19" })
+
+        assert response.status_code == 206
+        assert response.content == bytes(range(10, 20))
+        assert response.headers["content-type"] == "video/mp4"
+        assert response.headers["content-range"] == "bytes 10-19/4096"
+
+    def test_auto_delete_file_is_removed_after_response(self, adapter, tmp_path):
+        path = tmp_path / "output.bin"
+        path.write_bytes(b"payload")
+
+        with self._client(adapter, lambda: FileStreamResource(str(path), auto_delete=True)) as client:
+            response = client.get("/output")
+
+        assert response.content == b"payload"
+        assert response.headers["content-disposition"] == 'attachment; filename="output.bin"'
+        assert not path.exists()
+
+    def test_task_output_file_reports_completion(self, adapter, tmp_path):
+        path = tmp_path / "output.bin"
+        path.write_bytes(b"payload")
+        on_terminated = AsyncMock()
+
+        with self._client(adapter, lambda: TaskOutputStreamResource(FileStreamResource(str(path)), on_terminated)) as client:
+            response = client.get("/output")
+
+        assert response.content == b"payload"
+        on_terminated.assert_awaited_once_with("completed", None)
+
+    def test_in_memory_output_is_streamed(self, adapter):
+        with self._client(adapter, lambda: BytesStreamResource(b"abc")) as client:
+            response = client.get("/output", headers={ "Range": "bytes=0-0" })
+
+        assert response.status_code == 200
+        assert response.content == b"abc"
+
+
+class TestImageFormatNegotiation:
+    @pytest.fixture
+    def adapter(self):
+        config = HttpServerControllerAdapterConfig(type=ControllerAdapterType.HTTP_SERVER)
+        return HttpServerControllerAdapterService(config, MagicMock(), daemon=False)
+
+    @pytest.mark.parametrize("accept,expected", [
+        (None, "png"),
+        ("*/*", "png"),
+        ("image/avif,image/webp,image/apng,*/*;q=0.8", "webp"),
+        ("image/jpeg;q=0.5, image/png;q=0.9", "png"),
+        ("image/webp;q=0, image/jpeg", "jpeg"),
+        ("application/json", "png"),
+    ])
+    def test_preferred_format(self, adapter, accept, expected):
+        assert adapter._negotiate_image_format(accept, PILImage.new("RGB", (1, 1))) == expected
+
+    def test_jpeg_skipped_for_alpha_images(self, adapter):
+        assert adapter._negotiate_image_format("image/jpeg", PILImage.new("RGBA", (1, 1))) == "png"
+
+
+class TestEventStreamCoalescing:
+    def _make_adapter(self, **kwargs):
+        config = HttpServerControllerAdapterConfig(type=ControllerAdapterType.HTTP_SERVER, **kwargs)
+        return HttpServerControllerAdapterService(config, MagicMock(), daemon=False)
+
+    async def _stream_writes(self, adapter, coalesce):
+        async def chunks():
+            for chunk in [ "a", "b", "c" ]:
+                yield chunk
+
+        response = adapter._render_stream_output(StreamEncodingIterator(chunks()), coalesce)
+        writes = []
+
+        async def receive():
+            await asyncio.sleep(10)
+            return { "type": "http.disconnect" }
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                writes.append(message["body"])
+
+        await response({ "type": "http", "asgi": { "spec_version": "2.4" } }, receive, send)
+
+        assert response.media_type == "text/event-stream"
+        assert b"".join(writes) == b"data: a\n\ndata: b\n\ndata: c\n\n"
+        return writes
+
+    @pytest.mark.anyio
+    async def test_events_are_written_one_by_one_by_default(self):
+        assert len(await self._stream_writes(self._make_adapter(), None)) == 3
+
+    @pytest.mark.anyio
+    async def test_configured_coalescing_merges_events(self):
+        adapter = self._make_adapter(stream_coalescing={ "max_delay": "50ms" })
+        assert len(await self._stream_writes(adapter, None)) == 1
+
+    @pytest.mark.anyio
+    async def test_request_can_turn_coalescing_off(self):
+        adapter = self._make_adapter(stream_coalescing=True)
+        assert len(await self._stream_writes(adapter, False)) == 3
+
+    @pytest.mark.anyio
+    async def test_request_can_turn_coalescing_on(self):
+        assert len(await self._stream_writes(self._make_adapter(), True)) == 1
@@ -177,7 +177,7 @@ class TestConvertOutputValueNonMedia:
             type=WorkflowVariableType.OBJECT, subtype=None, format=None,
         ))
         assert isinstance(block, TextContent)
-        assert block.text == '{"k": "v"}'
+        assert json.loads(block.text) == {"k": "v"}
 
     def test_scalar_stringified(self, adapter):
         block = _run(adapter._convert_output_value(
@@ -0,0 +1,139 @@
+"""Tests for the SQLite queue store and the local-directory blob client."""
+
+import os
+import time
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from mindor.core.controller.queue.serialize import serialize_input, deserialize_input
+from mindor.core.controller.queue.errors import BlobNotFoundError
+from mindor.core.controller.queue.store import SqliteQueueStore, FileBlobClient
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def store(tmp_path):
+    pytest.importorskip("aiosqlite")
+    store = SqliteQueueStore(str(tmp_path / "queue.sqlite"))
+    await store.open()
+    yield store
+    await store.close()
+
+
+class TestFileBlobClient:
+    @pytest.mark.anyio
+    async def test_serialize_round_trip_consumes_blob(self, tmp_path):
+        blobs = FileBlobClient(str(tmp_path / "blobs"))
+        blobs.ensure_directory()
+
+        serialized, keys = await serialize_input({ "data": b"payload" }, blobs, "q:wf:run:blob:", ttl_seconds=60, max_blob_size=None)
+        assert len(keys) == 1
+        assert len(os.listdir(blobs.directory)) == 1
+
+        restored = await deserialize_input(serialized, blobs, "q:wf:run:blob:")
+        assert isinstance(restored["data"], UploadFile)
+        assert await restored["data"].read() == b"payload"
+        assert os.listdir(blobs.directory) == []
+
+    @pytest.mark.anyio
+    async def test_expired_blob_is_missing_and_purged(self, tmp_path):
+        blobs = FileBlobClient(str(tmp_path / "blobs"))
+        blobs.ensure_directory()
+
+        serialized, _ = await serialize_input({ "data": b"payload" }, blobs, "p:", ttl_seconds=0, max_blob_size=None)
+        time.sleep(0.01)
+
+        with pytest.raises(BlobNotFoundError):
+            await deserialize_input(serialized, blobs, "p:")
+
+        await blobs.setex("other", 0, b"x")
+        time.sleep(0.01)
+        await blobs.purge()
+        assert os.listdir(blobs.directory) == []
+
+
+class TestSqliteQueueStore:
+    @pytest.mark.anyio
+    async def test_claim_is_fifo_and_exclusive(self, store):
+        for index in range(5):
+            await store.push("q:a", f"m{index}")
+
+        first = await store.claim(["q:a"], "w1", 3, stale_before=0)
+        second = await store.claim(["q:a"], "w2", 3, stale_before=0)
+
+        assert [ message for _, _, message, _ in first ] == ["m0", "m1", "m2"]
+        assert [ message for _, _, message, _ in second ] == ["m3", "m4"]
+
+    @pytest.mark.anyio
+    async def test_stale_claims_are_reclaimed_unless_touched(self, store):
+        await store.push("q:a", "m0")
+        await store.push("q:a", "m1")
+        claimed = await store.claim(["q:a"], "w1", 2, stale_before=0)
+
+        time.sleep(0.02)
+        stale_before = time.time()
+        await store.touch([ claimed[0][0] ], "w1")
+        reclaimed = await store.claim(["q:a"], "w2", 2, stale_before=stale_before)
+
+        assert [ message for _, _, message, _ in reclaimed ] == ["m1"]
+
+    @pytest.mark.anyio
+    async def test_ack_removes_task(self, store):
+        await store.push("q:a", "m0")
+        (entry_id, _, _, _), = await store.claim(["q:a"], "w1", 1, stale_before=0)
+        await store.ack(entry_id)
+
+        assert await store.claim(["q:a"], "w2", 1, stale_before=time.time() + 1) == []
+
+    @pytest.mark.anyio
+    async def test_every_claim_counts_a_delivery(self, store):
+        await store.push("q:a", "m0")
+
+        first = await store.claim(["q:a"], "w1", 1, stale_before=0)
+        second = await store.claim(["q:a"], "w2", 1, stale_before=time.time() + 1)
+
+        assert [ deliveries for _, _, _, deliveries in first + second ] == [1, 2]
+
+    @pytest.mark.anyio
+    async def test_bury_moves_task_to_dead_tasks(self, store):
+        await store.push("q:a", "m0")
+        (entry_id, _, _, _), = await store.claim(["q:a"], "w1", 1, stale_before=0)
+        await store.bury(entry_id, "too many deliveries")
+
+        assert await store.claim(["q:a"], "w2", 1, stale_before=time.time() + 1) == []
+        async with store.connection.execute("SELECT queue, message, deliveries, error FROM queue_dead_tasks") as cursor:
+            assert list(await cursor.fetchall()) == [("q:a", "m0", 1, "too many deliveries")]
+
+    @pytest.mark.anyio
+    async def test_open_adds_deliveries_to_existing_database(self, tmp_path):
+        aiosqlite = pytest.importorskip("aiosqlite")
+        path = str(tmp_path / "old.sqlite")
+        async with aiosqlite.connect(path) as connection:
+            await connection.execute("CREATE TABLE queue_tasks (id INTEGER PRIMARY KEY AUTOINCREMENT, queue TEXT NOT NULL, message TEXT NOT NULL, owner TEXT, claimed_at REAL)")
+            await connection.execute("INSERT INTO queue_tasks (queue, message) VALUES ('q:a', 'm0')")
+            await connection.commit()
+
+        store = SqliteQueueStore(path)
+        await store.open()
+        try:
+            assert [ deliveries for _, _, _, deliveries in await store.claim(["q:a"], "w1", 1, stale_before=0) ] == [1]
+        finally:
+            await store.close()
+
+    @pytest.mark.anyio
+    async def test_pop_and_fetch_channels(self, store):
+        last_id = await store.get_last_message_id()
+        await store.publish("results", "r1")
+        await store.publish("results", "r2")
+        await store.publish("cancel", "c1")
+
+        assert await store.pop("results") == ["r1"]
+        assert await store.pop("results", count=10) == ["r2"]
+        assert await store.pop("results") == []
+        assert [ data for _, data in await store.fetch("cancel", last_id) ] == ["c1"]
+        assert [ data for _, data in await store.fetch("cancel", last_id) ] == ["c1"]
@@ -0,0 +1,196 @@
+"""Tests for ``ComponentStartupScheduler`` ordering, limits and readiness."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from mindor.core.controller.startup import ComponentStartupScheduler, ComponentStartupStatus
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class FakeComponent:
+    def __init__(self, id, tracker, depends_on=(), ram=None, vram=None, delay=0.02, error=None):
+        runtime_spec = SimpleNamespace(ram=ram, vram=vram) if ram or vram else None
+        self.id = id
+        self.config = SimpleNamespace(depends_on=list(depends_on), runtime_spec=runtime_spec, preload=True)
+        self.started = False
+        self.tracker = tracker
+        self.delay = delay
+        self.error = error
+
+    async def start(self):
+        self.tracker.enter(self.id)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.error:
+                raise RuntimeError(self.error)
+            self.started = True
+        finally:
+            self.tracker.exit(self.id)
+
+
+class Tracker:
+    def __init__(self):
+        self.running = set()
+        self.peak = 0
+        self.order = []
+        self.overlaps = []
+
+    def enter(self, id):
+        self.overlaps.append((id, set(self.running)))
+        self.running.add(id)
+        self.order.append(id)
+        self.peak = max(self.peak, len(self.running))
+
+    def exit(self, id):
+        self.running.discard(id)
+
+
+class TestConcurrency:
+    @pytest.mark.anyio
+    async def test_components_start_concurrently(self):
+        tracker = Tracker()
+        components = [ FakeComponent(f"c{index}", tracker) for index in range(4) ]
+
+        await ComponentStartupScheduler(components).run()
+
+        assert tracker.peak == 4
+        assert all(component.started for component in components)
+
+    @pytest.mark.anyio
+    async def test_max_concurrent_count_is_respected(self):
+        tracker = Tracker()
+        components = [ FakeComponent(f"c{index}", tracker) for index in range(5) ]
+
+        await ComponentStartupScheduler(components, max_concurrent_count=2).run()
+
+        assert tracker.peak == 2
+        assert all(component.started for component in components)
+
+    @pytest.mark.anyio
+    async def test_ram_budget_limits_overlap(self):
+        tracker = Tracker()
+        components = [ FakeComponent("a", tracker, ram=6000), FakeComponent("b", tracker, ram=6000), FakeComponent("c", tracker, ram=2000) ]
+
+        await ComponentStartupScheduler(components, ram_budget=8000).run()
+
+        assert ("b", { "a" }) not in tracker.overlaps
+        assert tracker.peak == 2
+
+    @pytest.mark.anyio
+    async def test_component_over_budget_starts_alone(self):
+        tracker = Tracker()
+        components = [ FakeComponent("big", tracker, vram=30000), FakeComponent("small", tracker, vram=1000) ]
+
+        await ComponentStartupScheduler(components, vram_budget=24000).run()
+
+        assert tracker.peak == 1
+        assert all(component.started for component in components)
+
+
+class TestDependencies:
+    @pytest.mark.anyio
+    async def test_dependencies_start_first(self):
+        tracker = Tracker()
+        components = [
+            FakeComponent("app", tracker, depends_on=[ "db", "cache" ]),
+            FakeComponent("db", tracker),
+            FakeComponent("cache", tracker),
+        ]
+
+        await ComponentStartupScheduler(components).run()
+
+        assert tracker.order[-1] == "app"
+        assert ("app", set()) in tracker.overlaps
+
+    @pytest.mark.anyio
+    async def test_failure_skips_dependents_and_raises(self):
+        tracker = Tracker()
+        components = [
+            FakeComponent("db", tracker, error="boom"),
+            FakeComponent("app", tracker, depends_on=[ "db" ]),
+            FakeComponent("other", tracker),
+        ]
+        scheduler = ComponentStartupScheduler(components)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await scheduler.run()
+
+        assert "app" not in tracker.order
+        assert scheduler.states["other"].status == ComponentStartupStatus.READY
+        assert scheduler.states["app"].status == ComponentStartupStatus.FAILED
+        assert scheduler.states["app"].error == "Dependency 'db' failed to start"
+        assert scheduler.is_complete
+
+    @pytest.mark.anyio
+    async def test_unknown_dependency_is_rejected(self):
+        scheduler = ComponentStartupScheduler([ FakeComponent("app", Tracker(), depends_on=[ "ghost" ]) ])
+
+        with pytest.raises(ValueError, match="non-existent component 'ghost'"):
+            await scheduler.run()
+
+    @pytest.mark.anyio
+    async def test_dependency_cycle_is_rejected(self):
+        tracker = Tracker()
+        scheduler = ComponentStartupScheduler([ FakeComponent("a", tracker, depends_on=[ "b" ]), FakeComponent("b", tracker, depends_on=[ "a" ]) ])
+
+        with pytest.raises(ValueError, match="Dependency cycle"):
+            await scheduler.run()
+
+
+class TestReadiness:
+    @pytest.mark.anyio
+    async def test_readiness_is_reported_per_component(self):
+        tracker = Tracker()
+        scheduler = ComponentStartupScheduler([ FakeComponent("fast", tracker, delay=0.0), FakeComponent("slow", tracker, delay=0.2) ])
+
+        run = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.05)
+
+        assert scheduler.is_ready("fast")
+        assert not scheduler.is_ready("slow")
+        assert not scheduler.is_complete
+        assert scheduler.get_stats()["slow"]["status"] == "starting"
+
+        await run
+
+        stats = scheduler.get_stats()
+        assert stats["slow"]["status"] == "ready"
+        assert stats["slow"]["elapsed"] >= 0.2
+        assert scheduler.is_complete
+
+
+class TestWorkflowAdmission:
+    """``ControllerService.run_workflow`` checks the scheduler before accepting a workflow."""
+
+    def _make_controller(self, scheduler, component_ids):
+        return SimpleNamespace(
+            _shutting_down=False,
+            _component_startup=scheduler,
+            _get_workflow_component_ids=lambda workflow_id: component_ids,
+        )
+
+    @pytest.mark.anyio
+    async def test_workflow_with_failed_component_is_rejected_after_startup(self):
+        from mindor.core.controller.base import ControllerService
+        from mindor.core.errors import NotReadyError
+
+        tracker = Tracker()
+        scheduler = ComponentStartupScheduler([ FakeComponent("ok", tracker), FakeComponent("broken", tracker, error="boom") ])
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await scheduler.run()
+
+        assert scheduler.is_complete
+        controller = self._make_controller(scheduler, [ "ok", "broken" ])
+
+        with pytest.raises(NotReadyError, match="failed to start: broken"):
+            await ControllerService.run_workflow(controller, "wf", {})
+
+        assert ControllerService.is_degraded.fget(controller)
+        assert not ControllerService.is_starting.fget(controller)
@@ -0,0 +1,82 @@
+"""Tests for the controller worker identity and shared-socket helpers."""
+
+import os
+import socket
+from contextlib import closing
+
+import pytest
+
+from mindor.core.controller.workers import (
+    ControllerWorkerContext,
+    create_shared_socket,
+    create_unix_socket,
+)
+
+
+@pytest.fixture
+def context(tmp_path) -> ControllerWorkerContext:
+    return ControllerWorkerContext(index=1, count=3, runtime_dir=str(tmp_path), token="secret")
+
+
+class TestTaskOwnership:
+    def test_generated_task_id_is_owned_by_worker(self, context):
+        task_id = context.generate_task_id()
+        assert task_id.endswith("-w1")
+        assert context.get_task_owner(task_id) == 1
+        assert context.is_remote_task(task_id) is False
+
+    def test_task_of_other_worker_is_remote(self, context):
+        assert context.get_task_owner("01J0000000000000000000000-w2") == 2
+        assert context.is_remote_task("01J0000000000000000000000-w2") is True
+
+    def test_plain_task_id_has_no_owner(self, context):
+        assert context.get_task_owner("01J0000000000000000000000") is None
+        assert context.is_remote_task("01J0000000000000000000000") is False
+
+    def test_out_of_range_owner_is_ignored(self, context):
+        assert context.get_task_owner("01J0000000000000000000000-w7") is None
+
+
+class TestEnvironment:
+    def test_from_env_without_worker_vars_returns_none(self, monkeypatch):
+        monkeypatch.delenv("MINDOR_WORKER_INDEX", raising=False)
+        assert ControllerWorkerContext.from_env() is None
+
+    def test_env_round_trip(self, monkeypatch):
+        primary = ControllerWorkerContext.create(4)
+        try:
+            for key, value in primary.get_env(2).items():
+                monkeypatch.setenv(key, value)
+
+            replica = ControllerWorkerContext.from_env()
+            assert replica.index == 2
+            assert replica.count == 4
+            assert replica.runtime_dir == primary.runtime_dir
+            assert replica.token == primary.token
+            assert replica.parent_pid == os.getpid()
+            assert replica.is_primary is False
+            assert replica.get_socket_path(0) == primary.get_socket_path()
+        finally:
+            primary.dispose()
+
+        assert not os.path.exists(primary.runtime_dir)
+
+    def test_replica_dispose_keeps_runtime_dir(self, context):
+        context.dispose()
+        assert os.path.isdir(context.runtime_dir)
+
+
+@pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT not available")
+class TestSockets:
+    def test_shared_sockets_bind_same_port(self):
+        with closing(create_shared_socket("127.0.0.1", 0)) as first:
+            port = first.getsockname()[1]
+            with closing(create_shared_socket("127.0.0.1", port)) as second:
+                assert second.getsockname()[1] == port
+
+    def test_unix_socket_replaces_stale_file(self, context):
+        path = context.get_socket_path()
+        open(path, "w").close()
+
+        with closing(create_unix_socket(path)) as sock:
+            assert sock.getsockname() == path
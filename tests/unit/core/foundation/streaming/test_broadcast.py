@@ -0,0 +1,199 @@
+"""Tests for ``mindor.core.foundation.streaming.broadcast``."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from mindor.core.foundation.streaming.broadcast import BroadcastStreamIterator, StreamBroadcast
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class CountingSource:
+    """Async source that records how far it has been pulled and whether it was closed."""
+    def __init__(self, count: int, fail_at: int = -1):
+        self.count = count
+        self.fail_at = fail_at
+        self.pulled = 0
+        self.closed = False
+
+    async def _generate(self):
+        try:
+            for index in range(self.count):
+                if index == self.fail_at:
+                    raise RuntimeError("source failed")
+                self.pulled += 1
+                yield index
+        finally:
+            self.closed = True
+
+    def __aiter__(self):
+        return self._generate()
+
+
+async def collect(iterator) -> List[Any]:
+    return [ item async for item in iterator ]
+
+
+class TestDelivery:
+    @pytest.mark.anyio
+    async def test_every_consumer_sees_every_item(self):
+        source = CountingSource(50)
+        broadcast = StreamBroadcast(source, consumer_count=3, max_buffer_size=4)
+
+        results = await asyncio.gather(*[ collect(broadcast.subscribe()) for _ in range(3) ])
+
+        assert results == [ list(range(50)) ] * 3
+        assert source.pulled == 50
+
+    @pytest.mark.anyio
+    async def test_sequential_drain_within_buffer(self):
+        broadcast = StreamBroadcast(CountingSource(5), consumer_count=2, max_buffer_size=8)
+        first, second = broadcast.subscribe(), broadcast.subscribe()
+
+        assert await collect(first) == list(range(5))
+        assert await collect(second) == list(range(5))
+        assert broadcast.buffered_count == 0
+
+    @pytest.mark.anyio
+    async def test_reserved_consumer_joining_late_sees_all_items(self):
+        broadcast = StreamBroadcast(CountingSource(3), consumer_count=2)
+
+        assert await collect(broadcast.subscribe()) == [ 0, 1, 2 ]
+        assert await collect(broadcast.subscribe()) == [ 0, 1, 2 ]
+
+    @pytest.mark.anyio
+    async def test_iterator_subscribes_on_each_iteration(self):
+        iterator = BroadcastStreamIterator(StreamBroadcast(CountingSource(3), consumer_count=2))
+
+        assert await collect(iterator) == [ 0, 1, 2 ]
+        assert await collect(iterator) == [ 0, 1, 2 ]
+
+
+class TestBackPressure:
+    @pytest.mark.anyio
+    async def test_fast_consumer_pauses_at_high_water_mark(self):
+        source = CountingSource(100)
+        broadcast = StreamBroadcast(source, consumer_count=2, max_buffer_size=8)
+        fast, slow = broadcast.subscribe(), broadcast.subscribe()
+
+        received: List[int] = []
+
+        async def _drain_fast():
+            async for item in fast:
+                received.append(item)
+
+        task = asyncio.create_task(_drain_fast())
+        await asyncio.sleep(0.05)
+
+        assert received == list(range(8))
+        assert source.pulled == 8
+        assert broadcast.buffered_count == 8
+
+        assert await slow.__anext__() == 0
+        await asyncio.sleep(0.05)
+
+        assert received == list(range(9))
+        assert broadcast.buffered_count == 8
+
+        assert await collect(slow) == list(range(1, 100))
+        await task
+        assert received == list(range(100))
+
+
+    @pytest.mark.anyio
+    async def test_unsubscribed_reservations_do_not_pause_when_limiting_subscribed_only(self):
+        broadcast = StreamBroadcast(CountingSource(100), consumer_count=2, max_buffer_size=8, limit_subscribed_only=True)
+
+        assert await asyncio.wait_for(collect(broadcast.subscribe()), 1.0) == list(range(100))
+        assert broadcast.buffered_count == 100
+        assert await collect(broadcast.subscribe()) == list(range(100))
+        assert broadcast.buffered_count == 0
+
+    @pytest.mark.anyio
+    async def test_subscribed_consumers_still_pause_when_limiting_subscribed_only(self):
+        source = CountingSource(100)
+        broadcast = StreamBroadcast(source, consumer_count=2, max_buffer_size=8, limit_subscribed_only=True)
+        fast, slow = broadcast.subscribe(), broadcast.subscribe()
+
+        assert await slow.__anext__() == 0
+        received = asyncio.create_task(collect(fast))
+        await asyncio.sleep(0.05)
+
+        assert source.pulled == 9
+        assert not received.done()
+
+        assert await collect(slow) == list(range(1, 100))
+        assert await received == list(range(100))
+
+
+class TestReservations:
+    @pytest.mark.anyio
+    async def test_release_unblocks_reader_past_buffer_size(self):
+        broadcast = StreamBroadcast(CountingSource(3000), reservations={ "reader": 1, "skipped": 1 })
+        reader = asyncio.create_task(collect(broadcast.subscribe("reader")))
+        await asyncio.sleep(0.05)
+
+        assert not reader.done()
+        assert broadcast.buffered_count == 1024
+
+        await broadcast.release("skipped")
+
+        assert await asyncio.wait_for(reader, 1.0) == list(range(3000))
+
+    @pytest.mark.anyio
+    async def test_owner_subscription_takes_its_own_slot(self):
+        broadcast = StreamBroadcast(CountingSource(3), reservations={ "a": 1, "b": 1 })
+
+        assert await collect(broadcast.subscribe("a")) == [ 0, 1, 2 ]
+        await broadcast.release("a")
+        assert broadcast.reserved_count == 1
+        assert await collect(BroadcastStreamIterator(broadcast).bind("b")) == [ 0, 1, 2 ]
+
+    @pytest.mark.anyio
+    async def test_releasing_last_reservation_closes_abandoned_source(self):
+        source = CountingSource(100)
+        broadcast = StreamBroadcast(source, reservations={ "a": 1, "b": 1 })
+        first = broadcast.subscribe("a")
+
+        assert await first.__anext__() == 0
+        await first.aclose()
+        assert source.closed is False
+
+        await broadcast.release("b")
+        assert source.closed is True
+
+
+class TestTermination:
+    @pytest.mark.anyio
+    async def test_source_error_reaches_every_consumer(self):
+        broadcast = StreamBroadcast(CountingSource(10, fail_at=3), consumer_count=2)
+
+        results = await asyncio.gather(
+            collect(broadcast.subscribe()),
+            collect(broadcast.subscribe()),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.anyio
+    async def test_source_closed_when_all_consumers_leave(self):
+        source = CountingSource(100)
+        broadcast = StreamBroadcast(source, consumer_count=2)
+        first, second = broadcast.subscribe(), broadcast.subscribe()
+
+        assert await first.__anext__() == 0
+        assert await second.__anext__() == 0
+        await first.aclose()
+        assert source.closed is False
+
+        await second.aclose()
+        assert source.closed is True
+        assert source.pulled == 1
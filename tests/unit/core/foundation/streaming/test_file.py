@@ -0,0 +1,60 @@
+"""Tests for ``mindor.core.foundation.streaming.file.FileStreamResource``."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from mindor.core.foundation.streaming.audio import AudioStreamResource
+from mindor.core.foundation.streaming.bytes import BytesStreamResource
+from mindor.core.foundation.streaming.file import FileStreamResource
+from mindor.core.foundation.streaming.resources import ChunkedStreamResource, read_stream_to_bytes
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _write(path, size: int) -> str:
+    path.write_bytes(os.urandom(size))
+    return str(path)
+
+
+class TestChunkSize:
+    def test_small_file_uses_minimum_chunk(self, tmp_path):
+        assert FileStreamResource(_write(tmp_path / "a.bin", 100)).chunk_size == 8192
+
+    def test_medium_file_is_read_in_one_chunk(self, tmp_path):
+        assert FileStreamResource(_write(tmp_path / "a.bin", 300_000)).chunk_size == 300_000
+
+    def test_large_file_chunk_is_capped(self, tmp_path):
+        assert FileStreamResource(_write(tmp_path / "a.bin", 3 * 1024 * 1024)).chunk_size == 1024 * 1024
+
+    def test_explicit_chunk_size_is_kept(self, tmp_path):
+        assert FileStreamResource(_write(tmp_path / "a.bin", 300_000), chunk_size=4096).chunk_size == 4096
+
+    @pytest.mark.anyio
+    async def test_content_is_unchanged(self, tmp_path):
+        path = _write(tmp_path / "a.bin", 2 * 1024 * 1024 + 17)
+        with open(path, "rb") as f:
+            expected = f.read()
+
+        assert await read_stream_to_bytes(FileStreamResource(path)) == expected
+
+
+class TestLocalPath:
+    def test_file_resource_exposes_path(self, tmp_path):
+        path = _write(tmp_path / "a.bin", 10)
+        assert FileStreamResource(path).get_local_path() == path
+
+    def test_wrappers_delegate_to_source(self, tmp_path):
+        path = _write(tmp_path / "a.mp3", 10)
+        resource = AudioStreamResource(FileStreamResource(path), format="mp3")
+
+        assert resource.get_local_path() == path
+        assert ChunkedStreamResource(resource, 4).get_local_path() == path
+
+    def test_in_memory_resource_has_no_path(self):
+        assert BytesStreamResource(b"abc").get_local_path() is None
@@ -0,0 +1,139 @@
+"""Tests for image encoding memoisation and raw image transport in
+``mindor.core.foundation.streaming.image``."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+from PIL import Image as PILImage
+
+from mindor.core.foundation.streaming import image as image_module
+from mindor.core.foundation.streaming.bytes import BytesStreamResource
+from mindor.core.foundation.streaming.image import (
+    FAST_PNG_COMPRESS_LEVEL,
+    ImageStreamResource,
+    RawImageStreamResource,
+    encode_image,
+    get_raw_image_attrs,
+    load_image_from_stream,
+)
+from mindor.core.foundation.streaming.resources import read_stream_to_bytes
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def save_calls(monkeypatch):
+    calls = []
+    original = image_module._save_image
+
+    def _counting_save(*args, **kwargs):
+        calls.append(args[1:])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(image_module, "_save_image", _counting_save)
+    return calls
+
+
+def _gradient(mode: str = "RGB") -> PILImage.Image:
+    image = PILImage.linear_gradient("L").resize((64, 48))
+    return image.convert(mode)
+
+
+class TestEncodeImage:
+    def test_same_settings_encode_once(self, save_calls):
+        image = _gradient()
+
+        first = encode_image(image, "png")
+        second = encode_image(image, "png")
+
+        assert first is second
+        assert len(save_calls) == 1
+
+    def test_settings_are_cached_separately(self, save_calls):
+        image = _gradient()
+
+        encode_image(image, "png")
+        encode_image(image, "png", compress_level=FAST_PNG_COMPRESS_LEVEL)
+        encode_image(image, "webp", quality=80)
+
+        assert save_calls == [ ("PNG", None, None), ("PNG", None, FAST_PNG_COMPRESS_LEVEL), ("WEBP", 80, None) ]
+
+    def test_jpeg_of_image_with_alpha_is_flattened(self):
+        data = encode_image(_gradient("RGBA"), "jpeg")
+        assert PILImage.open(io.BytesIO(data)).mode == "RGB"
+
+    def test_image_modified_in_place_is_encoded_again(self, save_calls):
+        image = _gradient()
+
+        first = encode_image(image, "png")
+        image.putpixel((0, 0), (255, 0, 0))
+        second = encode_image(image, "png")
+
+        assert first != second
+        assert PILImage.open(io.BytesIO(second)).getpixel((0, 0)) == (255, 0, 0)
+        assert len(save_calls) == 2
+
+    def test_raw_is_pixel_buffer(self, save_calls):
+        image = _gradient("RGBA")
+        assert encode_image(image, "raw") == image.tobytes()
+        assert save_calls == []
+
+    def test_raw_is_not_memoised(self):
+        image = _gradient()
+
+        encode_image(image, "raw")
+        image.putpixel((0, 0), (255, 0, 0))
+
+        assert encode_image(image, "raw") == image.tobytes()
+        assert not hasattr(image, image_module._ENCODED_CACHE_ATTR)
+
+
+class TestImageStreamResource:
+    @pytest.mark.anyio
+    async def test_resources_share_encoding(self, save_calls):
+        image = _gradient()
+
+        first = await read_stream_to_bytes(ImageStreamResource(image))
+        resource = ImageStreamResource(image)
+
+        assert resource.size == len(first)
+        assert await read_stream_to_bytes(resource) == first
+        assert len(save_calls) == 1
+
+    @pytest.mark.anyio
+    async def test_resource_of_modified_image_is_encoded_again(self, save_calls):
+        image = _gradient()
+
+        await read_stream_to_bytes(ImageStreamResource(image))
+        image.putpixel((0, 0), (255, 0, 0))
+        data = await read_stream_to_bytes(ImageStreamResource(image))
+
+        assert PILImage.open(io.BytesIO(data)).getpixel((0, 0)) == (255, 0, 0)
+        assert len(save_calls) == 2
+
+    @pytest.mark.anyio
+    async def test_raw_round_trip(self):
+        image = _gradient("RGBA")
+        sent = ImageStreamResource(image, "raw")
+        assert sent.content_type == "image/x-raw"
+
+        received = RawImageStreamResource(BytesStreamResource(await read_stream_to_bytes(sent)), attrs=sent.attrs)
+        restored = await load_image_from_stream(received)
+
+        assert get_raw_image_attrs(restored) == get_raw_image_attrs(image)
+        assert restored.tobytes() == image.tobytes()
+
+    @pytest.mark.anyio
+    async def test_raw_resource_iterates_as_png(self):
+        image = _gradient()
+        received = RawImageStreamResource(BytesStreamResource(image.tobytes()), attrs=get_raw_image_attrs(image))
+
+        assert received.content_type == "image/png"
+        decoded = PILImage.open(io.BytesIO(await read_stream_to_bytes(received)))
+        assert decoded.format == "PNG"
+        assert decoded.tobytes() == image.tobytes()
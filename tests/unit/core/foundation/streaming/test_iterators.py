@@ -0,0 +1,158 @@
+"""Tests for termination callbacks registered on ``StreamIterator``."""
+
+import asyncio
+
+import pytest
+
+from mindor.core.foundation.streaming.iterators import (
+    StreamChunkIterator,
+    StreamEncodingFormat,
+    StreamEncodingIterator,
+    attach_terminated_callback,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+async def make_iterator(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def recorder(events: list, name: str):
+    async def _on_terminated(event, error):
+        events.append((name, event, error))
+    return _on_terminated
+
+
+class TestAttachTerminatedCallback:
+    def test_stream_iterator_carries_callbacks_itself(self):
+        stream = StreamEncodingIterator(make_iterator([ "a" ]), StreamEncodingFormat.TEXT)
+
+        first = attach_terminated_callback(stream, recorder([], "component"))
+        second = attach_terminated_callback(first, recorder([], "task"))
+
+        assert first is stream
+        assert second is stream
+
+    def test_plain_async_iterator_is_wrapped_once(self):
+        wrapped = attach_terminated_callback(make_iterator([ "a" ]), recorder([], "component"))
+
+        assert isinstance(wrapped, StreamChunkIterator)
+        assert attach_terminated_callback(wrapped, recorder([], "job")) is wrapped
+
+    @pytest.mark.anyio
+    async def test_stream_being_iterated_is_wrapped(self):
+        events = []
+        stream = attach_terminated_callback(make_iterator([ "a", "b" ]), recorder(events, "inner"))
+        iterator = stream.__aiter__()
+        assert await iterator.__anext__() == "a"
+
+        outer = attach_terminated_callback(stream, recorder(events, "outer"))
+
+        assert outer is not stream
+        assert [ chunk async for chunk in outer ] == [ "b" ]
+        assert events == [ ("inner", "completed", None), ("outer", "completed", None) ]
+
+
+class TestTerminationEvents:
+    @pytest.mark.anyio
+    async def test_callbacks_fire_in_registration_order_on_completion(self):
+        events = []
+        stream = make_iterator([ 1, 2 ])
+        for name in ("component", "job", "task"):
+            stream = attach_terminated_callback(stream, recorder(events, name))
+
+        assert [ chunk async for chunk in stream ] == [ 1, 2 ]
+        assert events == [ ("component", "completed", None), ("job", "completed", None), ("task", "completed", None) ]
+
+    @pytest.mark.anyio
+    async def test_failure_is_reported_and_raised(self):
+        async def failing():
+            yield 1
+            raise ValueError("boom")
+
+        events = []
+        stream = attach_terminated_callback(failing(), recorder(events, "task"))
+
+        with pytest.raises(ValueError):
+            async for _ in stream:
+                pass
+
+        assert events == [ ("task", "failed", "boom") ]
+
+    @pytest.mark.anyio
+    async def test_aclose_before_iteration_reports_cancelled(self):
+        closed = []
+
+        async def source():
+            try:
+                yield 1
+            finally:
+                closed.append(True)
+
+        events = []
+        generator = source()
+        await generator.__anext__()
+        stream = attach_terminated_callback(StreamChunkIterator(generator), recorder(events, "task"))
+
+        await stream.aclose()
+
+        assert closed == [ True ]
+        assert events == [ ("task", "cancelled", "consumer closed stream") ]
+
+    @pytest.mark.anyio
+    async def test_aclose_during_iteration_reports_cancelled_once(self):
+        events = []
+        stream = attach_terminated_callback(make_iterator([ 1, 2, 3 ]), recorder(events, "task"))
+
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        assert events == [ ("task", "cancelled", "consumer closed stream") ]
+
+    @pytest.mark.anyio
+    async def test_cancellation_is_reported(self):
+        async def slow():
+            yield 1
+            await asyncio.sleep(10)
+            yield 2
+
+        events = []
+        stream = attach_terminated_callback(slow(), recorder(events, "task"))
+
+        async def consume():
+            async for _ in stream:
+                pass
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert events == [ ("task", "cancelled", None) ]
+
+    @pytest.mark.anyio
+    async def test_failing_callback_does_not_stop_others(self):
+        async def broken(event, error):
+            raise RuntimeError("callback failed")
+
+        events = []
+        stream = attach_terminated_callback(make_iterator([ 1 ]), broken)
+        attach_terminated_callback(stream, recorder(events, "task"))
+
+        assert [ chunk async for chunk in stream ] == [ 1 ]
+        assert events == [ ("task", "completed", None) ]
+
+    @pytest.mark.anyio
+    async def test_stream_without_callbacks_is_iterated_directly(self):
+        stream = StreamChunkIterator(make_iterator([ 1, None, 2 ]), is_fragmented=True)
+
+        assert [ chunk async for chunk in stream ] == [ 1, 2 ]
+        assert not stream.is_iterating
@@ -288,6 +288,21 @@ class TestStreamVariable:
         assert variable["kind"] == "bytes"
         assert variable["content_type"].startswith("image/")
 
+    def test_pil_image_sent_as_raw_pixels(self, codec):
+        from PIL import Image
+
+        img = Image.new("RGBA", (3, 2))
+        variable = codec.encode(img)["__variable__"]
+        assert variable["content_type"] == "image/x-raw"
+        assert variable["attrs"] == {"mode": "RGBA", "width": 3, "height": 2}
+
+    def test_palette_image_sent_as_png(self, codec):
+        from PIL import Image
+
+        variable = codec.encode(Image.new("P", (3, 2)))["__variable__"]
+        assert variable["content_type"] == "image/png"
+        assert "attrs" not in variable
+
     def test_stream_nested_in_list(self, codec):
         res = BytesStreamResource(b"x")
         out = codec.encode([res])
@@ -423,6 +423,23 @@ class TestSplitStream:
         assert a_values == [1, 3]
         assert b_values == [2, 4]
 
+    @pytest.mark.anyio
+    async def test_split_stream_sequential_drain_past_buffer_size(self):
+        stream = make_stream([{"x": i, "y": -i} for i in range(50)])
+        renderer = VariableRenderer(make_source_resolver({"s": stream}), split_buffer_size=8)
+        result = await renderer.render({
+            "|": "${s}",
+            "a": "${item.x}",
+            "b": "${item.y}",
+            "c": "${item.x}",
+        })
+
+        # `c` is never read; neither it nor the unread `b` may hold `a` back.
+        a_values = await asyncio.wait_for(collect_async(result["a"]), 1.0)
+        b_values = await asyncio.wait_for(collect_async(result["b"]), 1.0)
+        assert a_values == list(range(50))
+        assert b_values == [-i for i in range(50)]
+
     @pytest.mark.anyio
     async def test_split_stream_concurrent_drain(self):
         stream = make_stream([{"x": 1, "y": 2}, {"x": 3, "y": 4}, {"x": 5, "y": 6}])
@@ -0,0 +1,184 @@
+"""Unit tests for ``mindor.core.utils.admission_queue.AdmissionWorkQueue``.
+
+Focus: bounded depth with fast rejection, queue-deadline expiry, priority
+ordering, round-robin fairness between groups, and wait-time statistics.
+"""
+
+import asyncio
+
+import pytest
+
+from mindor.core.errors import OverloadedError
+from mindor.core.utils.admission_queue import AdmissionWorkQueue
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+async def _block_single_worker(q: AdmissionWorkQueue) -> asyncio.Future:
+    """Occupy the only worker so that subsequently scheduled items stay queued."""
+    future = await q.schedule("blocker")
+    await asyncio.sleep(0.02)
+    return future
+
+
+class TestBoundedDepth:
+    @pytest.mark.anyio
+    async def test_rejects_when_queue_is_full(self):
+        gate = asyncio.Event()
+
+        async def handler(tag):
+            await gate.wait()
+            return tag
+
+        q = AdmissionWorkQueue(max_concurrent_count=1, handler=handler, max_queue_size=2)
+        await q.start()
+        try:
+            blocker = await _block_single_worker(q)
+            queued = [ await q.schedule("a"), await q.schedule("b") ]
+
+            with pytest.raises(OverloadedError):
+                await q.schedule("c")
+
+            gate.set()
+            assert await blocker == "blocker"
+            assert [ await future for future in queued ] == ["a", "b"]
+            assert q.get_stats()["rejected"] == 1
+        finally:
+            await q.stop(timeout=1.0)
+
+    @pytest.mark.anyio
+    async def test_cancelled_items_free_queue_slots(self):
+        gate = asyncio.Event()
+
+        async def handler(tag):
+            await gate.wait()
+            return tag
+
+        q = AdmissionWorkQueue(max_concurrent_count=1, handler=handler, max_queue_size=1)
+        await q.start()
+        try:
+            await _block_single_worker(q)
+            queued = await q.schedule("a")
+            queued.cancel()
+            await asyncio.sleep(0)  # let the done-callback release the slot
+
+            replacement = await q.schedule("b")
+            gate.set()
+            assert await replacement == "b"
+        finally:
+            await q.stop(timeout=1.0)
+
+
+class TestQueueDeadline:
+    @pytest.mark.anyio
+    async def test_waiting_item_expires(self):
+        gate = asyncio.Event()
+        executed = []
+
+        async def handler(tag):
+            executed.append(tag)
+            await gate.wait()
+            return tag
+
+        q = AdmissionWorkQueue(max_concurrent_count=1, handler=handler, queue_timeout=0.05)
+        await q.start()
+        try:
+            await _block_single_worker(q)
+            queued = await q.schedule("late")
+
+            with pytest.raises(OverloadedError, match="expired"):
+                await asyncio.wait_for(queued, timeout=1.0)
+
+            gate.set()
+            await asyncio.sleep(0.05)
+            assert executed == ["blocker"]
+            assert q.get_stats()["expired"] == 1
+        finally:
+            await q.stop(timeout=1.0)
+
+    @pytest.mark.anyio
+    async def test_running_item_does_not_expire(self):
+        async def handler():
+            await asyncio.sleep(0.15)
+            return "done"
+
+        q = AdmissionWorkQueue(max_concurrent_count=1, handler=handler, queue_timeout=0.05)
+        await q.start()
+        try:
+            future = await q.schedule()
+            assert await future == "done"
+        finally:
+            await q.stop(timeout=1.0)
+
+
+class TestOrdering:
+    @pytest.mark.anyio
+    async def test_higher_priority_runs_first(self):
+        gate = asyncio.Event()
+        executed = []
+
+        async def handler(tag):
+            executed.append(tag)
+            await gate.wait()
+
+        q = AdmissionWorkQueue(max_concurrent_count=1, handler=handler)
+        await q.start()
+        try:
+            await _block_single_worker(q)
+            futures = [
+                await q.schedule("low", priority=0),
+                await q.schedule("high", priority=10),
+                await q.schedule("mid", priority=5),
+            ]
+            gate.set()
+            await asyncio.gather(*futures)
+
+            assert executed == ["blocker", "high", "mid", "low"]
+        finally:
+            await q.stop(timeout=1.0)
+
+    @pytest.mark.anyio
+    async def test_groups_are_served_round_robin(self):
+        gate = asyncio.Event()
+        executed = []
+
+        async def handler(tag):
+            executed.append(tag)
+            await gate.wait()
+
+        q = AdmissionWorkQueue(max_concurrent_count=1, handler=handler)
+        await q.start()
+        try:
+            await _block_single_worker(q)
+            futures = [ await q.schedule(f"a{i}", group="a") for i in range(3) ]
+            futures += [ await q.schedule(f"b{i}", group="b") for i in range(2) ]
+            gate.set()
+            await asyncio.gather(*futures)
+
+            assert executed == ["blocker", "a0", "b0", "a1", "b1", "a2"]
+        finally:
+            await q.stop(timeout=1.0)
+
+
+class TestStats:
+    @pytest.mark.anyio
+    async def test_wait_time_is_recorded(self):
+        async def handler():
+            await asyncio.sleep(0.05)
+
+        q = AdmissionWorkQueue(max_concurrent_count=1, handler=handler)
+        await q.start()
+        try:
+            futures = [ await q.schedule() for _ in range(3) ]
+            await asyncio.gather(*futures)
+
+            stats = q.get_stats()
+            assert stats["admitted"] == 3
+            assert stats["queued"] == 0
+            assert stats["running"] == 0
+            assert stats["wait_time"]["max"] >= 0.08
+        finally:
+            await q.stop(timeout=1.0)
@@ -6,7 +6,7 @@ import wave
 
 import pytest
 
-from mindor.core.utils.audio import encode_waveform_to_pcm
+from mindor.core.utils.audio import encode_waveform_to_pcm, parse_wav, concat_wavs, mix_waveforms
 from mindor.core.foundation.streaming.audio import PcmStreamResource, WavStreamResource
 
 
@@ -252,3 +252,74 @@ async def test_wav_stream_resource_pcm_attrs_override():
     with wave.open(io.BytesIO(data), "rb") as wav:
         assert wav.getframerate() == 48000
         assert wav.getnchannels() == 2
+
+
+# ---- WavAudio ----
+
+def _wav_bytes(frames: bytes, sample_rate: int = 8000, channels: int = 1, sample_width: int = 2) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(sample_width)
+        w.setframerate(sample_rate)
+        w.writeframes(frames)
+    return buffer.getvalue()
+
+
+class TestWavAudio:
+    def test_parse_reads_layout_and_samples(self):
+        wav = parse_wav(_wav_bytes(struct.pack("<4h", 1, 2, 3, 4), channels=2))
+
+        assert (wav.sample_rate, wav.channels, wav.format, wav.frame_count) == (8000, 2, "s16le", 2)
+        assert wav.data == struct.pack("<4h", 1, 2, 3, 4)
+
+    def test_parse_ignores_unset_size_fields(self):
+        header = bytearray(_wav_bytes(b""))
+        header[4:8] = header[40:44] = b"\xff\xff\xff\xff"
+
+        wav = parse_wav(bytes(header) + struct.pack("<3h", 1, 2, 3))
+
+        assert wav.frame_count == 3
+
+    def test_parse_rejects_unsupported_layouts(self):
+        assert parse_wav(_wav_bytes(b"\x80\x81", sample_width=1)) is None
+        assert parse_wav(b"not a wav") is None
+
+    def test_slice_and_concat_keep_bytes(self):
+        wav = parse_wav(_wav_bytes(struct.pack("<6h", 0, 1, 2, 3, 4, 5), sample_rate=10))
+
+        joined = concat_wavs([ wav.slice(0.1, 0.3), wav.slice(0.5) ])
+
+        assert joined.data == struct.pack("<3h", 1, 2, 5)
+
+    def test_concat_rejects_mixed_layouts(self):
+        mono = parse_wav(_wav_bytes(struct.pack("<h", 1)))
+        stereo = parse_wav(_wav_bytes(struct.pack("<2h", 1, 1), channels=2))
+
+        with pytest.raises(ValueError):
+            concat_wavs([ mono, stereo ])
+
+    def test_to_bytes_round_trips_through_wave(self):
+        wav = parse_wav(_wav_bytes(struct.pack("<4h", 1, 2, 3, 4), channels=2))
+
+        with wave.open(io.BytesIO(wav.to_bytes())) as w:
+            assert (w.getnchannels(), w.getframerate(), w.getnframes()) == (2, 8000, 2)
+            assert w.readframes(2) == wav.data
+
+    def test_convert_resamples_and_remixes(self):
+        import numpy as np
+
+        wav = parse_wav(_wav_bytes(np.full(200, 8192, dtype="<i2").tobytes()))
+
+        converted = wav.convert(sample_rate=16000, channels=2, format="f32le")
+
+        assert (converted.sample_rate, converted.channels, converted.format, converted.frame_count) == (16000, 2, "f32le", 400)
+        assert np.allclose(converted.to_waveform(), 0.25)
+        assert wav.convert() is wav
+
+    def test_mix_waveforms_sums_with_offsets(self):
+        import numpy as np
+
+        mixed = mix_waveforms([ (np.ones((4, 1), dtype=np.float32), 0), (np.ones((4, 1), dtype=np.float32), 2) ], 5)
+
+        assert mixed[:, 0].tolist() == [ 1, 1, 2, 2, 1 ]
@@ -1,8 +1,8 @@
-"""Unit tests for ``mindor.core.utils.caching.ExpiringDict``."""
+"""Unit tests for ``mindor.core.utils.caching.ExpiringDict`` and ``LRUCache``."""
 
 import time
 
-from mindor.core.utils.caching import ExpiringDict
+from mindor.core.utils.caching import ExpiringDict, LRUCache
 
 
 class TestSetAndGet:
@@ -92,3 +92,35 @@ class TestCleanup:
         d.cleanup()
         assert d.get("a") == 1
         assert "b" not in d.keys()
+
+
+class TestLRUCache:
+    def test_evicts_least_recently_used(self):
+        cache: LRUCache[int] = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_overwrite_refreshes_entry(self):
+        cache: LRUCache[int] = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+        cache.set("c", 3)
+        assert cache.get("a") == 10
+        assert cache.get("b") is None
+
+    def test_remove_and_clear(self):
+        cache: LRUCache[int] = LRUCache(max_size=4)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.remove("a")
+        cache.remove("missing")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
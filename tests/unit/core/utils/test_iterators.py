@@ -2,9 +2,12 @@
 
 from typing import AsyncIterator, List
 
+import asyncio
+import time
+
 import pytest
 
-from mindor.core.utils.iterators import BatchSourceIterator, TextDecodeIterator
+from mindor.core.utils.iterators import BatchSourceIterator, OrderedConcurrentIterator, TextDecodeIterator
 from mindor.core.foundation.streaming.iterators import StreamEncodingIterator, StreamChunkIterator
 from mindor.core.foundation.streaming.iterators import StreamEncodingFormat
 
@@ -153,6 +156,71 @@ class TestBatchSourceIteratorWithTupleBroadcast:
         assert result == []
 
 
+class TestOrderedConcurrentIterator:
+    @pytest.mark.anyio
+    async def test_keeps_source_order(self):
+        async def _delayed(item):
+            await asyncio.sleep(0.01 * (5 - item))
+            return item * 10
+
+        result = await _collect(OrderedConcurrentIterator([1, 2, 3, 4], _delayed, concurrency=4))
+        assert result == [10, 20, 30, 40]
+
+    @pytest.mark.anyio
+    async def test_bounds_calls_in_flight(self):
+        running, peak = 0, 0
+
+        async def _track(item):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return item
+
+        result = await _collect(OrderedConcurrentIterator(list(range(10)), _track, concurrency=3))
+        assert result == list(range(10))
+        assert peak == 3
+
+    @pytest.mark.anyio
+    async def test_slow_source_does_not_hold_back_done_results(self):
+        async def _slow_source():
+            for item in range(3):
+                yield item
+                await asyncio.sleep(0.5)
+
+        async def _identity(item):
+            return item
+
+        started = time.monotonic()
+        arrivals = []
+        async for item in OrderedConcurrentIterator(_slow_source(), _identity, concurrency=4):
+            arrivals.append((item, time.monotonic() - started))
+
+        assert [ item for item, _ in arrivals ] == [0, 1, 2]
+        assert arrivals[0][1] < 0.25
+        assert arrivals[1][1] < 0.75
+
+    @pytest.mark.anyio
+    async def test_cancels_calls_in_flight_when_closed_early(self):
+        cancelled = []
+
+        async def _slow(item):
+            try:
+                await asyncio.sleep(0.05 if item == 0 else 10)
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+            return item
+
+        iterator = OrderedConcurrentIterator([0, 1, 2], _slow, concurrency=3).__aiter__()
+        assert await iterator.__anext__() == 0
+        await iterator.aclose()
+        await asyncio.sleep(0)
+
+        assert sorted(cancelled) == [1, 2]
+
+
 class TestStreamChunkIterator:
     @pytest.mark.anyio
     async def test_yields_non_none_chunks(self):
@@ -0,0 +1,93 @@
+"""Tests for the pluggable JSON serializers in ``mindor.core.utils.json``."""
+
+import datetime
+import json
+
+import pytest
+
+from mindor.core.foundation.variable.atomic import AtomicDict, AtomicList
+from mindor.core.utils import json as json_utils
+from mindor.core.utils.json import (
+    JsonSerializerRegistry,
+    get_json_serializer,
+    json_dumps,
+    json_dumps_str,
+    json_loads,
+    set_json_serializer,
+)
+
+
+def _available_serializers():
+    names = []
+    for name, serializer_type in JsonSerializerRegistry.items():
+        try:
+            serializer_type()
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+
+@pytest.fixture(params=_available_serializers())
+def serializer(request):
+    previous = json_utils._serializer
+    yield set_json_serializer(request.param)
+    json_utils._serializer = previous
+
+
+class TestSerializers:
+    def test_round_trip(self, serializer):
+        value = {"text": "héllo ✓", "n": 3, "f": 1.5, "b": True, "none": None, "list": [1, "a"]}
+        assert json.loads(serializer.dumps(value)) == value
+        assert serializer.loads(serializer.dumps(value)) == value
+
+    def test_output_is_compact_utf8(self, serializer):
+        assert serializer.dumps({"a": [1, 2], "k": "é"}) == '{"a":[1,2],"k":"é"}'.encode("utf-8")
+
+    def test_atomic_containers(self, serializer):
+        value = AtomicDict(items=AtomicList([1, 2, 3]))
+        assert json.loads(serializer.dumps(value)) == {"items": [1, 2, 3]}
+
+    def test_numpy_arrays_and_scalars(self, serializer):
+        np = pytest.importorskip("numpy")
+        value = {
+            "embedding": np.arange(4, dtype=np.float32),
+            "matrix": np.arange(6).reshape(2, 3).T,
+            "score": np.float64(0.25),
+            "count": np.int64(7),
+        }
+        assert json.loads(serializer.dumps(value)) == {
+            "embedding": [0.0, 1.0, 2.0, 3.0],
+            "matrix": [[0, 3], [1, 4], [2, 5]],
+            "score": 0.25,
+            "count": 7,
+        }
+
+    def test_unknown_objects_are_stringified(self, serializer):
+        class Opaque:
+            def __str__(self):
+                return "opaque"
+
+        assert json.loads(serializer.dumps({"value": Opaque()})) == {"value": "opaque"}
+
+    def test_datetime_is_encoded(self, serializer):
+        value = datetime.datetime(2026, 1, 2, 3, 4, 5)
+        assert json.loads(serializer.dumps([value]))[0].startswith("2026-01-02")
+
+    def test_malformed_input_raises_value_error(self, serializer):
+        with pytest.raises(ValueError):
+            serializer.loads("{not json")
+
+
+class TestModuleFunctions:
+    def test_default_serializer_prefers_fast_backend(self):
+        assert get_json_serializer().name == _available_serializers()[0]
+
+    def test_helpers_use_active_serializer(self):
+        assert json_dumps({"a": 1}) == b'{"a":1}'
+        assert json_dumps_str({"a": 1}) == '{"a":1}'
+        assert json_loads(b'{"a":1}') == {"a": 1}
+
+    def test_unknown_serializer_rejected(self):
+        with pytest.raises(ValueError, match="Unsupported JSON serializer"):
+            set_json_serializer("yaml")
@@ -0,0 +1,66 @@
+"""Unit tests for ``mindor.core.utils.startup_profiler.StartupProfiler``."""
+
+import asyncio
+
+import pytest
+
+from mindor.core.utils.startup_profiler import StartupProfiler
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class TestStartupProfiler:
+    def test_disabled_profiler_records_nothing(self):
+        profiler = StartupProfiler()
+        with profiler.measure("import", "runtime"):
+            pass
+
+        assert profiler.records == []
+
+    def test_nested_measurements_are_indented(self):
+        reports = []
+        profiler = StartupProfiler()
+        profiler.enable(reports.append)
+
+        with profiler.measure("validate", "compose config"):
+            with profiler.measure("import", "schema:model"):
+                pass
+        profiler.annotate("validate", "compose config", "cached")
+        profiler.complete()
+
+        [ report ] = reports
+        lines = report.splitlines()
+        assert [ (record.phase, record.subsystem, record.depth) for record in profiler.records ] == [
+            ("validate", "compose config", 0),
+            ("import", "schema:model", 1),
+        ]
+        assert "compose config" in lines[2] and "(cached)" in lines[2]
+        assert "  schema:model" in lines[3]
+        assert lines[-1].lstrip().startswith("total")
+
+    def test_report_is_emitted_once(self):
+        reports = []
+        profiler = StartupProfiler()
+        profiler.enable(reports.append)
+
+        profiler.complete()
+        profiler.complete()
+
+        assert len(reports) == 1
+
+    @pytest.mark.anyio
+    async def test_concurrent_measurements_do_not_nest(self):
+        profiler = StartupProfiler()
+        profiler.enable(lambda report: None)
+
+        async def start(name: str):
+            with profiler.measure("setup", name):
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(start("a"), start("b"))
+
+        assert [ record.depth for record in profiler.records ] == [ 0, 0 ]
+        assert all(record.duration >= 0.01 for record in profiler.records)
@@ -0,0 +1,26 @@
+"""Unit tests for ``mindor.core.utils.statistics``."""
+
+from mindor.core.utils.statistics import summarize_durations, percentile
+
+
+class TestSummarizeDurations:
+    def test_empty_values_summarize_to_zero(self):
+        assert summarize_durations([]) == { "avg": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0 }
+
+    def test_unsorted_values_are_summarized(self):
+        summary = summarize_durations([ float(value) for value in reversed(range(1, 101)) ])
+
+        assert summary == { "avg": 50.5, "p50": 51.0, "p95": 96.0, "max": 100.0 }
+
+    def test_accepts_a_deque(self):
+        from collections import deque
+
+        assert summarize_durations(deque([ 2.0, 1.0 ], maxlen=2))["max"] == 2.0
+
+
+class TestPercentile:
+    def test_single_value(self):
+        assert percentile([ 3.0 ], 0.95) == 3.0
+
+    def test_fraction_one_returns_last_value(self):
+        assert percentile([ 1.0, 2.0, 3.0 ], 1.0) == 3.0
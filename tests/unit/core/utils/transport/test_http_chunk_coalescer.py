@@ -0,0 +1,87 @@
+"""Tests for HttpChunkCoalescer write merging."""
+
+import asyncio
+
+import pytest
+from mindor.core.utils.transport.http_stream import HttpChunkCoalescer, HttpEventStreamer
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+async def make_iterator(chunks, delay: float = 0.0):
+    for chunk in chunks:
+        if delay:
+            await asyncio.sleep(delay)
+        yield chunk
+
+
+async def collect_writes(coalescer: HttpChunkCoalescer) -> list:
+    return [ piece async for piece in coalescer.stream() ]
+
+
+class TestHttpChunkCoalescer:
+    @pytest.mark.anyio
+    async def test_ready_chunks_are_merged_into_one_write(self):
+        coalescer = HttpChunkCoalescer(make_iterator([ "a", "b", b"c", None, "d" ]), max_delay=0.05, max_bytes=1024)
+        assert await collect_writes(coalescer) == [ b"abcd" ]
+
+    @pytest.mark.anyio
+    async def test_write_is_flushed_at_max_bytes(self):
+        coalescer = HttpChunkCoalescer(make_iterator([ b"xx" ] * 5), max_delay=10, max_bytes=4)
+        assert await collect_writes(coalescer) == [ b"xxxx", b"xxxx", b"xx" ]
+
+    @pytest.mark.anyio
+    async def test_write_is_flushed_after_max_delay_while_source_stalls(self):
+        async def stalled():
+            yield b"first"
+            await asyncio.sleep(0.3)
+            yield b"second"
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        writes = []
+        async for piece in HttpChunkCoalescer(stalled(), max_delay=0.02, max_bytes=1024).stream():
+            writes.append((piece, loop.time() - started))
+
+        assert [ piece for piece, _ in writes ] == [ b"first", b"second" ]
+        assert writes[0][1] < 0.2
+
+    @pytest.mark.anyio
+    async def test_sse_events_are_preserved(self):
+        events = HttpEventStreamer(make_iterator([ "hello", "line1\nline2" ])).stream()
+        writes = await collect_writes(HttpChunkCoalescer(events, max_delay=0.05, max_bytes=1024))
+        assert writes == [ b"data: hello\n\ndata: line1\ndata: line2\n\n" ]
+
+    @pytest.mark.anyio
+    async def test_buffered_chunks_are_flushed_before_error(self):
+        async def failing():
+            yield b"partial"
+            raise RuntimeError("boom")
+
+        writes = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for piece in HttpChunkCoalescer(failing(), max_delay=10, max_bytes=1024).stream():
+                writes.append(piece)
+
+        assert writes == [ b"partial" ]
+
+    @pytest.mark.anyio
+    async def test_closing_the_stream_stops_the_source(self):
+        closed = asyncio.Event()
+
+        async def endless():
+            try:
+                while True:
+                    yield b"x"
+                    await asyncio.sleep(0)
+            finally:
+                closed.set()
+
+        stream = HttpChunkCoalescer(endless(), max_delay=0.01, max_bytes=8).stream()
+        assert await stream.__anext__() == b"x" * 8
+        await stream.aclose()
+
+        await asyncio.wait_for(closed.wait(), timeout=1)
@@ -0,0 +1,120 @@
+"""Tests for ``mindor.core.utils.transport.http_server.SharedHttpServer``."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from contextlib import closing
+
+import aiohttp
+import pytest
+from fastapi import FastAPI, WebSocket
+
+from mindor.core.utils.transport.http_server import get_shared_http_server
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _free_port() -> int:
+    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _app(name: str, base_path: str = "") -> FastAPI:
+    app = FastAPI()
+
+    @app.get(f"{base_path}/whoami")
+    async def whoami():
+        return { "name": name }
+
+    @app.websocket(f"{base_path}/ws")
+    async def echo(websocket: WebSocket):
+        await websocket.accept()
+        await websocket.send_text(name)
+        await websocket.close()
+
+    return app
+
+
+async def _wait_until_started(server) -> None:
+    for _ in range(100):
+        if server.server and server.server.started:
+            return
+        await asyncio.sleep(0.02)
+    raise TimeoutError("server did not start")
+
+
+@pytest.mark.anyio
+async def test_requests_are_routed_by_longest_prefix():
+    port = _free_port()
+    shared = get_shared_http_server("127.0.0.1", port)
+
+    tasks = [
+        asyncio.create_task(shared.serve(None, _app("root"))),
+        asyncio.create_task(shared.serve("/api", _app("api", "/api"))),
+        asyncio.create_task(shared.serve("/api/hooks/", _app("hooks", "/api/hooks"))),
+    ]
+    await _wait_until_started(shared)
+
+    try:
+        async with aiohttp.ClientSession(f"http://127.0.0.1:{port}") as session:
+            for path, name in [ ("/whoami", "root"), ("/api/whoami", "api"), ("/api/hooks/whoami", "hooks") ]:
+                async with session.get(path) as response:
+                    assert (await response.json()) == { "name": name }
+
+            async with session.get("/apix/whoami") as response:
+                assert response.status == 404
+
+            async with session.ws_connect("/api/hooks/ws") as websocket:
+                assert await websocket.receive_str(timeout=5) == "hooks"
+    finally:
+        for base_path in (None, "/api", "/api/hooks"):
+            shared.release(base_path)
+        await asyncio.gather(*tasks)
+
+    assert shared.server is None
+
+
+@pytest.mark.anyio
+async def test_server_keeps_running_until_last_release():
+    port = _free_port()
+    shared = get_shared_http_server("127.0.0.1", port)
+
+    first = asyncio.create_task(shared.serve("/a", _app("a", "/a")))
+    second = asyncio.create_task(shared.serve("/b", _app("b", "/b")))
+    await _wait_until_started(shared)
+
+    shared.release("/a")
+    await first
+
+    async with aiohttp.ClientSession(f"http://127.0.0.1:{port}") as session:
+        async with session.get("/a/whoami") as response:
+            assert response.status == 404
+        async with session.get("/b/whoami") as response:
+            assert (await response.json()) == { "name": "b" }
+
+    shared.release("/b")
+    await second
+
+    assert shared.server is None
+    assert get_shared_http_server("127.0.0.1", port) is not shared
+
+
+@pytest.mark.anyio
+async def test_duplicate_base_path_is_rejected():
+    port = _free_port()
+    shared = get_shared_http_server("127.0.0.1", port)
+
+    task = asyncio.create_task(shared.serve("/api", _app("api", "/api")))
+    await _wait_until_started(shared)
+
+    try:
+        with pytest.raises(ValueError, match="already mounted"):
+            await shared.serve("api/", _app("other", "/api"))
+    finally:
+        shared.release("/api")
+        await task
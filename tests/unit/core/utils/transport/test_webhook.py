@@ -0,0 +1,259 @@
+"""Tests for ``mindor.core.utils.transport.webhook.WebhookDispatcher``."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, List
+
+import pytest
+from aiohttp import web
+
+from mindor.core.utils.transport.webhook import WebhookDispatcher, WebhookOutbox
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class Receiver:
+    """A local webhook endpoint that answers with queued status codes and records what it received."""
+    def __init__(self):
+        self.statuses: List[int] = []
+        self.bodies: List[Any] = []
+        self.headers: List[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0.0
+        self.runner: web.AppRunner = None
+        self.url: str = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            status = self.statuses.pop(0) if self.statuses else 200
+            if status < 300:
+                self.bodies.append(await request.json())
+                self.headers.append(dict(request.headers))
+            return web.Response(status=status)
+        finally:
+            self.in_flight -= 1
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/hook", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/hook"
+
+    async def stop(self) -> None:
+        await self.runner.cleanup()
+
+
+@pytest.fixture
+async def receiver():
+    receiver = Receiver()
+    await receiver.start()
+    yield receiver
+    await receiver.stop()
+
+
+async def _wait_for(predicate, timeout: float = 5.0) -> None:
+    for _ in range(int(timeout / 0.01)):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise TimeoutError("condition not met")
+
+
+class TestDelivery:
+    @pytest.mark.anyio
+    async def test_payload_is_posted_as_json(self, receiver):
+        dispatcher = WebhookDispatcher()
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(receiver.url, { "task_id": "t1" }, { "Authorization": "Bearer x" })
+            await _wait_for(lambda: dispatcher.get_stats()["delivered"] == 1)
+        finally:
+            await dispatcher.stop()
+
+        assert receiver.bodies == [ { "task_id": "t1" } ]
+        assert receiver.headers[0]["Authorization"] == "Bearer x"
+        assert receiver.headers[0]["Content-Type"] == "application/json"
+
+    @pytest.mark.anyio
+    async def test_concurrency_is_bounded(self, receiver):
+        receiver.delay = 0.05
+        dispatcher = WebhookDispatcher(max_concurrency=3)
+        await dispatcher.start()
+        try:
+            for index in range(12):
+                await dispatcher.submit(receiver.url, { "index": index })
+            await _wait_for(lambda: dispatcher.get_stats()["delivered"] == 12)
+        finally:
+            await dispatcher.stop()
+
+        assert receiver.max_in_flight == 3
+        assert dispatcher.get_stats()["pending"] == 0
+
+
+class TestRetry:
+    @pytest.mark.anyio
+    async def test_server_errors_are_retried_with_backoff(self, receiver):
+        receiver.statuses = [ 503, 500 ]
+        dispatcher = WebhookDispatcher(retry_backoff=0.01, max_retries=3)
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(receiver.url, { "task_id": "t1" })
+            await _wait_for(lambda: dispatcher.get_stats()["delivered"] == 1)
+        finally:
+            await dispatcher.stop()
+
+        stats = dispatcher.get_stats()
+        assert receiver.bodies == [ { "task_id": "t1" } ]
+        assert stats["retried"] == 2
+        assert stats["dropped"] == 0
+
+    @pytest.mark.anyio
+    async def test_client_errors_are_not_retried(self, receiver):
+        receiver.statuses = [ 400 ]
+        dispatcher = WebhookDispatcher(retry_backoff=0.01)
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(receiver.url, { "task_id": "t1" })
+            await _wait_for(lambda: dispatcher.get_stats()["dropped"] == 1)
+        finally:
+            await dispatcher.stop()
+
+        assert dispatcher.get_stats()["retried"] == 0
+
+    @pytest.mark.anyio
+    async def test_delivery_is_dropped_after_max_retries(self, receiver):
+        receiver.statuses = [ 502 ] * 10
+        dispatcher = WebhookDispatcher(retry_backoff=0.01, max_retries=2)
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(receiver.url, { "task_id": "t1" })
+            await _wait_for(lambda: dispatcher.get_stats()["dropped"] == 1)
+        finally:
+            await dispatcher.stop()
+
+        assert dispatcher.get_stats()["retried"] == 2
+        assert len(receiver.statuses) == 7
+
+    def test_backoff_grows_exponentially_within_bounds(self):
+        dispatcher = WebhookDispatcher(retry_backoff=1.0, max_retry_backoff=10.0)
+
+        for attempts, upper in [ (1, 1.0), (2, 2.0), (3, 4.0), (4, 8.0), (8, 10.0) ]:
+            delay = dispatcher._get_backoff(attempts)
+            assert upper / 2 <= delay <= upper
+
+
+class TestBatching:
+    @pytest.mark.anyio
+    async def test_events_for_same_url_are_batched(self, receiver):
+        dispatcher = WebhookDispatcher(batch_size=10, batch_interval=0.05)
+        await dispatcher.start()
+        try:
+            for index in range(4):
+                await dispatcher.submit(receiver.url, { "index": index })
+            await _wait_for(lambda: dispatcher.get_stats()["delivered"] == 4)
+        finally:
+            await dispatcher.stop()
+
+        assert receiver.bodies == [ [ { "index": index } for index in range(4) ] ]
+
+    @pytest.mark.anyio
+    async def test_full_batch_is_sent_without_waiting(self, receiver):
+        dispatcher = WebhookDispatcher(batch_size=2, batch_interval=60)
+        await dispatcher.start()
+        try:
+            for index in range(4):
+                await dispatcher.submit(receiver.url, { "index": index })
+            await _wait_for(lambda: dispatcher.get_stats()["delivered"] == 4, timeout=2)
+        finally:
+            await dispatcher.stop()
+
+        assert sorted(len(body) for body in receiver.bodies) == [ 2, 2 ]
+
+    @pytest.mark.anyio
+    async def test_different_headers_are_not_batched_together(self, receiver):
+        dispatcher = WebhookDispatcher(batch_size=10, batch_interval=0.05)
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(receiver.url, { "index": 0 }, { "X-Tenant": "a" })
+            await dispatcher.submit(receiver.url, { "index": 1 }, { "X-Tenant": "b" })
+            await _wait_for(lambda: dispatcher.get_stats()["delivered"] == 2)
+        finally:
+            await dispatcher.stop()
+
+        assert len(receiver.bodies) == 2
+
+
+class TestOutbox:
+    @pytest.mark.anyio
+    async def test_undelivered_events_survive_restart(self, receiver, tmp_path):
+        path = str(tmp_path / "outbox.db")
+        receiver.statuses = [ 503 ]
+
+        first = WebhookDispatcher(retry_backoff=60, outbox=WebhookOutbox(path))
+        await first.start()
+        await first.submit(receiver.url, { "task_id": "t1" })
+        await _wait_for(lambda: first.get_stats()["retried"] == 1)
+        await first.stop()
+
+        assert receiver.bodies == []
+
+        second = WebhookDispatcher(outbox=WebhookOutbox(path))
+        await second.start()
+        try:
+            # The stored retry time is honoured, so the event is not sent again yet.
+            await asyncio.sleep(0.1)
+            assert receiver.bodies == []
+        finally:
+            await second.stop()
+
+        outbox = WebhookOutbox(path)
+        await outbox.open()
+        try:
+            [ (delivery, _) ] = await outbox.load()
+            await outbox.reschedule([ delivery ], 0)
+        finally:
+            await outbox.close()
+
+        third = WebhookDispatcher(outbox=WebhookOutbox(path))
+        await third.start()
+        try:
+            await _wait_for(lambda: third.get_stats()["delivered"] == 1)
+        finally:
+            await third.stop()
+
+        assert receiver.bodies == [ { "task_id": "t1" } ]
+
+        outbox = WebhookOutbox(path)
+        await outbox.open()
+        try:
+            assert await outbox.load() == []
+        finally:
+            await outbox.close()
+
+
+class TestStats:
+    @pytest.mark.anyio
+    async def test_lag_is_reported(self, receiver):
+        dispatcher = WebhookDispatcher()
+        await dispatcher.start()
+        try:
+            await dispatcher.submit(receiver.url, { "task_id": "t1" })
+            await _wait_for(lambda: dispatcher.get_stats()["delivered"] == 1)
+        finally:
+            await dispatcher.stop()
+
+        lag = dispatcher.get_stats()["lag"]
+        assert 0 < lag["avg"] == lag["max"] < 5
@@ -8,6 +8,8 @@ Scope:
 
 from __future__ import annotations
 
+import asyncio
+import json
 from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Set
 from unittest.mock import MagicMock
@@ -17,6 +19,7 @@ import pytest
 from mindor.core.workflow import runner as workflow_module
 from mindor.core.workflow.job.base import Job, RoutingTarget
 from mindor.core.workflow.runner import WorkflowRunner
+from mindor.core.foundation.streaming.broadcast import BroadcastStreamIterator
 
 
 @pytest.fixture
@@ -24,7 +27,7 @@ def anyio_backend():
     return "asyncio"
 
 
-def make_job_config(job_id: str, depends_on: Optional[List[Any]] = None, max_run_count: int = 5) -> SimpleNamespace:
+def make_job_config(job_id: str, depends_on: Optional[List[Any]] = None, max_run_count: int = 5, routes: Optional[List[str]] = None) -> SimpleNamespace:
     depends_on = depends_on or []
 
     def _groups() -> List[List[str]]:
@@ -48,6 +51,7 @@ def make_job_config(job_id: str, depends_on: Optional[List[Any]] = None, max_run
         on_error=None,
         get_dependency_groups=_groups,
         get_dependency_ids=_ids,
+        get_routing_jobs=lambda: set(routes or []),
     )
 
 
@@ -94,6 +98,7 @@ def make_runner(jobs_config: Dict[str, SimpleNamespace]) -> WorkflowRunner:
     runner.jobs = jobs_config
     runner.output = None
     runner.global_configs = None
+    runner._output_references = {}
     return runner
 
 
@@ -433,6 +438,103 @@ class TestRunJobsBasicFlow:
         assert output == {"b_key": 1, "c_key": 2}
 
 
+def with_input(config: SimpleNamespace, input: Any) -> SimpleNamespace:
+    config.model_dump_json = lambda: json.dumps({ "id": config.id, "input": input })
+    return config
+
+
+class ReaderJob(Job):
+    """A Job that reads the whole output stream of `source_id` through its job context."""
+
+    def __init__(self, id: str, source_id: str, config: SimpleNamespace):
+        self.id = id
+        self.config = config
+        self.global_configs = None
+        self.source_id = source_id
+
+    async def _run(self, context) -> Any:
+        jobs = await context.resolve_source("jobs", None, None)
+        return [ value async for value in jobs[self.source_id]["output"] ]
+
+
+def make_stream_context() -> MagicMock:
+    context = make_context()
+
+    async def _resolve_source(key, index, scope):
+        return context.sources[key]
+
+    context.resolve_source = _resolve_source
+    return context
+
+
+async def _count_up(count: int):
+    for value in range(count):
+        yield value
+
+
+class TestStreamingOutputSharing:
+    def test_counts_output_references_per_job(self):
+        cfg = {
+            "a": with_input(make_job_config("a"), None),
+            "b": with_input(make_job_config("b", depends_on=["a"]), { "x": "${jobs.a.output}", "y": "${jobs.a.output as text}" }),
+            "c": with_input(make_job_config("c", depends_on=["a"]), { "x": "${jobs.a.output.field}", "y": "${jobs.a.output[0]}", "z": "${jobs.ab.output}" }),
+        }
+        runner = make_runner(cfg)
+        runner.output = { "result": "${ jobs.a.output | none }" }
+
+        assert runner._get_output_references("a") == { "b": 2, "c": 2, None: 1 }
+        assert runner._get_output_references("b") == {}
+
+    @pytest.mark.anyio
+    async def test_stream_referenced_by_two_jobs_is_replayed_to_each(self, monkeypatch):
+        cfg = {
+            "a": with_input(make_job_config("a"), None),
+            "b": with_input(make_job_config("b", depends_on=["a"]), "${jobs.a.output}"),
+            "c": with_input(make_job_config("c", depends_on=["a"]), "${jobs.a.output}"),
+        }
+        pending = {
+            "a": make_job("a", [_count_up(5)], cfg["a"]),
+            "b": ReaderJob("b", "a", cfg["b"]),
+            "c": ReaderJob("c", "a", cfg["c"]),
+        }
+        install_rewind_scripts(monkeypatch, {})
+        context = make_stream_context()
+        await make_runner(cfg)._run_jobs(context, pending, {})
+
+        assert isinstance(context.sources["jobs"]["a"]["output"], BroadcastStreamIterator)
+        assert context.sources["jobs"]["b"]["output"] == [ 0, 1, 2, 3, 4 ]
+        assert context.sources["jobs"]["c"]["output"] == [ 0, 1, 2, 3, 4 ]
+
+    @pytest.mark.anyio
+    async def test_untaken_branch_does_not_stall_readers(self, monkeypatch):
+        # a streams more chunks than the broadcast buffers; b reads them while the router
+        # picks "taken", so the reservation held for "skipped" has to be given back.
+        cfg = {
+            "a": with_input(make_job_config("a"), None),
+            "b": with_input(make_job_config("b", depends_on=["a"]), "${jobs.a.output}"),
+            "router": with_input(make_job_config("router", depends_on=["a"], routes=["taken", "skipped"]), None),
+            "taken": with_input(make_job_config("taken"), "${jobs.a.output}"),
+            "skipped": with_input(make_job_config("skipped"), "${jobs.a.output.text}"),
+        }
+        pending = {
+            "a": make_job("a", [_count_up(3000)], cfg["a"]),
+            "b": ReaderJob("b", "a", cfg["b"]),
+            "router": make_job("router", [RoutingTarget("taken")], cfg["router"]),
+        }
+        routing = {
+            "taken": ReaderJob("taken", "a", cfg["taken"]),
+            "skipped": ReaderJob("skipped", "a", cfg["skipped"]),
+        }
+        install_rewind_scripts(monkeypatch, {})
+        context = make_stream_context()
+
+        await asyncio.wait_for(make_runner(cfg)._run_jobs(context, pending, routing), 5.0)
+
+        assert context.sources["jobs"]["b"]["output"] == list(range(3000))
+        assert context.sources["jobs"]["taken"]["output"] == list(range(3000))
+        assert "skipped" not in context.sources["jobs"]
+
+
 class TestRunJobsRewindScenarios:
     @pytest.mark.anyio
     async def test_loop_runs_multiple_times_until_condition(self, monkeypatch):
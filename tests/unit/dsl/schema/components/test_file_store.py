@@ -93,6 +93,31 @@ class TestFileStoreComponentSchema:
         assert config.session_token == "TOKEN"
         assert config.base_path == "workflows/"
 
+    def test_aws_s3_cache_config(self):
+        config = ComponentAdapter.validate_python({
+            "id": "s3",
+            "type": "file-store",
+            "driver": "aws-s3",
+            "bucket": "my-bucket",
+            "cache": { "path": "/tmp/assets", "max_size": "2GB" },
+            "actions": [],
+        })
+        assert config.cache.path == "/tmp/assets"
+        assert config.cache.max_size == "2GB"
+        assert config.cache.get_cache_dir() == "/tmp/assets"
+
+    def test_cache_shorthand(self):
+        config = ComponentAdapter.validate_python({
+            "id": "gcs",
+            "type": "file-store",
+            "driver": "gcp-storage",
+            "bucket": "my-bucket",
+            "cache": True,
+            "actions": [],
+        })
+        assert config.cache.path is None
+        assert config.cache.get_cache_dir().endswith("file-store")
+
     def test_aws_s3_requires_bucket(self):
         with pytest.raises(ValidationError):
             ComponentAdapter.validate_python({
@@ -339,6 +364,15 @@ class TestCloudDriverActionSchemas:
         for data in cases:
             AwsS3ActionAdapter.validate_python(data)
 
+    def test_get_action_part_size_and_concurrency(self):
+        config = AwsS3ActionAdapter.validate_python({"method": "get", "path": "x", "part_size": "16MB", "max_concurrency": 8})
+        assert config.part_size == "16MB"
+        assert config.max_concurrency == 8
+
+    def test_local_get_action_has_no_part_size(self):
+        config = LocalActionAdapter.validate_python({"method": "get", "path": "x"})
+        assert not hasattr(config, "part_size")
+
     def test_gcp_storage_actions(self):
         cases = [
             {"method": "put", "path": "x", "source": "y"},
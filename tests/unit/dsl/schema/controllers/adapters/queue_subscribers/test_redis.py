@@ -20,3 +20,27 @@ class TestConnection:
             RedisQueueSubscriberControllerAdapterConfig(
                 type="queue-subscriber", driver="redis", url="redis://x", host="other",
             )
+
+
+class TestStreamMode:
+    def test_defaults(self):
+        cfg = RedisQueueSubscriberControllerAdapterConfig(type="queue-subscriber", driver="redis")
+        assert cfg.mode == "list"
+        assert cfg.consumer_group == "workers"
+        assert cfg.claim_idle_time == "5m"
+        assert cfg.claim_interval == "30s"
+        assert cfg.max_deliveries == 5
+
+    def test_stream_mode_with_claim_settings(self):
+        cfg = RedisQueueSubscriberControllerAdapterConfig(
+            type="queue-subscriber", driver="redis", mode="stream",
+            consumer_group="gpu-workers", claim_idle_time="1m", claim_interval="10s",
+        )
+        assert cfg.mode == "stream"
+        assert cfg.consumer_group == "gpu-workers"
+        assert cfg.claim_idle_time == "1m"
+        assert cfg.claim_interval == "10s"
+
+    def test_max_deliveries_must_be_positive(self):
+        with pytest.raises(ValidationError):
+            RedisQueueSubscriberControllerAdapterConfig(type="queue-subscriber", driver="redis", max_deliveries=0)
@@ -0,0 +1,25 @@
+"""Unit tests for ``SqliteQueueSubscriberControllerAdapterConfig`` schema validation."""
+
+import pytest
+
+from mindor.dsl.schema.controller.adapter.impl.queue_subscriber.impl.sqlite import (
+    SqliteQueueSubscriberControllerAdapterConfig,
+)
+
+
+class TestDefaults:
+    def test_defaults(self):
+        cfg = SqliteQueueSubscriberControllerAdapterConfig(type="queue-subscriber", driver="sqlite")
+        assert cfg.path == "controller-queue.sqlite"
+        assert cfg.blob_dir is None
+        assert cfg.poll_interval == "50ms"
+        assert cfg.claim_idle_time == "5m"
+        assert cfg.max_deliveries == 5
+
+    def test_max_deliveries_must_be_positive(self):
+        with pytest.raises(ValueError):
+            SqliteQueueSubscriberControllerAdapterConfig(type="queue-subscriber", driver="sqlite", max_deliveries=0)
+
+    def test_single_workflow_inflated(self):
+        cfg = SqliteQueueSubscriberControllerAdapterConfig(type="queue-subscriber", driver="sqlite", workflow="wf")
+        assert cfg.workflows == ["wf"]
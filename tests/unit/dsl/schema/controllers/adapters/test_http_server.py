@@ -1,7 +1,11 @@
 """Unit tests for ``HttpServerControllerAdapterConfig`` schema validation."""
 
+import pytest
+from pydantic import ValidationError
+
 from mindor.dsl.schema.controller.adapter.impl.http_server import (
     HttpServerControllerAdapterConfig,
+    StreamCoalescingConfig,
     WebSocketConfig,
 )
 
@@ -35,3 +39,56 @@ class TestWebSocket:
         cfg = HttpServerControllerAdapterConfig.model_validate({"type": "http-server"})
         assert isinstance(cfg.websocket, WebSocketConfig)
         assert cfg.websocket.path == "/ws"
+
+
+class TestWorkers:
+    def test_default_single_worker(self):
+        cfg = HttpServerControllerAdapterConfig.model_validate({"type": "http-server"})
+        assert cfg.workers == 1
+
+    def test_multiple_workers(self):
+        cfg = HttpServerControllerAdapterConfig.model_validate({"type": "http-server", "workers": 4})
+        assert cfg.workers == 4
+
+    def test_zero_workers_rejected(self):
+        with pytest.raises(ValidationError):
+            HttpServerControllerAdapterConfig.model_validate({"type": "http-server", "workers": 0})
+
+
+class TestCallback:
+    def test_defaults_deliver_events_one_by_one(self):
+        cfg = HttpServerControllerAdapterConfig.model_validate({"type": "http-server"})
+        assert cfg.callback.batch_size == 1
+        assert cfg.callback.max_retries == 5
+        assert cfg.callback.outbox is None
+
+    def test_callback_object_pass_through(self):
+        cfg = HttpServerControllerAdapterConfig.model_validate({
+            "type": "http-server",
+            "callback": {"batch_size": 50, "batch_interval": "500ms", "outbox": "./callbacks.db"},
+        })
+        assert cfg.callback.batch_size == 50
+        assert cfg.callback.batch_interval == "500ms"
+        assert cfg.callback.outbox == "./callbacks.db"
+
+    def test_zero_concurrency_rejected(self):
+        with pytest.raises(ValidationError):
+            HttpServerControllerAdapterConfig.model_validate({"type": "http-server", "callback": {"max_concurrency": 0}})
+
+
+class TestStreamCoalescing:
+    def test_disabled_by_default(self):
+        cfg = HttpServerControllerAdapterConfig.model_validate({"type": "http-server"})
+        assert cfg.stream_coalescing is False
+
+    def test_true_inflated_to_default_config(self):
+        cfg = HttpServerControllerAdapterConfig.model_validate({"type": "http-server", "stream_coalescing": True})
+        assert isinstance(cfg.stream_coalescing, StreamCoalescingConfig)
+        assert cfg.stream_coalescing.max_delay == "20ms"
+
+    def test_object_pass_through(self):
+        cfg = HttpServerControllerAdapterConfig.model_validate({
+            "type": "http-server", "stream_coalescing": {"max_delay": "50ms", "max_bytes": "16KB"},
+        })
+        assert cfg.stream_coalescing.max_delay == "50ms"
+        assert cfg.stream_coalescing.max_bytes == "16KB"
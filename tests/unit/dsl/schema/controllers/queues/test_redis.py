@@ -14,3 +14,17 @@ class TestConnection:
     def test_url_and_host_together_rejected(self):
         with pytest.raises(ValidationError, match="Either 'url' or 'host'"):
             RedisControllerQueueConfig(driver="redis", url="redis://x", host="other")
+
+
+class TestMode:
+    def test_defaults_to_list(self):
+        cfg = RedisControllerQueueConfig(driver="redis")
+        assert cfg.mode == "list"
+
+    def test_stream_mode(self):
+        cfg = RedisControllerQueueConfig(driver="redis", mode="stream")
+        assert cfg.mode == "stream"
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValidationError):
+            RedisControllerQueueConfig(driver="redis", mode="pubsub")
@@ -0,0 +1,20 @@
+"""Unit tests for ``SqliteControllerQueueConfig`` schema validation."""
+
+import pytest
+from pydantic import TypeAdapter
+
+from mindor.dsl.schema.controller import ControllerQueueConfig
+from mindor.dsl.schema.controller.queue.impl.sqlite import SqliteControllerQueueConfig
+
+
+class TestDefaults:
+    def test_defaults(self):
+        cfg = SqliteControllerQueueConfig(driver="sqlite")
+        assert cfg.path == "controller-queue.sqlite"
+        assert cfg.blob_dir is None
+        assert cfg.poll_interval == "50ms"
+
+    def test_discriminated_by_driver(self):
+        cfg = TypeAdapter(ControllerQueueConfig).validate_python({ "driver": "sqlite", "path": "/tmp/q.db" })
+        assert isinstance(cfg, SqliteControllerQueueConfig)
+        assert cfg.path == "/tmp/q.db"
@@ -1,5 +1,8 @@
 """Unit tests for ``ControllerConfig`` schema validation."""
 
+import pytest
+from pydantic import ValidationError
+
 from mindor.dsl.schema.controller import ControllerConfig
 from mindor.dsl.schema.controller.webui import ControllerWebUIDriver
 from mindor.dsl.schema.runtime import RuntimeType
@@ -56,3 +59,39 @@ class TestWebUIDefault:
     def test_omitted_webui_stays_none(self):
         cfg = ControllerConfig.model_validate({})
         assert cfg.webui is None
+
+
+class TestAdmission:
+    def test_admission_defaults(self):
+        cfg = ControllerConfig(max_concurrent_count=2, admission={})
+        assert cfg.admission.max_queue_size == 0
+        assert cfg.admission.queue_timeout == "0s"
+        assert cfg.admission.fair_share_by == []
+        assert cfg.admission.priority_key == "priority"
+
+    def test_admission_fair_share_keys(self):
+        cfg = ControllerConfig(max_concurrent_count=2, admission={ "max_queue_size": 100, "fair_share_by": [ "workflow", "session" ] })
+        assert [ key.value for key in cfg.admission.fair_share_by ] == [ "workflow", "session" ]
+
+    def test_admission_requires_bounded_concurrency(self):
+        with pytest.raises(ValidationError, match="max_concurrent_count"):
+            ControllerConfig(admission={ "max_queue_size": 10 })
+
+
+class TestStartup:
+    def test_startup_defaults(self):
+        cfg = ControllerConfig.model_validate({})
+        assert cfg.startup.max_concurrent_count == 4
+        assert cfg.startup.ram_budget is None
+        assert cfg.startup.vram_budget is None
+        assert cfg.startup.serve_partial is False
+
+    def test_startup_budgets(self):
+        cfg = ControllerConfig(startup={ "max_concurrent_count": 0, "vram_budget": 24000, "serve_partial": True })
+        assert cfg.startup.max_concurrent_count == 0
+        assert cfg.startup.vram_budget == 24000
+        assert cfg.startup.serve_partial is True
+
+    def test_negative_budget_rejected(self):
+        with pytest.raises(ValidationError):
+            ControllerConfig(startup={ "ram_budget": -1 })
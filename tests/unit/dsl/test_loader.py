@@ -144,3 +144,72 @@ controller:
 """, encoding="utf-8")
         config = load_compose_config(tmp_path, [], env={})
         assert config.controller.adapters[0].port == 8080
+
+
+class TestConfigCache:
+    _CONFIG = """
+controller:
+  adapter:
+    type: http-server
+    port: ${env.PORT|8080}
+"""
+
+    @pytest.fixture
+    def config_file(self, tmp_path) -> Path:
+        config_file = tmp_path / "model-compose.yml"
+        config_file.write_text(self._CONFIG, encoding="utf-8")
+        return config_file
+
+    @pytest.fixture
+    def cached_loader(self, tmp_path) -> ComposeConfigLoader:
+        return ComposeConfigLoader("model-compose", cache_dir=str(tmp_path / "cache"))
+
+    def _fail_validation(self, monkeypatch):
+        from mindor.dsl import loader as loader_module
+
+        def _model_validate(value):
+            raise AssertionError("config was validated again")
+        monkeypatch.setattr(loader_module.ComposeConfig, "model_validate", _model_validate)
+
+    def test_same_content_is_served_from_cache(self, tmp_path, config_file, cached_loader, monkeypatch):
+        first = cached_loader.load(tmp_path, [config_file], env={})
+        self._fail_validation(monkeypatch)
+        second = cached_loader.load(tmp_path, [config_file], env={})
+
+        assert second == first
+        assert second is not first
+
+    def test_changed_content_is_validated_again(self, tmp_path, config_file, cached_loader):
+        cached_loader.load(tmp_path, [config_file], env={})
+        config = cached_loader.load(tmp_path, [config_file], env={"PORT": "9090"})
+
+        assert config.controller.adapters[0].port == 9090
+
+    def test_changed_schema_module_invalidates_entry(self, tmp_path, config_file, cached_loader, monkeypatch):
+        cached_loader.load(tmp_path, [config_file], env={})
+        fingerprint = cached_loader._get_module_fingerprint
+        monkeypatch.setattr(cached_loader, "_get_module_fingerprint", lambda paths: [ (path, 0, 0) for path, _, _ in fingerprint(paths) ])
+        self._fail_validation(monkeypatch)
+
+        with pytest.raises(AssertionError, match="validated again"):
+            cached_loader.load(tmp_path, [config_file], env={})
+
+    def test_corrupt_entry_is_ignored(self, tmp_path, config_file, cached_loader):
+        cached_loader.load(tmp_path, [config_file], env={})
+        for entry in (tmp_path / "cache").iterdir():
+            entry.write_bytes(b"not a pickle")
+
+        assert cached_loader.load(tmp_path, [config_file], env={}).controller.adapters[0].port == 8080
+
+    def test_cache_is_pruned(self, tmp_path, config_file):
+        cached_loader = ComposeConfigLoader("model-compose", cache_dir=str(tmp_path / "cache"), max_cache_entries=2)
+        for port in range(3):
+            cached_loader.load(tmp_path, [config_file], env={"PORT": str(8080 + port)})
+
+        assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    def test_cache_is_off_by_default(self, tmp_path, config_file, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        load_compose_config(tmp_path, [config_file], env={})
+
+        assert not (tmp_path / "xdg").exists()
@@ -0,0 +1,97 @@
+"""Tests for the lazily resolved schema unions in ``mindor.dsl.utils.lazy``."""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from mindor.dsl.schema.compose import ComposeConfig
+from mindor.dsl.schema.component import ComponentConfig, ComponentType, HttpClientComponentConfig
+
+
+def _base() -> dict:
+    return {"controller": {"adapter": {"type": "http-server", "port": 8080}}}
+
+
+def _run_isolated(code: str) -> str:
+    result = subprocess.run([ sys.executable, "-c", textwrap.dedent(code) ], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+class TestLazySchemaImports:
+    def test_only_schemas_of_used_types_are_imported(self):
+        output = _run_isolated("""
+            import sys
+            from mindor.dsl.schema.compose import ComposeConfig
+            ComposeConfig.model_validate({
+                "controller": { "adapter": { "type": "http-server", "port": 8080 } },
+                "component": { "type": "model", "task": "text-embedding", "model": "m" }
+            })
+            prefixes = ("mindor.dsl.schema.component.impl.", "mindor.dsl.schema.action.impl.")
+            print(sorted({ name.split(".")[5] for name in sys.modules if name.startswith(prefixes) }))
+            print(sorted({ name.split(".")[7] for name in sys.modules if name.startswith("mindor.dsl.schema.component.impl.model.tasks.") }))
+        """)
+        impl_modules, task_modules = output.splitlines()
+
+        assert impl_modules == "['common', 'model', 'types']"
+        assert "text_embedding" in task_modules
+        assert "text_generation" not in task_modules
+        assert "image_generation" not in task_modules
+
+    def test_names_are_still_importable_from_packages(self):
+        output = _run_isolated("""
+            import sys
+            from mindor.dsl.schema.action import HttpServerActionConfig, ChatCompletionModelActionConfig
+            print("mindor.dsl.schema.action.impl.data_queue" in sys.modules)
+        """)
+
+        assert output == "False"
+
+
+class TestLazyDiscriminatedUnion:
+    def test_member_is_validated_with_its_own_schema(self):
+        config = ComposeConfig.model_validate({**_base(), "component": {"type": "http-client", "base_url": "http://localhost"}})
+
+        assert isinstance(config.components[0], HttpClientComponentConfig)
+        assert config.components[0].type == ComponentType.HTTP_CLIENT
+
+    def test_nested_union_resolves_model_task(self):
+        config = ComposeConfig.model_validate({**_base(), "component": {"type": "model", "task": "text-embedding", "model": "m"}})
+
+        assert type(config.components[0]).__name__ == "HuggingfaceTextEmbeddingModelComponentConfig"
+
+    def test_member_errors_keep_their_location(self):
+        with pytest.raises(ValidationError) as e:
+            ComposeConfig.model_validate({**_base(), "component": {"type": "http-client", "base_url": 3}})
+
+        assert e.value.errors()[0]["loc"] == ("components", 0, "base_url")
+
+    def test_unknown_tag_is_rejected(self):
+        with pytest.raises(ValidationError) as e:
+            ComposeConfig.model_validate({**_base(), "component": {"type": "no-such-type"}})
+
+        assert e.value.errors()[0]["type"] == "union_tag_invalid"
+
+    def test_missing_tag_is_rejected(self):
+        with pytest.raises(ValidationError) as e:
+            ComposeConfig.model_validate({**_base(), "components": [ {"id": "c1"} ]})
+
+        assert e.value.errors()[0]["type"] == "union_tag_not_found"
+
+    def test_validated_instances_are_accepted(self):
+        component = HttpClientComponentConfig(type="http-client", base_url="http://localhost")
+
+        assert TypeAdapter(ComponentConfig).validate_python(component) is component
+
+    def test_json_schema_lists_every_member(self):
+        schema = ComposeConfig.model_json_schema()
+        union = schema["properties"]["components"]["items"]
+
+        assert set(union["discriminator"]["mapping"]) == { type.value for type in ComponentType if type not in (ComponentType.MODEL_TRAINER, ComponentType.MORPHEME_ANALYZER) }
+
+    def test_dump_round_trips(self):
+        config = ComposeConfig.model_validate({**_base(), "component": {"type": "model", "task": "text-embedding", "model": "m"}})
+
+        assert ComposeConfig.model_validate(config.model_dump()).components[0] == config.components[0]